@@ -0,0 +1,121 @@
+"""
+Client side cost of building `asset_transfer` calls: the typed client path (`*Args`
+dataclass parsing, params copy and AlgoKit Utils ABI encoding) against the
+precompiled encoders of `smart_contracts.smart_asa.encoders`.
+
+The report has the mean µs per call of encoding the arguments only and of building
+the transaction (suggested params cached, no network round trip per call), and the
+speedups. Requires a running LocalNet and built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.args_encoding
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Final
+
+from algokit_utils import AlgorandClient, CommonAppCallParams
+from algosdk import abi
+
+from benchmarks.localnet import deploy_smart_asa, funded_account, write_report
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetTransferArgs,
+    SmartAsaClient,
+    _parse_abi_args,
+)
+from smart_contracts.smart_asa.encoders import app_call_params, encode_args
+
+logger = logging.getLogger(__name__)
+
+ENCODE_CALLS: Final[int] = 100_000
+BUILD_CALLS: Final[int] = 10_000
+
+
+def mean_us(calls: list[AssetTransferArgs], call: Callable[..., object]) -> float:
+    start = time.perf_counter()
+    for args in calls:
+        call(args)
+    return (time.perf_counter() - start) / len(calls) * 1e6
+
+
+def transfer_args(
+    client: SmartAsaClient, receiver: str, n: int
+) -> list[AssetTransferArgs]:
+    smart_asa_id = client.state.global_state.smart_asa_id
+    return [
+        AssetTransferArgs(
+            xfer_asset=smart_asa_id,
+            asset_amount=amount,
+            asset_sender=client.app_address,
+            asset_receiver=receiver,
+        )
+        for amount in range(1, n + 1)
+    ]
+
+
+def measure_encode(client: SmartAsaClient, receiver: str) -> dict[str, float]:
+    calls = transfer_args(client, receiver, ENCODE_CALLS)
+    method = abi.Method.from_signature(calls[0].abi_method_signature)
+    selector = method.get_selector()
+
+    def typed_client(args: object) -> list[bytes]:
+        values = _parse_abi_args(args) or []
+        return [
+            selector,
+            *(
+                arg.type.encode(value)
+                for arg, value in zip(method.args, values, strict=True)
+            ),
+        ]
+
+    assert typed_client(calls[0]) == encode_args(calls[0])
+    return {
+        "typed_client": mean_us(calls, typed_client),
+        "precompiled": mean_us(calls, encode_args),
+    }
+
+
+def measure_build(
+    client: SmartAsaClient, sender: str, receiver: str
+) -> dict[str, float]:
+    params = CommonAppCallParams(sender=sender)
+    calls = transfer_args(client, receiver, BUILD_CALLS)
+    return {
+        "typed_client": mean_us(
+            calls,
+            lambda args: client.create_transaction.asset_transfer(args, params),
+        ),
+        "precompiled": mean_us(
+            calls,
+            lambda args: client.algorand.create_transaction.app_call(
+                app_call_params(client.app_id, args, params)
+            ),
+        ),
+    }
+
+
+def main() -> None:
+    algorand = AlgorandClient.default_localnet()
+    creator, roles = funded_account(algorand), funded_account(algorand)
+    receiver = funded_account(algorand)
+    client = deploy_smart_asa(algorand, creator, roles)
+    algorand.set_suggested_params_cache(algorand.get_suggested_params())
+
+    report: dict[str, dict] = {
+        "encode_us": measure_encode(client, receiver.address),
+        "build_us": measure_build(client, roles.address, receiver.address),
+    }
+    report["speedup"] = {
+        section: report[section]["typed_client"] / report[section]["precompiled"]
+        for section in ("encode_us", "build_us")
+    }
+    for section, speedup in report["speedup"].items():
+        logger.info(f"{section}: {speedup:.1f}x faster precompiled")
+    logger.info(f"Report written to {write_report('args_encoding', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
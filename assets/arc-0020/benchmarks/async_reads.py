@@ -0,0 +1,84 @@
+"""
+1k simultaneous `get_circulating_supply` read-only calls: typed client calls one at a
+time, typed client calls on a thread pool, and the async client (`asyncio.gather` of
+all the calls, over pooled connections).
+
+The report has, for each mode, the seconds to complete all the calls and the calls
+per second. Requires a running LocalNet and built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.async_reads
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final
+
+from algokit_utils import AlgorandClient, SigningAccount
+from arc_common.aio import AsyncAlgodClient
+
+from benchmarks.localnet import deploy_smart_asa, funded_account, write_report
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    GetCirculatingSupplyArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.aio import AsyncSmartAsaClient
+
+logger = logging.getLogger(__name__)
+
+CALLS: Final[int] = 1_000
+CONNECTIONS: Final[int] = 64
+
+
+async def async_reads(
+    algorand: AlgorandClient, client: SmartAsaClient, caller: SigningAccount
+) -> None:
+    args = GetCirculatingSupplyArgs(asset=client.state.global_state.smart_asa_id)
+    async with AsyncAlgodClient.from_algod(
+        algorand.client.algod, max_connections=CONNECTIONS
+    ) as algod:
+        aio_client = AsyncSmartAsaClient(
+            algod, client.app_id, default_sender=caller.address
+        )
+        await asyncio.gather(
+            *(aio_client.send.get_circulating_supply(args) for _ in range(CALLS))
+        )
+
+
+def main() -> None:
+    algorand = AlgorandClient.default_localnet()
+    creator, roles = funded_account(algorand), funded_account(algorand)
+    client = deploy_smart_asa(algorand, creator, roles)
+    args = GetCirculatingSupplyArgs(asset=client.state.global_state.smart_asa_id)
+
+    seconds: dict[str, float] = {}
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        client.send.get_circulating_supply(args)
+    seconds["typed_client"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONNECTIONS) as pool:
+        list(pool.map(lambda _: client.send.get_circulating_supply(args), range(CALLS)))
+    seconds[f"typed_client_{CONNECTIONS}_threads"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    asyncio.run(async_reads(algorand, client, creator))
+    seconds["async_client"] = time.perf_counter() - start
+
+    report = {
+        "calls": CALLS,
+        "connections": CONNECTIONS,
+        "seconds": seconds,
+        "calls_per_second": {mode: CALLS / secs for mode, secs in seconds.items()},
+    }
+    for mode, secs in seconds.items():
+        logger.info(f"{mode}: {secs:.2f} s, {CALLS / secs:.0f} calls/s")
+    logger.info(f"Report written to {write_report('async_reads', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
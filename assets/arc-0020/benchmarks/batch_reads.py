@@ -0,0 +1,70 @@
+"""
+Account frozen status reads: one typed client `get_account_is_frozen` call (one
+simulate request) per account against batched reads (16 calls per simulated group,
+groups simulated in parallel).
+
+The report has, for each mode, the simulate requests and the seconds to read the
+frozen status of all the accounts. Requires a running LocalNet and built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.batch_reads
+"""
+
+import logging
+import time
+from typing import Final
+
+from algokit_utils import AlgorandClient
+
+from benchmarks.localnet import deploy_smart_asa, funded_account, opt_in, write_report
+from smart_contracts.artifacts.smart_asa.smart_asa_client import GetAccountIsFrozenArgs
+from smart_contracts.smart_asa.reads import MAX_GROUP_SIZE, batch_read
+
+logger = logging.getLogger(__name__)
+
+READS: Final[int] = 1_000
+HOLDERS: Final[int] = 8
+CONCURRENCY: Final[tuple[int, ...]] = (1, 8)
+
+
+def main() -> None:
+    algorand = AlgorandClient.default_localnet()
+    creator, roles = funded_account(algorand), funded_account(algorand)
+    client = deploy_smart_asa(algorand, creator, roles)
+    holders = [funded_account(algorand) for _ in range(HOLDERS)]
+    for holder in holders:
+        opt_in(client, holder)
+    smart_asa_id = client.state.global_state.smart_asa_id
+    calls = [
+        GetAccountIsFrozenArgs(
+            freeze_asset=smart_asa_id, freeze_account=holders[idx % HOLDERS].address
+        )
+        for idx in range(READS)
+    ]
+
+    report: dict[str, dict] = {"requests": {}, "seconds": {}}
+    start = time.perf_counter()
+    for args in calls:
+        client.send.get_account_is_frozen(args)
+    report["requests"]["typed_client"] = READS
+    report["seconds"]["typed_client"] = time.perf_counter() - start
+
+    for concurrency in CONCURRENCY:
+        start = time.perf_counter()
+        batch_read(
+            algorand.client.algod,
+            client.app_id,
+            calls,
+            sender=creator.address,
+            concurrency=concurrency,
+        )
+        report["requests"][f"batch_{concurrency}"] = -(-READS // MAX_GROUP_SIZE)
+        report["seconds"][f"batch_{concurrency}"] = time.perf_counter() - start
+    for mode, seconds in report["seconds"].items():
+        logger.info(f"{mode}: {report['requests'][mode]} requests, {seconds:.2f} s")
+    logger.info(f"Report written to {write_report('batch_reads', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
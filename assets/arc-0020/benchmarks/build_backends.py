@@ -0,0 +1,88 @@
+"""
+Build time of the "subprocess" (AlgoKit CLI per build step) against the "in-process"
+(long-lived tool workers) build backends.
+
+For each backend the report has the tool startup time (mean wall time of a
+`--version` call of the compiler and of the client generator) and the total time of
+a forced build of all contracts. Does not require LocalNet:
+
+    poetry run python -m benchmarks.build_backends
+"""
+
+import logging
+import statistics
+import time
+from typing import Final
+
+from benchmarks.localnet import write_report
+from smart_contracts.__main__ import (
+    build_backends,
+    client_generator_script,
+    compiler_script,
+    contracts,
+    in_process_tools,
+    run_tool,
+    schedule,
+)
+
+logger = logging.getLogger(__name__)
+
+STARTUP_RUNS: Final[int] = 5
+BUILD_JOBS: Final[int] = 1
+
+VERSION_COMMANDS: Final[dict[str, list[str]]] = {
+    compiler_script: ["algokit", "--no-color", "compile", "python", "--version"],
+    client_generator_script: ["algokit", "generate", "client", "--version"],
+}
+
+
+def measure_startup(backend: str) -> dict[str, float]:
+    """Mean seconds of a tool `--version` call, after a warm up call"""
+    tools = in_process_tools(1) if backend == "in-process" else None
+    try:
+        startup: dict[str, float] = {}
+        for script, command in VERSION_COMMANDS.items():
+            run_tool(command, script, ["--version"], tools)
+            timings = []
+            for _ in range(STARTUP_RUNS):
+                start = time.perf_counter()
+                run_tool(command, script, ["--version"], tools)
+                timings.append(time.perf_counter() - start)
+            startup[script] = statistics.mean(timings)
+        return startup
+    finally:
+        if tools is not None:
+            tools.shutdown()
+
+
+def measure_build(backend: str) -> float:
+    """Seconds to force build all contracts, tool workers start up included"""
+    start = time.perf_counter()
+    schedule(
+        contracts,
+        build_contracts=True,
+        deploy_contracts=False,
+        jobs=BUILD_JOBS,
+        force=True,
+        backend=backend,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    report: dict[str, dict] = {}
+    for backend in build_backends:
+        report[backend] = {
+            "startup": measure_startup(backend),
+            "total": measure_build(backend),
+        }
+        logger.info(f"{backend}: {report[backend]['total']:.2f} s total build time")
+    report["speedup"] = {
+        "total": report["subprocess"]["total"] / report["in-process"]["total"]
+    }
+    logger.info(f"Report written to {write_report('build_backends', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
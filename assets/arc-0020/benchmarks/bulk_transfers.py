@@ -0,0 +1,92 @@
+"""
+Sustained mint throughput: one `send.asset_transfer` per transfer (each waiting for
+its confirmation) against the bulk transfer engine (groups of 16 with pooled fees,
+several groups in flight).
+
+The report has the transfers per second and the groups sent by each mode (fees per
+transfer are the same, pooled on the first app call of a group).
+Requires a running LocalNet and built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.bulk_transfers
+"""
+
+import logging
+import time
+from typing import Final
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams
+
+from benchmarks.localnet import deploy_smart_asa, funded_account, opt_in, write_report
+from smart_contracts.artifacts.smart_asa.smart_asa_client import AssetTransferArgs
+from smart_contracts.smart_asa.transfers import MAX_GROUP_SIZE, Transfer, send_transfers
+
+logger = logging.getLogger(__name__)
+
+TRANSFERS: Final[int] = 20 * MAX_GROUP_SIZE
+SEQUENTIAL_TRANSFERS: Final[int] = 2 * MAX_GROUP_SIZE
+CONCURRENCY: Final[tuple[int, ...]] = (1, 4, 8)
+RECEIVERS: Final[int] = 4
+
+
+def main() -> None:
+    algorand = AlgorandClient.default_localnet()
+    creator, roles = funded_account(algorand), funded_account(algorand)
+    client = deploy_smart_asa(algorand, creator, roles)
+    receivers = [funded_account(algorand) for _ in range(RECEIVERS)]
+    for receiver in receivers:
+        opt_in(client, receiver)
+    smart_asa_id = client.state.global_state.smart_asa_id
+    min_fee = algorand.client.algod.suggested_params().min_fee
+
+    def transfers(n: int) -> list[Transfer]:
+        return [
+            Transfer(
+                asset_sender=client.app_address,
+                asset_receiver=receivers[idx % RECEIVERS].address,
+                asset_amount=1,
+            )
+            for idx in range(n)
+        ]
+
+    report: dict[str, dict] = {"transfers_per_second": {}, "groups": {}}
+
+    start = time.perf_counter()
+    for transfer in transfers(SEQUENTIAL_TRANSFERS):
+        client.send.asset_transfer(
+            AssetTransferArgs(xfer_asset=smart_asa_id, **vars(transfer)),
+            params=CommonAppCallParams(
+                sender=roles.address,
+                signer=roles.signer,
+                static_fee=AlgoAmount.from_micro_algo(min_fee * 2),
+            ),
+        )
+    report["transfers_per_second"]["sequential"] = SEQUENTIAL_TRANSFERS / (
+        time.perf_counter() - start
+    )
+    report["groups"]["sequential"] = SEQUENTIAL_TRANSFERS
+
+    for concurrency in CONCURRENCY:
+        start = time.perf_counter()
+        groups = list(
+            send_transfers(
+                algorand.client.algod,
+                client.app_id,
+                smart_asa_id,
+                transfers(TRANSFERS),
+                sender=roles.address,
+                signer=roles.signer,
+                concurrency=concurrency,
+            )
+        )
+        elapsed = time.perf_counter() - start
+        report["transfers_per_second"][f"engine_{concurrency}"] = TRANSFERS / elapsed
+        report["groups"][f"engine_{concurrency}"] = len(groups)
+    for mode, throughput in report["transfers_per_second"].items():
+        logger.info(f"{mode}: {throughput:.1f} transfers/s")
+    logger.info(f"Report written to {write_report('bulk_transfers', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,139 @@
+"""
+Import time of the SmartAsa helpers against the generated client, measured with
+`-X importtime` in fresh interpreters.
+
+The generated client parses its embedded App Spec at import. The helpers (global
+state snapshot, holders scanner, batched reads, async client) load the App Spec from
+the build artifact on first use instead, so importing them does not pay for it.
+
+The light client import path, `smart_asa.app_spec.app_client`, returns a generic
+AlgoKit `AppClient` with the App Spec parsed on the first call, so a process that
+never builds a client does not pay for the parse.
+
+The report has the median microseconds of:
+- `import`: the cumulative import of the generated client and of each helper;
+- `algokit_utils`: the AlgoKit Utils import, shared by all;
+- `first_app_spec_access`: the first `app_spec()` call, parsing the artifact;
+- `first_client`: importing a client module and building the first client, with
+  AlgoKit Utils already imported, generated `SmartAsaClient` against `app_client`.
+
+Does not require LocalNet:
+
+    poetry run python -m benchmarks.client_import
+"""
+
+import logging
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Final
+
+from benchmarks.localnet import write_report
+
+logger = logging.getLogger(__name__)
+
+RUNS: Final[int] = 10
+MODULES: Final[tuple[str, ...]] = (
+    "smart_contracts.artifacts.smart_asa.smart_asa_client",
+    "smart_contracts.smart_asa.state",
+    "smart_contracts.smart_asa.holders",
+    "smart_contracts.smart_asa.reads",
+    "smart_contracts.smart_asa.aio",
+    "smart_contracts.smart_asa.app_spec",
+)
+PROJECT_PATH: Final[Path] = Path(__file__).parent.parent
+IMPORT_TIME: Final[re.Pattern[str]] = re.compile(
+    r"^import time:\s+(\d+) \|\s+(\d+) \|\s+(.+)$", re.M
+)
+FIRST_ACCESS: Final[
+    str
+] = """
+import time
+from smart_contracts.smart_asa.app_spec import app_spec
+start = time.perf_counter()
+app_spec()
+print(round((time.perf_counter() - start) * 1e6))
+"""
+FIRST_CLIENT: Final[dict[str, str]] = {
+    "generated": """
+from smart_contracts.artifacts.smart_asa.smart_asa_client import SmartAsaClient
+client = SmartAsaClient(algorand=algorand, app_id=1)
+""",
+    "light": """
+from smart_contracts.smart_asa.app_spec import app_client
+client = app_client(algorand, 1)
+""",
+}
+TIMED: Final[
+    str
+] = """
+import time
+from algokit_utils import AlgorandClient
+algorand = AlgorandClient.default_localnet()
+start = time.perf_counter()
+{code}
+print(round((time.perf_counter() - start) * 1e6))
+"""
+
+
+def run(code: str, *, import_time: bool = False) -> str:
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_PATH)}
+    result = subprocess.run(
+        [sys.executable, *(["-X", "importtime"] if import_time else []), "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stderr if import_time else result.stdout
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Median cumulative import microseconds, of `module` and of AlgoKit Utils"""
+    samples: dict[str, list[int]] = {"import": [], "algokit_utils": []}
+    for _ in range(RUNS):
+        cumulative = {
+            name.strip(): int(total)
+            for _, total, name in IMPORT_TIME.findall(
+                run(f"import {module}", import_time=True)
+            )
+        }
+        samples["import"].append(cumulative[module])
+        samples["algokit_utils"].append(cumulative["algokit_utils"])
+    return {name: round(statistics.median(values)) for name, values in samples.items()}
+
+
+def median_run(code: str) -> int:
+    """Median microseconds printed by `code`"""
+    return round(statistics.median(int(run(code)) for _ in range(RUNS)))
+
+
+def main() -> None:
+    run(f"import {', '.join(MODULES)}")  # Writes the bytecode caches
+    times = {module: import_times(module) for module in MODULES}
+    first_client = {
+        path: median_run(TIMED.format(code=code)) for path, code in FIRST_CLIENT.items()
+    }
+    report = {
+        "import": {module: median["import"] for module, median in times.items()},
+        "algokit_utils": times[MODULES[0]]["algokit_utils"],
+        "first_app_spec_access": median_run(FIRST_ACCESS),
+        "first_client": first_client,
+    }
+    for module, median in times.items():
+        logger.info(f"{module}: {median['import']} µs")
+    logger.info(
+        f"AlgoKit Utils {report['algokit_utils']} µs, first app_spec() "
+        f"{report['first_app_spec_access']} µs"
+    )
+    for path, micros in first_client.items():
+        logger.info(f"First {path} client, import included: {micros} µs")
+    logger.info(f"Report written to {write_report('client_import', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
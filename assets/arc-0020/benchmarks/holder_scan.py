@@ -0,0 +1,113 @@
+"""
+Throughput of the bulk holders local state scanner against one account at a time
+algod reads (as the typed client `local_state(address)` does).
+
+A local algod stand-in (HTTP server answering account application info requests
+with a fixed latency) replaces the node, so the report (records per second for each
+concurrency) measures the client side. Does not require LocalNet:
+
+    poetry run python -m benchmarks.holder_scan
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Final
+
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+
+from benchmarks.localnet import write_report
+from smart_contracts.smart_asa.holders import (
+    decode_local_state,
+    local_state_keys,
+    scan_holders,
+)
+
+logger = logging.getLogger(__name__)
+
+HOLDERS: Final[int] = 5_000
+CONCURRENCY: Final[tuple[int, ...]] = (1, 4, 16, 64)
+# Simulated algod request latency (seconds)
+LATENCY: Final[float] = 0.002
+APP_ID: Final[int] = 1
+SMART_ASA_ID: Final[int] = 2
+TOKEN: Final[str] = "a" * 64
+LOCAL_STATE_KEYS: Final = local_state_keys()
+
+
+class AlgodStandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body: Final[bytes] = json.dumps(
+        {
+            "app-local-state": {
+                "id": APP_ID,
+                "key-value": [
+                    {
+                        "key": LOCAL_STATE_KEYS.smart_asa_id,
+                        "value": {"type": 2, "uint": SMART_ASA_ID},
+                    },
+                    {"key": LOCAL_STATE_KEYS.frozen, "value": {"type": 2, "uint": 1}},
+                ],
+            },
+            "round": 1,
+        }
+    ).encode()
+
+    def do_GET(self) -> None:
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def measure_sequential(algod: AlgodClient, addresses: list[str]) -> float:
+    start = time.perf_counter()
+    for address in addresses:
+        account_app = algod.account_application_info(address, APP_ID)
+        decode_local_state(address, account_app.get("app-local-state"))
+    return len(addresses) / (time.perf_counter() - start)
+
+
+def measure_scan(algod: AlgodClient, addresses: list[str], concurrency: int) -> float:
+    start = time.perf_counter()
+    records = sum(
+        1 for _ in scan_holders(algod, APP_ID, addresses, concurrency=concurrency)
+    )
+    return records / (time.perf_counter() - start)
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AlgodStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    algod = AlgodClient(TOKEN, f"http://127.0.0.1:{server.server_port}")
+    addresses = [encoding.encode_address(os.urandom(32)) for _ in range(HOLDERS)]
+    try:
+        report: dict[str, dict] = {
+            "records_per_second": {
+                "sequential": measure_sequential(algod, addresses),
+                **{
+                    f"scan_{concurrency}": measure_scan(algod, addresses, concurrency)
+                    for concurrency in CONCURRENCY
+                },
+            },
+            "latency_s": {"algod": LATENCY},
+        }
+    finally:
+        server.shutdown()
+    for name, throughput in report["records_per_second"].items():
+        logger.info(f"{name}: {throughput:.0f} records/s")
+    logger.info(f"Report written to {write_report('holder_scan', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,451 @@
+"""
+Load generation harness: a configurable mix of SmartAsa operations (mint, burn,
+clawback and regular `asset_transfer`, `account_freeze` and `asset_opt_in`) driven
+against LocalNet, or in process against the ledger emulated by the Algorand Python
+testing framework (no node required).
+
+The report has, in total and per operation kind, the operations and transactions
+per second and the p50/p95/p99 latency: submission to confirmation on LocalNet, call
+execution in process. On LocalNet it also has the opcode cost of each kind (app
+budget consumed by the simulated first operation of the kind). Reports carry the
+approval program hash, to track regressions between contract revisions:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.load --ops 2000 --concurrency 8 \\
+        --mix mint=4,burn=1,clawback=1,regular=4,freeze=1,opt_in=1
+    poetry run python -m benchmarks.load --backend in-process --ops 10000
+
+Operations are independent: holders start with enough supply for any burn or
+transfer of the run, `freeze` toggles an account that holds no supply and each
+`opt_in` uses an account funded beforehand.
+"""
+
+import argparse
+import hashlib
+import logging
+import random
+import statistics
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from algokit_utils import AlgoAmount, AlgorandClient, SigningAccount
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+from arc_common.funding import MIN_BALANCE, AccountFunder
+from arc_common.suggested_params import SuggestedParamsCache
+
+from benchmarks.localnet import deploy_smart_asa, funded_account, write_report
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AccountFreezeArgs,
+    AssetTransferArgs,
+)
+from smart_contracts.smart_asa.encoders import encode_args
+from smart_contracts.smart_asa.fees import app_call_fee
+from smart_contracts.smart_asa.opt_ins import (
+    HOLDER_MIN_BALANCE,
+    build_opt_in_group,
+    opt_in_holders,
+)
+from smart_contracts.smart_asa.transfers import Transfer, send_transfers
+
+if TYPE_CHECKING:
+    from algopy_testing import AlgopyTestContext
+
+logger = logging.getLogger(__name__)
+
+KINDS: Final[tuple[str, ...]] = (
+    "mint",
+    "burn",
+    "clawback",
+    "regular",
+    "freeze",
+    "opt_in",
+)
+DEFAULT_MIX: Final[str] = "mint=4,burn=1,clawback=1,regular=4,freeze=1,opt_in=1"
+# Transactions per operation (an opt in is a Controlled ASA opt in and an app call).
+TXNS: Final[dict[str, int]] = {"opt_in": 2}
+HOLDERS: Final[int] = 16
+# Supply minted to each holder before the run, more than any run burns or transfers.
+HOLDER_SUPPLY: Final[int] = 10**9
+# Holders pay the fees of their regular transfers: 100 ALGO of spending balance.
+HOLDER_FUNDS: Final[int] = HOLDER_MIN_BALANCE + 100_000_000
+APPROVAL_TEAL: Final[Path] = (
+    Path(__file__).parent.parent
+    / "smart_contracts"
+    / "artifacts"
+    / "smart_asa"
+    / "SmartAsa.approval.teal"
+)
+
+# An operation of the run: kind, index in the run and index among its kind.
+Op = tuple[str, int, int]
+# Sends an operation, returns its latency in seconds.
+Sender = Callable[[Op], float]
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for item in mix.split(","):
+        kind, _, weight = item.partition("=")
+        if kind not in KINDS:
+            raise ValueError(f"Unknown operation {kind!r}, expected one of {KINDS}")
+        weights[kind] = int(weight)
+    return weights
+
+
+def schedule(mix: dict[str, int], ops: int, seed: int) -> list[Op]:
+    kinds = random.Random(seed).choices(list(mix), weights=list(mix.values()), k=ops)
+    ordinals: Counter[str] = Counter()
+    run = []
+    for idx, kind in enumerate(kinds):
+        run.append((kind, idx, ordinals[kind]))
+        ordinals[kind] += 1
+    return run
+
+
+def percentiles(latencies: list[float]) -> dict[str, float]:
+    if len(latencies) < 2:
+        return dict.fromkeys(("p50", "p95", "p99"), latencies[0] if latencies else 0.0)
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {"p50": quantiles[49], "p95": quantiles[94], "p99": quantiles[98]}
+
+
+def run(run_ops: list[Op], send: Sender, concurrency: int) -> tuple[float, list[float]]:
+    """Wall-clock seconds of the run and latency of each operation"""
+    start = time.perf_counter()
+    if concurrency == 1:
+        latencies = [send(op) for op in run_ops]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(send, run_ops))
+    return time.perf_counter() - start, latencies
+
+
+class LocalNetLoad:
+    """SmartAsa app, holders and newcomers on LocalNet, all roles held by `roles`"""
+
+    def __init__(self, holders: int, newcomers: int) -> None:
+        self.algorand = AlgorandClient.default_localnet()
+        self.algod = self.algorand.client.algod
+        self.params = SuggestedParamsCache()
+        creator = funded_account(self.algorand)
+        self.roles = funded_account(self.algorand)
+        self.client = deploy_smart_asa(self.algorand, creator, self.roles)
+        self.app_id = self.client.app_id
+        self.smart_asa_id = self.client.state.global_state.smart_asa_id
+
+        funder = AccountFunder(
+            self.algorand,
+            AlgoAmount.from_micro_algo(HOLDER_FUNDS - MIN_BALANCE.micro_algo),
+        )
+        funded = funder.accounts(holders + 1 + newcomers)
+        accounts, self.newcomers = funded[: holders + 1], funded[holders + 1 :]
+        for _ in opt_in_holders(self.algod, self.app_id, self.smart_asa_id, accounts):
+            pass
+        self.holders, self.frozen = accounts[:-1], accounts[-1]
+        for _ in send_transfers(
+            self.algod,
+            self.app_id,
+            self.smart_asa_id,
+            [
+                Transfer(
+                    asset_sender=self.client.app_address,
+                    asset_receiver=holder.address,
+                    asset_amount=HOLDER_SUPPLY,
+                )
+                for holder in self.holders
+            ],
+            sender=self.roles.address,
+            signer=self.roles.signer,
+        ):
+            pass
+
+    def app_call(
+        self,
+        sp: transaction.SuggestedParams,
+        sender: SigningAccount,
+        args: object,
+        accounts: list[str],
+        note: bytes,
+    ) -> list[tuple[transaction.Transaction, TransactionSigner]]:
+        fee_sp = transaction.SuggestedParams(
+            fee=app_call_fee(sp, args),
+            first=sp.first,
+            last=sp.last,
+            gh=sp.gh,
+            gen=sp.gen,
+            flat_fee=True,
+            min_fee=sp.min_fee,
+        )
+        txn = transaction.ApplicationNoOpTxn(
+            sender.address,
+            fee_sp,
+            self.app_id,
+            app_args=encode_args(args),
+            accounts=[
+                account
+                for account in dict.fromkeys(accounts)
+                if account != self.client.app_address
+            ],
+            foreign_assets=[self.smart_asa_id],
+            note=note,
+        )
+        return [(txn, sender.signer)]
+
+    def transfer(
+        self,
+        sp: transaction.SuggestedParams,
+        sender: SigningAccount,
+        asset_sender: str,
+        asset_receiver: str,
+        note: bytes,
+    ) -> list[tuple[transaction.Transaction, TransactionSigner]]:
+        args = AssetTransferArgs(
+            xfer_asset=self.smart_asa_id,
+            asset_amount=1,
+            asset_sender=asset_sender,
+            asset_receiver=asset_receiver,
+        )
+        return self.app_call(sp, sender, args, [asset_sender, asset_receiver], note)
+
+    def build(self, op: Op) -> list[transaction.GenericSignedTransaction]:
+        kind, idx, ordinal = op
+        sp = self.params.get(self.algod)
+        # Operations are told apart by their note: same calls in a round differ.
+        note = idx.to_bytes(8, "big")
+        app_address = self.client.app_address
+        holder = self.holders[idx % len(self.holders)]
+        other = self.holders[(idx + 1) % len(self.holders)]
+        if kind == "mint":
+            group = self.transfer(sp, self.roles, app_address, holder.address, note)
+        elif kind == "burn":
+            group = self.transfer(sp, self.roles, holder.address, app_address, note)
+        elif kind == "clawback":
+            group = self.transfer(sp, self.roles, holder.address, other.address, note)
+        elif kind == "regular":
+            group = self.transfer(sp, holder, holder.address, other.address, note)
+        elif kind == "freeze":
+            args = AccountFreezeArgs(
+                freeze_asset=self.smart_asa_id,
+                freeze_account=self.frozen.address,
+                asset_frozen=idx % 2 == 0,
+            )
+            group = self.app_call(sp, self.roles, args, [self.frozen.address], note)
+        else:
+            newcomer = self.newcomers[ordinal]
+            txns = build_opt_in_group(
+                sp, self.app_id, self.smart_asa_id, [newcomer.address]
+            )
+            group = [(txn, newcomer.signer) for txn in txns]
+        txns = [txn for txn, _ in group]
+        return [
+            signed
+            for txn_idx, (_, signer) in enumerate(group)
+            for signed in signer.sign_transactions(txns, [txn_idx])
+        ]
+
+    def send(self, op: Op) -> float:
+        signed = self.build(op)
+        start = time.perf_counter()
+        self.algod.send_transactions(signed)
+        transaction.wait_for_confirmation(self.algod, signed[0].get_txid())
+        return time.perf_counter() - start
+
+    def opcode_cost(self, op: Op) -> int:
+        """App budget consumed by `op`, simulated (nothing is committed)"""
+        request = SimulateRequest(
+            txn_groups=[SimulateRequestTransactionGroup(txns=self.build(op))]
+        )
+        response = self.algod.simulate_transactions(request)
+        return int(response["txn-groups"][0]["app-budget-consumed"])
+
+
+def in_process_sender(context: "AlgopyTestContext", holders: int) -> Sender:
+    """
+    Sender of the operations to a SmartAsa in the emulated ledger of `context`.
+    Inner transfers are not applied to the emulated ledger: supply and balances
+    never run out.
+    """
+    from algopy import Account, Asset, arc4
+
+    from smart_contracts.smart_asa import config as cfg
+    from smart_contracts.smart_asa.contract import SmartAsa
+
+    creator, roles = context.any.account(), context.any.account()
+    with context.txn.create_group(
+        active_txn_overrides={
+            "sender": creator,
+            "global_num_bytes": cfg.GLOBAL_BYTES,
+            "global_num_uint": cfg.GLOBAL_UINTS,
+            "local_num_bytes": cfg.LOCAL_BYTES,
+            "local_num_uint": cfg.LOCAL_UINTS,
+        }
+    ):
+        smart_asa = SmartAsa()
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        asset = smart_asa.asset_create(
+            total=arc4.UInt64(cfg.TOTAL),
+            decimals=arc4.UInt32(0),
+            default_frozen=arc4.Bool(False),
+            unit_name=arc4.String("LOAD"),
+            name=arc4.String("Load"),
+            url=arc4.String(""),
+            metadata_hash=arc4.DynamicBytes(b""),
+            manager_addr=arc4.Address(roles),
+            reserve_addr=arc4.Address(roles),
+            freeze_addr=arc4.Address(roles),
+            clawback_addr=arc4.Address(roles),
+        )
+    asset = Asset(asset.native)
+    app_address = context.ledger.get_app(smart_asa).address
+    context.ledger.update_asset_holdings(asset, app_address, balance=cfg.TOTAL)
+
+    def opt_in() -> tuple[Account, Callable[[], None]]:
+        account = context.any.account()
+        context.ledger.update_asset_holdings(asset, account)
+        ctrl_asa_opt_in = context.any.txn.asset_transfer(
+            sender=account, asset_receiver=account, xfer_asset=asset
+        )
+
+        def call() -> None:
+            with context.txn.create_group(active_txn_overrides={"sender": account}):
+                smart_asa.asset_opt_in(asset, ctrl_asa_opt_in)
+
+        return account, call
+
+    opted_in = []
+    for _ in range(holders + 1):
+        account, call = opt_in()
+        call()
+        opted_in.append(account)
+    accounts, frozen = opted_in[:-1], opted_in[-1]
+
+    def send(op: Op) -> float:
+        kind, idx, _ = op
+        holder = accounts[idx % len(accounts)]
+        other = accounts[(idx + 1) % len(accounts)]
+        one = arc4.UInt64(1)
+        if kind == "opt_in":
+            _, call = opt_in()
+        else:
+            sender, method, args = {
+                "mint": (roles, "asset_transfer", (asset, one, app_address, holder)),
+                "burn": (roles, "asset_transfer", (asset, one, holder, app_address)),
+                "clawback": (roles, "asset_transfer", (asset, one, holder, other)),
+                "regular": (holder, "asset_transfer", (asset, one, holder, other)),
+                "freeze": (
+                    roles,
+                    "account_freeze",
+                    (asset, frozen, arc4.Bool(idx % 2 == 0)),
+                ),
+            }[kind]
+
+            def call() -> None:
+                with context.txn.create_group(active_txn_overrides={"sender": sender}):
+                    getattr(smart_asa, method)(*args)
+
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    return send
+
+
+def report_run(
+    run_ops: list[Op],
+    elapsed: float,
+    latencies: list[float],
+    costs: dict[str, int | None],
+) -> dict:
+    txns = sum(TXNS.get(kind, 1) for kind, _, _ in run_ops)
+    report: dict = {
+        "ops": len(run_ops),
+        "elapsed_seconds": elapsed,
+        "ops_per_second": len(run_ops) / elapsed,
+        "transactions_per_second": txns / elapsed,
+        "latency_seconds": percentiles(latencies),
+        "kinds": {},
+    }
+    for kind in sorted({kind for kind, _, _ in run_ops}):
+        kind_latencies = [
+            latency
+            for (op_kind, _, _), latency in zip(run_ops, latencies, strict=True)
+            if op_kind == kind
+        ]
+        report["kinds"][kind] = {
+            "ops": len(kind_latencies),
+            "ops_per_second": len(kind_latencies) / elapsed,
+            "transactions_per_second": len(kind_latencies)
+            * TXNS.get(kind, 1)
+            / elapsed,
+            "latency_seconds": percentiles(kind_latencies),
+            "opcode_cost": costs.get(kind),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SmartAsa load generation")
+    parser.add_argument(
+        "--backend", choices=("localnet", "in-process"), default="localnet"
+    )
+    parser.add_argument("--ops", type=int, default=1000, help="operations to send")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="operation weights")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="operations in flight (LocalNet only, in process runs sequentially)",
+    )
+    parser.add_argument("--holders", type=int, default=HOLDERS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", default=None, help="report name (load_<backend>)")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    run_ops = schedule(mix, args.ops, args.seed)
+    opt_ins = sum(1 for kind, _, _ in run_ops if kind == "opt_in")
+    costs: dict[str, int | None] = {}
+    if args.backend == "localnet":
+        load = LocalNetLoad(args.holders, opt_ins)
+        first_ops: dict[str, Op] = {}
+        for op in run_ops:
+            first_ops.setdefault(op[0], op)
+        costs = {kind: load.opcode_cost(op) for kind, op in first_ops.items()}
+        concurrency = args.concurrency
+        elapsed, latencies = run(run_ops, load.send, concurrency)
+    else:
+        from algopy_testing import algopy_testing_context
+
+        concurrency = 1
+        with algopy_testing_context() as context:
+            send = in_process_sender(context, args.holders)
+            elapsed, latencies = run(run_ops, send, concurrency)
+
+    report = report_run(run_ops, elapsed, latencies, costs)
+    report.update(
+        backend=args.backend,
+        concurrency=concurrency,
+        mix=mix,
+        seed=args.seed,
+        approval_sha256=hashlib.sha256(APPROVAL_TEAL.read_bytes()).hexdigest(),
+    )
+    for kind, kind_report in report["kinds"].items():
+        logger.info(
+            f"{kind}: {kind_report['ops']} ops, "
+            f"p50 {kind_report['latency_seconds']['p50'] * 1000:.1f} ms, "
+            f"opcode cost {kind_report['opcode_cost']}"
+        )
+    logger.info(f"{report['transactions_per_second']:.1f} transactions/s")
+    name = args.report or f"load_{args.backend.replace('-', '_')}"
+    logger.info(f"Report written to {write_report(name, report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
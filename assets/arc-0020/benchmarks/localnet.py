@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+from typing import Final
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetOptInParams,
+    CommonAppCallParams,
+    SendAtomicTransactionComposerResults,
+    SigningAccount,
+)
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetCreateArgs,
+    AssetOptInArgs,
+    SmartAsaClient,
+    SmartAsaFactory,
+)
+
+INITIAL_FUNDS: Final[AlgoAmount] = AlgoAmount.from_algo(100)
+ASA_TOTAL: Final[int] = 10**12
+
+RESULTS_PATH: Final[Path] = Path(__file__).parent / "results"
+
+
+def funded_account(algorand: AlgorandClient) -> SigningAccount:
+    account = algorand.account.random()
+    algorand.account.ensure_funded_from_environment(
+        account_to_fund=account.address,
+        min_spending_balance=INITIAL_FUNDS,
+    )
+    return account
+
+
+def asset_create_args(roles: SigningAccount) -> AssetCreateArgs:
+    return AssetCreateArgs(
+        total=ASA_TOTAL,
+        decimals=0,
+        default_frozen=False,
+        unit_name="BENCH",
+        name="Benchmark",
+        url="",
+        metadata_hash=b"",
+        manager_addr=roles.address,
+        reserve_addr=roles.address,
+        freeze_addr=roles.address,
+        clawback_addr=roles.address,
+    )
+
+
+def deploy_smart_asa(
+    algorand: AlgorandClient,
+    creator: SigningAccount,
+    roles: SigningAccount,
+    factory_type: type = SmartAsaFactory,
+) -> SmartAsaClient:
+    """Deploys a funded Smart ASA app and creates its Controlled ASA, all roles assigned to `roles`"""
+    factory = algorand.client.get_typed_app_factory(
+        factory_type,
+        default_sender=creator.address,
+        default_signer=creator.signer,
+    )
+    client, _ = factory.send.create.bare()
+    algorand.account.ensure_funded_from_environment(
+        account_to_fund=client.app_address,
+        min_spending_balance=INITIAL_FUNDS,
+    )
+    sp = algorand.client.algod.suggested_params()
+    client.send.asset_create(
+        asset_create_args(roles),
+        params=CommonAppCallParams(
+            static_fee=AlgoAmount.from_micro_algo(sp.min_fee * 2)
+        ),
+    )
+    return client
+
+
+def opt_in(client: SmartAsaClient, account: SigningAccount) -> None:
+    smart_asa_id = client.state.global_state.smart_asa_id
+    client.send.opt_in.asset_opt_in(
+        AssetOptInArgs(
+            asset=smart_asa_id,
+            ctrl_asa_opt_in=TransactionWithSigner(
+                txn=client.algorand.create_transaction.asset_opt_in(
+                    AssetOptInParams(asset_id=smart_asa_id, sender=account.address)
+                ),
+                signer=account.signer,
+            ),
+        ),
+        params=CommonAppCallParams(signer=account.signer, sender=account.address),
+    )
+
+
+def app_budget_consumed(result: SendAtomicTransactionComposerResults) -> int:
+    """Total opcode cost of a simulated group"""
+    return int(result.simulate_response["txn-groups"][0]["app-budget-consumed"])
+
+
+def write_report(name: str, report: dict) -> Path:
+    RESULTS_PATH.mkdir(exist_ok=True, parents=True)
+    report_path = RESULTS_PATH / f"{name}.json"
+    report_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    return report_path
@@ -0,0 +1,192 @@
+"""
+Minimum balance requirement (MBR) of the Smart ASA layouts, computed from the
+consensus MBR parameters and the ARC-56 App Specs of the build artifacts (state
+schemas, program sizes and box layouts) for the `benchmarks.localnet` configuration.
+
+The MBR does not depend on the node state, so these figures are exact for the built
+programs. The report has, in µALGO:
+- `layouts`: per layout, the MBR locked by the app creator (app pages and global
+  state schema), by the app account per Smart ASA (account, Controlled ASA and
+  boxes) and per holder (local state or holding box, and Controlled ASA opt in);
+- `assets`: for 10, 100 and 1000 Smart ASAs, the MBR and deployment fees of one
+  SmartAsa app per Smart ASA against a single SmartAsaMulti app (`multi_tenant`
+  measures the same on LocalNet);
+- `holders`: for 10, 100 and 1000 holders of a Smart ASA, their MBR per layout.
+
+Does not require LocalNet:
+
+    poetry run python -m benchmarks.mbr
+"""
+
+import base64
+import dataclasses
+import logging
+from pathlib import Path
+from typing import Final
+
+from algokit_utils import Arc56Contract, calculate_extra_program_pages
+from algosdk import abi, constants
+from arc_common.app_spec import load_app_spec
+
+from benchmarks.localnet import ASA_TOTAL, write_report
+
+logger = logging.getLogger(__name__)
+
+# Consensus MBR parameters (µALGO)
+ACCOUNT_MBR: Final[int] = 100_000  # Per account, asset holding and app page
+SCHEMA_UINT_MBR: Final[int] = 25_000 + 3_500
+SCHEMA_BYTES_MBR: Final[int] = 25_000 + 25_000
+BOX_FLAT_MBR: Final[int] = 2_500
+BOX_BYTE_MBR: Final[int] = 400
+
+SIZES: Final[tuple[int, ...]] = (10, 100, 1000)
+ARTIFACTS_PATH: Final[Path] = (
+    Path(__file__).parent.parent / "smart_contracts" / "artifacts"
+)
+# `benchmarks.localnet.asset_create_args` values, all roles assigned to one account.
+ASSET_CONFIG: Final[list[object]] = [
+    ASA_TOTAL,
+    0,
+    False,
+    "BENCH",
+    "Benchmark",
+    "",
+    b"",
+    *([constants.ZERO_ADDRESS] * 4),
+]
+# Box values by ARC-56 type, for the configuration above (not frozen, no allowlist).
+BOX_VALUES: Final[dict[str, list[object]]] = {
+    "AssetConfig": ASSET_CONFIG,
+    "ControlledAsset": [False, bytes(32), ASSET_CONFIG],
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class Layout:
+    app_spec_path: Path
+    # Box maps with one box per Smart ASA and one box per holder.
+    asset_box_maps: tuple[str, ...] = ()
+    holder_box_maps: tuple[str, ...] = ()
+
+
+LAYOUTS: Final[dict[str, Layout]] = {
+    "global_state": Layout(ARTIFACTS_PATH / "smart_asa" / "SmartAsa.arc56.json"),
+    "packed_box": Layout(
+        ARTIFACTS_PATH / "smart_asa_packed" / "SmartAsaPacked.arc56.json"
+    ),
+    "multi_tenant": Layout(
+        ARTIFACTS_PATH / "smart_asa_multi" / "SmartAsaMulti.arc56.json",
+        asset_box_maps=("ctrl_assets",),
+        holder_box_maps=("holdings",),
+    ),
+}
+
+
+def abi_type(spec: Arc56Contract, type_name: str) -> abi.ABIType:
+    """ABI type of an ARC-56 type name, structs expanded to tuples"""
+    return abi.ABIType.from_string(_abi_type_string(spec, type_name))
+
+
+def _abi_type_string(spec: Arc56Contract, type_name: str) -> str:
+    if type_name not in spec.structs:
+        return type_name
+    fields = (
+        _abi_type_string(spec, str(field.type)) for field in spec.structs[type_name]
+    )
+    return f"({','.join(fields)})"
+
+
+def box_mbr(key_size: int, value_size: int) -> int:
+    return BOX_FLAT_MBR + BOX_BYTE_MBR * (key_size + value_size)
+
+
+def value_size(spec: Arc56Contract, type_name: str) -> int:
+    """Encoded size of a box value of the benchmark configuration"""
+    value_type = abi_type(spec, type_name)
+    if type_name in BOX_VALUES:
+        return len(value_type.encode(BOX_VALUES[type_name]))
+    return value_type.byte_len()
+
+
+def map_box_mbr(spec: Arc56Contract, name: str) -> int:
+    """MBR of one box of the `name` box map"""
+    box_map = spec.state.maps.box[name]
+    key_size = len(base64.b64decode(box_map.prefix or "")) + (
+        abi_type(spec, box_map.key_type).byte_len()
+    )
+    return box_mbr(key_size, value_size(spec, box_map.value_type))
+
+
+def layout_mbr(layout: Layout) -> dict[str, int]:
+    """MBR locked by the app creator, and per Smart ASA and holder"""
+    spec = load_app_spec(layout.app_spec_path)
+    assert spec.byte_code is not None, "Build the contracts first"
+    extra_pages = calculate_extra_program_pages(
+        base64.b64decode(spec.byte_code.approval),
+        base64.b64decode(spec.byte_code.clear),
+    )
+    schema = spec.state.schema
+    app_keys_mbr = sum(
+        box_mbr(len(base64.b64decode(key.key)), value_size(spec, key.value_type))
+        for key in spec.state.keys.box.values()
+    )
+    local_mbr = schema.local_state.ints * SCHEMA_UINT_MBR
+    local_mbr += schema.local_state.bytes * SCHEMA_BYTES_MBR
+    return {
+        "extra_pages": extra_pages,
+        "creator": ACCOUNT_MBR * (1 + extra_pages)
+        + schema.global_state.ints * SCHEMA_UINT_MBR
+        + schema.global_state.bytes * SCHEMA_BYTES_MBR,
+        "app_account": ACCOUNT_MBR,
+        # Controlled ASA, created by the app account, and its config boxes.
+        "per_asset": ACCOUNT_MBR
+        + app_keys_mbr
+        + sum(map_box_mbr(spec, name) for name in layout.asset_box_maps),
+        # Controlled ASA opt in, and local state or holding box.
+        "per_holder": ACCOUNT_MBR
+        + (ACCOUNT_MBR + local_mbr if local_mbr else 0)
+        + sum(map_box_mbr(spec, name) for name in layout.holder_box_maps),
+    }
+
+
+def main() -> None:
+    min_fee = constants.min_txn_fee
+    layouts = {name: layout_mbr(layout) for name, layout in LAYOUTS.items()}
+    single, multi = layouts["global_state"], layouts["multi_tenant"]
+    report = {
+        "layouts": layouts,
+        "assets": {
+            n: {
+                # One app per Smart ASA: app create, funding and asset_create (with
+                # its inner transaction), as `multi_tenant` deploys them.
+                "single_tenant": {
+                    "mbr": n * (single["creator"] + single["app_account"])
+                    + n * single["per_asset"],
+                    "fees": 4 * n * min_fee,
+                },
+                # One app: app create and funding, then an asset_create per asset.
+                "multi_tenant": {
+                    "mbr": multi["creator"]
+                    + multi["app_account"]
+                    + n * multi["per_asset"],
+                    "fees": 3 * min_fee + 2 * n * min_fee,
+                },
+            }
+            for n in SIZES
+        },
+        "holders": {
+            n: {name: n * mbr["per_holder"] for name, mbr in layouts.items()}
+            for n in SIZES
+        },
+    }
+    for name, mbr in layouts.items():
+        logger.info(
+            f"{name}: creator {mbr['creator']}, per asset {mbr['per_asset']}, "
+            f"per holder {mbr['per_holder']} µALGO"
+        )
+    logger.info(f"Report written to {write_report('mbr', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,162 @@
+"""
+Deployment cost of N Smart ASAs: one SmartAsa app per Controlled ASA against a single
+SmartAsaMulti app controlling all of them (Controlled ASA state in boxes).
+
+For each N the report has the transactions and fees paid to deploy, the MBR locked by
+the creator and the app accounts, and the MBR locked by a holder opt in. Requires a
+running LocalNet and built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.multi_tenant
+"""
+
+import logging
+from typing import Final
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetOptInParams,
+    CommonAppCallParams,
+    PaymentParams,
+    SigningAccount,
+)
+from algokit_utils.config import config
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from benchmarks.localnet import (
+    asset_create_args,
+    deploy_smart_asa,
+    funded_account,
+    opt_in,
+    write_report,
+)
+from smart_contracts.artifacts.smart_asa_multi.smart_asa_multi_client import (
+    AssetOptInArgs,
+    SmartAsaMultiClient,
+    SmartAsaMultiFactory,
+)
+from smart_contracts.smart_asa_multi import config as cfg
+
+logger = logging.getLogger(__name__)
+
+SIZES: Final[tuple[int, ...]] = (10, 100, 1000)
+# Controlled ASA (0.1 Algo) and its box MBR, with headroom.
+ASSET_FUNDS: Final[AlgoAmount] = AlgoAmount.from_micro_algo(250_000)
+# Creator MBR per SmartAsa app (global state schema), with headroom.
+APP_FUNDS: Final[AlgoAmount] = AlgoAmount.from_algo(1)
+
+
+def min_balance(algorand: AlgorandClient, address: str) -> int:
+    return algorand.account.get_information(address).min_balance.micro_algo
+
+
+def creator_account(algorand: AlgorandClient, funds: AlgoAmount) -> SigningAccount:
+    account = algorand.account.random()
+    algorand.account.ensure_funded_from_environment(
+        account_to_fund=account.address, min_spending_balance=funds
+    )
+    return account
+
+
+def measure_single_tenant(algorand: AlgorandClient, n: int, min_fee: int) -> dict:
+    creator = creator_account(
+        algorand, AlgoAmount.from_micro_algo(APP_FUNDS.micro_algo * n)
+    )
+    roles, holder = funded_account(algorand), funded_account(algorand)
+    creator_mbr = min_balance(algorand, creator.address)
+    clients = [deploy_smart_asa(algorand, creator, roles) for _ in range(n)]
+
+    holder_mbr = min_balance(algorand, holder.address)
+    opt_in(clients[0], holder)
+    apps_mbr = sum(min_balance(algorand, client.app_address) for client in clients)
+    return {
+        # App create, app funding and asset_create (with its inner transaction)
+        "transactions": 3 * n,
+        "fees": 4 * n * min_fee,
+        "mbr": min_balance(algorand, creator.address) - creator_mbr + apps_mbr,
+        "holder_mbr": min_balance(algorand, holder.address) - holder_mbr,
+    }
+
+
+def multi_tenant_opt_in(
+    client: SmartAsaMultiClient, asset_id: int, account: SigningAccount
+) -> None:
+    # SmartAsaMulti has no local state, the holder pays the holding box MBR.
+    client.new_group().add_transaction(
+        txn=client.algorand.create_transaction.payment(
+            PaymentParams(
+                sender=account.address,
+                receiver=client.app_address,
+                amount=AlgoAmount.from_micro_algo(cfg.HOLDING_BOX_MBR),
+            )
+        ),
+        signer=account.signer,
+    ).asset_opt_in(
+        AssetOptInArgs(
+            asset=asset_id,
+            ctrl_asa_opt_in=TransactionWithSigner(
+                txn=client.algorand.create_transaction.asset_opt_in(
+                    AssetOptInParams(asset_id=asset_id, sender=account.address)
+                ),
+                signer=account.signer,
+            ),
+        ),
+        params=CommonAppCallParams(signer=account.signer, sender=account.address),
+    ).send()
+
+
+def measure_multi_tenant(algorand: AlgorandClient, n: int, min_fee: int) -> dict:
+    creator = creator_account(algorand, APP_FUNDS)
+    roles, holder = funded_account(algorand), funded_account(algorand)
+    creator_mbr = min_balance(algorand, creator.address)
+    client = deploy_smart_asa(algorand, creator, roles, SmartAsaMultiFactory)
+    algorand.account.ensure_funded_from_environment(
+        account_to_fund=client.app_address,
+        min_spending_balance=AlgoAmount.from_micro_algo(ASSET_FUNDS.micro_algo * n),
+    )
+    asset_ids = [
+        client.send.asset_create(
+            asset_create_args(roles),
+            params=CommonAppCallParams(
+                static_fee=AlgoAmount.from_micro_algo(min_fee * 2)
+            ),
+        ).abi_return
+        for _ in range(n - 1)
+    ]
+
+    holder_mbr = min_balance(algorand, holder.address)
+    app_mbr = min_balance(algorand, client.app_address)
+    multi_tenant_opt_in(client, asset_ids[0], holder)
+    holder_mbr = min_balance(algorand, holder.address) - holder_mbr
+    holder_box_mbr = min_balance(algorand, client.app_address) - app_mbr
+    return {
+        # App create, app funding (twice) and asset_create (with its inner transaction)
+        "transactions": 3 + n,
+        "fees": 3 * min_fee + 2 * n * min_fee,
+        "mbr": min_balance(algorand, creator.address) - creator_mbr + app_mbr,
+        # Holding box MBR is paid by the holder to the app account
+        "holder_mbr": holder_mbr + holder_box_mbr,
+    }
+
+
+def main() -> None:
+    # SmartAsaMulti needs its box references populated.
+    config.configure(populate_app_call_resources=True)
+    algorand = AlgorandClient.default_localnet()
+    min_fee = algorand.client.algod.suggested_params().min_fee
+    report: dict[str, dict] = {"single_tenant": {}, "multi_tenant": {}}
+    for n in SIZES:
+        report["single_tenant"][n] = measure_single_tenant(algorand, n, min_fee)
+        report["multi_tenant"][n] = measure_multi_tenant(algorand, n, min_fee)
+        for layout in report:
+            logger.info(
+                f"{layout} x{n}: {report[layout][n]['mbr']} µALGO MBR, "
+                f"{report[layout][n]['fees']} µALGO fees"
+            )
+    logger.info(f"Report written to {write_report('multi_tenant', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,367 @@
+"""
+Per-method opcode cost profile of SmartAsa, attributed to `contract.py` lines and
+subroutines through the source map emitted by `algokit compile python`.
+
+Every ABI method (and every `asset_transfer` branch) is simulated with execution
+tracing enabled against a LocalNet app, nothing is committed on chain besides the
+profiling fixtures. Each executed opcode is weighted by its opcode budget (e.g. 35
+for `sha256`), the group `app_budget_consumed` reported by simulate is the reference
+total. `asset_transfer_with_proof` verifies proofs of an allowlist of
+`ALLOWLIST_SIZE` accounts. Requires a running LocalNet and built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.opcode_profile
+"""
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetOptInParams,
+    AssetTransferParams,
+    CommonAppCallParams,
+    SendAtomicTransactionComposerResults,
+    SigningAccount,
+)
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateTraceConfig
+
+from benchmarks.localnet import (
+    ASA_TOTAL,
+    deploy_smart_asa,
+    funded_account,
+    opt_in,
+    write_report,
+)
+from benchmarks.source_map import ProgramMap
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AccountFreezeArgs,
+    AssetCloseOutArgs,
+    AssetConfigArgs,
+    AssetCreateArgs,
+    AssetDestroyArgs,
+    AssetFreezeArgs,
+    AssetOptInArgs,
+    AssetTransferArgs,
+    AssetTransferBatchArgs,
+    AssetTransferWithProofArgs,
+    GetAccountIsFrozenArgs,
+    GetAssetConfigArgs,
+    GetAssetIsFrozenArgs,
+    GetCirculatingSupplyArgs,
+    SetTransferAllowlistArgs,
+    SmartAsaClient,
+    SmartAsaComposer,
+    SmartAsaFactory,
+)
+from smart_contracts.smart_asa.merkle import MerkleTree
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_MAP: Final[Path] = (
+    Path(__file__).parent.parent
+    / "smart_contracts"
+    / "artifacts"
+    / "smart_asa"
+    / "SmartAsa.approval.puya.map"
+)
+
+# Allowlist accounts, the proofs verify log2(ALLOWLIST_SIZE) = 10 node hashes each.
+ALLOWLIST_SIZE: Final[int] = 1024
+
+Scenario = Callable[[], SmartAsaComposer]
+
+
+def simulate_traced(
+    group: SmartAsaComposer,
+) -> SendAtomicTransactionComposerResults:
+    return group.simulate(
+        allow_unnamed_resources=True,
+        skip_signatures=True,
+        exec_trace_config=SimulateTraceConfig(enable=True),
+    )
+
+
+def profile_group(group: SmartAsaComposer, program_map: ProgramMap) -> dict:
+    """Attributes the approval program trace of every app call in a simulated group"""
+    result = simulate_traced(group)
+    (txn_group,) = result.simulate_response["txn-groups"]
+    pcs = [
+        step["pc"]
+        for txn_result in txn_group["txn-results"]
+        for step in txn_result.get("exec-trace", {}).get("approval-program-trace", [])
+    ]
+    profile = program_map.attribute(pcs)
+    profile["app_budget_consumed"] = txn_group["app-budget-consumed"]
+    if profile["app_budget_consumed"] != profile["cost"]:
+        logger.warning(
+            f"Weighted opcode cost {profile['cost']} differs from the budget consumed "
+            f"{profile['app_budget_consumed']}, check `source_map.OPCODE_COSTS`"
+        )
+    return profile
+
+
+def scenarios(
+    algorand: AlgorandClient,
+    client: SmartAsaClient,
+    bare_client: SmartAsaClient,
+    destroyable_client: SmartAsaClient,
+    allowlisted_client: SmartAsaClient,
+    allowlist: MerkleTree,
+    roles: SigningAccount,
+    holder: SigningAccount,
+    receiver: SigningAccount,
+    newcomer: SigningAccount,
+) -> dict[str, Scenario]:
+    """
+    Profiling scenarios by method (and `asset_transfer` branch).
+
+    `client` has circulating supply, `bare_client` has no Controlled ASA yet and
+    `destroyable_client` has no circulating supply, `allowlisted_client` has
+    `allowlist` set. `holder` owns supply (of `client` and `allowlisted_client`),
+    `receiver` is opted in (to both), `newcomer` is funded but not opted in, `roles`
+    holds every role (so `burn` acts as reserve and clawback).
+    """
+    smart_asa_id = client.state.global_state.smart_asa_id
+    min_fee = algorand.client.algod.suggested_params().min_fee
+
+    def as_sender(account: SigningAccount, inner_txns: int = 0) -> CommonAppCallParams:
+        return CommonAppCallParams(
+            sender=account.address,
+            signer=account.signer,
+            static_fee=AlgoAmount.from_micro_algo(min_fee * (1 + inner_txns)),
+        )
+
+    def transfer(
+        sender: SigningAccount, asset_sender: str, asset_receiver: str
+    ) -> Scenario:
+        return lambda: client.new_group().asset_transfer(
+            AssetTransferArgs(
+                xfer_asset=smart_asa_id,
+                asset_amount=1,
+                asset_sender=asset_sender,
+                asset_receiver=asset_receiver,
+            ),
+            params=as_sender(sender, inner_txns=1),
+        )
+
+    def asset_config_args() -> dict:
+        return {
+            "total": ASA_TOTAL,
+            "decimals": 0,
+            "default_frozen": False,
+            "unit_name": "PROF",
+            "name": "Profile",
+            "url": "",
+            "metadata_hash": b"",
+            "manager_addr": roles.address,
+            "reserve_addr": roles.address,
+            "freeze_addr": roles.address,
+            "clawback_addr": roles.address,
+        }
+
+    def asset_opt_in() -> SmartAsaComposer:
+        return client.new_group().opt_in.asset_opt_in(
+            AssetOptInArgs(
+                asset=smart_asa_id,
+                ctrl_asa_opt_in=TransactionWithSigner(
+                    txn=algorand.create_transaction.asset_opt_in(
+                        AssetOptInParams(asset_id=smart_asa_id, sender=newcomer.address)
+                    ),
+                    signer=newcomer.signer,
+                ),
+            ),
+            params=as_sender(newcomer),
+        )
+
+    def asset_close_out() -> SmartAsaComposer:
+        return (
+            client.new_group()
+            .close_out.asset_close_out(
+                AssetCloseOutArgs(close_asset=smart_asa_id, close_to=receiver.address),
+                params=as_sender(holder, inner_txns=1),
+            )
+            .add_transaction(
+                txn=algorand.create_transaction.asset_transfer(
+                    AssetTransferParams(
+                        sender=holder.address,
+                        asset_id=smart_asa_id,
+                        receiver=client.app_address,
+                        close_asset_to=client.app_address,
+                        amount=0,
+                    )
+                ),
+                signer=holder.signer,
+            )
+        )
+
+    return {
+        "asset_create": lambda: bare_client.new_group().asset_create(
+            AssetCreateArgs(**asset_config_args()),
+            params=CommonAppCallParams(
+                static_fee=AlgoAmount.from_micro_algo(min_fee * 2)
+            ),
+        ),
+        "asset_opt_in": asset_opt_in,
+        "asset_config": lambda: client.new_group().asset_config(
+            AssetConfigArgs(config_asset=smart_asa_id, **asset_config_args()),
+            params=as_sender(roles),
+        ),
+        "asset_transfer.mint": transfer(roles, client.app_address, receiver.address),
+        "asset_transfer.burn": transfer(roles, holder.address, client.app_address),
+        "asset_transfer.clawback": transfer(roles, holder.address, receiver.address),
+        "asset_transfer.regular": transfer(holder, holder.address, receiver.address),
+        "asset_transfer_batch.mint": lambda: client.new_group().asset_transfer_batch(
+            AssetTransferBatchArgs(
+                xfer_asset=smart_asa_id,
+                legs=[
+                    (client.app_address, account.address, 1)
+                    for account in (holder, receiver)
+                ],
+            ),
+            params=as_sender(roles, inner_txns=2),
+        ),
+        "asset_transfer_with_proof": lambda: allowlisted_client.new_group().asset_transfer_with_proof(
+            AssetTransferWithProofArgs(
+                xfer_asset=allowlisted_client.state.global_state.smart_asa_id,
+                asset_amount=1,
+                asset_sender=holder.address,
+                asset_receiver=receiver.address,
+                sender_proof=[*allowlist.proof(holder.address)],
+                receiver_proof=[*allowlist.proof(receiver.address)],
+            ),
+            params=as_sender(holder, inner_txns=1),
+        ),
+        "set_transfer_allowlist": lambda: client.new_group().set_transfer_allowlist(
+            SetTransferAllowlistArgs(
+                freeze_asset=smart_asa_id, allowlist_root=allowlist.root
+            ),
+            params=as_sender(roles),
+        ),
+        "asset_freeze": lambda: client.new_group().asset_freeze(
+            AssetFreezeArgs(freeze_asset=smart_asa_id, asset_frozen=True),
+            params=as_sender(roles),
+        ),
+        "account_freeze": lambda: client.new_group().account_freeze(
+            AccountFreezeArgs(
+                freeze_asset=smart_asa_id,
+                freeze_account=holder.address,
+                asset_frozen=True,
+            ),
+            params=as_sender(roles),
+        ),
+        "asset_close_out": asset_close_out,
+        "asset_destroy": lambda: destroyable_client.new_group().asset_destroy(
+            AssetDestroyArgs(
+                destroy_asset=destroyable_client.state.global_state.smart_asa_id
+            ),
+            params=as_sender(roles, inner_txns=1),
+        ),
+        "get_asset_config": lambda: client.new_group().get_asset_config(
+            GetAssetConfigArgs(asset=smart_asa_id), params=as_sender(roles)
+        ),
+        "get_asset_is_frozen": lambda: client.new_group().get_asset_is_frozen(
+            GetAssetIsFrozenArgs(freeze_asset=smart_asa_id), params=as_sender(roles)
+        ),
+        "get_account_is_frozen": lambda: client.new_group().get_account_is_frozen(
+            GetAccountIsFrozenArgs(
+                freeze_asset=smart_asa_id, freeze_account=holder.address
+            ),
+            params=as_sender(roles),
+        ),
+        "get_circulating_supply": lambda: client.new_group().get_circulating_supply(
+            GetCirculatingSupplyArgs(asset=smart_asa_id), params=as_sender(roles)
+        ),
+    }
+
+
+def mint(
+    algod: AlgodClient,
+    client: SmartAsaClient,
+    roles: SigningAccount,
+    receiver: SigningAccount,
+) -> None:
+    """Mints half of the total supply to `receiver`"""
+    client.send.asset_transfer(
+        AssetTransferArgs(
+            xfer_asset=client.state.global_state.smart_asa_id,
+            asset_amount=ASA_TOTAL // 2,
+            asset_sender=client.app_address,
+            asset_receiver=receiver.address,
+        ),
+        params=CommonAppCallParams(
+            sender=roles.address,
+            signer=roles.signer,
+            static_fee=AlgoAmount.from_micro_algo(algod.suggested_params().min_fee * 2),
+        ),
+    )
+
+
+def main() -> None:
+    program_map = ProgramMap.from_puya_map(APPROVAL_MAP)
+    algorand = AlgorandClient.default_localnet()
+    creator = funded_account(algorand)
+    roles = funded_account(algorand)
+
+    client = deploy_smart_asa(algorand, creator, roles)
+    destroyable_client = deploy_smart_asa(algorand, creator, roles)
+    bare_client, _ = algorand.client.get_typed_app_factory(
+        SmartAsaFactory,
+        default_sender=creator.address,
+        default_signer=creator.signer,
+    ).send.create.bare()
+    algorand.account.ensure_funded_from_environment(
+        account_to_fund=bare_client.app_address,
+        min_spending_balance=AlgoAmount.from_algo(1),
+    )
+
+    holder, receiver, newcomer = (funded_account(algorand) for _ in range(3))
+    allowlisted_client = deploy_smart_asa(algorand, creator, roles)
+    allowlist = MerkleTree(
+        [
+            holder.address,
+            receiver.address,
+            *(algorand.account.random().address for _ in range(ALLOWLIST_SIZE - 2)),
+        ]
+    )
+    for supplied_client in (client, allowlisted_client):
+        for account in (holder, receiver):
+            opt_in(supplied_client, account)
+        mint(algorand.client.algod, supplied_client, roles, holder)
+    allowlisted_client.send.set_transfer_allowlist(
+        SetTransferAllowlistArgs(
+            freeze_asset=allowlisted_client.state.global_state.smart_asa_id,
+            allowlist_root=allowlist.root,
+        ),
+        params=CommonAppCallParams(sender=roles.address, signer=roles.signer),
+    )
+
+    report: dict[str, dict] = {}
+    for name, scenario in scenarios(
+        algorand,
+        client,
+        bare_client,
+        destroyable_client,
+        allowlisted_client,
+        allowlist,
+        roles,
+        holder,
+        receiver,
+        newcomer,
+    ).items():
+        report[name] = profile_group(scenario(), program_map)
+        logger.info(
+            f"{name}: {report[name]['app_budget_consumed']} opcode budget, "
+            f"{report[name]['opcodes']} opcodes"
+        )
+    logger.info(f"Report written to {write_report('opcode_profile', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,119 @@
+"""
+Opcode cost of the Smart ASA configuration layouts: one global state key per field
+(SmartAsa) against a single ARC-4 encoded AssetConfig box read at fixed offsets
+(SmartAsaPacked).
+
+Both apps are deployed with the same configuration and every method is simulated,
+nothing is committed on chain besides the fixtures. Requires a running LocalNet and
+built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.packed_config
+"""
+
+import logging
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams
+from algokit_utils.config import config
+
+from benchmarks.localnet import (
+    ASA_TOTAL,
+    app_budget_consumed,
+    deploy_smart_asa,
+    funded_account,
+    opt_in,
+    write_report,
+)
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    SmartAsaComposer,
+    SmartAsaFactory,
+)
+from smart_contracts.artifacts.smart_asa_packed.smart_asa_packed_client import (
+    SmartAsaPackedComposer,
+    SmartAsaPackedFactory,
+)
+
+logger = logging.getLogger(__name__)
+
+LAYOUTS = {"global_state": SmartAsaFactory, "packed_box": SmartAsaPackedFactory}
+
+
+def measure_layout(algorand: AlgorandClient, factory_type: type) -> dict[str, int]:
+    creator, roles, receiver = (funded_account(algorand) for _ in range(3))
+    client = deploy_smart_asa(algorand, creator, roles, factory_type)
+    opt_in(client, receiver)
+    smart_asa_id = client.state.global_state.smart_asa_id
+    min_fee = algorand.client.algod.suggested_params().min_fee
+
+    def as_roles(inner_txns: int = 0) -> CommonAppCallParams:
+        return CommonAppCallParams(
+            sender=roles.address,
+            signer=roles.signer,
+            static_fee=AlgoAmount.from_micro_algo(min_fee * (1 + inner_txns)),
+        )
+
+    def cost(group: SmartAsaComposer | SmartAsaPackedComposer) -> int:
+        return app_budget_consumed(
+            group.simulate(allow_unnamed_resources=True, skip_signatures=True)
+        )
+
+    return {
+        "asset_config": cost(
+            client.new_group().asset_config(
+                (
+                    smart_asa_id,
+                    ASA_TOTAL,
+                    0,
+                    False,
+                    "BENCH",
+                    "Benchmark",
+                    "",
+                    b"",
+                    roles.address,
+                    roles.address,
+                    roles.address,
+                    roles.address,
+                ),
+                params=as_roles(),
+            )
+        ),
+        "asset_transfer.mint": cost(
+            client.new_group().asset_transfer(
+                (smart_asa_id, 1, client.app_address, receiver.address),
+                params=as_roles(inner_txns=1),
+            )
+        ),
+        "asset_freeze": cost(
+            client.new_group().asset_freeze((smart_asa_id, True), params=as_roles())
+        ),
+        "account_freeze": cost(
+            client.new_group().account_freeze(
+                (smart_asa_id, receiver.address, True), params=as_roles()
+            )
+        ),
+        "get_asset_config": cost(
+            client.new_group().get_asset_config((smart_asa_id,), params=as_roles())
+        ),
+    }
+
+
+def main() -> None:
+    # The packed layout needs its AssetConfig box reference populated.
+    config.configure(populate_app_call_resources=True)
+    algorand = AlgorandClient.default_localnet()
+    report: dict[str, dict] = {
+        layout: measure_layout(algorand, factory_type)
+        for layout, factory_type in LAYOUTS.items()
+    }
+    report["delta"] = {
+        method: report["packed_box"][method] - report["global_state"][method]
+        for method in report["global_state"]
+    }
+    for method, delta in report["delta"].items():
+        logger.info(f"{method}: {delta:+} opcode budget (packed - global state)")
+    logger.info(f"Report written to {write_report('packed_config', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,153 @@
+import dataclasses
+import json
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Final
+
+UNMAPPED: Final[str] = "<unmapped>"
+# AVM opcode budget of the opcodes not costing 1 (fixed costs, AVM v10):
+# https://developer.algorand.org/docs/get-details/dapps/avm/teal/opcodes/v10/
+OPCODE_COSTS: Final[dict[str, int]] = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "sumhash512": 50,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+}
+
+_BASE64: Final[dict[str, int]] = {
+    char: idx
+    for idx, char in enumerate(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    )
+}
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    """Decodes a Base64 VLQ source map segment into its (relative) fields"""
+    fields: list[int] = []
+    shift = value = 0
+    for char in segment:
+        digit = _BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            fields.append(-(value >> 1) if value & 1 else value >> 1)
+            shift = value = 0
+    return fields
+
+
+@dataclasses.dataclass(frozen=True)
+class ProgramMap:
+    """Program Counter attribution of a compiled program to its Algorand Python sources"""
+
+    source_paths: list[Path]
+    source_lines: list[list[str]]
+    pc_to_line: dict[int, tuple[int, int]]  # PC -> (source index, line)
+    pc_to_subroutine: dict[int, str]
+    pc_to_op: dict[int, str]
+
+    @classmethod
+    def from_puya_map(cls, map_path: Path) -> "ProgramMap":
+        """Loads a `*.puya.map` produced by `algokit compile python --output-source-map`"""
+        puya_map = json.loads(map_path.read_text())
+        sources: list[str] = puya_map["sources"]
+        mappings: str = puya_map["mappings"]
+        source_paths = [(map_path.parent / source).resolve() for source in sources]
+
+        # One ';'-separated group per PC, source indexes and lines are cumulative
+        # across segments. A PC is attributed to the first segment of its group.
+        pc_to_line: dict[int, tuple[int, int]] = {}
+        source = line = 0
+        for pc, group in enumerate(mappings.split(";")):
+            for idx, segment in enumerate(group.split(",") if group else []):
+                fields = _decode_vlq(segment)
+                if len(fields) >= 4:
+                    source += fields[1]
+                    line += fields[2]
+                    if idx == 0:
+                        pc_to_line[pc] = (source, line + 1)
+
+        pc_to_subroutine: dict[int, str] = {}
+        pc_to_op: dict[int, str] = {}
+        subroutine = UNMAPPED
+        for pc, event in sorted(
+            (int(pc), event) for pc, event in puya_map["pc_events"].items()
+        ):
+            subroutine = event.get("subroutine", subroutine)
+            pc_to_subroutine[pc] = subroutine.rsplit(".", 1)[-1]
+            if "op" in event:
+                pc_to_op[pc] = event["op"].split()[0]
+
+        return cls(
+            source_paths=source_paths,
+            source_lines=[path.read_text().splitlines() for path in source_paths],
+            pc_to_line=pc_to_line,
+            pc_to_subroutine=pc_to_subroutine,
+            pc_to_op=pc_to_op,
+        )
+
+    def subroutine(self, pc: int) -> str:
+        return self.pc_to_subroutine.get(pc, UNMAPPED)
+
+    def cost(self, pc: int) -> int:
+        """Opcode budget of the opcode at `pc`"""
+        return OPCODE_COSTS.get(self.pc_to_op.get(pc, ""), 1)
+
+    def location(self, pc: int) -> str:
+        """`<package>/<module>.py:<line>` of the source line compiled to `pc`"""
+        if pc not in self.pc_to_line:
+            return UNMAPPED
+        source, line = self.pc_to_line[pc]
+        path = self.source_paths[source]
+        return f"{path.parent.name}/{path.name}:{line}"
+
+    def source(self, pc: int) -> str:
+        if pc not in self.pc_to_line:
+            return ""
+        source, line = self.pc_to_line[pc]
+        return self.source_lines[source][line - 1].strip()
+
+    def attribute(self, pcs: Iterable[int]) -> dict:
+        """Attributes the opcode budget of executed PCs to subroutines and source lines"""
+        executed = list(pcs)
+        per_line: Counter[str] = Counter()
+        per_subroutine: Counter[str] = Counter()
+        sources: dict[str, str] = {}
+        for pc in executed:
+            location = self.location(pc)
+            per_line[location] += self.cost(pc)
+            per_subroutine[self.subroutine(pc)] += self.cost(pc)
+            sources.setdefault(location, self.source(pc))
+        return {
+            "opcodes": len(executed),
+            "cost": sum(per_line.values()),
+            "subroutines": dict(per_subroutine.most_common()),
+            "lines": {
+                location: {"cost": cost, "source": sources[location]}
+                for location, cost in sorted(per_line.items(), key=_line_order)
+            },
+        }
+
+
+def _line_order(item: tuple[str, int]) -> tuple[str, int]:
+    location, _ = item
+    path, _, line = location.rpartition(":")
+    return (path, int(line)) if path else (location, 0)
@@ -0,0 +1,121 @@
+"""
+Decoding 100k `AssetConfig` ABI returns: the typed client `_init_dataclass` against
+the cached decoders of `smart_contracts.smart_asa.decoders`, for each result
+representation (dataclass, `__slots__` dataclass, named tuple).
+
+The report has the seconds to decode from AlgoKit Utils ABI returns (dicts) and from
+ABI encoded bytes, and the speedups. Does not require LocalNet:
+
+    poetry run python -m benchmarks.struct_decoding
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Final
+
+from algosdk import abi
+
+from benchmarks.localnet import ASA_TOTAL, write_report
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetConfig,
+    _init_dataclass,
+)
+from smart_contracts.smart_asa.decoders import (
+    REPRESENTATIONS,
+    abi_struct_decoder,
+    struct_decoder,
+)
+
+logger = logging.getLogger(__name__)
+
+DECODES: Final[int] = 100_000
+ASSET_CONFIG_ABI: Final[str] = (
+    "(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)"
+)
+# Zero address
+ADDRESS: Final[str] = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ"
+
+
+def asset_configs(n: int) -> list[dict[str, object]]:
+    return [
+        {
+            "total": ASA_TOTAL,
+            "decimals": 0,
+            "default_frozen": False,
+            "unit_name": "BENCH",
+            "name": f"Benchmark {i}",
+            "url": "",
+            "metadata_hash": b"",
+            "manager_addr": ADDRESS,
+            "reserve_addr": ADDRESS,
+            "freeze_addr": ADDRESS,
+            "clawback_addr": ADDRESS,
+        }
+        for i in range(n)
+    ]
+
+
+def seconds(values: list, decode: Callable[..., object]) -> float:
+    start = time.perf_counter()
+    for value in values:
+        decode(value)
+    return time.perf_counter() - start
+
+
+def measure_dicts(configs: list[dict[str, object]]) -> dict[str, float]:
+    report = {
+        "typed_client": seconds(
+            configs, lambda data: _init_dataclass(AssetConfig, data)
+        )
+    }
+    for representation in REPRESENTATIONS:
+        report[representation] = seconds(
+            configs, struct_decoder(AssetConfig, representation)
+        )
+    return report
+
+
+def measure_abi(configs: list[dict[str, object]]) -> dict[str, float]:
+    tuple_type = abi.ABIType.from_string(ASSET_CONFIG_ABI)
+    encoded = [tuple_type.encode(list(config.values())) for config in configs]
+    names = list(configs[0])
+
+    def typed_client(data: bytes) -> object:
+        return _init_dataclass(
+            AssetConfig, dict(zip(names, tuple_type.decode(data), strict=True))
+        )
+
+    report = {"typed_client": seconds(encoded, typed_client)}
+    for representation in REPRESENTATIONS:
+        report[representation] = seconds(
+            encoded, abi_struct_decoder(AssetConfig, ASSET_CONFIG_ABI, representation)
+        )
+    return report
+
+
+def main() -> None:
+    configs = asset_configs(DECODES)
+    report: dict[str, dict] = {
+        "dict_s": measure_dicts(configs),
+        "abi_s": measure_abi(configs),
+    }
+    report["speedup"] = {
+        section: {
+            representation: report[section]["typed_client"]
+            / report[section][representation]
+            for representation in REPRESENTATIONS
+        }
+        for section in ("dict_s", "abi_s")
+    }
+    for section, speedups in report["speedup"].items():
+        logger.info(
+            f"{section}: "
+            + ", ".join(f"{name} {speedup:.1f}x" for name, speedup in speedups.items())
+        )
+    logger.info(f"Report written to {write_report('struct_decoding', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,122 @@
+"""
+Total LocalNet test suite time, a SmartAsa app deployed and funded per test (pool of
+one app) against the pooled app fixture (apps deployed and funded 16 per group).
+
+The report has, for each `--app-pool-size`:
+- `seconds` and `exit_code`: the suite wall-clock seconds and the pytest exit code
+  (the timings are only comparable if both runs pass);
+- `algod_calls`: the algod round trips of the run, from `--http-accounting`;
+- `deploy_groups`: the app create and funding groups confirmed for the pooled apps,
+  counted from the collected tests drawing one (does not require LocalNet).
+
+Requires a running LocalNet and built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.suite_time
+"""
+
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from benchmarks.localnet import RESULTS_PATH, write_report
+
+logger = logging.getLogger(__name__)
+
+PROJECT_PATH: Final[Path] = Path(__file__).parent.parent
+POOL_SIZES: Final[tuple[int, ...]] = (1, 16)
+POOLED_APP_FIXTURE: Final[str] = "smart_asa_client_no_asset"
+SUITE_OPTIONS: Final[tuple[str, ...]] = ("-p", "no:sugar", "-m", "not offline")
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.items: list[pytest.Item] = []
+
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        self.items = list(session.items)
+
+
+def pooled_apps() -> int:
+    """LocalNet tests drawing an app from the pool, from the collected suite"""
+    collector = _Collector()
+    pytest.main(
+        [
+            str(PROJECT_PATH / "tests"),
+            "--collect-only",
+            "-p",
+            "no:terminal",
+            *SUITE_OPTIONS,
+        ],
+        plugins=[collector],
+    )
+    return sum(POOLED_APP_FIXTURE in item.fixturenames for item in collector.items)
+
+
+def deploy_groups(apps: int, pool_size: int) -> int:
+    """Groups confirmed to deploy `apps`: a create and a funding group per refill"""
+    return 2 * -(-apps // pool_size)
+
+
+def algod_calls(accounting_path: Path) -> int:
+    """algod round trips of a suite run, from its HTTP accounting report"""
+    phases = json.loads(accounting_path.read_text())["phases"]
+    return sum(phase["calls"].get("algod", 0) for phase in phases.values())
+
+
+def run_suite(name: str, *options: str) -> dict:
+    """Seconds, exit code and algod calls of the LocalNet suite run with `options`"""
+    accounting_path = RESULTS_PATH / f"{name}_http_accounting.json"
+    accounting_path.unlink(missing_ok=True)
+    start = time.perf_counter()
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "tests",
+            "-q",
+            *SUITE_OPTIONS,
+            "--http-accounting",
+            f"--http-accounting-json={accounting_path}",
+            *options,
+        ],
+        cwd=PROJECT_PATH,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return {
+        "seconds": time.perf_counter() - start,
+        "exit_code": result.returncode,
+        "algod_calls": (
+            algod_calls(accounting_path) if accounting_path.exists() else None
+        ),
+    }
+
+
+def main() -> None:
+    apps = pooled_apps()
+    report: dict[str, dict] = {}
+    for pool_size in POOL_SIZES:
+        name = f"app_pool_size_{pool_size}"
+        report[name] = {
+            **run_suite(name, f"--app-pool-size={pool_size}"),
+            "deploy_groups": deploy_groups(apps, pool_size),
+        }
+        logger.info(
+            f"App pool size {pool_size}: {report[name]['seconds']:.1f} s "
+            f"(exit {report[name]['exit_code']}), {report[name]['algod_calls']} "
+            f"algod calls, {report[name]['deploy_groups']} deploy groups"
+        )
+    logger.info(f"Report written to {write_report('suite_time', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
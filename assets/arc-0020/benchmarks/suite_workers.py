@@ -0,0 +1,62 @@
+"""
+Total LocalNet test suite time across pytest-xdist workers (`-n 1`, `-n 4`, `-n 8`),
+each worker funding its accounts from its own worker dispenser and deploying its own
+pool of SmartAsa apps.
+
+The report has, for each worker count:
+- `seconds`, `speedup` and `exit_code`: the suite wall-clock seconds, the speedup
+  over a single worker and the pytest exit code (the timings are only comparable if
+  all the runs pass);
+- `algod_calls`: the algod round trips of all the workers, from `--http-accounting`;
+- `max_deploy_groups`: the most app create and funding groups the workers can
+  confirm for their pools, each worker refilling its own (does not require LocalNet).
+
+Requires a running LocalNet and built artifacts:
+
+    poetry run python -m smart_contracts build
+    poetry run python -m benchmarks.suite_workers
+"""
+
+import logging
+from typing import Final
+
+from arc_common.funding import MAX_GROUP_SIZE
+
+from benchmarks.localnet import write_report
+from benchmarks.suite_time import pooled_apps, run_suite
+
+logger = logging.getLogger(__name__)
+
+WORKERS: Final[tuple[int, ...]] = (1, 4, 8)
+
+
+def max_deploy_groups(apps: int, workers: int) -> int:
+    """
+    Most groups confirmed to deploy `apps` across `workers` pools of 16: each worker
+    leaves at most 15 apps of its last refill unused.
+    """
+    refills = (apps + (MAX_GROUP_SIZE - 1) * workers) // MAX_GROUP_SIZE
+    return 2 * min(refills, apps)
+
+
+def main() -> None:
+    apps = pooled_apps()
+    report: dict[str, dict] = {}
+    for workers in WORKERS:
+        name = f"workers_{workers}"
+        run = run_suite(name, "-n", str(workers))
+        run["speedup"] = (
+            report["workers_1"]["seconds"] / run["seconds"] if report else 1.0
+        )
+        run["max_deploy_groups"] = max_deploy_groups(apps, workers)
+        report[name] = run
+        logger.info(
+            f"{workers} workers: {run['seconds']:.1f} s (exit {run['exit_code']}), "
+            f"{run['algod_calls']} algod calls"
+        )
+    logger.info(f"Report written to {write_report('suite_workers', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,112 @@
+"""
+Fees and opcode cost per leg: `asset_transfer` (one app call per leg) vs
+`asset_transfer_batch` (one app call, legs submitted as one inner group).
+
+Requires a running LocalNet:
+
+    poetry run python -m benchmarks.transfer_batch
+"""
+
+import logging
+from typing import Final
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams
+
+from benchmarks.localnet import (
+    app_budget_consumed,
+    deploy_smart_asa,
+    funded_account,
+    opt_in,
+    write_report,
+)
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetTransferArgs,
+    AssetTransferBatchArgs,
+    SmartAsaClient,
+)
+
+logger = logging.getLogger(__name__)
+
+# A single app call can reference at most 4 foreign accounts, so larger batches
+# with distinct receivers need extra reference-carrying transactions in the group.
+BATCH_SIZES: Final[tuple[int, ...]] = (1, 2, 4)
+
+
+def measure_single_legs(
+    client: SmartAsaClient, sender: str, receivers: list[str], min_fee: int
+) -> dict:
+    group = client.new_group()
+    for receiver in receivers:
+        group.asset_transfer(
+            AssetTransferArgs(
+                xfer_asset=client.state.global_state.smart_asa_id,
+                asset_amount=1,
+                asset_sender=client.app_address,
+                asset_receiver=receiver,
+            ),
+            params=CommonAppCallParams(
+                sender=sender,
+                static_fee=AlgoAmount.from_micro_algo(min_fee * 2),
+            ),
+        )
+    opcode_cost = app_budget_consumed(
+        group.simulate(allow_unnamed_resources=True, skip_signatures=True)
+    )
+    return {
+        "fee_per_leg": min_fee * 2,
+        "opcode_cost_per_leg": opcode_cost / len(receivers),
+    }
+
+
+def measure_batch(
+    client: SmartAsaClient, sender: str, receivers: list[str], min_fee: int
+) -> dict:
+    fee = min_fee * (1 + len(receivers))
+    result = (
+        client.new_group()
+        .asset_transfer_batch(
+            AssetTransferBatchArgs(
+                xfer_asset=client.state.global_state.smart_asa_id,
+                legs=[(client.app_address, receiver, 1) for receiver in receivers],
+            ),
+            params=CommonAppCallParams(
+                sender=sender, static_fee=AlgoAmount.from_micro_algo(fee)
+            ),
+        )
+        .simulate(allow_unnamed_resources=True, skip_signatures=True)
+    )
+    return {
+        "fee_per_leg": fee / len(receivers),
+        "opcode_cost_per_leg": app_budget_consumed(result) / len(receivers),
+    }
+
+
+def main() -> None:
+    algorand = AlgorandClient.default_localnet()
+    creator = funded_account(algorand)
+    reserve = funded_account(algorand)
+    client = deploy_smart_asa(algorand, creator, reserve)
+
+    receivers = [funded_account(algorand) for _ in range(max(BATCH_SIZES))]
+    for receiver in receivers:
+        opt_in(client, receiver)
+
+    min_fee = algorand.client.algod.suggested_params().min_fee
+    report: dict[str, dict] = {}
+    for size in BATCH_SIZES:
+        addresses = [receiver.address for receiver in receivers[:size]]
+        report[str(size)] = {
+            "asset_transfer": measure_single_legs(
+                client, reserve.address, addresses, min_fee
+            ),
+            "asset_transfer_batch": measure_batch(
+                client, reserve.address, addresses, min_fee
+            ),
+        }
+        logger.info(f"{size} legs: {report[str(size)]}")
+    logger.info(f"Report written to {write_report('transfer_batch', report)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    main()
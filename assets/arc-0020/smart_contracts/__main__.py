@@ -1,15 +1,27 @@
+import argparse
+import ast
+import contextlib
 import dataclasses
+import hashlib
 import importlib
+import importlib.metadata
+import json
 import logging
+import multiprocessing
+import os
+import re
+import shutil
 import subprocess
-import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from shutil import rmtree
 
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+from smart_contracts import _in_process
+
 # Set up logging and load environment variables.
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
@@ -34,6 +46,7 @@ class SmartContract:
     path: Path
     name: str
     deploy: Callable[[], None] | None = None
+    depends_on: list[str] = dataclasses.field(default_factory=list)
 
 
 def import_contract(folder: Path) -> Path:
@@ -55,6 +68,17 @@ def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
         return None
 
 
+def import_dependencies_if_exists(folder: Path) -> list[str]:
+    """Imports the names of the contracts to deploy first (DEPENDS_ON) if it exists."""
+    try:
+        module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
+        deploy_module = importlib.import_module(module_name)
+        depends_on: list[str] = getattr(deploy_module, "DEPENDS_ON", [])
+        return list(depends_on)
+    except ImportError:
+        return []
+
+
 def has_contract_file(directory: Path) -> bool:
     """Checks whether the directory contains a contract.py file."""
     return (directory / "contract.py").exists()
@@ -67,6 +91,7 @@ contracts: list[SmartContract] = [
         path=import_contract(folder),
         name=folder.name,
         deploy=import_deploy_if_exists(folder),
+        depends_on=import_dependencies_if_exists(folder),
     )
     for folder in root_path.iterdir()
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
@@ -86,35 +111,170 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+# ------------------------- Build Cache Logic ------------------------- #
+
+build_cache_file_name = ".build_hash"
+compile_options = ["--no-output-arc32", "--output-arc56", "--output-source-map"]
+tool_packages = ["puyapy", "algorand-python", "algokit-client-generator"]
+
+
+def _imported_modules(source_path: Path) -> Iterator[Path]:
+    """Yields the `smart_contracts` module files imported by a source file."""
+    for node in ast.walk(ast.parse(source_path.read_text())):
+        if isinstance(node, ast.ImportFrom):
+            if node.level:  # Relative import
+                base = source_path.parents[node.level - 1]
+            elif node.module and node.module.split(".")[0] == root_path.name:
+                base = root_path.parent
+            else:
+                continue
+            module = base.joinpath(*(node.module or "").split("."))
+            names = [module / alias.name for alias in node.names]
+        elif isinstance(node, ast.Import):
+            names = [
+                root_path.parent.joinpath(*alias.name.split("."))
+                for alias in node.names
+                if alias.name.split(".")[0] == root_path.name
+            ]
+            module = root_path
+        else:
+            continue
+        # `from package import module` or `from module import name`
+        for candidate in [module, *names]:
+            for path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+                if path.is_file():
+                    yield path
+
+
+def _contract_sources(contract_path: Path) -> list[Path]:
+    """The contract source and, transitively, its `smart_contracts` imports."""
+    sources = {contract_path.resolve()}
+    pending = [contract_path.resolve()]
+    while pending:
+        for module_path in _imported_modules(pending.pop()):
+            module_path = module_path.resolve()
+            if module_path not in sources:
+                sources.add(module_path)
+                pending.append(module_path)
+    return sorted(sources)
+
+
+def _tool_versions() -> list[str]:
+    """Compiler and client generator versions, without spawning them."""
+    versions = []
+    for package in tool_packages:
+        try:
+            versions.append(f"{package}=={importlib.metadata.version(package)}")
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(f"{package}==<missing>")
+    algokit = shutil.which("algokit")
+    if algokit:  # AlgoKit CLI upgrades replace its entry point
+        algokit_path = Path(algokit).resolve()
+        versions.append(f"algokit@{algokit_path}:{algokit_path.stat().st_mtime_ns}")
+    return versions
+
+
+def build_hash(contract_path: Path) -> str:
+    """Content hash of everything a contract build depends on."""
+    digest = hashlib.sha256()
+    manifest = {
+        "options": [*compile_options, deployment_extension],
+        "tools": _tool_versions(),
+    }
+    digest.update(json.dumps(manifest, sort_keys=True).encode())
+    for source_path in _contract_sources(contract_path):
+        digest.update(str(source_path.relative_to(root_path)).encode())
+        digest.update(hashlib.sha256(source_path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def is_build_fresh(output_dir: Path, contract_hash: str) -> bool:
+    """Checks whether the output directory was built from the same inputs."""
+    cache_file = output_dir / build_cache_file_name
+    return cache_file.is_file() and cache_file.read_text().strip() == contract_hash
+
+
+# ------------------------- Build Backend Logic ------------------------- #
+
+build_backends = ["subprocess", "in-process"]
+compiler_script = "puyapy"
+client_generator_script = "algokitgen-py"
+
+
+def in_process_tools(jobs: int) -> ProcessPoolExecutor:
+    """
+    Long-lived worker processes running the compiler and client generator.
+
+    Workers are started on demand, from the builder threads: they are spawned, not
+    forked, as forking a multi-threaded process can deadlock the child.
+    """
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_in_process.preload,
+        initargs=(compiler_script, client_generator_script),
+    )
+
+
+def run_tool(
+    command: list[str],
+    script: str,
+    script_args: list[str],
+    tools: ProcessPoolExecutor | None,
+) -> tuple[int, str]:
+    """
+    Runs a build step as an AlgoKit CLI `command` subprocess or, with in-process
+    `tools`, as a `script` console script call in a tools worker process.
+    Returns the exit code and the combined stdout and stderr.
+    """
+    if tools is None:
+        result = subprocess.run(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        return result.returncode, result.stdout
+    return tools.submit(_in_process.run_console_script, script, script_args).result()
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+
+
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    *,
+    force: bool = False,
+    tools: ProcessPoolExecutor | None = None,
+) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    The build is skipped if the output directory is fresh (same sources, imports and
+    tool versions) unless forced, otherwise the output directory is cleared.
+    Build steps run as AlgoKit CLI subprocesses, or in the in-process `tools` workers.
     """
     output_dir = output_dir.resolve()
+    contract_hash = build_hash(contract_path)
+    if not force and is_build_fresh(output_dir, contract_hash):
+        logger.info(f"Skipping {contract_path}, {output_dir} is up to date")
+        return next(output_dir.glob("*.arc56.json"), output_dir)
     if output_dir.exists():
         rmtree(output_dir)
     output_dir.mkdir(exist_ok=True, parents=True)
     logger.info(f"Exporting {contract_path} to {output_dir}")
 
-    build_result = subprocess.run(
-        [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
-            str(contract_path.resolve()),
-            f"--out-dir={output_dir}",
-            "--no-output-arc32",
-            "--output-arc56",
-            "--output-source-map",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+    compile_args = [
+        str(contract_path.resolve()),
+        f"--out-dir={output_dir}",
+        *compile_options,
+    ]
+    returncode, output = run_tool(
+        ["algokit", "--no-color", "compile", "python", *compile_args],
+        compiler_script,
+        compile_args,
+        tools,
     )
-    if build_result.returncode:
-        raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    if returncode:
+        raise Exception(f"Could not build contract:\n{output}")
 
     # Look for arc56.json files and generate the client based on them.
     app_spec_file_names: list[str] = [
@@ -129,40 +289,175 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     else:
         for file_name in app_spec_file_names:
             client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
+            logger.info(f"Generating client for {file_name}")
+            client_path = str(_get_output_path(output_dir, deployment_extension))
+            returncode, output = run_tool(
                 [
                     "algokit",
                     "generate",
                     "client",
                     str(output_dir),
                     "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
+                    client_path,
                 ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
+                client_generator_script,
+                [
+                    "--app_spec",
+                    str(output_dir / file_name),
+                    "--output",
+                    client_path.format(
+                        contract_name=_snake_case(file_name.split(".")[0])
+                    ),
+                ],
+                tools,
             )
-            if generate_result.returncode:
-                if "No such command" in generate_result.stdout:
+            if returncode:
+                if "No such command" in output:
                     raise Exception(
                         "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
                     )
                 else:
-                    raise Exception(
-                        f"Could not generate typed client:\n{generate_result.stdout}"
-                    )
+                    raise Exception(f"Could not generate typed client:\n{output}")
+    # Written last, an interrupted build is never considered fresh.
+    (output_dir / build_cache_file_name).write_text(contract_hash + "\n")
     if client_file:
         return output_dir / client_file
     return output_dir
 
 
-# --------------------------- Main Logic --------------------------- #
+# ------------------------- Scheduler Logic ------------------------- #
+
+
+def check_app_spec(output_dir: Path) -> None:
+    """Checks that the contract has been built before deploying it."""
+    app_spec_file_name = next(
+        (
+            file.name
+            for file in output_dir.iterdir()
+            if file.is_file() and file.suffixes == [".arc56", ".json"]
+        ),
+        None,
+    )
+    if app_spec_file_name is None:
+        raise Exception("Could not deploy app, .arc56.json file not found")
+
+
+def deploy_order(contracts: list[SmartContract]) -> list[SmartContract]:
+    """Orders contracts after their deploy dependencies, otherwise keeping their order."""
+    by_name = {contract.name: contract for contract in contracts}
+    ordered: list[SmartContract] = []
+    visiting: set[str] = set()
+
+    def visit(contract: SmartContract) -> None:
+        if contract in ordered:
+            return
+        if contract.name in visiting:
+            raise Exception(f"Circular deploy dependency on {contract.name}")
+        visiting.add(contract.name)
+        for dependency in contract.depends_on:
+            if dependency in by_name:
+                visit(by_name[dependency])
+        visiting.remove(contract.name)
+        ordered.append(contract)
+
+    for contract in contracts:
+        visit(contract)
+    return ordered
+
+
+def deploy_when_ready(
+    contract: SmartContract,
+    output_dir: Path,
+    prerequisites: list[Future[Path] | Future[None]],
+) -> None:
+    """Deploys the contract once its build and its dependencies deploys are done."""
+    for prerequisite in prerequisites:
+        prerequisite.result()
+    check_app_spec(output_dir)
+    if contract.deploy:
+        logger.info(f"Deploying app {contract.name}")
+        contract.deploy()
 
 
-def main(action: str, contract_name: str | None = None) -> None:
-    """Main entry point to build and/or deploy smart contracts."""
+def schedule(
+    contracts: list[SmartContract],
+    *,
+    build_contracts: bool,
+    deploy_contracts: bool,
+    jobs: int,
+    force: bool,
+    backend: str = "subprocess",
+) -> None:
+    """
+    Builds contracts concurrently, up to `jobs` compiler and client generator
+    processes at a time. A contract is deployed as soon as it is built, after the
+    contracts it depends on (DEPENDS_ON in its deploy_config) have been deployed.
+    With the "in-process" backend the processes are `jobs` long-lived workers
+    importing the tools once, instead of an AlgoKit CLI subprocess per build step.
+    """
     artifact_path = root_path / "artifacts"
+    tools = (
+        in_process_tools(jobs) if build_contracts and backend == "in-process" else None
+    )
+    with (
+        ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="build") as builder,
+        ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="deploy") as deployer,
+        tools or contextlib.nullcontext(),
+    ):
+        builds: dict[str, Future[Path]] = {}
+        if build_contracts:
+            for contract in contracts:
+                logger.info(f"Building app at {contract.path}")
+                builds[contract.name] = builder.submit(
+                    build,
+                    artifact_path / contract.name,
+                    contract.path,
+                    force=force,
+                    tools=tools,
+                )
+
+        # Deploys are submitted in dependency order, so a deploy only waits for
+        # already submitted ones and the bounded pool can not deadlock.
+        deploys: dict[str, Future[None]] = {}
+        if deploy_contracts:
+            for contract in deploy_order(contracts):
+                prerequisites: list[Future[Path] | Future[None]] = [
+                    deploys[dependency]
+                    for dependency in contract.depends_on
+                    if dependency in deploys
+                ]
+                if contract.name in builds:
+                    prerequisites.append(builds[contract.name])
+                deploys[contract.name] = deployer.submit(
+                    deploy_when_ready,
+                    contract,
+                    artifact_path / contract.name,
+                    prerequisites,
+                )
+
+        futures: list[Future[Path] | Future[None]] = [
+            *builds.values(),
+            *deploys.values(),
+        ]
+        for future in futures:
+            future.result()
+
+
+# --------------------------- Main Logic --------------------------- #
+
+
+def main(
+    action: str,
+    contract_name: str | None = None,
+    *,
+    force: bool = False,
+    jobs: int = 1,
+    backend: str = "subprocess",
+) -> None:
+    """
+    Main entry point to build and/or deploy smart contracts.
+    Up to date contracts are not rebuilt, unless forced.
+    """
     # Filter contracts based on an optional specific contract name.
     filtered_contracts = [
         contract
@@ -172,40 +467,72 @@ def main(action: str, contract_name: str | None = None) -> None:
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            schedule(
+                filtered_contracts,
+                build_contracts=True,
+                deploy_contracts=False,
+                jobs=jobs,
+                force=force,
+                backend=backend,
+            )
         case "deploy":
-            for contract in filtered_contracts:
-                output_dir = artifact_path / contract.name
-                app_spec_file_name = next(
-                    (
-                        file.name
-                        for file in output_dir.iterdir()
-                        if file.is_file() and file.suffixes == [".arc56", ".json"]
-                    ),
-                    None,
-                )
-                if app_spec_file_name is None:
-                    raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
-                    logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
+            schedule(
+                filtered_contracts,
+                build_contracts=False,
+                deploy_contracts=True,
+                jobs=jobs,
+                force=force,
+                backend=backend,
+            )
         case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
-                    logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+            schedule(
+                filtered_contracts,
+                build_contracts=True,
+                deploy_contracts=True,
+                jobs=jobs,
+                force=force,
+                backend=backend,
+            )
         case _:
             logger.error(f"Unknown action: {action}")
 
 
+class CliArgs(argparse.Namespace):
+    """Command line arguments, typed."""
+
+    action: str
+    contract_name: str | None
+    force: bool
+    jobs: int
+    backend: str
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    parser = argparse.ArgumentParser(description="Build and/or deploy smart contracts")
+    parser.add_argument("action", nargs="?", default="all")
+    parser.add_argument("contract_name", nargs="?", default=None)
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild up to date contracts"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="max concurrent builds and deploys (default: CPU count)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=build_backends,
+        default="subprocess",
+        help="run the compiler and client generator as AlgoKit CLI subprocesses "
+        "or in long-lived worker processes (default: subprocess)",
+    )
+    cli_args = parser.parse_args(namespace=CliArgs())
+    main(
+        cli_args.action,
+        cli_args.contract_name,
+        force=cli_args.force,
+        jobs=max(cli_args.jobs, 1),
+        backend=cli_args.backend,
+    )
@@ -0,0 +1,85 @@
+"""
+In-process runner for the compiler (puyapy) and client generator (algokitgen-py)
+console scripts, used by the "in-process" build backend.
+
+Tools are imported once per (long-lived) worker process and invoked as libraries,
+avoiding the interpreter and AlgoKit CLI startup of a subprocess per build step.
+"""
+
+import contextlib
+import importlib.metadata
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from typing import BinaryIO
+
+_console_scripts: dict[str, Callable[[], object]] = {}
+
+
+def _console_script(name: str) -> Callable[[], object]:
+    """The `name` console script entry point, imported once per worker."""
+    if name not in _console_scripts:
+        (entry_point,) = importlib.metadata.entry_points(
+            group="console_scripts", name=name
+        )
+        script: Callable[[], object] = entry_point.load()
+        _console_scripts[name] = script
+    return _console_scripts[name]
+
+
+def preload(*names: str) -> None:
+    """Imports the console scripts ahead of the first build step."""
+    for name in names:
+        _console_script(name)
+
+
+def _reset_logging() -> None:
+    """The compiler configures (structlog) logging only once per process."""
+    structlog = sys.modules.get("structlog")
+    if structlog is not None:
+        structlog.reset_defaults()
+
+
+@contextlib.contextmanager
+def _redirect_output(file: BinaryIO) -> Iterator[None]:
+    """
+    Redirects the process stdout and stderr to `file`, at the file descriptor level:
+    the compiler replaces `sys.stdout` with its own wrapper of the process stdout.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = [os.dup(fd) for fd in (1, 2)]
+    try:
+        for fd in (1, 2):
+            os.dup2(file.fileno(), fd)
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for fd, saved_fd in zip((1, 2), saved_fds, strict=True):
+            os.dup2(saved_fd, fd)
+            os.close(saved_fd)
+
+
+def run_console_script(name: str, args: list[str]) -> tuple[int, str]:
+    """Runs a console script with `args`, returns its exit code and output."""
+    output = tempfile.TemporaryFile()
+    argv = sys.argv
+    sys.argv = [name, *args]
+    _reset_logging()
+    try:
+        with _redirect_output(output):
+            result = _console_script(name)()
+        returncode = result if isinstance(result, int) else 0
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            returncode = e.code or 0
+        else:
+            output.write(str(e.code).encode())
+            returncode = 1
+    finally:
+        sys.argv = argv
+    with output:
+        output.seek(0)
+        return returncode, output.read().decode(errors="replace")
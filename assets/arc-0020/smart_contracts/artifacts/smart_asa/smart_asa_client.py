@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The total number of base units of the Smart ASA to create", "name": "total"}, {"type": "uint32", "desc": "The number of digits to use after the decimal point when displaying the Smart ASA", "name": "decimals"}, {"type": "bool", "desc": "Smart ASA default frozen (True to freeze holdings by default)", "name": "default_frozen"}, {"type": "string", "desc": "The name of a unit of Smart ASA", "name": "unit_name"}, {"type": "string", "desc": "The name of the Smart ASA", "name": "name"}, {"type": "string", "desc": "Smart ASA external URL", "name": "url"}, {"type": "byte[]", "desc": "Smart ASA metadata hash", "name": "metadata_hash"}, {"type": "address", "desc": "Account that can manage the configuration of the Smart ASA and destroy it", "name": "manager_addr"}, {"type": "address", "desc": "Account that holds the reserve (non-minted) units of Smart ASA and can mint or burn it", "name": "reserve_addr"}, {"type": "address", "desc": "Account that can freeze/unfreeze holdings of the Smart ASA globally or locally", "name": "freeze_addr"}, {"type": "address", "desc": "Account that can clawback holdings of the Smart ASA", "name": "clawback_addr"}], "name": "asset_create", "returns": {"type": "uint64", "desc": "Controlled ASA ID"}, "desc": "Create the Controlled ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["OptIn"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}, {"type": "axfer", "desc": "Controlled ASA opt in transaction", "name": "ctrl_asa_opt_in"}], "name": "asset_opt_in", "returns": {"type": "void"}, "desc": "Smart ASA opt in (App and Controlled ASA)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to configure", "name": "config_asset"}, {"type": "uint64", "desc": "Total number of base units if the Smart ASA. It can not be less than current circulating supply", "name": "total"}, {"type": "uint32", "desc": "The number of digits to use after the decimal point when displaying the Smart ASA", "name": "decimals"}, {"type": "bool", "desc": "Smart ASA default frozen (True to freeze holdings by default)", "name": "default_frozen"}, {"type": "string", "desc": "The name of a unit of Smart ASA", "name": "unit_name"}, {"type": "string", "desc": "The name of the Smart ASA", "name": "name"}, {"type": "string", "desc": "Smart ASA external URL", "name": "url"}, {"type": "byte[]", "desc": "Smart ASA metadata hash", "name": "metadata_hash"}, {"type": "address", "desc": "Account that can manage the configuration of the Smart ASA and destroy it", "name": "manager_addr"}, {"type": "address", "desc": "Account that holds the reserve (non-minted) units of Smart ASA and can mint or burn it", "name": "reserve_addr"}, {"type": "address", "desc": "Account that can freeze/unfreeze holdings of the Smart ASA globally or locally", "name": "freeze_addr"}, {"type": "address", "desc": "Account that can clawback holdings of the Smart ASA", "name": "clawback_addr"}], "name": "asset_config", "returns": {"type": "void"}, "desc": "Configure Smart ASA (for unchanged parameters use existing value - no optional args on AVM)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "uint64", "desc": "Amount to transfer", "name": "asset_amount"}, {"type": "address", "desc": "Smart ASA sender", "name": "asset_sender"}, {"type": "address", "desc": "Smart ASA receiver", "name": "asset_receiver"}], "name": "asset_transfer", "returns": {"type": "void"}, "desc": "Smart ASA transfers: regular, clawback, mint, burn", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to globally freeze/unfreeze", "name": "freeze_asset"}, {"type": "bool", "desc": "Smart ASA frozen status", "name": "asset_frozen"}], "name": "asset_freeze", "returns": {"type": "void"}, "desc": "Smart ASA global freeze (all accounts)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to locally freeze/unfreeze", "name": "freeze_asset"}, {"type": "address", "desc": "Account to freeze/unfreeze", "name": "freeze_account"}, {"type": "bool", "desc": "Smart ASA frozen status", "name": "asset_frozen"}], "name": "account_freeze", "returns": {"type": "void"}, "desc": "Smart ASA local freeze (account specific)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["CloseOut"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to close out", "name": "close_asset"}, {"type": "address", "desc": "Account to send all the Smart ASA remainder to.", "name": "close_to"}], "name": "asset_close_out", "returns": {"type": "void"}, "desc": "Smart ASA close out (App and Controlled ASA)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to destroy", "name": "destroy_asset"}], "name": "asset_destroy", "returns": {"type": "void"}, "desc": "Destroy the Controlled ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}], "name": "get_asset_config", "returns": {"type": "(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)", "desc": "Smart ASA configuration parameters", "struct": "AssetConfig"}, "desc": "Get Smart ASA configuration", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "freeze_asset"}], "name": "get_asset_is_frozen", "returns": {"type": "bool", "desc": "Smart ASA global frozen status"}, "desc": "Get Smart ASA global frozen status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "freeze_asset"}, {"type": "address", "desc": "Account to check", "name": "freeze_account"}], "name": "get_account_is_frozen", "returns": {"type": "bool", "desc": "Smart ASA account frozen status"}, "desc": "Get Smart ASA account frozen status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}], "name": "get_circulating_supply", "returns": {"type": "uint64", "desc": "Smart ASA circulating supply"}, "desc": "Get Smart ASA circulating supply", "events": [], "readonly": true, "recommendations": {}}], "name": "SmartAsa", "state": {"keys": {"box": {}, "global": {"total": {"key": "dG90YWw=", "keyType": "AVMString", "valueType": "AVMUint64"}, "decimals": {"key": "ZGVjaW1hbHM=", "keyType": "AVMString", "valueType": "AVMUint64"}, "default_frozen": {"key": "ZGVmYXVsdF9mcm96ZW4=", "keyType": "AVMString", "valueType": "AVMUint64"}, "unit_name": {"key": "dW5pdF9uYW1l", "keyType": "AVMString", "valueType": "AVMString"}, "name": {"key": "bmFtZQ==", "keyType": "AVMString", "valueType": "AVMString"}, "url": {"key": "dXJs", "keyType": "AVMString", "valueType": "AVMString"}, "metadata_hash": {"key": "bWV0YWRhdGFfaGFzaA==", "keyType": "AVMString", "valueType": "AVMBytes"}, "manager_addr": {"key": "bWFuYWdlcl9hZGRy", "keyType": "AVMString", "valueType": "address"}, "reserve_addr": {"key": "cmVzZXJ2ZV9hZGRy", "keyType": "AVMString", "valueType": "address"}, "freeze_addr": {"key": "ZnJlZXplX2FkZHI=", "keyType": "AVMString", "valueType": "address"}, "clawback_addr": {"key": "Y2xhd2JhY2tfYWRkcg==", "keyType": "AVMString", "valueType": "address"}, "smart_asa_id": {"key": "c21hcnRfYXNhX2lk", "keyType": "AVMString", "valueType": "AVMUint64"}, "global_frozen": {"key": "Z2xvYmFsX2Zyb3plbg==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"account_smart_asa_id": {"key": "YWNjb3VudF9zbWFydF9hc2FfaWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "account_frozen": {"key": "YWNjb3VudF9mcm96ZW4=", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 8, "ints": 5}, "local": {"bytes": 0, "ints": 2}}}, "structs": {"AssetConfig": [{"name": "total", "type": "uint64"}, {"name": "decimals", "type": "uint32"}, {"name": "default_frozen", "type": "bool"}, {"name": "unit_name", "type": "string"}, {"name": "name", "type": "string"}, {"name": "url", "type": "string"}, {"name": "metadata_hash", "type": "byte[]"}, {"name": "manager_addr", "type": "address"}, {"name": "reserve_addr", "type": "address"}, {"name": "freeze_addr", "type": "address"}, {"name": "clawback_addr", "type": "address"}]}, "byteCode": {"approval": "CyAFAAEIIP///////////wEmEQxzbWFydF9hc2FfaWQMcmVzZXJ2ZV9hZGRyDWNsYXdiYWNrX2FkZHIUYWNjb3VudF9zbWFydF9hc2FfaWQOYWNjb3VudF9mcm96ZW4LZnJlZXplX2FkZHINZ2xvYmFsX2Zyb3plbgxtYW5hZ2VyX2FkZHIFdG90YWwOZGVmYXVsdF9mcm96ZW4IZGVjaW1hbHMJdW5pdF9uYW1lBG5hbWUDdXJsDW1ldGFkYXRhX2hhc2gEFR98dQEAMRhAAE4xNSQSRDE0gQUSRDE3FEQxNoECEkQnCCJnJwoiZycJImcnC4AAZycMgABnJw2AAGcnDoAAZycHMgNnKTIDZycFMgNnKjIDZygiZycGImcxG0EAgYICBEhkFkUEOgRb3DYaAI4CAGEAVTEZFEQxGESCCgTn7NWoBPiBn+sEfqy3dQShM9WBBP9Tre8E7WRFLwQum5A4BJebmXIESKY8yQRGrQ1SNhoAjgoAIgH4AyYEUQR3BV4FvgaDBqEGyAAxGYECEjEYEERCBKUxGSMSMRgQREIBaTEZFDEYFBBEI0M2GgFJFSQSRDYaAkkVgQQSRDYaA0kVIxJENhoERwIiWYECCEwVEkQ2GgVHAiJZgQIITBUSRDYaBkcCIlmBAghMFRJENhoHRwIiWYECCEwVEkQ2GghJFSUSRDYaCUkVJRJENhoKSRUlEkQ2GgtJFSUSRDEAMgkSRCIoZUQURLEyCIAASwFBACJLAUmBChiACjAxMjM0NTY3ODlMI1hLAlBFAoEKCkUCQv/ZRwIVgAEwTgJNgA9hbGdvcmFuZDovL2FwcC9MUDIKRwOyLLIrsiqyKbIngBBBUkMtMjAgU21hcnQgQVNBsiaABkFSQy0yMLIlI7IkIrIjIQSyIoEDshAisgGzKLQ8Z0sMFycITGdLCxcnCkxnSwoiUycJTGdLCVcCACcLTGdLCFcCACcMTGdLB1cCACcNTGdLBlcCACcOTGcnB0sGZylLBWcnBUsEZypLA2ciKGVEFicPTFCwI0M2GgFJFSQSRBdJMRYjCUk4EIEEEkRLAYgFVEk4ESIoZURMSwESREsBOAAxABJESwE4FDEAEkRLATgSFERMOBUyAxJEMRkjEkQxAE8CcABFAUQxACtPAmYxACcEImYiJwllREAACjEASwFwAERBAAYxACcEI2YjQzYaAUkVJBJEF0k2GgJJTgIVJBJENhoDSU4CFYEEEkQ2GgRJTgIVIxJENhoFSU4CSSJZgQIITBUSRDYaBklOAkkiWYECCEwVEkQ2GgdJTgJJIlmBAghMFRJENhoISU4CSSJZgQIITBUSRDYaCUlOAhUlEkQ2GgpJTgJJFSUSRDYaC0lOAxUlEkQ2GgxJTgMVJRJETIgEYTEAIicHZUQSRCIpZUQTQQAIIillRDIDE0QiJwVlREsCE0EACSInBWVEMgMTRCIqZURLARNBAAgiKmVEMgMTREsLiAQOFksLSU8Cp0QXJwhMZ0sJFycKTGdLCCJTJwlMZ0sHVwIAJwtMZ0sGVwIAJwxMZ0sFVwIAJw1MZ0sEVwIAJw5MZycHSwRnKUsDZycFSwJnKksBZyNDNhoBSRUkEkQXSTYaAklOAhUkEkQ2GgNJTgJJFSUSRDYaBElOAxUlEkRMiAOcMgoSQQBZSwIXMQAiKWVEEkQyCksCSU8CE0QiKGVEiANsTwIIIicIZUQORCIrY0QiKGVEEkQiJwZlRBREIillRCIqZUQTQQAISSInBGNEFERLAhdLBExLA0sDiANNI0NJMgoSQQA5MQAiKWVETEsBEkRLAiIrY0QiKGVEEkQiJwZlRBREIiplRBNB/8RLAUkiJwRjRBREIillRBJEQv+xMQAiKmVEEkEAGksBIitjRCIoZURMSwESREsBIitjRBJEQv+NMQBLAklOAhJESSIrY0QiKGVETEsBEkRLAklOAiIrY0QSRCInBmVEFERMIicEY0QURCInBGNEFERC/1I2GgFJFSQSRBc2GgJJFSMSREyIAokxACInBWVEEkQiUycGTGcjQzYaAUkVJBJEFzYaAkkVJRJENhoDSRUjEkRPAogCWksBIitjRCIoZUQSRDEAIicFZUQSRCJTJwRMZiNDNhoBSRUkEkQXSTYaAklOAhUlEkQxFiMISTgQgQQSRDEZgQISRDEAIitjREsCEkQyBEsBDURJOBFLAhJESTgAMQASREk4EhREOBUyAxNEcQtBAFcxFiMISTgQgQQSRDgVSwFJTgISRCIoZURLBBJESwITQQAkSwFJIitjRCIoZUQSRCInBmVEFEQxACInBGNEFEQiJwRjRBREMQBLA0lOAnAARDEASwSIAaEjQzYaAUkVJBJEF0mIAYQxACInB2VEEkSxMgqyALIhgQOyECKyAbMnCCJnJwoiZycJImcnC4AAZycMgABnJw2AAGcnDoAAZycHMgNnKTIDZycFMgNnKjIDZygiZycGImcjQzYaAUkVJBJEF4gBJSInCGVEFiInCmVEFkmTJQ5EVwQEIicJZUQnECJPAlQiJwtlREkVFlcGAkxQIicMZURJFRZXBgJMUCInDWVESRUWVwYCTFAiJw5lREkVFlcGAkxQIicHZUQiKWVEIicFZUQiKmVETwpPClBPCVCAAgCVUEsIFYGVAQhJFlcGAk8CTFBLCBVPAghJFlcGAk8CTFBLBxVPAggWVwYCUE8EUE8DUE8CUExQTwRQTwNQTwJQTFAnD0xQsCNDNhoBSRUkEkQXiABgIicGZUQnECJPAlQnD0xQsCNDNhoBSRUkEkQXNhoCSRUlEkRMiAA5IicEY0QnECJPAlQnD0xQsCNDNhoBSRUkEkQXSYgAGogACBYnD0xQsCNDigEBMgqL/3AARCEETAmJigEAIihlRElEi/8SRImKBACxMgqyAIv/shSL/rITi/2yEov8shGBBLIQIrIBs4k=", "clear": "C4EBQw=="}, "desc": "\n    ARC-0020 (Smart ASA) - Reference Implementation\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgYnl0ZWNibG9jayAic21hcnRfYXNhX2lkIiAicmVzZXJ2ZV9hZGRyIiAiY2xhd2JhY2tfYWRkciIgImFjY291bnRfc21hcnRfYXNhX2lkIiAiYWNjb3VudF9mcm96ZW4iICJmcmVlemVfYWRkciIgImdsb2JhbF9mcm96ZW4iICJtYW5hZ2VyX2FkZHIiICJ0b3RhbCIgImRlZmF1bHRfZnJvemVuIiAiZGVjaW1hbHMiICJ1bml0X25hbWUiICJuYW1lIiAidXJsIiAibWV0YWRhdGFfaGFzaCIgMHgxNTFmN2M3NSAweDAwCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQxLTQyCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV9ieXRlX3NsaWNlID09IGNmZy5HTE9CQUxfQllURVMsIGVyci5XUk9OR19HTE9CQUxfQllURVMKICAgIHR4biBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEdsb2JhbCBCeXRlcyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fdWludCA9PSBjZmcuR0xPQkFMX1VJTlRTLCBlcnIuV1JPTkdfR0xPQkFMX1VJTlRTCiAgICB0eG4gR2xvYmFsTnVtVWludAogICAgcHVzaGludCA1IC8vIDUKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDQKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDUKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX3VpbnQgPT0gY2ZnLkxPQ0FMX1VJTlRTLCBlcnIuV1JPTkdfTE9DQUxfVUlOVFMKICAgIHR4biBMb2NhbE51bVVpbnQKICAgIHB1c2hpbnQgMiAvLyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDctNDkKICAgIC8vICMgR0xPQkFMIFNUQVRFCiAgICAvLyAjIEFTQSBGaWVsZHMKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZWMgOCAvLyAidG90YWwiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTAKICAgIC8vIHNlbGYuZGVjaW1hbHMgPSBVSW50NjQoKQogICAgYnl0ZWMgMTAgLy8gImRlY2ltYWxzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLmRlZmF1bHRfZnJvemVuID0gRmFsc2UKICAgIGJ5dGVjIDkgLy8gImRlZmF1bHRfZnJvemVuIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBzZWxmLnVuaXRfbmFtZSA9IFN0cmluZygpCiAgICBieXRlYyAxMSAvLyAidW5pdF9uYW1lIgogICAgcHVzaGJ5dGVzICIiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MwogICAgLy8gc2VsZi5uYW1lID0gU3RyaW5nKCkKICAgIGJ5dGVjIDEyIC8vICJuYW1lIgogICAgcHVzaGJ5dGVzICIiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NAogICAgLy8gc2VsZi51cmwgPSBTdHJpbmcoKQogICAgYnl0ZWMgMTMgLy8gInVybCIKICAgIHB1c2hieXRlcyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTUKICAgIC8vIHNlbGYubWV0YWRhdGFfaGFzaCA9IEJ5dGVzKCkKICAgIGJ5dGVjIDE0IC8vICJtZXRhZGF0YV9oYXNoIgogICAgcHVzaGJ5dGVzIDB4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NgogICAgLy8gc2VsZi5tYW5hZ2VyX2FkZHIgPSBBY2NvdW50KCkKICAgIGJ5dGVjIDcgLy8gIm1hbmFnZXJfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTcKICAgIC8vIHNlbGYucmVzZXJ2ZV9hZGRyID0gQWNjb3VudCgpCiAgICBieXRlY18xIC8vICJyZXNlcnZlX2FkZHIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBzZWxmLmZyZWV6ZV9hZGRyID0gQWNjb3VudCgpCiAgICBieXRlYyA1IC8vICJmcmVlemVfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTkKICAgIC8vIHNlbGYuY2xhd2JhY2tfYWRkciA9IEFjY291bnQoKQogICAgYnl0ZWNfMiAvLyAiY2xhd2JhY2tfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjAtNjEKICAgIC8vICMgU21hcnQgQVNBIEZpZWxkcwogICAgLy8gc2VsZi5zbWFydF9hc2FfaWQgPSBVSW50NjQoKQogICAgYnl0ZWNfMCAvLyAic21hcnRfYXNhX2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLmdsb2JhbF9mcm96ZW4gPSBGYWxzZQogICAgYnl0ZWMgNiAvLyAiZ2xvYmFsX2Zyb3plbiIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3LTM1CiAgICAvLyBjbGFzcyBTbWFydEFzYSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMjIKICAgIHB1c2hieXRlc3MgMHg0ODY0MTY0NSAweDNhMDQ1YmRjIC8vIG1ldGhvZCAiYXNzZXRfb3B0X2luKHVpbnQ2NCxheGZlcil2b2lkIiwgbWV0aG9kICJhc3NldF9jbG9zZV9vdXQodWludDY0LGFkZHJlc3Mpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fYXNzZXRfb3B0X2luX3JvdXRlQDUgbWFpbl9hc3NldF9jbG9zZV9vdXRfcm91dGVANgoKbWFpbl9zd2l0Y2hfY2FzZV9uZXh0QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3LTM1CiAgICAvLyBjbGFzcyBTbWFydEFzYSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIHB1c2hieXRlc3MgMHhlN2VjZDVhOCAweGY4ODE5ZmViIDB4N2VhY2I3NzUgMHhhMTMzZDU4MSAweGZmNTNhZGVmIDB4ZWQ2NDQ1MmYgMHgyZTliOTAzOCAweDk3OWI5OTcyIDB4NDhhNjNjYzkgMHg0NmFkMGQ1MiAvLyBtZXRob2QgImFzc2V0X2NyZWF0ZSh1aW50NjQsdWludDMyLGJvb2wsc3RyaW5nLHN0cmluZyxzdHJpbmcsYnl0ZVtdLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MpdWludDY0IiwgbWV0aG9kICJhc3NldF9jb25maWcodWludDY0LHVpbnQ2NCx1aW50MzIsYm9vbCxzdHJpbmcsc3RyaW5nLHN0cmluZyxieXRlW10sYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJhc3NldF90cmFuc2Zlcih1aW50NjQsdWludDY0LGFkZHJlc3MsYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJhc3NldF9mcmVlemUodWludDY0LGJvb2wpdm9pZCIsIG1ldGhvZCAiYWNjb3VudF9mcmVlemUodWludDY0LGFkZHJlc3MsYm9vbCl2b2lkIiwgbWV0aG9kICJhc3NldF9kZXN0cm95KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfYXNzZXRfY29uZmlnKHVpbnQ2NCkodWludDY0LHVpbnQzMixib29sLHN0cmluZyxzdHJpbmcsc3RyaW5nLGJ5dGVbXSxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzKSIsIG1ldGhvZCAiZ2V0X2Fzc2V0X2lzX2Zyb3plbih1aW50NjQpYm9vbCIsIG1ldGhvZCAiZ2V0X2FjY291bnRfaXNfZnJvemVuKHVpbnQ2NCxhZGRyZXNzKWJvb2wiLCBtZXRob2QgImdldF9jaXJjdWxhdGluZ19zdXBwbHkodWludDY0KXVpbnQ2NCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGFzc2V0X2NyZWF0ZSBhc3NldF9jb25maWcgYXNzZXRfdHJhbnNmZXIgYXNzZXRfZnJlZXplIGFjY291bnRfZnJlZXplIGFzc2V0X2Rlc3Ryb3kgZ2V0X2Fzc2V0X2NvbmZpZyBnZXRfYXNzZXRfaXNfZnJvemVuIGdldF9hY2NvdW50X2lzX2Zyb3plbiBnZXRfY2lyY3VsYXRpbmdfc3VwcGx5CiAgICBlcnIKCm1haW5fYXNzZXRfY2xvc2Vfb3V0X3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJDbG9zZU91dCJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCAyIC8vIENsb3NlT3V0CiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgQ2xvc2VPdXQgJiYgY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYiBhc3NldF9jbG9zZV9vdXQKCm1haW5fYXNzZXRfb3B0X2luX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJPcHRJbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18xIC8vIE9wdEluCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgT3B0SW4gJiYgY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYiBhc3NldF9vcHRfaW4KCm1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMjI6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgJiYKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBOb09wICYmIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2EuYXNzZXRfY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgOAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA5CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDExCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjY5LTI3MAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCBlcnIuVU5BVVRIT1JJWkVECiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3MQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnNtYXJ0X2FzYV9pZCwgZXJyLkVYSVNUSU5HX0NUUkxfQVNBCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic21hcnRfYXNhX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNtYXJ0X2FzYV9pZCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBDb250cm9sbGVkIEFTQSBhbHJlYWR5IGNyZWF0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTkyLTIwNQogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB0b3RhbD1jZmcuVE9UQUwsCiAgICAvLyAgICAgZGVjaW1hbHM9Y2ZnLkRFQ0lNQUxTLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPWNmZy5ERUZBVUxUX0ZST1pFTiwKICAgIC8vICAgICB1bml0X25hbWU9Y2ZnLlVOSVRfTkFNRSwKICAgIC8vICAgICBhc3NldF9uYW1lPWNmZy5OQU1FLAogICAgLy8gICAgIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkKICAgIC8vIC5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxOTkKICAgIC8vIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBhY2MgPSBCeXRlcygpCiAgICBwdXNoYnl0ZXMgMHgKCmFzc2V0X2NyZWF0ZV93aGlsZV90b3BAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzMKICAgIC8vIHdoaWxlIG4gPiAwOgogICAgZGlnIDEKICAgIGJ6IGFzc2V0X2NyZWF0ZV9hZnRlcl93aGlsZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBhY2MgPSBkaWdpdHNbbiAlIDEwXSArIGFjYwogICAgZGlnIDEKICAgIGR1cAogICAgcHVzaGludCAxMCAvLyAxMAogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MQogICAgLy8gZGlnaXRzID0gQnl0ZXMoYiIwMTIzNDU2Nzg5IikKICAgIHB1c2hieXRlcyAweDMwMzEzMjMzMzQzNTM2MzczODM5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBhY2MgPSBkaWdpdHNbbiAlIDEwXSArIGFjYwogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgIGV4dHJhY3QzCiAgICBkaWcgMgogICAgY29uY2F0CiAgICBidXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzUKICAgIC8vIG4gLy89IDEwCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICAvCiAgICBidXJ5IDIKICAgIGIgYXNzZXRfY3JlYXRlX3doaWxlX3RvcEAyCgphc3NldF9jcmVhdGVfYWZ0ZXJfd2hpbGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzYKICAgIC8vIHJldHVybiBhY2Mgb3IgQnl0ZXMoYiIwIikKICAgIGR1cG4gMgogICAgbGVuCiAgICBwdXNoYnl0ZXMgMHgzMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5OQogICAgLy8gdXJsPWNmZy5BUFBfQklORElORyArIHNlbGYuaXRvYShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICBwdXNoYnl0ZXMgMHg2MTZjNjc2ZjcyNjE2ZTY0M2EyZjJmNjE3MDcwMmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMDAKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIwMS0yMDMKICAgIC8vIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cG4gMwogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVUkwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTk4CiAgICAvLyBhc3NldF9uYW1lPWNmZy5OQU1FLAogICAgcHVzaGJ5dGVzICJBUkMtMjAgU21hcnQgQVNBIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTk3CiAgICAvLyB1bml0X25hbWU9Y2ZnLlVOSVRfTkFNRSwKICAgIHB1c2hieXRlcyAiQVJDLTIwIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gZGVmYXVsdF9mcm96ZW49Y2ZnLkRFRkFVTFRfRlJPWkVOLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gZGVjaW1hbHM9Y2ZnLkRFQ0lNQUxTLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxOTQKICAgIC8vIHRvdGFsPWNmZy5UT1RBTCwKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIHB1c2hpbnQgMyAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5MwogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTkyLTIwNQogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB0b3RhbD1jZmcuVE9UQUwsCiAgICAvLyAgICAgZGVjaW1hbHM9Y2ZnLkRFQ0lNQUxTLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPWNmZy5ERUZBVUxUX0ZST1pFTiwKICAgIC8vICAgICB1bml0X25hbWU9Y2ZnLlVOSVRfTkFNRSwKICAgIC8vICAgICBhc3NldF9uYW1lPWNmZy5OQU1FLAogICAgLy8gICAgIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkKICAgIC8vIC5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjczLTI3NAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBzZWxmLnNtYXJ0X2FzYV9pZCA9IHNlbGYuaW5uZXJfYXNzZXRfY29uZmlnKCkKICAgIGJ5dGVjXzAgLy8gInNtYXJ0X2FzYV9pZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTkyLTIwNgogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB0b3RhbD1jZmcuVE9UQUwsCiAgICAvLyAgICAgZGVjaW1hbHM9Y2ZnLkRFQ0lNQUxTLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPWNmZy5ERUZBVUxUX0ZST1pFTiwKICAgIC8vICAgICB1bml0X25hbWU9Y2ZnLlVOSVRfTkFNRSwKICAgIC8vICAgICBhc3NldF9uYW1lPWNmZy5OQU1FLAogICAgLy8gICAgIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkKICAgIC8vIC5zdWJtaXQoKQogICAgLy8gLmNyZWF0ZWRfYXNzZXQuaWQKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjczLTI3NAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBzZWxmLnNtYXJ0X2FzYV9pZCA9IHNlbGYuaW5uZXJfYXNzZXRfY29uZmlnKCkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gc2VsZi50b3RhbCA9IHRvdGFsLm5hdGl2ZQogICAgZGlnIDEyCiAgICBidG9pCiAgICBieXRlYyA4IC8vICJ0b3RhbCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3NgogICAgLy8gc2VsZi5kZWNpbWFscyA9IGRlY2ltYWxzLm5hdGl2ZQogICAgZGlnIDExCiAgICBidG9pCiAgICBieXRlYyAxMCAvLyAiZGVjaW1hbHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNzcKICAgIC8vIHNlbGYuZGVmYXVsdF9mcm96ZW4gPSBkZWZhdWx0X2Zyb3plbi5uYXRpdmUKICAgIGRpZyAxMAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgYnl0ZWMgOSAvLyAiZGVmYXVsdF9mcm96ZW4iCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNzgKICAgIC8vIHNlbGYudW5pdF9uYW1lID0gdW5pdF9uYW1lLm5hdGl2ZQogICAgZGlnIDkKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlYyAxMSAvLyAidW5pdF9uYW1lIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjc5CiAgICAvLyBzZWxmLm5hbWUgPSBuYW1lLm5hdGl2ZQogICAgZGlnIDgKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlYyAxMiAvLyAibmFtZSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4MAogICAgLy8gc2VsZi51cmwgPSB1cmwubmF0aXZlCiAgICBkaWcgNwogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGVjIDEzIC8vICJ1cmwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyODEKICAgIC8vIHNlbGYubWV0YWRhdGFfaGFzaCA9IG1ldGFkYXRhX2hhc2gubmF0aXZlCiAgICBkaWcgNgogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGVjIDE0IC8vICJtZXRhZGF0YV9oYXNoIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjgyCiAgICAvLyBzZWxmLm1hbmFnZXJfYWRkciA9IG1hbmFnZXJfYWRkci5uYXRpdmUKICAgIGJ5dGVjIDcgLy8gIm1hbmFnZXJfYWRkciIKICAgIGRpZyA2CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyODMKICAgIC8vIHNlbGYucmVzZXJ2ZV9hZGRyID0gcmVzZXJ2ZV9hZGRyLm5hdGl2ZQogICAgYnl0ZWNfMSAvLyAicmVzZXJ2ZV9hZGRyIgogICAgZGlnIDUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4NAogICAgLy8gc2VsZi5mcmVlemVfYWRkciA9IGZyZWV6ZV9hZGRyLm5hdGl2ZQogICAgYnl0ZWMgNSAvLyAiZnJlZXplX2FkZHIiCiAgICBkaWcgNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjg1CiAgICAvLyBzZWxmLmNsYXdiYWNrX2FkZHIgPSBjbGF3YmFja19hZGRyLm5hdGl2ZQogICAgYnl0ZWNfMiAvLyAiY2xhd2JhY2tfYWRkciIKICAgIGRpZyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyODYKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLnNtYXJ0X2FzYV9pZCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzbWFydF9hc2FfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc21hcnRfYXNhX2lkIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWMgMTUgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhLmFzc2V0X29wdF9pbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X29wdF9pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjg4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjk5LTMwMAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhhc3NldC5pZCkKICAgIGRpZyAxCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMDQKICAgIC8vIGFzc2VydCBjdHJsX2FzYV9vcHRfaW4ueGZlcl9hc3NldC5pZCA9PSBzZWxmLnNtYXJ0X2FzYV9pZCwgZXJyLk9QVF9JTl9XUk9OR19BU0EKICAgIGR1cAogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic21hcnRfYXNhX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNtYXJ0X2FzYV9pZCBleGlzdHMKICAgIHN3YXAKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBPcHQgSW4gSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzA1CiAgICAvLyBhc3NlcnQgY3RybF9hc2Ffb3B0X2luLnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuT1BUX0lOX1dST05HX1NFTkRFUgogICAgZGlnIDEKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgT3B0IEluIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMDYKICAgIC8vIGFzc2VydCBjdHJsX2FzYV9vcHRfaW4uYXNzZXRfcmVjZWl2ZXIgPT0gVHhuLnNlbmRlciwgZXJyLk9QVF9JTl9XUk9OR19SRUNFSVZFUgogICAgZGlnIDEKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIE9wdCBJbiBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMDgKICAgIC8vIGN0cmxfYXNhX29wdF9pbi5hc3NldF9hbW91bnQgPT0gMAogICAgZGlnIDEKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwNy0zMDkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY3RybF9hc2Ffb3B0X2luLmFzc2V0X2Ftb3VudCA9PSAwCiAgICAvLyApLCBlcnIuT1BUX0lOX1dST05HX0FNT1VOVCAgIyBQZWRhbnQ6IENvbnRyb2xsZWQgQVNBIGlzIGRlZmF1bHQgZnJvemVuCiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIE9wdCBJbiBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzExCiAgICAvLyBjdHJsX2FzYV9vcHRfaW4uYXNzZXRfY2xvc2VfdG8gPT0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgc3dhcAogICAgZ3R4bnMgQXNzZXRDbG9zZVRvCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMxMC0zMTIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY3RybF9hc2Ffb3B0X2luLmFzc2V0X2Nsb3NlX3RvID09IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIC8vICksIGVyci5PUFRfSU5fV1JPTkdfQ0xPU0VfVE8KICAgIGFzc2VydCAvLyBGb3JiaWRkZW4gQ2xvc2UgT3V0IG9uIE9wdCBJbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMTMKICAgIC8vIGFzc2VydCBUeG4ub25fY29tcGxldGlvbiA9PSBPbkNvbXBsZXRlQWN0aW9uLk9wdEluLCBlcnIuV1JPTkdfT05fQ09NUExFVEUKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMSAvLyBPcHRJbgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBPbiBDb21wbGV0ZSBBY3Rpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzE0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlci5pc19vcHRlZF9pbigKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzE0LTMxNgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuaXNfb3B0ZWRfaW4oCiAgICAvLyAgICAgYXNzZXQKICAgIC8vICksIGVyci5NSVNTSU5HX0NUUkxfQVNBICAjIFBlZGFudDogY3RybF9hc2Ffb3B0X2luIGlzIGNoZWNrZWQgcHJvcGVybHkKICAgIHVuY292ZXIgMgogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbnRyb2xsZWQgQVNBCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMxOC0zMTkKICAgIC8vICMgTG9jYWwgU3RhdGUgSW5pdAogICAgLy8gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFtUeG4uc2VuZGVyXSA9IHNlbGYuc21hcnRfYXNhX2lkCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18zIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIHVuY292ZXIgMgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMjAKICAgIC8vIHNlbGYuYWNjb3VudF9mcm96ZW5bVHhuLnNlbmRlcl0gPSBGYWxzZQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgNCAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMjQKICAgIC8vIHNlbGYuZGVmYXVsdF9mcm96ZW4gb3IgYXNzZXQuYmFsYW5jZShUeG4uc2VuZGVyKSA+IDAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJkZWZhdWx0X2Zyb3plbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWZhdWx0X2Zyb3plbiBleGlzdHMKICAgIGJueiBhc3NldF9vcHRfaW5faWZfYm9keUAzCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICBieiBhc3NldF9vcHRfaW5fYWZ0ZXJfaWZfZWxzZUA0Cgphc3NldF9vcHRfaW5faWZfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMjYKICAgIC8vIHNlbGYuYWNjb3VudF9mcm96ZW5bVHhuLnNlbmRlcl0gPSBUcnVlCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyA0IC8vICJhY2NvdW50X2Zyb3plbiIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfbG9jYWxfcHV0Cgphc3NldF9vcHRfaW5fYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyODgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhLmFzc2V0X2NvbmZpZ1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X2NvbmZpZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzI4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTEKICAgIGR1cAogICAgY292ZXIgMwogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTIKICAgIGR1cAogICAgY292ZXIgMwogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNjEtMzYyCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGNvbmZpZ19hc3NldC5pZCkKICAgIHN3YXAKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM2MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHIsIGVyci5VTkFVVEhPUklaRURfTUFOQUdFUgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gIm1hbmFnZXJfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYW5hZ2VyX2FkZHIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM2NAogICAgLy8gaWYgcmVzZXJ2ZV9hZGRyICE9IHNlbGYucmVzZXJ2ZV9hZGRyOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInJlc2VydmVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXNlcnZlX2FkZHIgZXhpc3RzCiAgICAhPQogICAgYnogYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNjUKICAgIC8vIGFzc2VydCBzZWxmLnJlc2VydmVfYWRkciAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCBlcnIuRElTQUJMRURfUkVTRVJWRQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInJlc2VydmVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXNlcnZlX2FkZHIgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gUmVzZXJ2ZSBBZGRyZXNzIGhhcyBiZWVuIGRlbGV0ZWQKCmFzc2V0X2NvbmZpZ19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM2NgogICAgLy8gaWYgZnJlZXplX2FkZHIgIT0gc2VsZi5mcmVlemVfYWRkcjoKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJmcmVlemVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mcmVlemVfYWRkciBleGlzdHMKICAgIGRpZyAyCiAgICAhPQogICAgYnogYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNjcKICAgIC8vIGFzc2VydCBzZWxmLmZyZWV6ZV9hZGRyICE9IEdsb2JhbC56ZXJvX2FkZHJlc3MsIGVyci5ESVNBQkxFRF9GUkVFWkUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJmcmVlemVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mcmVlemVfYWRkciBleGlzdHMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGFzc2VydCAvLyBGcmVlemUgQWRkcmVzcyBoYXMgYmVlbiBkZWxldGVkCgphc3NldF9jb25maWdfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNjgKICAgIC8vIGlmIGNsYXdiYWNrX2FkZHIgIT0gc2VsZi5jbGF3YmFja19hZGRyOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhd2JhY2tfYWRkciBleGlzdHMKICAgIGRpZyAxCiAgICAhPQogICAgYnogYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNjkKICAgIC8vIGFzc2VydCBzZWxmLmNsYXdiYWNrX2FkZHIgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgZXJyLkRJU0FCTEVEX0NMQVdCQUNLCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY2xhd2JhY2tfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jbGF3YmFja19hZGRyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIENsYXdiYWNrIEFkZHJlc3MgaGFzIGJlZW4gZGVsZXRlZAoKYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzcwCiAgICAvLyBhc3NlcnQgdG90YWwgPj0gc2VsZi5jaXJjdWxhdGluZ19zdXBwbHkoY29uZmlnX2Fzc2V0KSwgZXJyLklOVkFMSURfVE9UQUwKICAgIGRpZyAxMQogICAgY2FsbHN1YiBjaXJjdWxhdGluZ19zdXBwbHkKICAgIGl0b2IKICAgIGRpZyAxMQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGI+PQogICAgYXNzZXJ0IC8vIEludmFsaWQgVG90YWwsIG11c3QgYmUgPj0gY2lyY3VsYXRpbmcgc3VwcGx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM3Mi0zNzMKICAgIC8vICMgRWZmZWN0cwogICAgLy8gc2VsZi50b3RhbCA9IHRvdGFsLm5hdGl2ZQogICAgYnRvaQogICAgYnl0ZWMgOCAvLyAidG90YWwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNzQKICAgIC8vIHNlbGYuZGVjaW1hbHMgPSBkZWNpbWFscy5uYXRpdmUKICAgIGRpZyA5CiAgICBidG9pCiAgICBieXRlYyAxMCAvLyAiZGVjaW1hbHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNzUKICAgIC8vIHNlbGYuZGVmYXVsdF9mcm96ZW4gPSBkZWZhdWx0X2Zyb3plbi5uYXRpdmUKICAgIGRpZyA4CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBieXRlYyA5IC8vICJkZWZhdWx0X2Zyb3plbiIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM3NgogICAgLy8gc2VsZi51bml0X25hbWUgPSB1bml0X25hbWUubmF0aXZlCiAgICBkaWcgNwogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGVjIDExIC8vICJ1bml0X25hbWUiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNzcKICAgIC8vIHNlbGYubmFtZSA9IG5hbWUubmF0aXZlCiAgICBkaWcgNgogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGVjIDEyIC8vICJuYW1lIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzc4CiAgICAvLyBzZWxmLnVybCA9IHVybC5uYXRpdmUKICAgIGRpZyA1CiAgICBleHRyYWN0IDIgMAogICAgYnl0ZWMgMTMgLy8gInVybCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM3OQogICAgLy8gc2VsZi5tZXRhZGF0YV9oYXNoID0gbWV0YWRhdGFfaGFzaC5uYXRpdmUKICAgIGRpZyA0CiAgICBleHRyYWN0IDIgMAogICAgYnl0ZWMgMTQgLy8gIm1ldGFkYXRhX2hhc2giCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozODAKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyID0gbWFuYWdlcl9hZGRyLm5hdGl2ZQogICAgYnl0ZWMgNyAvLyAibWFuYWdlcl9hZGRyIgogICAgZGlnIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM4MQogICAgLy8gc2VsZi5yZXNlcnZlX2FkZHIgPSByZXNlcnZlX2FkZHIubmF0aXZlCiAgICBieXRlY18xIC8vICJyZXNlcnZlX2FkZHIiCiAgICBkaWcgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzgyCiAgICAvLyBzZWxmLmZyZWV6ZV9hZGRyID0gZnJlZXplX2FkZHIubmF0aXZlCiAgICBieXRlYyA1IC8vICJmcmVlemVfYWRkciIKICAgIGRpZyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozODMKICAgIC8vIHNlbGYuY2xhd2JhY2tfYWRkciA9IGNsYXdiYWNrX2FkZHIubmF0aXZlCiAgICBieXRlY18yIC8vICJjbGF3YmFja19hZGRyIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMyOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYS5hc3NldF90cmFuc2Zlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X3RyYW5zZmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQwMi00MDMKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gc2VsZi5hc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoeGZlcl9hc3NldC5pZCkKICAgIHN3YXAKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQwNAogICAgLy8gaWYgYXNzZXRfc2VuZGVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGJ6IGFzc2V0X3RyYW5zZmVyX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQwNgogICAgLy8gYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlCiAgICBkaWcgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5MS05MgogICAgLy8gIyBNaW50IHBlcm1pc3Npb24gcmVzdHJpY3RlZCB0byBSZXNlcnZlLgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5yZXNlcnZlX2FkZHIsIGVyci5VTkFVVEhPUklaRURfUkVTRVJWRQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInJlc2VydmVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXNlcnZlX2FkZHIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBSZXNlcnZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkzLTk0CiAgICAvLyAjIEZvcmJpZGRlbiBzZWxmLW1pbnQgKHRvIENyZWF0b3IpIGFuZCBvdmVyLW1pbnQgKD4gdG90YWwpLgogICAgLy8gYXNzZXJ0IGFzc2V0X3JlY2VpdmVyICE9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsIGVyci5TRUxGX01JTlQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBkaWcgMgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgICE9CiAgICBhc3NlcnQgLy8gRm9yYmlkZGVuIHNlbGYgbWludGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NgogICAgLy8gYXNzZXRfYW1vdW50ICsgc2VsZi5jaXJjdWxhdGluZ19zdXBwbHkoQXNzZXQoc2VsZi5zbWFydF9hc2FfaWQpKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zbWFydF9hc2FfaWQgZXhpc3RzCiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgdW5jb3ZlciAyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyA8PSBzZWxmLnRvdGFsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAidG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk2LTk3CiAgICAvLyBhc3NldF9hbW91bnQgKyBzZWxmLmNpcmN1bGF0aW5nX3N1cHBseShBc3NldChzZWxmLnNtYXJ0X2FzYV9pZCkpCiAgICAvLyA8PSBzZWxmLnRvdGFsCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NS05OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBhc3NldF9hbW91bnQgKyBzZWxmLmNpcmN1bGF0aW5nX3N1cHBseShBc3NldChzZWxmLnNtYXJ0X2FzYV9pZCkpCiAgICAvLyAgICAgPD0gc2VsZi50b3RhbAogICAgLy8gKSwgZXJyLk9WRVJfTUlOVAogICAgYXNzZXJ0IC8vIEZvcmJpZGRlbiBvdmVyIG1pbnRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTAxCiAgICAvLyBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2Fzc2V0X3JlY2VpdmVyXSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic21hcnRfYXNhX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNtYXJ0X2FzYV9pZCBleGlzdHMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk5LTEwMgogICAgLy8gIyBJbiB0aGUgY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQsIHRoZSBTbWFydCBBREEgSUQgaW4gTG9jYWwgU3RhdGUgY291bGQgYmUgb3V0ZGF0ZWQuCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYXNzZXRfcmVjZWl2ZXJdID09IHNlbGYuc21hcnRfYXNhX2lkCiAgICAvLyApLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTAzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuZ2xvYmFsX2Zyb3plbiwgZXJyLkdMT0JBTF9GUk9aRU4KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJnbG9iYWxfZnJvemVuIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdsb2JhbF9mcm96ZW4gZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gU21hcnQgQVNBIGlzIGdsb2JhbCBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA0CiAgICAvLyBpZiBzZWxmLnJlc2VydmVfYWRkciAhPSBzZWxmLmNsYXdiYWNrX2FkZHI6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicmVzZXJ2ZV9hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlc2VydmVfYWRkciBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjbGF3YmFja19hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNsYXdiYWNrX2FkZHIgZXhpc3RzCiAgICAhPQogICAgYnogYXNzZXRfdHJhbnNmZXJfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDUKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5hY2NvdW50X2Zyb3plblthc3NldF9yZWNlaXZlcl0sIGVyci5SRUNFSVZFUl9GUk9aRU4KICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImFjY291bnRfZnJvemVuIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9mcm96ZW4gZXhpc3RzIGZvciBhY2NvdW50CiAgICAhCiAgICBhc3NlcnQgLy8gUmVjZWl2ZXIgYWNjb3VudCBpcyBmcm96ZW4KCmFzc2V0X3RyYW5zZmVyX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQyMgogICAgLy8gYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICBkaWcgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0MTktNDI1CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHNlbGYuaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyApCiAgICBkaWcgNAogICAgc3dhcAogICAgZGlnIDMKICAgIGRpZyAzCiAgICBjYWxsc3ViIGlubmVyX2Fzc2V0X3RyYW5zZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM4NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgphc3NldF90cmFuc2Zlcl9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDA4CiAgICAvLyBlbGlmIGFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBkdXAKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYnogYXNzZXRfdHJhbnNmZXJfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA5LTExMAogICAgLy8gIyBCdXJuIHBlcm1pc3Npb24gcmVzdHJpY3RlZCB0byBSZXNlcnZlLgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5yZXNlcnZlX2FkZHIsIGVyci5VTkFVVEhPUklaRURfUkVTRVJWRQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInJlc2VydmVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXNlcnZlX2FkZHIgZXhpc3RzCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgUmVzZXJ2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMTMKICAgIC8vIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYXNzZXRfc2VuZGVyXSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgZGlnIDIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zbWFydF9hc2FfaWQgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMTEtMTE0CiAgICAvLyAjIEluIGNhc2Ugb2YgQ29udHJvbGxlZCBBU0EgZGVzdHJveWVkIGFuZCByZS1jcmVhdGVkIHRoZSBTbWFydCBBREEgSUQgaW4gTG9jYWwgU3RhdGUgY291bGQgYmUgb3V0ZGF0ZWQuCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYXNzZXRfc2VuZGVyXSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgLy8gKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjExNQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmdsb2JhbF9mcm96ZW4sIGVyci5HTE9CQUxfRlJPWkVOCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAiZ2xvYmFsX2Zyb3plbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfZnJvemVuIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFNtYXJ0IEFTQSBpcyBnbG9iYWwgZnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjExNgogICAgLy8gaWYgc2VsZi5yZXNlcnZlX2FkZHIgIT0gc2VsZi5jbGF3YmFja19hZGRyOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhd2JhY2tfYWRkciBleGlzdHMKICAgICE9CiAgICBieiBhc3NldF90cmFuc2Zlcl9hZnRlcl9pZl9lbHNlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjExNwogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmFjY291bnRfZnJvemVuW2Fzc2V0X3NlbmRlcl0sIGVyci5TRU5ERVJfRlJPWkVOCiAgICBkaWcgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X2Zyb3plbiBleGlzdHMgZm9yIGFjY291bnQKICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTE4LTExOQogICAgLy8gIyBGb3JiaWRkZW4gY2xhd2JhY2sgdGhyb3VnaCBidXJuaW5nIChidXJuZWQgYW1vdW50IG5vdCBmcm9tIFJlc2VydmUpLgogICAgLy8gYXNzZXJ0IGFzc2V0X3NlbmRlciA9PSBzZWxmLnJlc2VydmVfYWRkciwgZXJyLkNMQVdCQUNLX0JVUk4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJyZXNlcnZlX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVzZXJ2ZV9hZGRyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBGb3JiaWRkZW4gY2xhd2JhY2sgYnVybmluZwogICAgYiBhc3NldF90cmFuc2Zlcl9hZnRlcl9pZl9lbHNlQDEwCgphc3NldF90cmFuc2Zlcl9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDEwCiAgICAvLyBlbGlmIFR4bi5zZW5kZXIgPT0gc2VsZi5jbGF3YmFja19hZGRyOgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhd2JhY2tfYWRkciBleGlzdHMKICAgID09CiAgICBieiBhc3NldF90cmFuc2Zlcl9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMjcKICAgIC8vIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYXNzZXRfc2VuZGVyXSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zbWFydF9hc2FfaWQgZXhpc3RzCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTI1LTEyOAogICAgLy8gIyBJbiB0aGUgY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQsIHRoZSBTbWFydCBBREEgSUQgaW4gTG9jYWwgU3RhdGUgY291bGQgYmUgb3V0ZGF0ZWQuCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYXNzZXRfc2VuZGVyXSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgLy8gKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthc3NldF9yZWNlaXZlcl0gPT0gc2VsZi5zbWFydF9hc2FfaWQKICAgIGRpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYWNjb3VudF9zbWFydF9hc2FfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEyOS0xMzEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthc3NldF9yZWNlaXZlcl0gPT0gc2VsZi5zbWFydF9hc2FfaWQKICAgIC8vICksIGVyci5JTlZBTElEX0NUUkxfQVNBCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDb250cm9sbGVkIEFTQSBJRAogICAgYiBhc3NldF90cmFuc2Zlcl9hZnRlcl9pZl9lbHNlQDEwCgphc3NldF90cmFuc2Zlcl9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTM3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBhc3NldF9zZW5kZXIsIGVyci5VTkFVVEhPUklaRURfQ0xBV0JBQ0sKICAgIHR4biBTZW5kZXIKICAgIGRpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIENsYXdiYWNrCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthc3NldF9zZW5kZXJdID09IHNlbGYuc21hcnRfYXNhX2lkCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zbWFydF9hc2FfaWQgZXhpc3RzCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTM4LTE0MQogICAgLy8gIyBJbiB0aGUgY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQsIHRoZSBTbWFydCBBREEgSUQgaW4gTG9jYWwgU3RhdGUgY291bGQgYmUgb3V0ZGF0ZWQuCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYXNzZXRfc2VuZGVyXSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgLy8gKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE0MwogICAgLy8gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthc3NldF9yZWNlaXZlcl0gPT0gc2VsZi5zbWFydF9hc2FfaWQKICAgIGRpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTQyLTE0NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2Fzc2V0X3JlY2VpdmVyXSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgLy8gKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmdsb2JhbF9mcm96ZW4sIGVyci5HTE9CQUxfRlJPWkVOCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAiZ2xvYmFsX2Zyb3plbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfZnJvemVuIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFNtYXJ0IEFTQSBpcyBnbG9iYWwgZnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmFjY291bnRfZnJvemVuW2Fzc2V0X3NlbmRlcl0sIGVyci5TRU5ERVJfRlJPWkVOCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X2Zyb3plbiBleGlzdHMgZm9yIGFjY291bnQKICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTQ3CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuYWNjb3VudF9mcm96ZW5bYXNzZXRfcmVjZWl2ZXJdLCBlcnIuUkVDRUlWRVJfRlJPWkVOCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X2Zyb3plbiBleGlzdHMgZm9yIGFjY291bnQKICAgICEKICAgIGFzc2VydCAvLyBSZWNlaXZlciBhY2NvdW50IGlzIGZyb3plbgogICAgYiBhc3NldF90cmFuc2Zlcl9hZnRlcl9pZl9lbHNlQDEwCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYS5hc3NldF9mcmVlemVbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9mcmVlemU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0MzYtNDM3CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGZyZWV6ZV9hc3NldC5pZCkKICAgIHN3YXAKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQzOAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5mcmVlemVfYWRkciwgZXJyLlVOQVVUSE9SSVpFRF9GUkVFWkUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJmcmVlemVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mcmVlemVfYWRkciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIEZyZWV6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NDAtNDQxCiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHNlbGYuZ2xvYmFsX2Zyb3plbiA9IGFzc2V0X2Zyb3plbi5uYXRpdmUKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGJ5dGVjIDYgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0MjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2EuYWNjb3VudF9mcmVlemVbcm91dGluZ10oKSAtPiB2b2lkOgphY2NvdW50X2ZyZWV6ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDU1LTQ1NgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ1OAogICAgLy8gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFtmcmVlemVfYWNjb3VudF0gPT0gc2VsZi5zbWFydF9hc2FfaWQKICAgIGRpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYWNjb3VudF9zbWFydF9hc2FfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzbWFydF9hc2FfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc21hcnRfYXNhX2lkIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDU3LTQ1OQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2ZyZWV6ZV9hY2NvdW50XSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgLy8gKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5mcmVlemVfYWRkciwgZXJyLlVOQVVUSE9SSVpFRF9GUkVFWkUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJmcmVlemVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mcmVlemVfYWRkciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIEZyZWV6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjItNDYzCiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHNlbGYuYWNjb3VudF9mcm96ZW5bZnJlZXplX2FjY291bnRdID0gYXNzZXRfZnJvemVuLm5hdGl2ZQogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgYnl0ZWMgNCAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBzd2FwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYS5hc3NldF9jbG9zZV9vdXRbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9jbG9zZV9vdXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJDbG9zZU91dCJdKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTUxCiAgICAvLyBhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeCA9IFR4bi5ncm91cF9pbmRleCArIDEKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNTIKICAgIC8vIGFzYV9jbG9zZV9vdXRfdHhuID0gZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24oYXNhX2Nsb3NlX291dF9yZWxhdGl2ZV9pZHgpCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNTMKICAgIC8vIGFzc2VydCBUeG4ub25fY29tcGxldGlvbiA9PSBPbkNvbXBsZXRlQWN0aW9uLkNsb3NlT3V0LCBlcnIuV1JPTkdfT05fQ09NUExFVEUKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgMiAvLyBDbG9zZU91dAogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBPbiBDb21wbGV0ZSBBY3Rpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTU1CiAgICAvLyBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW1R4bi5zZW5kZXJdID09IGNsb3NlX2Fzc2V0LmlkCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYWNjb3VudF9zbWFydF9hc2FfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGRpZyAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNTQtMTU2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbVHhuLnNlbmRlcl0gPT0gY2xvc2VfYXNzZXQuaWQKICAgIC8vICksIGVyci5JTlZBTElEX0NUUkxfQVNBCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDb250cm9sbGVkIEFTQSBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNTgKICAgIC8vIEdsb2JhbC5ncm91cF9zaXplID4gYXNhX2Nsb3NlX291dF9yZWxhdGl2ZV9pZHgKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIGRpZyAxCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE1Ny0xNTkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmdyb3VwX3NpemUgPiBhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeAogICAgLy8gKSwgZXJyLklOVkFMSURfQ0xPU0VfT1VUX0dST1VQX1NJWkUKICAgIGFzc2VydCAvLyBJbnZhbGlkIENsb3NlIE91dCBncm91cCBzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gYXNhX2Nsb3NlX291dF90eG4ueGZlcl9hc3NldC5pZCA9PSBjbG9zZV9hc3NldC5pZAogICAgZHVwCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGRpZyAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjMtMTY1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGFzYV9jbG9zZV9vdXRfdHhuLnhmZXJfYXNzZXQuaWQgPT0gY2xvc2VfYXNzZXQuaWQKICAgIC8vICksIGVyci5DTE9TRV9PVVRfV1JPTkdfQVNBCiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIENsb3NlIE91dCBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjYKICAgIC8vIGFzc2VydCBhc2FfY2xvc2Vfb3V0X3R4bi5zZW5kZXIgPT0gVHhuLnNlbmRlciwgZXJyLkNMT1NFX09VVF9XUk9OR19TRU5ERVIKICAgIGR1cAogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBDbG9zZSBPdXQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gYXNzZXJ0IGFzYV9jbG9zZV9vdXRfdHhuLmFzc2V0X2Ftb3VudCA9PSBVSW50NjQoMCksIGVyci5DTE9TRV9PVVRfV1JPTkdfQU1PVU5UCiAgICBkdXAKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIENsb3NlIE91dCBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTY5CiAgICAvLyBhc2FfY2xvc2Vfb3V0X3R4bi5hc3NldF9jbG9zZV90byAhPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBndHhucyBBc3NldENsb3NlVG8KICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTY4LTE3MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBhc2FfY2xvc2Vfb3V0X3R4bi5hc3NldF9jbG9zZV90byAhPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICAvLyApLCBlcnIuQ0xPU0VfT1VUX1dST05HX0NMT1NFX1RPCiAgICBhc3NlcnQgLy8gV3JvbmcgQ2xvc2UgT3V0IG9uIENsb3NlIE91dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NzYKICAgIC8vIChjcmVhdG9yLCBleGlzdHMpID0gb3AuQXNzZXRQYXJhbXNHZXQuYXNzZXRfY3JlYXRvcihjbG9zZV9hc3NldC5pZCkKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ3NwogICAgLy8gaWYgZXhpc3RzOiAgIyBTbWFydCBBU0EgaGFzIG5vdCBiZWVuIGRlc3Ryb3llZAogICAgYnogYXNzZXRfY2xvc2Vfb3V0X2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNzYKICAgIC8vIGFzYV9jbG9zZV9vdXRfcmVsYXRpdmVfaWR4ID0gVHhuLmdyb3VwX2luZGV4ICsgMQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gYXNhX2Nsb3NlX291dF90eG4gPSBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbihhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeCkKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE3OQogICAgLy8gYXNhX2Nsb3NlX291dF90eG4uYXNzZXRfY2xvc2VfdG8gPT0gYXNzZXRfY3JlYXRvcgogICAgZ3R4bnMgQXNzZXRDbG9zZVRvCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNzgtMTgwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGFzYV9jbG9zZV9vdXRfdHhuLmFzc2V0X2Nsb3NlX3RvID09IGFzc2V0X2NyZWF0b3IKICAgIC8vICksIGVyci5DTE9TRV9PVVRfV1JPTkdfQ0xPU0VfVE8KICAgIGFzc2VydCAvLyBXcm9uZyBDbG9zZSBPdXQgb24gQ2xvc2UgT3V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gYXNzZXJ0IGNsb3NlX2Fzc2V0LmlkID09IHNlbGYuc21hcnRfYXNhX2lkLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zbWFydF9hc2FfaWQgZXhpc3RzCiAgICBkaWcgNAogICAgPT0KICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gY2xvc2VfdG8gIT0gY3JlYXRvcgogICAgZGlnIDIKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ3OS00ODEKICAgIC8vIGlmICgKICAgIC8vICAgICBjbG9zZV90byAhPSBjcmVhdG9yCiAgICAvLyApOiAgIyBJZiBjbG9zZS1vdXQgdGFyZ2V0IGlzIG5vdCB0aGUgQ3JlYXRvciwgdGhlbiBjbG9zZS1vdXQgdGFyZ2V0IE1VU1QgYmUgb3B0ZWQtaW4KICAgIGJ6IGFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDgzCiAgICAvLyBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2Nsb3NlX3RvXSA9PSBzZWxmLnNtYXJ0X2FzYV9pZAogICAgZGlnIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic21hcnRfYXNhX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNtYXJ0X2FzYV9pZCBleGlzdHMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ4Mi00ODQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFtjbG9zZV90b10gPT0gc2VsZi5zbWFydF9hc2FfaWQKICAgIC8vICksIGVyci5JTlZBTElEX0NUUkxfQVNBCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDb250cm9sbGVkIEFTQSBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxODUKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5nbG9iYWxfZnJvemVuLCBlcnIuR0xPQkFMX0ZST1pFTgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX2Zyb3plbiBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBTbWFydCBBU0EgaXMgZ2xvYmFsIGZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxODYKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5hY2NvdW50X2Zyb3plbltUeG4uc2VuZGVyXSwgZXJyLlNFTkRFUl9GUk9aRU4KICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJhY2NvdW50X2Zyb3plbiIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfZnJvemVuIGV4aXN0cyBmb3IgYWNjb3VudAogICAgIQogICAgYXNzZXJ0IC8vIFNlbmRlciBhY2NvdW50IGlzIGZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxODcKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5hY2NvdW50X2Zyb3plbltjbG9zZV90b10sIGVyci5DTE9TRV9UT19GUk9aRU4KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJhY2NvdW50X2Zyb3plbiIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfZnJvemVuIGV4aXN0cyBmb3IgYWNjb3VudAogICAgIQogICAgYXNzZXJ0IC8vIENsb3NlIHRvIGFjY291bnQgaXMgZnJvemVuCgphc3NldF9jbG9zZV9vdXRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0OTAKICAgIC8vIGFzc2V0X2Ftb3VudD1jbG9zZV9hc3NldC5iYWxhbmNlKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgZGlnIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ5MQogICAgLy8gYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ4Ny00OTMKICAgIC8vICMgRWZmZWN0cwogICAgLy8gc2VsZi5pbm5lcl9hc3NldF90cmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWNsb3NlX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1jbG9zZV9hc3NldC5iYWxhbmNlKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWNsb3NlX3RvLAogICAgLy8gKQogICAgZGlnIDQKICAgIGNhbGxzdWIgaW5uZXJfYXNzZXRfdHJhbnNmZXIKCmFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJDbG9zZU91dCJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2EuYXNzZXRfZGVzdHJveVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X2Rlc3Ryb3k6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ5NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUwMy01MDQKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gc2VsZi5hc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoZGVzdHJveV9hc3NldC5pZCkKICAgIGR1cAogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTA1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm1hbmFnZXJfYWRkciwgZXJyLlVOQVVUSE9SSVpFRF9NQU5BR0VSCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAibWFuYWdlcl9hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hbmFnZXJfYWRkciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIE1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjI5LTIzMwogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICBjb25maWdfYXNzZXQ9ZGVzdHJveV9hc3NldCwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjMyCiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMjkKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMzAKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIyOS0yMzMKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PWRlc3Ryb3lfYXNzZXQsCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MDkKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZWMgOCAvLyAidG90YWwiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTEwCiAgICAvLyBzZWxmLmRlY2ltYWxzID0gVUludDY0KCkKICAgIGJ5dGVjIDEwIC8vICJkZWNpbWFscyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MTEKICAgIC8vIHNlbGYuZGVmYXVsdF9mcm96ZW4gPSBGYWxzZQogICAgYnl0ZWMgOSAvLyAiZGVmYXVsdF9mcm96ZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTEyCiAgICAvLyBzZWxmLnVuaXRfbmFtZSA9IFN0cmluZygpCiAgICBieXRlYyAxMSAvLyAidW5pdF9uYW1lIgogICAgcHVzaGJ5dGVzICIiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MTMKICAgIC8vIHNlbGYubmFtZSA9IFN0cmluZygpCiAgICBieXRlYyAxMiAvLyAibmFtZSIKICAgIHB1c2hieXRlcyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTE0CiAgICAvLyBzZWxmLnVybCA9IFN0cmluZygpCiAgICBieXRlYyAxMyAvLyAidXJsIgogICAgcHVzaGJ5dGVzICIiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MTUKICAgIC8vIHNlbGYubWV0YWRhdGFfaGFzaCA9IEJ5dGVzKCkKICAgIGJ5dGVjIDE0IC8vICJtZXRhZGF0YV9oYXNoIgogICAgcHVzaGJ5dGVzIDB4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MTYKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyID0gQWNjb3VudCgpCiAgICBieXRlYyA3IC8vICJtYW5hZ2VyX2FkZHIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUxNwogICAgLy8gc2VsZi5yZXNlcnZlX2FkZHIgPSBBY2NvdW50KCkKICAgIGJ5dGVjXzEgLy8gInJlc2VydmVfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTE4CiAgICAvLyBzZWxmLmZyZWV6ZV9hZGRyID0gQWNjb3VudCgpCiAgICBieXRlYyA1IC8vICJmcmVlemVfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTE5CiAgICAvLyBzZWxmLmNsYXdiYWNrX2FkZHIgPSBBY2NvdW50KCkKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUyMAogICAgLy8gc2VsZi5zbWFydF9hc2FfaWQgPSBVSW50NjQoKQogICAgYnl0ZWNfMCAvLyAic21hcnRfYXNhX2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUyMQogICAgLy8gc2VsZi5nbG9iYWxfZnJvemVuID0gRmFsc2UKICAgIGJ5dGVjIDYgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDk1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhLmdldF9hc3NldF9jb25maWdbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXNzZXRfY29uZmlnOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MjMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MzQtNTM1CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGFzc2V0LmlkKQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTM5CiAgICAvLyB0b3RhbD1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJ0b3RhbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQwCiAgICAvLyBkZWNpbWFscz1hcmM0LlVJbnQzMihzZWxmLmRlY2ltYWxzKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAiZGVjaW1hbHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVjaW1hbHMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NDEKICAgIC8vIGRlZmF1bHRfZnJvemVuPWFyYzQuQm9vbChzZWxmLmRlZmF1bHRfZnJvemVuKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJkZWZhdWx0X2Zyb3plbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWZhdWx0X2Zyb3plbiBleGlzdHMKICAgIGJ5dGVjIDE2IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NDIKICAgIC8vIHVuaXRfbmFtZT1hcmM0LlN0cmluZyhzZWxmLnVuaXRfbmFtZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gInVuaXRfbmFtZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51bml0X25hbWUgZXhpc3RzCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NDMKICAgIC8vIG5hbWU9YXJjNC5TdHJpbmcoc2VsZi5uYW1lKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAibmFtZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5uYW1lIGV4aXN0cwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQ0CiAgICAvLyB1cmw9YXJjNC5TdHJpbmcoc2VsZi51cmwpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJ1cmwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXJsIGV4aXN0cwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQ1CiAgICAvLyBtZXRhZGF0YV9oYXNoPWFyYzQuRHluYW1pY0J5dGVzKHNlbGYubWV0YWRhdGFfaGFzaCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTQgLy8gIm1ldGFkYXRhX2hhc2giCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWV0YWRhdGFfaGFzaCBleGlzdHMKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU0NgogICAgLy8gbWFuYWdlcl9hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLm1hbmFnZXJfYWRkciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAibWFuYWdlcl9hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hbmFnZXJfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQ3CiAgICAvLyByZXNlcnZlX2FkZHI9YXJjNC5BZGRyZXNzKHNlbGYucmVzZXJ2ZV9hZGRyKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJyZXNlcnZlX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVzZXJ2ZV9hZGRyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NDgKICAgIC8vIGZyZWV6ZV9hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLmZyZWV6ZV9hZGRyKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJmcmVlemVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mcmVlemVfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQ5CiAgICAvLyBjbGF3YmFja19hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLmNsYXdiYWNrX2FkZHIpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhd2JhY2tfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTM3LTU1MAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyByZXR1cm4gQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9YXJjNC5VSW50NjQoc2VsZi50b3RhbCksCiAgICAvLyAgICAgZGVjaW1hbHM9YXJjNC5VSW50MzIoc2VsZi5kZWNpbWFscyksCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49YXJjNC5Cb29sKHNlbGYuZGVmYXVsdF9mcm96ZW4pLAogICAgLy8gICAgIHVuaXRfbmFtZT1hcmM0LlN0cmluZyhzZWxmLnVuaXRfbmFtZSksCiAgICAvLyAgICAgbmFtZT1hcmM0LlN0cmluZyhzZWxmLm5hbWUpLAogICAgLy8gICAgIHVybD1hcmM0LlN0cmluZyhzZWxmLnVybCksCiAgICAvLyAgICAgbWV0YWRhdGFfaGFzaD1hcmM0LkR5bmFtaWNCeXRlcyhzZWxmLm1ldGFkYXRhX2hhc2gpLAogICAgLy8gICAgIG1hbmFnZXJfYWRkcj1hcmM0LkFkZHJlc3Moc2VsZi5tYW5hZ2VyX2FkZHIpLAogICAgLy8gICAgIHJlc2VydmVfYWRkcj1hcmM0LkFkZHJlc3Moc2VsZi5yZXNlcnZlX2FkZHIpLAogICAgLy8gICAgIGZyZWV6ZV9hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLmZyZWV6ZV9hZGRyKSwKICAgIC8vICAgICBjbGF3YmFja19hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLmNsYXdiYWNrX2FkZHIpLAogICAgLy8gKQogICAgdW5jb3ZlciAxMAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MDA5NQogICAgY29uY2F0CiAgICBkaWcgOAogICAgbGVuCiAgICBwdXNoaW50IDE0OSAvLyAxNDkKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgOAogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgNwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUyMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlYyAxNSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2EuZ2V0X2Fzc2V0X2lzX2Zyb3plbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9hc3NldF9pc19mcm96ZW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU1MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU2My01NjQKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gc2VsZi5hc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoZnJlZXplX2Fzc2V0LmlkKQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTY2LTU2NwogICAgLy8gIyBFZmZlY3RzCiAgICAvLyByZXR1cm4gYXJjNC5Cb29sKHNlbGYuZ2xvYmFsX2Zyb3plbikKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJnbG9iYWxfZnJvemVuIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdsb2JhbF9mcm96ZW4gZXhpc3RzCiAgICBieXRlYyAxNiAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTUyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDE1IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYS5nZXRfYWNjb3VudF9pc19mcm96ZW5bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYWNjb3VudF9pc19mcm96ZW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU2OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTgzLTU4NAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBzd2FwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1ODYtNTg3CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHJldHVybiBhcmM0LkJvb2woc2VsZi5hY2NvdW50X2Zyb3plbltmcmVlemVfYWNjb3VudF0pCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X2Zyb3plbiBleGlzdHMgZm9yIGFjY291bnQKICAgIGJ5dGVjIDE2IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NjkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgMTUgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhLmdldF9jaXJjdWxhdGluZ19zdXBwbHlbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfY2lyY3VsYXRpbmdfc3VwcGx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1ODkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MDAtNjAxCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGFzc2V0LmlkKQogICAgZHVwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MDMtNjA0CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmNpcmN1bGF0aW5nX3N1cHBseShhc3NldCkpCiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1ODkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgMTUgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhLmNpcmN1bGF0aW5nX3N1cHBseShjdHJsX2Fzc2V0OiB1aW50NjQpIC0+IHVpbnQ2NDoKY2lyY3VsYXRpbmdfc3VwcGx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3OC03OQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjaXJjdWxhdGluZ19zdXBwbHkoc2VsZiwgY3RybF9hc3NldDogQXNzZXQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MAogICAgLy8gcmV0dXJuIGNmZy5UT1RBTCAtIGN0cmxfYXNzZXQuYmFsYW5jZShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIHN3YXAKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2EuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGFzc2V0X2lkOiB1aW50NjQpIC0+IHZvaWQ6CmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9uczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODItODMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKHNlbGYsIGFzc2V0X2lkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODQKICAgIC8vIGFzc2VydCBzZWxmLnNtYXJ0X2FzYV9pZCwgZXJyLk1JU1NJTkdfQ1RSTF9BU0EKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzbWFydF9hc2FfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc21hcnRfYXNhX2lkIGV4aXN0cwogICAgZHVwCiAgICBhc3NlcnQgLy8gTWlzc2luZyBDb250cm9sbGVkIEFTQQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NQogICAgLy8gYXNzZXJ0IHNlbGYuc21hcnRfYXNhX2lkID09IGFzc2V0X2lkLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2EuaW5uZXJfYXNzZXRfdHJhbnNmZXIoeGZlcl9hc3NldDogdWludDY0LCBhc3NldF9hbW91bnQ6IHVpbnQ2NCwgYXNzZXRfc2VuZGVyOiBieXRlcywgYXNzZXRfcmVjZWl2ZXI6IGJ5dGVzKSAtPiB2b2lkOgppbm5lcl9hc3NldF90cmFuc2ZlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjA5LTIxNwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBpbm5lcl9hc3NldF90cmFuc2ZlcigKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgICosCiAgICAvLyAgICAgeGZlcl9hc3NldDogQXNzZXQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50OiBVSW50NjQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyOiBBY2NvdW50LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyOiBBY2NvdW50CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjE4LTIyNQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YXNzZXRfYW1vdW50LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgaXR4bl9maWVsZCBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgQXNzZXRTZW5kZXIKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC00CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMTgKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMTkKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIxOC0yMjUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXhmZXJfYXNzZXQuaWQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1113], "errorMessage": "Clawback Address has been deleted"}, {"pc": [1751], "errorMessage": "Close to account is frozen"}, {"pc": [555], "errorMessage": "Controlled ASA already created"}, {"pc": [848], "errorMessage": "Forbidden Close Out on Opt In"}, {"pc": [1403], "errorMessage": "Forbidden clawback burning"}, {"pc": [1290], "errorMessage": "Forbidden over minting"}, {"pc": [1273], "errorMessage": "Forbidden self minting"}, {"pc": [1095], "errorMessage": "Freeze Address has been deleted"}, {"pc": [1651], "errorMessage": "Invalid Close Out group size"}, {"pc": [1300, 1372, 1431, 1439, 1465, 1476, 1581, 1645, 1709, 1728, 2184], "errorMessage": "Invalid Controlled ASA ID"}, {"pc": [1126], "errorMessage": "Invalid Total, must be >= circulating supply"}, {"pc": [862, 2180], "errorMessage": "Missing Controlled ASA"}, {"pc": [406], "errorMessage": "OnCompletion must be CloseOut && can only call when not creating"}, {"pc": [316], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [428], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [417], "errorMessage": "OnCompletion must be OptIn && can only call when not creating"}, {"pc": [1327, 1498], "errorMessage": "Receiver account is frozen"}, {"pc": [1075], "errorMessage": "Reserve Address has been deleted"}, {"pc": [1397, 1491, 1744], "errorMessage": "Sender account is frozen"}, {"pc": [1307, 1379, 1483, 1735], "errorMessage": "Smart ASA is global frozen"}, {"pc": [549], "errorMessage": "Unauthorized"}, {"pc": [1451], "errorMessage": "Unauthorized Clawback"}, {"pc": [1531, 1590], "errorMessage": "Unauthorized Freeze"}, {"pc": [1059, 1792], "errorMessage": "Unauthorized Manager"}, {"pc": [1264, 1360], "errorMessage": "Unauthorized Reserve"}, {"pc": [1670], "errorMessage": "Wrong ASA Close Out Amount"}, {"pc": [1658], "errorMessage": "Wrong ASA Close Out ID"}, {"pc": [1665], "errorMessage": "Wrong ASA Close Out Sender"}, {"pc": [841], "errorMessage": "Wrong ASA Opt In Amount"}, {"pc": [819], "errorMessage": "Wrong ASA Opt In ID"}, {"pc": [835], "errorMessage": "Wrong ASA Opt In Receiver"}, {"pc": [827], "errorMessage": "Wrong ASA Opt In Sender"}, {"pc": [1676, 1701], "errorMessage": "Wrong Close Out on Close Out"}, {"pc": [213], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [219], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [223], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [229], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [853, 1635], "errorMessage": "Wrong On Complete Action"}, {"pc": [889, 1761, 2166], "errorMessage": "account opted into asset"}, {"pc": [1325, 1395, 1489, 1496, 1742, 1749, 2119], "errorMessage": "check self.account_frozen exists for account"}, {"pc": [1294, 1366, 1422, 1437, 1456, 1474, 1575, 1641, 1722], "errorMessage": "check self.account_smart_asa_id exists for account"}, {"pc": [1099, 1109, 1315, 1383, 1412, 1979], "errorMessage": "check self.clawback_addr exists"}, {"pc": [1889], "errorMessage": "check self.decimals exists"}, {"pc": [879, 1903], "errorMessage": "check self.default_frozen exists"}, {"pc": [1080, 1091, 1529, 1588, 1975], "errorMessage": "check self.freeze_addr exists"}, {"pc": [1305, 1377, 1481, 1733, 2080], "errorMessage": "check self.global_frozen exists"}, {"pc": [1057, 1790, 1966], "errorMessage": "check self.manager_addr exists"}, {"pc": [1953], "errorMessage": "check self.metadata_hash exists"}, {"pc": [1927], "errorMessage": "check self.name exists"}, {"pc": [1063, 1071, 1262, 1311, 1355, 1401, 1970], "errorMessage": "check self.reserve_addr exists"}, {"pc": [553, 773, 814, 1277, 1298, 1370, 1426, 1460, 1579, 1705, 1726, 2178], "errorMessage": "check self.smart_asa_id exists"}, {"pc": [1288, 1883], "errorMessage": "check self.total exists"}, {"pc": [1914], "errorMessage": "check self.unit_name exists"}, {"pc": [1940], "errorMessage": "check self.url exists"}, {"pc": [462, 476, 490, 504, 950, 966, 982, 998], "errorMessage": "invalid array length header"}, {"pc": [455, 941, 1518, 1564], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [469, 483, 497, 511, 957, 973, 989, 1005], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [519, 527, 535, 543, 1015, 1026, 1036, 1046, 1233, 1243, 1556, 1618, 2110], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [447, 931], "errorMessage": "invalid number of bytes for arc4.uint32"}, {"pc": [438, 789, 908, 920, 1210, 1222, 1509, 1547, 1606, 1778, 1874, 2071, 2101, 2140], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [1895], "errorMessage": "overflow"}, {"pc": [802, 1629, 1692], "errorMessage": "transaction type is axfer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The total number of base units of the Smart ASA to create", "name": "total"}, {"type": "uint32", "desc": "The number of digits to use after the decimal point when displaying the Smart ASA", "name": "decimals"}, {"type": "bool", "desc": "Smart ASA default frozen (True to freeze holdings by default)", "name": "default_frozen"}, {"type": "string", "desc": "The name of a unit of Smart ASA", "name": "unit_name"}, {"type": "string", "desc": "The name of the Smart ASA", "name": "name"}, {"type": "string", "desc": "Smart ASA external URL", "name": "url"}, {"type": "byte[]", "desc": "Smart ASA metadata hash", "name": "metadata_hash"}, {"type": "address", "desc": "Account that can manage the configuration of the Smart ASA and destroy it", "name": "manager_addr"}, {"type": "address", "desc": "Account that holds the reserve (non-minted) units of Smart ASA and can mint or burn it", "name": "reserve_addr"}, {"type": "address", "desc": "Account that can freeze/unfreeze holdings of the Smart ASA globally or locally", "name": "freeze_addr"}, {"type": "address", "desc": "Account that can clawback holdings of the Smart ASA", "name": "clawback_addr"}], "name": "asset_create", "returns": {"type": "uint64", "desc": "Controlled ASA ID"}, "desc": "Create the Controlled ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["OptIn"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}, {"type": "axfer", "desc": "Controlled ASA opt in transaction", "name": "ctrl_asa_opt_in"}], "name": "asset_opt_in", "returns": {"type": "void"}, "desc": "Smart ASA opt in (App and Controlled ASA)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to configure", "name": "config_asset"}, {"type": "uint64", "desc": "Total number of base units if the Smart ASA. It can not be less than current circulating supply", "name": "total"}, {"type": "uint32", "desc": "The number of digits to use after the decimal point when displaying the Smart ASA", "name": "decimals"}, {"type": "bool", "desc": "Smart ASA default frozen (True to freeze holdings by default)", "name": "default_frozen"}, {"type": "string", "desc": "The name of a unit of Smart ASA", "name": "unit_name"}, {"type": "string", "desc": "The name of the Smart ASA", "name": "name"}, {"type": "string", "desc": "Smart ASA external URL", "name": "url"}, {"type": "byte[]", "desc": "Smart ASA metadata hash", "name": "metadata_hash"}, {"type": "address", "desc": "Account that can manage the configuration of the Smart ASA and destroy it", "name": "manager_addr"}, {"type": "address", "desc": "Account that holds the reserve (non-minted) units of Smart ASA and can mint or burn it", "name": "reserve_addr"}, {"type": "address", "desc": "Account that can freeze/unfreeze holdings of the Smart ASA globally or locally", "name": "freeze_addr"}, {"type": "address", "desc": "Account that can clawback holdings of the Smart ASA", "name": "clawback_addr"}], "name": "asset_config", "returns": {"type": "void"}, "desc": "Configure Smart ASA (for unchanged parameters use existing value - no optional args on AVM)", "events": [{"args": [{"type": "uint64", "name": "total"}, {"type": "uint32", "name": "decimals"}, {"type": "bool", "name": "default_frozen"}, {"type": "string", "name": "unit_name"}, {"type": "string", "name": "name"}, {"type": "string", "name": "url"}, {"type": "byte[]", "name": "metadata_hash"}, {"type": "address", "name": "manager_addr"}, {"type": "address", "name": "reserve_addr"}, {"type": "address", "name": "freeze_addr"}, {"type": "address", "name": "clawback_addr"}], "name": "AssetConfig", "desc": "Smart ASA Configuration"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "uint64", "desc": "Amount to transfer", "name": "asset_amount"}, {"type": "address", "desc": "Smart ASA sender", "name": "asset_sender"}, {"type": "address", "desc": "Smart ASA receiver", "name": "asset_receiver"}], "name": "asset_transfer", "returns": {"type": "void"}, "desc": "Smart ASA transfers: regular, clawback, mint, burn", "events": [{"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "(address,address,uint64)[]", "desc": "Transfer legs (sender, receiver, amount), submitted as a single inner transaction group", "name": "legs"}], "name": "asset_transfer_batch", "returns": {"type": "void"}, "desc": "Smart ASA batched transfers: each leg is a regular, clawback, mint or burn transfer", "events": [{"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "uint64", "desc": "Amount to transfer", "name": "asset_amount"}, {"type": "address", "desc": "Smart ASA sender", "name": "asset_sender"}, {"type": "address", "desc": "Smart ASA receiver", "name": "asset_receiver"}, {"type": "byte[32][]", "desc": "Merkle proof of the sender inclusion in the transfer allowlist", "name": "sender_proof"}, {"type": "byte[32][]", "desc": "Merkle proof of the receiver inclusion in the transfer allowlist", "name": "receiver_proof"}], "name": "asset_transfer_with_proof", "returns": {"type": "void"}, "desc": "Smart ASA regular transfer between allowlisted accounts", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to globally freeze/unfreeze", "name": "freeze_asset"}, {"type": "bool", "desc": "Smart ASA frozen status", "name": "asset_frozen"}], "name": "asset_freeze", "returns": {"type": "void"}, "desc": "Smart ASA global freeze (all accounts)", "events": [{"args": [{"type": "bool", "name": "asset_frozen"}], "name": "AssetFreeze", "desc": "Smart ASA Global Freeze Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to locally freeze/unfreeze", "name": "freeze_asset"}, {"type": "address", "desc": "Account to freeze/unfreeze", "name": "freeze_account"}, {"type": "bool", "desc": "Smart ASA frozen status", "name": "asset_frozen"}], "name": "account_freeze", "returns": {"type": "void"}, "desc": "Smart ASA local freeze (account specific)", "events": [{"args": [{"type": "address", "name": "freeze_account"}, {"type": "bool", "name": "asset_frozen"}], "name": "AccountFreeze", "desc": "Smart ASA Account Freeze Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to set the transfer allowlist for", "name": "freeze_asset"}, {"type": "byte[32]", "desc": "Allowlist Merkle root (zero hash to disable the allowlist)", "name": "allowlist_root"}], "name": "set_transfer_allowlist", "returns": {"type": "void"}, "desc": "Smart ASA transfer allowlist (Merkle root of the accounts allowed to transfer)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["CloseOut"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to close out", "name": "close_asset"}, {"type": "address", "desc": "Account to send all the Smart ASA remainder to.", "name": "close_to"}], "name": "asset_close_out", "returns": {"type": "void"}, "desc": "Smart ASA close out (App and Controlled ASA)", "events": [{"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to destroy", "name": "destroy_asset"}], "name": "asset_destroy", "returns": {"type": "void"}, "desc": "Destroy the Controlled ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}], "name": "get_asset_config", "returns": {"type": "(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)", "desc": "Smart ASA configuration parameters", "struct": "AssetConfig"}, "desc": "Get Smart ASA configuration", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "freeze_asset"}], "name": "get_asset_is_frozen", "returns": {"type": "bool", "desc": "Smart ASA global frozen status"}, "desc": "Get Smart ASA global frozen status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "freeze_asset"}, {"type": "address", "desc": "Account to check", "name": "freeze_account"}], "name": "get_account_is_frozen", "returns": {"type": "bool", "desc": "Smart ASA account frozen status"}, "desc": "Get Smart ASA account frozen status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}], "name": "get_circulating_supply", "returns": {"type": "uint64", "desc": "Smart ASA circulating supply"}, "desc": "Get Smart ASA circulating supply", "events": [], "readonly": true, "recommendations": {}}], "name": "SmartAsa", "state": {"keys": {"box": {}, "global": {"smart_asa_id": {"key": "c21hcnRfYXNhX2lk", "keyType": "AVMString", "valueType": "AVMUint64"}, "global_frozen": {"key": "Z2xvYmFsX2Zyb3plbg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "allowlist_root": {"key": "YWxsb3dsaXN0X3Jvb3Q=", "keyType": "AVMString", "valueType": "AVMBytes"}, "total": {"key": "dG90YWw=", "keyType": "AVMString", "valueType": "AVMUint64"}, "decimals": {"key": "ZGVjaW1hbHM=", "keyType": "AVMString", "valueType": "AVMUint64"}, "default_frozen": {"key": "ZGVmYXVsdF9mcm96ZW4=", "keyType": "AVMString", "valueType": "AVMUint64"}, "unit_name": {"key": "dW5pdF9uYW1l", "keyType": "AVMString", "valueType": "AVMString"}, "name": {"key": "bmFtZQ==", "keyType": "AVMString", "valueType": "AVMString"}, "url": {"key": "dXJs", "keyType": "AVMString", "valueType": "AVMString"}, "metadata_hash": {"key": "bWV0YWRhdGFfaGFzaA==", "keyType": "AVMString", "valueType": "AVMBytes"}, "manager_addr": {"key": "bWFuYWdlcl9hZGRy", "keyType": "AVMString", "valueType": "address"}, "reserve_addr": {"key": "cmVzZXJ2ZV9hZGRy", "keyType": "AVMString", "valueType": "address"}, "freeze_addr": {"key": "ZnJlZXplX2FkZHI=", "keyType": "AVMString", "valueType": "address"}, "clawback_addr": {"key": "Y2xhd2JhY2tfYWRkcg==", "keyType": "AVMString", "valueType": "address"}}, "local": {"account_smart_asa_id": {"key": "YWNjb3VudF9zbWFydF9hc2FfaWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "account_frozen": {"key": "YWNjb3VudF9mcm96ZW4=", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 9, "ints": 5}, "local": {"bytes": 0, "ints": 2}}}, "structs": {"AssetConfig": [{"name": "total", "type": "uint64"}, {"name": "decimals", "type": "uint32"}, {"name": "default_frozen", "type": "bool"}, {"name": "unit_name", "type": "string"}, {"name": "name", "type": "string"}, {"name": "url", "type": "string"}, {"name": "metadata_hash", "type": "byte[]"}, {"name": "manager_addr", "type": "address"}, {"name": "reserve_addr", "type": "address"}, {"name": "freeze_addr", "type": "address"}, {"name": "clawback_addr", "type": "address"}]}, "byteCode": {"approval": "CyAGAAEgCJUB////////////ASYVABRhY2NvdW50X3NtYXJ0X2FzYV9pZA1jbGF3YmFja19hZGRyDmFjY291bnRfZnJvemVuC2ZyZWV6ZV9hZGRyDWdsb2JhbF9mcm96ZW4McmVzZXJ2ZV9hZGRyDG1hbmFnZXJfYWRkcg5hbGxvd2xpc3Rfcm9vdAV0b3RhbA5kZWZhdWx0X2Zyb3plbgxzbWFydF9hc2FfaWQEFR98dQEACGRlY2ltYWxzCXVuaXRfbmFtZQRuYW1lA3VybA1tZXRhZGF0YV9oYXNoAgCVBPn79dwxGEAAUTE1gQkSRDE0gQUSRDE3FEQxNoECEkQnCSJnJw4iZycKImcnDyhnJxAoZycRKGcnEihnJwcyA2cnBjIDZycEMgNnKjIDZycLImcnBSJnJwgoZzEbQQCWggIESGQWRQQ6BFvcNhoAjgIAdgBqMRkURDEYRIINBOfs1agE+IGf6wR+rLd1BE7OS3QELFCH4gShM9WBBP9Tre8ESjqU/QTtZEUvBC6bkDgEl5uZcgRIpjzJBEatDVI2GgCODQAiAfgDRAOIBD4EuAToBS4GKwaNB1AHbgeUADEZgQISMRgQREIFVjEZIxIxGBBEQgFzMRkUMRgUEEQjQzYaAUkVJRJENhoCSRWBBBJENhoDSRUjEkQ2GgRHAiJZgQIITBVJTwISRDYaBUcCIlmBAghMFUlPAhJENhoGRwIiWYECCEwVSU8CEkQ2GgdHAiJZgQIITBUSRDYaCEkVJBJENhoJSRUkEkQ2GgpJFSQSRDYaC0kVJBJEMQAyCRJEIicLZUQURLEyCChLAUEAIksBSYEKGIAKMDEyMzQ1Njc4OUwjWEsCUEUCgQoKRQJC/9lHAhWAATBOAk2AD2FsZ29yYW5kOi8vYXBwL0xQMgpHA7IssiuyKrIpsieAEEFSQy0yMCBTbWFydCBBU0GyJoAGQVJDLTIwsiUjsiQisiMhBbIigQOyECKyAbO0PEsQSxBQSw9QJxNQIQRLDghJFlcGAk8CTFBMSwwISRZXBgJPAkxQTEsKCBZXBgJQSwdQSwZQSwVQSwRQSw5QSwxQSwpQSwhQJwtLAmdLAUyIBipIFicMTFCwI0M2GgFJFSUSRBdJMRYjCUk4EIEEEkQxGSMSREsBiAaZSTgRSwISREk4ADEAEkRJOBQxABJESTgSFEQ4FTIDEkQxAExwAEUBRDEAIicKZURAAAoxAEsCcABEQQAOI0sBSSlLBWYrTwJmI0MiQv/vIkk2GgFJFSUSRBdJNhoCSU4CFSUSRDYaA0lOAhWBBBJENhoESU4CFSMSRDYaBUlOAkkiWYECCEwVSU4DEkQ2GgZJTgJJIlmBAghMFUlOAxJENhoHSU4CSSJZgQIITBVJTgMSRDYaCElOAkkiWYECCEwVEkQ2GglJTgIVJBJENhoKSU4CSRUkEkQ2GgtJTgMVJBJENhoMSU4DFSQSREyIBaoxACInB2VEEkQiJwZlTElOAk4DRBNBAAVJMgMTRCInBGVMSU4CRRNESwMTQQAGSxAyAxNEIiplTElOAkUUREsCE0EABksRMgMTREsPSYgFdRZLEElPAqdESw9QSw5QJxNQIQRLDQhJFlcGAk8CTFBMSwsISRZXBgJPAkxQTEsJCBZXBgJQSwZQSwVQSwRQSwNQSw1QSwtQSwlQSwdQiARzgAThDFpHTFCwI0M2GgFJFSUSRBc2GgJJFSUSRDYaA0kVJBJENhoESRUkEkRLA4gE2U8CF0sDSwNLA0sDiAUqSwNLAUsESwSIBoaIBdsjQyJJKDYaAUkVJRJEF0k2GgJJTgJJIllJTgNJgUgLgQIITwIVEkRMiASSSUSBEA5EIklJSwMMQQB7SwNXAgBLAYFIC4FIWElXACBJTgJFCUlXICBFCoFAW0UHMgoSQQBGSwFLBghJRQNLBUsISwpPA4gEqElBACu2gQSyECKyAUsESbIRSwZJTgKyEksISbITSwpJshRPA4gFQEkjCEUBQv+QsUL/0ksESwdLCUsIiARqQv+/syNDNhoBSRUlEkQXNhoCSRUlEkQ2GgNJFSQSRDYaBEkVJBJENhoFSSJZJAuBAghLARUSRDYaBkkiWSQLgQIISwEVEkRLBYgDv0sFiAPJREsFSwRLBIgD2ksFSwRPA4gFFEhESwRLAk8CiAUJSERPAhdPA0xPA08DiAVTI0M2GgFJFSUSRBc2GgJJFSMSREyIA3YxACInBGVEEkRJIlMnBUxngARimWRqTFCwI0M2GgFJFSUSRBc2GgJJFSQSRDYaA0kVIxJESwKIAz1LASIpY0RPAxJEMQAiJwRlRBJESSJTSwIrTwJmUIAE74tm2UxQsCNDNhoBSRUlEkQXNhoCSU4CSRUkEkRMiAL9MQAiJwRlRBJEMgMSQQAGJwgoZyNDJwhLAWdC//YoNhoBSRUlEkQXSTYaAklOAhUkEkQxGYECEkQxFiMISTgQgQQSRDEAIiljREsCEkQyBEsBDURJOBFLAhJESTgAMQASREk4EhREOBUyAxNEcQtBAHIxFiMISTgQgQQSRDgVSwFJTgISREsDiAJzSwITQQAoSwFJIiljREsESU4CEkSIAmsURCInBWVEFEQxACIrY0QURCIrY0QURDEASwNJTgJwAExJTgJFB0QxAEsESU4EiAPxMgoSQQALMQBLBBZQJxRMULAjQzYaAUkVJRJEF0mIAgsxACInB2VEEkSxMgqyALIhgQOyECKyAbMnCSJnJw4iZycKImcnDyhnJxAoZycRKGcnEihnJwcyA2cnBjIDZycEMgNnKjIDZycLImcnBSJnJwgoZyNDNhoBSRUlEkQXiAGqIicJZUQWIicOZUQWSZMkDkRXBAQiJwplRCcNIk8CVCInD2VESRUWVwYCTFAiJxBlREkVFlcGAkxQIicRZURJFRZXBgJMUCInEmVESRUWVwYCTFAiJwdlRCInBmVEIicEZUQiKmVETwpPClBPCVAnE1BLCBUhBAhJFlcGAk8CTFBLCBVPAghJFlcGAk8CTFBLBxVPAggWVwYCUE8EUE8DUE8CUExQTwRQTwNQTwJQTFAnDExQsCNDNhoBSRUlEkQXiADnIicFZUQnDSJPAlQnDExQsCNDNhoBSRUlEkQXNhoCSRUkEkRMiADAIitjRCcNIk8CVCcMTFCwI0M2GgFJFSUSRBdJiACiiAC6FicMTFCwI0OKAgGL/yJbJwlMZ4v/JVonDkxni/+BYFMnDSJPAlQiUycKTGeL/4ENWYv/gQ9Zi/9PAksCUlcCACcPTGeL/4ERWYv/TwJLAlJXAgAnEExni/+BE1mL/08CSwJSVwIAJxFMZ4v/FYv/TgJSVwIAJxJMZ4v/VxUgJwdMZ4v/VzUgJwZMZ4v/V1UgJwRMZ4v/V3UgKkxni/+JigEAIicLZURJRIv/EkSJigEBIicIZUQVIhOJigEBMgqL/3AARCEFTAmJigMAMQCL/hJEi/4iKWNEi/0SRIv/IiljRIv9EkQiJwVlRBREi/4iK2NEFESL/yIrY0QURImKBAAii/0yChJBAEIiJwZlRDEASwESRIv+MgoTRIv8iP+ai/8IIicJZUQORIv+IiljRIv8EkQiJwVlRBREIiplRBNBAAiL/iIrY0QURImL/jIKEkEAOSInBmVMSU4CjABEMQBLARJEi/0iKWNEi/wSRCInBWVEFEQiKmVEE0H/zYv9IitjRBREi/2LABJEiTEAIiplRBJBABWL/SIpY0SL/BJEi/4iKWNEi/wSRImL/Ij+/RREi/yL/Yv+iP8NiYoEAIv9MgoSQQARi/8Wi/5MUIAE3y55TkxQsImL/jIKEkEADYv/Fov9TFAnFExQsIkxACIqZUQSQf/gi/8Wi/2L/lBMUIAES4mY/ExQsImKAwInDYv+UAGL/yJZIosCiwEMQQA0i/9XAgCLAiQLJFhJiwClQQAUgAEBiwBQTFABjACLAiMIjAJC/9KAAQFMUIsAUAGMAEL/6SInCGVEiwASi/+MAYwAiYoEALEyCrIAi/+yFIv+shOL/bISi/yyEYEEshAisgGziQ==", "clear": "C4EBQw=="}, "desc": "\n    ARC-0020 (Smart ASA) - Reference Implementation\n    ", "events": [{"args": [{"type": "uint64", "name": "total"}, {"type": "uint32", "name": "decimals"}, {"type": "bool", "name": "default_frozen"}, {"type": "string", "name": "unit_name"}, {"type": "string", "name": "name"}, {"type": "string", "name": "url"}, {"type": "byte[]", "name": "metadata_hash"}, {"type": "address", "name": "manager_addr"}, {"type": "address", "name": "reserve_addr"}, {"type": "address", "name": "freeze_addr"}, {"type": "address", "name": "clawback_addr"}], "name": "AssetConfig", "desc": "Smart ASA Configuration"}, {"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}, {"args": [{"type": "bool", "name": "asset_frozen"}], "name": "AssetFreeze", "desc": "Smart ASA Global Freeze Event"}, {"args": [{"type": "address", "name": "freeze_account"}, {"type": "bool", "name": "asset_frozen"}], "name": "AccountFreeze", "desc": "Smart ASA Account Freeze Event"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgOCAxNDkgMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIGJ5dGVjYmxvY2sgMHggImFjY291bnRfc21hcnRfYXNhX2lkIiAiY2xhd2JhY2tfYWRkciIgImFjY291bnRfZnJvemVuIiAiZnJlZXplX2FkZHIiICJnbG9iYWxfZnJvemVuIiAicmVzZXJ2ZV9hZGRyIiAibWFuYWdlcl9hZGRyIiAiYWxsb3dsaXN0X3Jvb3QiICJ0b3RhbCIgImRlZmF1bHRfZnJvemVuIiAic21hcnRfYXNhX2lkIiAweDE1MWY3Yzc1IDB4MDAgImRlY2ltYWxzIiAidW5pdF9uYW1lIiAibmFtZSIgInVybCIgIm1ldGFkYXRhX2hhc2giIDB4MDA5NSAweGY5ZmJmNWRjCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwMTAtMTAxMQogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fYnl0ZV9zbGljZSA9PSBjZmcuR0xPQkFMX0JZVEVTLCBlcnIuV1JPTkdfR0xPQkFMX0JZVEVTCiAgICB0eG4gR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICBwdXNoaW50IDkgLy8gOQogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDEyCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fdWludCA9PSBjZmcuR0xPQkFMX1VJTlRTLCBlcnIuV1JPTkdfR0xPQkFMX1VJTlRTCiAgICB0eG4gR2xvYmFsTnVtVWludAogICAgcHVzaGludCA1IC8vIDUKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTAxMwogICAgLy8gYXNzZXJ0IFR4bi5sb2NhbF9udW1fYnl0ZV9zbGljZSA9PSBjZmcuTE9DQUxfQllURVMsIGVyci5XUk9OR19MT0NBTF9CWVRFUwogICAgdHhuIExvY2FsTnVtQnl0ZVNsaWNlCiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDE0CiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV91aW50ID09IGNmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICBwdXNoaW50IDIgLy8gMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwMTYtMTAxOAogICAgLy8gIyBHTE9CQUwgU1RBVEUKICAgIC8vICMgQVNBIEZpZWxkcwogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlYyA5IC8vICJ0b3RhbCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDE5CiAgICAvLyBzZWxmLmRlY2ltYWxzID0gVUludDY0KCkKICAgIGJ5dGVjIDE0IC8vICJkZWNpbWFscyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDIwCiAgICAvLyBzZWxmLmRlZmF1bHRfZnJvemVuID0gRmFsc2UKICAgIGJ5dGVjIDEwIC8vICJkZWZhdWx0X2Zyb3plbiIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDIxCiAgICAvLyBzZWxmLnVuaXRfbmFtZSA9IFN0cmluZygpCiAgICBieXRlYyAxNSAvLyAidW5pdF9uYW1lIgogICAgYnl0ZWNfMCAvLyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTAyMgogICAgLy8gc2VsZi5uYW1lID0gU3RyaW5nKCkKICAgIGJ5dGVjIDE2IC8vICJuYW1lIgogICAgYnl0ZWNfMCAvLyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTAyMwogICAgLy8gc2VsZi51cmwgPSBTdHJpbmcoKQogICAgYnl0ZWMgMTcgLy8gInVybCIKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwMjQKICAgIC8vIHNlbGYubWV0YWRhdGFfaGFzaCA9IEJ5dGVzKCkKICAgIGJ5dGVjIDE4IC8vICJtZXRhZGF0YV9oYXNoIgogICAgYnl0ZWNfMCAvLyAweAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTAyNQogICAgLy8gc2VsZi5tYW5hZ2VyX2FkZHIgPSBBY2NvdW50KCkKICAgIGJ5dGVjIDcgLy8gIm1hbmFnZXJfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTAyNgogICAgLy8gc2VsZi5yZXNlcnZlX2FkZHIgPSBBY2NvdW50KCkKICAgIGJ5dGVjIDYgLy8gInJlc2VydmVfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTAyNwogICAgLy8gc2VsZi5mcmVlemVfYWRkciA9IEFjY291bnQoKQogICAgYnl0ZWMgNCAvLyAiZnJlZXplX2FkZHIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwMjgKICAgIC8vIHNlbGYuY2xhd2JhY2tfYWRkciA9IEFjY291bnQoKQogICAgYnl0ZWNfMiAvLyAiY2xhd2JhY2tfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTEwLTkxMgogICAgLy8gIyBHTE9CQUwgU1RBVEUKICAgIC8vICMgU21hcnQgQVNBIEZpZWxkcwogICAgLy8gc2VsZi5zbWFydF9hc2FfaWQgPSBVSW50NjQoKQogICAgYnl0ZWMgMTEgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5MTMKICAgIC8vIHNlbGYuZ2xvYmFsX2Zyb3plbiA9IEZhbHNlCiAgICBieXRlYyA1IC8vICJnbG9iYWxfZnJvemVuIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkxNAogICAgLy8gc2VsZi5hbGxvd2xpc3Rfcm9vdCA9IEJ5dGVzKCkKICAgIGJ5dGVjIDggLy8gImFsbG93bGlzdF9yb290IgogICAgYnl0ZWNfMCAvLyAweAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5OTYtMTAwNAogICAgLy8gY2xhc3MgU21hcnRBc2EoCiAgICAvLyAgICAgU2luZ2xlU21hcnRBc2FCYXNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDI1CiAgICBwdXNoYnl0ZXNzIDB4NDg2NDE2NDUgMHgzYTA0NWJkYyAvLyBtZXRob2QgImFzc2V0X29wdF9pbih1aW50NjQsYXhmZXIpdm9pZCIsIG1ldGhvZCAiYXNzZXRfY2xvc2Vfb3V0KHVpbnQ2NCxhZGRyZXNzKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2Fzc2V0X29wdF9pbl9yb3V0ZUA1IG1haW5fYXNzZXRfY2xvc2Vfb3V0X3JvdXRlQDYKCm1haW5fc3dpdGNoX2Nhc2VfbmV4dEA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5OTYtMTAwNAogICAgLy8gY2xhc3MgU21hcnRBc2EoCiAgICAvLyAgICAgU2luZ2xlU21hcnRBc2FCYXNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0CiAgICBwdXNoYnl0ZXNzIDB4ZTdlY2Q1YTggMHhmODgxOWZlYiAweDdlYWNiNzc1IDB4NGVjZTRiNzQgMHgyYzUwODdlMiAweGExMzNkNTgxIDB4ZmY1M2FkZWYgMHg0YTNhOTRmZCAweGVkNjQ0NTJmIDB4MmU5YjkwMzggMHg5NzliOTk3MiAweDQ4YTYzY2M5IDB4NDZhZDBkNTIgLy8gbWV0aG9kICJhc3NldF9jcmVhdGUodWludDY0LHVpbnQzMixib29sLHN0cmluZyxzdHJpbmcsc3RyaW5nLGJ5dGVbXSxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiYXNzZXRfY29uZmlnKHVpbnQ2NCx1aW50NjQsdWludDMyLGJvb2wsc3RyaW5nLHN0cmluZyxzdHJpbmcsYnl0ZVtdLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiYXNzZXRfdHJhbnNmZXIodWludDY0LHVpbnQ2NCxhZGRyZXNzLGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiYXNzZXRfdHJhbnNmZXJfYmF0Y2godWludDY0LChhZGRyZXNzLGFkZHJlc3MsdWludDY0KVtdKXZvaWQiLCBtZXRob2QgImFzc2V0X3RyYW5zZmVyX3dpdGhfcHJvb2YodWludDY0LHVpbnQ2NCxhZGRyZXNzLGFkZHJlc3MsYnl0ZVszMl1bXSxieXRlWzMyXVtdKXZvaWQiLCBtZXRob2QgImFzc2V0X2ZyZWV6ZSh1aW50NjQsYm9vbCl2b2lkIiwgbWV0aG9kICJhY2NvdW50X2ZyZWV6ZSh1aW50NjQsYWRkcmVzcyxib29sKXZvaWQiLCBtZXRob2QgInNldF90cmFuc2Zlcl9hbGxvd2xpc3QodWludDY0LGJ5dGVbMzJdKXZvaWQiLCBtZXRob2QgImFzc2V0X2Rlc3Ryb3kodWludDY0KXZvaWQiLCBtZXRob2QgImdldF9hc3NldF9jb25maWcodWludDY0KSh1aW50NjQsdWludDMyLGJvb2wsc3RyaW5nLHN0cmluZyxzdHJpbmcsYnl0ZVtdLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MpIiwgbWV0aG9kICJnZXRfYXNzZXRfaXNfZnJvemVuKHVpbnQ2NClib29sIiwgbWV0aG9kICJnZXRfYWNjb3VudF9pc19mcm96ZW4odWludDY0LGFkZHJlc3MpYm9vbCIsIG1ldGhvZCAiZ2V0X2NpcmN1bGF0aW5nX3N1cHBseSh1aW50NjQpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggYXNzZXRfY3JlYXRlIGFzc2V0X2NvbmZpZyBhc3NldF90cmFuc2ZlciBhc3NldF90cmFuc2Zlcl9iYXRjaCBhc3NldF90cmFuc2Zlcl93aXRoX3Byb29mIGFzc2V0X2ZyZWV6ZSBhY2NvdW50X2ZyZWV6ZSBzZXRfdHJhbnNmZXJfYWxsb3dsaXN0IGFzc2V0X2Rlc3Ryb3kgZ2V0X2Fzc2V0X2NvbmZpZyBnZXRfYXNzZXRfaXNfZnJvemVuIGdldF9hY2NvdW50X2lzX2Zyb3plbiBnZXRfY2lyY3VsYXRpbmdfc3VwcGx5CiAgICBlcnIKCm1haW5fYXNzZXRfY2xvc2Vfb3V0X3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgwMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJDbG9zZU91dCJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCAyIC8vIENsb3NlT3V0CiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgQ2xvc2VPdXQgJiYgY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYiBhc3NldF9jbG9zZV9vdXQKCm1haW5fYXNzZXRfb3B0X2luX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJPcHRJbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18xIC8vIE9wdEluCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgT3B0SW4gJiYgY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYiBhc3NldF9vcHRfaW4KCm1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMjU6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgJiYKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBOb09wICYmIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmFzc2V0X2NyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X2NyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5ib29sCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgOQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQyNi00MjcKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgZXJyLlVOQVVUSE9SSVpFRAogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5MzIKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5zbWFydF9hc2FfaWQsIGVyci5FWElTVElOR19DVFJMX0FTQQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJzbWFydF9hc2FfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc21hcnRfYXNhX2lkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIENvbnRyb2xsZWQgQVNBIGFscmVhZHkgY3JlYXRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNDktMzYyCiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gICAgIHRvdGFsPWNmZy5UT1RBTCwKICAgIC8vICAgICBkZWNpbWFscz1jZmcuREVDSU1BTFMsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49Y2ZnLkRFRkFVTFRfRlJPWkVOLAogICAgLy8gICAgIHVuaXRfbmFtZT1jZmcuVU5JVF9OQU1FLAogICAgLy8gICAgIGFzc2V0X25hbWU9Y2ZnLk5BTUUsCiAgICAvLyAgICAgdXJsPWNmZy5BUFBfQklORElORyArIHNlbGYuaXRvYShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKQogICAgLy8gLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1NgogICAgLy8gdXJsPWNmZy5BUFBfQklORElORyArIHNlbGYuaXRvYShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTYwCiAgICAvLyBhY2MgPSBCeXRlcygpCiAgICBieXRlY18wIC8vIDB4Cgphc3NldF9jcmVhdGVfd2hpbGVfdG9wQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gd2hpbGUgbiA+IDA6CiAgICBkaWcgMQogICAgYnogYXNzZXRfY3JlYXRlX2FmdGVyX3doaWxlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTYyCiAgICAvLyBhY2MgPSBkaWdpdHNbbiAlIDEwXSArIGFjYwogICAgZGlnIDEKICAgIGR1cAogICAgcHVzaGludCAxMCAvLyAxMAogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNTkKICAgIC8vIGRpZ2l0cyA9IEJ5dGVzKGIiMDEyMzQ1Njc4OSIpCiAgICBwdXNoYnl0ZXMgMHgzMDMxMzIzMzM0MzUzNjM3MzgzOQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjIKICAgIC8vIGFjYyA9IGRpZ2l0c1tuICUgMTBdICsgYWNjCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgZXh0cmFjdDMKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGJ1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjMKICAgIC8vIG4gLy89IDEwCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICAvCiAgICBidXJ5IDIKICAgIGIgYXNzZXRfY3JlYXRlX3doaWxlX3RvcEA0Cgphc3NldF9jcmVhdGVfYWZ0ZXJfd2hpbGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTY0CiAgICAvLyByZXR1cm4gYWNjIG9yIEJ5dGVzKGIiMCIpCiAgICBkdXBuIDIKICAgIGxlbgogICAgcHVzaGJ5dGVzIDB4MzAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTYKICAgIC8vIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgcHVzaGJ5dGVzIDB4NjE2YzY3NmY3MjYxNmU2NDNhMmYyZjYxNzA3MDJmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzU3CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTgtMzYwCiAgICAvLyByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VVJMCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1NQogICAgLy8gYXNzZXRfbmFtZT1jZmcuTkFNRSwKICAgIHB1c2hieXRlcyAiQVJDLTIwIFNtYXJ0IEFTQSIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1NAogICAgLy8gdW5pdF9uYW1lPWNmZy5VTklUX05BTUUsCiAgICBwdXNoYnl0ZXMgIkFSQy0yMCIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTMKICAgIC8vIGRlZmF1bHRfZnJvemVuPWNmZy5ERUZBVUxUX0ZST1pFTiwKICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTIKICAgIC8vIGRlY2ltYWxzPWNmZy5ERUNJTUFMUywKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzUxCiAgICAvLyB0b3RhbD1jZmcuVE9UQUwsCiAgICBpbnRjIDUgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNDkKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTAKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0OS0zNjIKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgdG90YWw9Y2ZnLlRPVEFMLAogICAgLy8gICAgIGRlY2ltYWxzPWNmZy5ERUNJTUFMUywKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1jZmcuREVGQVVMVF9GUk9aRU4sCiAgICAvLyAgICAgdW5pdF9uYW1lPWNmZy5VTklUX05BTUUsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1jZmcuTkFNRSwKICAgIC8vICAgICB1cmw9Y2ZnLkFQUF9CSU5ESU5HICsgc2VsZi5pdG9hKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApCiAgICAvLyAuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0OS0zNjMKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgdG90YWw9Y2ZnLlRPVEFMLAogICAgLy8gICAgIGRlY2ltYWxzPWNmZy5ERUNJTUFMUywKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1jZmcuREVGQVVMVF9GUk9aRU4sCiAgICAvLyAgICAgdW5pdF9uYW1lPWNmZy5VTklUX05BTUUsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1jZmcuTkFNRSwKICAgIC8vICAgICB1cmw9Y2ZnLkFQUF9CSU5ESU5HICsgc2VsZi5pdG9hKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApCiAgICAvLyAuc3VibWl0KCkKICAgIC8vIC5jcmVhdGVkX2Fzc2V0LmlkCiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQzNC00NDYKICAgIC8vIEFzc2V0Q29uZmlnKAogICAgLy8gICAgIHRvdGFsPXRvdGFsLAogICAgLy8gICAgIGRlY2ltYWxzPWRlY2ltYWxzLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPWRlZmF1bHRfZnJvemVuLAogICAgLy8gICAgIHVuaXRfbmFtZT11bml0X25hbWUsCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIHVybD11cmwsCiAgICAvLyAgICAgbWV0YWRhdGFfaGFzaD1tZXRhZGF0YV9oYXNoLAogICAgLy8gICAgIG1hbmFnZXJfYWRkcj1tYW5hZ2VyX2FkZHIsCiAgICAvLyAgICAgcmVzZXJ2ZV9hZGRyPXJlc2VydmVfYWRkciwKICAgIC8vICAgICBmcmVlemVfYWRkcj1mcmVlemVfYWRkciwKICAgIC8vICAgICBjbGF3YmFja19hZGRyPWNsYXdiYWNrX2FkZHIsCiAgICAvLyApLAogICAgZGlnIDE2CiAgICBkaWcgMTYKICAgIGNvbmNhdAogICAgZGlnIDE1CiAgICBjb25jYXQKICAgIGJ5dGVjIDE5IC8vIDB4MDA5NQogICAgY29uY2F0CiAgICBpbnRjIDQgLy8gMTQ5CiAgICBkaWcgMTQKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkaWcgMTIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkaWcgMTAKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIGRpZyA3CiAgICBjb25jYXQKICAgIGRpZyA2CiAgICBjb25jYXQKICAgIGRpZyA1CiAgICBjb25jYXQKICAgIGRpZyA0CiAgICBjb25jYXQKICAgIGRpZyAxNAogICAgY29uY2F0CiAgICBkaWcgMTIKICAgIGNvbmNhdAogICAgZGlnIDEwCiAgICBjb25jYXQKICAgIGRpZyA4CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTM2CiAgICAvLyBzZWxmLnNtYXJ0X2FzYV9pZCA9IGFzc2V0X2lkCiAgICBieXRlYyAxMSAvLyAic21hcnRfYXNhX2lkIgogICAgZGlnIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkzNwogICAgLy8gc2VsZi5zdG9yZV9hc3NldF9jb25maWcoYXNzZXRfaWQsIGFzc2V0X2NvbmZpZykKICAgIGRpZyAxCiAgICBzd2FwCiAgICBjYWxsc3ViIHN0b3JlX2Fzc2V0X2NvbmZpZwogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ0OAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNtYXJ0X2FzYV9pZCkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjIDEyIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXRfb3B0X2luW3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfb3B0X2luOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0OTIKICAgIC8vIGFzc2VydCBUeG4ub25fY29tcGxldGlvbiA9PSBPbkNvbXBsZXRlQWN0aW9uLk9wdEluLCBlcnIuV1JPTkdfT05fQ09NUExFVEUKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMSAvLyBPcHRJbgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBPbiBDb21wbGV0ZSBBY3Rpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDU0LTQ1NQogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhhc3NldC5pZCkKICAgIGRpZyAxCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NTkKICAgIC8vIGFzc2VydCBjdHJsX2FzYV9vcHRfaW4ueGZlcl9hc3NldC5pZCA9PSBhc3NldC5pZCwgZXJyLk9QVF9JTl9XUk9OR19BU0EKICAgIGR1cAogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBkaWcgMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgT3B0IEluIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2MAogICAgLy8gYXNzZXJ0IGN0cmxfYXNhX29wdF9pbi5zZW5kZXIgPT0gVHhuLnNlbmRlciwgZXJyLk9QVF9JTl9XUk9OR19TRU5ERVIKICAgIGR1cAogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBPcHQgSW4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2MQogICAgLy8gYXNzZXJ0IGN0cmxfYXNhX29wdF9pbi5hc3NldF9yZWNlaXZlciA9PSBUeG4uc2VuZGVyLCBlcnIuT1BUX0lOX1dST05HX1JFQ0VJVkVSCiAgICBkdXAKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIE9wdCBJbiBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjMKICAgIC8vIGN0cmxfYXNhX29wdF9pbi5hc3NldF9hbW91bnQgPT0gMAogICAgZHVwCiAgICBndHhucyBBc3NldEFtb3VudAogICAgIQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjItNDY0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGN0cmxfYXNhX29wdF9pbi5hc3NldF9hbW91bnQgPT0gMAogICAgLy8gKSwgZXJyLk9QVF9JTl9XUk9OR19BTU9VTlQgICMgUGVkYW50OiBDb250cm9sbGVkIEFTQSBpcyBkZWZhdWx0IGZyb3plbgogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBPcHQgSW4gQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2NgogICAgLy8gY3RybF9hc2Ffb3B0X2luLmFzc2V0X2Nsb3NlX3RvID09IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGd0eG5zIEFzc2V0Q2xvc2VUbwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjUtNDY3CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGN0cmxfYXNhX29wdF9pbi5hc3NldF9jbG9zZV90byA9PSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICAvLyApLCBlcnIuT1BUX0lOX1dST05HX0NMT1NFX1RPCiAgICBhc3NlcnQgLy8gRm9yYmlkZGVuIENsb3NlIE91dCBvbiBPcHQgSW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDY4CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlci5pc19vcHRlZF9pbigKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDY4LTQ3MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuaXNfb3B0ZWRfaW4oCiAgICAvLyAgICAgYXNzZXQKICAgIC8vICksIGVyci5NSVNTSU5HX0NUUkxfQVNBICAjIFBlZGFudDogY3RybF9hc2Ffb3B0X2luIGlzIGNoZWNrZWQgcHJvcGVybHkKICAgIHN3YXAKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWlzc2luZyBDb250cm9sbGVkIEFTQQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NzUKICAgIC8vIFR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwMzgKICAgIC8vIHJldHVybiBzZWxmLmRlZmF1bHRfZnJvemVuCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gImRlZmF1bHRfZnJvemVuIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlZmF1bHRfZnJvemVuIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NzYtNDc4CiAgICAvLyAjIFByZXZlbnQgY2xvc2Utb3V0IGNpcmN1bXZlbnRpbmcgYWNjb3VudCBmcm96ZW4gc3RhdGUKICAgIC8vIGFzc2V0X2Zyb3plbj1zZWxmLmNvbmZpZ19kZWZhdWx0X2Zyb3plbihhc3NldC5pZCkKICAgIC8vIG9yIGFzc2V0LmJhbGFuY2UoVHhuLnNlbmRlcikgPiAwLAogICAgYm56IGFzc2V0X29wdF9pbl9ib29sX3RydWVAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NzgKICAgIC8vIG9yIGFzc2V0LmJhbGFuY2UoVHhuLnNlbmRlcikgPiAwLAogICAgdHhuIFNlbmRlcgogICAgZGlnIDIKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgb3B0ZWQgaW50byBhc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NzYtNDc4CiAgICAvLyAjIFByZXZlbnQgY2xvc2Utb3V0IGNpcmN1bXZlbnRpbmcgYWNjb3VudCBmcm96ZW4gc3RhdGUKICAgIC8vIGFzc2V0X2Zyb3plbj1zZWxmLmNvbmZpZ19kZWZhdWx0X2Zyb3plbihhc3NldC5pZCkKICAgIC8vIG9yIGFzc2V0LmJhbGFuY2UoVHhuLnNlbmRlcikgPiAwLAogICAgYnogYXNzZXRfb3B0X2luX2Jvb2xfZmFsc2VANAoKYXNzZXRfb3B0X2luX2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18xIC8vIDEKCmFzc2V0X29wdF9pbl9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk4Ny05ODgKICAgIC8vICMgTG9jYWwgU3RhdGUgSW5pdAogICAgLy8gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9IGFzc2V0X2lkCiAgICBkaWcgMQogICAgZHVwCiAgICBieXRlY18xIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGRpZyA1CiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk4OQogICAgLy8gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XSA9IGFzc2V0X2Zyb3plbgogICAgYnl0ZWNfMyAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICB1bmNvdmVyIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDgxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgphc3NldF9vcHRfaW5fYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgYXNzZXRfb3B0X2luX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmFzc2V0X2NvbmZpZ1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X2NvbmZpZzoKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDk1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciAzCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciAzCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciAzCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTEKICAgIGR1cAogICAgY292ZXIgMwogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTIKICAgIGR1cAogICAgY292ZXIgMwogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MzAKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGFzc2V0X2lkKQogICAgc3dhcAogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTMxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19tYW5hZ2VyX2FkZHIoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNDIKICAgIC8vIHJldHVybiBzZWxmLm1hbmFnZXJfYWRkcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gIm1hbmFnZXJfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYW5hZ2VyX2FkZHIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUzMS01MzMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX21hbmFnZXJfYWRkcigKICAgIC8vICAgICBhc3NldF9pZAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRF9NQU5BR0VSCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNDYKICAgIC8vIHJldHVybiBzZWxmLnJlc2VydmVfYWRkcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInJlc2VydmVfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDMKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlc2VydmVfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTM1CiAgICAvLyBpZiByZXNlcnZlX2FkZHIgIT0gY3VycmVudF9yZXNlcnZlX2FkZHI6CiAgICAhPQogICAgYnogYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MzYKICAgIC8vIGFzc2VydCBjdXJyZW50X3Jlc2VydmVfYWRkciAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCBlcnIuRElTQUJMRURfUkVTRVJWRQogICAgZHVwCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gUmVzZXJ2ZSBBZGRyZXNzIGhhcyBiZWVuIGRlbGV0ZWQKCmFzc2V0X2NvbmZpZ19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNTAKICAgIC8vIHJldHVybiBzZWxmLmZyZWV6ZV9hZGRyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiZnJlZXplX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDE5CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mcmVlemVfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTM4CiAgICAvLyBpZiBmcmVlemVfYWRkciAhPSBjdXJyZW50X2ZyZWV6ZV9hZGRyOgogICAgZGlnIDMKICAgICE9CiAgICBieiBhc3NldF9jb25maWdfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gYXNzZXJ0IGN1cnJlbnRfZnJlZXplX2FkZHIgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgZXJyLkRJU0FCTEVEX0ZSRUVaRQogICAgZGlnIDE2CiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gRnJlZXplIEFkZHJlc3MgaGFzIGJlZW4gZGVsZXRlZAoKYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA1NAogICAgLy8gcmV0dXJuIHNlbGYuY2xhd2JhY2tfYWRkcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDIwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jbGF3YmFja19hZGRyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NDEKICAgIC8vIGlmIGNsYXdiYWNrX2FkZHIgIT0gY3VycmVudF9jbGF3YmFja19hZGRyOgogICAgZGlnIDIKICAgICE9CiAgICBieiBhc3NldF9jb25maWdfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU0MgogICAgLy8gYXNzZXJ0IGN1cnJlbnRfY2xhd2JhY2tfYWRkciAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCBlcnIuRElTQUJMRURfQ0xBV0JBQ0sKICAgIGRpZyAxNwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIENsYXdiYWNrIEFkZHJlc3MgaGFzIGJlZW4gZGVsZXRlZAoKYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQzCiAgICAvLyBhc3NlcnQgdG90YWwgPj0gc2VsZi5jaXJjdWxhdGluZ19zdXBwbHkoY29uZmlnX2Fzc2V0KSwgZXJyLklOVkFMSURfVE9UQUwKICAgIGRpZyAxNQogICAgZHVwCiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgaXRvYgogICAgZGlnIDE2CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYj49CiAgICBhc3NlcnQgLy8gSW52YWxpZCBUb3RhbCwgbXVzdCBiZSA+PSBjaXJjdWxhdGluZyBzdXBwbHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQ1LTU1OAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBhc3NldF9jb25maWcgPSBBc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD10b3RhbCwKICAgIC8vICAgICBkZWNpbWFscz1kZWNpbWFscywKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1kZWZhdWx0X2Zyb3plbiwKICAgIC8vICAgICB1bml0X25hbWU9dW5pdF9uYW1lLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICB1cmw9dXJsLAogICAgLy8gICAgIG1ldGFkYXRhX2hhc2g9bWV0YWRhdGFfaGFzaC5jb3B5KCksCiAgICAvLyAgICAgbWFuYWdlcl9hZGRyPW1hbmFnZXJfYWRkciwKICAgIC8vICAgICByZXNlcnZlX2FkZHI9cmVzZXJ2ZV9hZGRyLAogICAgLy8gICAgIGZyZWV6ZV9hZGRyPWZyZWV6ZV9hZGRyLAogICAgLy8gICAgIGNsYXdiYWNrX2FkZHI9Y2xhd2JhY2tfYWRkciwKICAgIC8vICkKICAgIGRpZyAxNQogICAgY29uY2F0CiAgICBkaWcgMTQKICAgIGNvbmNhdAogICAgYnl0ZWMgMTkgLy8gMHgwMDk1CiAgICBjb25jYXQKICAgIGludGMgNCAvLyAxNDkKICAgIGRpZyAxMwogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGRpZyAxMQogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGRpZyA5CiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICBkaWcgNgogICAgY29uY2F0CiAgICBkaWcgNQogICAgY29uY2F0CiAgICBkaWcgNAogICAgY29uY2F0CiAgICBkaWcgMwogICAgY29uY2F0CiAgICBkaWcgMTMKICAgIGNvbmNhdAogICAgZGlnIDExCiAgICBjb25jYXQKICAgIGRpZyA5CiAgICBjb25jYXQKICAgIGRpZyA3CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTU5CiAgICAvLyBzZWxmLnN0b3JlX2Fzc2V0X2NvbmZpZyhhc3NldF9pZCwgYXNzZXRfY29uZmlnKQogICAgY2FsbHN1YiBzdG9yZV9hc3NldF9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTYwCiAgICAvLyBhcmM0LmVtaXQoYXNzZXRfY29uZmlnKQogICAgcHVzaGJ5dGVzIDB4ZTEwYzVhNDcgLy8gbWV0aG9kICJBc3NldENvbmZpZyh1aW50NjQsdWludDMyLGJvb2wsc3RyaW5nLHN0cmluZyxzdHJpbmcsYnl0ZVtdLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDk1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF90cmFuc2Zlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X3RyYW5zZmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTc5LTU4MAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyh4ZmVyX2Fzc2V0LmlkKQogICAgZGlnIDMKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU4NQogICAgLy8gYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTgxLTU4NgogICAgLy8gc2VsZi5hc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBhc3NldF9pZD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDMKICAgIGRpZyAzCiAgICBkaWcgMwogICAgY2FsbHN1YiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1ODgtNTk0CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHNlbGYuaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDEKICAgIGRpZyA0CiAgICBkaWcgNAogICAgY2FsbHN1YiBpbm5lcl9hc3NldF90cmFuc2ZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1OTUtNjAwCiAgICAvLyBzZWxmLmVtaXRfdHJhbnNmZXJfZXZlbnQoCiAgICAvLyAgICAgYXNzZXRfaWQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gKQogICAgY2FsbHN1YiBlbWl0X3RyYW5zZmVyX2V2ZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU2MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXRfdHJhbnNmZXJfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF90cmFuc2Zlcl9iYXRjaDoKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjAyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGR1cAogICAgcHVzaGludCA3MiAvLyA3MgogICAgKgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmF2bV90eXBlcy5UcmFuc2ZlckxlZz4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjEzLTYxNAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyh4ZmVyX2Fzc2V0LmlkKQogICAgc3dhcAogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjE1CiAgICAvLyBhc3NlcnQgbGVncy5sZW5ndGgsIGVyci5FTVBUWV9CQVRDSAogICAgZHVwCiAgICBhc3NlcnQgLy8gRW1wdHkgdHJhbnNmZXIgYmF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjE2CiAgICAvLyBhc3NlcnQgbGVncy5sZW5ndGggPD0gY2ZnLk1BWF9CQVRDSF9MRUdTLCBlcnIuT1ZFUlNJWkVEX0JBVENICiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIFRyYW5zZmVyIGJhdGNoIGV4Y2VlZHMgbWF4IGlubmVyIGdyb3VwIHNpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjE4LTYxOQogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBtaW50ZWQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyMAogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UobGVncy5sZW5ndGgpOgogICAgZHVwCgphc3NldF90cmFuc2Zlcl9iYXRjaF9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyMAogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UobGVncy5sZW5ndGgpOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogYXNzZXRfdHJhbnNmZXJfYmF0Y2hfYWZ0ZXJfZm9yQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyMS02MjIKICAgIC8vIGxlZyA9IGxlZ3NbaWR4XS5jb3B5KCkKICAgIC8vIGFzc2V0X3NlbmRlciA9IGxlZy5hc3NldF9zZW5kZXIubmF0aXZlCiAgICBkaWcgMwogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBwdXNoaW50IDcyIC8vIDcyCiAgICAqCiAgICBwdXNoaW50IDcyIC8vIDcyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MjMKICAgIC8vIGFzc2V0X3JlY2VpdmVyID0gbGVnLmFzc2V0X3JlY2VpdmVyLm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDMyIDMyCiAgICBidXJ5IDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyNAogICAgLy8gYXNzZXRfYW1vdW50ID0gbGVnLmFzc2V0X2Ftb3VudC5uYXRpdmUKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBidXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjI1CiAgICAvLyBpZiBhc3NldF9zZW5kZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzczoKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYnogYXNzZXRfdHJhbnNmZXJfYmF0Y2hfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjI2LTYyNwogICAgLy8gIyBJbm5lciB0cmFuc2ZlcnMgYXJlIHN1Ym1pdHRlZCBhZnRlciB0aGUgbG9vcCwgc28gb3Zlci1taW50aW5nIGlzIGNoZWNrZWQgYWdhaW5zdCB0aGUgYmF0Y2ggdG90YWwuCiAgICAvLyBtaW50ZWQgKz0gYXNzZXRfYW1vdW50CiAgICBkaWcgMQogICAgZGlnIDYKICAgICsKICAgIGR1cAogICAgYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyOC02MzMKICAgIC8vIHNlbGYuYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoCiAgICAvLyAgICAgYXNzZXRfaWQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1taW50ZWQsCiAgICAvLyApCiAgICBkaWcgNQogICAgZGlnIDgKICAgIGRpZyAxMAogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zCgphc3NldF90cmFuc2Zlcl9iYXRjaF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY0MgogICAgLy8gaWYgaWR4OgogICAgZHVwCiAgICBieiBhc3NldF90cmFuc2Zlcl9iYXRjaF9lbHNlX2JvZHlAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NDMKICAgIC8vIG9wLklUeG5DcmVhdGUubmV4dCgpCiAgICBpdHhuX25leHQKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjQ2CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF90eXBlX2VudW0oVHJhbnNhY3Rpb25UeXBlLkFzc2V0VHJhbnNmZXIpCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjQ3CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9mZWUoMCkKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NDgKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3hmZXJfYXNzZXQoeGZlcl9hc3NldCkKICAgIGRpZyA0CiAgICBkdXAKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY0OQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfYXNzZXRfYW1vdW50KGFzc2V0X2Ftb3VudCkKICAgIGRpZyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjUwCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9zZW5kZXIoYXNzZXRfc2VuZGVyKQogICAgZGlnIDgKICAgIGR1cAogICAgaXR4bl9maWVsZCBBc3NldFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NTEKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X3JlY2VpdmVyKGFzc2V0X3JlY2VpdmVyKQogICAgZGlnIDEwCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NTItNjU3CiAgICAvLyBzZWxmLmVtaXRfdHJhbnNmZXJfZXZlbnQoCiAgICAvLyAgICAgYXNzZXRfaWQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgZW1pdF90cmFuc2Zlcl9ldmVudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MjAKICAgIC8vIGZvciBpZHggaW4gdXJhbmdlKGxlZ3MubGVuZ3RoKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBhc3NldF90cmFuc2Zlcl9iYXRjaF9mb3JfaGVhZGVyQDIKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2Vsc2VfYm9keUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NDUKICAgIC8vIG9wLklUeG5DcmVhdGUuYmVnaW4oKQogICAgaXR4bl9iZWdpbgogICAgYiBhc3NldF90cmFuc2Zlcl9iYXRjaF9hZnRlcl9pZl9lbHNlQDkKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MzUtNjQwCiAgICAvLyBzZWxmLmFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zKAogICAgLy8gICAgIGFzc2V0X2lkPXhmZXJfYXNzZXQuaWQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YXNzZXRfYW1vdW50LAogICAgLy8gKQogICAgZGlnIDQKICAgIGRpZyA3CiAgICBkaWcgOQogICAgZGlnIDgKICAgIGNhbGxzdWIgYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMKICAgIGIgYXNzZXRfdHJhbnNmZXJfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA2Cgphc3NldF90cmFuc2Zlcl9iYXRjaF9hZnRlcl9mb3JAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY1OAogICAgLy8gb3AuSVR4bkNyZWF0ZS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjAyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF90cmFuc2Zlcl93aXRoX3Byb29mW3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfdHJhbnNmZXJfd2l0aF9wcm9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjYwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjgxLTY4MgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyh4ZmVyX2Fzc2V0LmlkKQogICAgZGlnIDUKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY4MwogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX2FsbG93bGlzdCh4ZmVyX2Fzc2V0LmlkKSwgZXJyLk1JU1NJTkdfQUxMT1dMSVNUCiAgICBkaWcgNQogICAgY2FsbHN1YiBoYXNfYWxsb3dsaXN0CiAgICBhc3NlcnQgLy8gVHJhbnNmZXIgYWxsb3dsaXN0IGlzIG5vdCBzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Njg0LTY4OAogICAgLy8gc2VsZi5hc3NlcnRfcmVndWxhcl90cmFuc2Zlcl9wcmVjb25kaXRpb25zKAogICAgLy8gICAgIGFzc2V0X2lkPXhmZXJfYXNzZXQuaWQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICkKICAgIGRpZyA1CiAgICBkaWcgNAogICAgZGlnIDQKICAgIGNhbGxzdWIgYXNzZXJ0X3JlZ3VsYXJfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2ODktNjkxCiAgICAvLyBhc3NlcnQgc2VsZi5pc19hbGxvd2xpc3RlZCgKICAgIC8vICAgICB4ZmVyX2Fzc2V0LmlkLCBhc3NldF9zZW5kZXIsIHNlbmRlcl9wcm9vZgogICAgLy8gKSwgZXJyLlNFTkRFUl9OT1RfQUxMT1dMSVNURUQKICAgIGRpZyA1CiAgICBkaWcgNAogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGlzX2FsbG93bGlzdGVkCiAgICBwb3AKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBub3QgYWxsb3dsaXN0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjkyLTY5NAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfYWxsb3dsaXN0ZWQoCiAgICAvLyAgICAgeGZlcl9hc3NldC5pZCwgYXNzZXRfcmVjZWl2ZXIsIHJlY2VpdmVyX3Byb29mCiAgICAvLyApLCBlcnIuUkVDRUlWRVJfTk9UX0FMTE9XTElTVEVECiAgICBkaWcgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBpc19hbGxvd2xpc3RlZAogICAgcG9wCiAgICBhc3NlcnQgLy8gUmVjZWl2ZXIgYWNjb3VudCBpcyBub3QgYWxsb3dsaXN0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Njk5CiAgICAvLyBhc3NldF9hbW91bnQ9YXNzZXRfYW1vdW50Lm5hdGl2ZSwKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2OTYtNzAyCiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHNlbGYuaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGlubmVyX2Fzc2V0X3RyYW5zZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY2MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXRfZnJlZXplW3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfZnJlZXplOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MDQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzEzLTcxNAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBzd2FwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MTUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2ZyZWV6ZV9hZGRyKAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDUwCiAgICAvLyByZXR1cm4gc2VsZi5mcmVlemVfYWRkcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImZyZWV6ZV9hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZyZWV6ZV9hZGRyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MTUtNzE3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19mcmVlemVfYWRkcigKICAgIC8vICAgICBmcmVlemVfYXNzZXQuaWQKICAgIC8vICksIGVyci5VTkFVVEhPUklaRURfRlJFRVpFCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBGcmVlemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzE5LTcyMAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBzZWxmLnN0b3JlX2dsb2JhbF9mcm96ZW4oZnJlZXplX2Fzc2V0LmlkLCBhc3NldF9mcm96ZW49YXNzZXRfZnJvemVuLm5hdGl2ZSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NTIKICAgIC8vIHNlbGYuZ2xvYmFsX2Zyb3plbiA9IGFzc2V0X2Zyb3plbgogICAgYnl0ZWMgNSAvLyAiZ2xvYmFsX2Zyb3plbiIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcyMQogICAgLy8gYXJjNC5lbWl0KEFzc2V0RnJlZXplKGFzc2V0X2Zyb3plbj1hc3NldF9mcm96ZW4pKQogICAgcHVzaGJ5dGVzIDB4NjI5OTY0NmEgLy8gbWV0aG9kICJBc3NldEZyZWV6ZShib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYWNjb3VudF9mcmVlemVbcm91dGluZ10oKSAtPiB2b2lkOgphY2NvdW50X2ZyZWV6ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzM1LTczNgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBkaWcgMgogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgdW5jb3ZlciAzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MzcKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihmcmVlemVfYXNzZXQuaWQsIGZyZWV6ZV9hY2NvdW50KSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjczOAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfZnJlZXplX2FkZHIoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNTAKICAgIC8vIHJldHVybiBzZWxmLmZyZWV6ZV9hZGRyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiZnJlZXplX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnJlZXplX2FkZHIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjczOC03NDAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2ZyZWV6ZV9hZGRyKAogICAgLy8gICAgIGZyZWV6ZV9hc3NldC5pZAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRF9GUkVFWkUKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIEZyZWV6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NDQKICAgIC8vIGZyZWV6ZV9hc3NldC5pZCwgZnJlZXplX2FjY291bnQsIGFzc2V0X2Zyb3plbj1hc3NldF9mcm96ZW4ubmF0aXZlCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTgxCiAgICAvLyBzZWxmLmFjY291bnRfZnJvemVuW2FjY291bnRdID0gYXNzZXRfZnJvemVuCiAgICBkaWcgMgogICAgYnl0ZWNfMyAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICB1bmNvdmVyIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzQ3LTc0OQogICAgLy8gQWNjb3VudEZyZWV6ZSgKICAgIC8vICAgICBmcmVlemVfYWNjb3VudD1hcmM0LkFkZHJlc3MoZnJlZXplX2FjY291bnQpLCBhc3NldF9mcm96ZW49YXNzZXRfZnJvemVuCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzQ2LTc1MAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEFjY291bnRGcmVlemUoCiAgICAvLyAgICAgICAgIGZyZWV6ZV9hY2NvdW50PWFyYzQuQWRkcmVzcyhmcmVlemVfYWNjb3VudCksIGFzc2V0X2Zyb3plbj1hc3NldF9mcm96ZW4KICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhlZjhiNjZkOSAvLyBtZXRob2QgIkFjY291bnRGcmVlemUoYWRkcmVzcyxib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcyMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2Uuc2V0X3RyYW5zZmVyX2FsbG93bGlzdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF90cmFuc2Zlcl9hbGxvd2xpc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc1MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NjEtNzYyCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGZyZWV6ZV9hc3NldC5pZCkKICAgIHN3YXAKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc2MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfZnJlZXplX2FkZHIoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNTAKICAgIC8vIHJldHVybiBzZWxmLmZyZWV6ZV9hZGRyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiZnJlZXplX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnJlZXplX2FkZHIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc2My03NjUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2ZyZWV6ZV9hZGRyKAogICAgLy8gICAgIGZyZWV6ZV9hc3NldC5pZAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRF9GUkVFWkUKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIEZyZWV6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NjQKICAgIC8vIGlmIGFsbG93bGlzdF9yb290ID09IEdsb2JhbC56ZXJvX2FkZHJlc3MuYnl0ZXM6CiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBieiBzZXRfdHJhbnNmZXJfYWxsb3dsaXN0X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk2NQogICAgLy8gc2VsZi5hbGxvd2xpc3Rfcm9vdCA9IEJ5dGVzKCkKICAgIGJ5dGVjIDggLy8gImFsbG93bGlzdF9yb290IgogICAgYnl0ZWNfMCAvLyAweAogICAgYXBwX2dsb2JhbF9wdXQKCnNldF90cmFuc2Zlcl9hbGxvd2xpc3RfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKc2V0X3RyYW5zZmVyX2FsbG93bGlzdF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTY3CiAgICAvLyBzZWxmLmFsbG93bGlzdF9yb290ID0gYWxsb3dsaXN0X3Jvb3QKICAgIGJ5dGVjIDggLy8gImFsbG93bGlzdF9yb290IgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIHNldF90cmFuc2Zlcl9hbGxvd2xpc3RfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXRfY2xvc2Vfb3V0W3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfY2xvc2Vfb3V0OgogICAgYnl0ZWNfMCAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MDEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiQ2xvc2VPdXQiXSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgxMAogICAgLy8gYXNzZXJ0IFR4bi5vbl9jb21wbGV0aW9uID09IE9uQ29tcGxldGVBY3Rpb24uQ2xvc2VPdXQsIGVyci5XUk9OR19PTl9DT01QTEVURQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCAyIC8vIENsb3NlT3V0CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE9uIENvbXBsZXRlIEFjdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMDcKICAgIC8vIGFzYV9jbG9zZV9vdXRfcmVsYXRpdmVfaWR4ID0gVHhuLmdyb3VwX2luZGV4ICsgMQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwOAogICAgLy8gYXNhX2Nsb3NlX291dF90eG4gPSBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbihhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeCkKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwOQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfaG9sZGVyKGNsb3NlX2Fzc2V0LmlkLCBUeG4uc2VuZGVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBkaWcgMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzA5CiAgICAvLyBhc3NlcnQgc2VsZi5pc19ob2xkZXIoY2xvc2VfYXNzZXQuaWQsIFR4bi5zZW5kZXIpLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzExCiAgICAvLyBHbG9iYWwuZ3JvdXBfc2l6ZSA+IGFzYV9jbG9zZV9vdXRfcmVsYXRpdmVfaWR4CiAgICBnbG9iYWwgR3JvdXBTaXplCiAgICBkaWcgMQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMTAtMzEyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5ncm91cF9zaXplID4gYXNhX2Nsb3NlX291dF9yZWxhdGl2ZV9pZHgKICAgIC8vICksIGVyci5JTlZBTElEX0NMT1NFX09VVF9HUk9VUF9TSVpFCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDbG9zZSBPdXQgZ3JvdXAgc2l6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMTcKICAgIC8vIGFzYV9jbG9zZV9vdXRfdHhuLnhmZXJfYXNzZXQuaWQgPT0gY2xvc2VfYXNzZXQuaWQKICAgIGR1cAogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBkaWcgMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzE2LTMxOAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBhc2FfY2xvc2Vfb3V0X3R4bi54ZmVyX2Fzc2V0LmlkID09IGNsb3NlX2Fzc2V0LmlkCiAgICAvLyApLCBlcnIuQ0xPU0VfT1VUX1dST05HX0FTQQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBDbG9zZSBPdXQgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzE5CiAgICAvLyBhc3NlcnQgYXNhX2Nsb3NlX291dF90eG4uc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5DTE9TRV9PVVRfV1JPTkdfU0VOREVSCiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgQ2xvc2UgT3V0IFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMjAKICAgIC8vIGFzc2VydCBhc2FfY2xvc2Vfb3V0X3R4bi5hc3NldF9hbW91bnQgPT0gVUludDY0KDApLCBlcnIuQ0xPU0VfT1VUX1dST05HX0FNT1VOVAogICAgZHVwCiAgICBndHhucyBBc3NldEFtb3VudAogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBDbG9zZSBPdXQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMyMgogICAgLy8gYXNhX2Nsb3NlX291dF90eG4uYXNzZXRfY2xvc2VfdG8gIT0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgZ3R4bnMgQXNzZXRDbG9zZVRvCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMyMS0zMjMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYXNhX2Nsb3NlX291dF90eG4uYXNzZXRfY2xvc2VfdG8gIT0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgLy8gKSwgZXJyLkNMT1NFX09VVF9XUk9OR19DTE9TRV9UTwogICAgYXNzZXJ0IC8vIFdyb25nIENsb3NlIE91dCBvbiBDbG9zZSBPdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzc0CiAgICAvLyAoY3JlYXRvciwgZXhpc3RzKSA9IG9wLkFzc2V0UGFyYW1zR2V0LmFzc2V0X2NyZWF0b3IoY2xvc2VfYXNzZXQuaWQpCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0Q3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NzUKICAgIC8vIGlmIGV4aXN0czogICMgU21hcnQgQVNBIGhhcyBub3QgYmVlbiBkZXN0cm95ZWQKICAgIGJ6IGFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzI5CiAgICAvLyBhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeCA9IFR4bi5ncm91cF9pbmRleCArIDEKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMzAKICAgIC8vIGFzYV9jbG9zZV9vdXRfdHhuID0gZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24oYXNhX2Nsb3NlX291dF9yZWxhdGl2ZV9pZHgpCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMzIKICAgIC8vIGFzYV9jbG9zZV9vdXRfdHhuLmFzc2V0X2Nsb3NlX3RvID09IGFzc2V0X2NyZWF0b3IKICAgIGd0eG5zIEFzc2V0Q2xvc2VUbwogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzMxLTMzMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBhc2FfY2xvc2Vfb3V0X3R4bi5hc3NldF9jbG9zZV90byA9PSBhc3NldF9jcmVhdG9yCiAgICAvLyApLCBlcnIuQ0xPU0VfT1VUX1dST05HX0NMT1NFX1RPCiAgICBhc3NlcnQgLy8gV3JvbmcgQ2xvc2UgT3V0IG9uIENsb3NlIE91dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMzQKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGNsb3NlX2Fzc2V0LmlkKQogICAgZGlnIDMKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc3OAogICAgLy8gY2xvc2VfdG8gIT0gY3JlYXRvcgogICAgZGlnIDIKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc3Ny03NzkKICAgIC8vIGlmICgKICAgIC8vICAgICBjbG9zZV90byAhPSBjcmVhdG9yCiAgICAvLyApOiAgIyBJZiBjbG9zZS1vdXQgdGFyZ2V0IGlzIG5vdCB0aGUgQ3JlYXRvciwgdGhlbiBjbG9zZS1vdXQgdGFyZ2V0IE1VU1QgYmUgb3B0ZWQtaW4KICAgIGJ6IGFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgZGlnIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBkaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3ODAKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihjbG9zZV9hc3NldC5pZCwgY2xvc2VfdG8pLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzQwLTM0MQogICAgLy8gIyBBIGNsb3NlIG91dCBjYXJyaWVzIG5vIGFsbG93bGlzdCBwcm9vZnMsIHRoZSByZW1haW5kZXIgcmV0dXJucyB0byB0aGUgQ3JlYXRvci4KICAgIC8vIGFzc2VydCBub3Qgc2VsZi5oYXNfYWxsb3dsaXN0KGNsb3NlX2Fzc2V0LmlkKSwgZXJyLkFMTE9XTElTVF9DTE9TRV9PVVQKICAgIGNhbGxzdWIgaGFzX2FsbG93bGlzdAogICAgIQogICAgYXNzZXJ0IC8vIFRyYW5zZmVyIGFsbG93bGlzdCBpcyBzZXQsIGNsb3NlIG91dCB0byB0aGUgQ3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NDgKICAgIC8vIHJldHVybiBzZWxmLmdsb2JhbF9mcm96ZW4KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJnbG9iYWxfZnJvemVuIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdsb2JhbF9mcm96ZW4gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0MgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2dsb2JhbF9mcm96ZW4oY2xvc2VfYXNzZXQuaWQpLCBlcnIuR0xPQkFMX0ZST1pFTgogICAgIQogICAgYXNzZXJ0IC8vIFNtYXJ0IEFTQSBpcyBnbG9iYWwgZnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGNsb3NlX2Fzc2V0LmlkLCBUeG4uc2VuZGVyKSwgZXJyLlNFTkRFUl9GUk9aRU4KICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTc1CiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFjY291bnRfZnJvemVuIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9mcm96ZW4gZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGNsb3NlX2Fzc2V0LmlkLCBUeG4uc2VuZGVyKSwgZXJyLlNFTkRFUl9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTc1CiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFjY291bnRfZnJvemVuIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9mcm96ZW4gZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0NAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGNsb3NlX2Fzc2V0LmlkLCBjbG9zZV90byksIGVyci5DTE9TRV9UT19GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBDbG9zZSB0byBhY2NvdW50IGlzIGZyb3plbgoKYXNzZXRfY2xvc2Vfb3V0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzgzLTc4NAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBhc3NldF9hbW91bnQgPSBjbG9zZV9hc3NldC5iYWxhbmNlKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSA3CiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc4OAogICAgLy8gYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc4NS03OTAKICAgIC8vIHNlbGYuaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1jbG9zZV9hc3NldCwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YXNzZXRfYW1vdW50LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWNsb3NlX3RvLAogICAgLy8gKQogICAgZGlnIDQKICAgIGR1cAogICAgY292ZXIgNAogICAgY2FsbHN1YiBpbm5lcl9hc3NldF90cmFuc2ZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3OTEKICAgIC8vIGlmIGNsb3NlX3RvID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGJ6IGFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzk1CiAgICAvLyBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3OTYKICAgIC8vIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgZGlnIDQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzk0LTc5NwogICAgLy8gQnVybigKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc5Mi03OTgKICAgIC8vICMgUmVtYWluZGVyIGNsb3NlZCB0byB0aGUgQ3JlYXRvciBsZWF2ZXMgdGhlIGNpcmN1bGF0aW5nIHN1cHBseS4KICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBCdXJuKAogICAgLy8gICAgICAgICBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhc3NldF9hbW91bnQ9YXJjNC5VSW50NjQoYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBieXRlYyAyMCAvLyBtZXRob2QgIkJ1cm4oYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKCmFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgwMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJDbG9zZU91dCJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmFzc2V0X2Rlc3Ryb3lbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9kZXN0cm95OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MjEtODIyCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGRlc3Ryb3lfYXNzZXQuaWQpCiAgICBkdXAKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgyMwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfbWFuYWdlcl9hZGRyKAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDQyCiAgICAvLyByZXR1cm4gc2VsZi5tYW5hZ2VyX2FkZHIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJtYW5hZ2VyX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFuYWdlcl9hZGRyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MjMtODI1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19tYW5hZ2VyX2FkZHIoCiAgICAvLyAgICAgZGVzdHJveV9hc3NldC5pZAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRF9NQU5BR0VSCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM4Ni0zOTAKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PWRlc3Ryb3lfYXNzZXQsCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgaXR4bl9maWVsZCBTZW5kZXIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzg2CiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzg3CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozODYtMzkwCiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gICAgIGNvbmZpZ19hc3NldD1kZXN0cm95X2Fzc2V0LAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA4OAogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlYyA5IC8vICJ0b3RhbCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDg5CiAgICAvLyBzZWxmLmRlY2ltYWxzID0gVUludDY0KCkKICAgIGJ5dGVjIDE0IC8vICJkZWNpbWFscyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDkwCiAgICAvLyBzZWxmLmRlZmF1bHRfZnJvemVuID0gRmFsc2UKICAgIGJ5dGVjIDEwIC8vICJkZWZhdWx0X2Zyb3plbiIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDkxCiAgICAvLyBzZWxmLnVuaXRfbmFtZSA9IFN0cmluZygpCiAgICBieXRlYyAxNSAvLyAidW5pdF9uYW1lIgogICAgYnl0ZWNfMCAvLyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA5MgogICAgLy8gc2VsZi5uYW1lID0gU3RyaW5nKCkKICAgIGJ5dGVjIDE2IC8vICJuYW1lIgogICAgYnl0ZWNfMCAvLyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA5MwogICAgLy8gc2VsZi51cmwgPSBTdHJpbmcoKQogICAgYnl0ZWMgMTcgLy8gInVybCIKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwOTQKICAgIC8vIHNlbGYubWV0YWRhdGFfaGFzaCA9IEJ5dGVzKCkKICAgIGJ5dGVjIDE4IC8vICJtZXRhZGF0YV9oYXNoIgogICAgYnl0ZWNfMCAvLyAweAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA5NQogICAgLy8gc2VsZi5tYW5hZ2VyX2FkZHIgPSBBY2NvdW50KCkKICAgIGJ5dGVjIDcgLy8gIm1hbmFnZXJfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA5NgogICAgLy8gc2VsZi5yZXNlcnZlX2FkZHIgPSBBY2NvdW50KCkKICAgIGJ5dGVjIDYgLy8gInJlc2VydmVfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA5NwogICAgLy8gc2VsZi5mcmVlemVfYWRkciA9IEFjY291bnQoKQogICAgYnl0ZWMgNCAvLyAiZnJlZXplX2FkZHIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwOTgKICAgIC8vIHNlbGYuY2xhd2JhY2tfYWRkciA9IEFjY291bnQoKQogICAgYnl0ZWNfMiAvLyAiY2xhd2JhY2tfYWRkciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTQyCiAgICAvLyBzZWxmLnNtYXJ0X2FzYV9pZCA9IFVJbnQ2NCgpCiAgICBieXRlYyAxMSAvLyAic21hcnRfYXNhX2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk0MwogICAgLy8gc2VsZi5nbG9iYWxfZnJvemVuID0gRmFsc2UKICAgIGJ5dGVjIDUgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTQ0CiAgICAvLyBzZWxmLmFsbG93bGlzdF9yb290ID0gQnl0ZXMoKQogICAgYnl0ZWMgOCAvLyAiYWxsb3dsaXN0X3Jvb3QiCiAgICBieXRlY18wIC8vIDB4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmdldF9hc3NldF9jb25maWdbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXNzZXRfY29uZmlnOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NDItODQzCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGFzc2V0LmlkKQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA1OQogICAgLy8gdG90YWw9YXJjNC5VSW50NjQoc2VsZi50b3RhbCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAidG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNjAKICAgIC8vIGRlY2ltYWxzPWFyYzQuVUludDMyKHNlbGYuZGVjaW1hbHMpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJkZWNpbWFscyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWNpbWFscyBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNjEKICAgIC8vIGRlZmF1bHRfZnJvemVuPWFyYzQuQm9vbChzZWxmLmRlZmF1bHRfZnJvemVuKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAiZGVmYXVsdF9mcm96ZW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVmYXVsdF9mcm96ZW4gZXhpc3RzCiAgICBieXRlYyAxMyAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA2MgogICAgLy8gdW5pdF9uYW1lPWFyYzQuU3RyaW5nKHNlbGYudW5pdF9uYW1lKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAidW5pdF9uYW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVuaXRfbmFtZSBleGlzdHMKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNjMKICAgIC8vIG5hbWU9YXJjNC5TdHJpbmcoc2VsZi5uYW1lKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAibmFtZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5uYW1lIGV4aXN0cwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA2NAogICAgLy8gdXJsPWFyYzQuU3RyaW5nKHNlbGYudXJsKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNyAvLyAidXJsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVybCBleGlzdHMKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNjUKICAgIC8vIG1ldGFkYXRhX2hhc2g9YXJjNC5EeW5hbWljQnl0ZXMoc2VsZi5tZXRhZGF0YV9oYXNoKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOCAvLyAibWV0YWRhdGFfaGFzaCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tZXRhZGF0YV9oYXNoIGV4aXN0cwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA2NgogICAgLy8gbWFuYWdlcl9hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLm1hbmFnZXJfYWRkciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAibWFuYWdlcl9hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hbmFnZXJfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA2NwogICAgLy8gcmVzZXJ2ZV9hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLnJlc2VydmVfYWRkciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAicmVzZXJ2ZV9hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlc2VydmVfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA2OAogICAgLy8gZnJlZXplX2FkZHI9YXJjNC5BZGRyZXNzKHNlbGYuZnJlZXplX2FkZHIpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImZyZWV6ZV9hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZyZWV6ZV9hZGRyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDY5CiAgICAvLyBjbGF3YmFja19hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLmNsYXdiYWNrX2FkZHIpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhd2JhY2tfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA1OC0xMDcwCiAgICAvLyByZXR1cm4gQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9YXJjNC5VSW50NjQoc2VsZi50b3RhbCksCiAgICAvLyAgICAgZGVjaW1hbHM9YXJjNC5VSW50MzIoc2VsZi5kZWNpbWFscyksCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49YXJjNC5Cb29sKHNlbGYuZGVmYXVsdF9mcm96ZW4pLAogICAgLy8gICAgIHVuaXRfbmFtZT1hcmM0LlN0cmluZyhzZWxmLnVuaXRfbmFtZSksCiAgICAvLyAgICAgbmFtZT1hcmM0LlN0cmluZyhzZWxmLm5hbWUpLAogICAgLy8gICAgIHVybD1hcmM0LlN0cmluZyhzZWxmLnVybCksCiAgICAvLyAgICAgbWV0YWRhdGFfaGFzaD1hcmM0LkR5bmFtaWNCeXRlcyhzZWxmLm1ldGFkYXRhX2hhc2gpLAogICAgLy8gICAgIG1hbmFnZXJfYWRkcj1hcmM0LkFkZHJlc3Moc2VsZi5tYW5hZ2VyX2FkZHIpLAogICAgLy8gICAgIHJlc2VydmVfYWRkcj1hcmM0LkFkZHJlc3Moc2VsZi5yZXNlcnZlX2FkZHIpLAogICAgLy8gICAgIGZyZWV6ZV9hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLmZyZWV6ZV9hZGRyKSwKICAgIC8vICAgICBjbGF3YmFja19hZGRyPWFyYzQuQWRkcmVzcyhzZWxmLmNsYXdiYWNrX2FkZHIpLAogICAgLy8gKQogICAgdW5jb3ZlciAxMAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgYnl0ZWMgMTkgLy8gMHgwMDk1CiAgICBjb25jYXQKICAgIGRpZyA4CiAgICBsZW4KICAgIGludGMgNCAvLyAxNDkKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgOAogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgNwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgzMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlYyAxMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmdldF9hc3NldF9pc19mcm96ZW5bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXNzZXRfaXNfZnJvemVuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NTktODYwCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGZyZWV6ZV9hc3NldC5pZCkKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk0OAogICAgLy8gcmV0dXJuIHNlbGYuZ2xvYmFsX2Zyb3plbgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX2Zyb3plbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODYyLTg2MwogICAgLy8gIyBFZmZlY3RzCiAgICAvLyByZXR1cm4gYXJjNC5Cb29sKHNlbGYuaXNfZ2xvYmFsX2Zyb3plbihmcmVlemVfYXNzZXQuaWQpKQogICAgYnl0ZWMgMTMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojg0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlYyAxMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmdldF9hY2NvdW50X2lzX2Zyb3plbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9hY2NvdW50X2lzX2Zyb3plbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODY1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NzktODgwCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGZyZWV6ZV9hc3NldC5pZCkKICAgIHN3YXAKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk3NQogICAgLy8gcmV0dXJuIHNlbGYuYWNjb3VudF9mcm96ZW5bYWNjb3VudF0KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhY2NvdW50X2Zyb3plbiIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfZnJvemVuIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4ODItODgzCiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHJldHVybiBhcmM0LkJvb2woc2VsZi5pc19hY2NvdW50X2Zyb3plbihmcmVlemVfYXNzZXQuaWQsIGZyZWV6ZV9hY2NvdW50KSkKICAgIGJ5dGVjIDEzIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgMTIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5nZXRfY2lyY3VsYXRpbmdfc3VwcGx5W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2NpcmN1bGF0aW5nX3N1cHBseToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODg1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODk2LTg5NwogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhhc3NldC5pZCkKICAgIGR1cAogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODk5LTkwMAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5jaXJjdWxhdGluZ19zdXBwbHkoYXNzZXQpKQogICAgY2FsbHN1YiBjaXJjdWxhdGluZ19zdXBwbHkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODg1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDEyIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYS5zdG9yZV9hc3NldF9jb25maWcoYXNzZXRfaWQ6IHVpbnQ2NCwgYXNzZXRfY29uZmlnOiBieXRlcykgLT4gYnl0ZXM6CnN0b3JlX2Fzc2V0X2NvbmZpZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA3Mi0xMDczCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHN0b3JlX2Fzc2V0X2NvbmZpZyhzZWxmLCBhc3NldF9pZDogVUludDY0LCBhc3NldF9jb25maWc6IEFzc2V0Q29uZmlnKSAtPiBOb25lOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNzQKICAgIC8vIHNlbGYudG90YWwgPSBhc3NldF9jb25maWcudG90YWwubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgOSAvLyAidG90YWwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDc1CiAgICAvLyBzZWxmLmRlY2ltYWxzID0gYXNzZXRfY29uZmlnLmRlY2ltYWxzLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzMgLy8gOAogICAgZXh0cmFjdF91aW50MzIKICAgIGJ5dGVjIDE0IC8vICJkZWNpbWFscyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNzYKICAgIC8vIHNlbGYuZGVmYXVsdF9mcm96ZW4gPSBhc3NldF9jb25maWcuZGVmYXVsdF9mcm96ZW4ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgOTYgLy8gOTYKICAgIGdldGJpdAogICAgYnl0ZWMgMTMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBieXRlYyAxMCAvLyAiZGVmYXVsdF9mcm96ZW4iCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDc3CiAgICAvLyBzZWxmLnVuaXRfbmFtZSA9IGFzc2V0X2NvbmZpZy51bml0X25hbWUubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTMgLy8gMTMKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTUgLy8gMTUKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlYyAxNSAvLyAidW5pdF9uYW1lIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA3OAogICAgLy8gc2VsZi5uYW1lID0gYXNzZXRfY29uZmlnLm5hbWUubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTcgLy8gMTcKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlYyAxNiAvLyAibmFtZSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwNzkKICAgIC8vIHNlbGYudXJsID0gYXNzZXRfY29uZmlnLnVybC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAxOSAvLyAxOQogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMQogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGVjIDE3IC8vICJ1cmwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDgwCiAgICAvLyBzZWxmLm1ldGFkYXRhX2hhc2ggPSBhc3NldF9jb25maWcubWV0YWRhdGFfaGFzaC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlYyAxOCAvLyAibWV0YWRhdGFfaGFzaCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwODEKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyID0gYXNzZXRfY29uZmlnLm1hbmFnZXJfYWRkci5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyMSAzMgogICAgYnl0ZWMgNyAvLyAibWFuYWdlcl9hZGRyIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA4MgogICAgLy8gc2VsZi5yZXNlcnZlX2FkZHIgPSBhc3NldF9jb25maWcucmVzZXJ2ZV9hZGRyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDUzIDMyCiAgICBieXRlYyA2IC8vICJyZXNlcnZlX2FkZHIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDgzCiAgICAvLyBzZWxmLmZyZWV6ZV9hZGRyID0gYXNzZXRfY29uZmlnLmZyZWV6ZV9hZGRyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDg1IDMyCiAgICBieXRlYyA0IC8vICJmcmVlemVfYWRkciIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwODQKICAgIC8vIHNlbGYuY2xhd2JhY2tfYWRkciA9IGFzc2V0X2NvbmZpZy5jbGF3YmFja19hZGRyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDExNyAzMgogICAgYnl0ZWNfMiAvLyAiY2xhd2JhY2tfYWRkciIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBmcmFtZV9kaWcgLTEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU2luZ2xlU21hcnRBc2FCYXNlLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhhc3NldF9pZDogdWludDY0KSAtPiB2b2lkOgphc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkyNS05MjYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKHNlbGYsIGFzc2V0X2lkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTI3CiAgICAvLyBhc3NlcnQgc2VsZi5zbWFydF9hc2FfaWQsIGVyci5NSVNTSU5HX0NUUkxfQVNBCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zbWFydF9hc2FfaWQgZXhpc3RzCiAgICBkdXAKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbnRyb2xsZWQgQVNBCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkyOAogICAgLy8gYXNzZXJ0IHNlbGYuc21hcnRfYXNhX2lkID09IGFzc2V0X2lkLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU2luZ2xlU21hcnRBc2FCYXNlLmhhc19hbGxvd2xpc3QoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpoYXNfYWxsb3dsaXN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NTQtOTU1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGhhc19hbGxvd2xpc3Qoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NTYKICAgIC8vIHJldHVybiBib29sKHNlbGYuYWxsb3dsaXN0X3Jvb3QpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAiYWxsb3dsaXN0X3Jvb3QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWxsb3dsaXN0X3Jvb3QgZXhpc3RzCiAgICBsZW4KICAgIGludGNfMCAvLyAwCiAgICAhPQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuY2lyY3VsYXRpbmdfc3VwcGx5KGN0cmxfYXNzZXQ6IHVpbnQ2NCkgLT4gdWludDY0OgpjaXJjdWxhdGluZ19zdXBwbHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2Ni0xNjcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2lyY3VsYXRpbmdfc3VwcGx5KHNlbGYsIGN0cmxfYXNzZXQ6IEFzc2V0KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTY4CiAgICAvLyByZXR1cm4gY2ZnLlRPVEFMIC0gY3RybF9hc3NldC5iYWxhbmNlKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IG9wdGVkIGludG8gYXNzZXQKICAgIGludGMgNSAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgc3dhcAogICAgLQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXJ0X3JlZ3VsYXJfdHJhbnNmZXJfcHJlY29uZGl0aW9ucyhhc3NldF9pZDogdWludDY0LCBhc3NldF9zZW5kZXI6IGJ5dGVzLCBhc3NldF9yZWNlaXZlcjogYnl0ZXMpIC0+IHZvaWQ6CmFzc2VydF9yZWd1bGFyX3RyYW5zZmVyX3ByZWNvbmRpdGlvbnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIxMy0yMTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X3JlZ3VsYXJfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBzZWxmLCAqLCBhc3NldF9pZDogVUludDY0LCBhc3NldF9zZW5kZXI6IEFjY291bnQsIGFzc2V0X3JlY2VpdmVyOiBBY2NvdW50CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjE3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBhc3NldF9zZW5kZXIsIGVyci5VTkFVVEhPUklaRURfQ0xBV0JBQ0sKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgQ2xhd2JhY2sKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWNjb3VudF9zbWFydF9hc2FfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGZyYW1lX2RpZyAtMwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjE4LTIxOQogICAgLy8gIyBJbiB0aGUgY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQsIHRoZSBTbWFydCBBREEgSUQgaW4gTG9jYWwgU3RhdGUgY291bGQgYmUgb3V0ZGF0ZWQuCiAgICAvLyBhc3NlcnQgc2VsZi5pc19ob2xkZXIoYXNzZXRfaWQsIGFzc2V0X3NlbmRlciksIGVyci5JTlZBTElEX0NUUkxfQVNBCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDb250cm9sbGVkIEFTQSBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzEKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2FjY291bnRdID09IGFzc2V0X2lkCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMjAKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihhc3NldF9pZCwgYXNzZXRfcmVjZWl2ZXIpLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTQ4CiAgICAvLyByZXR1cm4gc2VsZi5nbG9iYWxfZnJvemVuCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiZ2xvYmFsX2Zyb3plbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfZnJvemVuIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMjEKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19nbG9iYWxfZnJvemVuKGFzc2V0X2lkKSwgZXJyLkdMT0JBTF9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBTbWFydCBBU0EgaXMgZ2xvYmFsIGZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzUKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfZnJvemVuW2FjY291bnRdCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhY2NvdW50X2Zyb3plbiIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfZnJvemVuIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMjIKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19hY2NvdW50X2Zyb3plbihhc3NldF9pZCwgYXNzZXRfc2VuZGVyKSwgZXJyLlNFTkRFUl9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTc1CiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X2Zyb3plbiBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjIzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oYXNzZXRfaWQsIGFzc2V0X3JlY2VpdmVyKSwgZXJyLlJFQ0VJVkVSX0ZST1pFTgogICAgIQogICAgYXNzZXJ0IC8vIFJlY2VpdmVyIGFjY291bnQgaXMgZnJvemVuCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucyhhc3NldF9pZDogdWludDY0LCBhc3NldF9zZW5kZXI6IGJ5dGVzLCBhc3NldF9yZWNlaXZlcjogYnl0ZXMsIGFzc2V0X2Ftb3VudDogdWludDY0KSAtPiB2b2lkOgphc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjI1LTIzMwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgICosCiAgICAvLyAgICAgYXNzZXRfaWQ6IFVJbnQ2NCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI6IEFjY291bnQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI6IEFjY291bnQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50OiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjM0CiAgICAvLyBpZiBhc3NldF9zZW5kZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzczoKICAgIGZyYW1lX2RpZyAtMwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBieiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDQ2CiAgICAvLyByZXR1cm4gc2VsZi5yZXNlcnZlX2FkZHIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJyZXNlcnZlX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVzZXJ2ZV9hZGRyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNzYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHJlc2VydmVfYWRkciwgZXJyLlVOQVVUSE9SSVpFRF9SRVNFUlZFCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgUmVzZXJ2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNzctMTc4CiAgICAvLyAjIEZvcmJpZGRlbiBzZWxmLW1pbnQgKHRvIENyZWF0b3IpIGFuZCBvdmVyLW1pbnQgKD4gdG90YWwpLgogICAgLy8gYXNzZXJ0IGFzc2V0X3JlY2VpdmVyICE9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsIGVyci5TRUxGX01JTlQKICAgIGZyYW1lX2RpZyAtMgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gRm9yYmlkZGVuIHNlbGYgbWludGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNzktMTgxCiAgICAvLyBhc3NlcnQgYXNzZXRfYW1vdW50ICsgc2VsZi5jaXJjdWxhdGluZ19zdXBwbHkoCiAgICAvLyAgICAgQXNzZXQoYXNzZXRfaWQpCiAgICAvLyApIDw9IHNlbGYuY29uZmlnX3RvdGFsKGFzc2V0X2lkKSwgZXJyLk9WRVJfTUlOVAogICAgZnJhbWVfZGlnIC00CiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjEwMzQKICAgIC8vIHJldHVybiBzZWxmLnRvdGFsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAidG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE3OS0xODEKICAgIC8vIGFzc2VydCBhc3NldF9hbW91bnQgKyBzZWxmLmNpcmN1bGF0aW5nX3N1cHBseSgKICAgIC8vICAgICBBc3NldChhc3NldF9pZCkKICAgIC8vICkgPD0gc2VsZi5jb25maWdfdG90YWwoYXNzZXRfaWQpLCBlcnIuT1ZFUl9NSU5UCiAgICA8PQogICAgYXNzZXJ0IC8vIEZvcmJpZGRlbiBvdmVyIG1pbnRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWNjb3VudF9zbWFydF9hc2FfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGZyYW1lX2RpZyAtNAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTgyLTE4MwogICAgLy8gIyBJbiB0aGUgY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQsIHRoZSBTbWFydCBBREEgSUQgaW4gTG9jYWwgU3RhdGUgY291bGQgYmUgb3V0ZGF0ZWQuCiAgICAvLyBhc3NlcnQgc2VsZi5pc19ob2xkZXIoYXNzZXRfaWQsIGFzc2V0X3JlY2VpdmVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk0OAogICAgLy8gcmV0dXJuIHNlbGYuZ2xvYmFsX2Zyb3plbgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX2Zyb3plbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTg0CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfZ2xvYmFsX2Zyb3plbihhc3NldF9pZCksIGVyci5HTE9CQUxfRlJPWkVOCiAgICAhCiAgICBhc3NlcnQgLy8gU21hcnQgQVNBIGlzIGdsb2JhbCBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA1NAogICAgLy8gcmV0dXJuIHNlbGYuY2xhd2JhY2tfYWRkcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhd2JhY2tfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTg1CiAgICAvLyBpZiByZXNlcnZlX2FkZHIgIT0gc2VsZi5jb25maWdfY2xhd2JhY2tfYWRkcihhc3NldF9pZCk6CiAgICAhPQogICAgYnogYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfYWZ0ZXJfaWZfZWxzZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk3NQogICAgLy8gcmV0dXJuIHNlbGYuYWNjb3VudF9mcm96ZW5bYWNjb3VudF0KICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFjY291bnRfZnJvemVuIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9mcm96ZW4gZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE4Ni0xODgKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19hY2NvdW50X2Zyb3plbigKICAgIC8vICAgICBhc3NldF9pZCwgYXNzZXRfcmVjZWl2ZXIKICAgIC8vICksIGVyci5SRUNFSVZFUl9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBSZWNlaXZlciBhY2NvdW50IGlzIGZyb3plbgoKYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfYWZ0ZXJfaWZfZWxzZUA5OgogICAgcmV0c3ViCgphc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjQwCiAgICAvLyBlbGlmIGFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBmcmFtZV9kaWcgLTIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYnogYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA0NgogICAgLy8gcmV0dXJuIHNlbGYucmVzZXJ2ZV9hZGRyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAicmVzZXJ2ZV9hZGRyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXNlcnZlX2FkZHIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gcmVzZXJ2ZV9hZGRyLCBlcnIuVU5BVVRIT1JJWkVEX1JFU0VSVkUKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBSZXNlcnZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk3MQogICAgLy8gcmV0dXJuIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYWNjb3VudF0gPT0gYXNzZXRfaWQKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBmcmFtZV9kaWcgLTQKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5Ny0xOTgKICAgIC8vICMgSW4gY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQgdGhlIFNtYXJ0IEFEQSBJRCBpbiBMb2NhbCBTdGF0ZSBjb3VsZCBiZSBvdXRkYXRlZC4KICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihhc3NldF9pZCwgYXNzZXRfc2VuZGVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk0OAogICAgLy8gcmV0dXJuIHNlbGYuZ2xvYmFsX2Zyb3plbgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX2Zyb3plbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTk5CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfZ2xvYmFsX2Zyb3plbihhc3NldF9pZCksIGVyci5HTE9CQUxfRlJPWkVOCiAgICAhCiAgICBhc3NlcnQgLy8gU21hcnQgQVNBIGlzIGdsb2JhbCBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTA1NAogICAgLy8gcmV0dXJuIHNlbGYuY2xhd2JhY2tfYWRkcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNsYXdiYWNrX2FkZHIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhd2JhY2tfYWRkciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjAwCiAgICAvLyBpZiByZXNlcnZlX2FkZHIgIT0gc2VsZi5jb25maWdfY2xhd2JhY2tfYWRkcihhc3NldF9pZCk6CiAgICAhPQogICAgYnogYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfYWZ0ZXJfaWZfZWxzZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk3NQogICAgLy8gcmV0dXJuIHNlbGYuYWNjb3VudF9mcm96ZW5bYWNjb3VudF0KICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFjY291bnRfZnJvemVuIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9mcm96ZW4gZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGFzc2V0X2lkLCBhc3NldF9zZW5kZXIpLCBlcnIuU0VOREVSX0ZST1pFTgogICAgIQogICAgYXNzZXJ0IC8vIFNlbmRlciBhY2NvdW50IGlzIGZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMDItMjAzCiAgICAvLyAjIEZvcmJpZGRlbiBjbGF3YmFjayB0aHJvdWdoIGJ1cm5pbmcgKGJ1cm5lZCBhbW91bnQgbm90IGZyb20gUmVzZXJ2ZSkuCiAgICAvLyBhc3NlcnQgYXNzZXRfc2VuZGVyID09IHJlc2VydmVfYWRkciwgZXJyLkNMQVdCQUNLX0JVUk4KICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIDAKICAgID09CiAgICBhc3NlcnQgLy8gRm9yYmlkZGVuIGNsYXdiYWNrIGJ1cm5pbmcKICAgIHJldHN1YgoKYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI0NAogICAgLy8gZWxpZiBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2NsYXdiYWNrX2FkZHIoYXNzZXRfaWQpOgogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDU0CiAgICAvLyByZXR1cm4gc2VsZi5jbGF3YmFja19hZGRyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY2xhd2JhY2tfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jbGF3YmFja19hZGRyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNDQKICAgIC8vIGVsaWYgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19jbGF3YmFja19hZGRyKGFzc2V0X2lkKToKICAgID09CiAgICBieiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19lbHNlX2JvZHlANgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzEKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2FjY291bnRdID09IGFzc2V0X2lkCiAgICBmcmFtZV9kaWcgLTMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgZnJhbWVfZGlnIC00CiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMDktMjEwCiAgICAvLyAjIEluIHRoZSBjYXNlIG9mIENvbnRyb2xsZWQgQVNBIGRlc3Ryb3llZCBhbmQgcmUtY3JlYXRlZCwgdGhlIFNtYXJ0IEFEQSBJRCBpbiBMb2NhbCBTdGF0ZSBjb3VsZCBiZSBvdXRkYXRlZC4KICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihhc3NldF9pZCwgYXNzZXRfc2VuZGVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk3MQogICAgLy8gcmV0dXJuIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYWNjb3VudF0gPT0gYXNzZXRfaWQKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBmcmFtZV9kaWcgLTQKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfaG9sZGVyKGFzc2V0X2lkLCBhc3NldF9yZWNlaXZlciksIGVyci5JTlZBTElEX0NUUkxfQVNBCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDb250cm9sbGVkIEFTQSBJRAogICAgcmV0c3ViCgphc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19lbHNlX2JvZHlANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjUxCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaGFzX2FsbG93bGlzdChhc3NldF9pZCksIGVyci5NSVNTSU5HX0FMTE9XTElTVF9QUk9PRgogICAgZnJhbWVfZGlnIC00CiAgICBjYWxsc3ViIGhhc19hbGxvd2xpc3QKICAgICEKICAgIGFzc2VydCAvLyBUcmFuc2ZlciBhbGxvd2xpc3QgaXMgc2V0LCB1c2UgYXNzZXRfdHJhbnNmZXJfd2l0aF9wcm9vZgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNTItMjU2CiAgICAvLyBzZWxmLmFzc2VydF9yZWd1bGFyX3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoCiAgICAvLyAgICAgYXNzZXRfaWQ9YXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgYXNzZXJ0X3JlZ3VsYXJfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuZW1pdF90cmFuc2Zlcl9ldmVudChhc3NldF9pZDogdWludDY0LCBhc3NldF9zZW5kZXI6IGJ5dGVzLCBhc3NldF9yZWNlaXZlcjogYnl0ZXMsIGFzc2V0X2Ftb3VudDogdWludDY0KSAtPiB2b2lkOgplbWl0X3RyYW5zZmVyX2V2ZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNTgtMjY2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGVtaXRfdHJhbnNmZXJfZXZlbnQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAqLAogICAgLy8gICAgIGFzc2V0X2lkOiBVSW50NjQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyOiBBY2NvdW50LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyOiBBY2NvdW50LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudDogVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBSZWd1bGFyIHRyYW5zZmVycyBhcmUgbm90IGxvZ2dlZCwgc3VwcGx5IGFuZCBjbGF3YmFjayBjaGFuZ2VzIGFyZS4KICAgIC8vIGlmIGFzc2V0X3NlbmRlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzOgogICAgZnJhbWVfZGlnIC0zCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGJ6IGVtaXRfdHJhbnNmZXJfZXZlbnRfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjcyCiAgICAvLyBhc3NldF9hbW91bnQ9YXJjNC5VSW50NjQoYXNzZXRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNzAtMjczCiAgICAvLyBNaW50KAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFyYzQuQWRkcmVzcyhhc3NldF9yZWNlaXZlciksCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNjktMjc0CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgTWludCgKICAgIC8vICAgICAgICAgYXNzZXRfcmVjZWl2ZXI9YXJjNC5BZGRyZXNzKGFzc2V0X3JlY2VpdmVyKSwKICAgIC8vICAgICAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZGYyZTc5NGUgLy8gbWV0aG9kICJNaW50KGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCgplbWl0X3RyYW5zZmVyX2V2ZW50X2FmdGVyX2lmX2Vsc2VAODoKICAgIHJldHN1YgoKZW1pdF90cmFuc2Zlcl9ldmVudF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjc1CiAgICAvLyBlbGlmIGFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBmcmFtZV9kaWcgLTIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYnogZW1pdF90cmFuc2Zlcl9ldmVudF9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNzkKICAgIC8vIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3Ny0yODAKICAgIC8vIEJ1cm4oCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFyYzQuQWRkcmVzcyhhc3NldF9zZW5kZXIpLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjc2LTI4MQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEJ1cm4oCiAgICAvLyAgICAgICAgIGFzc2V0X3NlbmRlcj1hcmM0LkFkZHJlc3MoYXNzZXRfc2VuZGVyKSwKICAgIC8vICAgICAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgYnl0ZWMgMjAgLy8gbWV0aG9kICJCdXJuKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCmVtaXRfdHJhbnNmZXJfZXZlbnRfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4MgogICAgLy8gZWxpZiBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2NsYXdiYWNrX2FkZHIoYXNzZXRfaWQpOgogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxMDU0CiAgICAvLyByZXR1cm4gc2VsZi5jbGF3YmFja19hZGRyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY2xhd2JhY2tfYWRkciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jbGF3YmFja19hZGRyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyODIKICAgIC8vIGVsaWYgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19jbGF3YmFja19hZGRyKGFzc2V0X2lkKToKICAgID09CiAgICBieiBlbWl0X3RyYW5zZmVyX2V2ZW50X2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyODcKICAgIC8vIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4NC0yODgKICAgIC8vIENsYXdiYWNrKAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hcmM0LkFkZHJlc3MoYXNzZXRfc2VuZGVyKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hcmM0LkFkZHJlc3MoYXNzZXRfcmVjZWl2ZXIpLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4My0yODkKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBDbGF3YmFjaygKICAgIC8vICAgICAgICAgYXNzZXRfc2VuZGVyPWFyYzQuQWRkcmVzcyhhc3NldF9zZW5kZXIpLAogICAgLy8gICAgICAgICBhc3NldF9yZWNlaXZlcj1hcmM0LkFkZHJlc3MoYXNzZXRfcmVjZWl2ZXIpLAogICAgLy8gICAgICAgICBhc3NldF9hbW91bnQ9YXJjNC5VSW50NjQoYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg0Yjg5OThmYyAvLyBtZXRob2QgIkNsYXdiYWNrKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmlzX2FsbG93bGlzdGVkKGFzc2V0X2lkOiB1aW50NjQsIGFjY291bnQ6IGJ5dGVzLCBwcm9vZjogYnl0ZXMpIC0+IHVpbnQ2NCwgYnl0ZXM6CmlzX2FsbG93bGlzdGVkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyOTEtMjk0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGlzX2FsbG93bGlzdGVkKAogICAgLy8gICAgIHNlbGYsIGFzc2V0X2lkOiBVSW50NjQsIGFjY291bnQ6IEFjY291bnQsIHByb29mOiBNZXJrbGVQcm9vZgogICAgLy8gKSAtPiBib29sOgogICAgcHJvdG8gMyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihjZmcuTUVSS0xFX0xFQUZfUFJFRklYICsgYWNjb3VudC5ieXRlcykKICAgIGJ5dGVjIDEzIC8vIDB4MDAKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjk2CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMCAvLyAwCgppc19hbGxvd2xpc3RlZF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI5NgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHByb29mLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGlzX2FsbG93bGlzdGVkX2FmdGVyX2ZvckA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI5NwogICAgLy8gc2libGluZyA9IHByb29mW2ldLmJ5dGVzCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI5OC0yOTkKICAgIC8vICMgU29ydGVkIHBhaXIgaGFzaGluZzogcHJvb2ZzIG5lZWQgbm8gbGVmdC9yaWdodCBwYXRoIGJpdHMuCiAgICAvLyBpZiBCaWdVSW50LmZyb21fYnl0ZXMobm9kZSkgPCBCaWdVSW50LmZyb21fYnl0ZXMoc2libGluZyk6CiAgICBmcmFtZV9kaWcgMAogICAgYj4KICAgIGJ6IGlzX2FsbG93bGlzdGVkX2Vsc2VfYm9keUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwMAogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihjZmcuTUVSS0xFX05PREVfUFJFRklYICsgbm9kZSArIHNpYmxpbmcpCiAgICBwdXNoYnl0ZXMgMHgwMQogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIGZyYW1lX2J1cnkgMAoKaXNfYWxsb3dsaXN0ZWRfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyOTYKICAgIC8vIGZvciBpIGluIHVyYW5nZShwcm9vZi5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgaXNfYWxsb3dsaXN0ZWRfZm9yX2hlYWRlckAxCgppc19hbGxvd2xpc3RlZF9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzAyCiAgICAvLyBub2RlID0gb3Auc2hhMjU2KGNmZy5NRVJLTEVfTk9ERV9QUkVGSVggKyBzaWJsaW5nICsgbm9kZSkKICAgIHB1c2hieXRlcyAweDAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgZnJhbWVfYnVyeSAwCiAgICBiIGlzX2FsbG93bGlzdGVkX2FmdGVyX2lmX2Vsc2VANQoKaXNfYWxsb3dsaXN0ZWRfYWZ0ZXJfZm9yQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk2MAogICAgLy8gcmV0dXJuIHNlbGYuYWxsb3dsaXN0X3Jvb3QKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJhbGxvd2xpc3Rfcm9vdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbGxvd2xpc3Rfcm9vdCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzAzCiAgICAvLyByZXR1cm4gbm9kZSA9PSBzZWxmLmxvYWRfYWxsb3dsaXN0X3Jvb3QoYXNzZXRfaWQpCiAgICBmcmFtZV9kaWcgMAogICAgPT0KICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmlubmVyX2Fzc2V0X3RyYW5zZmVyKHhmZXJfYXNzZXQ6IHVpbnQ2NCwgYXNzZXRfYW1vdW50OiB1aW50NjQsIGFzc2V0X3NlbmRlcjogYnl0ZXMsIGFzc2V0X3JlY2VpdmVyOiBieXRlcykgLT4gdm9pZDoKaW5uZXJfYXNzZXRfdHJhbnNmZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM2Ni0zNzQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAqLAogICAgLy8gICAgIHhmZXJfYXNzZXQ6IEFzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudDogVUludDY0LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcjogQWNjb3VudCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcjogQWNjb3VudAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM3NS0zODIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXhmZXJfYXNzZXQuaWQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozODEKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtNAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzc1CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzc2CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNzUtMzgyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1185], "errorMessage": "Clawback Address has been deleted"}, {"pc": [1980], "errorMessage": "Close to account is frozen"}, {"pc": [615], "errorMessage": "Controlled ASA already created"}, {"pc": [1393], "errorMessage": "Empty transfer batch"}, {"pc": [904], "errorMessage": "Forbidden Close Out on Opt In"}, {"pc": [2798], "errorMessage": "Forbidden clawback burning"}, {"pc": [2700], "errorMessage": "Forbidden over minting"}, {"pc": [2685], "errorMessage": "Forbidden self minting"}, {"pc": [1163], "errorMessage": "Freeze Address has been deleted"}, {"pc": [1879], "errorMessage": "Invalid Close Out group size"}, {"pc": [1742, 1873, 1954, 2575, 2622, 2632, 2710, 2769, 2819, 2829], "errorMessage": "Invalid Controlled ASA ID"}, {"pc": [1199], "errorMessage": "Invalid Total, must be >= circulating supply"}, {"pc": [912, 2571], "errorMessage": "Missing Controlled ASA"}, {"pc": [456], "errorMessage": "OnCompletion must be CloseOut && can only call when not creating"}, {"pc": [345], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [478], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [467], "errorMessage": "OnCompletion must be OptIn && can only call when not creating"}, {"pc": [2655, 2733], "errorMessage": "Receiver account is frozen"}, {"pc": [1639], "errorMessage": "Receiver account is not allowlisted"}, {"pc": [1140], "errorMessage": "Reserve Address has been deleted"}, {"pc": [1974, 2647, 2792], "errorMessage": "Sender account is frozen"}, {"pc": [1628], "errorMessage": "Sender account is not allowlisted"}, {"pc": [1966, 2639, 2717, 2776], "errorMessage": "Smart ASA is global frozen"}, {"pc": [1608], "errorMessage": "Transfer allowlist is not set"}, {"pc": [1959], "errorMessage": "Transfer allowlist is set, close out to the Creator"}, {"pc": [2837], "errorMessage": "Transfer allowlist is set, use asset_transfer_with_proof"}, {"pc": [1397], "errorMessage": "Transfer batch exceeds max inner group size"}, {"pc": [608], "errorMessage": "Unauthorized"}, {"pc": [2612], "errorMessage": "Unauthorized Clawback"}, {"pc": [1684, 1751, 1805], "errorMessage": "Unauthorized Freeze"}, {"pc": [1120, 2047], "errorMessage": "Unauthorized Manager"}, {"pc": [2679, 2759], "errorMessage": "Unauthorized Reserve"}, {"pc": [1898], "errorMessage": "Wrong ASA Close Out Amount"}, {"pc": [1886], "errorMessage": "Wrong ASA Close Out ID"}, {"pc": [1893], "errorMessage": "Wrong ASA Close Out Sender"}, {"pc": [898], "errorMessage": "Wrong ASA Opt In Amount"}, {"pc": [879], "errorMessage": "Wrong ASA Opt In ID"}, {"pc": [893], "errorMessage": "Wrong ASA Opt In Receiver"}, {"pc": [886], "errorMessage": "Wrong ASA Opt In Sender"}, {"pc": [1904, 1929], "errorMessage": "Wrong Close Out on Close Out"}, {"pc": [240], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [246], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [250], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [256], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [867, 1852], "errorMessage": "Wrong On Complete Action"}, {"pc": [929, 1996, 2598], "errorMessage": "account opted into asset"}, {"pc": [1972, 1978, 2373, 2645, 2653, 2731, 2790], "errorMessage": "check self.account_frozen exists for account"}, {"pc": [1738, 1869, 1947, 2618, 2628, 2706, 2765, 2815, 2825], "errorMessage": "check self.account_smart_asa_id exists for account"}, {"pc": [2584, 3005], "errorMessage": "check self.allowlist_root exists"}, {"pc": [1173, 2237, 2721, 2780, 2805, 2902], "errorMessage": "check self.clawback_addr exists"}, {"pc": [2146], "errorMessage": "check self.decimals exists"}, {"pc": [919, 2160], "errorMessage": "check self.default_frozen exists"}, {"pc": [1151, 1682, 1749, 1803, 2233], "errorMessage": "check self.freeze_addr exists"}, {"pc": [1964, 2335, 2637, 2715, 2774], "errorMessage": "check self.global_frozen exists"}, {"pc": [1118, 2045, 2223], "errorMessage": "check self.manager_addr exists"}, {"pc": [2210], "errorMessage": "check self.metadata_hash exists"}, {"pc": [2184], "errorMessage": "check self.name exists"}, {"pc": [1131, 2228, 2673, 2753], "errorMessage": "check self.reserve_addr exists"}, {"pc": [613, 2569], "errorMessage": "check self.smart_asa_id exists"}, {"pc": [2140, 2698], "errorMessage": "check self.total exists"}, {"pc": [2171], "errorMessage": "check self.unit_name exists"}, {"pc": [2197], "errorMessage": "check self.url exists"}, {"pc": [1419, 2959], "errorMessage": "index access is out of bounds"}, {"pc": [512, 529, 546, 563, 1002, 1021, 1040, 1059, 1372, 1571, 1587, 2939], "errorMessage": "invalid array length header"}, {"pc": [505, 993, 1671, 1727], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [1581, 1597], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [522, 539, 556, 570, 1012, 1031, 1050, 1066], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [1387], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.avm_types.TransferLeg>"}, {"pc": [578, 586, 594, 602, 1076, 1087, 1097, 1107, 1307, 1315, 1557, 1565, 1719, 1792, 1846, 2365], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [497, 983], "errorMessage": "invalid number of bytes for arc4.uint32"}, {"pc": [488, 849, 960, 972, 1290, 1299, 1361, 1540, 1549, 1662, 1710, 1780, 1834, 2033, 2131, 2326, 2356, 2394], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [2152], "errorMessage": "overflow"}, {"pc": [862, 1863, 1920], "errorMessage": "transaction type is axfer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -131,6 +131,30 @@ class AssetTransferArgs:
     def abi_method_signature(self) -> str:
         return "asset_transfer(uint64,uint64,address,address)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetTransferBatchArgs:
+    """Dataclass for asset_transfer_batch arguments"""
+    xfer_asset: int
+    legs: list[tuple[str, str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_transfer_batch(uint64,(address,address,uint64)[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetTransferWithProofArgs:
+    """Dataclass for asset_transfer_with_proof arguments"""
+    xfer_asset: int
+    asset_amount: int
+    asset_sender: str
+    asset_receiver: str
+    sender_proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+    receiver_proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class AssetFreezeArgs:
     """Dataclass for asset_freeze arguments"""
@@ -152,6 +176,16 @@ class AccountFreezeArgs:
     def abi_method_signature(self) -> str:
         return "account_freeze(uint64,address,bool)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetTransferAllowlistArgs:
+    """Dataclass for set_transfer_allowlist arguments"""
+    freeze_asset: int
+    allowlist_root: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_transfer_allowlist(uint64,byte[32])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class AssetDestroyArgs:
     """Dataclass for asset_destroy arguments"""
@@ -306,6 +340,32 @@ class SmartAsaParams:
             "args": method_args,
         }))
 
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }))
+
     def asset_freeze(
         self,
         args: tuple[int, bool] | AssetFreezeArgs,
@@ -332,6 +392,19 @@ class SmartAsaParams:
             "args": method_args,
         }))
 
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }))
+
     def asset_destroy(
         self,
         args: tuple[int] | AssetDestroyArgs,
@@ -495,6 +568,32 @@ class SmartAsaCreateTransactionParams:
             "args": method_args,
         }))
 
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }))
+
     def asset_freeze(
         self,
         args: tuple[int, bool] | AssetFreezeArgs,
@@ -521,6 +620,19 @@ class SmartAsaCreateTransactionParams:
             "args": method_args,
         }))
 
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }))
+
     def asset_destroy(
         self,
         args: tuple[int] | AssetDestroyArgs,
@@ -699,6 +811,38 @@ class SmartAsaSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def asset_freeze(
         self,
         args: tuple[int, bool] | AssetFreezeArgs,
@@ -731,6 +875,22 @@ class SmartAsaSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def asset_destroy(
         self,
         args: tuple[int] | AssetDestroyArgs,
@@ -824,6 +984,9 @@ class SmartAsaSend:
 
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
+    smart_asa_id: int
+    global_frozen: int
+    allowlist_root: bytes
     total: int
     decimals: int
     default_frozen: int
@@ -835,8 +998,6 @@ class GlobalStateValue(typing.TypedDict):
     reserve_addr: str
     freeze_addr: str
     clawback_addr: str
-    smart_asa_id: int
-    global_frozen: int
 
 class LocalStateValue(typing.TypedDict):
     """Shape of local_state state key values"""
@@ -885,6 +1046,30 @@ class _GlobalState:
             )
         return typing.cast(GlobalStateValue, converted)
 
+    @property
+    def smart_asa_id(self) -> int:
+        """Get the current value of the smart_asa_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("smart_asa_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def global_frozen(self) -> int:
+        """Get the current value of the global_frozen key in global_state state"""
+        value = self.app_client.state.global_state.get_value("global_frozen")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def allowlist_root(self) -> bytes:
+        """Get the current value of the allowlist_root key in global_state state"""
+        value = self.app_client.state.global_state.get_value("allowlist_root")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
     @property
     def total(self) -> int:
         """Get the current value of the total key in global_state state"""
@@ -973,22 +1158,6 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
         return typing.cast(str, value)
 
-    @property
-    def smart_asa_id(self) -> int:
-        """Get the current value of the smart_asa_id key in global_state state"""
-        value = self.app_client.state.global_state.get_value("smart_asa_id")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
-        return typing.cast(int, value)
-
-    @property
-    def global_frozen(self) -> int:
-        """Get the current value of the global_frozen key in global_state state"""
-        value = self.app_client.state.global_state.get_value("global_frozen")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
-        return typing.cast(int, value)
-
 class _LocalState:
     def __init__(self, app_client: algokit_utils.AppClient, address: str):
         self.app_client = app_client
@@ -1190,6 +1359,18 @@ class SmartAsaClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_transfer_batch(uint64,(address,address,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["asset_freeze(uint64,bool)void"],
@@ -1202,6 +1383,12 @@ class SmartAsaClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_transfer_allowlist(uint64,byte[32])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["asset_destroy(uint64)void"],
@@ -1485,6 +1672,46 @@ class SmartAsaFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_transfer_batch(uint64,(address,address,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def asset_freeze(
         self,
         args: tuple[int, bool] | AssetFreezeArgs,
@@ -1525,6 +1752,26 @@ class SmartAsaFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_transfer_allowlist(uint64,byte[32])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_transfer_allowlist(uint64,byte[32])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def asset_destroy(
         self,
         args: tuple[int] | AssetDestroyArgs,
@@ -1874,6 +2121,42 @@ class SmartAsaComposer:
         )
         return self
 
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_transfer_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_transfer_batch(uint64,(address,address,uint64)[])void", v
+            )
+        )
+        return self
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_transfer_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void", v
+            )
+        )
+        return self
+
     def asset_freeze(
         self,
         args: tuple[int, bool] | AssetFreezeArgs,
@@ -1910,6 +2193,24 @@ class SmartAsaComposer:
         )
         return self
 
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_transfer_allowlist(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_transfer_allowlist(uint64,byte[32])void", v
+            )
+        )
+        return self
+
     def asset_destroy(
         self,
         args: tuple[int] | AssetDestroyArgs,
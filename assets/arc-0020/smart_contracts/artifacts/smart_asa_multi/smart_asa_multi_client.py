@@ -0,0 +1,2173 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}, {"type": "axfer", "desc": "Controlled ASA opt in transaction", "name": "ctrl_asa_opt_in"}], "name": "asset_opt_in", "returns": {"type": "void"}, "desc": "Smart ASA opt in (Controlled ASA and holding box), a NoOp app call preceded\nby the holding box MBR payment", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to close out", "name": "close_asset"}, {"type": "address", "desc": "Account to send all the Smart ASA remainder to.", "name": "close_to"}], "name": "asset_close_out", "returns": {"type": "void"}, "desc": "Smart ASA close out (Controlled ASA and holding box), a NoOp app call", "events": [{"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The total number of base units of the Smart ASA to create", "name": "total"}, {"type": "uint32", "desc": "The number of digits to use after the decimal point when displaying the Smart ASA", "name": "decimals"}, {"type": "bool", "desc": "Smart ASA default frozen (True to freeze holdings by default)", "name": "default_frozen"}, {"type": "string", "desc": "The name of a unit of Smart ASA", "name": "unit_name"}, {"type": "string", "desc": "The name of the Smart ASA", "name": "name"}, {"type": "string", "desc": "Smart ASA external URL", "name": "url"}, {"type": "byte[]", "desc": "Smart ASA metadata hash", "name": "metadata_hash"}, {"type": "address", "desc": "Account that can manage the configuration of the Smart ASA and destroy it", "name": "manager_addr"}, {"type": "address", "desc": "Account that holds the reserve (non-minted) units of Smart ASA and can mint or burn it", "name": "reserve_addr"}, {"type": "address", "desc": "Account that can freeze/unfreeze holdings of the Smart ASA globally or locally", "name": "freeze_addr"}, {"type": "address", "desc": "Account that can clawback holdings of the Smart ASA", "name": "clawback_addr"}], "name": "asset_create", "returns": {"type": "uint64", "desc": "Controlled ASA ID"}, "desc": "Create the Controlled ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to configure", "name": "config_asset"}, {"type": "uint64", "desc": "Total number of base units if the Smart ASA. It can not be less than current circulating supply", "name": "total"}, {"type": "uint32", "desc": "The number of digits to use after the decimal point when displaying the Smart ASA", "name": "decimals"}, {"type": "bool", "desc": "Smart ASA default frozen (True to freeze holdings by default)", "name": "default_frozen"}, {"type": "string", "desc": "The name of a unit of Smart ASA", "name": "unit_name"}, {"type": "string", "desc": "The name of the Smart ASA", "name": "name"}, {"type": "string", "desc": "Smart ASA external URL", "name": "url"}, {"type": "byte[]", "desc": "Smart ASA metadata hash", "name": "metadata_hash"}, {"type": "address", "desc": "Account that can manage the configuration of the Smart ASA and destroy it", "name": "manager_addr"}, {"type": "address", "desc": "Account that holds the reserve (non-minted) units of Smart ASA and can mint or burn it", "name": "reserve_addr"}, {"type": "address", "desc": "Account that can freeze/unfreeze holdings of the Smart ASA globally or locally", "name": "freeze_addr"}, {"type": "address", "desc": "Account that can clawback holdings of the Smart ASA", "name": "clawback_addr"}], "name": "asset_config", "returns": {"type": "void"}, "desc": "Configure Smart ASA (for unchanged parameters use existing value - no optional args on AVM)", "events": [{"args": [{"type": "uint64", "name": "total"}, {"type": "uint32", "name": "decimals"}, {"type": "bool", "name": "default_frozen"}, {"type": "string", "name": "unit_name"}, {"type": "string", "name": "name"}, {"type": "string", "name": "url"}, {"type": "byte[]", "name": "metadata_hash"}, {"type": "address", "name": "manager_addr"}, {"type": "address", "name": "reserve_addr"}, {"type": "address", "name": "freeze_addr"}, {"type": "address", "name": "clawback_addr"}], "name": "AssetConfig", "desc": "Smart ASA Configuration"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "uint64", "desc": "Amount to transfer", "name": "asset_amount"}, {"type": "address", "desc": "Smart ASA sender", "name": "asset_sender"}, {"type": "address", "desc": "Smart ASA receiver", "name": "asset_receiver"}], "name": "asset_transfer", "returns": {"type": "void"}, "desc": "Smart ASA transfers: regular, clawback, mint, burn", "events": [{"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "(address,address,uint64)[]", "desc": "Transfer legs (sender, receiver, amount), submitted as a single inner transaction group", "name": "legs"}], "name": "asset_transfer_batch", "returns": {"type": "void"}, "desc": "Smart ASA batched transfers: each leg is a regular, clawback, mint or burn transfer", "events": [{"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "uint64", "desc": "Amount to transfer", "name": "asset_amount"}, {"type": "address", "desc": "Smart ASA sender", "name": "asset_sender"}, {"type": "address", "desc": "Smart ASA receiver", "name": "asset_receiver"}, {"type": "byte[32][]", "desc": "Merkle proof of the sender inclusion in the transfer allowlist", "name": "sender_proof"}, {"type": "byte[32][]", "desc": "Merkle proof of the receiver inclusion in the transfer allowlist", "name": "receiver_proof"}], "name": "asset_transfer_with_proof", "returns": {"type": "void"}, "desc": "Smart ASA regular transfer between allowlisted accounts", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to globally freeze/unfreeze", "name": "freeze_asset"}, {"type": "bool", "desc": "Smart ASA frozen status", "name": "asset_frozen"}], "name": "asset_freeze", "returns": {"type": "void"}, "desc": "Smart ASA global freeze (all accounts)", "events": [{"args": [{"type": "bool", "name": "asset_frozen"}], "name": "AssetFreeze", "desc": "Smart ASA Global Freeze Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to locally freeze/unfreeze", "name": "freeze_asset"}, {"type": "address", "desc": "Account to freeze/unfreeze", "name": "freeze_account"}, {"type": "bool", "desc": "Smart ASA frozen status", "name": "asset_frozen"}], "name": "account_freeze", "returns": {"type": "void"}, "desc": "Smart ASA local freeze (account specific)", "events": [{"args": [{"type": "address", "name": "freeze_account"}, {"type": "bool", "name": "asset_frozen"}], "name": "AccountFreeze", "desc": "Smart ASA Account Freeze Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to set the transfer allowlist for", "name": "freeze_asset"}, {"type": "byte[32]", "desc": "Allowlist Merkle root (zero hash to disable the allowlist)", "name": "allowlist_root"}], "name": "set_transfer_allowlist", "returns": {"type": "void"}, "desc": "Smart ASA transfer allowlist (Merkle root of the accounts allowed to transfer)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to destroy", "name": "destroy_asset"}], "name": "asset_destroy", "returns": {"type": "void"}, "desc": "Destroy the Controlled ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}], "name": "get_asset_config", "returns": {"type": "(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)", "desc": "Smart ASA configuration parameters", "struct": "AssetConfig"}, "desc": "Get Smart ASA configuration", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "freeze_asset"}], "name": "get_asset_is_frozen", "returns": {"type": "bool", "desc": "Smart ASA global frozen status"}, "desc": "Get Smart ASA global frozen status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "freeze_asset"}, {"type": "address", "desc": "Account to check", "name": "freeze_account"}], "name": "get_account_is_frozen", "returns": {"type": "bool", "desc": "Smart ASA account frozen status"}, "desc": "Get Smart ASA account frozen status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}], "name": "get_circulating_supply", "returns": {"type": "uint64", "desc": "Smart ASA circulating supply"}, "desc": "Get Smart ASA circulating supply", "events": [], "readonly": true, "recommendations": {}}], "name": "SmartAsaMulti", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"ctrl_assets": {"keyType": "uint64", "valueType": "ControlledAsset", "prefix": "YQ=="}, "holdings": {"keyType": "Holding", "valueType": "bool", "prefix": "aA=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"AssetConfig": [{"name": "total", "type": "uint64"}, {"name": "decimals", "type": "uint32"}, {"name": "default_frozen", "type": "bool"}, {"name": "unit_name", "type": "string"}, {"name": "name", "type": "string"}, {"name": "url", "type": "string"}, {"name": "metadata_hash", "type": "byte[]"}, {"name": "manager_addr", "type": "address"}, {"name": "reserve_addr", "type": "address"}, {"name": "freeze_addr", "type": "address"}, {"name": "clawback_addr", "type": "address"}], "ControlledAsset": [{"name": "global_frozen", "type": "bool"}, {"name": "allowlist_root", "type": "byte[32]"}, {"name": "asset_config", "type": "AssetConfig"}], "Holding": [{"name": "asset_id", "type": "uint64"}, {"name": "account", "type": "address"}]}, "byteCode": {"approval": "CyAHAQAgCJgB5JYB////////////ASYGAWEBaAQVH3x1AQAE+fv13AIAlTEYQAAQMTUURDE0FEQxNxREMTYURDEbQQB4MRkURDEYRIIPBEhkFkUEOgRb3ATn7NWoBPiBn+sEfqy3dQROzkt0BCxQh+IEoTPVgQT/U63vBEo6lP0E7WRFLwQum5A4BJebmXIESKY8yQRGrQ1SNhoAjg8ACwCsAZ0DJgSLBM8FhgYHBjwGggauBt4G/wcgB0QAMRkUMRgUEEQiQzYaAUkVJRJEF0kxFiIJSTgQgQQSREsBiAdJSTgRSwISREk4ADEAEkRJOBQxABJESTgSFEQ4FTIDEkQxAEsBcABFAUQxAEwWSShMUIEvIrojU0AACjEASwNwAERBAD8iSwFLA0lOAlApTFBJvUUBFEQxFoECD0QxFoECCUk4ECISREk4AE8DEkRJOAcyChJEOAghBQ9EKyNPA1S/IkMjQv++gAA2GgFJFSUSRBdJNhoCSU4CFSQSRDEWIghJOBCBBBJEMQBLAhZJTgRMUClMUL1FAUQyBEsBDURJOBFLAhJESTgAMQASREk4EhREOBUyAxNEcQtBAH8xFiIISTgQgQQSRDgVSwFJTgISREsEiAZTSwMTQQA1SwFJSwRJTgNQKUxQvUUBRChMUEkiJLoyAxMURCMiuiNTFEQxAEsFSU8CiAYuFERMiAYoFEQxAEsESU4CcABMSU4CRQhEMQBLBUlOBIgIATIKEkEACzEASwUWUCcETFCwMQBLAksBUClMULxIsSEFsgiyByKyECOyAbMiQzYaAUkVJRJENhoCSRWBBBJENhoDSRUiEkQ2GgRHAiNZgQIITBVJTwISRDYaBUcCI1mBAghMFUlPAhJENhoGRwIjWYECCEwVSU8CEkQ2GgdHAiNZgQIITBUSRDYaCEkVJBJENhoJSRUkEkQ2GgpJFSQSRDYaC0kVJBJEMQAyCRJEsTIIgABLAUEAIksBSYEKGIAKMDEyMzQ1Njc4OUwiWEsCUEUCgQoKRQJC/9lHAhWAATBOAk2AD2FsZ29yYW5kOi8vYXBwL0xQMgpHA7IssiuyKrIpsieAEEFSQy0yMCBTbWFydCBBU0GyJoAGQVJDLTIwsiUisiQjsiMhBrIigQOyECOyAbO0PEsQSxBQSw9QJwVQgZUBSw4ISRZXBgJPAkxQTEsMCEkWVwYCTwJMUExLCggWVwYCUEsHUEsGUEsFUEsEUEsOUEsMUEsKUEsIUIAjAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACNMUEwWKEsBUEm8SE8CvypMULAiQyNJNhoBSRUlEkQXSTYaAklOAhUlEkQ2GgNJTgIVgQQSRDYaBElOAhUiEkQ2GgVJTgJJI1mBAghMFUlOAxJENhoGSU4CSSNZgQIITBVJTgMSRDYaB0lOAkkjWYECCEwVSU4DEkQ2GghJTgJJI1mBAghMFRJENhoJSU4CFSQSRDYaCklOAkkVJBJENhoLSU4DFSQSRDYaDElOAxUkEkRLAYgDpjEASwKBOIgDihJETIFYiAOCSU4CE0EABUkyAxNESw+BeIgDb0lFEksDE0EABksQMgMTREsPIQSIA1lJRRNLAhNBAAZLETIDE0RLD0mIA3YWSxBJTwKnREsPUEsOUCcFUIGVAUsNCEkWVwYCTwJMUExLCwhJFlcGAk8CTFBMSwkIFlcGAlBLBlBLBVBLBFBLA1BLDVBLC1BLCVBLB1BMFihMUEm+REmBIVkjTFhLAlBLAbxISwG8SL+ABOEMWkdMULAiQzYaAUkVJRJEFzYaAkkVJRJENhoDSRUkEkQ2GgRJFSQSREsDiAK9TwIXSwNLA0sDSwOIAxxLA0sBSwRLBIgEp4gD9iJDI0mAADYaAUkVJRJEF0k2GgJJTgJJI1lJTgNJgUgLgQIITwIVEkRMiAJ1SUSBEA5EI0lJSwMMQQB7SwNXAgBLAYFIC4FIWElXACBJTgJFCUlXICBFCoFAW0UHMgoSQQBGSwFLBghJRQNLBUsISwpPA4gCmUlBACu2gQSyECOyAUsESbIRSwZJTgKyEksISbITSwpJshRPA4gDWkkiCEUBQv+QsUL/0ksESwdLCUsIiAJbQv+/syJDNhoBSRUlEkQXNhoCSRUlEkQ2GgNJFSQSRDYaBEkVJBJENhoFSSNZJAuBAghLARUSRDYaBkkjWSQLgQIISwEVEkRLBYgBoksFFihMUCIkujIDE0RLBUsESwSIAbpLBUsETwOIAypIREsESwJPAogDH0hETwIXTwNMTwNPA4gDbCJDNhoBSRUlEkQXNhoCSRUiEkRLAYgBUTEASwKBeIgBNRJETBYoTFAjSwK7gARimWRqTFCwIkM2GgFJFSUSRBc2GgJJFSQSRDYaA0kVIhJESwKIARRLAhZLAlApTFBJvUUBRDEATwSBeIgA6hJESwG/UIAE74tm2UxQsCJDNhoBSRUlEkQXNhoCSRUkEkRLAYgA1jEASwKBeIgAuhJETBYoTFAiTwK7IkM2GgFJFSUSRBdJiACzMQBLAYE4iACXEkSxMgqyAEmyIYEDshAjsgGzFihMULxIIkM2GgFJFSUSRBdJiACDFihMUL5ESYEhWUsBFVIqTFCwIkM2GgFJFSUSRBdJiABiFihMUCMiuiNTKyNPAlQqTFCwIkM2GgFJFSUSRBc2GgJJFSQSREsBiAA4iABDKyNPAlQqTFCwIkM2GgFJFSUSRBdJiAAdiAA5FipMULAiQ4oCAYv+FihMUIv/JLpJFSQSRImKAQCL/xYoTFC9RQFEiYoCAYv+Fov/UClMUL5EI1OJigEBMgqL/3AARCEGTAmJigMAMQCL/hJEi/0WSYv+UClMUL1FAURJi/9QKUxQvUUBRChMUCMiuiNTFESL/Yv+iP+tFESL/Yv/iP+kFESJigQAI4v9MgoSQQBTi/yBWIj/bTEASwESRIv+MgoTRIv8iP+Oi/8Ii/wWKEsBUEmBIyW6F08DD0RMi/5QKUxQvUUBRCMiuiNTFESL/CEEiP8vE0EACYv8i/6I/0UURImL/jIKEkEAQ4v8gViI/xJJjAAxAEsBEkSL/BZJi/1QKUxQvUUBRChMUCMiuiNTFESL/CEEiP7qE0H/xIv8i/2I/wAURIv9iwASRIkxAIv8IQSI/s0SQQAZi/wWSYv9UClMUL1FAUSL/lApTFC9RQFEiYv8FihMUCIkujIDExREi/yL/Yv+iP7aiYoEAIv9MgoSQQARi/8Wi/5MUIAE3y55TkxQsImL/jIKEkEADYv/Fov9TFAnBExQsIkxAIv8IQSI/l4SQf/di/8Wi/2L/lBMUIAES4mY/ExQsImKAwIri/5QAYv/I1kjiwKLAQxBADSL/1cCAIsCJAskWEmLAKVBABSAAQGLAFBMUAGMAIsCIgiMAkL/0oABAUxQiwBQAYwAQv/pi/0WKExQIiS6iwASi/+MAYwAiYoEALEyCrIAi/+yFIv+shOL/bISi/yyEYEEshAjsgGziQ==", "clear": "C4EBQw=="}, "desc": "\n    ARC-0020 (Smart ASA) - Reference Implementation, multi-tenant variant\n\n    A single application controls many Smart ASAs. Each Controlled ASA state is a box\n    keyed by the ASA ID, each (Controlled ASA, Account) opt in is a box holding the\n    account frozen status. The opt in pays the holding box MBR, refunded on close out.\n\n    There is no Local State: opt in and close out are NoOp app calls, so an account\n    can hold any number of the Smart ASAs, and a Clear State leaves its holdings (and\n    their MBR) in place, to be closed out as usual.\n    ", "events": [{"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "uint64", "name": "total"}, {"type": "uint32", "name": "decimals"}, {"type": "bool", "name": "default_frozen"}, {"type": "string", "name": "unit_name"}, {"type": "string", "name": "name"}, {"type": "string", "name": "url"}, {"type": "byte[]", "name": "metadata_hash"}, {"type": "address", "name": "manager_addr"}, {"type": "address", "name": "reserve_addr"}, {"type": "address", "name": "freeze_addr"}, {"type": "address", "name": "clawback_addr"}], "name": "AssetConfig", "desc": "Smart ASA Configuration"}, {"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}, {"args": [{"type": "bool", "name": "asset_frozen"}], "name": "AssetFreeze", "desc": "Smart ASA Global Freeze Event"}, {"args": [{"type": "address", "name": "freeze_account"}, {"type": "bool", "name": "asset_frozen"}], "name": "AccountFreeze", "desc": "Smart ASA Account Freeze Event"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMzIgOCAxNTIgMTkzMDAgMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIGJ5dGVjYmxvY2sgMHg2MSAweDY4IDB4MTUxZjdjNzUgMHgwMCAweGY5ZmJmNWRjIDB4MDA5NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo0Ni00NwogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fYnl0ZV9zbGljZSA9PSBjZmcuR0xPQkFMX0JZVEVTLCBlcnIuV1JPTkdfR0xPQkFMX0JZVEVTCiAgICB0eG4gR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NDgKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV91aW50ID09IGNmZy5HTE9CQUxfVUlOVFMsIGVyci5XUk9OR19HTE9CQUxfVUlOVFMKICAgIHR4biBHbG9iYWxOdW1VaW50CiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NDkKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NTAKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX3VpbnQgPT0gY2ZnLkxPQ0FMX1VJTlRTLCBlcnIuV1JPTkdfTE9DQUxfVUlOVFMKICAgIHR4biBMb2NhbE51bVVpbnQKICAgICEKICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBVSW50cyBhbGxvY2F0aW9uCgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MjQtMzIKICAgIC8vIGNsYXNzIFNtYXJ0QXNhTXVsdGkoCiAgICAvLyAgICAgU21hcnRBc2FCYXNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDI0CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydAogICAgcHVzaGJ5dGVzcyAweDQ4NjQxNjQ1IDB4M2EwNDViZGMgMHhlN2VjZDVhOCAweGY4ODE5ZmViIDB4N2VhY2I3NzUgMHg0ZWNlNGI3NCAweDJjNTA4N2UyIDB4YTEzM2Q1ODEgMHhmZjUzYWRlZiAweDRhM2E5NGZkIDB4ZWQ2NDQ1MmYgMHgyZTliOTAzOCAweDk3OWI5OTcyIDB4NDhhNjNjYzkgMHg0NmFkMGQ1MiAvLyBtZXRob2QgImFzc2V0X29wdF9pbih1aW50NjQsYXhmZXIpdm9pZCIsIG1ldGhvZCAiYXNzZXRfY2xvc2Vfb3V0KHVpbnQ2NCxhZGRyZXNzKXZvaWQiLCBtZXRob2QgImFzc2V0X2NyZWF0ZSh1aW50NjQsdWludDMyLGJvb2wsc3RyaW5nLHN0cmluZyxzdHJpbmcsYnl0ZVtdLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MpdWludDY0IiwgbWV0aG9kICJhc3NldF9jb25maWcodWludDY0LHVpbnQ2NCx1aW50MzIsYm9vbCxzdHJpbmcsc3RyaW5nLHN0cmluZyxieXRlW10sYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJhc3NldF90cmFuc2Zlcih1aW50NjQsdWludDY0LGFkZHJlc3MsYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJhc3NldF90cmFuc2Zlcl9iYXRjaCh1aW50NjQsKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpW10pdm9pZCIsIG1ldGhvZCAiYXNzZXRfdHJhbnNmZXJfd2l0aF9wcm9vZih1aW50NjQsdWludDY0LGFkZHJlc3MsYWRkcmVzcyxieXRlWzMyXVtdLGJ5dGVbMzJdW10pdm9pZCIsIG1ldGhvZCAiYXNzZXRfZnJlZXplKHVpbnQ2NCxib29sKXZvaWQiLCBtZXRob2QgImFjY291bnRfZnJlZXplKHVpbnQ2NCxhZGRyZXNzLGJvb2wpdm9pZCIsIG1ldGhvZCAic2V0X3RyYW5zZmVyX2FsbG93bGlzdCh1aW50NjQsYnl0ZVszMl0pdm9pZCIsIG1ldGhvZCAiYXNzZXRfZGVzdHJveSh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X2NvbmZpZyh1aW50NjQpKHVpbnQ2NCx1aW50MzIsYm9vbCxzdHJpbmcsc3RyaW5nLHN0cmluZyxieXRlW10sYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcykiLCBtZXRob2QgImdldF9hc3NldF9pc19mcm96ZW4odWludDY0KWJvb2wiLCBtZXRob2QgImdldF9hY2NvdW50X2lzX2Zyb3plbih1aW50NjQsYWRkcmVzcylib29sIiwgbWV0aG9kICJnZXRfY2lyY3VsYXRpbmdfc3VwcGx5KHVpbnQ2NCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBhc3NldF9vcHRfaW4gYXNzZXRfY2xvc2Vfb3V0IGFzc2V0X2NyZWF0ZSBhc3NldF9jb25maWcgYXNzZXRfdHJhbnNmZXIgYXNzZXRfdHJhbnNmZXJfYmF0Y2ggYXNzZXRfdHJhbnNmZXJfd2l0aF9wcm9vZiBhc3NldF9mcmVlemUgYWNjb3VudF9mcmVlemUgc2V0X3RyYW5zZmVyX2FsbG93bGlzdCBhc3NldF9kZXN0cm95IGdldF9hc3NldF9jb25maWcgZ2V0X2Fzc2V0X2lzX2Zyb3plbiBnZXRfYWNjb3VudF9pc19mcm96ZW4gZ2V0X2NpcmN1bGF0aW5nX3N1cHBseQogICAgZXJyCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDI0OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcCAmJiBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhX211bHRpLmNvbnRyYWN0LlNtYXJ0QXNhTXVsdGkuYXNzZXRfb3B0X2luW3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfb3B0X2luOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToyMDUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ1NC00NTUKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gc2VsZi5hc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoYXNzZXQuaWQpCiAgICBkaWcgMQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDU5CiAgICAvLyBhc3NlcnQgY3RybF9hc2Ffb3B0X2luLnhmZXJfYXNzZXQuaWQgPT0gYXNzZXQuaWQsIGVyci5PUFRfSU5fV1JPTkdfQVNBCiAgICBkdXAKICAgIGd0eG5zIFhmZXJBc3NldAogICAgZGlnIDIKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIE9wdCBJbiBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjAKICAgIC8vIGFzc2VydCBjdHJsX2FzYV9vcHRfaW4uc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5PUFRfSU5fV1JPTkdfU0VOREVSCiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgT3B0IEluIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjEKICAgIC8vIGFzc2VydCBjdHJsX2FzYV9vcHRfaW4uYXNzZXRfcmVjZWl2ZXIgPT0gVHhuLnNlbmRlciwgZXJyLk9QVF9JTl9XUk9OR19SRUNFSVZFUgogICAgZHVwCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBPcHQgSW4gUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDYzCiAgICAvLyBjdHJsX2FzYV9vcHRfaW4uYXNzZXRfYW1vdW50ID09IDAKICAgIGR1cAogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgICEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDYyLTQ2NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBjdHJsX2FzYV9vcHRfaW4uYXNzZXRfYW1vdW50ID09IDAKICAgIC8vICksIGVyci5PUFRfSU5fV1JPTkdfQU1PVU5UICAjIFBlZGFudDogQ29udHJvbGxlZCBBU0EgaXMgZGVmYXVsdCBmcm96ZW4KICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgT3B0IEluIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjYKICAgIC8vIGN0cmxfYXNhX29wdF9pbi5hc3NldF9jbG9zZV90byA9PSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBndHhucyBBc3NldENsb3NlVG8KICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDY1LTQ2NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBjdHJsX2FzYV9vcHRfaW4uYXNzZXRfY2xvc2VfdG8gPT0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgLy8gKSwgZXJyLk9QVF9JTl9XUk9OR19DTE9TRV9UTwogICAgYXNzZXJ0IC8vIEZvcmJpZGRlbiBDbG9zZSBPdXQgb24gT3B0IEluCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2OAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuaXNfb3B0ZWRfaW4oCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2OC00NzAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyLmlzX29wdGVkX2luKAogICAgLy8gICAgIGFzc2V0CiAgICAvLyApLCBlcnIuTUlTU0lOR19DVFJMX0FTQSAgIyBQZWRhbnQ6IGN0cmxfYXNhX29wdF9pbiBpcyBjaGVja2VkIHByb3Blcmx5CiAgICBkaWcgMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbnRyb2xsZWQgQVNBCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gVHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiBjZmcuQ1RSTF9BU1NFVF9CT1hfUFJFRklYICsgb3AuaXRvYihhc3NldF9pZCkKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWNfMCAvLyAweDYxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTA1CiAgICAvLyBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkRFRkFVTFRfRlJPWkVOX09GRlNFVCwgMQogICAgcHVzaGludCA0NyAvLyA0NwogICAgaW50Y18wIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTA0LTEwNgogICAgLy8gZGVmYXVsdF9mcm96ZW4gPSBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkRFRkFVTFRfRlJPWkVOX09GRlNFVCwgMQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTA3CiAgICAvLyByZXR1cm4gYm9vbChvcC5nZXRiaXQoZGVmYXVsdF9mcm96ZW4sIDApKQogICAgaW50Y18xIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NzYtNDc4CiAgICAvLyAjIFByZXZlbnQgY2xvc2Utb3V0IGNpcmN1bXZlbnRpbmcgYWNjb3VudCBmcm96ZW4gc3RhdGUKICAgIC8vIGFzc2V0X2Zyb3plbj1zZWxmLmNvbmZpZ19kZWZhdWx0X2Zyb3plbihhc3NldC5pZCkKICAgIC8vIG9yIGFzc2V0LmJhbGFuY2UoVHhuLnNlbmRlcikgPiAwLAogICAgYm56IGFzc2V0X29wdF9pbl9ib29sX3RydWVAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NzgKICAgIC8vIG9yIGFzc2V0LmJhbGFuY2UoVHhuLnNlbmRlcikgPiAwLAogICAgdHhuIFNlbmRlcgogICAgZGlnIDMKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgb3B0ZWQgaW50byBhc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NzYtNDc4CiAgICAvLyAjIFByZXZlbnQgY2xvc2Utb3V0IGNpcmN1bXZlbnRpbmcgYWNjb3VudCBmcm96ZW4gc3RhdGUKICAgIC8vIGFzc2V0X2Zyb3plbj1zZWxmLmNvbmZpZ19kZWZhdWx0X2Zyb3plbihhc3NldC5pZCkKICAgIC8vIG9yIGFzc2V0LmJhbGFuY2UoVHhuLnNlbmRlcikgPiAwLAogICAgYnogYXNzZXRfb3B0X2luX2Jvb2xfZmFsc2VANAoKYXNzZXRfb3B0X2luX2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18wIC8vIDEKCmFzc2V0X29wdF9pbl9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjcyCiAgICAvLyByZXR1cm4gSG9sZGluZyhhc3NldF9pZD1hcmM0LlVJbnQ2NChhc3NldF9pZCksIGFjY291bnQ9YXJjNC5BZGRyZXNzKGFjY291bnQpKQogICAgZGlnIDEKICAgIGRpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNzAKICAgIC8vIHJldHVybiBzZWxmLmhvbGRpbmcoYXNzZXRfaWQsIGFjY291bnQpIGluIHNlbGYuaG9sZGluZ3MKICAgIGJ5dGVjXzEgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxODYtMTg3CiAgICAvLyAjIEdyb3VwOiBbaG9sZGluZyBib3ggTUJSIHBheW1lbnQsIENvbnRyb2xsZWQgQVNBIG9wdCBpbiwgU21hcnQgQVNBIG9wdCBpbl0KICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19ob2xkZXIoYXNzZXRfaWQsIGFjY291bnQpLCBlcnIuT1BUX0lOX0VYSVNUSU5HCiAgICAhCiAgICBhc3NlcnQgLy8gU21hcnQgQVNBIGFscmVhZHkgb3B0ZWQgaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTg4CiAgICAvLyBhc3NlcnQgVHhuLmdyb3VwX2luZGV4ID49IDIsIGVyci5PUFRfSU5fTUlTU0lOR19NQlIKICAgIHR4biBHcm91cEluZGV4CiAgICBwdXNoaW50IDIgLy8gMgogICAgPj0KICAgIGFzc2VydCAvLyBNaXNzaW5nIE9wdCBJbiBib3ggTUJSIHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTg5CiAgICAvLyBtYnJfcGF5bWVudCA9IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKFR4bi5ncm91cF9pbmRleCAtIDIpCiAgICB0eG4gR3JvdXBJbmRleAogICAgcHVzaGludCAyIC8vIDIKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTkwLTE5MQogICAgLy8gIyBUaGUgaG9sZGVyIHBheXMgdGhlIE1CUiwgc28gdGhlIGNsb3NlIG91dCByZWZ1bmRzIHdob2V2ZXIgcGFpZCBpdC4KICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5zZW5kZXIgPT0gYWNjb3VudCwgZXJyLk9QVF9JTl9XUk9OR19NQlJfU0VOREVSCiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgdW5jb3ZlciAzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE9wdCBJbiBib3ggTUJSIHBheW1lbnQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE5MwogICAgLy8gbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE5Mi0xOTQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLk9QVF9JTl9XUk9OR19NQlJfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBPcHQgSW4gYm94IE1CUiBwYXltZW50IFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBjZmcuSE9MRElOR19CT1hfTUJSLCBlcnIuT1BUX0lOX1dST05HX01CUl9BTU9VTlQKICAgIGd0eG5zIEFtb3VudAogICAgaW50YyA1IC8vIDE5MzAwCiAgICA+PQogICAgYXNzZXJ0IC8vIFdyb25nIE9wdCBJbiBib3ggTUJSIHBheW1lbnQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gc2VsZi5ob2xkaW5nc1tzZWxmLmhvbGRpbmcoYXNzZXRfaWQsIGFjY291bnQpXSA9IGFyYzQuQm9vbChhc3NldF9mcm96ZW4pCiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDMKICAgIHNldGJpdAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToyMDUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKYXNzZXRfb3B0X2luX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMSAvLyAwCiAgICBiIGFzc2V0X29wdF9pbl9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhX211bHRpLmNvbnRyYWN0LlNtYXJ0QXNhTXVsdGkuYXNzZXRfY2xvc2Vfb3V0W3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfY2xvc2Vfb3V0OgogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjIxOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMDcKICAgIC8vIGFzYV9jbG9zZV9vdXRfcmVsYXRpdmVfaWR4ID0gVHhuLmdyb3VwX2luZGV4ICsgMQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwOAogICAgLy8gYXNhX2Nsb3NlX291dF90eG4gPSBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbihhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeCkKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwOQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfaG9sZGVyKGNsb3NlX2Fzc2V0LmlkLCBUeG4uc2VuZGVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NzIKICAgIC8vIHJldHVybiBIb2xkaW5nKGFzc2V0X2lkPWFyYzQuVUludDY0KGFzc2V0X2lkKSwgYWNjb3VudD1hcmM0LkFkZHJlc3MoYWNjb3VudCkpCiAgICBkaWcgMgogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciA0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTcwCiAgICAvLyByZXR1cm4gc2VsZi5ob2xkaW5nKGFzc2V0X2lkLCBhY2NvdW50KSBpbiBzZWxmLmhvbGRpbmdzCiAgICBieXRlY18xIC8vIDB4NjgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwOQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfaG9sZGVyKGNsb3NlX2Fzc2V0LmlkLCBUeG4uc2VuZGVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMxMQogICAgLy8gR2xvYmFsLmdyb3VwX3NpemUgPiBhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeAogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgZGlnIDEKICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzEwLTMxMgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBHbG9iYWwuZ3JvdXBfc2l6ZSA+IGFzYV9jbG9zZV9vdXRfcmVsYXRpdmVfaWR4CiAgICAvLyApLCBlcnIuSU5WQUxJRF9DTE9TRV9PVVRfR1JPVVBfU0laRQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ2xvc2UgT3V0IGdyb3VwIHNpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzE3CiAgICAvLyBhc2FfY2xvc2Vfb3V0X3R4bi54ZmVyX2Fzc2V0LmlkID09IGNsb3NlX2Fzc2V0LmlkCiAgICBkdXAKICAgIGd0eG5zIFhmZXJBc3NldAogICAgZGlnIDIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMxNi0zMTgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYXNhX2Nsb3NlX291dF90eG4ueGZlcl9hc3NldC5pZCA9PSBjbG9zZV9hc3NldC5pZAogICAgLy8gKSwgZXJyLkNMT1NFX09VVF9XUk9OR19BU0EKICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgQ2xvc2UgT3V0IElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMxOQogICAgLy8gYXNzZXJ0IGFzYV9jbG9zZV9vdXRfdHhuLnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuQ0xPU0VfT1VUX1dST05HX1NFTkRFUgogICAgZHVwCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIENsb3NlIE91dCBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzIwCiAgICAvLyBhc3NlcnQgYXNhX2Nsb3NlX291dF90eG4uYXNzZXRfYW1vdW50ID09IFVJbnQ2NCgwKSwgZXJyLkNMT1NFX09VVF9XUk9OR19BTU9VTlQKICAgIGR1cAogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgICEKICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgQ2xvc2UgT3V0IEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMjIKICAgIC8vIGFzYV9jbG9zZV9vdXRfdHhuLmFzc2V0X2Nsb3NlX3RvICE9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGd0eG5zIEFzc2V0Q2xvc2VUbwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMjEtMzIzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGFzYV9jbG9zZV9vdXRfdHhuLmFzc2V0X2Nsb3NlX3RvICE9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIC8vICksIGVyci5DTE9TRV9PVVRfV1JPTkdfQ0xPU0VfVE8KICAgIGFzc2VydCAvLyBXcm9uZyBDbG9zZSBPdXQgb24gQ2xvc2UgT3V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc3NAogICAgLy8gKGNyZWF0b3IsIGV4aXN0cykgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9jcmVhdG9yKGNsb3NlX2Fzc2V0LmlkKQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzc1CiAgICAvLyBpZiBleGlzdHM6ICAjIFNtYXJ0IEFTQSBoYXMgbm90IGJlZW4gZGVzdHJveWVkCiAgICBieiBhc3NldF9jbG9zZV9vdXRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMyOQogICAgLy8gYXNhX2Nsb3NlX291dF9yZWxhdGl2ZV9pZHggPSBUeG4uZ3JvdXBfaW5kZXggKyAxCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzMwCiAgICAvLyBhc2FfY2xvc2Vfb3V0X3R4biA9IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uKGFzYV9jbG9zZV9vdXRfcmVsYXRpdmVfaWR4KQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzMyCiAgICAvLyBhc2FfY2xvc2Vfb3V0X3R4bi5hc3NldF9jbG9zZV90byA9PSBhc3NldF9jcmVhdG9yCiAgICBndHhucyBBc3NldENsb3NlVG8KICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMzMS0zMzMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYXNhX2Nsb3NlX291dF90eG4uYXNzZXRfY2xvc2VfdG8gPT0gYXNzZXRfY3JlYXRvcgogICAgLy8gKSwgZXJyLkNMT1NFX09VVF9XUk9OR19DTE9TRV9UTwogICAgYXNzZXJ0IC8vIFdyb25nIENsb3NlIE91dCBvbiBDbG9zZSBPdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzM0CiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhjbG9zZV9hc3NldC5pZCkKICAgIGRpZyA0CiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NzgKICAgIC8vIGNsb3NlX3RvICE9IGNyZWF0b3IKICAgIGRpZyAzCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NzctNzc5CiAgICAvLyBpZiAoCiAgICAvLyAgICAgY2xvc2VfdG8gIT0gY3JlYXRvcgogICAgLy8gKTogICMgSWYgY2xvc2Utb3V0IHRhcmdldCBpcyBub3QgdGhlIENyZWF0b3IsIHRoZW4gY2xvc2Utb3V0IHRhcmdldCBNVVNUIGJlIG9wdGVkLWluCiAgICBieiBhc3NldF9jbG9zZV9vdXRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjcyCiAgICAvLyByZXR1cm4gSG9sZGluZyhhc3NldF9pZD1hcmM0LlVJbnQ2NChhc3NldF9pZCksIGFjY291bnQ9YXJjNC5BZGRyZXNzKGFjY291bnQpKQogICAgZGlnIDEKICAgIGR1cAogICAgZGlnIDQKICAgIGR1cAogICAgY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gcmV0dXJuIHNlbGYuaG9sZGluZyhhc3NldF9pZCwgYWNjb3VudCkgaW4gc2VsZi5ob2xkaW5ncwogICAgYnl0ZWNfMSAvLyAweDY4CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3ODAKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihjbG9zZV9hc3NldC5pZCwgY2xvc2VfdG8pLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiBjZmcuQ1RSTF9BU1NFVF9CT1hfUFJFRklYICsgb3AuaXRvYihhc3NldF9pZCkKICAgIGJ5dGVjXzAgLy8gMHg2MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE1OC0xNjAKICAgIC8vIHJldHVybiBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkFMTE9XTElTVF9ST09UX09GRlNFVCwgY2ZnLkhBU0hfU0laRQogICAgLy8gKQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE1OQogICAgLy8gc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5BTExPV0xJU1RfUk9PVF9PRkZTRVQsIGNmZy5IQVNIX1NJWkUKICAgIGludGNfMCAvLyAxCiAgICBpbnRjXzIgLy8gMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTU4LTE2MAogICAgLy8gcmV0dXJuIG9wLkJveC5leHRyYWN0KAogICAgLy8gICAgIHNlbGYuY3RybF9hc3NldF9rZXkoYXNzZXRfaWQpLCBjZmcuQUxMT1dMSVNUX1JPT1RfT0ZGU0VULCBjZmcuSEFTSF9TSVpFCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNTQKICAgIC8vIHJldHVybiBzZWxmLmxvYWRfYWxsb3dsaXN0X3Jvb3QoYXNzZXRfaWQpICE9IEdsb2JhbC56ZXJvX2FkZHJlc3MuYnl0ZXMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzQwLTM0MQogICAgLy8gIyBBIGNsb3NlIG91dCBjYXJyaWVzIG5vIGFsbG93bGlzdCBwcm9vZnMsIHRoZSByZW1haW5kZXIgcmV0dXJucyB0byB0aGUgQ3JlYXRvci4KICAgIC8vIGFzc2VydCBub3Qgc2VsZi5oYXNfYWxsb3dsaXN0KGNsb3NlX2Fzc2V0LmlkKSwgZXJyLkFMTE9XTElTVF9DTE9TRV9PVVQKICAgICEKICAgIGFzc2VydCAvLyBUcmFuc2ZlciBhbGxvd2xpc3QgaXMgc2V0LCBjbG9zZSBvdXQgdG8gdGhlIENyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTQwCiAgICAvLyBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkdMT0JBTF9GUk9aRU5fT0ZGU0VULCAxCiAgICBpbnRjXzEgLy8gMAogICAgaW50Y18wIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTM5LTE0MQogICAgLy8gZ2xvYmFsX2Zyb3plbiA9IG9wLkJveC5leHRyYWN0KAogICAgLy8gICAgIHNlbGYuY3RybF9hc3NldF9rZXkoYXNzZXRfaWQpLCBjZmcuR0xPQkFMX0ZST1pFTl9PRkZTRVQsIDEKICAgIC8vICkKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gcmV0dXJuIGJvb2wob3AuZ2V0Yml0KGdsb2JhbF9mcm96ZW4sIDApKQogICAgaW50Y18xIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNDIKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19nbG9iYWxfZnJvemVuKGNsb3NlX2Fzc2V0LmlkKSwgZXJyLkdMT0JBTF9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBTbWFydCBBU0EgaXMgZ2xvYmFsIGZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNDMKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19hY2NvdW50X2Zyb3plbihjbG9zZV9hc3NldC5pZCwgVHhuLnNlbmRlciksIGVyci5TRU5ERVJfRlJPWkVOCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgNQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgaXNfYWNjb3VudF9mcm96ZW4KICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzQ0CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oY2xvc2VfYXNzZXQuaWQsIGNsb3NlX3RvKSwgZXJyLkNMT1NFX1RPX0ZST1pFTgogICAgc3dhcAogICAgY2FsbHN1YiBpc19hY2NvdW50X2Zyb3plbgogICAgIQogICAgYXNzZXJ0IC8vIENsb3NlIHRvIGFjY291bnQgaXMgZnJvemVuCgphc3NldF9jbG9zZV9vdXRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3ODMtNzg0CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIGFzc2V0X2Ftb3VudCA9IGNsb3NlX2Fzc2V0LmJhbGFuY2UoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGRpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDgKICAgIGFzc2VydCAvLyBhY2NvdW50IG9wdGVkIGludG8gYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzg4CiAgICAvLyBhc3NldF9zZW5kZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzg1LTc5MAogICAgLy8gc2VsZi5pbm5lcl9hc3NldF90cmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWNsb3NlX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9Y2xvc2VfdG8sCiAgICAvLyApCiAgICBkaWcgNQogICAgZHVwCiAgICBjb3ZlciA0CiAgICBjYWxsc3ViIGlubmVyX2Fzc2V0X3RyYW5zZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc5MQogICAgLy8gaWYgY2xvc2VfdG8gPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzczoKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYnogYXNzZXRfY2xvc2Vfb3V0X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3OTUKICAgIC8vIGFzc2V0X3NlbmRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc5NgogICAgLy8gYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICBkaWcgNQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3OTQtNzk3CiAgICAvLyBCdXJuKAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzkyLTc5OAogICAgLy8gIyBSZW1haW5kZXIgY2xvc2VkIHRvIHRoZSBDcmVhdG9yIGxlYXZlcyB0aGUgY2lyY3VsYXRpbmcgc3VwcGx5LgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEJ1cm4oCiAgICAvLyAgICAgICAgIGFzc2V0X3NlbmRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGJ5dGVjIDQgLy8gbWV0aG9kICJCdXJuKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCgphc3NldF9jbG9zZV9vdXRfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3OTkKICAgIC8vIHNlbGYuZGVsZXRlX2hvbGRpbmcoY2xvc2VfYXNzZXQuaWQsIFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjcyCiAgICAvLyByZXR1cm4gSG9sZGluZyhhc3NldF9pZD1hcmM0LlVJbnQ2NChhc3NldF9pZCksIGFjY291bnQ9YXJjNC5BZGRyZXNzKGFjY291bnQpKQogICAgZGlnIDIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MjAwLTIwMgogICAgLy8gIyBSZWZ1bmRzIHRoZSBob2xkaW5nIGJveCBNQlIgdG8gdGhlIGhvbGRlciwgd2hvIHBhaWQgaXQgb24gb3B0IGluLCBhbHNvIGZvcgogICAgLy8gIyBkZXN0cm95ZWQgU21hcnQgQVNBcy4KICAgIC8vIGRlbCBzZWxmLmhvbGRpbmdzW3NlbGYuaG9sZGluZyhhc3NldF9pZCwgYWNjb3VudCldCiAgICBieXRlY18xIC8vIDB4NjgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gaXR4bi5QYXltZW50KGZlZT0wLCByZWNlaXZlcj1hY2NvdW50LCBhbW91bnQ9Y2ZnLkhPTERJTkdfQk9YX01CUikuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGludGMgNSAvLyAxOTMwMAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMCAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MjE5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF9jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9jcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwbiAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZHVwbiAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgZHVwbiAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNwogICAgZHVwbiAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA4CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDkKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTAKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0MjYtNDI3CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsIGVyci5VTkFVVEhPUklaRUQKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzQ5LTM2MgogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB0b3RhbD1jZmcuVE9UQUwsCiAgICAvLyAgICAgZGVjaW1hbHM9Y2ZnLkRFQ0lNQUxTLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPWNmZy5ERUZBVUxUX0ZST1pFTiwKICAgIC8vICAgICB1bml0X25hbWU9Y2ZnLlVOSVRfTkFNRSwKICAgIC8vICAgICBhc3NldF9uYW1lPWNmZy5OQU1FLAogICAgLy8gICAgIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkKICAgIC8vIC5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTYKICAgIC8vIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2MAogICAgLy8gYWNjID0gQnl0ZXMoKQogICAgcHVzaGJ5dGVzIDB4Cgphc3NldF9jcmVhdGVfd2hpbGVfdG9wQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gd2hpbGUgbiA+IDA6CiAgICBkaWcgMQogICAgYnogYXNzZXRfY3JlYXRlX2FmdGVyX3doaWxlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTYyCiAgICAvLyBhY2MgPSBkaWdpdHNbbiAlIDEwXSArIGFjYwogICAgZGlnIDEKICAgIGR1cAogICAgcHVzaGludCAxMCAvLyAxMAogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNTkKICAgIC8vIGRpZ2l0cyA9IEJ5dGVzKGIiMDEyMzQ1Njc4OSIpCiAgICBwdXNoYnl0ZXMgMHgzMDMxMzIzMzM0MzUzNjM3MzgzOQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjIKICAgIC8vIGFjYyA9IGRpZ2l0c1tuICUgMTBdICsgYWNjCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMQogICAgZXh0cmFjdDMKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGJ1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjMKICAgIC8vIG4gLy89IDEwCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICAvCiAgICBidXJ5IDIKICAgIGIgYXNzZXRfY3JlYXRlX3doaWxlX3RvcEA0Cgphc3NldF9jcmVhdGVfYWZ0ZXJfd2hpbGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTY0CiAgICAvLyByZXR1cm4gYWNjIG9yIEJ5dGVzKGIiMCIpCiAgICBkdXBuIDIKICAgIGxlbgogICAgcHVzaGJ5dGVzIDB4MzAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTYKICAgIC8vIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgcHVzaGJ5dGVzIDB4NjE2YzY3NmY3MjYxNmU2NDNhMmYyZjYxNzA3MDJmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzU3CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTgtMzYwCiAgICAvLyByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VVJMCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1NQogICAgLy8gYXNzZXRfbmFtZT1jZmcuTkFNRSwKICAgIHB1c2hieXRlcyAiQVJDLTIwIFNtYXJ0IEFTQSIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1NAogICAgLy8gdW5pdF9uYW1lPWNmZy5VTklUX05BTUUsCiAgICBwdXNoYnl0ZXMgIkFSQy0yMCIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTMKICAgIC8vIGRlZmF1bHRfZnJvemVuPWNmZy5ERUZBVUxUX0ZST1pFTiwKICAgIGludGNfMCAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTIKICAgIC8vIGRlY2ltYWxzPWNmZy5ERUNJTUFMUywKICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzUxCiAgICAvLyB0b3RhbD1jZmcuVE9UQUwsCiAgICBpbnRjIDYgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNDkKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTAKICAgIC8vIGZlZT0wLAogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0OS0zNjIKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgdG90YWw9Y2ZnLlRPVEFMLAogICAgLy8gICAgIGRlY2ltYWxzPWNmZy5ERUNJTUFMUywKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1jZmcuREVGQVVMVF9GUk9aRU4sCiAgICAvLyAgICAgdW5pdF9uYW1lPWNmZy5VTklUX05BTUUsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1jZmcuTkFNRSwKICAgIC8vICAgICB1cmw9Y2ZnLkFQUF9CSU5ESU5HICsgc2VsZi5pdG9hKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApCiAgICAvLyAuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0OS0zNjMKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgdG90YWw9Y2ZnLlRPVEFMLAogICAgLy8gICAgIGRlY2ltYWxzPWNmZy5ERUNJTUFMUywKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1jZmcuREVGQVVMVF9GUk9aRU4sCiAgICAvLyAgICAgdW5pdF9uYW1lPWNmZy5VTklUX05BTUUsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1jZmcuTkFNRSwKICAgIC8vICAgICB1cmw9Y2ZnLkFQUF9CSU5ESU5HICsgc2VsZi5pdG9hKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApCiAgICAvLyAuc3VibWl0KCkKICAgIC8vIC5jcmVhdGVkX2Fzc2V0LmlkCiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQzNC00NDYKICAgIC8vIEFzc2V0Q29uZmlnKAogICAgLy8gICAgIHRvdGFsPXRvdGFsLAogICAgLy8gICAgIGRlY2ltYWxzPWRlY2ltYWxzLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPWRlZmF1bHRfZnJvemVuLAogICAgLy8gICAgIHVuaXRfbmFtZT11bml0X25hbWUsCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIHVybD11cmwsCiAgICAvLyAgICAgbWV0YWRhdGFfaGFzaD1tZXRhZGF0YV9oYXNoLAogICAgLy8gICAgIG1hbmFnZXJfYWRkcj1tYW5hZ2VyX2FkZHIsCiAgICAvLyAgICAgcmVzZXJ2ZV9hZGRyPXJlc2VydmVfYWRkciwKICAgIC8vICAgICBmcmVlemVfYWRkcj1mcmVlemVfYWRkciwKICAgIC8vICAgICBjbGF3YmFja19hZGRyPWNsYXdiYWNrX2FkZHIsCiAgICAvLyApLAogICAgZGlnIDE2CiAgICBkaWcgMTYKICAgIGNvbmNhdAogICAgZGlnIDE1CiAgICBjb25jYXQKICAgIGJ5dGVjIDUgLy8gMHgwMDk1CiAgICBjb25jYXQKICAgIHB1c2hpbnQgMTQ5IC8vIDE0OQogICAgZGlnIDE0CiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgZGlnIDEyCiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgZGlnIDEwCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICBkaWcgNwogICAgY29uY2F0CiAgICBkaWcgNgogICAgY29uY2F0CiAgICBkaWcgNQogICAgY29uY2F0CiAgICBkaWcgNAogICAgY29uY2F0CiAgICBkaWcgMTQKICAgIGNvbmNhdAogICAgZGlnIDEyCiAgICBjb25jYXQKICAgIGRpZyAxMAogICAgY29uY2F0CiAgICBkaWcgOAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5Ojg0LTg4CiAgICAvLyBzZWxmLmN0cmxfYXNzZXRzW2Fzc2V0X2lkXSA9IENvbnRyb2xsZWRBc3NldCgKICAgIC8vICAgICBnbG9iYWxfZnJvemVuPWFyYzQuQm9vbCgpLAogICAgLy8gICAgIGFsbG93bGlzdF9yb290PUhhc2guZnJvbV9ieXRlcyhHbG9iYWwuemVyb19hZGRyZXNzLmJ5dGVzKSwKICAgIC8vICAgICBhc3NldF9jb25maWc9YXNzZXRfY29uZmlnLmNvcHkoKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQkQpCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6ODQKICAgIC8vIHNlbGYuY3RybF9hc3NldHNbYXNzZXRfaWRdID0gQ29udHJvbGxlZEFzc2V0KAogICAgc3dhcAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDYxCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5Ojg0LTg4CiAgICAvLyBzZWxmLmN0cmxfYXNzZXRzW2Fzc2V0X2lkXSA9IENvbnRyb2xsZWRBc3NldCgKICAgIC8vICAgICBnbG9iYWxfZnJvemVuPWFyYzQuQm9vbCgpLAogICAgLy8gICAgIGFsbG93bGlzdF9yb290PUhhc2guZnJvbV9ieXRlcyhHbG9iYWwuemVyb19hZGRyZXNzLmJ5dGVzKSwKICAgIC8vICAgICBhc3NldF9jb25maWc9YXNzZXRfY29uZmlnLmNvcHkoKSwKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICB1bmNvdmVyIDIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF9jb25maWdbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9jb25maWc6CiAgICBpbnRjXzEgLy8gMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ5NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5ib29sCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgIGR1cAogICAgY292ZXIgMwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgIGR1cAogICAgY292ZXIgMwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgIGR1cAogICAgY292ZXIgMwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA4CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgOQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDExCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTMwCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhhc3NldF9pZCkKICAgIGRpZyAxCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MzEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX21hbmFnZXJfYWRkcigKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTExCiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShhc3NldF9pZCwgVUludDY0KGNmZy5NQU5BR0VSX0FERFJfT0ZGU0VUKSkKICAgIGRpZyAyCiAgICBwdXNoaW50IDU2IC8vIDU2CiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUzMS01MzMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX21hbmFnZXJfYWRkcigKICAgIC8vICAgICBhc3NldF9pZAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRF9NQU5BR0VSCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjExNQogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoYXNzZXRfaWQsIFVJbnQ2NChjZmcuUkVTRVJWRV9BRERSX09GRlNFVCkpCiAgICBzd2FwCiAgICBwdXNoaW50IDg4IC8vIDg4CiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTM1CiAgICAvLyBpZiByZXNlcnZlX2FkZHIgIT0gY3VycmVudF9yZXNlcnZlX2FkZHI6CiAgICAhPQogICAgYnogYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MzYKICAgIC8vIGFzc2VydCBjdXJyZW50X3Jlc2VydmVfYWRkciAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCBlcnIuRElTQUJMRURfUkVTRVJWRQogICAgZHVwCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gUmVzZXJ2ZSBBZGRyZXNzIGhhcyBiZWVuIGRlbGV0ZWQKCmFzc2V0X2NvbmZpZ19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjExOQogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoYXNzZXRfaWQsIFVJbnQ2NChjZmcuRlJFRVpFX0FERFJfT0ZGU0VUKSkKICAgIGRpZyAxNQogICAgcHVzaGludCAxMjAgLy8gMTIwCiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICBkdXAKICAgIGJ1cnkgMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTM4CiAgICAvLyBpZiBmcmVlemVfYWRkciAhPSBjdXJyZW50X2ZyZWV6ZV9hZGRyOgogICAgZGlnIDMKICAgICE9CiAgICBieiBhc3NldF9jb25maWdfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gYXNzZXJ0IGN1cnJlbnRfZnJlZXplX2FkZHIgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgZXJyLkRJU0FCTEVEX0ZSRUVaRQogICAgZGlnIDE2CiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gRnJlZXplIEFkZHJlc3MgaGFzIGJlZW4gZGVsZXRlZAoKYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTIzCiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShhc3NldF9pZCwgVUludDY0KGNmZy5DTEFXQkFDS19BRERSX09GRlNFVCkpCiAgICBkaWcgMTUKICAgIGludGMgNCAvLyAxNTIKICAgIGNhbGxzdWIgY29uZmlnX3JvbGUKICAgIGR1cAogICAgYnVyeSAxOQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NDEKICAgIC8vIGlmIGNsYXdiYWNrX2FkZHIgIT0gY3VycmVudF9jbGF3YmFja19hZGRyOgogICAgZGlnIDIKICAgICE9CiAgICBieiBhc3NldF9jb25maWdfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU0MgogICAgLy8gYXNzZXJ0IGN1cnJlbnRfY2xhd2JhY2tfYWRkciAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCBlcnIuRElTQUJMRURfQ0xBV0JBQ0sKICAgIGRpZyAxNwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIENsYXdiYWNrIEFkZHJlc3MgaGFzIGJlZW4gZGVsZXRlZAoKYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQzCiAgICAvLyBhc3NlcnQgdG90YWwgPj0gc2VsZi5jaXJjdWxhdGluZ19zdXBwbHkoY29uZmlnX2Fzc2V0KSwgZXJyLklOVkFMSURfVE9UQUwKICAgIGRpZyAxNQogICAgZHVwCiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgaXRvYgogICAgZGlnIDE2CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYj49CiAgICBhc3NlcnQgLy8gSW52YWxpZCBUb3RhbCwgbXVzdCBiZSA+PSBjaXJjdWxhdGluZyBzdXBwbHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQ1LTU1OAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBhc3NldF9jb25maWcgPSBBc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD10b3RhbCwKICAgIC8vICAgICBkZWNpbWFscz1kZWNpbWFscywKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1kZWZhdWx0X2Zyb3plbiwKICAgIC8vICAgICB1bml0X25hbWU9dW5pdF9uYW1lLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICB1cmw9dXJsLAogICAgLy8gICAgIG1ldGFkYXRhX2hhc2g9bWV0YWRhdGFfaGFzaC5jb3B5KCksCiAgICAvLyAgICAgbWFuYWdlcl9hZGRyPW1hbmFnZXJfYWRkciwKICAgIC8vICAgICByZXNlcnZlX2FkZHI9cmVzZXJ2ZV9hZGRyLAogICAgLy8gICAgIGZyZWV6ZV9hZGRyPWZyZWV6ZV9hZGRyLAogICAgLy8gICAgIGNsYXdiYWNrX2FkZHI9Y2xhd2JhY2tfYWRkciwKICAgIC8vICkKICAgIGRpZyAxNQogICAgY29uY2F0CiAgICBkaWcgMTQKICAgIGNvbmNhdAogICAgYnl0ZWMgNSAvLyAweDAwOTUKICAgIGNvbmNhdAogICAgcHVzaGludCAxNDkgLy8gMTQ5CiAgICBkaWcgMTMKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkaWcgMTEKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkaWcgOQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgZGlnIDYKICAgIGNvbmNhdAogICAgZGlnIDUKICAgIGNvbmNhdAogICAgZGlnIDQKICAgIGNvbmNhdAogICAgZGlnIDMKICAgIGNvbmNhdAogICAgZGlnIDEzCiAgICBjb25jYXQKICAgIGRpZyAxMQogICAgY29uY2F0CiAgICBkaWcgOQogICAgY29uY2F0CiAgICBkaWcgNwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gY3RybF9hc3NldCA9IHNlbGYuY3RybF9hc3NldHNbYXNzZXRfaWRdLmNvcHkoKQogICAgc3dhcAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDYxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3RybF9hc3NldHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gY3RybF9hc3NldC5hc3NldF9jb25maWcgPSBhc3NldF9jb25maWcuY29weSgpCiAgICBkdXAKICAgIHB1c2hpbnQgMzMgLy8gMzMKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAogICAgc3dhcAogICAgZXh0cmFjdDMKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTMzLTEzNAogICAgLy8gIyBEeW5hbWljIGZpZWxkcyBtYXkgY2hhbmdlIHRoZSBlbmNvZGVkIHNpemUsIHRoZSBib3ggaXMgcmUtY3JlYXRlZC4KICAgIC8vIGRlbCBzZWxmLmN0cmxfYXNzZXRzW2Fzc2V0X2lkXQogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxMzUKICAgIC8vIHNlbGYuY3RybF9hc3NldHNbYXNzZXRfaWRdID0gY3RybF9hc3NldC5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTYwCiAgICAvLyBhcmM0LmVtaXQoYXNzZXRfY29uZmlnKQogICAgcHVzaGJ5dGVzIDB4ZTEwYzVhNDcgLy8gbWV0aG9kICJBc3NldENvbmZpZyh1aW50NjQsdWludDMyLGJvb2wsc3RyaW5nLHN0cmluZyxzdHJpbmcsYnl0ZVtdLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDk1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF90cmFuc2Zlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X3RyYW5zZmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTc5LTU4MAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyh4ZmVyX2Fzc2V0LmlkKQogICAgZGlnIDMKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU4NQogICAgLy8gYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTgxLTU4NgogICAgLy8gc2VsZi5hc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBhc3NldF9pZD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDMKICAgIGRpZyAzCiAgICBkaWcgMwogICAgY2FsbHN1YiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1ODgtNTk0CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHNlbGYuaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDEKICAgIGRpZyA0CiAgICBkaWcgNAogICAgY2FsbHN1YiBpbm5lcl9hc3NldF90cmFuc2ZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1OTUtNjAwCiAgICAvLyBzZWxmLmVtaXRfdHJhbnNmZXJfZXZlbnQoCiAgICAvLyAgICAgYXNzZXRfaWQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gKQogICAgY2FsbHN1YiBlbWl0X3RyYW5zZmVyX2V2ZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU2MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXRfdHJhbnNmZXJfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF90cmFuc2Zlcl9iYXRjaDoKICAgIGludGNfMSAvLyAwCiAgICBkdXAKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBwdXNoaW50IDcyIC8vIDcyCiAgICAqCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuYXZtX3R5cGVzLlRyYW5zZmVyTGVnPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MTMtNjE0CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKHhmZXJfYXNzZXQuaWQpCiAgICBzd2FwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MTUKICAgIC8vIGFzc2VydCBsZWdzLmxlbmd0aCwgZXJyLkVNUFRZX0JBVENICiAgICBkdXAKICAgIGFzc2VydCAvLyBFbXB0eSB0cmFuc2ZlciBiYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MTYKICAgIC8vIGFzc2VydCBsZWdzLmxlbmd0aCA8PSBjZmcuTUFYX0JBVENIX0xFR1MsIGVyci5PVkVSU0laRURfQkFUQ0gKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gVHJhbnNmZXIgYmF0Y2ggZXhjZWVkcyBtYXggaW5uZXIgZ3JvdXAgc2l6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MTgtNjE5CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIG1pbnRlZCA9IFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjIwCiAgICAvLyBmb3IgaWR4IGluIHVyYW5nZShsZWdzLmxlbmd0aCk6CiAgICBkdXAKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjIwCiAgICAvLyBmb3IgaWR4IGluIHVyYW5nZShsZWdzLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBhc3NldF90cmFuc2Zlcl9iYXRjaF9hZnRlcl9mb3JAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjIxLTYyMgogICAgLy8gbGVnID0gbGVnc1tpZHhdLmNvcHkoKQogICAgLy8gYXNzZXRfc2VuZGVyID0gbGVnLmFzc2V0X3NlbmRlci5uYXRpdmUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIHB1c2hpbnQgNzIgLy8gNzIKICAgICoKICAgIHB1c2hpbnQgNzIgLy8gNzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyMwogICAgLy8gYXNzZXRfcmVjZWl2ZXIgPSBsZWcuYXNzZXRfcmVjZWl2ZXIubmF0aXZlCiAgICBkdXAKICAgIGV4dHJhY3QgMzIgMzIKICAgIGJ1cnkgMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjI0CiAgICAvLyBhc3NldF9hbW91bnQgPSBsZWcuYXNzZXRfYW1vdW50Lm5hdGl2ZQogICAgcHVzaGludCA2NCAvLyA2NAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MjUKICAgIC8vIGlmIGFzc2V0X3NlbmRlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzOgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBieiBhc3NldF90cmFuc2Zlcl9iYXRjaF9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MjYtNjI3CiAgICAvLyAjIElubmVyIHRyYW5zZmVycyBhcmUgc3VibWl0dGVkIGFmdGVyIHRoZSBsb29wLCBzbyBvdmVyLW1pbnRpbmcgaXMgY2hlY2tlZCBhZ2FpbnN0IHRoZSBiYXRjaCB0b3RhbC4KICAgIC8vIG1pbnRlZCArPSBhc3NldF9hbW91bnQKICAgIGRpZyAxCiAgICBkaWcgNgogICAgKwogICAgZHVwCiAgICBidXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjI4LTYzMwogICAgLy8gc2VsZi5hc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBhc3NldF9pZD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PW1pbnRlZCwKICAgIC8vICkKICAgIGRpZyA1CiAgICBkaWcgOAogICAgZGlnIDEwCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjQyCiAgICAvLyBpZiBpZHg6CiAgICBkdXAKICAgIGJ6IGFzc2V0X3RyYW5zZmVyX2JhdGNoX2Vsc2VfYm9keUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY0MwogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAoKYXNzZXRfdHJhbnNmZXJfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NDYKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3R5cGVfZW51bShUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlcikKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NDcKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2ZlZSgwKQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY0OAogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfeGZlcl9hc3NldCh4ZmVyX2Fzc2V0KQogICAgZGlnIDQKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjQ5CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9hbW91bnQoYXNzZXRfYW1vdW50KQogICAgZGlnIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NTAKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X3NlbmRlcihhc3NldF9zZW5kZXIpCiAgICBkaWcgOAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY1MQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfYXNzZXRfcmVjZWl2ZXIoYXNzZXRfcmVjZWl2ZXIpCiAgICBkaWcgMTAKICAgIGR1cAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY1Mi02NTcKICAgIC8vIHNlbGYuZW1pdF90cmFuc2Zlcl9ldmVudCgKICAgIC8vICAgICBhc3NldF9pZD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudCwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBlbWl0X3RyYW5zZmVyX2V2ZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyMAogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UobGVncy5sZW5ndGgpOgogICAgZHVwCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGFzc2V0X3RyYW5zZmVyX2JhdGNoX2Zvcl9oZWFkZXJAMgoKYXNzZXRfdHJhbnNmZXJfYmF0Y2hfZWxzZV9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY0NQogICAgLy8gb3AuSVR4bkNyZWF0ZS5iZWdpbigpCiAgICBpdHhuX2JlZ2luCiAgICBiIGFzc2V0X3RyYW5zZmVyX2JhdGNoX2FmdGVyX2lmX2Vsc2VAOQoKYXNzZXRfdHJhbnNmZXJfYmF0Y2hfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYzNS02NDAKICAgIC8vIHNlbGYuYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoCiAgICAvLyAgICAgYXNzZXRfaWQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQsCiAgICAvLyApCiAgICBkaWcgNAogICAgZGlnIDcKICAgIGRpZyA5CiAgICBkaWcgOAogICAgY2FsbHN1YiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgYiBhc3NldF90cmFuc2Zlcl9iYXRjaF9hZnRlcl9pZl9lbHNlQDYKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2FmdGVyX2ZvckAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjU4CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmFzc2V0X3RyYW5zZmVyX3dpdGhfcHJvb2Zbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF90cmFuc2Zlcl93aXRoX3Byb29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2ODEtNjgyCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKHhmZXJfYXNzZXQuaWQpCiAgICBkaWcgNQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiBjZmcuQ1RSTF9BU1NFVF9CT1hfUFJFRklYICsgb3AuaXRvYihhc3NldF9pZCkKICAgIGRpZyA1CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4NjEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNTkKICAgIC8vIHNlbGYuY3RybF9hc3NldF9rZXkoYXNzZXRfaWQpLCBjZmcuQUxMT1dMSVNUX1JPT1RfT0ZGU0VULCBjZmcuSEFTSF9TSVpFCiAgICBpbnRjXzAgLy8gMQogICAgaW50Y18yIC8vIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE1OC0xNjAKICAgIC8vIHJldHVybiBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkFMTE9XTElTVF9ST09UX09GRlNFVCwgY2ZnLkhBU0hfU0laRQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTU0CiAgICAvLyByZXR1cm4gc2VsZi5sb2FkX2FsbG93bGlzdF9yb290KGFzc2V0X2lkKSAhPSBHbG9iYWwuemVyb19hZGRyZXNzLmJ5dGVzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY4MwogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX2FsbG93bGlzdCh4ZmVyX2Fzc2V0LmlkKSwgZXJyLk1JU1NJTkdfQUxMT1dMSVNUCiAgICBhc3NlcnQgLy8gVHJhbnNmZXIgYWxsb3dsaXN0IGlzIG5vdCBzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Njg0LTY4OAogICAgLy8gc2VsZi5hc3NlcnRfcmVndWxhcl90cmFuc2Zlcl9wcmVjb25kaXRpb25zKAogICAgLy8gICAgIGFzc2V0X2lkPXhmZXJfYXNzZXQuaWQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICkKICAgIGRpZyA1CiAgICBkaWcgNAogICAgZGlnIDQKICAgIGNhbGxzdWIgYXNzZXJ0X3JlZ3VsYXJfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2ODktNjkxCiAgICAvLyBhc3NlcnQgc2VsZi5pc19hbGxvd2xpc3RlZCgKICAgIC8vICAgICB4ZmVyX2Fzc2V0LmlkLCBhc3NldF9zZW5kZXIsIHNlbmRlcl9wcm9vZgogICAgLy8gKSwgZXJyLlNFTkRFUl9OT1RfQUxMT1dMSVNURUQKICAgIGRpZyA1CiAgICBkaWcgNAogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGlzX2FsbG93bGlzdGVkCiAgICBwb3AKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBub3QgYWxsb3dsaXN0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjkyLTY5NAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfYWxsb3dsaXN0ZWQoCiAgICAvLyAgICAgeGZlcl9hc3NldC5pZCwgYXNzZXRfcmVjZWl2ZXIsIHJlY2VpdmVyX3Byb29mCiAgICAvLyApLCBlcnIuUkVDRUlWRVJfTk9UX0FMTE9XTElTVEVECiAgICBkaWcgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBpc19hbGxvd2xpc3RlZAogICAgcG9wCiAgICBhc3NlcnQgLy8gUmVjZWl2ZXIgYWNjb3VudCBpcyBub3QgYWxsb3dsaXN0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Njk5CiAgICAvLyBhc3NldF9hbW91bnQ9YXNzZXRfYW1vdW50Lm5hdGl2ZSwKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2OTYtNzAyCiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHNlbGYuaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGlubmVyX2Fzc2V0X3RyYW5zZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY2MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXRfZnJlZXplW3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfZnJlZXplOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MDQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzEzLTcxNAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBkaWcgMQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzE1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19mcmVlemVfYWRkcigKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTE5CiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShhc3NldF9pZCwgVUludDY0KGNmZy5GUkVFWkVfQUREUl9PRkZTRVQpKQogICAgZGlnIDIKICAgIHB1c2hpbnQgMTIwIC8vIDEyMAogICAgY2FsbHN1YiBjb25maWdfcm9sZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MTUtNzE3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19mcmVlemVfYWRkcigKICAgIC8vICAgICBmcmVlemVfYXNzZXQuaWQKICAgIC8vICksIGVyci5VTkFVVEhPUklaRURfRlJFRVpFCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBGcmVlemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiBjZmcuQ1RSTF9BU1NFVF9CT1hfUFJFRklYICsgb3AuaXRvYihhc3NldF9pZCkKICAgIHN3YXAKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHg2MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gY2ZnLkdMT0JBTF9GUk9aRU5fT0ZGU0VULAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTQ2LTE1MAogICAgLy8gb3AuQm94LnJlcGxhY2UoCiAgICAvLyAgICAgc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksCiAgICAvLyAgICAgY2ZnLkdMT0JBTF9GUk9aRU5fT0ZGU0VULAogICAgLy8gICAgIGFyYzQuQm9vbChhc3NldF9mcm96ZW4pLmJ5dGVzLAogICAgLy8gKQogICAgZGlnIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcyMQogICAgLy8gYXJjNC5lbWl0KEFzc2V0RnJlZXplKGFzc2V0X2Zyb3plbj1hc3NldF9mcm96ZW4pKQogICAgcHVzaGJ5dGVzIDB4NjI5OTY0NmEgLy8gbWV0aG9kICJBc3NldEZyZWV6ZShib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYWNjb3VudF9mcmVlemVbcm91dGluZ10oKSAtPiB2b2lkOgphY2NvdW50X2ZyZWV6ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzM1LTczNgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBkaWcgMgogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NzIKICAgIC8vIHJldHVybiBIb2xkaW5nKGFzc2V0X2lkPWFyYzQuVUludDY0KGFzc2V0X2lkKSwgYWNjb3VudD1hcmM0LkFkZHJlc3MoYWNjb3VudCkpCiAgICBkaWcgMgogICAgaXRvYgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNzAKICAgIC8vIHJldHVybiBzZWxmLmhvbGRpbmcoYXNzZXRfaWQsIGFjY291bnQpIGluIHNlbGYuaG9sZGluZ3MKICAgIGJ5dGVjXzEgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MzcKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihmcmVlemVfYXNzZXQuaWQsIGZyZWV6ZV9hY2NvdW50KSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjczOAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfZnJlZXplX2FkZHIoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjExOQogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoYXNzZXRfaWQsIFVJbnQ2NChjZmcuRlJFRVpFX0FERFJfT0ZGU0VUKSkKICAgIHVuY292ZXIgNAogICAgcHVzaGludCAxMjAgLy8gMTIwCiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjczOC03NDAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2ZyZWV6ZV9hZGRyKAogICAgLy8gICAgIGZyZWV6ZV9hc3NldC5pZAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRF9GUkVFWkUKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIEZyZWV6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxODAKICAgIC8vIHNlbGYuaG9sZGluZ3Nbc2VsZi5ob2xkaW5nKGFzc2V0X2lkLCBhY2NvdW50KV0gPSBhcmM0LkJvb2woYXNzZXRfZnJvemVuKQogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzQ3LTc0OQogICAgLy8gQWNjb3VudEZyZWV6ZSgKICAgIC8vICAgICBmcmVlemVfYWNjb3VudD1hcmM0LkFkZHJlc3MoZnJlZXplX2FjY291bnQpLCBhc3NldF9mcm96ZW49YXNzZXRfZnJvemVuCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzQ2LTc1MAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEFjY291bnRGcmVlemUoCiAgICAvLyAgICAgICAgIGZyZWV6ZV9hY2NvdW50PWFyYzQuQWRkcmVzcyhmcmVlemVfYWNjb3VudCksIGFzc2V0X2Zyb3plbj1hc3NldF9mcm96ZW4KICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhlZjhiNjZkOSAvLyBtZXRob2QgIkFjY291bnRGcmVlemUoYWRkcmVzcyxib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcyMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2Uuc2V0X3RyYW5zZmVyX2FsbG93bGlzdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF90cmFuc2Zlcl9hbGxvd2xpc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc1MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzYxLTc2MgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBkaWcgMQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzYzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19mcmVlemVfYWRkcigKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTE5CiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShhc3NldF9pZCwgVUludDY0KGNmZy5GUkVFWkVfQUREUl9PRkZTRVQpKQogICAgZGlnIDIKICAgIHB1c2hpbnQgMTIwIC8vIDEyMAogICAgY2FsbHN1YiBjb25maWdfcm9sZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NjMtNzY1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19mcmVlemVfYWRkcigKICAgIC8vICAgICBmcmVlemVfYXNzZXQuaWQKICAgIC8vICksIGVyci5VTkFVVEhPUklaRURfRlJFRVpFCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBGcmVlemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiBjZmcuQ1RSTF9BU1NFVF9CT1hfUFJFRklYICsgb3AuaXRvYihhc3NldF9pZCkKICAgIHN3YXAKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHg2MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE2NQogICAgLy8gc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5BTExPV0xJU1RfUk9PVF9PRkZTRVQsIGFsbG93bGlzdF9yb290CiAgICBpbnRjXzAgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNjQtMTY2CiAgICAvLyBvcC5Cb3gucmVwbGFjZSgKICAgIC8vICAgICBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkFMTE9XTElTVF9ST09UX09GRlNFVCwgYWxsb3dsaXN0X3Jvb3QKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzUyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF9kZXN0cm95W3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzZXRfZGVzdHJveToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODEzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODIxLTgyMgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhkZXN0cm95X2Fzc2V0LmlkKQogICAgZHVwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MjMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX21hbmFnZXJfYWRkcigKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTExCiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShhc3NldF9pZCwgVUludDY0KGNmZy5NQU5BR0VSX0FERFJfT0ZGU0VUKSkKICAgIGRpZyAxCiAgICBwdXNoaW50IDU2IC8vIDU2CiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgyMy04MjUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX21hbmFnZXJfYWRkcigKICAgIC8vICAgICBkZXN0cm95X2Fzc2V0LmlkCiAgICAvLyApLCBlcnIuVU5BVVRIT1JJWkVEX01BTkFHRVIKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIE1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzg2LTM5MAogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICBjb25maWdfYXNzZXQ9ZGVzdHJveV9hc3NldCwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzg5CiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgZHVwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM4NgogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIHB1c2hpbnQgMyAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM4NwogICAgLy8gZmVlPTAsCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzg2LTM5MAogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICBjb25maWdfYXNzZXQ9ZGVzdHJveV9hc3NldCwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBkZWwgc2VsZi5jdHJsX2Fzc2V0c1thc3NldF9pZF0KICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHg2MQogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODEzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5nZXRfYXNzZXRfY29uZmlnW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2Fzc2V0X2NvbmZpZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODMxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODQyLTg0MwogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhhc3NldC5pZCkKICAgIGR1cAogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTI3CiAgICAvLyByZXR1cm4gc2VsZi5jdHJsX2Fzc2V0c1thc3NldF9pZF0uYXNzZXRfY29uZmlnLmNvcHkoKQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDYxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN0cmxfYXNzZXRzIGVudHJ5IGV4aXN0cwogICAgZHVwCiAgICBwdXNoaW50IDMzIC8vIDMzCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIGxlbgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmdldF9hc3NldF9pc19mcm96ZW5bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXNzZXRfaXNfZnJvemVuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NTktODYwCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGZyZWV6ZV9hc3NldC5pZCkKICAgIGR1cAogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiBjZmcuQ1RSTF9BU1NFVF9CT1hfUFJFRklYICsgb3AuaXRvYihhc3NldF9pZCkKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHg2MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5HTE9CQUxfRlJPWkVOX09GRlNFVCwgMQogICAgaW50Y18xIC8vIDAKICAgIGludGNfMCAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjEzOS0xNDEKICAgIC8vIGdsb2JhbF9mcm96ZW4gPSBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkdMT0JBTF9GUk9aRU5fT0ZGU0VULCAxCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNDIKICAgIC8vIHJldHVybiBib29sKG9wLmdldGJpdChnbG9iYWxfZnJvemVuLCAwKSkKICAgIGludGNfMSAvLyAwCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODYyLTg2MwogICAgLy8gIyBFZmZlY3RzCiAgICAvLyByZXR1cm4gYXJjNC5Cb29sKHNlbGYuaXNfZ2xvYmFsX2Zyb3plbihmcmVlemVfYXNzZXQuaWQpKQogICAgYnl0ZWNfMyAvLyAweDAwCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODQ4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5nZXRfYWNjb3VudF9pc19mcm96ZW5bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYWNjb3VudF9pc19mcm96ZW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojg2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODc5LTg4MAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBkaWcgMQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODgyLTg4MwogICAgLy8gIyBFZmZlY3RzCiAgICAvLyByZXR1cm4gYXJjNC5Cb29sKHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oZnJlZXplX2Fzc2V0LmlkLCBmcmVlemVfYWNjb3VudCkpCiAgICBjYWxsc3ViIGlzX2FjY291bnRfZnJvemVuCiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmdldF9jaXJjdWxhdGluZ19zdXBwbHlbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfY2lyY3VsYXRpbmdfc3VwcGx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4ODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4OTYtODk3CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGFzc2V0LmlkKQogICAgZHVwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4OTktOTAwCiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmNpcmN1bGF0aW5nX3N1cHBseShhc3NldCkpCiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4ODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2FfbXVsdGkuY29udHJhY3QuU21hcnRBc2FNdWx0aS5jb25maWdfcm9sZShhc3NldF9pZDogdWludDY0LCBvZmZzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmNvbmZpZ19yb2xlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo2NC02NQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjb25maWdfcm9sZShzZWxmLCBhc3NldF9pZDogVUludDY0LCBvZmZzZXQ6IFVJbnQ2NCkgLT4gQWNjb3VudDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo2MgogICAgLy8gcmV0dXJuIGNmZy5DVFJMX0FTU0VUX0JPWF9QUkVGSVggKyBvcC5pdG9iKGFzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4NjEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo2NwogICAgLy8gb3AuQm94LmV4dHJhY3Qoc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIG9mZnNldCwgY2ZnLkFERFJFU1NfU0laRSkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18yIC8vIDMyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo2Ni02OAogICAgLy8gcmV0dXJuIEFjY291bnQoCiAgICAvLyAgICAgb3AuQm94LmV4dHJhY3Qoc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIG9mZnNldCwgY2ZnLkFERFJFU1NfU0laRSkKICAgIC8vICkKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2FfbXVsdGkuY29udHJhY3QuU21hcnRBc2FNdWx0aS5hc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo3NC03NQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo3NgogICAgLy8gYXNzZXJ0IGFzc2V0X2lkIGluIHNlbGYuY3RybF9hc3NldHMsIGVyci5NSVNTSU5HX0NUUkxfQVNBCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHg2MQogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbnRyb2xsZWQgQVNBCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhX211bHRpLmNvbnRyYWN0LlNtYXJ0QXNhTXVsdGkuaXNfYWNjb3VudF9mcm96ZW4oYXNzZXRfaWQ6IHVpbnQ2NCwgYWNjb3VudDogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNfYWNjb3VudF9mcm96ZW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE3Mi0xNzMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaXNfYWNjb3VudF9mcm96ZW4oc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCwgYWNjb3VudDogQWNjb3VudCkgLT4gYm9vbDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo3MgogICAgLy8gcmV0dXJuIEhvbGRpbmcoYXNzZXRfaWQ9YXJjNC5VSW50NjQoYXNzZXRfaWQpLCBhY2NvdW50PWFyYzQuQWRkcmVzcyhhY2NvdW50KSkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTc0CiAgICAvLyByZXR1cm4gc2VsZi5ob2xkaW5nc1tzZWxmLmhvbGRpbmcoYXNzZXRfaWQsIGFjY291bnQpXS5uYXRpdmUKICAgIGJ5dGVjXzEgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ob2xkaW5ncyBlbnRyeSBleGlzdHMKICAgIGludGNfMSAvLyAwCiAgICBnZXRiaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmNpcmN1bGF0aW5nX3N1cHBseShjdHJsX2Fzc2V0OiB1aW50NjQpIC0+IHVpbnQ2NDoKY2lyY3VsYXRpbmdfc3VwcGx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjYtMTY3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNpcmN1bGF0aW5nX3N1cHBseShzZWxmLCBjdHJsX2Fzc2V0OiBBc3NldCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gcmV0dXJuIGNmZy5UT1RBTCAtIGN0cmxfYXNzZXQuYmFsYW5jZShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICBpbnRjIDYgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIHN3YXAKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmFzc2VydF9yZWd1bGFyX3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoYXNzZXRfaWQ6IHVpbnQ2NCwgYXNzZXRfc2VuZGVyOiBieXRlcywgYXNzZXRfcmVjZWl2ZXI6IGJ5dGVzKSAtPiB2b2lkOgphc3NlcnRfcmVndWxhcl90cmFuc2Zlcl9wcmVjb25kaXRpb25zOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMTMtMjE2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGFzc2VydF9yZWd1bGFyX3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoCiAgICAvLyAgICAgc2VsZiwgKiwgYXNzZXRfaWQ6IFVJbnQ2NCwgYXNzZXRfc2VuZGVyOiBBY2NvdW50LCBhc3NldF9yZWNlaXZlcjogQWNjb3VudAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gYXNzZXRfc2VuZGVyLCBlcnIuVU5BVVRIT1JJWkVEX0NMQVdCQUNLCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIENsYXdiYWNrCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjcyCiAgICAvLyByZXR1cm4gSG9sZGluZyhhc3NldF9pZD1hcmM0LlVJbnQ2NChhc3NldF9pZCksIGFjY291bnQ9YXJjNC5BZGRyZXNzKGFjY291bnQpKQogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gcmV0dXJuIHNlbGYuaG9sZGluZyhhc3NldF9pZCwgYWNjb3VudCkgaW4gc2VsZi5ob2xkaW5ncwogICAgYnl0ZWNfMSAvLyAweDY4CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMTgtMjE5CiAgICAvLyAjIEluIHRoZSBjYXNlIG9mIENvbnRyb2xsZWQgQVNBIGRlc3Ryb3llZCBhbmQgcmUtY3JlYXRlZCwgdGhlIFNtYXJ0IEFEQSBJRCBpbiBMb2NhbCBTdGF0ZSBjb3VsZCBiZSBvdXRkYXRlZC4KICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihhc3NldF9pZCwgYXNzZXRfc2VuZGVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjcyCiAgICAvLyByZXR1cm4gSG9sZGluZyhhc3NldF9pZD1hcmM0LlVJbnQ2NChhc3NldF9pZCksIGFjY291bnQ9YXJjNC5BZGRyZXNzKGFjY291bnQpKQogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNzAKICAgIC8vIHJldHVybiBzZWxmLmhvbGRpbmcoYXNzZXRfaWQsIGFjY291bnQpIGluIHNlbGYuaG9sZGluZ3MKICAgIGJ5dGVjXzEgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjIwCiAgICAvLyBhc3NlcnQgc2VsZi5pc19ob2xkZXIoYXNzZXRfaWQsIGFzc2V0X3JlY2VpdmVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjYyCiAgICAvLyByZXR1cm4gY2ZnLkNUUkxfQVNTRVRfQk9YX1BSRUZJWCArIG9wLml0b2IoYXNzZXRfaWQpCiAgICBieXRlY18wIC8vIDB4NjEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNDAKICAgIC8vIHNlbGYuY3RybF9hc3NldF9rZXkoYXNzZXRfaWQpLCBjZmcuR0xPQkFMX0ZST1pFTl9PRkZTRVQsIDEKICAgIGludGNfMSAvLyAwCiAgICBpbnRjXzAgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxMzktMTQxCiAgICAvLyBnbG9iYWxfZnJvemVuID0gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5HTE9CQUxfRlJPWkVOX09GRlNFVCwgMQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTQyCiAgICAvLyByZXR1cm4gYm9vbChvcC5nZXRiaXQoZ2xvYmFsX2Zyb3plbiwgMCkpCiAgICBpbnRjXzEgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2dsb2JhbF9mcm96ZW4oYXNzZXRfaWQpLCBlcnIuR0xPQkFMX0ZST1pFTgogICAgIQogICAgYXNzZXJ0IC8vIFNtYXJ0IEFTQSBpcyBnbG9iYWwgZnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIyMgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGFzc2V0X2lkLCBhc3NldF9zZW5kZXIpLCBlcnIuU0VOREVSX0ZST1pFTgogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgaXNfYWNjb3VudF9mcm96ZW4KICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjIzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oYXNzZXRfaWQsIGFzc2V0X3JlY2VpdmVyKSwgZXJyLlJFQ0VJVkVSX0ZST1pFTgogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgaXNfYWNjb3VudF9mcm96ZW4KICAgICEKICAgIGFzc2VydCAvLyBSZWNlaXZlciBhY2NvdW50IGlzIGZyb3plbgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoYXNzZXRfaWQ6IHVpbnQ2NCwgYXNzZXRfc2VuZGVyOiBieXRlcywgYXNzZXRfcmVjZWl2ZXI6IGJ5dGVzLCBhc3NldF9hbW91bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIyNS0yMzMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAqLAogICAgLy8gICAgIGFzc2V0X2lkOiBVSW50NjQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyOiBBY2NvdW50LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyOiBBY2NvdW50LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudDogVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIzNAogICAgLy8gaWYgYXNzZXRfc2VuZGVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBmcmFtZV9kaWcgLTMKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYnogYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTE1CiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShhc3NldF9pZCwgVUludDY0KGNmZy5SRVNFUlZFX0FERFJfT0ZGU0VUKSkKICAgIGZyYW1lX2RpZyAtNAogICAgcHVzaGludCA4OCAvLyA4OAogICAgY2FsbHN1YiBjb25maWdfcm9sZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNzYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHJlc2VydmVfYWRkciwgZXJyLlVOQVVUSE9SSVpFRF9SRVNFUlZFCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgUmVzZXJ2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNzctMTc4CiAgICAvLyAjIEZvcmJpZGRlbiBzZWxmLW1pbnQgKHRvIENyZWF0b3IpIGFuZCBvdmVyLW1pbnQgKD4gdG90YWwpLgogICAgLy8gYXNzZXJ0IGFzc2V0X3JlY2VpdmVyICE9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsIGVyci5TRUxGX01JTlQKICAgIGZyYW1lX2RpZyAtMgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gRm9yYmlkZGVuIHNlbGYgbWludGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNzktMTgxCiAgICAvLyBhc3NlcnQgYXNzZXRfYW1vdW50ICsgc2VsZi5jaXJjdWxhdGluZ19zdXBwbHkoCiAgICAvLyAgICAgQXNzZXQoYXNzZXRfaWQpCiAgICAvLyApIDw9IHNlbGYuY29uZmlnX3RvdGFsKGFzc2V0X2lkKSwgZXJyLk9WRVJfTUlOVAogICAgZnJhbWVfZGlnIC00CiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjYyCiAgICAvLyByZXR1cm4gY2ZnLkNUUkxfQVNTRVRfQk9YX1BSRUZJWCArIG9wLml0b2IoYXNzZXRfaWQpCiAgICBmcmFtZV9kaWcgLTQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHg2MQogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo5Ny05OQogICAgLy8gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5UT1RBTF9PRkZTRVQsIGNmZy5VSU5UNjRfU0laRQogICAgLy8gKQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLlRPVEFMX09GRlNFVCwgY2ZnLlVJTlQ2NF9TSVpFCiAgICBwdXNoaW50IDM1IC8vIDM1CiAgICBpbnRjXzMgLy8gOAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo5Ny05OQogICAgLy8gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5UT1RBTF9PRkZTRVQsIGNmZy5VSU5UNjRfU0laRQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6OTYtMTAwCiAgICAvLyByZXR1cm4gb3AuYnRvaSgKICAgIC8vICAgICBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICAgICAgc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5UT1RBTF9PRkZTRVQsIGNmZy5VSU5UNjRfU0laRQogICAgLy8gICAgICkKICAgIC8vICkKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTc5LTE4MQogICAgLy8gYXNzZXJ0IGFzc2V0X2Ftb3VudCArIHNlbGYuY2lyY3VsYXRpbmdfc3VwcGx5KAogICAgLy8gICAgIEFzc2V0KGFzc2V0X2lkKQogICAgLy8gKSA8PSBzZWxmLmNvbmZpZ190b3RhbChhc3NldF9pZCksIGVyci5PVkVSX01JTlQKICAgIHVuY292ZXIgMwogICAgPj0KICAgIGFzc2VydCAvLyBGb3JiaWRkZW4gb3ZlciBtaW50aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjcyCiAgICAvLyByZXR1cm4gSG9sZGluZyhhc3NldF9pZD1hcmM0LlVJbnQ2NChhc3NldF9pZCksIGFjY291bnQ9YXJjNC5BZGRyZXNzKGFjY291bnQpKQogICAgc3dhcAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTcwCiAgICAvLyByZXR1cm4gc2VsZi5ob2xkaW5nKGFzc2V0X2lkLCBhY2NvdW50KSBpbiBzZWxmLmhvbGRpbmdzCiAgICBieXRlY18xIC8vIDB4NjgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE4Mi0xODMKICAgIC8vICMgSW4gdGhlIGNhc2Ugb2YgQ29udHJvbGxlZCBBU0EgZGVzdHJveWVkIGFuZCByZS1jcmVhdGVkLCB0aGUgU21hcnQgQURBIElEIGluIExvY2FsIFN0YXRlIGNvdWxkIGJlIG91dGRhdGVkLgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfaG9sZGVyKGFzc2V0X2lkLCBhc3NldF9yZWNlaXZlciksIGVyci5JTlZBTElEX0NUUkxfQVNBCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDb250cm9sbGVkIEFTQSBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNDAKICAgIC8vIHNlbGYuY3RybF9hc3NldF9rZXkoYXNzZXRfaWQpLCBjZmcuR0xPQkFMX0ZST1pFTl9PRkZTRVQsIDEKICAgIGludGNfMSAvLyAwCiAgICBpbnRjXzAgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxMzktMTQxCiAgICAvLyBnbG9iYWxfZnJvemVuID0gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5HTE9CQUxfRlJPWkVOX09GRlNFVCwgMQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTQyCiAgICAvLyByZXR1cm4gYm9vbChvcC5nZXRiaXQoZ2xvYmFsX2Zyb3plbiwgMCkpCiAgICBpbnRjXzEgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE4NAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2dsb2JhbF9mcm96ZW4oYXNzZXRfaWQpLCBlcnIuR0xPQkFMX0ZST1pFTgogICAgIQogICAgYXNzZXJ0IC8vIFNtYXJ0IEFTQSBpcyBnbG9iYWwgZnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoYXNzZXRfaWQsIFVJbnQ2NChjZmcuQ0xBV0JBQ0tfQUREUl9PRkZTRVQpKQogICAgZnJhbWVfZGlnIC00CiAgICBpbnRjIDQgLy8gMTUyCiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE4NQogICAgLy8gaWYgcmVzZXJ2ZV9hZGRyICE9IHNlbGYuY29uZmlnX2NsYXdiYWNrX2FkZHIoYXNzZXRfaWQpOgogICAgIT0KICAgIGJ6IGFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zX2FmdGVyX2lmX2Vsc2VAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxODYtMTg4CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oCiAgICAvLyAgICAgYXNzZXRfaWQsIGFzc2V0X3JlY2VpdmVyCiAgICAvLyApLCBlcnIuUkVDRUlWRVJfRlJPWkVOCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBpc19hY2NvdW50X2Zyb3plbgogICAgIQogICAgYXNzZXJ0IC8vIFJlY2VpdmVyIGFjY291bnQgaXMgZnJvemVuCgphc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19hZnRlcl9pZl9lbHNlQDk6CiAgICByZXRzdWIKCmFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNDAKICAgIC8vIGVsaWYgYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzczoKICAgIGZyYW1lX2RpZyAtMgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBieiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxMTUKICAgIC8vIHJldHVybiBzZWxmLmNvbmZpZ19yb2xlKGFzc2V0X2lkLCBVSW50NjQoY2ZnLlJFU0VSVkVfQUREUl9PRkZTRVQpKQogICAgZnJhbWVfZGlnIC00CiAgICBwdXNoaW50IDg4IC8vIDg4CiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxOTYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHJlc2VydmVfYWRkciwgZXJyLlVOQVVUSE9SSVpFRF9SRVNFUlZFCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgUmVzZXJ2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo3MgogICAgLy8gcmV0dXJuIEhvbGRpbmcoYXNzZXRfaWQ9YXJjNC5VSW50NjQoYXNzZXRfaWQpLCBhY2NvdW50PWFyYzQuQWRkcmVzcyhhY2NvdW50KSkKICAgIGZyYW1lX2RpZyAtNAogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNzAKICAgIC8vIHJldHVybiBzZWxmLmhvbGRpbmcoYXNzZXRfaWQsIGFjY291bnQpIGluIHNlbGYuaG9sZGluZ3MKICAgIGJ5dGVjXzEgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTk3LTE5OAogICAgLy8gIyBJbiBjYXNlIG9mIENvbnRyb2xsZWQgQVNBIGRlc3Ryb3llZCBhbmQgcmUtY3JlYXRlZCB0aGUgU21hcnQgQURBIElEIGluIExvY2FsIFN0YXRlIGNvdWxkIGJlIG91dGRhdGVkLgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfaG9sZGVyKGFzc2V0X2lkLCBhc3NldF9zZW5kZXIpLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiBjZmcuQ1RSTF9BU1NFVF9CT1hfUFJFRklYICsgb3AuaXRvYihhc3NldF9pZCkKICAgIGJ5dGVjXzAgLy8gMHg2MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gc2VsZi5jdHJsX2Fzc2V0X2tleShhc3NldF9pZCksIGNmZy5HTE9CQUxfRlJPWkVOX09GRlNFVCwgMQogICAgaW50Y18xIC8vIDAKICAgIGludGNfMCAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjEzOS0xNDEKICAgIC8vIGdsb2JhbF9mcm96ZW4gPSBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkdMT0JBTF9GUk9aRU5fT0ZGU0VULCAxCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNDIKICAgIC8vIHJldHVybiBib29sKG9wLmdldGJpdChnbG9iYWxfZnJvemVuLCAwKSkKICAgIGludGNfMSAvLyAwCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTk5CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfZ2xvYmFsX2Zyb3plbihhc3NldF9pZCksIGVyci5HTE9CQUxfRlJPWkVOCiAgICAhCiAgICBhc3NlcnQgLy8gU21hcnQgQVNBIGlzIGdsb2JhbCBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTIzCiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShhc3NldF9pZCwgVUludDY0KGNmZy5DTEFXQkFDS19BRERSX09GRlNFVCkpCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGMgNCAvLyAxNTIKICAgIGNhbGxzdWIgY29uZmlnX3JvbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjAwCiAgICAvLyBpZiByZXNlcnZlX2FkZHIgIT0gc2VsZi5jb25maWdfY2xhd2JhY2tfYWRkcihhc3NldF9pZCk6CiAgICAhPQogICAgYnogYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfYWZ0ZXJfaWZfZWxzZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGFzc2V0X2lkLCBhc3NldF9zZW5kZXIpLCBlcnIuU0VOREVSX0ZST1pFTgogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgaXNfYWNjb3VudF9mcm96ZW4KICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjAyLTIwMwogICAgLy8gIyBGb3JiaWRkZW4gY2xhd2JhY2sgdGhyb3VnaCBidXJuaW5nIChidXJuZWQgYW1vdW50IG5vdCBmcm9tIFJlc2VydmUpLgogICAgLy8gYXNzZXJ0IGFzc2V0X3NlbmRlciA9PSByZXNlcnZlX2FkZHIsIGVyci5DTEFXQkFDS19CVVJOCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAwCiAgICA9PQogICAgYXNzZXJ0IC8vIEZvcmJpZGRlbiBjbGF3YmFjayBidXJuaW5nCiAgICByZXRzdWIKCmFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zX2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNDQKICAgIC8vIGVsaWYgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19jbGF3YmFja19hZGRyKGFzc2V0X2lkKToKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTIzCiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShhc3NldF9pZCwgVUludDY0KGNmZy5DTEFXQkFDS19BRERSX09GRlNFVCkpCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGMgNCAvLyAxNTIKICAgIGNhbGxzdWIgY29uZmlnX3JvbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjQ0CiAgICAvLyBlbGlmIFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfY2xhd2JhY2tfYWRkcihhc3NldF9pZCk6CiAgICA9PQogICAgYnogYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfZWxzZV9ib2R5QDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NzIKICAgIC8vIHJldHVybiBIb2xkaW5nKGFzc2V0X2lkPWFyYzQuVUludDY0KGFzc2V0X2lkKSwgYWNjb3VudD1hcmM0LkFkZHJlc3MoYWNjb3VudCkpCiAgICBmcmFtZV9kaWcgLTQKICAgIGl0b2IKICAgIGR1cAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTcwCiAgICAvLyByZXR1cm4gc2VsZi5ob2xkaW5nKGFzc2V0X2lkLCBhY2NvdW50KSBpbiBzZWxmLmhvbGRpbmdzCiAgICBieXRlY18xIC8vIDB4NjgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIwOS0yMTAKICAgIC8vICMgSW4gdGhlIGNhc2Ugb2YgQ29udHJvbGxlZCBBU0EgZGVzdHJveWVkIGFuZCByZS1jcmVhdGVkLCB0aGUgU21hcnQgQURBIElEIGluIExvY2FsIFN0YXRlIGNvdWxkIGJlIG91dGRhdGVkLgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfaG9sZGVyKGFzc2V0X2lkLCBhc3NldF9zZW5kZXIpLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6NzIKICAgIC8vIHJldHVybiBIb2xkaW5nKGFzc2V0X2lkPWFyYzQuVUludDY0KGFzc2V0X2lkKSwgYWNjb3VudD1hcmM0LkFkZHJlc3MoYWNjb3VudCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNzAKICAgIC8vIHJldHVybiBzZWxmLmhvbGRpbmcoYXNzZXRfaWQsIGFjY291bnQpIGluIHNlbGYuaG9sZGluZ3MKICAgIGJ5dGVjXzEgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjExCiAgICAvLyBhc3NlcnQgc2VsZi5pc19ob2xkZXIoYXNzZXRfaWQsIGFzc2V0X3JlY2VpdmVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICByZXRzdWIKCmFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zX2Vsc2VfYm9keUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo2MgogICAgLy8gcmV0dXJuIGNmZy5DVFJMX0FTU0VUX0JPWF9QUkVGSVggKyBvcC5pdG9iKGFzc2V0X2lkKQogICAgZnJhbWVfZGlnIC00CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4NjEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNTkKICAgIC8vIHNlbGYuY3RybF9hc3NldF9rZXkoYXNzZXRfaWQpLCBjZmcuQUxMT1dMSVNUX1JPT1RfT0ZGU0VULCBjZmcuSEFTSF9TSVpFCiAgICBpbnRjXzAgLy8gMQogICAgaW50Y18yIC8vIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE1OC0xNjAKICAgIC8vIHJldHVybiBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkFMTE9XTElTVF9ST09UX09GRlNFVCwgY2ZnLkhBU0hfU0laRQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfbXVsdGkvY29udHJhY3QucHk6MTU0CiAgICAvLyByZXR1cm4gc2VsZi5sb2FkX2FsbG93bGlzdF9yb290KGFzc2V0X2lkKSAhPSBHbG9iYWwuemVyb19hZGRyZXNzLmJ5dGVzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI1MQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmhhc19hbGxvd2xpc3QoYXNzZXRfaWQpLCBlcnIuTUlTU0lOR19BTExPV0xJU1RfUFJPT0YKICAgICEKICAgIGFzc2VydCAvLyBUcmFuc2ZlciBhbGxvd2xpc3QgaXMgc2V0LCB1c2UgYXNzZXRfdHJhbnNmZXJfd2l0aF9wcm9vZgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNTItMjU2CiAgICAvLyBzZWxmLmFzc2VydF9yZWd1bGFyX3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoCiAgICAvLyAgICAgYXNzZXRfaWQ9YXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgYXNzZXJ0X3JlZ3VsYXJfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuZW1pdF90cmFuc2Zlcl9ldmVudChhc3NldF9pZDogdWludDY0LCBhc3NldF9zZW5kZXI6IGJ5dGVzLCBhc3NldF9yZWNlaXZlcjogYnl0ZXMsIGFzc2V0X2Ftb3VudDogdWludDY0KSAtPiB2b2lkOgplbWl0X3RyYW5zZmVyX2V2ZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNTgtMjY2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGVtaXRfdHJhbnNmZXJfZXZlbnQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAqLAogICAgLy8gICAgIGFzc2V0X2lkOiBVSW50NjQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyOiBBY2NvdW50LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyOiBBY2NvdW50LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudDogVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBSZWd1bGFyIHRyYW5zZmVycyBhcmUgbm90IGxvZ2dlZCwgc3VwcGx5IGFuZCBjbGF3YmFjayBjaGFuZ2VzIGFyZS4KICAgIC8vIGlmIGFzc2V0X3NlbmRlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzOgogICAgZnJhbWVfZGlnIC0zCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGJ6IGVtaXRfdHJhbnNmZXJfZXZlbnRfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjcyCiAgICAvLyBhc3NldF9hbW91bnQ9YXJjNC5VSW50NjQoYXNzZXRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNzAtMjczCiAgICAvLyBNaW50KAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFyYzQuQWRkcmVzcyhhc3NldF9yZWNlaXZlciksCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNjktMjc0CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgTWludCgKICAgIC8vICAgICAgICAgYXNzZXRfcmVjZWl2ZXI9YXJjNC5BZGRyZXNzKGFzc2V0X3JlY2VpdmVyKSwKICAgIC8vICAgICAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZGYyZTc5NGUgLy8gbWV0aG9kICJNaW50KGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCgplbWl0X3RyYW5zZmVyX2V2ZW50X2FmdGVyX2lmX2Vsc2VAODoKICAgIHJldHN1YgoKZW1pdF90cmFuc2Zlcl9ldmVudF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjc1CiAgICAvLyBlbGlmIGFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBmcmFtZV9kaWcgLTIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYnogZW1pdF90cmFuc2Zlcl9ldmVudF9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNzkKICAgIC8vIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3Ny0yODAKICAgIC8vIEJ1cm4oCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFyYzQuQWRkcmVzcyhhc3NldF9zZW5kZXIpLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjc2LTI4MQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEJ1cm4oCiAgICAvLyAgICAgICAgIGFzc2V0X3NlbmRlcj1hcmM0LkFkZHJlc3MoYXNzZXRfc2VuZGVyKSwKICAgIC8vICAgICAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgYnl0ZWMgNCAvLyBtZXRob2QgIkJ1cm4oYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKZW1pdF90cmFuc2Zlcl9ldmVudF9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjgyCiAgICAvLyBlbGlmIFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfY2xhd2JhY2tfYWRkcihhc3NldF9pZCk6CiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoYXNzZXRfaWQsIFVJbnQ2NChjZmcuQ0xBV0JBQ0tfQUREUl9PRkZTRVQpKQogICAgZnJhbWVfZGlnIC00CiAgICBpbnRjIDQgLy8gMTUyCiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4MgogICAgLy8gZWxpZiBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2NsYXdiYWNrX2FkZHIoYXNzZXRfaWQpOgogICAgPT0KICAgIGJ6IGVtaXRfdHJhbnNmZXJfZXZlbnRfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjg0LTI4OAogICAgLy8gQ2xhd2JhY2soCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFyYzQuQWRkcmVzcyhhc3NldF9zZW5kZXIpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFyYzQuQWRkcmVzcyhhc3NldF9yZWNlaXZlciksCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjgzLTI4OQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIENsYXdiYWNrKAogICAgLy8gICAgICAgICBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKGFzc2V0X3NlbmRlciksCiAgICAvLyAgICAgICAgIGFzc2V0X3JlY2VpdmVyPWFyYzQuQWRkcmVzcyhhc3NldF9yZWNlaXZlciksCiAgICAvLyAgICAgICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDRiODk5OGZjIC8vIG1ldGhvZCAiQ2xhd2JhY2soYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuaXNfYWxsb3dsaXN0ZWQoYXNzZXRfaWQ6IHVpbnQ2NCwgYWNjb3VudDogYnl0ZXMsIHByb29mOiBieXRlcykgLT4gdWludDY0LCBieXRlczoKaXNfYWxsb3dsaXN0ZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI5MS0yOTQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaXNfYWxsb3dsaXN0ZWQoCiAgICAvLyAgICAgc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCwgYWNjb3VudDogQWNjb3VudCwgcHJvb2Y6IE1lcmtsZVByb29mCiAgICAvLyApIC0+IGJvb2w6CiAgICBwcm90byAzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjk1CiAgICAvLyBub2RlID0gb3Auc2hhMjU2KGNmZy5NRVJLTEVfTEVBRl9QUkVGSVggKyBhY2NvdW50LmJ5dGVzKQogICAgYnl0ZWNfMyAvLyAweDAwCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI5NgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHByb29mLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzEgLy8gMAoKaXNfYWxsb3dsaXN0ZWRfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyOTYKICAgIC8vIGZvciBpIGluIHVyYW5nZShwcm9vZi5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBpc19hbGxvd2xpc3RlZF9hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyOTcKICAgIC8vIHNpYmxpbmcgPSBwcm9vZltpXS5ieXRlcwogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyOTgtMjk5CiAgICAvLyAjIFNvcnRlZCBwYWlyIGhhc2hpbmc6IHByb29mcyBuZWVkIG5vIGxlZnQvcmlnaHQgcGF0aCBiaXRzLgogICAgLy8gaWYgQmlnVUludC5mcm9tX2J5dGVzKG5vZGUpIDwgQmlnVUludC5mcm9tX2J5dGVzKHNpYmxpbmcpOgogICAgZnJhbWVfZGlnIDAKICAgIGI+CiAgICBieiBpc19hbGxvd2xpc3RlZF9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMDAKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoY2ZnLk1FUktMRV9OT0RFX1BSRUZJWCArIG5vZGUgKyBzaWJsaW5nKQogICAgcHVzaGJ5dGVzIDB4MDEKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBmcmFtZV9idXJ5IDAKCmlzX2FsbG93bGlzdGVkX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjk2CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGlzX2FsbG93bGlzdGVkX2Zvcl9oZWFkZXJAMQoKaXNfYWxsb3dsaXN0ZWRfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwMgogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihjZmcuTUVSS0xFX05PREVfUFJFRklYICsgc2libGluZyArIG5vZGUpCiAgICBwdXNoYnl0ZXMgMHgwMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIGZyYW1lX2J1cnkgMAogICAgYiBpc19hbGxvd2xpc3RlZF9hZnRlcl9pZl9lbHNlQDUKCmlzX2FsbG93bGlzdGVkX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weTo2MgogICAgLy8gcmV0dXJuIGNmZy5DVFJMX0FTU0VUX0JPWF9QUkVGSVggKyBvcC5pdG9iKGFzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4NjEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9tdWx0aS9jb250cmFjdC5weToxNTkKICAgIC8vIHNlbGYuY3RybF9hc3NldF9rZXkoYXNzZXRfaWQpLCBjZmcuQUxMT1dMSVNUX1JPT1RfT0ZGU0VULCBjZmcuSEFTSF9TSVpFCiAgICBpbnRjXzAgLy8gMQogICAgaW50Y18yIC8vIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX211bHRpL2NvbnRyYWN0LnB5OjE1OC0xNjAKICAgIC8vIHJldHVybiBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBzZWxmLmN0cmxfYXNzZXRfa2V5KGFzc2V0X2lkKSwgY2ZnLkFMTE9XTElTVF9ST09UX09GRlNFVCwgY2ZnLkhBU0hfU0laRQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzAzCiAgICAvLyByZXR1cm4gbm9kZSA9PSBzZWxmLmxvYWRfYWxsb3dsaXN0X3Jvb3QoYXNzZXRfaWQpCiAgICBmcmFtZV9kaWcgMAogICAgPT0KICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmlubmVyX2Fzc2V0X3RyYW5zZmVyKHhmZXJfYXNzZXQ6IHVpbnQ2NCwgYXNzZXRfYW1vdW50OiB1aW50NjQsIGFzc2V0X3NlbmRlcjogYnl0ZXMsIGFzc2V0X3JlY2VpdmVyOiBieXRlcykgLT4gdm9pZDoKaW5uZXJfYXNzZXRfdHJhbnNmZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM2Ni0zNzQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAqLAogICAgLy8gICAgIHhmZXJfYXNzZXQ6IEFzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudDogVUludDY0LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcjogQWNjb3VudCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcjogQWNjb3VudAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM3NS0zODIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXhmZXJfYXNzZXQuaWQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozODEKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtNAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzc1CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzc2CiAgICAvLyBmZWU9MCwKICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNzUtMzgyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [2088], "errorMessage": "Address length is 32 bytes"}, {"pc": [1228], "errorMessage": "Clawback Address has been deleted"}, {"pc": [529], "errorMessage": "Close to account is frozen"}, {"pc": [1462], "errorMessage": "Empty transfer batch"}, {"pc": [256], "errorMessage": "Forbidden Close Out on Opt In"}, {"pc": [2367], "errorMessage": "Forbidden clawback burning"}, {"pc": [2254], "errorMessage": "Forbidden over minting"}, {"pc": [2229], "errorMessage": "Forbidden self minting"}, {"pc": [1206], "errorMessage": "Freeze Address has been deleted"}, {"pc": [415], "errorMessage": "Invalid Close Out group size"}, {"pc": [409, 492, 1827, 2158, 2169, 2265, 2331, 2395, 2405], "errorMessage": "Invalid Controlled ASA ID"}, {"pc": [1242], "errorMessage": "Invalid Total, must be >= circulating supply"}, {"pc": [265, 2102], "errorMessage": "Missing Controlled ASA"}, {"pc": [316], "errorMessage": "Missing Opt In box MBR payment"}, {"pc": [72], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [196], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [2197, 2292], "errorMessage": "Receiver account is frozen"}, {"pc": [1715], "errorMessage": "Receiver account is not allowlisted"}, {"pc": [1184], "errorMessage": "Reserve Address has been deleted"}, {"pc": [523, 2188, 2361], "errorMessage": "Sender account is frozen"}, {"pc": [1704], "errorMessage": "Sender account is not allowlisted"}, {"pc": [310], "errorMessage": "Smart ASA already opted in"}, {"pc": [511, 2179, 2272, 2341], "errorMessage": "Smart ASA is global frozen"}, {"pc": [1684], "errorMessage": "Transfer allowlist is not set"}, {"pc": [504], "errorMessage": "Transfer allowlist is set, close out to the Creator"}, {"pc": [2420], "errorMessage": "Transfer allowlist is set, use asset_transfer_with_proof"}, {"pc": [1466], "errorMessage": "Transfer batch exceeds max inner group size"}, {"pc": [728], "errorMessage": "Unauthorized"}, {"pc": [2144], "errorMessage": "Unauthorized Clawback"}, {"pc": [1763, 1838, 1886], "errorMessage": "Unauthorized Freeze"}, {"pc": [1166, 1921], "errorMessage": "Unauthorized Manager"}, {"pc": [2223, 2317], "errorMessage": "Unauthorized Reserve"}, {"pc": [434], "errorMessage": "Wrong ASA Close Out Amount"}, {"pc": [422], "errorMessage": "Wrong ASA Close Out ID"}, {"pc": [429], "errorMessage": "Wrong ASA Close Out Sender"}, {"pc": [250], "errorMessage": "Wrong ASA Opt In Amount"}, {"pc": [231], "errorMessage": "Wrong ASA Opt In ID"}, {"pc": [245], "errorMessage": "Wrong ASA Opt In Receiver"}, {"pc": [238], "errorMessage": "Wrong ASA Opt In Sender"}, {"pc": [440, 465], "errorMessage": "Wrong Close Out on Close Out"}, {"pc": [51], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [55], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [59], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [63], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [347], "errorMessage": "Wrong Opt In box MBR payment Amount"}, {"pc": [341], "errorMessage": "Wrong Opt In box MBR payment Receiver"}, {"pc": [334], "errorMessage": "Wrong Opt In box MBR payment Sender"}, {"pc": [289, 545, 2130], "errorMessage": "account opted into asset"}, {"pc": [1320, 1964], "errorMessage": "check self.ctrl_assets entry exists"}, {"pc": [2117], "errorMessage": "check self.holdings entry exists"}, {"pc": [1488, 2544], "errorMessage": "index access is out of bounds"}, {"pc": [632, 649, 666, 683, 1045, 1064, 1083, 1102, 1441, 1640, 1656, 2524], "errorMessage": "invalid array length header"}, {"pc": [625, 1036, 1747, 1808], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [1650, 1666], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [642, 659, 676, 690, 1055, 1074, 1093, 1109], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [1456], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.avm_types.TransferLeg>"}, {"pc": [381, 698, 706, 714, 722, 1119, 1130, 1140, 1150, 1375, 1383, 1626, 1634, 1800, 1870, 2028], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [617, 1026], "errorMessage": "invalid number of bytes for arc4.uint32"}, {"pc": [206, 369, 608, 1003, 1015, 1358, 1367, 1430, 1609, 1618, 1738, 1791, 1861, 1905, 1953, 1986, 2019, 2055], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [219, 392, 456], "errorMessage": "transaction type is axfer"}, {"pc": [327], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True)
+class AssetConfig:
+    """Struct for AssetConfig"""
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: str
+    name: str
+    url: str
+    metadata_hash: bytes
+    manager_addr: str
+    reserve_addr: str
+    freeze_addr: str
+    clawback_addr: str
+
+@dataclasses.dataclass(frozen=True)
+class ControlledAsset:
+    """Struct for ControlledAsset"""
+    global_frozen: bool
+    allowlist_root: bytes
+    asset_config: AssetConfig
+
+@dataclasses.dataclass(frozen=True)
+class Holding:
+    """Struct for Holding"""
+    asset_id: int
+    account: str
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetOptInArgs:
+    """Dataclass for asset_opt_in arguments"""
+    asset: int
+    ctrl_asa_opt_in: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_opt_in(uint64,axfer)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetCloseOutArgs:
+    """Dataclass for asset_close_out arguments"""
+    close_asset: int
+    close_to: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_close_out(uint64,address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetCreateArgs:
+    """Dataclass for asset_create arguments"""
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: str
+    name: str
+    url: str
+    metadata_hash: bytes | str
+    manager_addr: str
+    reserve_addr: str
+    freeze_addr: str
+    clawback_addr: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetConfigArgs:
+    """Dataclass for asset_config arguments"""
+    config_asset: int
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: str
+    name: str
+    url: str
+    metadata_hash: bytes | str
+    manager_addr: str
+    reserve_addr: str
+    freeze_addr: str
+    clawback_addr: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetTransferArgs:
+    """Dataclass for asset_transfer arguments"""
+    xfer_asset: int
+    asset_amount: int
+    asset_sender: str
+    asset_receiver: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_transfer(uint64,uint64,address,address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetTransferBatchArgs:
+    """Dataclass for asset_transfer_batch arguments"""
+    xfer_asset: int
+    legs: list[tuple[str, str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_transfer_batch(uint64,(address,address,uint64)[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetTransferWithProofArgs:
+    """Dataclass for asset_transfer_with_proof arguments"""
+    xfer_asset: int
+    asset_amount: int
+    asset_sender: str
+    asset_receiver: str
+    sender_proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+    receiver_proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetFreezeArgs:
+    """Dataclass for asset_freeze arguments"""
+    freeze_asset: int
+    asset_frozen: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_freeze(uint64,bool)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AccountFreezeArgs:
+    """Dataclass for account_freeze arguments"""
+    freeze_asset: int
+    freeze_account: str
+    asset_frozen: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "account_freeze(uint64,address,bool)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetTransferAllowlistArgs:
+    """Dataclass for set_transfer_allowlist arguments"""
+    freeze_asset: int
+    allowlist_root: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_transfer_allowlist(uint64,byte[32])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetDestroyArgs:
+    """Dataclass for asset_destroy arguments"""
+    destroy_asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_destroy(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetAssetConfigArgs:
+    """Dataclass for get_asset_config arguments"""
+    asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetAssetIsFrozenArgs:
+    """Dataclass for get_asset_is_frozen arguments"""
+    freeze_asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_asset_is_frozen(uint64)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetAccountIsFrozenArgs:
+    """Dataclass for get_account_is_frozen arguments"""
+    freeze_asset: int
+    freeze_account: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_account_is_frozen(uint64,address)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCirculatingSupplyArgs:
+    """Dataclass for get_circulating_supply arguments"""
+    asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_circulating_supply(uint64)uint64"
+
+
+class SmartAsaMultiParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_opt_in(uint64,axfer)void",
+            "args": method_args,
+        }))
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_close_out(uint64,address)void",
+            "args": method_args,
+        }))
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64",
+            "args": method_args,
+        }))
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void",
+            "args": method_args,
+        }))
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer(uint64,uint64,address,address)void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }))
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_freeze(uint64,bool)void",
+            "args": method_args,
+        }))
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "account_freeze(uint64,address,bool)void",
+            "args": method_args,
+        }))
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }))
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_destroy(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)",
+            "args": method_args,
+        }))
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_is_frozen(uint64)bool",
+            "args": method_args,
+        }))
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_account_is_frozen(uint64,address)bool",
+            "args": method_args,
+        }))
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_circulating_supply(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class SmartAsaMultiCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_opt_in(uint64,axfer)void",
+            "args": method_args,
+        }))
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_close_out(uint64,address)void",
+            "args": method_args,
+        }))
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64",
+            "args": method_args,
+        }))
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void",
+            "args": method_args,
+        }))
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer(uint64,uint64,address,address)void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }))
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_freeze(uint64,bool)void",
+            "args": method_args,
+        }))
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "account_freeze(uint64,address,bool)void",
+            "args": method_args,
+        }))
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }))
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_destroy(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)",
+            "args": method_args,
+        }))
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_is_frozen(uint64)bool",
+            "args": method_args,
+        }))
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_account_is_frozen(uint64,address)bool",
+            "args": method_args,
+        }))
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_circulating_supply(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class SmartAsaMultiSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_opt_in(uint64,axfer)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_close_out(uint64,address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer(uint64,uint64,address,address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_freeze(uint64,bool)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "account_freeze(uint64,address,bool)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_destroy(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[AssetConfig]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(AssetConfig, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[AssetConfig], parsed_response)
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_is_frozen(uint64)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_account_is_frozen(uint64,address)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_circulating_supply(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class SmartAsaMultiState:
+    """Methods to access state for the current SmartAsaMulti app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "ControlledAsset": ControlledAsset
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def ctrl_assets(self) -> "_MapState[int, ControlledAsset]":
+        """Get values from the ctrl_assets map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "ctrl_assets",
+            self._struct_classes.get("ControlledAsset")
+        )
+
+    @property
+    def holdings(self) -> "_MapState[Holding, bool]":
+        """Get values from the holdings map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "holdings",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class SmartAsaMultiClient:
+    """Client for interacting with SmartAsaMulti smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = SmartAsaMultiParams(self.app_client)
+        self.create_transaction = SmartAsaMultiCreateTransactionParams(self.app_client)
+        self.send = SmartAsaMultiSend(self.app_client)
+        self.state = SmartAsaMultiState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "SmartAsaMultiClient":
+        return SmartAsaMultiClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "SmartAsaMultiClient":
+        return SmartAsaMultiClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "SmartAsaMultiClient":
+        return SmartAsaMultiClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "SmartAsaMultiComposer":
+        return SmartAsaMultiComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_opt_in(uint64,axfer)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_close_out(uint64,address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_transfer(uint64,uint64,address,address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_transfer_batch(uint64,(address,address,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_freeze(uint64,bool)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["account_freeze(uint64,address,bool)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_transfer_allowlist(uint64,byte[32])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_destroy(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> AssetConfig | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_asset_is_frozen(uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_account_is_frozen(uint64,address)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_circulating_supply(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | AssetConfig | None | bool | int:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class SmartAsaMultiBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating SmartAsaMulti contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class SmartAsaMultiFactory(algokit_utils.TypedAppFactoryProtocol[SmartAsaMultiBareCallCreateParams, None, None]):
+    """Factory for deploying and managing SmartAsaMultiClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = SmartAsaMultiFactoryParams(self.app_factory)
+        self.create_transaction = SmartAsaMultiFactoryCreateTransaction(self.app_factory)
+        self.send = SmartAsaMultiFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: SmartAsaMultiBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[SmartAsaMultiClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return SmartAsaMultiClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> SmartAsaMultiClient:
+        """Get an app client by creator address and name"""
+        return SmartAsaMultiClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> SmartAsaMultiClient:
+        """Get an app client by app ID"""
+        return SmartAsaMultiClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class SmartAsaMultiFactoryParams:
+    """Parameters for creating transactions for SmartAsaMulti contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = SmartAsaMultiFactoryCreateParams(app_factory)
+        self.update = SmartAsaMultiFactoryUpdateParams(app_factory)
+        self.delete = SmartAsaMultiFactoryDeleteParams(app_factory)
+
+class SmartAsaMultiFactoryCreateParams:
+    """Parameters for 'create' operations of SmartAsaMulti contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_opt_in(uint64,axfer)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_opt_in(uint64,axfer)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_close_out(uint64,address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_close_out(uint64,address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_transfer(uint64,uint64,address,address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_transfer(uint64,uint64,address,address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_transfer_batch(uint64,(address,address,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_freeze(uint64,bool)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_freeze(uint64,bool)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the account_freeze(uint64,address,bool)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "account_freeze(uint64,address,bool)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_transfer_allowlist(uint64,byte[32])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_transfer_allowlist(uint64,byte[32])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_destroy(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_destroy(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_asset_is_frozen(uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_asset_is_frozen(uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_account_is_frozen(uint64,address)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_account_is_frozen(uint64,address)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_circulating_supply(uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_circulating_supply(uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class SmartAsaMultiFactoryUpdateParams:
+    """Parameters for 'update' operations of SmartAsaMulti contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class SmartAsaMultiFactoryDeleteParams:
+    """Parameters for 'delete' operations of SmartAsaMulti contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class SmartAsaMultiFactoryCreateTransaction:
+    """Create transactions for SmartAsaMulti contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = SmartAsaMultiFactoryCreateTransactionCreate(app_factory)
+
+
+class SmartAsaMultiFactoryCreateTransactionCreate:
+    """Create new instances of SmartAsaMulti contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class SmartAsaMultiFactorySend:
+    """Send calls to SmartAsaMulti contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = SmartAsaMultiFactorySendCreate(app_factory)
+
+
+class SmartAsaMultiFactorySendCreate:
+    """Send create calls to SmartAsaMulti contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[SmartAsaMultiClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return SmartAsaMultiClient(result[0]), result[1]
+
+
+class SmartAsaMultiComposer:
+    """Composer for creating transaction groups for SmartAsaMulti contract calls"""
+
+    def __init__(self, client: "SmartAsaMultiClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_opt_in(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_opt_in(uint64,axfer)void", v
+            )
+        )
+        return self
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_close_out(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_close_out(uint64,address)void", v
+            )
+        )
+        return self
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_create(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64", v
+            )
+        )
+        return self
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_config(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void", v
+            )
+        )
+        return self
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_transfer(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_transfer(uint64,uint64,address,address)void", v
+            )
+        )
+        return self
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_transfer_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_transfer_batch(uint64,(address,address,uint64)[])void", v
+            )
+        )
+        return self
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_transfer_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void", v
+            )
+        )
+        return self
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_freeze(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_freeze(uint64,bool)void", v
+            )
+        )
+        return self
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.account_freeze(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "account_freeze(uint64,address,bool)void", v
+            )
+        )
+        return self
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_transfer_allowlist(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_transfer_allowlist(uint64,byte[32])void", v
+            )
+        )
+        return self
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_destroy(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_destroy(uint64)void", v
+            )
+        )
+        return self
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_asset_config(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)", v
+            )
+        )
+        return self
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_asset_is_frozen(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_asset_is_frozen(uint64)bool", v
+            )
+        )
+        return self
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_account_is_frozen(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_account_is_frozen(uint64,address)bool", v
+            )
+        )
+        return self
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_circulating_supply(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_circulating_supply(uint64)uint64", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "SmartAsaMultiComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "SmartAsaMultiComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,2301 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The total number of base units of the Smart ASA to create", "name": "total"}, {"type": "uint32", "desc": "The number of digits to use after the decimal point when displaying the Smart ASA", "name": "decimals"}, {"type": "bool", "desc": "Smart ASA default frozen (True to freeze holdings by default)", "name": "default_frozen"}, {"type": "string", "desc": "The name of a unit of Smart ASA", "name": "unit_name"}, {"type": "string", "desc": "The name of the Smart ASA", "name": "name"}, {"type": "string", "desc": "Smart ASA external URL", "name": "url"}, {"type": "byte[]", "desc": "Smart ASA metadata hash", "name": "metadata_hash"}, {"type": "address", "desc": "Account that can manage the configuration of the Smart ASA and destroy it", "name": "manager_addr"}, {"type": "address", "desc": "Account that holds the reserve (non-minted) units of Smart ASA and can mint or burn it", "name": "reserve_addr"}, {"type": "address", "desc": "Account that can freeze/unfreeze holdings of the Smart ASA globally or locally", "name": "freeze_addr"}, {"type": "address", "desc": "Account that can clawback holdings of the Smart ASA", "name": "clawback_addr"}], "name": "asset_create", "returns": {"type": "uint64", "desc": "Controlled ASA ID"}, "desc": "Create the Controlled ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["OptIn"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}, {"type": "axfer", "desc": "Controlled ASA opt in transaction", "name": "ctrl_asa_opt_in"}], "name": "asset_opt_in", "returns": {"type": "void"}, "desc": "Smart ASA opt in (App and Controlled ASA)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to configure", "name": "config_asset"}, {"type": "uint64", "desc": "Total number of base units if the Smart ASA. It can not be less than current circulating supply", "name": "total"}, {"type": "uint32", "desc": "The number of digits to use after the decimal point when displaying the Smart ASA", "name": "decimals"}, {"type": "bool", "desc": "Smart ASA default frozen (True to freeze holdings by default)", "name": "default_frozen"}, {"type": "string", "desc": "The name of a unit of Smart ASA", "name": "unit_name"}, {"type": "string", "desc": "The name of the Smart ASA", "name": "name"}, {"type": "string", "desc": "Smart ASA external URL", "name": "url"}, {"type": "byte[]", "desc": "Smart ASA metadata hash", "name": "metadata_hash"}, {"type": "address", "desc": "Account that can manage the configuration of the Smart ASA and destroy it", "name": "manager_addr"}, {"type": "address", "desc": "Account that holds the reserve (non-minted) units of Smart ASA and can mint or burn it", "name": "reserve_addr"}, {"type": "address", "desc": "Account that can freeze/unfreeze holdings of the Smart ASA globally or locally", "name": "freeze_addr"}, {"type": "address", "desc": "Account that can clawback holdings of the Smart ASA", "name": "clawback_addr"}], "name": "asset_config", "returns": {"type": "void"}, "desc": "Configure Smart ASA (for unchanged parameters use existing value - no optional args on AVM)", "events": [{"args": [{"type": "uint64", "name": "total"}, {"type": "uint32", "name": "decimals"}, {"type": "bool", "name": "default_frozen"}, {"type": "string", "name": "unit_name"}, {"type": "string", "name": "name"}, {"type": "string", "name": "url"}, {"type": "byte[]", "name": "metadata_hash"}, {"type": "address", "name": "manager_addr"}, {"type": "address", "name": "reserve_addr"}, {"type": "address", "name": "freeze_addr"}, {"type": "address", "name": "clawback_addr"}], "name": "AssetConfig", "desc": "Smart ASA Configuration"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "uint64", "desc": "Amount to transfer", "name": "asset_amount"}, {"type": "address", "desc": "Smart ASA sender", "name": "asset_sender"}, {"type": "address", "desc": "Smart ASA receiver", "name": "asset_receiver"}], "name": "asset_transfer", "returns": {"type": "void"}, "desc": "Smart ASA transfers: regular, clawback, mint, burn", "events": [{"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "(address,address,uint64)[]", "desc": "Transfer legs (sender, receiver, amount), submitted as a single inner transaction group", "name": "legs"}], "name": "asset_transfer_batch", "returns": {"type": "void"}, "desc": "Smart ASA batched transfers: each leg is a regular, clawback, mint or burn transfer", "events": [{"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to transfer", "name": "xfer_asset"}, {"type": "uint64", "desc": "Amount to transfer", "name": "asset_amount"}, {"type": "address", "desc": "Smart ASA sender", "name": "asset_sender"}, {"type": "address", "desc": "Smart ASA receiver", "name": "asset_receiver"}, {"type": "byte[32][]", "desc": "Merkle proof of the sender inclusion in the transfer allowlist", "name": "sender_proof"}, {"type": "byte[32][]", "desc": "Merkle proof of the receiver inclusion in the transfer allowlist", "name": "receiver_proof"}], "name": "asset_transfer_with_proof", "returns": {"type": "void"}, "desc": "Smart ASA regular transfer between allowlisted accounts", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to globally freeze/unfreeze", "name": "freeze_asset"}, {"type": "bool", "desc": "Smart ASA frozen status", "name": "asset_frozen"}], "name": "asset_freeze", "returns": {"type": "void"}, "desc": "Smart ASA global freeze (all accounts)", "events": [{"args": [{"type": "bool", "name": "asset_frozen"}], "name": "AssetFreeze", "desc": "Smart ASA Global Freeze Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to locally freeze/unfreeze", "name": "freeze_asset"}, {"type": "address", "desc": "Account to freeze/unfreeze", "name": "freeze_account"}, {"type": "bool", "desc": "Smart ASA frozen status", "name": "asset_frozen"}], "name": "account_freeze", "returns": {"type": "void"}, "desc": "Smart ASA local freeze (account specific)", "events": [{"args": [{"type": "address", "name": "freeze_account"}, {"type": "bool", "name": "asset_frozen"}], "name": "AccountFreeze", "desc": "Smart ASA Account Freeze Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to set the transfer allowlist for", "name": "freeze_asset"}, {"type": "byte[32]", "desc": "Allowlist Merkle root (zero hash to disable the allowlist)", "name": "allowlist_root"}], "name": "set_transfer_allowlist", "returns": {"type": "void"}, "desc": "Smart ASA transfer allowlist (Merkle root of the accounts allowed to transfer)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["CloseOut"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to close out", "name": "close_asset"}, {"type": "address", "desc": "Account to send all the Smart ASA remainder to.", "name": "close_to"}], "name": "asset_close_out", "returns": {"type": "void"}, "desc": "Smart ASA close out (App and Controlled ASA)", "events": [{"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID to destroy", "name": "destroy_asset"}], "name": "asset_destroy", "returns": {"type": "void"}, "desc": "Destroy the Controlled ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}], "name": "get_asset_config", "returns": {"type": "(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)", "desc": "Smart ASA configuration parameters", "struct": "AssetConfig"}, "desc": "Get Smart ASA configuration", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "freeze_asset"}], "name": "get_asset_is_frozen", "returns": {"type": "bool", "desc": "Smart ASA global frozen status"}, "desc": "Get Smart ASA global frozen status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "freeze_asset"}, {"type": "address", "desc": "Account to check", "name": "freeze_account"}], "name": "get_account_is_frozen", "returns": {"type": "bool", "desc": "Smart ASA account frozen status"}, "desc": "Get Smart ASA account frozen status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Smart ASA ID", "name": "asset"}], "name": "get_circulating_supply", "returns": {"type": "uint64", "desc": "Smart ASA circulating supply"}, "desc": "Get Smart ASA circulating supply", "events": [], "readonly": true, "recommendations": {}}], "name": "SmartAsaPacked", "state": {"keys": {"box": {"asset_config_box": {"key": "YXNzZXRfY29uZmln", "keyType": "AVMBytes", "valueType": "AssetConfig"}}, "global": {"smart_asa_id": {"key": "c21hcnRfYXNhX2lk", "keyType": "AVMString", "valueType": "AVMUint64"}, "global_frozen": {"key": "Z2xvYmFsX2Zyb3plbg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "allowlist_root": {"key": "YWxsb3dsaXN0X3Jvb3Q=", "keyType": "AVMString", "valueType": "AVMBytes"}}, "local": {"account_smart_asa_id": {"key": "YWNjb3VudF9zbWFydF9hc2FfaWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "account_frozen": {"key": "YWNjb3VudF9mcm96ZW4=", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 2}, "local": {"bytes": 0, "ints": 2}}}, "structs": {"AssetConfig": [{"name": "total", "type": "uint64"}, {"name": "decimals", "type": "uint32"}, {"name": "default_frozen", "type": "bool"}, {"name": "unit_name", "type": "string"}, {"name": "name", "type": "string"}, {"name": "url", "type": "string"}, {"name": "metadata_hash", "type": "byte[]"}, {"name": "manager_addr", "type": "address"}, {"name": "reserve_addr", "type": "address"}, {"name": "freeze_addr", "type": "address"}, {"name": "clawback_addr", "type": "address"}]}, "byteCode": {"approval": "CyAFAAEgCP///////////wEmCgxhc3NldF9jb25maWcUYWNjb3VudF9zbWFydF9hc2FfaWQOYWNjb3VudF9mcm96ZW4NZ2xvYmFsX2Zyb3plbg5hbGxvd2xpc3Rfcm9vdAxzbWFydF9hc2FfaWQEFR98dQEAAgCVBPn79dwxGEAAITE1IxJEMTSBAhJEMTcURDE2gQISRCcFImcrImcnBIAAZzEbQQCWggIESGQWRQQ6BFvcNhoAjgIAdgBqMRkURDEYRIINBOfs1agE+IGf6wR+rLd1BE7OS3QELFCH4gShM9WBBP9Tre8ESjqU/QTtZEUvBC6bkDgEl5uZcgRIpjzJBEatDVI2GgCODQAiAf4DSQONBEQEvgTtBTMGMQZnBn0GmgbAADEZgQISMRgQREIFXDEZIxIxGBBEQgF3MRkUMRgUEEQjQzYaAUkVJRJENhoCSRWBBBJENhoDSRUjEkQ2GgRHAiJZgQIITBVJTwISRDYaBUcCIlmBAghMFUlPAhJENhoGRwIiWYECCEwVSU8CEkQ2GgdHAiJZgQIITBUSRDYaCEkVJBJENhoJSRUkEkQ2GgpJFSQSRDYaC0kVJBJEMQAyCRJEIicFZUQURLEyCIAASwFBACJLAUmBChiACjAxMjM0NTY3ODlMI1hLAlBFAoEKCkUCQv/ZRwIVgAEwTgJNgA9hbGdvcmFuZDovL2FwcC9MUDIKRwOyLLIrsiqyKbIngBBBUkMtMjAgU21hcnQgQVNBsiaABkFSQy0yMLIlI7IkIrIjIQSyIoEDshAisgGztDxLEEsQUEsPUCcIUIGVAUsOCEkWVwYCTwJMUExLDAhJFlcGAk8CTFBMSwoIFlcGAlBLB1BLBlBLBVBLBFBLDlBLDFBLClBLCFAnBUsCZyi8SCi8SChMvxYnBkxQsCNDNhoBSRUlEkQXSTEWIwlJOBCBBBJEMRkjEkRLAYgFOEk4EUsCEkRJOAAxABJESTgUMQASREk4EhREOBUyAxJEMQBMcABFAUQxACiBDCO6IlNAAAoxAEsCcABEQQAOI0sBSSlLBWYqTwJmI0MiQv/vIkk2GgFJFSUSRBdJNhoCSU4CFSUSRDYaA0lOAhWBBBJENhoESU4CFSMSRDYaBUlOAkkiWYECCEwVSU4DEkQ2GgZJTgJJIlmBAghMFUlOAxJENhoHSU4CSSJZgQIITBVJTgMSRDYaCElOAkkiWYECCEwVEkQ2GglJTgIVJBJENhoKSU4CSRUkEkQ2GgtJTgMVJBJENhoMSU4DFSQSREyIBEcxAIEViAQyEkSBNYgEK0lOAhNBAAVJMgMTRIFViAQaSUUSSwMTQQAGSxAyAxNEgXWIBAZJRRNLAhNBAAZLETIDE0RLD4gEGxZLD0lPAqdESw5QSw1QJwhQgZUBSwwISRZXBgJPAkxQTEsKCEkWVwYCTwJMUExLCAgWVwYCUEsFUEsEUEsDUEsCUEsMUEsKUEsIUEsGUCi8SCi8SChLAb+ABOEMWkdMULAjQzYaAUkVJRJEFzYaAkkVJRJENhoDSRUkEkQ2GgRJFSQSREsDiAN3TwIXSwNLA0sDSwOIA8dLA0sBSwRLBIgFIogEdiNDIkmAADYaAUkVJRJEF0k2GgJJTgJJIllJTgNJgUgLgQIITwIVEkRMiAMvSUSBEA5EIklJSwMMQQB7SwNXAgBLAYFIC4FIWElXACBJTgJFCUlXICBFCoFAW0UHMgoSQQBGSwFLBghJRQNLBUsISwpPA4gDRElBACu2gQSyECKyAUsESbIRSwZJTgKyEksISbITSwpJshRPA4gD2kkjCEUBQv+QsUL/0ksESwdLCUsIiAMGQv+/syNDNhoBSRUlEkQXNhoCSRUlEkQ2GgNJFSQSRDYaBEkVJBJENhoFSSJZJAuBAghLARUSRDYaBkkiWSQLgQIISwEVEkRLBYgCXEsFiAJmREsFSwRLBIgCd0sFSwRPA4gDr0hESwRLAk8CiAOkSERPAhdPA0xPA08DiAPuI0M2GgFJFSUSRBc2GgJJFSMSREyIAhMxAIFViAH+EkRJIlMrTGeABGKZZGpMULAjQzYaAUkVJRJEFzYaAkkVJBJENhoDSRUjEkRLAogB20sBIiljRE8DEkQxAIFViAG8EkRJIlNLAipPAmZQgATvi2bZTFCwI0M2GgFJFSUSRBc2GgJJTgJJFSQSREyIAZsxAIFViAGGEkQyAxJBAAcnBIAAZyNDJwRLAWdC//aAADYaAUkVJRJEF0k2GgJJTgIVJBJEMRmBAhJEMRYjCEk4EIEEEkQxACIpY0RLAhJEMgRLAQ1ESTgRSwISREk4ADEAEkRJOBIURDgVMgMTRHELQQBxMRYjCEk4EIEEEkQ4FUsBSU4CEkRLA4gBD0sCE0EAJ0sBSSIpY0RLBElOAhJEiAEHFEQiK2VEFEQxACIqY0QURCIqY0QURDEASwNJTgJwAExJTgJFB0QxAEsESU4EiAKMMgoSQQALMQBLBBZQJwlMULAjQzYaAUkVJRJEF0mIAKgxAIEViACTEkSxMgqyALIhgQOyECKyAbMovEgnBSJnKyJnJwSAAGcjQzYaAUkVJRJEF4gAcyi+RCcGTFCwI0M2GgFJFSUSRBeIAF0iK2VEJwciTwJUJwZMULAjQzYaAUkVJRJEFzYaAkkVJBJETIgANyIqY0QnByJPAlQnBkxQsCNDNhoBSRUlEkQXSYgAGYgAMRYnBkxQsCNDigEBKIv/JLpJFSQSRImKAQAiJwVlRElEi/8SRImKAQEiJwRlRBUiE4mKAQEyCov/cABEIQRMCYmKAwAxAIv+EkSL/iIpY0SL/RJEi/8iKWNEi/0SRCIrZUQURIv+IipjRBREi/8iKmNEFESJigQAIov9MgoSQQBCgTWI/4MxAEsBEkSL/jIKE0SL/Ij/m4v/CCgiJboXDkSL/iIpY0SL/BJEIitlRBREgXWI/1MTQQAIi/4iKmNEFESJi/4yChJBADaBNYj/OUmMADEASwESRIv9IiljRIv8EkQiK2VEFESBdYj/GxNB/9CL/SIqY0QURIv9iwASRIkxAIF1iP8BEkEAFYv9IiljRIv8EkSL/iIpY0SL/BJEiYv8iP8AFESL/Iv9i/6I/xCJigQAi/0yChJBABGL/xaL/kxQgATfLnlOTFCwiYv+MgoSQQANi/8Wi/1MUCcJTFCwiTEAgXWI/p8SQf/fi/8Wi/2L/lBMUIAES4mY/ExQsImKAwInB4v+UAGL/yJZIosCiwEMQQA0i/9XAgCLAiQLJFhJiwClQQAUgAEBiwBQTFABjACLAiMIjAJC/9KAAQFMUIsAUAGMAEL/6SInBGVEiwASi/+MAYwAiYoEALEyCrIAi/+yFIv+shOL/bISi/yyEYEEshAisgGziQ==", "clear": "C4EBQw=="}, "desc": "\n    ARC-0020 (Smart ASA) - Reference Implementation, packed configuration layout\n\n    The Smart ASA configuration is stored ARC-4 encoded (AssetConfig) in a single box,\n    role addresses and total are read at fixed offsets of its static head.\n    ", "events": [{"args": [{"type": "uint64", "name": "total"}, {"type": "uint32", "name": "decimals"}, {"type": "bool", "name": "default_frozen"}, {"type": "string", "name": "unit_name"}, {"type": "string", "name": "name"}, {"type": "string", "name": "url"}, {"type": "byte[]", "name": "metadata_hash"}, {"type": "address", "name": "manager_addr"}, {"type": "address", "name": "reserve_addr"}, {"type": "address", "name": "freeze_addr"}, {"type": "address", "name": "clawback_addr"}], "name": "AssetConfig", "desc": "Smart ASA Configuration"}, {"args": [{"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Mint", "desc": "Smart ASA Mint Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "uint64", "name": "asset_amount"}], "name": "Burn", "desc": "Smart ASA Burn Event"}, {"args": [{"type": "address", "name": "asset_sender"}, {"type": "address", "name": "asset_receiver"}, {"type": "uint64", "name": "asset_amount"}], "name": "Clawback", "desc": "Smart ASA Clawback Event"}, {"args": [{"type": "bool", "name": "asset_frozen"}], "name": "AssetFreeze", "desc": "Smart ASA Global Freeze Event"}, {"args": [{"type": "address", "name": "freeze_account"}, {"type": "bool", "name": "asset_frozen"}], "name": "AccountFreeze", "desc": "Smart ASA Account Freeze Event"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgOCAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgYnl0ZWNibG9jayAweDYxNzM3MzY1NzQ1ZjYzNmY2ZTY2Njk2NyAiYWNjb3VudF9zbWFydF9hc2FfaWQiICJhY2NvdW50X2Zyb3plbiIgImdsb2JhbF9mcm96ZW4iICJhbGxvd2xpc3Rfcm9vdCIgInNtYXJ0X2FzYV9pZCIgMHgxNTFmN2M3NSAweDAwIDB4MDA5NSAweGY5ZmJmNWRjCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTozNS0zNgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fYnl0ZV9zbGljZSA9PSBjZmcuR0xPQkFMX0JZVEVTLCBlcnIuV1JPTkdfR0xPQkFMX0JZVEVTCiAgICB0eG4gR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6MzcKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV91aW50ID09IGNmZy5HTE9CQUxfVUlOVFMsIGVyci5XUk9OR19HTE9CQUxfVUlOVFMKICAgIHR4biBHbG9iYWxOdW1VaW50CiAgICBwdXNoaW50IDIgLy8gMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6MzgKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfcGFja2VkL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV91aW50ID09IGNmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICBwdXNoaW50IDIgLy8gMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkxMC05MTIKICAgIC8vICMgR0xPQkFMIFNUQVRFCiAgICAvLyAjIFNtYXJ0IEFTQSBGaWVsZHMKICAgIC8vIHNlbGYuc21hcnRfYXNhX2lkID0gVUludDY0KCkKICAgIGJ5dGVjIDUgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5MTMKICAgIC8vIHNlbGYuZ2xvYmFsX2Zyb3plbiA9IEZhbHNlCiAgICBieXRlY18zIC8vICJnbG9iYWxfZnJvemVuIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkxNAogICAgLy8gc2VsZi5hbGxvd2xpc3Rfcm9vdCA9IEJ5dGVzKCkKICAgIGJ5dGVjIDQgLy8gImFsbG93bGlzdF9yb290IgogICAgcHVzaGJ5dGVzIDB4CiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weToxOC0yNgogICAgLy8gY2xhc3MgU21hcnRBc2FQYWNrZWQoCiAgICAvLyAgICAgU2luZ2xlU21hcnRBc2FCYXNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDI1CiAgICBwdXNoYnl0ZXNzIDB4NDg2NDE2NDUgMHgzYTA0NWJkYyAvLyBtZXRob2QgImFzc2V0X29wdF9pbih1aW50NjQsYXhmZXIpdm9pZCIsIG1ldGhvZCAiYXNzZXRfY2xvc2Vfb3V0KHVpbnQ2NCxhZGRyZXNzKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2Fzc2V0X29wdF9pbl9yb3V0ZUA1IG1haW5fYXNzZXRfY2xvc2Vfb3V0X3JvdXRlQDYKCm1haW5fc3dpdGNoX2Nhc2VfbmV4dEA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6MTgtMjYKICAgIC8vIGNsYXNzIFNtYXJ0QXNhUGFja2VkKAogICAgLy8gICAgIFNpbmdsZVNtYXJ0QXNhQmFzZSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgICAgICBnbG9iYWxfdWludHM9Y2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9Y2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgKSwKICAgIC8vICk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydAogICAgcHVzaGJ5dGVzcyAweGU3ZWNkNWE4IDB4Zjg4MTlmZWIgMHg3ZWFjYjc3NSAweDRlY2U0Yjc0IDB4MmM1MDg3ZTIgMHhhMTMzZDU4MSAweGZmNTNhZGVmIDB4NGEzYTk0ZmQgMHhlZDY0NDUyZiAweDJlOWI5MDM4IDB4OTc5Yjk5NzIgMHg0OGE2M2NjOSAweDQ2YWQwZDUyIC8vIG1ldGhvZCAiYXNzZXRfY3JlYXRlKHVpbnQ2NCx1aW50MzIsYm9vbCxzdHJpbmcsc3RyaW5nLHN0cmluZyxieXRlW10sYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgImFzc2V0X2NvbmZpZyh1aW50NjQsdWludDY0LHVpbnQzMixib29sLHN0cmluZyxzdHJpbmcsc3RyaW5nLGJ5dGVbXSxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzKXZvaWQiLCBtZXRob2QgImFzc2V0X3RyYW5zZmVyKHVpbnQ2NCx1aW50NjQsYWRkcmVzcyxhZGRyZXNzKXZvaWQiLCBtZXRob2QgImFzc2V0X3RyYW5zZmVyX2JhdGNoKHVpbnQ2NCwoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NClbXSl2b2lkIiwgbWV0aG9kICJhc3NldF90cmFuc2Zlcl93aXRoX3Byb29mKHVpbnQ2NCx1aW50NjQsYWRkcmVzcyxhZGRyZXNzLGJ5dGVbMzJdW10sYnl0ZVszMl1bXSl2b2lkIiwgbWV0aG9kICJhc3NldF9mcmVlemUodWludDY0LGJvb2wpdm9pZCIsIG1ldGhvZCAiYWNjb3VudF9mcmVlemUodWludDY0LGFkZHJlc3MsYm9vbCl2b2lkIiwgbWV0aG9kICJzZXRfdHJhbnNmZXJfYWxsb3dsaXN0KHVpbnQ2NCxieXRlWzMyXSl2b2lkIiwgbWV0aG9kICJhc3NldF9kZXN0cm95KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfYXNzZXRfY29uZmlnKHVpbnQ2NCkodWludDY0LHVpbnQzMixib29sLHN0cmluZyxzdHJpbmcsc3RyaW5nLGJ5dGVbXSxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzKSIsIG1ldGhvZCAiZ2V0X2Fzc2V0X2lzX2Zyb3plbih1aW50NjQpYm9vbCIsIG1ldGhvZCAiZ2V0X2FjY291bnRfaXNfZnJvemVuKHVpbnQ2NCxhZGRyZXNzKWJvb2wiLCBtZXRob2QgImdldF9jaXJjdWxhdGluZ19zdXBwbHkodWludDY0KXVpbnQ2NCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGFzc2V0X2NyZWF0ZSBhc3NldF9jb25maWcgYXNzZXRfdHJhbnNmZXIgYXNzZXRfdHJhbnNmZXJfYmF0Y2ggYXNzZXRfdHJhbnNmZXJfd2l0aF9wcm9vZiBhc3NldF9mcmVlemUgYWNjb3VudF9mcmVlemUgc2V0X3RyYW5zZmVyX2FsbG93bGlzdCBhc3NldF9kZXN0cm95IGdldF9hc3NldF9jb25maWcgZ2V0X2Fzc2V0X2lzX2Zyb3plbiBnZXRfYWNjb3VudF9pc19mcm96ZW4gZ2V0X2NpcmN1bGF0aW5nX3N1cHBseQogICAgZXJyCgptYWluX2Fzc2V0X2Nsb3NlX291dF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MDEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiQ2xvc2VPdXQiXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgMiAvLyBDbG9zZU91dAogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIENsb3NlT3V0ICYmIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGIgYXNzZXRfY2xvc2Vfb3V0CgptYWluX2Fzc2V0X29wdF9pbl9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMSAvLyBPcHRJbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE9wdEluICYmIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGIgYXNzZXRfb3B0X2luCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDI1OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcCAmJiBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF9jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9jcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNwogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA4CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDkKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTAKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0MjYtNDI3CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsIGVyci5VTkFVVEhPUklaRUQKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTMyCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuc21hcnRfYXNhX2lkLCBlcnIuRVhJU1RJTkdfQ1RSTF9BU0EKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJzbWFydF9hc2FfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc21hcnRfYXNhX2lkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIENvbnRyb2xsZWQgQVNBIGFscmVhZHkgY3JlYXRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNDktMzYyCiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gICAgIHRvdGFsPWNmZy5UT1RBTCwKICAgIC8vICAgICBkZWNpbWFscz1jZmcuREVDSU1BTFMsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49Y2ZnLkRFRkFVTFRfRlJPWkVOLAogICAgLy8gICAgIHVuaXRfbmFtZT1jZmcuVU5JVF9OQU1FLAogICAgLy8gICAgIGFzc2V0X25hbWU9Y2ZnLk5BTUUsCiAgICAvLyAgICAgdXJsPWNmZy5BUFBfQklORElORyArIHNlbGYuaXRvYShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKQogICAgLy8gLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1NgogICAgLy8gdXJsPWNmZy5BUFBfQklORElORyArIHNlbGYuaXRvYShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTYwCiAgICAvLyBhY2MgPSBCeXRlcygpCiAgICBwdXNoYnl0ZXMgMHgKCmFzc2V0X2NyZWF0ZV93aGlsZV90b3BANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTYxCiAgICAvLyB3aGlsZSBuID4gMDoKICAgIGRpZyAxCiAgICBieiBhc3NldF9jcmVhdGVfYWZ0ZXJfd2hpbGVANgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjIKICAgIC8vIGFjYyA9IGRpZ2l0c1tuICUgMTBdICsgYWNjCiAgICBkaWcgMQogICAgZHVwCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE1OQogICAgLy8gZGlnaXRzID0gQnl0ZXMoYiIwMTIzNDU2Nzg5IikKICAgIHB1c2hieXRlcyAweDMwMzEzMjMzMzQzNTM2MzczODM5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gYWNjID0gZGlnaXRzW24gJSAxMF0gKyBhY2MKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICBleHRyYWN0MwogICAgZGlnIDIKICAgIGNvbmNhdAogICAgYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2MwogICAgLy8gbiAvLz0gMTAKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIC8KICAgIGJ1cnkgMgogICAgYiBhc3NldF9jcmVhdGVfd2hpbGVfdG9wQDQKCmFzc2V0X2NyZWF0ZV9hZnRlcl93aGlsZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxNjQKICAgIC8vIHJldHVybiBhY2Mgb3IgQnl0ZXMoYiIwIikKICAgIGR1cG4gMgogICAgbGVuCiAgICBwdXNoYnl0ZXMgMHgzMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1NgogICAgLy8gdXJsPWNmZy5BUFBfQklORElORyArIHNlbGYuaXRvYShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICBwdXNoYnl0ZXMgMHg2MTZjNjc2ZjcyNjE2ZTY0M2EyZjJmNjE3MDcwMmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTcKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1OC0zNjAKICAgIC8vIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cG4gMwogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVUkwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzU1CiAgICAvLyBhc3NldF9uYW1lPWNmZy5OQU1FLAogICAgcHVzaGJ5dGVzICJBUkMtMjAgU21hcnQgQVNBIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzU0CiAgICAvLyB1bml0X25hbWU9Y2ZnLlVOSVRfTkFNRSwKICAgIHB1c2hieXRlcyAiQVJDLTIwIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1MwogICAgLy8gZGVmYXVsdF9mcm96ZW49Y2ZnLkRFRkFVTFRfRlJPWkVOLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1MgogICAgLy8gZGVjaW1hbHM9Y2ZnLkRFQ0lNQUxTLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNTEKICAgIC8vIHRvdGFsPWNmZy5UT1RBTCwKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0OQogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIHB1c2hpbnQgMyAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM1MAogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzQ5LTM2MgogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB0b3RhbD1jZmcuVE9UQUwsCiAgICAvLyAgICAgZGVjaW1hbHM9Y2ZnLkRFQ0lNQUxTLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPWNmZy5ERUZBVUxUX0ZST1pFTiwKICAgIC8vICAgICB1bml0X25hbWU9Y2ZnLlVOSVRfTkFNRSwKICAgIC8vICAgICBhc3NldF9uYW1lPWNmZy5OQU1FLAogICAgLy8gICAgIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkKICAgIC8vIC5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzQ5LTM2MwogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICB0b3RhbD1jZmcuVE9UQUwsCiAgICAvLyAgICAgZGVjaW1hbHM9Y2ZnLkRFQ0lNQUxTLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPWNmZy5ERUZBVUxUX0ZST1pFTiwKICAgIC8vICAgICB1bml0X25hbWU9Y2ZnLlVOSVRfTkFNRSwKICAgIC8vICAgICBhc3NldF9uYW1lPWNmZy5OQU1FLAogICAgLy8gICAgIHVybD1jZmcuQVBQX0JJTkRJTkcgKyBzZWxmLml0b2EoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkKICAgIC8vIC5zdWJtaXQoKQogICAgLy8gLmNyZWF0ZWRfYXNzZXQuaWQKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDM0LTQ0NgogICAgLy8gQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9dG90YWwsCiAgICAvLyAgICAgZGVjaW1hbHM9ZGVjaW1hbHMsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49ZGVmYXVsdF9mcm96ZW4sCiAgICAvLyAgICAgdW5pdF9uYW1lPXVuaXRfbmFtZSwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgdXJsPXVybCwKICAgIC8vICAgICBtZXRhZGF0YV9oYXNoPW1ldGFkYXRhX2hhc2gsCiAgICAvLyAgICAgbWFuYWdlcl9hZGRyPW1hbmFnZXJfYWRkciwKICAgIC8vICAgICByZXNlcnZlX2FkZHI9cmVzZXJ2ZV9hZGRyLAogICAgLy8gICAgIGZyZWV6ZV9hZGRyPWZyZWV6ZV9hZGRyLAogICAgLy8gICAgIGNsYXdiYWNrX2FkZHI9Y2xhd2JhY2tfYWRkciwKICAgIC8vICksCiAgICBkaWcgMTYKICAgIGRpZyAxNgogICAgY29uY2F0CiAgICBkaWcgMTUKICAgIGNvbmNhdAogICAgYnl0ZWMgOCAvLyAweDAwOTUKICAgIGNvbmNhdAogICAgcHVzaGludCAxNDkgLy8gMTQ5CiAgICBkaWcgMTQKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkaWcgMTIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkaWcgMTAKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIGRpZyA3CiAgICBjb25jYXQKICAgIGRpZyA2CiAgICBjb25jYXQKICAgIGRpZyA1CiAgICBjb25jYXQKICAgIGRpZyA0CiAgICBjb25jYXQKICAgIGRpZyAxNAogICAgY29uY2F0CiAgICBkaWcgMTIKICAgIGNvbmNhdAogICAgZGlnIDEwCiAgICBjb25jYXQKICAgIGRpZyA4CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTM2CiAgICAvLyBzZWxmLnNtYXJ0X2FzYV9pZCA9IGFzc2V0X2lkCiAgICBieXRlYyA1IC8vICJzbWFydF9hc2FfaWQiCiAgICBkaWcgMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfcGFja2VkL2NvbnRyYWN0LnB5Ojg4LTg5CiAgICAvLyAjIER5bmFtaWMgZmllbGRzIG1heSBjaGFuZ2UgdGhlIGVuY29kZWQgc2l6ZSwgdGhlIGJveCBpcyByZS1jcmVhdGVkLgogICAgLy8gZGVsIHNlbGYuYXNzZXRfY29uZmlnX2JveC52YWx1ZQogICAgYnl0ZWNfMCAvLyAweDYxNzM3MzY1NzQ1ZjYzNmY2ZTY2Njk2NwogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo5MAogICAgLy8gc2VsZi5hc3NldF9jb25maWdfYm94LnZhbHVlID0gYXNzZXRfY29uZmlnLmNvcHkoKQogICAgYnl0ZWNfMCAvLyAweDYxNzM3MzY1NzQ1ZjYzNmY2ZTY2Njk2NwogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18wIC8vIDB4NjE3MzczNjU3NDVmNjM2ZjZlNjY2OTY3CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ0OAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNtYXJ0X2FzYV9pZCkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF9vcHRfaW5bcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9vcHRfaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJPcHRJbiJdKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ5MgogICAgLy8gYXNzZXJ0IFR4bi5vbl9jb21wbGV0aW9uID09IE9uQ29tcGxldGVBY3Rpb24uT3B0SW4sIGVyci5XUk9OR19PTl9DT01QTEVURQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18xIC8vIE9wdEluCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE9uIENvbXBsZXRlIEFjdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NTQtNDU1CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGFzc2V0LmlkKQogICAgZGlnIDEKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ1OQogICAgLy8gYXNzZXJ0IGN0cmxfYXNhX29wdF9pbi54ZmVyX2Fzc2V0LmlkID09IGFzc2V0LmlkLCBlcnIuT1BUX0lOX1dST05HX0FTQQogICAgZHVwCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGRpZyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBPcHQgSW4gSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDYwCiAgICAvLyBhc3NlcnQgY3RybF9hc2Ffb3B0X2luLnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuT1BUX0lOX1dST05HX1NFTkRFUgogICAgZHVwCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIE9wdCBJbiBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDYxCiAgICAvLyBhc3NlcnQgY3RybF9hc2Ffb3B0X2luLmFzc2V0X3JlY2VpdmVyID09IFR4bi5zZW5kZXIsIGVyci5PUFRfSU5fV1JPTkdfUkVDRUlWRVIKICAgIGR1cAogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgT3B0IEluIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gY3RybF9hc2Ffb3B0X2luLmFzc2V0X2Ftb3VudCA9PSAwCiAgICBkdXAKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2Mi00NjQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY3RybF9hc2Ffb3B0X2luLmFzc2V0X2Ftb3VudCA9PSAwCiAgICAvLyApLCBlcnIuT1BUX0lOX1dST05HX0FNT1VOVCAgIyBQZWRhbnQ6IENvbnRyb2xsZWQgQVNBIGlzIGRlZmF1bHQgZnJvemVuCiAgICBhc3NlcnQgLy8gV3JvbmcgQVNBIE9wdCBJbiBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDY2CiAgICAvLyBjdHJsX2FzYV9vcHRfaW4uYXNzZXRfY2xvc2VfdG8gPT0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgZ3R4bnMgQXNzZXRDbG9zZVRvCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ2NS00NjcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY3RybF9hc2Ffb3B0X2luLmFzc2V0X2Nsb3NlX3RvID09IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIC8vICksIGVyci5PUFRfSU5fV1JPTkdfQ0xPU0VfVE8KICAgIGFzc2VydCAvLyBGb3JiaWRkZW4gQ2xvc2UgT3V0IG9uIE9wdCBJbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjgKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyLmlzX29wdGVkX2luKAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo0NjgtNDcwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlci5pc19vcHRlZF9pbigKICAgIC8vICAgICBhc3NldAogICAgLy8gKSwgZXJyLk1JU1NJTkdfQ1RSTF9BU0EgICMgUGVkYW50OiBjdHJsX2FzYV9vcHRfaW4gaXMgY2hlY2tlZCBwcm9wZXJseQogICAgc3dhcAogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbnRyb2xsZWQgQVNBCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gVHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfcGFja2VkL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBjZmcuQVNTRVRfQ09ORklHX0JPWF9LRVksIGNmZy5ERUZBVUxUX0ZST1pFTl9PRkZTRVQsIDEKICAgIGJ5dGVjXzAgLy8gMHg2MTczNzM2NTc0NWY2MzZmNmU2NjY5NjcKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIGludGNfMSAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo2MS02MwogICAgLy8gZGVmYXVsdF9mcm96ZW4gPSBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBjZmcuQVNTRVRfQ09ORklHX0JPWF9LRVksIGNmZy5ERUZBVUxUX0ZST1pFTl9PRkZTRVQsIDEKICAgIC8vICkKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo2NAogICAgLy8gcmV0dXJuIGJvb2wob3AuZ2V0Yml0KGRlZmF1bHRfZnJvemVuLCAwKSkKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDc2LTQ3OAogICAgLy8gIyBQcmV2ZW50IGNsb3NlLW91dCBjaXJjdW12ZW50aW5nIGFjY291bnQgZnJvemVuIHN0YXRlCiAgICAvLyBhc3NldF9mcm96ZW49c2VsZi5jb25maWdfZGVmYXVsdF9mcm96ZW4oYXNzZXQuaWQpCiAgICAvLyBvciBhc3NldC5iYWxhbmNlKFR4bi5zZW5kZXIpID4gMCwKICAgIGJueiBhc3NldF9vcHRfaW5fYm9vbF90cnVlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDc4CiAgICAvLyBvciBhc3NldC5iYWxhbmNlKFR4bi5zZW5kZXIpID4gMCwKICAgIHR4biBTZW5kZXIKICAgIGRpZyAyCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IG9wdGVkIGludG8gYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDc2LTQ3OAogICAgLy8gIyBQcmV2ZW50IGNsb3NlLW91dCBjaXJjdW12ZW50aW5nIGFjY291bnQgZnJvemVuIHN0YXRlCiAgICAvLyBhc3NldF9mcm96ZW49c2VsZi5jb25maWdfZGVmYXVsdF9mcm96ZW4oYXNzZXQuaWQpCiAgICAvLyBvciBhc3NldC5iYWxhbmNlKFR4bi5zZW5kZXIpID4gMCwKICAgIGJ6IGFzc2V0X29wdF9pbl9ib29sX2ZhbHNlQDQKCmFzc2V0X29wdF9pbl9ib29sX3RydWVAMzoKICAgIGludGNfMSAvLyAxCgphc3NldF9vcHRfaW5fYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5ODctOTg4CiAgICAvLyAjIExvY2FsIFN0YXRlIEluaXQKICAgIC8vIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYWNjb3VudF0gPSBhc3NldF9pZAogICAgZGlnIDEKICAgIGR1cAogICAgYnl0ZWNfMSAvLyAiYWNjb3VudF9zbWFydF9hc2FfaWQiCiAgICBkaWcgNQogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5ODkKICAgIC8vIHNlbGYuYWNjb3VudF9mcm96ZW5bYWNjb3VudF0gPSBhc3NldF9mcm96ZW4KICAgIGJ5dGVjXzIgLy8gImFjY291bnRfZnJvemVuIgogICAgdW5jb3ZlciAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJPcHRJbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKYXNzZXRfb3B0X2luX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIGFzc2V0X29wdF9pbl9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF9jb25maWdbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9jb25maWc6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjQ5NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5ib29sCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgIGR1cAogICAgY292ZXIgMwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgIGR1cAogICAgY292ZXIgMwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgIGR1cAogICAgY292ZXIgMwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA4CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgOQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDExCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTMwCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhhc3NldF9pZCkKICAgIHN3YXAKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUzMQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfbWFuYWdlcl9hZGRyKAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6NjgKICAgIC8vIHJldHVybiBzZWxmLmNvbmZpZ19yb2xlKFVJbnQ2NChjZmcuTUFOQUdFUl9BRERSX09GRlNFVCkpCiAgICBwdXNoaW50IDIxIC8vIDIxCiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUzMS01MzMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX21hbmFnZXJfYWRkcigKICAgIC8vICAgICBhc3NldF9pZAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRF9NQU5BR0VSCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo3MgogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoVUludDY0KGNmZy5SRVNFUlZFX0FERFJfT0ZGU0VUKSkKICAgIHB1c2hpbnQgNTMgLy8gNTMKICAgIGNhbGxzdWIgY29uZmlnX3JvbGUKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1MzUKICAgIC8vIGlmIHJlc2VydmVfYWRkciAhPSBjdXJyZW50X3Jlc2VydmVfYWRkcjoKICAgICE9CiAgICBieiBhc3NldF9jb25maWdfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUzNgogICAgLy8gYXNzZXJ0IGN1cnJlbnRfcmVzZXJ2ZV9hZGRyICE9IEdsb2JhbC56ZXJvX2FkZHJlc3MsIGVyci5ESVNBQkxFRF9SRVNFUlZFCiAgICBkdXAKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGFzc2VydCAvLyBSZXNlcnZlIEFkZHJlc3MgaGFzIGJlZW4gZGVsZXRlZAoKYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfcGFja2VkL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShVSW50NjQoY2ZnLkZSRUVaRV9BRERSX09GRlNFVCkpCiAgICBwdXNoaW50IDg1IC8vIDg1CiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICBkdXAKICAgIGJ1cnkgMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTM4CiAgICAvLyBpZiBmcmVlemVfYWRkciAhPSBjdXJyZW50X2ZyZWV6ZV9hZGRyOgogICAgZGlnIDMKICAgICE9CiAgICBieiBhc3NldF9jb25maWdfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gYXNzZXJ0IGN1cnJlbnRfZnJlZXplX2FkZHIgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgZXJyLkRJU0FCTEVEX0ZSRUVaRQogICAgZGlnIDE2CiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gRnJlZXplIEFkZHJlc3MgaGFzIGJlZW4gZGVsZXRlZAoKYXNzZXRfY29uZmlnX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfcGFja2VkL2NvbnRyYWN0LnB5OjgwCiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShVSW50NjQoY2ZnLkNMQVdCQUNLX0FERFJfT0ZGU0VUKSkKICAgIHB1c2hpbnQgMTE3IC8vIDExNwogICAgY2FsbHN1YiBjb25maWdfcm9sZQogICAgZHVwCiAgICBidXJ5IDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU0MQogICAgLy8gaWYgY2xhd2JhY2tfYWRkciAhPSBjdXJyZW50X2NsYXdiYWNrX2FkZHI6CiAgICBkaWcgMgogICAgIT0KICAgIGJ6IGFzc2V0X2NvbmZpZ19hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQyCiAgICAvLyBhc3NlcnQgY3VycmVudF9jbGF3YmFja19hZGRyICE9IEdsb2JhbC56ZXJvX2FkZHJlc3MsIGVyci5ESVNBQkxFRF9DTEFXQkFDSwogICAgZGlnIDE3CiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gQ2xhd2JhY2sgQWRkcmVzcyBoYXMgYmVlbiBkZWxldGVkCgphc3NldF9jb25maWdfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NDMKICAgIC8vIGFzc2VydCB0b3RhbCA+PSBzZWxmLmNpcmN1bGF0aW5nX3N1cHBseShjb25maWdfYXNzZXQpLCBlcnIuSU5WQUxJRF9UT1RBTAogICAgZGlnIDE1CiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgaXRvYgogICAgZGlnIDE1CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYj49CiAgICBhc3NlcnQgLy8gSW52YWxpZCBUb3RhbCwgbXVzdCBiZSA+PSBjaXJjdWxhdGluZyBzdXBwbHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTQ1LTU1OAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBhc3NldF9jb25maWcgPSBBc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD10b3RhbCwKICAgIC8vICAgICBkZWNpbWFscz1kZWNpbWFscywKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1kZWZhdWx0X2Zyb3plbiwKICAgIC8vICAgICB1bml0X25hbWU9dW5pdF9uYW1lLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICB1cmw9dXJsLAogICAgLy8gICAgIG1ldGFkYXRhX2hhc2g9bWV0YWRhdGFfaGFzaC5jb3B5KCksCiAgICAvLyAgICAgbWFuYWdlcl9hZGRyPW1hbmFnZXJfYWRkciwKICAgIC8vICAgICByZXNlcnZlX2FkZHI9cmVzZXJ2ZV9hZGRyLAogICAgLy8gICAgIGZyZWV6ZV9hZGRyPWZyZWV6ZV9hZGRyLAogICAgLy8gICAgIGNsYXdiYWNrX2FkZHI9Y2xhd2JhY2tfYWRkciwKICAgIC8vICkKICAgIGRpZyAxNAogICAgY29uY2F0CiAgICBkaWcgMTMKICAgIGNvbmNhdAogICAgYnl0ZWMgOCAvLyAweDAwOTUKICAgIGNvbmNhdAogICAgcHVzaGludCAxNDkgLy8gMTQ5CiAgICBkaWcgMTIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkaWcgMTAKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBkaWcgOAogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgZGlnIDUKICAgIGNvbmNhdAogICAgZGlnIDQKICAgIGNvbmNhdAogICAgZGlnIDMKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgZGlnIDEyCiAgICBjb25jYXQKICAgIGRpZyAxMAogICAgY29uY2F0CiAgICBkaWcgOAogICAgY29uY2F0CiAgICBkaWcgNgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo4OC04OQogICAgLy8gIyBEeW5hbWljIGZpZWxkcyBtYXkgY2hhbmdlIHRoZSBlbmNvZGVkIHNpemUsIHRoZSBib3ggaXMgcmUtY3JlYXRlZC4KICAgIC8vIGRlbCBzZWxmLmFzc2V0X2NvbmZpZ19ib3gudmFsdWUKICAgIGJ5dGVjXzAgLy8gMHg2MTczNzM2NTc0NWY2MzZmNmU2NjY5NjcKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6OTAKICAgIC8vIHNlbGYuYXNzZXRfY29uZmlnX2JveC52YWx1ZSA9IGFzc2V0X2NvbmZpZy5jb3B5KCkKICAgIGJ5dGVjXzAgLy8gMHg2MTczNzM2NTc0NWY2MzZmNmU2NjY5NjcKICAgIGJveF9kZWwKICAgIHBvcAogICAgYnl0ZWNfMCAvLyAweDYxNzM3MzY1NzQ1ZjYzNmY2ZTY2Njk2NwogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTYwCiAgICAvLyBhcmM0LmVtaXQoYXNzZXRfY29uZmlnKQogICAgcHVzaGJ5dGVzIDB4ZTEwYzVhNDcgLy8gbWV0aG9kICJBc3NldENvbmZpZyh1aW50NjQsdWludDMyLGJvb2wsc3RyaW5nLHN0cmluZyxzdHJpbmcsYnl0ZVtdLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NDk1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF90cmFuc2Zlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X3RyYW5zZmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1NjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTc5LTU4MAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyh4ZmVyX2Fzc2V0LmlkKQogICAgZGlnIDMKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU4NQogICAgLy8gYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NTgxLTU4NgogICAgLy8gc2VsZi5hc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBhc3NldF9pZD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDMKICAgIGRpZyAzCiAgICBkaWcgMwogICAgY2FsbHN1YiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1ODgtNTk0CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHNlbGYuaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDEKICAgIGRpZyA0CiAgICBkaWcgNAogICAgY2FsbHN1YiBpbm5lcl9hc3NldF90cmFuc2ZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo1OTUtNjAwCiAgICAvLyBzZWxmLmVtaXRfdHJhbnNmZXJfZXZlbnQoCiAgICAvLyAgICAgYXNzZXRfaWQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgLy8gKQogICAgY2FsbHN1YiBlbWl0X3RyYW5zZmVyX2V2ZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjU2MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXRfdHJhbnNmZXJfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF90cmFuc2Zlcl9iYXRjaDoKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBwdXNoaW50IDcyIC8vIDcyCiAgICAqCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuYXZtX3R5cGVzLlRyYW5zZmVyTGVnPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MTMtNjE0CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKHhmZXJfYXNzZXQuaWQpCiAgICBzd2FwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MTUKICAgIC8vIGFzc2VydCBsZWdzLmxlbmd0aCwgZXJyLkVNUFRZX0JBVENICiAgICBkdXAKICAgIGFzc2VydCAvLyBFbXB0eSB0cmFuc2ZlciBiYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MTYKICAgIC8vIGFzc2VydCBsZWdzLmxlbmd0aCA8PSBjZmcuTUFYX0JBVENIX0xFR1MsIGVyci5PVkVSU0laRURfQkFUQ0gKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gVHJhbnNmZXIgYmF0Y2ggZXhjZWVkcyBtYXggaW5uZXIgZ3JvdXAgc2l6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MTgtNjE5CiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIG1pbnRlZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjIwCiAgICAvLyBmb3IgaWR4IGluIHVyYW5nZShsZWdzLmxlbmd0aCk6CiAgICBkdXAKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjIwCiAgICAvLyBmb3IgaWR4IGluIHVyYW5nZShsZWdzLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBhc3NldF90cmFuc2Zlcl9iYXRjaF9hZnRlcl9mb3JAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjIxLTYyMgogICAgLy8gbGVnID0gbGVnc1tpZHhdLmNvcHkoKQogICAgLy8gYXNzZXRfc2VuZGVyID0gbGVnLmFzc2V0X3NlbmRlci5uYXRpdmUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIHB1c2hpbnQgNzIgLy8gNzIKICAgICoKICAgIHB1c2hpbnQgNzIgLy8gNzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyMwogICAgLy8gYXNzZXRfcmVjZWl2ZXIgPSBsZWcuYXNzZXRfcmVjZWl2ZXIubmF0aXZlCiAgICBkdXAKICAgIGV4dHJhY3QgMzIgMzIKICAgIGJ1cnkgMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjI0CiAgICAvLyBhc3NldF9hbW91bnQgPSBsZWcuYXNzZXRfYW1vdW50Lm5hdGl2ZQogICAgcHVzaGludCA2NCAvLyA2NAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MjUKICAgIC8vIGlmIGFzc2V0X3NlbmRlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzOgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBieiBhc3NldF90cmFuc2Zlcl9iYXRjaF9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MjYtNjI3CiAgICAvLyAjIElubmVyIHRyYW5zZmVycyBhcmUgc3VibWl0dGVkIGFmdGVyIHRoZSBsb29wLCBzbyBvdmVyLW1pbnRpbmcgaXMgY2hlY2tlZCBhZ2FpbnN0IHRoZSBiYXRjaCB0b3RhbC4KICAgIC8vIG1pbnRlZCArPSBhc3NldF9hbW91bnQKICAgIGRpZyAxCiAgICBkaWcgNgogICAgKwogICAgZHVwCiAgICBidXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjI4LTYzMwogICAgLy8gc2VsZi5hc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBhc3NldF9pZD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PW1pbnRlZCwKICAgIC8vICkKICAgIGRpZyA1CiAgICBkaWcgOAogICAgZGlnIDEwCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjQyCiAgICAvLyBpZiBpZHg6CiAgICBkdXAKICAgIGJ6IGFzc2V0X3RyYW5zZmVyX2JhdGNoX2Vsc2VfYm9keUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY0MwogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAoKYXNzZXRfdHJhbnNmZXJfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NDYKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3R5cGVfZW51bShUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlcikKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NDcKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2ZlZSgwKQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY0OAogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfeGZlcl9hc3NldCh4ZmVyX2Fzc2V0KQogICAgZGlnIDQKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjQ5CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9hbW91bnQoYXNzZXRfYW1vdW50KQogICAgZGlnIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NTAKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X3NlbmRlcihhc3NldF9zZW5kZXIpCiAgICBkaWcgOAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY1MQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfYXNzZXRfcmVjZWl2ZXIoYXNzZXRfcmVjZWl2ZXIpCiAgICBkaWcgMTAKICAgIGR1cAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY1Mi02NTcKICAgIC8vIHNlbGYuZW1pdF90cmFuc2Zlcl9ldmVudCgKICAgIC8vICAgICBhc3NldF9pZD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudCwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBlbWl0X3RyYW5zZmVyX2V2ZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYyMAogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UobGVncy5sZW5ndGgpOgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGFzc2V0X3RyYW5zZmVyX2JhdGNoX2Zvcl9oZWFkZXJAMgoKYXNzZXRfdHJhbnNmZXJfYmF0Y2hfZWxzZV9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY0NQogICAgLy8gb3AuSVR4bkNyZWF0ZS5iZWdpbigpCiAgICBpdHhuX2JlZ2luCiAgICBiIGFzc2V0X3RyYW5zZmVyX2JhdGNoX2FmdGVyX2lmX2Vsc2VAOQoKYXNzZXRfdHJhbnNmZXJfYmF0Y2hfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjYzNS02NDAKICAgIC8vIHNlbGYuYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoCiAgICAvLyAgICAgYXNzZXRfaWQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQsCiAgICAvLyApCiAgICBkaWcgNAogICAgZGlnIDcKICAgIGRpZyA5CiAgICBkaWcgOAogICAgY2FsbHN1YiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucwogICAgYiBhc3NldF90cmFuc2Zlcl9iYXRjaF9hZnRlcl9pZl9lbHNlQDYKCmFzc2V0X3RyYW5zZmVyX2JhdGNoX2FmdGVyX2ZvckAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjU4CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2MDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmFzc2V0X3RyYW5zZmVyX3dpdGhfcHJvb2Zbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF90cmFuc2Zlcl93aXRoX3Byb29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2NjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2ODEtNjgyCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKHhmZXJfYXNzZXQuaWQpCiAgICBkaWcgNQogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjgzCiAgICAvLyBhc3NlcnQgc2VsZi5oYXNfYWxsb3dsaXN0KHhmZXJfYXNzZXQuaWQpLCBlcnIuTUlTU0lOR19BTExPV0xJU1QKICAgIGRpZyA1CiAgICBjYWxsc3ViIGhhc19hbGxvd2xpc3QKICAgIGFzc2VydCAvLyBUcmFuc2ZlciBhbGxvd2xpc3QgaXMgbm90IHNldAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2ODQtNjg4CiAgICAvLyBzZWxmLmFzc2VydF9yZWd1bGFyX3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMoCiAgICAvLyAgICAgYXNzZXRfaWQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXNzZXRfc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFzc2V0X3JlY2VpdmVyLAogICAgLy8gKQogICAgZGlnIDUKICAgIGRpZyA0CiAgICBkaWcgNAogICAgY2FsbHN1YiBhc3NlcnRfcmVndWxhcl90cmFuc2Zlcl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY4OS02OTEKICAgIC8vIGFzc2VydCBzZWxmLmlzX2FsbG93bGlzdGVkKAogICAgLy8gICAgIHhmZXJfYXNzZXQuaWQsIGFzc2V0X3NlbmRlciwgc2VuZGVyX3Byb29mCiAgICAvLyApLCBlcnIuU0VOREVSX05PVF9BTExPV0xJU1RFRAogICAgZGlnIDUKICAgIGRpZyA0CiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgaXNfYWxsb3dsaXN0ZWQKICAgIHBvcAogICAgYXNzZXJ0IC8vIFNlbmRlciBhY2NvdW50IGlzIG5vdCBhbGxvd2xpc3RlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2OTItNjk0CiAgICAvLyBhc3NlcnQgc2VsZi5pc19hbGxvd2xpc3RlZCgKICAgIC8vICAgICB4ZmVyX2Fzc2V0LmlkLCBhc3NldF9yZWNlaXZlciwgcmVjZWl2ZXJfcHJvb2YKICAgIC8vICksIGVyci5SRUNFSVZFUl9OT1RfQUxMT1dMSVNURUQKICAgIGRpZyA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGlzX2FsbG93bGlzdGVkCiAgICBwb3AKICAgIGFzc2VydCAvLyBSZWNlaXZlciBhY2NvdW50IGlzIG5vdCBhbGxvd2xpc3RlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo2OTkKICAgIC8vIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQubmF0aXZlLAogICAgdW5jb3ZlciAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjY5Ni03MDIKICAgIC8vICMgRWZmZWN0cwogICAgLy8gc2VsZi5pbm5lcl9hc3NldF90cmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXhmZXJfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgaW5uZXJfYXNzZXRfdHJhbnNmZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NjYwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NldF9mcmVlemVbcm91dGluZ10oKSAtPiB2b2lkOgphc3NldF9mcmVlemU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MTMtNzE0CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGZyZWV6ZV9hc3NldC5pZCkKICAgIHN3YXAKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcxNQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfZnJlZXplX2FkZHIoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo3NgogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoVUludDY0KGNmZy5GUkVFWkVfQUREUl9PRkZTRVQpKQogICAgcHVzaGludCA4NSAvLyA4NQogICAgY2FsbHN1YiBjb25maWdfcm9sZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MTUtNzE3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19mcmVlemVfYWRkcigKICAgIC8vICAgICBmcmVlemVfYXNzZXQuaWQKICAgIC8vICksIGVyci5VTkFVVEhPUklaRURfRlJFRVpFCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBGcmVlemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzE5LTcyMAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBzZWxmLnN0b3JlX2dsb2JhbF9mcm96ZW4oZnJlZXplX2Fzc2V0LmlkLCBhc3NldF9mcm96ZW49YXNzZXRfZnJvemVuLm5hdGl2ZSkKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NTIKICAgIC8vIHNlbGYuZ2xvYmFsX2Zyb3plbiA9IGFzc2V0X2Zyb3plbgogICAgYnl0ZWNfMyAvLyAiZ2xvYmFsX2Zyb3plbiIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcyMQogICAgLy8gYXJjNC5lbWl0KEFzc2V0RnJlZXplKGFzc2V0X2Zyb3plbj1hc3NldF9mcm96ZW4pKQogICAgcHVzaGJ5dGVzIDB4NjI5OTY0NmEgLy8gbWV0aG9kICJBc3NldEZyZWV6ZShib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjcwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYWNjb3VudF9mcmVlemVbcm91dGluZ10oKSAtPiB2b2lkOgphY2NvdW50X2ZyZWV6ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzM1LTczNgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBkaWcgMgogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgdW5jb3ZlciAzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MzcKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihmcmVlemVfYXNzZXQuaWQsIGZyZWV6ZV9hY2NvdW50KSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjczOAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfZnJlZXplX2FkZHIoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo3NgogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoVUludDY0KGNmZy5GUkVFWkVfQUREUl9PRkZTRVQpKQogICAgcHVzaGludCA4NSAvLyA4NQogICAgY2FsbHN1YiBjb25maWdfcm9sZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MzgtNzQwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19mcmVlemVfYWRkcigKICAgIC8vICAgICBmcmVlemVfYXNzZXQuaWQKICAgIC8vICksIGVyci5VTkFVVEhPUklaRURfRlJFRVpFCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBGcmVlemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzQ0CiAgICAvLyBmcmVlemVfYXNzZXQuaWQsIGZyZWV6ZV9hY2NvdW50LCBhc3NldF9mcm96ZW49YXNzZXRfZnJvemVuLm5hdGl2ZQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk4MQogICAgLy8gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XSA9IGFzc2V0X2Zyb3plbgogICAgZGlnIDIKICAgIGJ5dGVjXzIgLy8gImFjY291bnRfZnJvemVuIgogICAgdW5jb3ZlciAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc0Ny03NDkKICAgIC8vIEFjY291bnRGcmVlemUoCiAgICAvLyAgICAgZnJlZXplX2FjY291bnQ9YXJjNC5BZGRyZXNzKGZyZWV6ZV9hY2NvdW50KSwgYXNzZXRfZnJvemVuPWFzc2V0X2Zyb3plbgogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc0Ni03NTAKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBBY2NvdW50RnJlZXplKAogICAgLy8gICAgICAgICBmcmVlemVfYWNjb3VudD1hcmM0LkFkZHJlc3MoZnJlZXplX2FjY291bnQpLCBhc3NldF9mcm96ZW49YXNzZXRfZnJvemVuCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZWY4YjY2ZDkgLy8gbWV0aG9kICJBY2NvdW50RnJlZXplKGFkZHJlc3MsYm9vbCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3MjMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLnNldF90cmFuc2Zlcl9hbGxvd2xpc3Rbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdHJhbnNmZXJfYWxsb3dsaXN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzYxLTc2MgogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBzd2FwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NjMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2ZyZWV6ZV9hZGRyKAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6NzYKICAgIC8vIHJldHVybiBzZWxmLmNvbmZpZ19yb2xlKFVJbnQ2NChjZmcuRlJFRVpFX0FERFJfT0ZGU0VUKSkKICAgIHB1c2hpbnQgODUgLy8gODUKICAgIGNhbGxzdWIgY29uZmlnX3JvbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzYzLTc2NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfZnJlZXplX2FkZHIoCiAgICAvLyAgICAgZnJlZXplX2Fzc2V0LmlkCiAgICAvLyApLCBlcnIuVU5BVVRIT1JJWkVEX0ZSRUVaRQogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgRnJlZXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk2NAogICAgLy8gaWYgYWxsb3dsaXN0X3Jvb3QgPT0gR2xvYmFsLnplcm9fYWRkcmVzcy5ieXRlczoKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIGJ6IHNldF90cmFuc2Zlcl9hbGxvd2xpc3RfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTY1CiAgICAvLyBzZWxmLmFsbG93bGlzdF9yb290ID0gQnl0ZXMoKQogICAgYnl0ZWMgNCAvLyAiYWxsb3dsaXN0X3Jvb3QiCiAgICBwdXNoYnl0ZXMgMHgKICAgIGFwcF9nbG9iYWxfcHV0CgpzZXRfdHJhbnNmZXJfYWxsb3dsaXN0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzUyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnNldF90cmFuc2Zlcl9hbGxvd2xpc3RfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk2NwogICAgLy8gc2VsZi5hbGxvd2xpc3Rfcm9vdCA9IGFsbG93bGlzdF9yb290CiAgICBieXRlYyA0IC8vICJhbGxvd2xpc3Rfcm9vdCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiBzZXRfdHJhbnNmZXJfYWxsb3dsaXN0X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmFzc2V0X2Nsb3NlX291dFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X2Nsb3NlX291dDoKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MDEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiQ2xvc2VPdXQiXSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgxMAogICAgLy8gYXNzZXJ0IFR4bi5vbl9jb21wbGV0aW9uID09IE9uQ29tcGxldGVBY3Rpb24uQ2xvc2VPdXQsIGVyci5XUk9OR19PTl9DT01QTEVURQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCAyIC8vIENsb3NlT3V0CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE9uIENvbXBsZXRlIEFjdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMDcKICAgIC8vIGFzYV9jbG9zZV9vdXRfcmVsYXRpdmVfaWR4ID0gVHhuLmdyb3VwX2luZGV4ICsgMQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwOAogICAgLy8gYXNhX2Nsb3NlX291dF90eG4gPSBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbihhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeCkKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwOQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfaG9sZGVyKGNsb3NlX2Fzc2V0LmlkLCBUeG4uc2VuZGVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBkaWcgMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzA5CiAgICAvLyBhc3NlcnQgc2VsZi5pc19ob2xkZXIoY2xvc2VfYXNzZXQuaWQsIFR4bi5zZW5kZXIpLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzExCiAgICAvLyBHbG9iYWwuZ3JvdXBfc2l6ZSA+IGFzYV9jbG9zZV9vdXRfcmVsYXRpdmVfaWR4CiAgICBnbG9iYWwgR3JvdXBTaXplCiAgICBkaWcgMQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMTAtMzEyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5ncm91cF9zaXplID4gYXNhX2Nsb3NlX291dF9yZWxhdGl2ZV9pZHgKICAgIC8vICksIGVyci5JTlZBTElEX0NMT1NFX09VVF9HUk9VUF9TSVpFCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDbG9zZSBPdXQgZ3JvdXAgc2l6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMTcKICAgIC8vIGFzYV9jbG9zZV9vdXRfdHhuLnhmZXJfYXNzZXQuaWQgPT0gY2xvc2VfYXNzZXQuaWQKICAgIGR1cAogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBkaWcgMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzE2LTMxOAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBhc2FfY2xvc2Vfb3V0X3R4bi54ZmVyX2Fzc2V0LmlkID09IGNsb3NlX2Fzc2V0LmlkCiAgICAvLyApLCBlcnIuQ0xPU0VfT1VUX1dST05HX0FTQQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBDbG9zZSBPdXQgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzE5CiAgICAvLyBhc3NlcnQgYXNhX2Nsb3NlX291dF90eG4uc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5DTE9TRV9PVVRfV1JPTkdfU0VOREVSCiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBBU0EgQ2xvc2UgT3V0IFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMjAKICAgIC8vIGFzc2VydCBhc2FfY2xvc2Vfb3V0X3R4bi5hc3NldF9hbW91bnQgPT0gVUludDY0KDApLCBlcnIuQ0xPU0VfT1VUX1dST05HX0FNT1VOVAogICAgZHVwCiAgICBndHhucyBBc3NldEFtb3VudAogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIEFTQSBDbG9zZSBPdXQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMyMgogICAgLy8gYXNhX2Nsb3NlX291dF90eG4uYXNzZXRfY2xvc2VfdG8gIT0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgZ3R4bnMgQXNzZXRDbG9zZVRvCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMyMS0zMjMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYXNhX2Nsb3NlX291dF90eG4uYXNzZXRfY2xvc2VfdG8gIT0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgLy8gKSwgZXJyLkNMT1NFX09VVF9XUk9OR19DTE9TRV9UTwogICAgYXNzZXJ0IC8vIFdyb25nIENsb3NlIE91dCBvbiBDbG9zZSBPdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzc0CiAgICAvLyAoY3JlYXRvciwgZXhpc3RzKSA9IG9wLkFzc2V0UGFyYW1zR2V0LmFzc2V0X2NyZWF0b3IoY2xvc2VfYXNzZXQuaWQpCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0Q3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3NzUKICAgIC8vIGlmIGV4aXN0czogICMgU21hcnQgQVNBIGhhcyBub3QgYmVlbiBkZXN0cm95ZWQKICAgIGJ6IGFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzI5CiAgICAvLyBhc2FfY2xvc2Vfb3V0X3JlbGF0aXZlX2lkeCA9IFR4bi5ncm91cF9pbmRleCArIDEKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMzAKICAgIC8vIGFzYV9jbG9zZV9vdXRfdHhuID0gZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24oYXNhX2Nsb3NlX291dF9yZWxhdGl2ZV9pZHgpCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMzIKICAgIC8vIGFzYV9jbG9zZV9vdXRfdHhuLmFzc2V0X2Nsb3NlX3RvID09IGFzc2V0X2NyZWF0b3IKICAgIGd0eG5zIEFzc2V0Q2xvc2VUbwogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzMxLTMzMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBhc2FfY2xvc2Vfb3V0X3R4bi5hc3NldF9jbG9zZV90byA9PSBhc3NldF9jcmVhdG9yCiAgICAvLyApLCBlcnIuQ0xPU0VfT1VUX1dST05HX0NMT1NFX1RPCiAgICBhc3NlcnQgLy8gV3JvbmcgQ2xvc2UgT3V0IG9uIENsb3NlIE91dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMzQKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGNsb3NlX2Fzc2V0LmlkKQogICAgZGlnIDMKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc3OAogICAgLy8gY2xvc2VfdG8gIT0gY3JlYXRvcgogICAgZGlnIDIKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc3Ny03NzkKICAgIC8vIGlmICgKICAgIC8vICAgICBjbG9zZV90byAhPSBjcmVhdG9yCiAgICAvLyApOiAgIyBJZiBjbG9zZS1vdXQgdGFyZ2V0IGlzIG5vdCB0aGUgQ3JlYXRvciwgdGhlbiBjbG9zZS1vdXQgdGFyZ2V0IE1VU1QgYmUgb3B0ZWQtaW4KICAgIGJ6IGFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgZGlnIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBkaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3ODAKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihjbG9zZV9hc3NldC5pZCwgY2xvc2VfdG8pLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzQwLTM0MQogICAgLy8gIyBBIGNsb3NlIG91dCBjYXJyaWVzIG5vIGFsbG93bGlzdCBwcm9vZnMsIHRoZSByZW1haW5kZXIgcmV0dXJucyB0byB0aGUgQ3JlYXRvci4KICAgIC8vIGFzc2VydCBub3Qgc2VsZi5oYXNfYWxsb3dsaXN0KGNsb3NlX2Fzc2V0LmlkKSwgZXJyLkFMTE9XTElTVF9DTE9TRV9PVVQKICAgIGNhbGxzdWIgaGFzX2FsbG93bGlzdAogICAgIQogICAgYXNzZXJ0IC8vIFRyYW5zZmVyIGFsbG93bGlzdCBpcyBzZXQsIGNsb3NlIG91dCB0byB0aGUgQ3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NDgKICAgIC8vIHJldHVybiBzZWxmLmdsb2JhbF9mcm96ZW4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJnbG9iYWxfZnJvemVuIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdsb2JhbF9mcm96ZW4gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0MgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2dsb2JhbF9mcm96ZW4oY2xvc2VfYXNzZXQuaWQpLCBlcnIuR0xPQkFMX0ZST1pFTgogICAgIQogICAgYXNzZXJ0IC8vIFNtYXJ0IEFTQSBpcyBnbG9iYWwgZnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGNsb3NlX2Fzc2V0LmlkLCBUeG4uc2VuZGVyKSwgZXJyLlNFTkRFUl9GUk9aRU4KICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTc1CiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFjY291bnRfZnJvemVuIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9mcm96ZW4gZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGNsb3NlX2Fzc2V0LmlkLCBUeG4uc2VuZGVyKSwgZXJyLlNFTkRFUl9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTc1CiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFjY291bnRfZnJvemVuIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9mcm96ZW4gZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM0NAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmlzX2FjY291bnRfZnJvemVuKGNsb3NlX2Fzc2V0LmlkLCBjbG9zZV90byksIGVyci5DTE9TRV9UT19GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBDbG9zZSB0byBhY2NvdW50IGlzIGZyb3plbgoKYXNzZXRfY2xvc2Vfb3V0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6NzgzLTc4NAogICAgLy8gIyBFZmZlY3RzCiAgICAvLyBhc3NldF9hbW91bnQgPSBjbG9zZV9hc3NldC5iYWxhbmNlKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSA3CiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc4OAogICAgLy8gYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc4NS03OTAKICAgIC8vIHNlbGYuaW5uZXJfYXNzZXRfdHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1jbG9zZV9hc3NldCwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YXNzZXRfYW1vdW50LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWNsb3NlX3RvLAogICAgLy8gKQogICAgZGlnIDQKICAgIGR1cAogICAgY292ZXIgNAogICAgY2FsbHN1YiBpbm5lcl9hc3NldF90cmFuc2ZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3OTEKICAgIC8vIGlmIGNsb3NlX3RvID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGJ6IGFzc2V0X2Nsb3NlX291dF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzk1CiAgICAvLyBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo3OTYKICAgIC8vIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgZGlnIDQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Nzk0LTc5NwogICAgLy8gQnVybigKICAgIC8vICAgICBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojc5Mi03OTgKICAgIC8vICMgUmVtYWluZGVyIGNsb3NlZCB0byB0aGUgQ3JlYXRvciBsZWF2ZXMgdGhlIGNpcmN1bGF0aW5nIHN1cHBseS4KICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBCdXJuKAogICAgLy8gICAgICAgICBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhc3NldF9hbW91bnQ9YXJjNC5VSW50NjQoYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBieXRlYyA5IC8vIG1ldGhvZCAiQnVybihhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwoKYXNzZXRfY2xvc2Vfb3V0X2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODAxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkNsb3NlT3V0Il0pCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXRfZGVzdHJveVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2V0X2Rlc3Ryb3k6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgxMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgyMS04MjIKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gc2VsZi5hc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoZGVzdHJveV9hc3NldC5pZCkKICAgIGR1cAogICAgY2FsbHN1YiBhc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODIzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNvbmZpZ19tYW5hZ2VyX2FkZHIoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo2OAogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoVUludDY0KGNmZy5NQU5BR0VSX0FERFJfT0ZGU0VUKSkKICAgIHB1c2hpbnQgMjEgLy8gMjEKICAgIGNhbGxzdWIgY29uZmlnX3JvbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODIzLTgyNQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfbWFuYWdlcl9hZGRyKAogICAgLy8gICAgIGRlc3Ryb3lfYXNzZXQuaWQKICAgIC8vICksIGVyci5VTkFVVEhPUklaRURfTUFOQUdFUgogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgTWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozODYtMzkwCiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gICAgIGNvbmZpZ19hc3NldD1kZXN0cm95X2Fzc2V0LAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozODkKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM4NgogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIHB1c2hpbnQgMyAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM4NwogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzg2LTM5MAogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICAgICBjb25maWdfYXNzZXQ9ZGVzdHJveV9hc3NldCwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo5NAogICAgLy8gZGVsIHNlbGYuYXNzZXRfY29uZmlnX2JveC52YWx1ZQogICAgYnl0ZWNfMCAvLyAweDYxNzM3MzY1NzQ1ZjYzNmY2ZTY2Njk2NwogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk0MgogICAgLy8gc2VsZi5zbWFydF9hc2FfaWQgPSBVSW50NjQoKQogICAgYnl0ZWMgNSAvLyAic21hcnRfYXNhX2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk0MwogICAgLy8gc2VsZi5nbG9iYWxfZnJvemVuID0gRmFsc2UKICAgIGJ5dGVjXzMgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTQ0CiAgICAvLyBzZWxmLmFsbG93bGlzdF9yb290ID0gQnl0ZXMoKQogICAgYnl0ZWMgNCAvLyAiYWxsb3dsaXN0X3Jvb3QiCiAgICBwdXNoYnl0ZXMgMHgKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgxMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuZ2V0X2Fzc2V0X2NvbmZpZ1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9hc3NldF9jb25maWc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjgzMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojg0Mi04NDMKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gc2VsZi5hc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoYXNzZXQuaWQpCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6ODQKICAgIC8vIHJldHVybiBzZWxmLmFzc2V0X2NvbmZpZ19ib3gudmFsdWUuY29weSgpCiAgICBieXRlY18wIC8vIDB4NjE3MzczNjU3NDVmNjM2ZjZlNjY2OTY3CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldF9jb25maWdfYm94IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4MzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmdldF9hc3NldF9pc19mcm96ZW5bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXNzZXRfaXNfZnJvemVuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NTktODYwCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGZyZWV6ZV9hc3NldC5pZCkKICAgIGNhbGxzdWIgYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk0OAogICAgLy8gcmV0dXJuIHNlbGYuZ2xvYmFsX2Zyb3plbgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX2Zyb3plbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODYyLTg2MwogICAgLy8gIyBFZmZlY3RzCiAgICAvLyByZXR1cm4gYXJjNC5Cb29sKHNlbGYuaXNfZ2xvYmFsX2Zyb3plbihmcmVlemVfYXNzZXQuaWQpKQogICAgYnl0ZWMgNyAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODQ4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5nZXRfYWNjb3VudF9pc19mcm96ZW5bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYWNjb3VudF9pc19mcm96ZW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojg2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODc5LTg4MAogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBzZWxmLmFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhmcmVlemVfYXNzZXQuaWQpCiAgICBzd2FwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzUKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfZnJvemVuW2FjY291bnRdCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X2Zyb3plbiBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6ODgyLTg4MwogICAgLy8gIyBFZmZlY3RzCiAgICAvLyByZXR1cm4gYXJjNC5Cb29sKHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oZnJlZXplX2Fzc2V0LmlkLCBmcmVlemVfYWNjb3VudCkpCiAgICBieXRlYyA3IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmdldF9jaXJjdWxhdGluZ19zdXBwbHlbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfY2lyY3VsYXRpbmdfc3VwcGx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4ODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4OTYtODk3CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIHNlbGYuYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zKGFzc2V0LmlkKQogICAgZHVwCiAgICBjYWxsc3ViIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4OTktOTAwCiAgICAvLyAjIEVmZmVjdHMKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmNpcmN1bGF0aW5nX3N1cHBseShhc3NldCkpCiAgICBjYWxsc3ViIGNpcmN1bGF0aW5nX3N1cHBseQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo4ODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2FfcGFja2VkLmNvbnRyYWN0LlNtYXJ0QXNhUGFja2VkLmNvbmZpZ19yb2xlKG9mZnNldDogdWludDY0KSAtPiBieXRlczoKY29uZmlnX3JvbGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo0Ny00OAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjb25maWdfcm9sZShzZWxmLCBvZmZzZXQ6IFVJbnQ2NCkgLT4gQWNjb3VudDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6NTAKICAgIC8vIG9wLkJveC5leHRyYWN0KGNmZy5BU1NFVF9DT05GSUdfQk9YX0tFWSwgb2Zmc2V0LCBjZmcuQUREUkVTU19TSVpFKQogICAgYnl0ZWNfMCAvLyAweDYxNzM3MzY1NzQ1ZjYzNmY2ZTY2Njk2NwogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzIgLy8gMzIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo0OS01MQogICAgLy8gcmV0dXJuIEFjY291bnQoCiAgICAvLyAgICAgb3AuQm94LmV4dHJhY3QoY2ZnLkFTU0VUX0NPTkZJR19CT1hfS0VZLCBvZmZzZXQsIGNmZy5BRERSRVNTX1NJWkUpCiAgICAvLyApCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNpbmdsZVNtYXJ0QXNhQmFzZS5hc3NlcnRfY29tbW9uX3ByZWNvbmRpdGlvbnMoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKYXNzZXJ0X2NvbW1vbl9wcmVjb25kaXRpb25zOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5MjUtOTI2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGFzc2VydF9jb21tb25fcHJlY29uZGl0aW9ucyhzZWxmLCBhc3NldF9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkyNwogICAgLy8gYXNzZXJ0IHNlbGYuc21hcnRfYXNhX2lkLCBlcnIuTUlTU0lOR19DVFJMX0FTQQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInNtYXJ0X2FzYV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zbWFydF9hc2FfaWQgZXhpc3RzCiAgICBkdXAKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbnRyb2xsZWQgQVNBCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjkyOAogICAgLy8gYXNzZXJ0IHNlbGYuc21hcnRfYXNhX2lkID09IGFzc2V0X2lkLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU2luZ2xlU21hcnRBc2FCYXNlLmhhc19hbGxvd2xpc3QoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpoYXNfYWxsb3dsaXN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NTQtOTU1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGhhc19hbGxvd2xpc3Qoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NTYKICAgIC8vIHJldHVybiBib29sKHNlbGYuYWxsb3dsaXN0X3Jvb3QpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWxsb3dsaXN0X3Jvb3QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWxsb3dsaXN0X3Jvb3QgZXhpc3RzCiAgICBsZW4KICAgIGludGNfMCAvLyAwCiAgICAhPQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuY2lyY3VsYXRpbmdfc3VwcGx5KGN0cmxfYXNzZXQ6IHVpbnQ2NCkgLT4gdWludDY0OgpjaXJjdWxhdGluZ19zdXBwbHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE2Ni0xNjcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2lyY3VsYXRpbmdfc3VwcGx5KHNlbGYsIGN0cmxfYXNzZXQ6IEFzc2V0KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTY4CiAgICAvLyByZXR1cm4gY2ZnLlRPVEFMIC0gY3RybF9hc3NldC5iYWxhbmNlKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IG9wdGVkIGludG8gYXNzZXQKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgc3dhcAogICAgLQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuYXNzZXJ0X3JlZ3VsYXJfdHJhbnNmZXJfcHJlY29uZGl0aW9ucyhhc3NldF9pZDogdWludDY0LCBhc3NldF9zZW5kZXI6IGJ5dGVzLCBhc3NldF9yZWNlaXZlcjogYnl0ZXMpIC0+IHZvaWQ6CmFzc2VydF9yZWd1bGFyX3RyYW5zZmVyX3ByZWNvbmRpdGlvbnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIxMy0yMTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X3JlZ3VsYXJfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBzZWxmLCAqLCBhc3NldF9pZDogVUludDY0LCBhc3NldF9zZW5kZXI6IEFjY291bnQsIGFzc2V0X3JlY2VpdmVyOiBBY2NvdW50CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjE3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBhc3NldF9zZW5kZXIsIGVyci5VTkFVVEhPUklaRURfQ0xBV0JBQ0sKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgQ2xhd2JhY2sKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWNjb3VudF9zbWFydF9hc2FfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGZyYW1lX2RpZyAtMwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjE4LTIxOQogICAgLy8gIyBJbiB0aGUgY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQsIHRoZSBTbWFydCBBREEgSUQgaW4gTG9jYWwgU3RhdGUgY291bGQgYmUgb3V0ZGF0ZWQuCiAgICAvLyBhc3NlcnQgc2VsZi5pc19ob2xkZXIoYXNzZXRfaWQsIGFzc2V0X3NlbmRlciksIGVyci5JTlZBTElEX0NUUkxfQVNBCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDb250cm9sbGVkIEFTQSBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzEKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2FjY291bnRdID09IGFzc2V0X2lkCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMjAKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihhc3NldF9pZCwgYXNzZXRfcmVjZWl2ZXIpLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTQ4CiAgICAvLyByZXR1cm4gc2VsZi5nbG9iYWxfZnJvemVuCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZ2xvYmFsX2Zyb3plbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfZnJvemVuIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMjEKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19nbG9iYWxfZnJvemVuKGFzc2V0X2lkKSwgZXJyLkdMT0JBTF9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBTbWFydCBBU0EgaXMgZ2xvYmFsIGZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzUKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfZnJvemVuW2FjY291bnRdCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhY2NvdW50X2Zyb3plbiIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfZnJvemVuIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMjIKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19hY2NvdW50X2Zyb3plbihhc3NldF9pZCwgYXNzZXRfc2VuZGVyKSwgZXJyLlNFTkRFUl9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBTZW5kZXIgYWNjb3VudCBpcyBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTc1CiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X2Zyb3plbiBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjIzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oYXNzZXRfaWQsIGFzc2V0X3JlY2VpdmVyKSwgZXJyLlJFQ0VJVkVSX0ZST1pFTgogICAgIQogICAgYXNzZXJ0IC8vIFJlY2VpdmVyIGFjY291bnQgaXMgZnJvemVuCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5hc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucyhhc3NldF9pZDogdWludDY0LCBhc3NldF9zZW5kZXI6IGJ5dGVzLCBhc3NldF9yZWNlaXZlcjogYnl0ZXMsIGFzc2V0X2Ftb3VudDogdWludDY0KSAtPiB2b2lkOgphc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjI1LTIzMwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9ucygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgICosCiAgICAvLyAgICAgYXNzZXRfaWQ6IFVJbnQ2NCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI6IEFjY291bnQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI6IEFjY291bnQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50OiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjM0CiAgICAvLyBpZiBhc3NldF9zZW5kZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzczoKICAgIGZyYW1lX2RpZyAtMwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBieiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6NzIKICAgIC8vIHJldHVybiBzZWxmLmNvbmZpZ19yb2xlKFVJbnQ2NChjZmcuUkVTRVJWRV9BRERSX09GRlNFVCkpCiAgICBwdXNoaW50IDUzIC8vIDUzCiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gcmVzZXJ2ZV9hZGRyLCBlcnIuVU5BVVRIT1JJWkVEX1JFU0VSVkUKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBSZXNlcnZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE3Ny0xNzgKICAgIC8vICMgRm9yYmlkZGVuIHNlbGYtbWludCAodG8gQ3JlYXRvcikgYW5kIG92ZXItbWludCAoPiB0b3RhbCkuCiAgICAvLyBhc3NlcnQgYXNzZXRfcmVjZWl2ZXIgIT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgZXJyLlNFTEZfTUlOVAogICAgZnJhbWVfZGlnIC0yCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgIT0KICAgIGFzc2VydCAvLyBGb3JiaWRkZW4gc2VsZiBtaW50aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE3OS0xODEKICAgIC8vIGFzc2VydCBhc3NldF9hbW91bnQgKyBzZWxmLmNpcmN1bGF0aW5nX3N1cHBseSgKICAgIC8vICAgICBBc3NldChhc3NldF9pZCkKICAgIC8vICkgPD0gc2VsZi5jb25maWdfdG90YWwoYXNzZXRfaWQpLCBlcnIuT1ZFUl9NSU5UCiAgICBmcmFtZV9kaWcgLTQKICAgIGNhbGxzdWIgY2lyY3VsYXRpbmdfc3VwcGx5CiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfcGFja2VkL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBvcC5Cb3guZXh0cmFjdChjZmcuQVNTRVRfQ09ORklHX0JPWF9LRVksIGNmZy5UT1RBTF9PRkZTRVQsIGNmZy5VSU5UNjRfU0laRSkKICAgIGJ5dGVjXzAgLy8gMHg2MTczNzM2NTc0NWY2MzZmNmU2NjY5NjcKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzMgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfcGFja2VkL2NvbnRyYWN0LnB5OjU1LTU3CiAgICAvLyByZXR1cm4gb3AuYnRvaSgKICAgIC8vICAgICBvcC5Cb3guZXh0cmFjdChjZmcuQVNTRVRfQ09ORklHX0JPWF9LRVksIGNmZy5UT1RBTF9PRkZTRVQsIGNmZy5VSU5UNjRfU0laRSkKICAgIC8vICkKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTc5LTE4MQogICAgLy8gYXNzZXJ0IGFzc2V0X2Ftb3VudCArIHNlbGYuY2lyY3VsYXRpbmdfc3VwcGx5KAogICAgLy8gICAgIEFzc2V0KGFzc2V0X2lkKQogICAgLy8gKSA8PSBzZWxmLmNvbmZpZ190b3RhbChhc3NldF9pZCksIGVyci5PVkVSX01JTlQKICAgIDw9CiAgICBhc3NlcnQgLy8gRm9yYmlkZGVuIG92ZXIgbWludGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzEKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2FjY291bnRdID09IGFzc2V0X2lkCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgZnJhbWVfZGlnIC00CiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxODItMTgzCiAgICAvLyAjIEluIHRoZSBjYXNlIG9mIENvbnRyb2xsZWQgQVNBIGRlc3Ryb3llZCBhbmQgcmUtY3JlYXRlZCwgdGhlIFNtYXJ0IEFEQSBJRCBpbiBMb2NhbCBTdGF0ZSBjb3VsZCBiZSBvdXRkYXRlZC4KICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihhc3NldF9pZCwgYXNzZXRfcmVjZWl2ZXIpLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTQ4CiAgICAvLyByZXR1cm4gc2VsZi5nbG9iYWxfZnJvemVuCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZ2xvYmFsX2Zyb3plbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfZnJvemVuIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxODQKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19nbG9iYWxfZnJvemVuKGFzc2V0X2lkKSwgZXJyLkdMT0JBTF9GUk9aRU4KICAgICEKICAgIGFzc2VydCAvLyBTbWFydCBBU0EgaXMgZ2xvYmFsIGZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6ODAKICAgIC8vIHJldHVybiBzZWxmLmNvbmZpZ19yb2xlKFVJbnQ2NChjZmcuQ0xBV0JBQ0tfQUREUl9PRkZTRVQpKQogICAgcHVzaGludCAxMTcgLy8gMTE3CiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE4NQogICAgLy8gaWYgcmVzZXJ2ZV9hZGRyICE9IHNlbGYuY29uZmlnX2NsYXdiYWNrX2FkZHIoYXNzZXRfaWQpOgogICAgIT0KICAgIGJ6IGFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zX2FmdGVyX2lmX2Vsc2VAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzUKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfZnJvemVuW2FjY291bnRdCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhY2NvdW50X2Zyb3plbiIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfZnJvemVuIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToxODYtMTg4CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oCiAgICAvLyAgICAgYXNzZXRfaWQsIGFzc2V0X3JlY2VpdmVyCiAgICAvLyApLCBlcnIuUkVDRUlWRVJfRlJPWkVOCiAgICAhCiAgICBhc3NlcnQgLy8gUmVjZWl2ZXIgYWNjb3VudCBpcyBmcm96ZW4KCmFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zX2FmdGVyX2lmX2Vsc2VAOToKICAgIHJldHN1YgoKYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI0MAogICAgLy8gZWxpZiBhc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzOgogICAgZnJhbWVfZGlnIC0yCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGJ6IGFzc2VydF90cmFuc2Zlcl9wcmVjb25kaXRpb25zX2Vsc2VfYm9keUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo3MgogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoVUludDY0KGNmZy5SRVNFUlZFX0FERFJfT0ZGU0VUKSkKICAgIHB1c2hpbnQgNTMgLy8gNTMKICAgIGNhbGxzdWIgY29uZmlnX3JvbGUKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gcmVzZXJ2ZV9hZGRyLCBlcnIuVU5BVVRIT1JJWkVEX1JFU0VSVkUKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBSZXNlcnZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk3MQogICAgLy8gcmV0dXJuIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWRbYWNjb3VudF0gPT0gYXNzZXRfaWQKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFjY291bnRfc21hcnRfYXNhX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWNjb3VudF9zbWFydF9hc2FfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBmcmFtZV9kaWcgLTQKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjE5Ny0xOTgKICAgIC8vICMgSW4gY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQgdGhlIFNtYXJ0IEFEQSBJRCBpbiBMb2NhbCBTdGF0ZSBjb3VsZCBiZSBvdXRkYXRlZC4KICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihhc3NldF9pZCwgYXNzZXRfc2VuZGVyKSwgZXJyLklOVkFMSURfQ1RSTF9BU0EKICAgIGFzc2VydCAvLyBJbnZhbGlkIENvbnRyb2xsZWQgQVNBIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5Ojk0OAogICAgLy8gcmV0dXJuIHNlbGYuZ2xvYmFsX2Zyb3plbgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImdsb2JhbF9mcm96ZW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX2Zyb3plbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MTk5CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfZ2xvYmFsX2Zyb3plbihhc3NldF9pZCksIGVyci5HTE9CQUxfRlJPWkVOCiAgICAhCiAgICBhc3NlcnQgLy8gU21hcnQgQVNBIGlzIGdsb2JhbCBmcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2FfcGFja2VkL2NvbnRyYWN0LnB5OjgwCiAgICAvLyByZXR1cm4gc2VsZi5jb25maWdfcm9sZShVSW50NjQoY2ZnLkNMQVdCQUNLX0FERFJfT0ZGU0VUKSkKICAgIHB1c2hpbnQgMTE3IC8vIDExNwogICAgY2FsbHN1YiBjb25maWdfcm9sZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMDAKICAgIC8vIGlmIHJlc2VydmVfYWRkciAhPSBzZWxmLmNvbmZpZ19jbGF3YmFja19hZGRyKGFzc2V0X2lkKToKICAgICE9CiAgICBieiBhc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19hZnRlcl9pZl9lbHNlQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTc1CiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X2Zyb3plblthY2NvdW50XQogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYWNjb3VudF9mcm96ZW4iCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X2Zyb3plbiBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjAxCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfYWNjb3VudF9mcm96ZW4oYXNzZXRfaWQsIGFzc2V0X3NlbmRlciksIGVyci5TRU5ERVJfRlJPWkVOCiAgICAhCiAgICBhc3NlcnQgLy8gU2VuZGVyIGFjY291bnQgaXMgZnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjIwMi0yMDMKICAgIC8vICMgRm9yYmlkZGVuIGNsYXdiYWNrIHRocm91Z2ggYnVybmluZyAoYnVybmVkIGFtb3VudCBub3QgZnJvbSBSZXNlcnZlKS4KICAgIC8vIGFzc2VydCBhc3NldF9zZW5kZXIgPT0gcmVzZXJ2ZV9hZGRyLCBlcnIuQ0xBV0JBQ0tfQlVSTgogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgMAogICAgPT0KICAgIGFzc2VydCAvLyBGb3JiaWRkZW4gY2xhd2JhY2sgYnVybmluZwogICAgcmV0c3ViCgphc3NlcnRfdHJhbnNmZXJfcHJlY29uZGl0aW9uc19lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjQ0CiAgICAvLyBlbGlmIFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfY2xhd2JhY2tfYWRkcihhc3NldF9pZCk6CiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhX3BhY2tlZC9jb250cmFjdC5weTo4MAogICAgLy8gcmV0dXJuIHNlbGYuY29uZmlnX3JvbGUoVUludDY0KGNmZy5DTEFXQkFDS19BRERSX09GRlNFVCkpCiAgICBwdXNoaW50IDExNyAvLyAxMTcKICAgIGNhbGxzdWIgY29uZmlnX3JvbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjQ0CiAgICAvLyBlbGlmIFR4bi5zZW5kZXIgPT0gc2VsZi5jb25maWdfY2xhd2JhY2tfYWRkcihhc3NldF9pZCk6CiAgICA9PQogICAgYnogYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfZWxzZV9ib2R5QDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6OTcxCiAgICAvLyByZXR1cm4gc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZFthY2NvdW50XSA9PSBhc3NldF9pZAogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWNjb3VudF9zbWFydF9hc2FfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY2NvdW50X3NtYXJ0X2FzYV9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGZyYW1lX2RpZyAtNAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjA5LTIxMAogICAgLy8gIyBJbiB0aGUgY2FzZSBvZiBDb250cm9sbGVkIEFTQSBkZXN0cm95ZWQgYW5kIHJlLWNyZWF0ZWQsIHRoZSBTbWFydCBBREEgSUQgaW4gTG9jYWwgU3RhdGUgY291bGQgYmUgb3V0ZGF0ZWQuCiAgICAvLyBhc3NlcnQgc2VsZi5pc19ob2xkZXIoYXNzZXRfaWQsIGFzc2V0X3NlbmRlciksIGVyci5JTlZBTElEX0NUUkxfQVNBCiAgICBhc3NlcnQgLy8gSW52YWxpZCBDb250cm9sbGVkIEFTQSBJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NzEKICAgIC8vIHJldHVybiBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkW2FjY291bnRdID09IGFzc2V0X2lkCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhY2NvdW50X3NtYXJ0X2FzYV9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjY291bnRfc21hcnRfYXNhX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgZnJhbWVfZGlnIC00CiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyMTEKICAgIC8vIGFzc2VydCBzZWxmLmlzX2hvbGRlcihhc3NldF9pZCwgYXNzZXRfcmVjZWl2ZXIpLCBlcnIuSU5WQUxJRF9DVFJMX0FTQQogICAgYXNzZXJ0IC8vIEludmFsaWQgQ29udHJvbGxlZCBBU0EgSUQKICAgIHJldHN1YgoKYXNzZXJ0X3RyYW5zZmVyX3ByZWNvbmRpdGlvbnNfZWxzZV9ib2R5QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI1MQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmhhc19hbGxvd2xpc3QoYXNzZXRfaWQpLCBlcnIuTUlTU0lOR19BTExPV0xJU1RfUFJPT0YKICAgIGZyYW1lX2RpZyAtNAogICAgY2FsbHN1YiBoYXNfYWxsb3dsaXN0CiAgICAhCiAgICBhc3NlcnQgLy8gVHJhbnNmZXIgYWxsb3dsaXN0IGlzIHNldCwgdXNlIGFzc2V0X3RyYW5zZmVyX3dpdGhfcHJvb2YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjUyLTI1NgogICAgLy8gc2VsZi5hc3NlcnRfcmVndWxhcl90cmFuc2Zlcl9wcmVjb25kaXRpb25zKAogICAgLy8gICAgIGFzc2V0X2lkPWFzc2V0X2lkLAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIGFzc2VydF9yZWd1bGFyX3RyYW5zZmVyX3ByZWNvbmRpdGlvbnMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zbWFydF9hc2EuY29udHJhY3QuU21hcnRBc2FCYXNlLmVtaXRfdHJhbnNmZXJfZXZlbnQoYXNzZXRfaWQ6IHVpbnQ2NCwgYXNzZXRfc2VuZGVyOiBieXRlcywgYXNzZXRfcmVjZWl2ZXI6IGJ5dGVzLCBhc3NldF9hbW91bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKZW1pdF90cmFuc2Zlcl9ldmVudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjU4LTI2NgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBlbWl0X3RyYW5zZmVyX2V2ZW50KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgKiwKICAgIC8vICAgICBhc3NldF9pZDogVUludDY0LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcjogQWNjb3VudCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcjogQWNjb3VudCwKICAgIC8vICAgICBhc3NldF9hbW91bnQ6IFVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgUmVndWxhciB0cmFuc2ZlcnMgYXJlIG5vdCBsb2dnZWQsIHN1cHBseSBhbmQgY2xhd2JhY2sgY2hhbmdlcyBhcmUuCiAgICAvLyBpZiBhc3NldF9zZW5kZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzczoKICAgIGZyYW1lX2RpZyAtMwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBieiBlbWl0X3RyYW5zZmVyX2V2ZW50X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3MgogICAgLy8gYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjcwLTI3MwogICAgLy8gTWludCgKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hcmM0LkFkZHJlc3MoYXNzZXRfcmVjZWl2ZXIpLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjY5LTI3NAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIE1pbnQoCiAgICAvLyAgICAgICAgIGFzc2V0X3JlY2VpdmVyPWFyYzQuQWRkcmVzcyhhc3NldF9yZWNlaXZlciksCiAgICAvLyAgICAgICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGRmMmU3OTRlIC8vIG1ldGhvZCAiTWludChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwoKZW1pdF90cmFuc2Zlcl9ldmVudF9hZnRlcl9pZl9lbHNlQDg6CiAgICByZXRzdWIKCmVtaXRfdHJhbnNmZXJfZXZlbnRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gZWxpZiBhc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzOgogICAgZnJhbWVfZGlnIC0yCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGJ6IGVtaXRfdHJhbnNmZXJfZXZlbnRfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjc5CiAgICAvLyBhc3NldF9hbW91bnQ9YXJjNC5VSW50NjQoYXNzZXRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyNzctMjgwCiAgICAvLyBCdXJuKAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hcmM0LkFkZHJlc3MoYXNzZXRfc2VuZGVyKSwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YXJjNC5VSW50NjQoYXNzZXRfYW1vdW50KSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI3Ni0yODEKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBCdXJuKAogICAgLy8gICAgICAgICBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKGFzc2V0X3NlbmRlciksCiAgICAvLyAgICAgICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGJ5dGVjIDkgLy8gbWV0aG9kICJCdXJuKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCmVtaXRfdHJhbnNmZXJfZXZlbnRfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4MgogICAgLy8gZWxpZiBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2NsYXdiYWNrX2FkZHIoYXNzZXRfaWQpOgogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYV9wYWNrZWQvY29udHJhY3QucHk6ODAKICAgIC8vIHJldHVybiBzZWxmLmNvbmZpZ19yb2xlKFVJbnQ2NChjZmcuQ0xBV0JBQ0tfQUREUl9PRkZTRVQpKQogICAgcHVzaGludCAxMTcgLy8gMTE3CiAgICBjYWxsc3ViIGNvbmZpZ19yb2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4MgogICAgLy8gZWxpZiBUeG4uc2VuZGVyID09IHNlbGYuY29uZmlnX2NsYXdiYWNrX2FkZHIoYXNzZXRfaWQpOgogICAgPT0KICAgIGJ6IGVtaXRfdHJhbnNmZXJfZXZlbnRfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjg0LTI4OAogICAgLy8gQ2xhd2JhY2soCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFyYzQuQWRkcmVzcyhhc3NldF9zZW5kZXIpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWFyYzQuQWRkcmVzcyhhc3NldF9yZWNlaXZlciksCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFyYzQuVUludDY0KGFzc2V0X2Ftb3VudCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MjgzLTI4OQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIENsYXdiYWNrKAogICAgLy8gICAgICAgICBhc3NldF9zZW5kZXI9YXJjNC5BZGRyZXNzKGFzc2V0X3NlbmRlciksCiAgICAvLyAgICAgICAgIGFzc2V0X3JlY2VpdmVyPWFyYzQuQWRkcmVzcyhhc3NldF9yZWNlaXZlciksCiAgICAvLyAgICAgICAgIGFzc2V0X2Ftb3VudD1hcmM0LlVJbnQ2NChhc3NldF9hbW91bnQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDRiODk5OGZjIC8vIG1ldGhvZCAiQ2xhd2JhY2soYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNtYXJ0X2FzYS5jb250cmFjdC5TbWFydEFzYUJhc2UuaXNfYWxsb3dsaXN0ZWQoYXNzZXRfaWQ6IHVpbnQ2NCwgYWNjb3VudDogYnl0ZXMsIHByb29mOiBieXRlcykgLT4gdWludDY0LCBieXRlczoKaXNfYWxsb3dsaXN0ZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI5MS0yOTQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaXNfYWxsb3dsaXN0ZWQoCiAgICAvLyAgICAgc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCwgYWNjb3VudDogQWNjb3VudCwgcHJvb2Y6IE1lcmtsZVByb29mCiAgICAvLyApIC0+IGJvb2w6CiAgICBwcm90byAzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjk1CiAgICAvLyBub2RlID0gb3Auc2hhMjU2KGNmZy5NRVJLTEVfTEVBRl9QUkVGSVggKyBhY2NvdW50LmJ5dGVzKQogICAgYnl0ZWMgNyAvLyAweDAwCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjI5NgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHByb29mLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzAgLy8gMAoKaXNfYWxsb3dsaXN0ZWRfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyOTYKICAgIC8vIGZvciBpIGluIHVyYW5nZShwcm9vZi5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBpc19hbGxvd2xpc3RlZF9hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyOTcKICAgIC8vIHNpYmxpbmcgPSBwcm9vZltpXS5ieXRlcwogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weToyOTgtMjk5CiAgICAvLyAjIFNvcnRlZCBwYWlyIGhhc2hpbmc6IHByb29mcyBuZWVkIG5vIGxlZnQvcmlnaHQgcGF0aCBiaXRzLgogICAgLy8gaWYgQmlnVUludC5mcm9tX2J5dGVzKG5vZGUpIDwgQmlnVUludC5mcm9tX2J5dGVzKHNpYmxpbmcpOgogICAgZnJhbWVfZGlnIDAKICAgIGI+CiAgICBieiBpc19hbGxvd2xpc3RlZF9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozMDAKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoY2ZnLk1FUktMRV9OT0RFX1BSRUZJWCArIG5vZGUgKyBzaWJsaW5nKQogICAgcHVzaGJ5dGVzIDB4MDEKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBmcmFtZV9idXJ5IDAKCmlzX2FsbG93bGlzdGVkX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mjk2CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGlzX2FsbG93bGlzdGVkX2Zvcl9oZWFkZXJAMQoKaXNfYWxsb3dsaXN0ZWRfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwMgogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihjZmcuTUVSS0xFX05PREVfUFJFRklYICsgc2libGluZyArIG5vZGUpCiAgICBwdXNoYnl0ZXMgMHgwMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIGZyYW1lX2J1cnkgMAogICAgYiBpc19hbGxvd2xpc3RlZF9hZnRlcl9pZl9lbHNlQDUKCmlzX2FsbG93bGlzdGVkX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTo5NjAKICAgIC8vIHJldHVybiBzZWxmLmFsbG93bGlzdF9yb290CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWxsb3dsaXN0X3Jvb3QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWxsb3dsaXN0X3Jvb3QgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjMwMwogICAgLy8gcmV0dXJuIG5vZGUgPT0gc2VsZi5sb2FkX2FsbG93bGlzdF9yb290KGFzc2V0X2lkKQogICAgZnJhbWVfZGlnIDAKICAgID09CiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc21hcnRfYXNhLmNvbnRyYWN0LlNtYXJ0QXNhQmFzZS5pbm5lcl9hc3NldF90cmFuc2Zlcih4ZmVyX2Fzc2V0OiB1aW50NjQsIGFzc2V0X2Ftb3VudDogdWludDY0LCBhc3NldF9zZW5kZXI6IGJ5dGVzLCBhc3NldF9yZWNlaXZlcjogYnl0ZXMpIC0+IHZvaWQ6CmlubmVyX2Fzc2V0X3RyYW5zZmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNjYtMzc0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGlubmVyX2Fzc2V0X3RyYW5zZmVyKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgKiwKICAgIC8vICAgICB4ZmVyX2Fzc2V0OiBBc3NldCwKICAgIC8vICAgICBhc3NldF9hbW91bnQ6IFVJbnQ2NCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI6IEFjY291bnQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI6IEFjY291bnQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NtYXJ0X2FzYS9jb250cmFjdC5weTozNzUtMzgyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyAgICAgeGZlcl9hc3NldD14ZmVyX2Fzc2V0LmlkLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hc3NldF9hbW91bnQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPWFzc2V0X3NlbmRlciwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1hc3NldF9yZWNlaXZlciwKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6MzgxCiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBc3NldFNlbmRlcgogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBmcmFtZV9kaWcgLTQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM3NQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc21hcnRfYXNhL2NvbnRyYWN0LnB5OjM3NgogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zbWFydF9hc2EvY29udHJhY3QucHk6Mzc1LTM4MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9eGZlcl9hc3NldC5pZCwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YXNzZXRfYW1vdW50LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1hc3NldF9zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YXNzZXRfcmVjZWl2ZXIsCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [2058], "errorMessage": "Address length is 32 bytes"}, {"pc": [1030], "errorMessage": "Clawback Address has been deleted"}, {"pc": [1833], "errorMessage": "Close to account is frozen"}, {"pc": [462], "errorMessage": "Controlled ASA already created"}, {"pc": [1246], "errorMessage": "Empty transfer batch"}, {"pc": [755], "errorMessage": "Forbidden Close Out on Opt In"}, {"pc": [2292], "errorMessage": "Forbidden clawback burning"}, {"pc": [2197], "errorMessage": "Forbidden over minting"}, {"pc": [2182], "errorMessage": "Forbidden self minting"}, {"pc": [1010], "errorMessage": "Freeze Address has been deleted"}, {"pc": [1733], "errorMessage": "Invalid Close Out group size"}, {"pc": [1594, 1727, 1808, 2073, 2120, 2130, 2207, 2263, 2314, 2324], "errorMessage": "Invalid Controlled ASA ID"}, {"pc": [1043], "errorMessage": "Invalid Total, must be >= circulating supply"}, {"pc": [763, 2069], "errorMessage": "Missing Controlled ASA"}, {"pc": [303], "errorMessage": "OnCompletion must be CloseOut && can only call when not creating"}, {"pc": [192], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [325], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [314], "errorMessage": "OnCompletion must be OptIn && can only call when not creating"}, {"pc": [2152, 2230], "errorMessage": "Receiver account is frozen"}, {"pc": [1492], "errorMessage": "Receiver account is not allowlisted"}, {"pc": [990], "errorMessage": "Reserve Address has been deleted"}, {"pc": [1827, 2144, 2286], "errorMessage": "Sender account is frozen"}, {"pc": [1481], "errorMessage": "Sender account is not allowlisted"}, {"pc": [1819, 2136, 2213, 2269], "errorMessage": "Smart ASA is global frozen"}, {"pc": [1461], "errorMessage": "Transfer allowlist is not set"}, {"pc": [1813], "errorMessage": "Transfer allowlist is set, close out to the Creator"}, {"pc": [2332], "errorMessage": "Transfer allowlist is set, use asset_transfer_with_proof"}, {"pc": [1250], "errorMessage": "Transfer batch exceeds max inner group size"}, {"pc": [455], "errorMessage": "Unauthorized"}, {"pc": [2110], "errorMessage": "Unauthorized Clawback"}, {"pc": [1537, 1603, 1657], "errorMessage": "Unauthorized Freeze"}, {"pc": [973, 1900], "errorMessage": "Unauthorized Manager"}, {"pc": [2176, 2253], "errorMessage": "Unauthorized Reserve"}, {"pc": [1752], "errorMessage": "Wrong ASA Close Out Amount"}, {"pc": [1740], "errorMessage": "Wrong ASA Close Out ID"}, {"pc": [1747], "errorMessage": "Wrong ASA Close Out Sender"}, {"pc": [749], "errorMessage": "Wrong ASA Opt In Amount"}, {"pc": [730], "errorMessage": "Wrong ASA Opt In ID"}, {"pc": [744], "errorMessage": "Wrong ASA Opt In Receiver"}, {"pc": [737], "errorMessage": "Wrong ASA Opt In Sender"}, {"pc": [1758, 1783], "errorMessage": "Wrong Close Out on Close Out"}, {"pc": [134], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [140], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [144], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [150], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [718, 1706], "errorMessage": "Wrong On Complete Action"}, {"pc": [782, 1849, 2096], "errorMessage": "account opted into asset"}, {"pc": [1825, 1831, 2008, 2142, 2150, 2228, 2284], "errorMessage": "check self.account_frozen exists for account"}, {"pc": [1590, 1723, 1801, 2116, 2126, 2203, 2259, 2310, 2320], "errorMessage": "check self.account_smart_asa_id exists for account"}, {"pc": [2082, 2501], "errorMessage": "check self.allowlist_root exists"}, {"pc": [1947], "errorMessage": "check self.asset_config_box exists"}, {"pc": [1817, 1970, 2134, 2211, 2267], "errorMessage": "check self.global_frozen exists"}, {"pc": [460, 2067], "errorMessage": "check self.smart_asa_id exists"}, {"pc": [1272, 2455], "errorMessage": "index access is out of bounds"}, {"pc": [359, 376, 393, 410, 855, 874, 893, 912, 1225, 1424, 1440, 2435], "errorMessage": "invalid array length header"}, {"pc": [352, 846, 1524, 1579], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [1434, 1450], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [369, 386, 403, 417, 865, 884, 903, 919], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [1240], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.avm_types.TransferLeg>"}, {"pc": [425, 433, 441, 449, 929, 940, 950, 960, 1159, 1167, 1410, 1418, 1571, 1644, 1700, 2000], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [344, 836], "errorMessage": "invalid number of bytes for arc4.uint32"}, {"pc": [335, 700, 813, 825, 1142, 1151, 1214, 1393, 1402, 1515, 1562, 1632, 1688, 1886, 1940, 1962, 1991, 2029], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [713, 1717, 1774], "errorMessage": "transaction type is axfer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True)
+class AssetConfig:
+    """Struct for AssetConfig"""
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: str
+    name: str
+    url: str
+    metadata_hash: bytes
+    manager_addr: str
+    reserve_addr: str
+    freeze_addr: str
+    clawback_addr: str
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetCreateArgs:
+    """Dataclass for asset_create arguments"""
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: str
+    name: str
+    url: str
+    metadata_hash: bytes | str
+    manager_addr: str
+    reserve_addr: str
+    freeze_addr: str
+    clawback_addr: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetConfigArgs:
+    """Dataclass for asset_config arguments"""
+    config_asset: int
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: str
+    name: str
+    url: str
+    metadata_hash: bytes | str
+    manager_addr: str
+    reserve_addr: str
+    freeze_addr: str
+    clawback_addr: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetTransferArgs:
+    """Dataclass for asset_transfer arguments"""
+    xfer_asset: int
+    asset_amount: int
+    asset_sender: str
+    asset_receiver: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_transfer(uint64,uint64,address,address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetTransferBatchArgs:
+    """Dataclass for asset_transfer_batch arguments"""
+    xfer_asset: int
+    legs: list[tuple[str, str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_transfer_batch(uint64,(address,address,uint64)[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetTransferWithProofArgs:
+    """Dataclass for asset_transfer_with_proof arguments"""
+    xfer_asset: int
+    asset_amount: int
+    asset_sender: str
+    asset_receiver: str
+    sender_proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+    receiver_proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetFreezeArgs:
+    """Dataclass for asset_freeze arguments"""
+    freeze_asset: int
+    asset_frozen: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_freeze(uint64,bool)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AccountFreezeArgs:
+    """Dataclass for account_freeze arguments"""
+    freeze_asset: int
+    freeze_account: str
+    asset_frozen: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "account_freeze(uint64,address,bool)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetTransferAllowlistArgs:
+    """Dataclass for set_transfer_allowlist arguments"""
+    freeze_asset: int
+    allowlist_root: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_transfer_allowlist(uint64,byte[32])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetDestroyArgs:
+    """Dataclass for asset_destroy arguments"""
+    destroy_asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_destroy(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetAssetConfigArgs:
+    """Dataclass for get_asset_config arguments"""
+    asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetAssetIsFrozenArgs:
+    """Dataclass for get_asset_is_frozen arguments"""
+    freeze_asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_asset_is_frozen(uint64)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetAccountIsFrozenArgs:
+    """Dataclass for get_account_is_frozen arguments"""
+    freeze_asset: int
+    freeze_account: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_account_is_frozen(uint64,address)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCirculatingSupplyArgs:
+    """Dataclass for get_circulating_supply arguments"""
+    asset: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_circulating_supply(uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetOptInArgs:
+    """Dataclass for asset_opt_in arguments"""
+    asset: int
+    ctrl_asa_opt_in: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_opt_in(uint64,axfer)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetCloseOutArgs:
+    """Dataclass for asset_close_out arguments"""
+    close_asset: int
+    close_to: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "asset_close_out(uint64,address)void"
+
+
+class _SmartAsaPackedOptIn:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_opt_in(uint64,axfer)void",
+            "args": method_args,
+        }))
+
+
+class _SmartAsaPackedCloseOut:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.close_out(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_close_out(uint64,address)void",
+            "args": method_args,
+        }))
+
+
+class SmartAsaPackedParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_SmartAsaPackedOptIn":
+        return _SmartAsaPackedOptIn(self.app_client)
+
+    @property
+    def close_out(self) -> "_SmartAsaPackedCloseOut":
+        return _SmartAsaPackedCloseOut(self.app_client)
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64",
+            "args": method_args,
+        }))
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void",
+            "args": method_args,
+        }))
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer(uint64,uint64,address,address)void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }))
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_freeze(uint64,bool)void",
+            "args": method_args,
+        }))
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "account_freeze(uint64,address,bool)void",
+            "args": method_args,
+        }))
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }))
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_destroy(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)",
+            "args": method_args,
+        }))
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_is_frozen(uint64)bool",
+            "args": method_args,
+        }))
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_account_is_frozen(uint64,address)bool",
+            "args": method_args,
+        }))
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_circulating_supply(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _SmartAsaPackedOptInTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_opt_in(uint64,axfer)void",
+            "args": method_args,
+        }))
+
+
+class _SmartAsaPackedCloseOutTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.close_out(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_close_out(uint64,address)void",
+            "args": method_args,
+        }))
+
+
+class SmartAsaPackedCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_SmartAsaPackedOptInTransaction":
+        return _SmartAsaPackedOptInTransaction(self.app_client)
+
+    @property
+    def close_out(self) -> "_SmartAsaPackedCloseOutTransaction":
+        return _SmartAsaPackedCloseOutTransaction(self.app_client)
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64",
+            "args": method_args,
+        }))
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void",
+            "args": method_args,
+        }))
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer(uint64,uint64,address,address)void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }))
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_freeze(uint64,bool)void",
+            "args": method_args,
+        }))
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "account_freeze(uint64,address,bool)void",
+            "args": method_args,
+        }))
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }))
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_destroy(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)",
+            "args": method_args,
+        }))
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_is_frozen(uint64)bool",
+            "args": method_args,
+        }))
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_account_is_frozen(uint64,address)bool",
+            "args": method_args,
+        }))
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_circulating_supply(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _SmartAsaPackedOptInSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_opt_in(uint64,axfer)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+
+class _SmartAsaPackedCloseOutSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.close_out(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_close_out(uint64,address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+
+class SmartAsaPackedSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_SmartAsaPackedOptInSend":
+        return _SmartAsaPackedOptInSend(self.app_client)
+
+    @property
+    def close_out(self) -> "_SmartAsaPackedCloseOutSend":
+        return _SmartAsaPackedCloseOutSend(self.app_client)
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer(uint64,uint64,address,address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_freeze(uint64,bool)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "account_freeze(uint64,address,bool)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_transfer_allowlist(uint64,byte[32])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "asset_destroy(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[AssetConfig]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(AssetConfig, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[AssetConfig], parsed_response)
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_asset_is_frozen(uint64)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_account_is_frozen(uint64,address)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_circulating_supply(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    smart_asa_id: int
+    global_frozen: int
+    allowlist_root: bytes
+
+class LocalStateValue(typing.TypedDict):
+    """Shape of local_state state key values"""
+    account_smart_asa_id: int
+    account_frozen: int
+
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    asset_config_box: AssetConfig
+
+class SmartAsaPackedState:
+    """Methods to access state for the current SmartAsaPacked app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    def local_state(
+        self, address: str
+    ) -> "_LocalState":
+            """Methods to access local_state for the current app"""
+            return _LocalState(self.app_client, address)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def smart_asa_id(self) -> int:
+        """Get the current value of the smart_asa_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("smart_asa_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def global_frozen(self) -> int:
+        """Get the current value of the global_frozen key in global_state state"""
+        value = self.app_client.state.global_state.get_value("global_frozen")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def allowlist_root(self) -> bytes:
+        """Get the current value of the allowlist_root key in global_state state"""
+        value = self.app_client.state.global_state.get_value("allowlist_root")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+class _LocalState:
+    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+        self.app_client = app_client
+        self.address = address
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> LocalStateValue:
+        """Get all current keyed values from local_state state"""
+        result = self.app_client.state.local_state(self.address).get_all()
+        if not result:
+            return typing.cast(LocalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(LocalStateValue, converted)
+
+    @property
+    def account_smart_asa_id(self) -> int:
+        """Get the current value of the account_smart_asa_id key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("account_smart_asa_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def account_frozen(self) -> int:
+        """Get the current value of the account_frozen key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("account_frozen")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "AssetConfig": AssetConfig
+        }
+
+    def get_all(self) -> BoxStateValue:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return typing.cast(BoxStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def asset_config_box(self) -> AssetConfig:
+        """Get the current value of the asset_config_box key in box state"""
+        value = self.app_client.state.box.get_value("asset_config_box")
+        if isinstance(value, dict) and "AssetConfig" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AssetConfig"], value)  # type: ignore
+        return typing.cast(AssetConfig, value)
+
+class SmartAsaPackedClient:
+    """Client for interacting with SmartAsaPacked smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = SmartAsaPackedParams(self.app_client)
+        self.create_transaction = SmartAsaPackedCreateTransactionParams(self.app_client)
+        self.send = SmartAsaPackedSend(self.app_client)
+        self.state = SmartAsaPackedState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "SmartAsaPackedClient":
+        return SmartAsaPackedClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "SmartAsaPackedClient":
+        return SmartAsaPackedClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "SmartAsaPackedClient":
+        return SmartAsaPackedClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "SmartAsaPackedComposer":
+        return SmartAsaPackedComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_transfer(uint64,uint64,address,address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_transfer_batch(uint64,(address,address,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_freeze(uint64,bool)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["account_freeze(uint64,address,bool)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_transfer_allowlist(uint64,byte[32])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_destroy(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> AssetConfig | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_asset_is_frozen(uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_account_is_frozen(uint64,address)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_circulating_supply(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_opt_in(uint64,axfer)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["asset_close_out(uint64,address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | AssetConfig | None | bool | int:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class SmartAsaPackedBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating SmartAsaPacked contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class SmartAsaPackedFactory(algokit_utils.TypedAppFactoryProtocol[SmartAsaPackedBareCallCreateParams, None, None]):
+    """Factory for deploying and managing SmartAsaPackedClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = SmartAsaPackedFactoryParams(self.app_factory)
+        self.create_transaction = SmartAsaPackedFactoryCreateTransaction(self.app_factory)
+        self.send = SmartAsaPackedFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: SmartAsaPackedBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[SmartAsaPackedClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return SmartAsaPackedClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> SmartAsaPackedClient:
+        """Get an app client by creator address and name"""
+        return SmartAsaPackedClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> SmartAsaPackedClient:
+        """Get an app client by app ID"""
+        return SmartAsaPackedClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class SmartAsaPackedFactoryParams:
+    """Parameters for creating transactions for SmartAsaPacked contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = SmartAsaPackedFactoryCreateParams(app_factory)
+        self.update = SmartAsaPackedFactoryUpdateParams(app_factory)
+        self.delete = SmartAsaPackedFactoryDeleteParams(app_factory)
+
+class SmartAsaPackedFactoryCreateParams:
+    """Parameters for 'create' operations of SmartAsaPacked contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_transfer(uint64,uint64,address,address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_transfer(uint64,uint64,address,address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_transfer_batch(uint64,(address,address,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_transfer_batch(uint64,(address,address,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_freeze(uint64,bool)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_freeze(uint64,bool)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the account_freeze(uint64,address,bool)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "account_freeze(uint64,address,bool)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_transfer_allowlist(uint64,byte[32])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_transfer_allowlist(uint64,byte[32])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_destroy(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_destroy(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_asset_is_frozen(uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_asset_is_frozen(uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_account_is_frozen(uint64,address)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_account_is_frozen(uint64,address)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_circulating_supply(uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_circulating_supply(uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_opt_in(uint64,axfer)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_opt_in(uint64,axfer)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the asset_close_out(uint64,address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "asset_close_out(uint64,address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class SmartAsaPackedFactoryUpdateParams:
+    """Parameters for 'update' operations of SmartAsaPacked contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class SmartAsaPackedFactoryDeleteParams:
+    """Parameters for 'delete' operations of SmartAsaPacked contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class SmartAsaPackedFactoryCreateTransaction:
+    """Create transactions for SmartAsaPacked contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = SmartAsaPackedFactoryCreateTransactionCreate(app_factory)
+
+
+class SmartAsaPackedFactoryCreateTransactionCreate:
+    """Create new instances of SmartAsaPacked contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class SmartAsaPackedFactorySend:
+    """Send calls to SmartAsaPacked contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = SmartAsaPackedFactorySendCreate(app_factory)
+
+
+class SmartAsaPackedFactorySendCreate:
+    """Send create calls to SmartAsaPacked contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[SmartAsaPackedClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return SmartAsaPackedClient(result[0]), result[1]
+
+
+class _SmartAsaPackedOptInComposer:
+    def __init__(self, composer: "SmartAsaPackedComposer"):
+        self.composer = composer
+    def asset_opt_in(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | AssetOptInArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self.composer._composer.add_app_call_method_call(
+            self.composer.client.params.opt_in.asset_opt_in(
+                args=args,
+                params=params,
+                
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "asset_opt_in(uint64,axfer)void", v
+            )
+        )
+        return self.composer
+
+
+class _SmartAsaPackedCloseOutComposer:
+    def __init__(self, composer: "SmartAsaPackedComposer"):
+        self.composer = composer
+    def asset_close_out(
+        self,
+        args: tuple[int, str] | AssetCloseOutArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self.composer._composer.add_app_call_method_call(
+            self.composer.client.params.close_out.asset_close_out(
+                args=args,
+                params=params,
+                
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "asset_close_out(uint64,address)void", v
+            )
+        )
+        return self.composer
+
+
+class SmartAsaPackedComposer:
+    """Composer for creating transaction groups for SmartAsaPacked contract calls"""
+
+    def __init__(self, client: "SmartAsaPackedClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def opt_in(self) -> "_SmartAsaPackedOptInComposer":
+        return _SmartAsaPackedOptInComposer(self)
+
+    @property
+    def close_out(self) -> "_SmartAsaPackedCloseOutComposer":
+        return _SmartAsaPackedCloseOutComposer(self)
+
+    def asset_create(
+        self,
+        args: tuple[int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetCreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_create(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_create(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)uint64", v
+            )
+        )
+        return self
+
+    def asset_config(
+        self,
+        args: tuple[int, int, int, bool, str, str, str, bytes | str, str, str, str, str] | AssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_config(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_config(uint64,uint64,uint32,bool,string,string,string,byte[],address,address,address,address)void", v
+            )
+        )
+        return self
+
+    def asset_transfer(
+        self,
+        args: tuple[int, int, str, str] | AssetTransferArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_transfer(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_transfer(uint64,uint64,address,address)void", v
+            )
+        )
+        return self
+
+    def asset_transfer_batch(
+        self,
+        args: tuple[int, list[tuple[str, str, int]]] | AssetTransferBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_transfer_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_transfer_batch(uint64,(address,address,uint64)[])void", v
+            )
+        )
+        return self
+
+    def asset_transfer_with_proof(
+        self,
+        args: tuple[int, int, str, str, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | AssetTransferWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_transfer_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_transfer_with_proof(uint64,uint64,address,address,byte[32][],byte[32][])void", v
+            )
+        )
+        return self
+
+    def asset_freeze(
+        self,
+        args: tuple[int, bool] | AssetFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_freeze(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_freeze(uint64,bool)void", v
+            )
+        )
+        return self
+
+    def account_freeze(
+        self,
+        args: tuple[int, str, bool] | AccountFreezeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.account_freeze(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "account_freeze(uint64,address,bool)void", v
+            )
+        )
+        return self
+
+    def set_transfer_allowlist(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SetTransferAllowlistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_transfer_allowlist(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_transfer_allowlist(uint64,byte[32])void", v
+            )
+        )
+        return self
+
+    def asset_destroy(
+        self,
+        args: tuple[int] | AssetDestroyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.asset_destroy(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "asset_destroy(uint64)void", v
+            )
+        )
+        return self
+
+    def get_asset_config(
+        self,
+        args: tuple[int] | GetAssetConfigArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_asset_config(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_asset_config(uint64)(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)", v
+            )
+        )
+        return self
+
+    def get_asset_is_frozen(
+        self,
+        args: tuple[int] | GetAssetIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_asset_is_frozen(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_asset_is_frozen(uint64)bool", v
+            )
+        )
+        return self
+
+    def get_account_is_frozen(
+        self,
+        args: tuple[int, str] | GetAccountIsFrozenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_account_is_frozen(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_account_is_frozen(uint64,address)bool", v
+            )
+        )
+        return self
+
+    def get_circulating_supply(
+        self,
+        args: tuple[int] | GetCirculatingSupplyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_circulating_supply(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_circulating_supply(uint64)uint64", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "SmartAsaPackedComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "SmartAsaPackedComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
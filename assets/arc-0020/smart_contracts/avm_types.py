@@ -1,5 +1,10 @@
+import typing
+
 from algopy import arc4
 
+Hash: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+MerkleProof: typing.TypeAlias = arc4.DynamicArray[Hash]
+
 
 class AssetConfig(arc4.Struct, kw_only=True):
     """Smart ASA Configuration"""
@@ -15,3 +20,61 @@ class AssetConfig(arc4.Struct, kw_only=True):
     reserve_addr: arc4.Address
     freeze_addr: arc4.Address
     clawback_addr: arc4.Address
+
+
+class TransferLeg(arc4.Struct, kw_only=True):
+    """Smart ASA Batched Transfer Leg"""
+
+    asset_sender: arc4.Address
+    asset_receiver: arc4.Address
+    asset_amount: arc4.UInt64
+
+
+class ControlledAsset(arc4.Struct, kw_only=True):
+    """Multi-tenant Smart ASA Controlled Asset"""
+
+    global_frozen: arc4.Bool
+    allowlist_root: Hash
+    asset_config: AssetConfig
+
+
+class Holding(arc4.Struct, kw_only=True):
+    """Multi-tenant Smart ASA Holding (Controlled Asset, Account) key"""
+
+    asset_id: arc4.UInt64
+    account: arc4.Address
+
+
+class Mint(arc4.Struct, kw_only=True):
+    """Smart ASA Mint Event"""
+
+    asset_receiver: arc4.Address
+    asset_amount: arc4.UInt64
+
+
+class Burn(arc4.Struct, kw_only=True):
+    """Smart ASA Burn Event"""
+
+    asset_sender: arc4.Address
+    asset_amount: arc4.UInt64
+
+
+class Clawback(arc4.Struct, kw_only=True):
+    """Smart ASA Clawback Event"""
+
+    asset_sender: arc4.Address
+    asset_receiver: arc4.Address
+    asset_amount: arc4.UInt64
+
+
+class AssetFreeze(arc4.Struct, kw_only=True):
+    """Smart ASA Global Freeze Event"""
+
+    asset_frozen: arc4.Bool
+
+
+class AccountFreeze(arc4.Struct, kw_only=True):
+    """Smart ASA Account Freeze Event"""
+
+    freeze_account: arc4.Address
+    asset_frozen: arc4.Bool
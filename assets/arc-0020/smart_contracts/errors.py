@@ -25,6 +25,12 @@ SENDER_FROZEN = "Sender account is frozen"
 RECEIVER_FROZEN = "Receiver account is frozen"
 CLOSE_TO_FROZEN = "Close to account is frozen"
 
+MISSING_ALLOWLIST = "Transfer allowlist is not set"
+MISSING_ALLOWLIST_PROOF = "Transfer allowlist is set, use asset_transfer_with_proof"
+SENDER_NOT_ALLOWLISTED = "Sender account is not allowlisted"
+RECEIVER_NOT_ALLOWLISTED = "Receiver account is not allowlisted"
+ALLOWLIST_CLOSE_OUT = "Transfer allowlist is set, close out to the Creator"
+
 OPT_IN_WRONG_TYPE = "Wrong ASA Opt In txn type"
 OPT_IN_WRONG_ASA = "Wrong ASA Opt In ID"
 OPT_IN_WRONG_SENDER = "Wrong ASA Opt In Sender"
@@ -32,6 +38,11 @@ OPT_IN_WRONG_RECEIVER = "Wrong ASA Opt In Receiver"
 OPT_IN_WRONG_AMOUNT = "Wrong ASA Opt In Amount"
 OPT_IN_WRONG_CLOSE_TO = "Forbidden Close Out on Opt In"
 OPT_IN_MISSING = "Missing OptIn"
+OPT_IN_EXISTING = "Smart ASA already opted in"
+OPT_IN_MISSING_MBR = "Missing Opt In box MBR payment"
+OPT_IN_WRONG_MBR_SENDER = "Wrong Opt In box MBR payment Sender"
+OPT_IN_WRONG_MBR_RECEIVER = "Wrong Opt In box MBR payment Receiver"
+OPT_IN_WRONG_MBR_AMOUNT = "Wrong Opt In box MBR payment Amount"
 
 CLOSE_OUT_WRONG_TYPE = "Wrong ASA Close Out txn type"
 CLOSE_OUT_WRONG_ASA = "Wrong ASA Close Out ID"
@@ -40,6 +51,9 @@ CLOSE_OUT_WRONG_AMOUNT = "Wrong ASA Close Out Amount"
 CLOSE_OUT_WRONG_CLOSE_TO = "Wrong Close Out on Close Out"
 INVALID_CLOSE_OUT_GROUP_SIZE = "Invalid Close Out group size"
 
+EMPTY_BATCH = "Empty transfer batch"
+OVERSIZED_BATCH = "Transfer batch exceeds max inner group size"
+
 INVALID_TOTAL = "Invalid Total, must be >= circulating supply"
 
 SELF_MINT = "Forbidden self minting"
@@ -0,0 +1,496 @@
+"""
+Asyncio client for the SmartAsa app.
+
+The typed client is synchronous: in an asyncio service each call blocks the event
+loop (or takes a worker thread). The async client mirrors the typed client accessors
+over the pooled `arc_common.aio.AsyncAlgodClient`, so thousands of calls can be
+awaited concurrently on a handful of keep-alive connections:
+
+    async with AsyncAlgodClient.from_algod(algod) as aio_algod:
+        client = AsyncSmartAsaClient(aio_algod, app_id, default_sender=caller.address)
+        supplies = await asyncio.gather(
+            *(client.send.get_circulating_supply(args) for args in calls)
+        )
+        state = await client.state.global_state()
+
+- `params` builds the app call params (no I/O);
+- `create_transaction` builds the unsigned app call (suggested params come from a
+  `SuggestedParamsCache`, which can be shared with the sync helpers);
+- `send` simulates read-only methods and signs, submits and confirms the others;
+- `state` fetches the whole global state or an account local state at once.
+
+Each accessor has a method per NoOp method (e.g. `send.asset_transfer(args)`), as the
+typed client, besides the generic `call(args)`. Calls without an explicit note get a
+unique one, so identical concurrent calls have distinct transaction IDs.
+
+Calls are the typed client `*Args` dataclasses of the NoOp methods (opt in and close
+out, which take a transaction argument or a non NoOp on completion, stay on the typed
+client). Arguments are encoded with the precompiled encoders. Resource references
+are derived from the arguments: `address` arguments are referenced as accounts, asset
+ID arguments (`asset`, `*_asset`) as assets, besides any reference in the params.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Final, TypeVar, cast
+
+import httpx
+from algokit_utils import AppCallParams, CommonAppCallParams
+from algosdk import abi, error, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.logic import get_application_address
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+from arc_common.aio import (
+    DEFAULT_WAIT_ROUNDS,
+    AsyncAlgodClient,
+    CallNotes,
+    build_transaction,
+)
+from arc_common.suggested_params import SuggestedParamsCache
+
+from smart_contracts.smart_asa.app_spec import app_spec
+from smart_contracts.smart_asa.encoders import AbiArgs, app_call_params
+from smart_contracts.smart_asa.fees import with_fee
+from smart_contracts.smart_asa.holders import HolderRecord, decode_local_state
+from smart_contracts.smart_asa.reads import RETURN_PREFIX, SimulateError, return_decoder
+from smart_contracts.smart_asa.state import SmartAsaGlobalState, decode_global_state
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+        AccountFreezeArgs,
+        AssetConfig,
+        AssetConfigArgs,
+        AssetCreateArgs,
+        AssetDestroyArgs,
+        AssetFreezeArgs,
+        AssetTransferArgs,
+        AssetTransferBatchArgs,
+        AssetTransferWithProofArgs,
+        GetAccountIsFrozenArgs,
+        GetAssetConfigArgs,
+        GetAssetIsFrozenArgs,
+        GetCirculatingSupplyArgs,
+        SetTransferAllowlistArgs,
+    )
+
+
+_T = TypeVar("_T", bound=Hashable)
+
+_AlgodHTTPError: Final[type[error.AlgodHTTPError]] = error.AlgodHTTPError
+_READONLY_METHODS: Final[list[frozenset[str]]] = []
+_METHODS: Final[dict[str, abi.Method]] = {}
+
+
+def readonly_methods() -> frozenset[str]:
+    """Names of the read-only methods, from the App Spec"""
+    if not _READONLY_METHODS:
+        _READONLY_METHODS.append(
+            frozenset(method.name for method in app_spec().methods if method.readonly)
+        )
+    return _READONLY_METHODS[0]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AsyncSendResult:
+    txid: str
+    # Pending transaction info, or the simulated transaction result (read-only calls)
+    confirmation: dict[str, object]
+    abi_return: object
+
+
+def _method(method_signature: str) -> abi.Method:
+    if method_signature not in _METHODS:
+        _METHODS[method_signature] = abi.Method.from_signature(method_signature)
+    return _METHODS[method_signature]
+
+
+def _merge(references: list[_T] | None, derived: list[_T]) -> list[_T]:
+    """`references` followed by the `derived` ones, without duplicates"""
+    merged: list[_T] = []
+    for reference in [*(references or []), *derived]:
+        if reference not in merged:
+            merged.append(reference)
+    return merged
+
+
+def _references(args: AbiArgs, app_id: int) -> tuple[list[str], list[int]]:
+    """Accounts and assets referenced by the `address` and asset ID arguments"""
+    method = _method(args.abi_method_signature)
+    app_address = get_application_address(app_id)
+    accounts: list[str] = []
+    assets: list[int] = []
+    fields: tuple[dataclasses.Field[object], ...] = dataclasses.fields(
+        cast(type, type(args))
+    )
+    for field, arg in zip(fields, method.args, strict=True):
+        value = cast(object, getattr(args, field.name))
+        if isinstance(arg.type, abi.AddressType):
+            if value != app_address and value not in accounts:
+                accounts.append(cast(str, value))
+        elif field.name == "asset" or field.name.endswith("_asset"):
+            if value not in assets:
+                assets.append(cast(int, value))
+    return accounts, assets
+
+
+class AsyncSmartAsaParams:
+    def __init__(self, client: AsyncSmartAsaClient) -> None:
+        self.client = client
+
+    def call(
+        self, args: AbiArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        """App call params of a NoOp method call (typed client `*Args`)"""
+        params = params or CommonAppCallParams()
+        accounts, assets = _references(args, self.client.app_id)
+        return app_call_params(
+            self.client.app_id,
+            args,
+            dataclasses.replace(
+                params,
+                sender=params.sender or self.client.default_sender,
+                signer=params.signer or self.client.default_signer,
+                note=params.note or self.client.notes.next(),
+                account_references=_merge(params.account_references, accounts),
+                asset_references=_merge(params.asset_references, assets),
+            ),
+        )
+
+    def asset_create(
+        self, args: AssetCreateArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def asset_config(
+        self, args: AssetConfigArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def asset_transfer(
+        self, args: AssetTransferArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def asset_transfer_batch(
+        self, args: AssetTransferBatchArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def asset_transfer_with_proof(
+        self,
+        args: AssetTransferWithProofArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def asset_freeze(
+        self, args: AssetFreezeArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def account_freeze(
+        self, args: AccountFreezeArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def set_transfer_allowlist(
+        self, args: SetTransferAllowlistArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def asset_destroy(
+        self, args: AssetDestroyArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def get_asset_config(
+        self, args: GetAssetConfigArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def get_asset_is_frozen(
+        self, args: GetAssetIsFrozenArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def get_account_is_frozen(
+        self, args: GetAccountIsFrozenArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def get_circulating_supply(
+        self, args: GetCirculatingSupplyArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+
+class AsyncSmartAsaCreateTransactionParams:
+    def __init__(self, client: AsyncSmartAsaClient) -> None:
+        self.client = client
+
+    async def call(
+        self, args: AbiArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        """
+        Unsigned app call of a NoOp method call (typed client `*Args`), paying the
+        inner transactions fees unless `params` sets a static or extra fee.
+        """
+        sp = await self.client.suggested_params.get_async(self.client.algod)
+        return build_transaction(
+            self.client.params.call(args, with_fee(params, sp, args)), sp
+        )
+
+    async def asset_create(
+        self, args: AssetCreateArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def asset_config(
+        self, args: AssetConfigArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def asset_transfer(
+        self, args: AssetTransferArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def asset_transfer_batch(
+        self, args: AssetTransferBatchArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def asset_transfer_with_proof(
+        self,
+        args: AssetTransferWithProofArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def asset_freeze(
+        self, args: AssetFreezeArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def account_freeze(
+        self, args: AccountFreezeArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def set_transfer_allowlist(
+        self, args: SetTransferAllowlistArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def asset_destroy(
+        self, args: AssetDestroyArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def get_asset_config(
+        self, args: GetAssetConfigArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def get_asset_is_frozen(
+        self, args: GetAssetIsFrozenArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def get_account_is_frozen(
+        self, args: GetAccountIsFrozenArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def get_circulating_supply(
+        self, args: GetCirculatingSupplyArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+
+class AsyncSmartAsaSend:
+    def __init__(self, client: AsyncSmartAsaClient) -> None:
+        self.client = client
+
+    async def call(
+        self,
+        args: AbiArgs,
+        params: CommonAppCallParams | None = None,
+        *,
+        wait_rounds: int = DEFAULT_WAIT_ROUNDS,
+    ) -> AsyncSendResult:
+        """
+        Sends a NoOp method call (typed client `*Args`): read-only methods are
+        simulated (like the typed client does), the others signed with
+        `params.signer` (or the default signer), submitted and confirmed.
+        """
+        txn = await self.client.create_transaction.call(args, params)
+        if _method(args.abi_method_signature).name in readonly_methods():
+            return await self._simulate(args, txn)
+        signer = params.signer if params and params.signer else None
+        signer = signer or self.client.default_signer
+        if signer is None:
+            raise ValueError("Sending app calls requires params.signer")
+        signed = signer.sign_transactions([txn], [0])
+        txid = await self.client.algod.send_transactions(signed)
+        confirmation = await self.client.algod.wait_for_confirmation(txid, wait_rounds)
+        return AsyncSendResult(
+            txid=txid,
+            confirmation=confirmation,
+            abi_return=_abi_return(args, cast(list[str], confirmation.get("logs", []))),
+        )
+
+    async def _simulate(
+        self, args: AbiArgs, txn: transaction.ApplicationCallTxn
+    ) -> AsyncSendResult:
+        request = SimulateRequest(
+            txn_groups=[
+                SimulateRequestTransactionGroup(
+                    txns=[transaction.SignedTransaction(txn, None)]
+                )
+            ],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+        )
+        response = await self.client.algod.simulate_transactions(request)
+        (group,) = cast(list[dict[str, object]], response["txn-groups"])
+        if "failure-message" in group:
+            raise SimulateError(str(group["failure-message"]))
+        (txn_result,) = cast(list[dict[str, dict[str, object]]], group["txn-results"])
+        confirmation = txn_result["txn-result"]
+        return AsyncSendResult(
+            txid=cast(str, txn.get_txid()),
+            confirmation=confirmation,
+            abi_return=_abi_return(args, cast(list[str], confirmation.get("logs", []))),
+        )
+
+    async def asset_create(
+        self, args: AssetCreateArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def asset_config(
+        self, args: AssetConfigArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def asset_transfer(
+        self, args: AssetTransferArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def asset_transfer_batch(
+        self, args: AssetTransferBatchArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def asset_transfer_with_proof(
+        self,
+        args: AssetTransferWithProofArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def asset_freeze(
+        self, args: AssetFreezeArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def account_freeze(
+        self, args: AccountFreezeArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def set_transfer_allowlist(
+        self, args: SetTransferAllowlistArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def asset_destroy(
+        self, args: AssetDestroyArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def get_asset_config(
+        self, args: GetAssetConfigArgs, params: CommonAppCallParams | None = None
+    ) -> AssetConfig:
+        return cast("AssetConfig", (await self.call(args, params)).abi_return)
+
+    async def get_asset_is_frozen(
+        self, args: GetAssetIsFrozenArgs, params: CommonAppCallParams | None = None
+    ) -> bool:
+        return cast(bool, (await self.call(args, params)).abi_return)
+
+    async def get_account_is_frozen(
+        self, args: GetAccountIsFrozenArgs, params: CommonAppCallParams | None = None
+    ) -> bool:
+        return cast(bool, (await self.call(args, params)).abi_return)
+
+    async def get_circulating_supply(
+        self, args: GetCirculatingSupplyArgs, params: CommonAppCallParams | None = None
+    ) -> int:
+        return cast(int, (await self.call(args, params)).abi_return)
+
+
+def _abi_return(args: AbiArgs, logs: list[str]) -> object:
+    signature = args.abi_method_signature
+    if _method(signature).returns.type == abi.Returns.VOID:
+        return None
+    abi_return = base64.b64decode(logs[-1]) if logs else b""
+    if not abi_return.startswith(RETURN_PREFIX):
+        raise ValueError(f"No ABI return in {args}")
+    return return_decoder(signature)(abi_return[len(RETURN_PREFIX) :])
+
+
+class AsyncSmartAsaState:
+    def __init__(self, client: AsyncSmartAsaClient) -> None:
+        self.client = client
+
+    async def global_state(self) -> SmartAsaGlobalState:
+        """The whole global state, fetched with a single algod request"""
+        app_info = await self.client.algod.application_info(self.client.app_id)
+        params = cast(dict[str, object], app_info["params"])
+        return decode_global_state(
+            cast(list[dict[str, object]], params.get("global-state", []))
+        )
+
+    async def local_state(self, address: str) -> HolderRecord:
+        """The local state of `address` (`None` fields if not opted in)"""
+        try:
+            account_app = await self.client.algod.account_application_info(
+                address, self.client.app_id
+            )
+        except _AlgodHTTPError as e:
+            if cast(int | None, e.code) == httpx.codes.NOT_FOUND:
+                return HolderRecord(address, None, None)
+            raise
+        return decode_local_state(
+            address, cast(dict[str, object] | None, account_app.get("app-local-state"))
+        )
+
+
+class AsyncSmartAsaClient:
+    """Async counterpart of the typed `SmartAsaClient` accessors, for an `app_id`"""
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        app_id: int,
+        *,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        params_cache: SuggestedParamsCache | None = None,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        self.suggested_params = params_cache or SuggestedParamsCache()
+        self.notes = CallNotes()
+        self.params = AsyncSmartAsaParams(self)
+        self.create_transaction = AsyncSmartAsaCreateTransactionParams(self)
+        self.send = AsyncSmartAsaSend(self)
+        self.state = AsyncSmartAsaState(self)
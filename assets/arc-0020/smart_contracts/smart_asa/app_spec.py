@@ -0,0 +1,50 @@
+"""
+SmartAsa App Spec for the helpers, parsed from the build artifact on first use.
+
+The state readers and the async client only need the App Spec state keys and method
+signatures: they load it with `app_spec()` when first needed instead of importing the
+typed client, which parses its embedded App Spec at import.
+
+`app_client` is the light client import path: a generic AlgoKit `AppClient` for a
+deployed SmartAsa, with the App Spec parsed on the first call instead of at import.
+It calls the methods by name (`client.send.call(AppClientMethodCallParams(...))`),
+without the typed client arguments and results:
+
+    from smart_contracts.smart_asa.app_spec import app_client
+    client = app_client(algorand, app_id, default_sender=address)
+"""
+
+from pathlib import Path
+from typing import Final
+
+from algokit_utils import AlgorandClient, AppClient, AppClientParams, Arc56Contract
+from algosdk.atomic_transaction_composer import TransactionSigner
+from arc_common.app_spec import load_app_spec
+
+APP_SPEC_PATH: Final[Path] = (
+    Path(__file__).parents[1] / "artifacts" / "smart_asa" / "SmartAsa.arc56.json"
+)
+
+
+def app_spec() -> Arc56Contract:
+    """The SmartAsa App Spec, parsed once"""
+    return load_app_spec(APP_SPEC_PATH)
+
+
+def app_client(
+    algorand: AlgorandClient,
+    app_id: int,
+    *,
+    default_sender: str | None = None,
+    default_signer: TransactionSigner | None = None,
+) -> AppClient:
+    """A generic client of the SmartAsa app `app_id`, from the parsed App Spec"""
+    return AppClient(
+        AppClientParams(
+            app_spec=app_spec(),
+            algorand=algorand,
+            app_id=app_id,
+            default_sender=default_sender,
+            default_signer=default_signer,
+        )
+    )
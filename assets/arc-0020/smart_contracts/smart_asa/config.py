@@ -1,7 +1,7 @@
 from typing import Final
 
 # State Schema
-GLOBAL_BYTES: Final[int] = 8
+GLOBAL_BYTES: Final[int] = 9
 GLOBAL_UINTS: Final[int] = 5
 LOCAL_BYTES: Final[int] = 0
 LOCAL_UINTS: Final[int] = 2
@@ -13,3 +13,10 @@ DEFAULT_FROZEN: Final[bool] = True
 UNIT_NAME: Final[str] = "ARC-20"
 NAME: Final[str] = "ARC-20 Smart ASA"
 APP_BINDING: Final[bytes] = b"algorand://app/"
+
+# Batched Transfers
+MAX_BATCH_LEGS: Final[int] = 16  # Max inner transaction group size
+
+# Transfer Allowlist (Merkle Tree)
+MERKLE_LEAF_PREFIX: Final[bytes] = b"\x00"
+MERKLE_NODE_PREFIX: Final[bytes] = b"\x01"
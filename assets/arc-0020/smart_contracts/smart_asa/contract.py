@@ -1,7 +1,10 @@
+import abc
+
 from algopy import (
     Account,
     ARC4Contract,
     Asset,
+    BigUInt,
     Bytes,
     Global,
     LocalState,
@@ -16,56 +19,141 @@ from algopy import (
     itxn,
     op,
     subroutine,
+    urange,
 )
 
 from smart_contracts import errors as err
-from smart_contracts.avm_types import AssetConfig
+from smart_contracts.avm_types import (
+    AccountFreeze,
+    AssetConfig,
+    AssetFreeze,
+    Burn,
+    Clawback,
+    Hash,
+    MerkleProof,
+    Mint,
+    TransferLeg,
+)
 
 from . import config as cfg
 
 
-class SmartAsa(
-    ARC4Contract,
-    state_totals=StateTotals(
-        global_bytes=cfg.GLOBAL_BYTES,
-        global_uints=cfg.GLOBAL_UINTS,
-        local_bytes=cfg.LOCAL_BYTES,
-        local_uints=cfg.LOCAL_UINTS,
-    ),
-):
+class SmartAsaBase(ARC4Contract):
     """
-    ARC-0020 (Smart ASA) - Reference Implementation
+    ARC-0020 (Smart ASA) - Reference Implementation, storage layout agnostic
+
+    The Smart ASA methods read and write the ASA fields, the Smart ASA fields and the
+    holdings through storage accessors keyed by Controlled ASA ID, implemented by each
+    storage layout.
     """
 
-    def __init__(self) -> None:
-        # Preconditions
-        assert Txn.global_num_byte_slice == cfg.GLOBAL_BYTES, err.WRONG_GLOBAL_BYTES
-        assert Txn.global_num_uint == cfg.GLOBAL_UINTS, err.WRONG_GLOBAL_UINTS
-        assert Txn.local_num_byte_slice == cfg.LOCAL_BYTES, err.WRONG_LOCAL_BYTES
-        assert Txn.local_num_uint == cfg.LOCAL_UINTS, err.WRONG_LOCAL_UINTS
+    # Implicitly abstract (abstract storage accessors): an `abc.ABC` base conflicts
+    # with the Algorand Python testing framework contract metaclass.
 
-        # GLOBAL STATE
-        # ASA Fields
-        self.total = UInt64()
-        self.decimals = UInt64()
-        self.default_frozen = False
-        self.unit_name = String()
-        self.name = String()
-        self.url = String()
-        self.metadata_hash = Bytes()
-        self.manager_addr = Account()
-        self.reserve_addr = Account()
-        self.freeze_addr = Account()
-        self.clawback_addr = Account()
-        # Smart ASA Fields
-        self.smart_asa_id = UInt64()
-        self.global_frozen = False
+    # STORAGE ACCESSORS
+    # Controlled ASA
+    @subroutine
+    @abc.abstractmethod
+    def assert_common_preconditions(self, asset_id: UInt64) -> None: ...
 
-        # LOCAL STATE
-        # Smart ASA Fields
-        self.account_smart_asa_id = LocalState(UInt64)
-        self.account_frozen = LocalState(bool)
+    @subroutine
+    @abc.abstractmethod
+    def assert_create_preconditions(self) -> None: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def create_ctrl_asset(
+        self, asset_id: UInt64, asset_config: AssetConfig
+    ) -> None: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def delete_ctrl_asset(self, asset_id: UInt64) -> None: ...
+
+    # ASA Fields
+    @subroutine
+    @abc.abstractmethod
+    def config_total(self, asset_id: UInt64) -> UInt64: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def config_default_frozen(self, asset_id: UInt64) -> bool: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def config_manager_addr(self, asset_id: UInt64) -> Account: ...
 
+    @subroutine
+    @abc.abstractmethod
+    def config_reserve_addr(self, asset_id: UInt64) -> Account: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def config_freeze_addr(self, asset_id: UInt64) -> Account: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def config_clawback_addr(self, asset_id: UInt64) -> Account: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def load_asset_config(self, asset_id: UInt64) -> AssetConfig: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def store_asset_config(
+        self, asset_id: UInt64, asset_config: AssetConfig
+    ) -> None: ...
+
+    # Smart ASA Fields
+    @subroutine
+    @abc.abstractmethod
+    def is_global_frozen(self, asset_id: UInt64) -> bool: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def store_global_frozen(self, asset_id: UInt64, *, asset_frozen: bool) -> None: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def has_allowlist(self, asset_id: UInt64) -> bool: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def load_allowlist_root(self, asset_id: UInt64) -> Bytes: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def store_allowlist_root(
+        self, asset_id: UInt64, allowlist_root: Bytes
+    ) -> None: ...  # A zero hash root disables the allowlist
+
+    # Holdings
+    @subroutine
+    @abc.abstractmethod
+    def is_holder(self, asset_id: UInt64, account: Account) -> bool: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def is_account_frozen(self, asset_id: UInt64, account: Account) -> bool: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def store_account_frozen(
+        self, asset_id: UInt64, account: Account, *, asset_frozen: bool
+    ) -> None: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def create_holding(
+        self, asset_id: UInt64, account: Account, *, asset_frozen: bool
+    ) -> None: ...
+
+    @subroutine
+    @abc.abstractmethod
+    def delete_holding(self, asset_id: UInt64, account: Account) -> None: ...
+
+    # SUBROUTINES
     @subroutine
     def itoa(self, n: UInt64) -> Bytes:
         digits = Bytes(b"0123456789")
@@ -79,81 +167,146 @@ class SmartAsa(
     def circulating_supply(self, ctrl_asset: Asset) -> UInt64:
         return cfg.TOTAL - ctrl_asset.balance(Global.current_application_address)
 
-    @subroutine
-    def assert_common_preconditions(self, asset_id: UInt64) -> None:
-        assert self.smart_asa_id, err.MISSING_CTRL_ASA
-        assert self.smart_asa_id == asset_id, err.INVALID_CTRL_ASA
-
     @subroutine
     def assert_minting_preconditions(
-        self, *, asset_receiver: Account, asset_amount: UInt64
+        self, *, asset_id: UInt64, asset_receiver: Account, asset_amount: UInt64
     ) -> None:
         # Mint permission restricted to Reserve.
-        assert Txn.sender == self.reserve_addr, err.UNAUTHORIZED_RESERVE
+        reserve_addr = self.config_reserve_addr(asset_id)
+        assert Txn.sender == reserve_addr, err.UNAUTHORIZED_RESERVE
         # Forbidden self-mint (to Creator) and over-mint (> total).
         assert asset_receiver != Global.current_application_address, err.SELF_MINT
-        assert (
-            asset_amount + self.circulating_supply(Asset(self.smart_asa_id))
-            <= self.total
-        ), err.OVER_MINT
+        assert asset_amount + self.circulating_supply(
+            Asset(asset_id)
+        ) <= self.config_total(asset_id), err.OVER_MINT
         # In the case of Controlled ASA destroyed and re-created, the Smart ADA ID in Local State could be outdated.
-        assert (
-            self.account_smart_asa_id[asset_receiver] == self.smart_asa_id
-        ), err.INVALID_CTRL_ASA
-        assert not self.global_frozen, err.GLOBAL_FROZEN
-        if self.reserve_addr != self.clawback_addr:
-            assert not self.account_frozen[asset_receiver], err.RECEIVER_FROZEN
+        assert self.is_holder(asset_id, asset_receiver), err.INVALID_CTRL_ASA
+        assert not self.is_global_frozen(asset_id), err.GLOBAL_FROZEN
+        if reserve_addr != self.config_clawback_addr(asset_id):
+            assert not self.is_account_frozen(
+                asset_id, asset_receiver
+            ), err.RECEIVER_FROZEN
 
     @subroutine
-    def assert_burning_preconditions(self, *, asset_sender: Account) -> None:
+    def assert_burning_preconditions(
+        self, *, asset_id: UInt64, asset_sender: Account
+    ) -> None:
         # Burn permission restricted to Reserve.
-        assert Txn.sender == self.reserve_addr, err.UNAUTHORIZED_RESERVE
+        reserve_addr = self.config_reserve_addr(asset_id)
+        assert Txn.sender == reserve_addr, err.UNAUTHORIZED_RESERVE
         # In case of Controlled ASA destroyed and re-created the Smart ADA ID in Local State could be outdated.
-        assert (
-            self.account_smart_asa_id[asset_sender] == self.smart_asa_id
-        ), err.INVALID_CTRL_ASA
-        assert not self.global_frozen, err.GLOBAL_FROZEN
-        if self.reserve_addr != self.clawback_addr:
-            assert not self.account_frozen[asset_sender], err.SENDER_FROZEN
+        assert self.is_holder(asset_id, asset_sender), err.INVALID_CTRL_ASA
+        assert not self.is_global_frozen(asset_id), err.GLOBAL_FROZEN
+        if reserve_addr != self.config_clawback_addr(asset_id):
+            assert not self.is_account_frozen(asset_id, asset_sender), err.SENDER_FROZEN
             # Forbidden clawback through burning (burned amount not from Reserve).
-            assert asset_sender == self.reserve_addr, err.CLAWBACK_BURN
+            assert asset_sender == reserve_addr, err.CLAWBACK_BURN
 
     @subroutine
     def assert_clawback_preconditions(
-        self, *, asset_sender: Account, asset_receiver: Account
+        self, *, asset_id: UInt64, asset_sender: Account, asset_receiver: Account
     ) -> None:
         # In the case of Controlled ASA destroyed and re-created, the Smart ADA ID in Local State could be outdated.
-        assert (
-            self.account_smart_asa_id[asset_sender] == self.smart_asa_id
-        ), err.INVALID_CTRL_ASA
-        assert (
-            self.account_smart_asa_id[asset_receiver] == self.smart_asa_id
-        ), err.INVALID_CTRL_ASA
+        assert self.is_holder(asset_id, asset_sender), err.INVALID_CTRL_ASA
+        assert self.is_holder(asset_id, asset_receiver), err.INVALID_CTRL_ASA
 
     @subroutine
     def assert_regular_transfer_preconditions(
-        self, *, asset_sender: Account, asset_receiver: Account
+        self, *, asset_id: UInt64, asset_sender: Account, asset_receiver: Account
     ) -> None:
         assert Txn.sender == asset_sender, err.UNAUTHORIZED_CLAWBACK
         # In the case of Controlled ASA destroyed and re-created, the Smart ADA ID in Local State could be outdated.
-        assert (
-            self.account_smart_asa_id[asset_sender] == self.smart_asa_id
-        ), err.INVALID_CTRL_ASA
-        assert (
-            self.account_smart_asa_id[asset_receiver] == self.smart_asa_id
-        ), err.INVALID_CTRL_ASA
-        assert not self.global_frozen, err.GLOBAL_FROZEN
-        assert not self.account_frozen[asset_sender], err.SENDER_FROZEN
-        assert not self.account_frozen[asset_receiver], err.RECEIVER_FROZEN
+        assert self.is_holder(asset_id, asset_sender), err.INVALID_CTRL_ASA
+        assert self.is_holder(asset_id, asset_receiver), err.INVALID_CTRL_ASA
+        assert not self.is_global_frozen(asset_id), err.GLOBAL_FROZEN
+        assert not self.is_account_frozen(asset_id, asset_sender), err.SENDER_FROZEN
+        assert not self.is_account_frozen(asset_id, asset_receiver), err.RECEIVER_FROZEN
+
+    @subroutine
+    def assert_transfer_preconditions(
+        self,
+        *,
+        asset_id: UInt64,
+        asset_sender: Account,
+        asset_receiver: Account,
+        asset_amount: UInt64
+    ) -> None:
+        if asset_sender == Global.current_application_address:
+            self.assert_minting_preconditions(
+                asset_id=asset_id,
+                asset_receiver=asset_receiver,
+                asset_amount=asset_amount,
+            )
+        elif asset_receiver == Global.current_application_address:
+            self.assert_burning_preconditions(
+                asset_id=asset_id, asset_sender=asset_sender
+            )
+        elif Txn.sender == self.config_clawback_addr(asset_id):
+            self.assert_clawback_preconditions(
+                asset_id=asset_id,
+                asset_sender=asset_sender,
+                asset_receiver=asset_receiver,
+            )
+        else:
+            assert not self.has_allowlist(asset_id), err.MISSING_ALLOWLIST_PROOF
+            self.assert_regular_transfer_preconditions(
+                asset_id=asset_id,
+                asset_sender=asset_sender,
+                asset_receiver=asset_receiver,
+            )
+
+    @subroutine
+    def emit_transfer_event(
+        self,
+        *,
+        asset_id: UInt64,
+        asset_sender: Account,
+        asset_receiver: Account,
+        asset_amount: UInt64
+    ) -> None:
+        # Regular transfers are not logged, supply and clawback changes are.
+        if asset_sender == Global.current_application_address:
+            arc4.emit(
+                Mint(
+                    asset_receiver=arc4.Address(asset_receiver),
+                    asset_amount=arc4.UInt64(asset_amount),
+                )
+            )
+        elif asset_receiver == Global.current_application_address:
+            arc4.emit(
+                Burn(
+                    asset_sender=arc4.Address(asset_sender),
+                    asset_amount=arc4.UInt64(asset_amount),
+                )
+            )
+        elif Txn.sender == self.config_clawback_addr(asset_id):
+            arc4.emit(
+                Clawback(
+                    asset_sender=arc4.Address(asset_sender),
+                    asset_receiver=arc4.Address(asset_receiver),
+                    asset_amount=arc4.UInt64(asset_amount),
+                )
+            )
+
+    @subroutine
+    def is_allowlisted(
+        self, asset_id: UInt64, account: Account, proof: MerkleProof
+    ) -> bool:
+        node = op.sha256(cfg.MERKLE_LEAF_PREFIX + account.bytes)
+        for i in urange(proof.length):
+            sibling = proof[i].bytes
+            # Sorted pair hashing: proofs need no left/right path bits.
+            if BigUInt.from_bytes(node) < BigUInt.from_bytes(sibling):
+                node = op.sha256(cfg.MERKLE_NODE_PREFIX + node + sibling)
+            else:
+                node = op.sha256(cfg.MERKLE_NODE_PREFIX + sibling + node)
+        return node == self.load_allowlist_root(asset_id)
 
     @subroutine
     def assert_close_out_preconditions(self, close_asset: Asset) -> None:
         asa_close_out_relative_idx = Txn.group_index + 1
         asa_close_out_txn = gtxn.AssetTransferTransaction(asa_close_out_relative_idx)
-        assert Txn.on_completion == OnCompleteAction.CloseOut, err.WRONG_ON_COMPLETE
-        assert (
-            self.account_smart_asa_id[Txn.sender] == close_asset.id
-        ), err.INVALID_CTRL_ASA
+        assert self.is_holder(close_asset.id, Txn.sender), err.INVALID_CTRL_ASA
         assert (
             Global.group_size > asa_close_out_relative_idx
         ), err.INVALID_CLOSE_OUT_GROUP_SIZE
@@ -178,13 +331,17 @@ class SmartAsa(
         assert (
             asa_close_out_txn.asset_close_to == asset_creator
         ), err.CLOSE_OUT_WRONG_CLOSE_TO
-        assert close_asset.id == self.smart_asa_id, err.INVALID_CTRL_ASA
+        self.assert_common_preconditions(close_asset.id)
 
     @subroutine
-    def assert_close_out_not_to_creator(self, close_to: Account) -> None:
-        assert not self.global_frozen, err.GLOBAL_FROZEN
-        assert not self.account_frozen[Txn.sender], err.SENDER_FROZEN
-        assert not self.account_frozen[close_to], err.CLOSE_TO_FROZEN
+    def assert_close_out_not_to_creator(
+        self, close_asset: Asset, close_to: Account
+    ) -> None:
+        # A close out carries no allowlist proofs, the remainder returns to the Creator.
+        assert not self.has_allowlist(close_asset.id), err.ALLOWLIST_CLOSE_OUT
+        assert not self.is_global_frozen(close_asset.id), err.GLOBAL_FROZEN
+        assert not self.is_account_frozen(close_asset.id, Txn.sender), err.SENDER_FROZEN
+        assert not self.is_account_frozen(close_asset.id, close_to), err.CLOSE_TO_FROZEN
 
     @subroutine
     def inner_asset_config(self) -> UInt64:
@@ -268,40 +425,38 @@ class SmartAsa(
         """
         # Preconditions
         assert Txn.sender == Global.creator_address, err.UNAUTHORIZED
-        assert not self.smart_asa_id, err.EXISTING_CTRL_ASA
+        self.assert_create_preconditions()
 
         # Effects
-        self.smart_asa_id = self.inner_asset_config()
-        self.total = total.native
-        self.decimals = decimals.native
-        self.default_frozen = default_frozen.native
-        self.unit_name = unit_name.native
-        self.name = name.native
-        self.url = url.native
-        self.metadata_hash = metadata_hash.native
-        self.manager_addr = manager_addr.native
-        self.reserve_addr = reserve_addr.native
-        self.freeze_addr = freeze_addr.native
-        self.clawback_addr = clawback_addr.native
-        return arc4.UInt64(self.smart_asa_id)
+        smart_asa_id = self.inner_asset_config()
+        self.create_ctrl_asset(
+            smart_asa_id,
+            AssetConfig(
+                total=total,
+                decimals=decimals,
+                default_frozen=default_frozen,
+                unit_name=unit_name,
+                name=name,
+                url=url,
+                metadata_hash=metadata_hash,
+                manager_addr=manager_addr,
+                reserve_addr=reserve_addr,
+                freeze_addr=freeze_addr,
+                clawback_addr=clawback_addr,
+            ),
+        )
+        return arc4.UInt64(smart_asa_id)
 
-    @arc4.abimethod(allow_actions=["OptIn"])
-    def asset_opt_in(
+    @subroutine
+    def opt_in(
         self, asset: Asset, ctrl_asa_opt_in: gtxn.AssetTransferTransaction
     ) -> None:
-        """
-        Smart ASA opt in (App and Controlled ASA)
-
-        Args:
-            asset: Smart ASA ID
-            ctrl_asa_opt_in: Controlled ASA opt in transaction
-        """
         # Preconditions
         self.assert_common_preconditions(asset.id)
         assert (
             ctrl_asa_opt_in.type == TransactionType.AssetTransfer
         ), err.OPT_IN_WRONG_TYPE  # Pedant
-        assert ctrl_asa_opt_in.xfer_asset.id == self.smart_asa_id, err.OPT_IN_WRONG_ASA
+        assert ctrl_asa_opt_in.xfer_asset.id == asset.id, err.OPT_IN_WRONG_ASA
         assert ctrl_asa_opt_in.sender == Txn.sender, err.OPT_IN_WRONG_SENDER
         assert ctrl_asa_opt_in.asset_receiver == Txn.sender, err.OPT_IN_WRONG_RECEIVER
         assert (
@@ -310,20 +465,32 @@ class SmartAsa(
         assert (
             ctrl_asa_opt_in.asset_close_to == Global.zero_address
         ), err.OPT_IN_WRONG_CLOSE_TO
-        assert Txn.on_completion == OnCompleteAction.OptIn, err.WRONG_ON_COMPLETE
         assert Txn.sender.is_opted_in(
             asset
         ), err.MISSING_CTRL_ASA  # Pedant: ctrl_asa_opt_in is checked properly
 
-        # Local State Init
-        self.account_smart_asa_id[Txn.sender] = self.smart_asa_id
-        self.account_frozen[Txn.sender] = False
-
         # Effects
-        if (
-            self.default_frozen or asset.balance(Txn.sender) > 0
-        ):  # Prevent close-out circumventing account frozen state
-            self.account_frozen[Txn.sender] = True
+        self.create_holding(
+            asset.id,
+            Txn.sender,
+            # Prevent close-out circumventing account frozen state
+            asset_frozen=self.config_default_frozen(asset.id)
+            or asset.balance(Txn.sender) > 0,
+        )
+
+    @arc4.abimethod(allow_actions=["OptIn"])
+    def asset_opt_in(
+        self, asset: Asset, ctrl_asa_opt_in: gtxn.AssetTransferTransaction
+    ) -> None:
+        """
+        Smart ASA opt in (App and Controlled ASA)
+
+        Args:
+            asset: Smart ASA ID
+            ctrl_asa_opt_in: Controlled ASA opt in transaction
+        """
+        assert Txn.on_completion == OnCompleteAction.OptIn, err.WRONG_ON_COMPLETE
+        self.opt_in(asset, ctrl_asa_opt_in)
 
     @arc4.abimethod
     def asset_config(
@@ -359,28 +526,38 @@ class SmartAsa(
             clawback_addr: Account that can clawback holdings of the Smart ASA
         """
         # Preconditions
-        self.assert_common_preconditions(config_asset.id)
-        assert Txn.sender == self.manager_addr, err.UNAUTHORIZED_MANAGER
-        if reserve_addr != self.reserve_addr:
-            assert self.reserve_addr != Global.zero_address, err.DISABLED_RESERVE
-        if freeze_addr != self.freeze_addr:
-            assert self.freeze_addr != Global.zero_address, err.DISABLED_FREEZE
-        if clawback_addr != self.clawback_addr:
-            assert self.clawback_addr != Global.zero_address, err.DISABLED_CLAWBACK
+        asset_id = config_asset.id
+        self.assert_common_preconditions(asset_id)
+        assert Txn.sender == self.config_manager_addr(
+            asset_id
+        ), err.UNAUTHORIZED_MANAGER
+        current_reserve_addr = self.config_reserve_addr(asset_id)
+        if reserve_addr != current_reserve_addr:
+            assert current_reserve_addr != Global.zero_address, err.DISABLED_RESERVE
+        current_freeze_addr = self.config_freeze_addr(asset_id)
+        if freeze_addr != current_freeze_addr:
+            assert current_freeze_addr != Global.zero_address, err.DISABLED_FREEZE
+        current_clawback_addr = self.config_clawback_addr(asset_id)
+        if clawback_addr != current_clawback_addr:
+            assert current_clawback_addr != Global.zero_address, err.DISABLED_CLAWBACK
         assert total >= self.circulating_supply(config_asset), err.INVALID_TOTAL
 
         # Effects
-        self.total = total.native
-        self.decimals = decimals.native
-        self.default_frozen = default_frozen.native
-        self.unit_name = unit_name.native
-        self.name = name.native
-        self.url = url.native
-        self.metadata_hash = metadata_hash.native
-        self.manager_addr = manager_addr.native
-        self.reserve_addr = reserve_addr.native
-        self.freeze_addr = freeze_addr.native
-        self.clawback_addr = clawback_addr.native
+        asset_config = AssetConfig(
+            total=total,
+            decimals=decimals,
+            default_frozen=default_frozen,
+            unit_name=unit_name,
+            name=name,
+            url=url,
+            metadata_hash=metadata_hash.copy(),
+            manager_addr=manager_addr,
+            reserve_addr=reserve_addr,
+            freeze_addr=freeze_addr,
+            clawback_addr=clawback_addr,
+        )
+        self.store_asset_config(asset_id, asset_config)
+        arc4.emit(asset_config)
 
     @arc4.abimethod
     def asset_transfer(
@@ -401,20 +578,120 @@ class SmartAsa(
         """
         # Preconditions
         self.assert_common_preconditions(xfer_asset.id)
-        if asset_sender == Global.current_application_address:
-            self.assert_minting_preconditions(
-                asset_receiver=asset_receiver, asset_amount=asset_amount.native
-            )
-        elif asset_receiver == Global.current_application_address:
-            self.assert_burning_preconditions(asset_sender=asset_sender)
-        elif Txn.sender == self.clawback_addr:
-            self.assert_clawback_preconditions(
-                asset_sender=asset_sender, asset_receiver=asset_receiver
-            )
-        else:
-            self.assert_regular_transfer_preconditions(
-                asset_sender=asset_sender, asset_receiver=asset_receiver
+        self.assert_transfer_preconditions(
+            asset_id=xfer_asset.id,
+            asset_sender=asset_sender,
+            asset_receiver=asset_receiver,
+            asset_amount=asset_amount.native,
+        )
+
+        # Effects
+        self.inner_asset_transfer(
+            xfer_asset=xfer_asset,
+            asset_amount=asset_amount.native,
+            asset_sender=asset_sender,
+            asset_receiver=asset_receiver,
+        )
+        self.emit_transfer_event(
+            asset_id=xfer_asset.id,
+            asset_sender=asset_sender,
+            asset_receiver=asset_receiver,
+            asset_amount=asset_amount.native,
+        )
+
+    @arc4.abimethod
+    def asset_transfer_batch(
+        self, xfer_asset: Asset, legs: arc4.DynamicArray[TransferLeg]
+    ) -> None:
+        """
+        Smart ASA batched transfers: each leg is a regular, clawback, mint or burn transfer
+
+        Args:
+            xfer_asset: Smart ASA ID to transfer
+            legs: Transfer legs (sender, receiver, amount), submitted as a single inner transaction group
+        """
+        # Preconditions
+        self.assert_common_preconditions(xfer_asset.id)
+        assert legs.length, err.EMPTY_BATCH
+        assert legs.length <= cfg.MAX_BATCH_LEGS, err.OVERSIZED_BATCH
+
+        # Effects
+        minted = UInt64(0)
+        for idx in urange(legs.length):
+            leg = legs[idx].copy()
+            asset_sender = leg.asset_sender.native
+            asset_receiver = leg.asset_receiver.native
+            asset_amount = leg.asset_amount.native
+            if asset_sender == Global.current_application_address:
+                # Inner transfers are submitted after the loop, so over-minting is checked against the batch total.
+                minted += asset_amount
+                self.assert_transfer_preconditions(
+                    asset_id=xfer_asset.id,
+                    asset_sender=asset_sender,
+                    asset_receiver=asset_receiver,
+                    asset_amount=minted,
+                )
+            else:
+                self.assert_transfer_preconditions(
+                    asset_id=xfer_asset.id,
+                    asset_sender=asset_sender,
+                    asset_receiver=asset_receiver,
+                    asset_amount=asset_amount,
+                )
+
+            if idx:
+                op.ITxnCreate.next()
+            else:
+                op.ITxnCreate.begin()
+            op.ITxnCreate.set_type_enum(TransactionType.AssetTransfer)
+            op.ITxnCreate.set_fee(0)
+            op.ITxnCreate.set_xfer_asset(xfer_asset)
+            op.ITxnCreate.set_asset_amount(asset_amount)
+            op.ITxnCreate.set_asset_sender(asset_sender)
+            op.ITxnCreate.set_asset_receiver(asset_receiver)
+            self.emit_transfer_event(
+                asset_id=xfer_asset.id,
+                asset_sender=asset_sender,
+                asset_receiver=asset_receiver,
+                asset_amount=asset_amount,
             )
+        op.ITxnCreate.submit()
+
+    @arc4.abimethod
+    def asset_transfer_with_proof(
+        self,
+        xfer_asset: Asset,
+        asset_amount: arc4.UInt64,
+        asset_sender: Account,
+        asset_receiver: Account,
+        sender_proof: MerkleProof,
+        receiver_proof: MerkleProof,
+    ) -> None:
+        """
+        Smart ASA regular transfer between allowlisted accounts
+
+        Args:
+            xfer_asset: Smart ASA ID to transfer
+            asset_amount: Amount to transfer
+            asset_sender: Smart ASA sender
+            asset_receiver: Smart ASA receiver
+            sender_proof: Merkle proof of the sender inclusion in the transfer allowlist
+            receiver_proof: Merkle proof of the receiver inclusion in the transfer allowlist
+        """
+        # Preconditions
+        self.assert_common_preconditions(xfer_asset.id)
+        assert self.has_allowlist(xfer_asset.id), err.MISSING_ALLOWLIST
+        self.assert_regular_transfer_preconditions(
+            asset_id=xfer_asset.id,
+            asset_sender=asset_sender,
+            asset_receiver=asset_receiver,
+        )
+        assert self.is_allowlisted(
+            xfer_asset.id, asset_sender, sender_proof
+        ), err.SENDER_NOT_ALLOWLISTED
+        assert self.is_allowlisted(
+            xfer_asset.id, asset_receiver, receiver_proof
+        ), err.RECEIVER_NOT_ALLOWLISTED
 
         # Effects
         self.inner_asset_transfer(
@@ -435,10 +712,13 @@ class SmartAsa(
         """
         # Preconditions
         self.assert_common_preconditions(freeze_asset.id)
-        assert Txn.sender == self.freeze_addr, err.UNAUTHORIZED_FREEZE
+        assert Txn.sender == self.config_freeze_addr(
+            freeze_asset.id
+        ), err.UNAUTHORIZED_FREEZE
 
         # Effects
-        self.global_frozen = asset_frozen.native
+        self.store_global_frozen(freeze_asset.id, asset_frozen=asset_frozen.native)
+        arc4.emit(AssetFreeze(asset_frozen=asset_frozen))
 
     @arc4.abimethod
     def account_freeze(
@@ -454,23 +734,41 @@ class SmartAsa(
         """
         # Preconditions
         self.assert_common_preconditions(freeze_asset.id)
-        assert (
-            self.account_smart_asa_id[freeze_account] == self.smart_asa_id
-        ), err.INVALID_CTRL_ASA
-        assert Txn.sender == self.freeze_addr, err.UNAUTHORIZED_FREEZE
+        assert self.is_holder(freeze_asset.id, freeze_account), err.INVALID_CTRL_ASA
+        assert Txn.sender == self.config_freeze_addr(
+            freeze_asset.id
+        ), err.UNAUTHORIZED_FREEZE
 
         # Effects
-        self.account_frozen[freeze_account] = asset_frozen.native
+        self.store_account_frozen(
+            freeze_asset.id, freeze_account, asset_frozen=asset_frozen.native
+        )
+        arc4.emit(
+            AccountFreeze(
+                freeze_account=arc4.Address(freeze_account), asset_frozen=asset_frozen
+            )
+        )
 
-    @arc4.abimethod(allow_actions=["CloseOut"])
-    def asset_close_out(self, close_asset: Asset, close_to: Account) -> None:
+    @arc4.abimethod
+    def set_transfer_allowlist(self, freeze_asset: Asset, allowlist_root: Hash) -> None:
         """
-        Smart ASA close out (App and Controlled ASA)
+        Smart ASA transfer allowlist (Merkle root of the accounts allowed to transfer)
 
         Args:
-            close_asset: Smart ASA ID to close out
-            close_to: Account to send all the Smart ASA remainder to.
+            freeze_asset: Smart ASA ID to set the transfer allowlist for
+            allowlist_root: Allowlist Merkle root (zero hash to disable the allowlist)
         """
+        # Preconditions
+        self.assert_common_preconditions(freeze_asset.id)
+        assert Txn.sender == self.config_freeze_addr(
+            freeze_asset.id
+        ), err.UNAUTHORIZED_FREEZE
+
+        # Effects
+        self.store_allowlist_root(freeze_asset.id, allowlist_root.bytes)
+
+    @subroutine
+    def close_out(self, close_asset: Asset, close_to: Account) -> None:
         # Preconditions
         self.assert_close_out_preconditions(close_asset)
         (creator, exists) = op.AssetParamsGet.asset_creator(close_asset.id)
@@ -479,18 +777,38 @@ class SmartAsa(
             if (
                 close_to != creator
             ):  # If close-out target is not the Creator, then close-out target MUST be opted-in
-                assert (
-                    self.account_smart_asa_id[close_to] == self.smart_asa_id
-                ), err.INVALID_CTRL_ASA
-                self.assert_close_out_not_to_creator(close_to)
+                assert self.is_holder(close_asset.id, close_to), err.INVALID_CTRL_ASA
+                self.assert_close_out_not_to_creator(close_asset, close_to)
 
             # Effects
+            asset_amount = close_asset.balance(Txn.sender)
             self.inner_asset_transfer(
                 xfer_asset=close_asset,
-                asset_amount=close_asset.balance(Txn.sender),
+                asset_amount=asset_amount,
                 asset_sender=Txn.sender,
                 asset_receiver=close_to,
             )
+            if close_to == Global.current_application_address:
+                # Remainder closed to the Creator leaves the circulating supply.
+                arc4.emit(
+                    Burn(
+                        asset_sender=arc4.Address(Txn.sender),
+                        asset_amount=arc4.UInt64(asset_amount),
+                    )
+                )
+        self.delete_holding(close_asset.id, Txn.sender)
+
+    @arc4.abimethod(allow_actions=["CloseOut"])
+    def asset_close_out(self, close_asset: Asset, close_to: Account) -> None:
+        """
+        Smart ASA close out (App and Controlled ASA)
+
+        Args:
+            close_asset: Smart ASA ID to close out
+            close_to: Account to send all the Smart ASA remainder to.
+        """
+        assert Txn.on_completion == OnCompleteAction.CloseOut, err.WRONG_ON_COMPLETE
+        self.close_out(close_asset, close_to)
 
     @arc4.abimethod
     def asset_destroy(self, destroy_asset: Asset) -> None:
@@ -502,23 +820,13 @@ class SmartAsa(
         """
         # Preconditions
         self.assert_common_preconditions(destroy_asset.id)
-        assert Txn.sender == self.manager_addr, err.UNAUTHORIZED_MANAGER
+        assert Txn.sender == self.config_manager_addr(
+            destroy_asset.id
+        ), err.UNAUTHORIZED_MANAGER
 
         # Effects
         self.inner_asset_destroy(destroy_asset=destroy_asset)
-        self.total = UInt64()
-        self.decimals = UInt64()
-        self.default_frozen = False
-        self.unit_name = String()
-        self.name = String()
-        self.url = String()
-        self.metadata_hash = Bytes()
-        self.manager_addr = Account()
-        self.reserve_addr = Account()
-        self.freeze_addr = Account()
-        self.clawback_addr = Account()
-        self.smart_asa_id = UInt64()
-        self.global_frozen = False
+        self.delete_ctrl_asset(destroy_asset.id)
 
     @arc4.abimethod(readonly=True)
     def get_asset_config(self, asset: Asset) -> AssetConfig:
@@ -535,19 +843,7 @@ class SmartAsa(
         self.assert_common_preconditions(asset.id)
 
         # Effects
-        return AssetConfig(
-            total=arc4.UInt64(self.total),
-            decimals=arc4.UInt32(self.decimals),
-            default_frozen=arc4.Bool(self.default_frozen),
-            unit_name=arc4.String(self.unit_name),
-            name=arc4.String(self.name),
-            url=arc4.String(self.url),
-            metadata_hash=arc4.DynamicBytes(self.metadata_hash),
-            manager_addr=arc4.Address(self.manager_addr),
-            reserve_addr=arc4.Address(self.reserve_addr),
-            freeze_addr=arc4.Address(self.freeze_addr),
-            clawback_addr=arc4.Address(self.clawback_addr),
-        )
+        return self.load_asset_config(asset.id)
 
     @arc4.abimethod(readonly=True)
     def get_asset_is_frozen(self, freeze_asset: Asset) -> arc4.Bool:
@@ -564,7 +860,7 @@ class SmartAsa(
         self.assert_common_preconditions(freeze_asset.id)
 
         # Effects
-        return arc4.Bool(self.global_frozen)
+        return arc4.Bool(self.is_global_frozen(freeze_asset.id))
 
     @arc4.abimethod(readonly=True)
     def get_account_is_frozen(
@@ -584,7 +880,7 @@ class SmartAsa(
         self.assert_common_preconditions(freeze_asset.id)
 
         # Effects
-        return arc4.Bool(self.account_frozen[freeze_account])
+        return arc4.Bool(self.is_account_frozen(freeze_asset.id, freeze_account))
 
     @arc4.abimethod(readonly=True)
     def get_circulating_supply(self, asset: Asset) -> arc4.UInt64:
@@ -602,3 +898,201 @@ class SmartAsa(
 
         # Effects
         return arc4.UInt64(self.circulating_supply(asset))
+
+
+class SingleSmartAsaBase(SmartAsaBase):
+    """
+    A single Controlled ASA per application: Smart ASA fields in Global State and
+    holdings in Local State. The ASA fields storage is left to the subclasses.
+    """
+
+    def __init__(self) -> None:
+        # GLOBAL STATE
+        # Smart ASA Fields
+        self.smart_asa_id = UInt64()
+        self.global_frozen = False
+        self.allowlist_root = Bytes()
+
+        # LOCAL STATE
+        # Smart ASA Fields
+        self.account_smart_asa_id = LocalState(UInt64)
+        self.account_frozen = LocalState(bool)
+
+    @subroutine
+    @abc.abstractmethod
+    def delete_asset_config(self) -> None: ...
+
+    @subroutine
+    def assert_common_preconditions(self, asset_id: UInt64) -> None:
+        assert self.smart_asa_id, err.MISSING_CTRL_ASA
+        assert self.smart_asa_id == asset_id, err.INVALID_CTRL_ASA
+
+    @subroutine
+    def assert_create_preconditions(self) -> None:
+        assert not self.smart_asa_id, err.EXISTING_CTRL_ASA
+
+    @subroutine
+    def create_ctrl_asset(self, asset_id: UInt64, asset_config: AssetConfig) -> None:
+        self.smart_asa_id = asset_id
+        self.store_asset_config(asset_id, asset_config)
+
+    @subroutine
+    def delete_ctrl_asset(self, asset_id: UInt64) -> None:
+        self.delete_asset_config()
+        self.smart_asa_id = UInt64()
+        self.global_frozen = False
+        self.allowlist_root = Bytes()
+
+    @subroutine
+    def is_global_frozen(self, asset_id: UInt64) -> bool:
+        return self.global_frozen
+
+    @subroutine
+    def store_global_frozen(self, asset_id: UInt64, *, asset_frozen: bool) -> None:
+        self.global_frozen = asset_frozen
+
+    @subroutine
+    def has_allowlist(self, asset_id: UInt64) -> bool:
+        return bool(self.allowlist_root)
+
+    @subroutine
+    def load_allowlist_root(self, asset_id: UInt64) -> Bytes:
+        return self.allowlist_root
+
+    @subroutine
+    def store_allowlist_root(self, asset_id: UInt64, allowlist_root: Bytes) -> None:
+        if allowlist_root == Global.zero_address.bytes:
+            self.allowlist_root = Bytes()
+        else:
+            self.allowlist_root = allowlist_root
+
+    @subroutine
+    def is_holder(self, asset_id: UInt64, account: Account) -> bool:
+        return self.account_smart_asa_id[account] == asset_id
+
+    @subroutine
+    def is_account_frozen(self, asset_id: UInt64, account: Account) -> bool:
+        return self.account_frozen[account]
+
+    @subroutine
+    def store_account_frozen(
+        self, asset_id: UInt64, account: Account, *, asset_frozen: bool
+    ) -> None:
+        self.account_frozen[account] = asset_frozen
+
+    @subroutine
+    def create_holding(
+        self, asset_id: UInt64, account: Account, *, asset_frozen: bool
+    ) -> None:
+        # Local State Init
+        self.account_smart_asa_id[account] = asset_id
+        self.account_frozen[account] = asset_frozen
+
+    @subroutine
+    def delete_holding(self, asset_id: UInt64, account: Account) -> None:
+        pass  # The CloseOut clears the Local State
+
+
+class SmartAsa(
+    SingleSmartAsaBase,
+    state_totals=StateTotals(
+        global_bytes=cfg.GLOBAL_BYTES,
+        global_uints=cfg.GLOBAL_UINTS,
+        local_bytes=cfg.LOCAL_BYTES,
+        local_uints=cfg.LOCAL_UINTS,
+    ),
+):
+    """
+    ARC-0020 (Smart ASA) - Reference Implementation
+    """
+
+    def __init__(self) -> None:
+        # Preconditions
+        assert Txn.global_num_byte_slice == cfg.GLOBAL_BYTES, err.WRONG_GLOBAL_BYTES
+        assert Txn.global_num_uint == cfg.GLOBAL_UINTS, err.WRONG_GLOBAL_UINTS
+        assert Txn.local_num_byte_slice == cfg.LOCAL_BYTES, err.WRONG_LOCAL_BYTES
+        assert Txn.local_num_uint == cfg.LOCAL_UINTS, err.WRONG_LOCAL_UINTS
+
+        # GLOBAL STATE
+        # ASA Fields
+        self.total = UInt64()
+        self.decimals = UInt64()
+        self.default_frozen = False
+        self.unit_name = String()
+        self.name = String()
+        self.url = String()
+        self.metadata_hash = Bytes()
+        self.manager_addr = Account()
+        self.reserve_addr = Account()
+        self.freeze_addr = Account()
+        self.clawback_addr = Account()
+        # Smart ASA Fields
+        super().__init__()
+
+    @subroutine
+    def config_total(self, asset_id: UInt64) -> UInt64:
+        return self.total
+
+    @subroutine
+    def config_default_frozen(self, asset_id: UInt64) -> bool:
+        return self.default_frozen
+
+    @subroutine
+    def config_manager_addr(self, asset_id: UInt64) -> Account:
+        return self.manager_addr
+
+    @subroutine
+    def config_reserve_addr(self, asset_id: UInt64) -> Account:
+        return self.reserve_addr
+
+    @subroutine
+    def config_freeze_addr(self, asset_id: UInt64) -> Account:
+        return self.freeze_addr
+
+    @subroutine
+    def config_clawback_addr(self, asset_id: UInt64) -> Account:
+        return self.clawback_addr
+
+    @subroutine
+    def load_asset_config(self, asset_id: UInt64) -> AssetConfig:
+        return AssetConfig(
+            total=arc4.UInt64(self.total),
+            decimals=arc4.UInt32(self.decimals),
+            default_frozen=arc4.Bool(self.default_frozen),
+            unit_name=arc4.String(self.unit_name),
+            name=arc4.String(self.name),
+            url=arc4.String(self.url),
+            metadata_hash=arc4.DynamicBytes(self.metadata_hash),
+            manager_addr=arc4.Address(self.manager_addr),
+            reserve_addr=arc4.Address(self.reserve_addr),
+            freeze_addr=arc4.Address(self.freeze_addr),
+            clawback_addr=arc4.Address(self.clawback_addr),
+        )
+
+    @subroutine
+    def store_asset_config(self, asset_id: UInt64, asset_config: AssetConfig) -> None:
+        self.total = asset_config.total.native
+        self.decimals = asset_config.decimals.native
+        self.default_frozen = asset_config.default_frozen.native
+        self.unit_name = asset_config.unit_name.native
+        self.name = asset_config.name.native
+        self.url = asset_config.url.native
+        self.metadata_hash = asset_config.metadata_hash.native
+        self.manager_addr = asset_config.manager_addr.native
+        self.reserve_addr = asset_config.reserve_addr.native
+        self.freeze_addr = asset_config.freeze_addr.native
+        self.clawback_addr = asset_config.clawback_addr.native
+
+    @subroutine
+    def delete_asset_config(self) -> None:
+        self.total = UInt64()
+        self.decimals = UInt64()
+        self.default_frozen = False
+        self.unit_name = String()
+        self.name = String()
+        self.url = String()
+        self.metadata_hash = Bytes()
+        self.manager_addr = Account()
+        self.reserve_addr = Account()
+        self.freeze_addr = Account()
+        self.clawback_addr = Account()
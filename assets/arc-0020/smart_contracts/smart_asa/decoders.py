@@ -0,0 +1,203 @@
+"""
+Cached struct decoders for the SmartAsa typed client ABI return types.
+
+The typed client `_init_dataclass` walks `dataclasses.fields()` and checks for nested
+dataclasses on every decoded return (e.g. the `AssetConfig` of `get_asset_config`).
+Here a flat decode plan (a field getter and a converter per field) is built once per
+struct type and representation, and reused:
+
+    decode = struct_decoder(AssetConfig)
+    configs = [decode(result.abi_return) for result in results]
+
+Structs decode from AlgoKit Utils ABI returns (dicts keyed by field name) or from
+algosdk decoded tuples (lists in field order, see `abi_struct_decoder`). For bulk
+reads the result can be the struct dataclass, a `__slots__` dataclass or a named
+tuple with the same fields (`representation`).
+"""
+
+import dataclasses
+import inspect
+import operator
+import typing
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Final, Literal, Protocol, TypeAlias, TypeGuard, cast
+
+from algosdk import abi
+
+Representation: TypeAlias = Literal["dataclass", "slots", "tuple"]
+StructDecoder: TypeAlias = Callable[[object], object]
+_Converter: TypeAlias = Callable[[object], object] | None
+
+REPRESENTATIONS: Final[tuple[Representation, ...]] = ("dataclass", "slots", "tuple")
+
+_RESULT_TYPES: Final[dict[tuple[type, Representation], type]] = {}
+_STRUCT_DECODERS: Final[dict[tuple[type, Representation], StructDecoder]] = {}
+_ABI_STRUCT_DECODERS: Final[
+    dict[tuple[type, str, Representation], Callable[[bytes], object]]
+] = {}
+
+
+class _NamedTupleType(Protocol):
+    def _make(self, iterable: Iterable[object]) -> object: ...
+
+
+def _to_bytes(value: object) -> object:
+    # `byte[]` is decoded by algosdk as a list of ints.
+    return bytes(cast(list[int], value)) if isinstance(value, list) else value
+
+
+def _fields(struct_type: type) -> tuple[dataclasses.Field[object], ...]:
+    fields: tuple[dataclasses.Field[object], ...] = dataclasses.fields(struct_type)
+    return fields
+
+
+def _field_types(struct_type: type) -> dict[str, object]:
+    hints = cast(dict[str, object], typing.get_type_hints(struct_type))
+    field_types: dict[str, object] = {}
+    for field in _fields(struct_type):
+        field_type: object = field.type
+        field_types[field.name] = hints.get(field.name, field_type)
+    return field_types
+
+
+def result_type(struct_type: type, representation: Representation) -> type:
+    """The class of decoded `struct_type` values for a `representation`"""
+    key = (struct_type, representation)
+    if key not in _RESULT_TYPES:
+        _RESULT_TYPES[key] = _result_type(struct_type, representation)
+    return _RESULT_TYPES[key]
+
+
+def _result_type(struct_type: type, representation: Representation) -> type:
+    match representation:
+        case "dataclass":
+            return struct_type
+        case "slots":
+            fields: list[tuple[str, object]] = list(_field_types(struct_type).items())
+            return dataclasses.make_dataclass(struct_type.__name__, fields, slots=True)
+        case "tuple":
+            return namedtuple(  # type: ignore[misc]
+                struct_type.__name__, list(_field_types(struct_type))
+            )
+    raise ValueError(f"Unknown struct representation: {representation}")
+
+
+def _constructor(
+    struct_type: type, representation: Representation
+) -> Callable[[tuple[object, ...]], object]:
+    cls = result_type(struct_type, representation)
+    if representation == "tuple":
+        return cast(_NamedTupleType, cls)._make
+    if any(field.kw_only for field in _fields(cls)):
+        names = [field.name for field in _fields(cls)]
+
+        def construct_kw(values: tuple[object, ...]) -> object:
+            return cast(object, cls(**dict(zip(names, values, strict=True))))
+
+        return construct_kw
+
+    def construct(values: tuple[object, ...]) -> object:
+        return cast(object, cls(*values))
+
+    return construct
+
+
+def _is_struct_type(field_type: object) -> TypeGuard[type[object]]:
+    # A dataclass, not a dataclass instance (e.g. a default value)
+    is_class: bool = inspect.isclass(field_type)
+    return is_class and dataclasses.is_dataclass(field_type)
+
+
+def _converter(field_type: object, representation: Representation) -> _Converter:
+    if _is_struct_type(field_type):
+        return struct_decoder(field_type, representation)
+    if field_type is bytes:
+        return _to_bytes
+    return None
+
+
+def struct_decoder(
+    struct_type: type, representation: Representation = "dataclass"
+) -> StructDecoder:
+    """
+    Decoder of `struct_type` values, from a dict keyed by field name or a sequence in
+    field order, built once per struct type and representation.
+    """
+    key = (struct_type, representation)
+    if key not in _STRUCT_DECODERS:
+        _STRUCT_DECODERS[key] = _struct_decoder(struct_type, representation)
+    return _STRUCT_DECODERS[key]
+
+
+def _struct_decoder(struct_type: type, representation: Representation) -> StructDecoder:
+    field_types = _field_types(struct_type)
+    names = list(field_types)
+    by_name: Callable[[Mapping[str, object]], object] = operator.itemgetter(*names)
+    by_index: Callable[[Sequence[object]], object] = operator.itemgetter(
+        *range(len(names))
+    )
+    construct = _constructor(struct_type, representation)
+    converters = [
+        (idx, converter)
+        for idx, field_type in enumerate(field_types.values())
+        if (converter := _converter(field_type, representation)) is not None
+    ]
+
+    def field_values(data: object) -> tuple[object, ...]:
+        if isinstance(data, Mapping):
+            values = by_name(cast(Mapping[str, object], data))
+        else:
+            values = by_index(cast(Sequence[object], data))
+        return cast(tuple[object, ...], values if len(names) > 1 else (values,))
+
+    if not converters:
+
+        def decode_flat(data: object) -> object:
+            return construct(field_values(data))
+
+        return decode_flat
+
+    def decode(data: object) -> object:
+        values = list(field_values(data))
+        for idx, converter in converters:
+            values[idx] = converter(values[idx])
+        return construct(tuple(values))
+
+    return decode
+
+
+def decode_struct(
+    struct_type: type,
+    data: Mapping[str, object] | Sequence[object],
+    representation: Representation = "dataclass",
+) -> object:
+    """Decodes an ABI return `data` into `struct_type` (or its `representation`)"""
+    return struct_decoder(struct_type, representation)(data)
+
+
+def abi_struct_decoder(
+    struct_type: type, abi_type: str, representation: Representation = "dataclass"
+) -> Callable[[bytes], object]:
+    """
+    Decoder of ABI encoded `struct_type` values (e.g. raw method return logs or box
+    contents), `abi_type` being the struct tuple type string.
+    """
+    key = (struct_type, abi_type, representation)
+    if key not in _ABI_STRUCT_DECODERS:
+        _ABI_STRUCT_DECODERS[key] = _abi_struct_decoder(
+            struct_type, abi_type, representation
+        )
+    return _ABI_STRUCT_DECODERS[key]
+
+
+def _abi_struct_decoder(
+    struct_type: type, abi_type: str, representation: Representation
+) -> Callable[[bytes], object]:
+    tuple_type = abi.ABIType.from_string(abi_type)
+    decode = struct_decoder(struct_type, representation)
+
+    def decode_abi(encoded: bytes) -> object:
+        return decode(cast(object, tuple_type.decode(encoded)))
+
+    return decode_abi
@@ -4,12 +4,13 @@ from typing import Final
 from algokit_utils import (
     AlgoAmount,
     AlgorandClient,
-    CommonAppCallParams,
     OnSchemaBreak,
     OnUpdate,
 )
 from algokit_utils.config import config
 
+from smart_contracts.smart_asa.fees import FeePolicy
+
 logger = logging.getLogger(__name__)
 
 ASA_TOTAL: Final[int] = 420
@@ -49,25 +50,18 @@ def deploy() -> None:
         min_spending_balance=APP_FUNDS,
     )
 
-    sp = app_client.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2  # type: ignore
-
-    app_client.send.asset_create(
-        AssetCreateArgs(
-            total=ASA_TOTAL,
-            decimals=ASA_DECIMALS,
-            default_frozen=ASA_DEFAULT_FROZEN,
-            unit_name=ASA_UNIT_NAME,
-            name=ASA_NAME,
-            url=ASA_URL,
-            metadata_hash=ASA_METADATA_HASH,
-            manager_addr=deployer.address,
-            reserve_addr=app_client.app_address,
-            clawback_addr=deployer.address,
-            freeze_addr=deployer.address,
-        ),
-        params=CommonAppCallParams(
-            static_fee=AlgoAmount.from_micro_algo(sp.fee)  # type: ignore
-        ),
+    fees = FeePolicy(algorand.client.algod)
+    create_args = AssetCreateArgs(
+        total=ASA_TOTAL,
+        decimals=ASA_DECIMALS,
+        default_frozen=ASA_DEFAULT_FROZEN,
+        unit_name=ASA_UNIT_NAME,
+        name=ASA_NAME,
+        url=ASA_URL,
+        metadata_hash=ASA_METADATA_HASH,
+        manager_addr=deployer.address,
+        reserve_addr=app_client.app_address,
+        clawback_addr=deployer.address,
+        freeze_addr=deployer.address,
     )
+    app_client.send.asset_create(create_args, params=fees.params(create_args))
@@ -0,0 +1,215 @@
+"""
+Precompiled ABI argument encoders for the SmartAsa typed client `*Args` dataclasses.
+
+The typed client converts the `*Args` dataclass (`_parse_abi_args`) and copies the
+call params (`dataclasses.asdict`) on every call, then AlgoKit Utils resolves the ABI
+method and encodes each argument. For bulk calls (e.g. tens of thousands of
+`AssetTransferArgs`) the encoder of an `*Args` class is built once, on first use,
+and emits the ABI encoded application arguments (selector first) directly:
+
+    algorand.send.app_call(
+        app_call_params(
+            client.app_id,
+            AssetTransferArgs(...),
+            CommonAppCallParams(sender=..., signer=...),
+        )
+    )
+
+Only methods without transaction or reference arguments are supported, ABI returns
+are not decoded (calls are sent as plain app calls).
+"""
+
+import dataclasses
+import operator
+from collections.abc import Callable
+from typing import Final, Protocol, TypeAlias, cast
+
+from algokit_utils import AppCallParams, CommonAppCallParams
+from algosdk import abi, encoding
+from algosdk.transaction import OnComplete
+
+ArgsEncoder: TypeAlias = Callable[[object], list[bytes]]
+ValueEncoder: TypeAlias = Callable[[object], bytes]
+
+# ARC-4: arguments beyond the 15th are encoded as a tuple in the last app argument.
+MAX_APP_ARGS: Final[int] = 16
+LENGTH_PREFIX_SIZE: Final[int] = 2
+
+_ENCODERS: Final[dict[type, ArgsEncoder]] = {}
+
+
+class AbiArgs(Protocol):
+    """A typed client `*Args` dataclass"""
+
+    @property
+    def abi_method_signature(self) -> str: ...
+
+
+def _uint_encoder(size: int) -> ValueEncoder:
+    def encode(value: object) -> bytes:
+        return cast(int, value).to_bytes(size, "big")
+
+    return encode
+
+
+def _encode_bool(value: object) -> bytes:
+    return b"\x80" if value else b"\x00"
+
+
+def _encode_address(value: object) -> bytes:
+    if isinstance(value, str):
+        address: bytes = encoding.decode_address(value)
+        return address
+    return bytes(cast(bytes, value))
+
+
+def _encode_dynamic_bytes(value: object) -> bytes:
+    # `string` and `byte[]` (typed as `bytes | str` in the client)
+    data = value.encode() if isinstance(value, str) else bytes(cast(bytes, value))
+    return len(data).to_bytes(LENGTH_PREFIX_SIZE, "big") + data
+
+
+def _field_names(struct_type: type) -> list[str]:
+    """Field names of the `struct_type` dataclass, in order"""
+    fields: tuple[dataclasses.Field[object], ...] = dataclasses.fields(struct_type)
+    return [field.name for field in fields]
+
+
+def _abi_value(value: object) -> object:
+    # Structs (e.g. `TransferLeg`) are dataclasses in the client, tuples for algosdk.
+    if dataclasses.is_dataclass(type(value)):
+        return tuple(
+            _abi_value(cast(object, getattr(value, name)))
+            for name in _field_names(type(value))
+        )
+    if isinstance(value, list | tuple):
+        return [_abi_value(item) for item in cast(list[object], value)]
+    return value
+
+
+def _abi_encode(abi_type: abi.ABIType, value: object) -> bytes:
+    # algosdk encodes structs (tuples) from lists or tuples.
+    return bytes(abi_type.encode(cast(list[object], _abi_value(value))))
+
+
+def _generic_encoder(abi_type: abi.ABIType) -> ValueEncoder:
+    def encode(value: object) -> bytes:
+        return _abi_encode(abi_type, value)
+
+    return encode
+
+
+def value_encoder(abi_type: abi.ABIType) -> ValueEncoder:
+    """Specialized encoder for the SmartAsa argument types, algosdk for the others"""
+    if isinstance(abi_type, abi.UintType):
+        return _uint_encoder(abi_type.bit_size // 8)
+    if isinstance(abi_type, abi.BoolType):
+        return _encode_bool
+    if isinstance(abi_type, abi.AddressType):
+        return _encode_address
+    if isinstance(abi_type, abi.StringType) or (
+        isinstance(abi_type, abi.ArrayDynamicType)
+        and isinstance(abi_type.child_type, abi.ByteType)
+    ):
+        return _encode_dynamic_bytes
+    return _generic_encoder(abi_type)
+
+
+def _compile(args_type: type, method_signature: str) -> ArgsEncoder:
+    method = abi.Method.from_signature(method_signature)
+    arg_types: list[abi.ABIType] = []
+    for arg in method.args:
+        if not isinstance(arg.type, abi.ABIType):
+            raise ValueError(
+                f"{method.name}: {arg.type} arguments can not be precompiled"
+            )
+        arg_types.append(arg.type)
+
+    names = _field_names(args_type)
+    if len(names) != len(arg_types):
+        raise ValueError(f"{args_type.__name__} does not match {method_signature}")
+    get_values: Callable[[object], object] = operator.attrgetter(*names)
+    selector = method.get_selector()
+
+    if len(arg_types) < MAX_APP_ARGS:
+        encoders = [value_encoder(arg_type) for arg_type in arg_types]
+        if len(encoders) == 1:
+            (encode_value,) = encoders
+
+            def encode(args: object) -> list[bytes]:
+                return [selector, encode_value(get_values(args))]
+
+        else:
+
+            def encode(args: object) -> list[bytes]:
+                values = cast(tuple[object, ...], get_values(args))
+                return [
+                    selector,
+                    *(enc(value) for enc, value in zip(encoders, values, strict=True)),
+                ]
+
+        return encode
+
+    head = MAX_APP_ARGS - 2
+    encoders = [value_encoder(arg_type) for arg_type in arg_types[:head]]
+    tail_type = abi.TupleType(arg_types[head:])
+
+    def encode_packed(args: object) -> list[bytes]:
+        values = cast(tuple[object, ...], get_values(args))
+        return [
+            selector,
+            *(enc(value) for enc, value in zip(encoders, values[:head], strict=True)),
+            _abi_encode(tail_type, values[head:]),
+        ]
+
+    return encode_packed
+
+
+def args_encoder(args: AbiArgs) -> ArgsEncoder:
+    """The encoder of the `*Args` dataclass of `args`, compiled on first use"""
+    args_type = type(args)
+    try:
+        return _ENCODERS[args_type]
+    except KeyError:
+        encoder = _ENCODERS[args_type] = _compile(args_type, args.abi_method_signature)
+        return encoder
+
+
+def encode_args(args: AbiArgs) -> list[bytes]:
+    """Application arguments of an ABI call: method selector and encoded `args`"""
+    return args_encoder(args)(args)
+
+
+def app_call_params(
+    app_id: int,
+    args: AbiArgs,
+    params: CommonAppCallParams,
+    *,
+    on_complete: OnComplete = OnComplete.NoOpOC,
+) -> AppCallParams:
+    """
+    App call params of an ABI call with precompiled `args`, without the typed client
+    params copy. `params.sender` is required (there is no default sender).
+    """
+    if params.sender is None:
+        raise ValueError("Precompiled app calls require params.sender")
+    return AppCallParams(
+        sender=params.sender,
+        signer=params.signer,
+        rekey_to=params.rekey_to,
+        note=params.note,
+        lease=params.lease,
+        static_fee=params.static_fee,
+        extra_fee=params.extra_fee,
+        max_fee=params.max_fee,
+        validity_window=params.validity_window,
+        first_valid_round=params.first_valid_round,
+        last_valid_round=params.last_valid_round,
+        app_id=app_id,
+        on_complete=on_complete,
+        args=encode_args(args),
+        account_references=params.account_references,
+        app_references=params.app_references,
+        asset_references=params.asset_references,
+        box_references=params.box_references,
+    )
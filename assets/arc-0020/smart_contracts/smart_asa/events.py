@@ -0,0 +1,149 @@
+"""
+ARC-28 event decoder for the SmartAsa app logs.
+
+Events are emitted on mint, burn, clawback, global and account freeze and asset
+configuration, so supply and frozen status can be followed from transaction or block
+logs instead of polling the read-only getters.
+"""
+
+import base64
+import dataclasses
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Final, TypeAlias, cast
+
+from algosdk import abi, encoding
+
+from smart_contracts.smart_asa.decoders import StructDecoder, struct_decoder
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Mint:
+    asset_receiver: str
+    asset_amount: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Burn:
+    asset_sender: str
+    asset_amount: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Clawback:
+    asset_sender: str
+    asset_receiver: str
+    asset_amount: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetFreeze:
+    asset_frozen: bool
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AccountFreeze:
+    freeze_account: str
+    asset_frozen: bool
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssetConfig:
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: str
+    name: str
+    url: str
+    metadata_hash: bytes
+    manager_addr: str
+    reserve_addr: str
+    freeze_addr: str
+    clawback_addr: str
+
+
+SmartAsaEvent: TypeAlias = (
+    Mint | Burn | Clawback | AssetFreeze | AccountFreeze | AssetConfig
+)
+
+# Event name is the dataclass name, as for the Algorand Python event structs.
+EVENT_ARGS: Final[dict[type, str]] = {
+    Mint: "(address,uint64)",
+    Burn: "(address,uint64)",
+    Clawback: "(address,address,uint64)",
+    AssetFreeze: "(bool)",
+    AccountFreeze: "(address,bool)",
+    AssetConfig: (
+        "(uint64,uint32,bool,string,string,string,byte[],"
+        "address,address,address,address)"
+    ),
+}
+
+SELECTOR_SIZE: Final[int] = 4
+
+
+def event_signature(event_type: type) -> str:
+    return event_type.__name__ + EVENT_ARGS[event_type]
+
+
+def event_selector(event_type: type) -> bytes:
+    """ARC-28 selector: first 4 bytes of the SHA-512/256 of the event signature"""
+    digest: bytes = encoding.checksum(event_signature(event_type).encode())
+    return digest[:SELECTOR_SIZE]
+
+
+# Event args are decoded by algosdk in field order, then into the event dataclass
+# (`byte[]` decoded as a list of ints is converted to `bytes`).
+_DECODERS: Final[dict[bytes, tuple[StructDecoder, abi.TupleType]]] = {
+    event_selector(event_type): (
+        struct_decoder(event_type),
+        cast(abi.TupleType, abi.ABIType.from_string(args)),
+    )
+    for event_type, args in EVENT_ARGS.items()
+}
+
+
+def decode_event(log: bytes) -> SmartAsaEvent | None:
+    """Decodes a SmartAsa event log, `None` for any other log (e.g. ABI returns)"""
+    try:
+        decode, args_type = _DECODERS[log[:SELECTOR_SIZE]]
+    except KeyError:
+        return None
+    values = cast(list[object], args_type.decode(log[SELECTOR_SIZE:]))
+    return cast(SmartAsaEvent, decode(values))
+
+
+def decode_logs(logs: Iterable[bytes | str]) -> Iterator[SmartAsaEvent]:
+    """Decodes SmartAsa events from raw or base64 logs (as in algod and indexer JSON)"""
+    for log in logs:
+        event = decode_event(base64.b64decode(log) if isinstance(log, str) else log)
+        if event is not None:
+            yield event
+
+
+def block_logs(block: Mapping[str, object], app_id: int) -> Iterator[bytes]:
+    """
+    Logs of the `app_id` calls in a msgpack decoded algod block, inner calls included.
+
+    Blocks are fetched with `algod.block_info(round_num, response_format="msgpack")`.
+    """
+
+    def signed_txn_logs(stxn: Mapping[str, object]) -> Iterator[bytes]:
+        txn = cast(Mapping[str, object], stxn["txn"])
+        apply_data = cast(Mapping[str, object], stxn.get("dt", {}))
+        if txn.get("type") == "appl" and txn.get("apid") == app_id:
+            yield from cast(list[bytes], apply_data.get("lg", []))
+        for inner_stxn in cast(list[Mapping[str, object]], apply_data.get("itx", [])):
+            yield from signed_txn_logs(inner_stxn)
+
+    body = cast(Mapping[str, object], block["block"])
+    for stxn in cast(list[Mapping[str, object]], body.get("txns", [])):
+        yield from signed_txn_logs(stxn)
+
+
+def supply_delta(event: SmartAsaEvent) -> int:
+    """Circulating supply change of an event"""
+    if isinstance(event, Mint):
+        return event.asset_amount
+    if isinstance(event, Burn):
+        return -event.asset_amount
+    return 0
@@ -0,0 +1,130 @@
+"""
+Fee policy for SmartAsa method calls.
+
+Methods firing inner transactions (the Controlled ASA create, transfers and destroy)
+must pool the inner transactions fees in the app call fee. `FeePolicy` knows the
+inner transactions fired by each method of a contract and serves the fees from a
+suggested params cache (`arc_common.suggested_params`), instead of one
+`suggested_params` call (and a `min_fee * 2` computed by hand) per app call:
+
+    fees = FeePolicy(algorand.client.algod)
+    client.send.asset_transfer(args, params=fees.params(args))
+
+The inner transactions counts default to SmartAsa (and SmartAsaPacked). SmartAsaMulti
+also refunds the holding box MBR on close out:
+
+    fees = FeePolicy(algorand.client.algod, inner_txns=MULTI_INNER_TXNS)
+
+Explicit `static_fee` or `extra_fee` params are left unchanged.
+"""
+
+import dataclasses
+from collections.abc import Mapping, Sized
+from typing import Final, Protocol, cast
+
+from algokit_utils import AlgoAmount, CommonAppCallParams
+from algosdk import transaction
+from algosdk.v2client.algod import AlgodClient
+from arc_common.suggested_params import SuggestedParamsCache
+
+from smart_contracts.smart_asa.encoders import AbiArgs
+
+# Inner transactions fired by each SmartAsa (and SmartAsaPacked) method (at most: a
+# close out of a destroyed Controlled ASA fires none). Methods not listed fire none.
+INNER_TXNS: Final[Mapping[str, int]] = {
+    "asset_create": 1,
+    "asset_transfer": 1,
+    "asset_transfer_with_proof": 1,
+    "asset_close_out": 1,
+    "asset_destroy": 1,
+}
+# SmartAsaMulti close out also refunds the holding box MBR to the holder.
+MULTI_INNER_TXNS: Final[Mapping[str, int]] = {**INNER_TXNS, "asset_close_out": 2}
+# `asset_transfer_batch` fires one inner asset transfer per leg.
+BATCH_METHOD: Final[str] = "asset_transfer_batch"
+
+
+class _BatchArgs(AbiArgs, Protocol):
+    @property
+    def legs(self) -> Sized: ...
+
+
+def inner_txns(args: AbiArgs, counts: Mapping[str, int] = INNER_TXNS) -> int:
+    """
+    Inner transactions fired by the method call of `args` (typed client `*Args`),
+    `counts` being the contract inner transactions per method
+    """
+    method = args.abi_method_signature.split("(", 1)[0]
+    if method == BATCH_METHOD:
+        return len(cast(_BatchArgs, args).legs)
+    return counts.get(method, 0)
+
+
+def method_fee(
+    sp: transaction.SuggestedParams,
+    method: str,
+    counts: Mapping[str, int] = INNER_TXNS,
+) -> int:
+    """Fee of a `method` call (by name), inner transactions fees pooled"""
+    if method == BATCH_METHOD:
+        raise ValueError(f"{BATCH_METHOD} fee depends on the legs, use its args")
+    return cast(int, sp.min_fee) * (1 + counts.get(method, 0))
+
+
+def app_call_fee(
+    sp: transaction.SuggestedParams,
+    args: AbiArgs,
+    counts: Mapping[str, int] = INNER_TXNS,
+) -> int:
+    """Fee of the method call of `args`, inner transactions fees pooled"""
+    return cast(int, sp.min_fee) * (1 + inner_txns(args, counts))
+
+
+def with_fee(
+    params: CommonAppCallParams | None,
+    sp: transaction.SuggestedParams,
+    args: AbiArgs,
+    counts: Mapping[str, int] = INNER_TXNS,
+) -> CommonAppCallParams:
+    """`params` with the method call fee, unless a static or extra fee is set"""
+    params = params or CommonAppCallParams()
+    if params.static_fee is not None or params.extra_fee is not None:
+        return params
+    return dataclasses.replace(
+        params, static_fee=AlgoAmount.from_micro_algo(app_call_fee(sp, args, counts))
+    )
+
+
+class FeePolicy:
+    def __init__(
+        self,
+        algod: AlgodClient,
+        *,
+        params_cache: SuggestedParamsCache | None = None,
+        inner_txns: Mapping[str, int] = INNER_TXNS,
+    ) -> None:
+        self.algod = algod
+        self.params_cache = params_cache or SuggestedParamsCache()
+        self.inner_txns = inner_txns
+
+    def suggested_params(self) -> transaction.SuggestedParams:
+        """The suggested params the fees are computed from (cached)"""
+        return self.params_cache.get(self.algod)
+
+    def fee(self, args: AbiArgs) -> AlgoAmount:
+        """Fee of the method call of `args`, inner transactions fees pooled"""
+        return AlgoAmount.from_micro_algo(
+            app_call_fee(self.suggested_params(), args, self.inner_txns)
+        )
+
+    def method_fee(self, method: str) -> AlgoAmount:
+        """Fee of a `method` call (by name), inner transactions fees pooled"""
+        return AlgoAmount.from_micro_algo(
+            method_fee(self.suggested_params(), method, self.inner_txns)
+        )
+
+    def params(
+        self, args: AbiArgs, params: CommonAppCallParams | None = None
+    ) -> CommonAppCallParams:
+        """Call params of `args` paying its fee (see `with_fee`)"""
+        return with_fee(params, self.suggested_params(), args, self.inner_txns)
@@ -0,0 +1,64 @@
+"""
+Atomic group batching shared by the bulk transfers, reads and opt ins.
+
+`chunks` packs items in lists of up to a group size. `map_groups` runs a group
+function (sign, submit and confirm, or simulate) over the chunks of an iterable from
+a thread pool, keeps up to `concurrency` groups in flight and streams the group
+results in submission order. Items are consumed lazily: a group is only built once
+a slot is free.
+
+When a group fails no further group is sent, but the groups already in flight are
+drained: their results are still streamed, then the first error is raised (with a
+note for each other failed group), so every confirmed group is reported.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Final, TypeVar
+
+MAX_GROUP_SIZE: Final[int] = 16
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def chunks(items: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def map_groups(
+    send: Callable[[list[_T]], _R],
+    items: Iterable[_T],
+    *,
+    group_size: int,
+    concurrency: int,
+    name: str,
+) -> Iterator[_R]:
+    """
+    `send` results of the chunks of `group_size` items, up to `concurrency` chunks
+    in flight (`name` prefixes the worker threads), in submission order
+    """
+    if not 0 < group_size <= MAX_GROUP_SIZE:
+        raise ValueError(f"Group size must be between 1 and {MAX_GROUP_SIZE}")
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=name) as pool:
+        in_flight: deque[Future[_R]] = deque()
+        try:
+            for chunk in chunks(items, group_size):
+                in_flight.append(pool.submit(send, chunk))
+                if len(in_flight) >= concurrency:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        except Exception as e:
+            for future in in_flight:
+                try:
+                    result = future.result()
+                except Exception as other:
+                    e.add_note(f"Another group in flight failed: {other!r}")
+                else:
+                    yield result
+            raise
@@ -0,0 +1,139 @@
+"""
+Bulk scanner of the SmartAsa holders local state (bound Smart ASA ID and frozen flag).
+
+The typed client reads local state one account and one key at a time. The scanner
+fetches the app local state of many accounts concurrently (one algod request per
+account) over a pooled keep-alive HTTP connection, with bounded parallelism and
+retries, and streams decoded records in input order:
+
+    for address, smart_asa_id, frozen in scan_holders(algod, app_id, addresses):
+        ...
+
+Addresses are consumed lazily, at most `2 * concurrency` requests are in flight.
+Accounts not opted in to the app are yielded with `None` Smart ASA ID and frozen flag.
+"""
+
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Final, NamedTuple, cast
+
+import httpx
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.smart_asa.app_spec import app_spec
+
+DEFAULT_CONCURRENCY: Final[int] = 16
+DEFAULT_RETRIES: Final[int] = 3
+DEFAULT_BACKOFF: Final[float] = 0.1
+DEFAULT_TIMEOUT: Final[float] = 10.0
+RETRY_STATUS_CODES: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+
+
+class LocalStateKeys(NamedTuple):
+    smart_asa_id: str
+    frozen: str
+
+
+_LOCAL_STATE_KEYS: Final[list[LocalStateKeys]] = []
+
+
+def local_state_keys() -> LocalStateKeys:
+    """Raw keys (base64, as returned by algod), from the App Spec"""
+    if not _LOCAL_STATE_KEYS:
+        keys = app_spec().state.keys.local_state
+        _LOCAL_STATE_KEYS.append(
+            LocalStateKeys(keys["account_smart_asa_id"].key, keys["account_frozen"].key)
+        )
+    return _LOCAL_STATE_KEYS[0]
+
+
+class HolderRecord(NamedTuple):
+    address: str
+    smart_asa_id: int | None
+    frozen: bool | None
+
+
+def decode_local_state(
+    address: str, app_local_state: dict[str, object] | None
+) -> HolderRecord:
+    """Decodes the `app-local-state` of an algod account application info response"""
+    if app_local_state is None:
+        return HolderRecord(address, None, None)
+    keys = local_state_keys()
+    uints: dict[str, int] = {}
+    for kv in cast(list[dict[str, object]], app_local_state.get("key-value", [])):
+        value = cast(dict[str, object], kv["value"])
+        uints[cast(str, kv["key"])] = cast(int, value.get("uint", 0))
+    return HolderRecord(
+        address, uints.get(keys.smart_asa_id, 0), bool(uints.get(keys.frozen, 0))
+    )
+
+
+def _fetch(
+    http: httpx.Client, address: str, app_id: int, retries: int, backoff: float
+) -> HolderRecord:
+    attempt = 0
+    while True:
+        try:
+            response = http.get(f"/v2/accounts/{address}/applications/{app_id}")
+        except httpx.TransportError:
+            if attempt >= retries:
+                raise
+        else:
+            if response.status_code == httpx.codes.NOT_FOUND:
+                return HolderRecord(address, None, None)
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                response.raise_for_status()
+                account_app = cast(dict[str, object], response.json())
+                return decode_local_state(
+                    address,
+                    cast(dict[str, object] | None, account_app.get("app-local-state")),
+                )
+        time.sleep(backoff * 2.0**attempt)
+        attempt += 1
+
+
+def algod_http_client(
+    algod: AlgodClient, *, concurrency: int = DEFAULT_CONCURRENCY
+) -> httpx.Client:
+    """Keep-alive HTTP client to the `algod` node, pooling `concurrency` connections"""
+    headers = {"X-Algo-API-Token": algod.algod_token, **(algod.headers or {})}
+    return httpx.Client(
+        base_url=algod.algod_address,
+        headers=headers,
+        limits=httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        ),
+        timeout=DEFAULT_TIMEOUT,
+    )
+
+
+def scan_holders(
+    algod: AlgodClient,
+    app_id: int,
+    addresses: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+) -> Iterator[HolderRecord]:
+    """
+    Streams the (address, smart_asa_id, frozen) records of `addresses` for the
+    SmartAsa `app_id`, in input order. Requests failing with a transport error or a
+    retryable status are retried `retries` times with exponential `backoff`.
+    """
+    with (
+        algod_http_client(algod, concurrency=concurrency) as http,
+        ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="scan") as pool,
+    ):
+        in_flight: deque[Future[HolderRecord]] = deque()
+        for address in addresses:
+            in_flight.append(
+                pool.submit(_fetch, http, address, app_id, retries, backoff)
+            )
+            if len(in_flight) >= 2 * concurrency:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
@@ -0,0 +1,76 @@
+import hashlib
+from collections.abc import Iterable
+from typing import cast
+
+from algosdk import encoding
+
+from . import config as cfg
+
+
+def leaf_hash(address: str) -> bytes:
+    return hashlib.sha256(
+        cfg.MERKLE_LEAF_PREFIX + cast(bytes, encoding.decode_address(address))
+    ).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Sorted pair hash, as verified by `SmartAsa.is_allowlisted`"""
+    return hashlib.sha256(
+        cfg.MERKLE_NODE_PREFIX + min(left, right) + max(left, right)
+    ).digest()
+
+
+class MerkleTree:
+    """
+    Transfer allowlist Merkle tree.
+
+    Leaves are the sorted, de-duplicated account leaf hashes. An unpaired node is
+    promoted to the next level as is, so proofs are only made of sibling hashes.
+    """
+
+    def __init__(self, addresses: Iterable[str]) -> None:
+        self.leaves = sorted({leaf_hash(address) for address in addresses})
+        if not self.leaves:
+            raise ValueError("Merkle tree requires at least one address")
+        self.levels = [self.leaves]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            self.levels.append(
+                [
+                    (
+                        node_hash(level[idx], level[idx + 1])
+                        if idx + 1 < len(level)
+                        else level[idx]
+                    )
+                    for idx in range(0, len(level), 2)
+                ]
+            )
+        self._leaf_index = {leaf: idx for idx, leaf in enumerate(self.leaves)}
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    def __contains__(self, address: str) -> bool:
+        return leaf_hash(address) in self._leaf_index
+
+    def proof(self, address: str) -> list[bytes]:
+        """Sibling hashes from the address leaf up to the root"""
+        try:
+            idx = self._leaf_index[leaf_hash(address)]
+        except KeyError as e:
+            raise ValueError(f"{address} is not in the Merkle tree") from e
+        proof = []
+        for level in self.levels[:-1]:
+            sibling = idx ^ 1
+            if sibling < len(level):
+                proof.append(level[sibling])
+            idx //= 2
+        return proof
+
+
+def verify(root: bytes, address: str, proof: Iterable[bytes]) -> bool:
+    node = leaf_hash(address)
+    for sibling in proof:
+        node = node_hash(node, sibling)
+    return node == root
@@ -0,0 +1,132 @@
+"""
+Bulk holders opt in to a SmartAsa (App and Controlled ASA).
+
+A holder opts in with a Controlled ASA opt in followed by the `asset_opt_in` app
+call (OptIn), both signed by the holder: one `send.opt_in.asset_opt_in` per holder
+waits for each confirmation. `opt_in_holders` packs the opt in pairs of up to 8
+holders in atomic groups of 16 transactions and keeps up to `concurrency` groups in
+flight:
+
+    for result in opt_in_holders(algod, app_id, smart_asa_id, holders):
+        ...
+
+Holders are funded accounts (at least `HOLDER_MIN_BALANCE` plus the opt in fees) with
+an `address` and a `signer` (e.g. AlgoKit Utils `SigningAccount`), not opted in yet.
+A failed opt in fails its whole group.
+"""
+
+import dataclasses
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Final, Protocol, cast
+
+from algosdk import abi, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.v2client.algod import AlgodClient
+from arc_common.suggested_params import SuggestedParamsCache
+
+from smart_contracts.smart_asa import config as cfg
+from smart_contracts.smart_asa.groups import MAX_GROUP_SIZE, map_groups
+from smart_contracts.smart_asa.transfers import DEFAULT_CONCURRENCY
+
+ASSET_OPT_IN_SIGNATURE: Final[str] = "asset_opt_in(uint64,axfer)void"
+TXNS_PER_HOLDER: Final[int] = 2
+HOLDERS_PER_GROUP: Final[int] = MAX_GROUP_SIZE // TXNS_PER_HOLDER
+# Minimum balance of an opted in holder: account, Controlled ASA and App local state.
+HOLDER_MIN_BALANCE: Final[int] = (
+    100_000 + 100_000 + 100_000 + 28_500 * cfg.LOCAL_UINTS + 50_000 * cfg.LOCAL_BYTES
+)
+
+
+class Holder(Protocol):
+    @property
+    def address(self) -> str: ...
+
+    @property
+    def signer(self) -> TransactionSigner: ...
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class HoldersGroupResult:
+    holders: list[str]
+    txids: list[str]
+    confirmed_round: int
+
+
+def build_opt_in_group(
+    sp: transaction.SuggestedParams,
+    app_id: int,
+    smart_asa_id: int,
+    holders: Sequence[str],
+) -> list[transaction.Transaction]:
+    """Controlled ASA opt in and `asset_opt_in` app call of each of `holders`"""
+    app_args = [
+        abi.Method.from_signature(ASSET_OPT_IN_SIGNATURE).get_selector(),
+        smart_asa_id.to_bytes(8, "big"),
+    ]
+    foreign_assets: list[int] = [smart_asa_id]
+    txns: list[transaction.Transaction] = []
+    for holder in holders:
+        txns.append(transaction.AssetOptInTxn(holder, sp, smart_asa_id))
+        txns.append(
+            transaction.ApplicationOptInTxn(
+                holder, sp, app_id, app_args=app_args, foreign_assets=foreign_assets
+            )
+        )
+    return cast(list[transaction.Transaction], transaction.assign_group_id(txns))
+
+
+def _send_group(
+    algod: AlgodClient,
+    holders: list[str],
+    txns: list[transaction.Transaction],
+    signed: list[transaction.GenericSignedTransaction],
+) -> HoldersGroupResult:
+    algod.send_transactions(signed)
+    txids = [cast(str, txn.get_txid()) for txn in txns]
+    confirmation = cast(
+        dict[str, object], transaction.wait_for_confirmation(algod, txids[0])
+    )
+    return HoldersGroupResult(
+        holders=holders,
+        txids=txids,
+        confirmed_round=cast(int, confirmation["confirmed-round"]),
+    )
+
+
+def opt_in_holders(
+    algod: AlgodClient,
+    app_id: int,
+    smart_asa_id: int,
+    holders: Iterable[Holder],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    params_cache: SuggestedParamsCache | None = None,
+) -> Iterator[HoldersGroupResult]:
+    """
+    Opts `holders` in to the `smart_asa_id` controlled by `app_id`, 8 holders per
+    atomic group, up to `concurrency` groups in flight, and streams the group
+    results in order. Holders are consumed lazily. Suggested params come from
+    `params_cache`, if shared with other callers.
+    """
+    params = params_cache or SuggestedParamsCache()
+
+    def opt_in(chunk: list[Holder]) -> HoldersGroupResult:
+        addresses = [holder.address for holder in chunk]
+        txns = build_opt_in_group(params.get(algod), app_id, smart_asa_id, addresses)
+        signed: list[transaction.GenericSignedTransaction] = []
+        for idx, holder in enumerate(chunk):
+            first = idx * TXNS_PER_HOLDER
+            signed.extend(
+                holder.signer.sign_transactions(
+                    txns, list(range(first, first + TXNS_PER_HOLDER))
+                )
+            )
+        return _send_group(algod, addresses, txns, signed)
+
+    return map_groups(
+        opt_in,
+        holders,
+        group_size=HOLDERS_PER_GROUP,
+        concurrency=concurrency,
+        name="opt-in-holders",
+    )
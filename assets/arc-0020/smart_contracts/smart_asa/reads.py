@@ -0,0 +1,151 @@
+"""
+Batched read-only calls of the SmartAsa getters, through simulate.
+
+Each read-only call through the typed client costs a simulate request. Here up to 16
+getter calls are packed in one simulated group, larger batches are spread over
+parallel simulate requests, and the decoded ABI returns are returned in input order:
+
+    frozen = batch_read(
+        algod,
+        client.app_id,
+        [
+            GetAccountIsFrozenArgs(freeze_asset=smart_asa_id, freeze_account=address)
+            for address in addresses
+        ],
+        sender=caller.address,
+    )
+
+Calls are simulated without signatures and with unnamed resources allowed, `sender`
+only pays the (simulated) fees. Arguments are encoded with the precompiled encoders,
+struct returns (`get_asset_config`) decoded with the cached struct decoders.
+Calls carry their index in the group as note, so the same getter called twice with
+the same arguments in a group gets distinct transaction IDs.
+"""
+
+import base64
+from collections.abc import Callable, Iterable, Sequence
+from typing import Final, cast
+
+from algosdk import abi, transaction
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts.smart_asa.decoders import abi_struct_decoder
+from smart_contracts.smart_asa.encoders import AbiArgs, encode_args
+from smart_contracts.smart_asa.groups import MAX_GROUP_SIZE, map_groups
+
+DEFAULT_CONCURRENCY: Final[int] = 8
+# ARC-4 method return log prefix
+RETURN_PREFIX: Final[bytes] = bytes.fromhex("151f7c75")
+
+
+class SimulateError(Exception):
+    """A batched read-only call failed (e.g. a getter precondition)"""
+
+
+_STRUCT_RETURNS: Final[dict[str, type]] = {}
+_RETURN_DECODERS: Final[dict[str, Callable[[bytes], object]]] = {}
+
+
+def struct_returns() -> dict[str, type]:
+    """Typed client struct returned by each struct getter"""
+    if not _STRUCT_RETURNS:
+        # The typed client parses its App Spec at import: only import it on first use.
+        from smart_contracts.artifacts.smart_asa.smart_asa_client import AssetConfig
+
+        _STRUCT_RETURNS["get_asset_config"] = AssetConfig
+    return _STRUCT_RETURNS
+
+
+def return_decoder(method_signature: str) -> Callable[[bytes], object]:
+    """Decoder of the ABI return of a getter, built once per method"""
+    if method_signature not in _RETURN_DECODERS:
+        _RETURN_DECODERS[method_signature] = _return_decoder(method_signature)
+    return _RETURN_DECODERS[method_signature]
+
+
+def _return_decoder(method_signature: str) -> Callable[[bytes], object]:
+    method = abi.Method.from_signature(method_signature)
+    return_type = cast(abi.ABIType, method.returns.type)
+    struct_type = struct_returns().get(method.name)
+    if struct_type is not None:
+        return abi_struct_decoder(struct_type, str(return_type))
+
+    def decode(encoded: bytes) -> object:
+        return cast(object, return_type.decode(encoded))
+
+    return decode
+
+
+def simulate_group(
+    algod: AlgodClient,
+    app_id: int,
+    calls: Sequence[AbiArgs],
+    *,
+    sender: str,
+    sp: transaction.SuggestedParams,
+) -> list[object]:
+    """Simulates up to 16 getter calls (typed client `*Args`) as one group"""
+    txns = [
+        transaction.ApplicationNoOpTxn(
+            sender,
+            sp,
+            app_id,
+            app_args=encode_args(args),
+            note=idx.to_bytes(8, "big"),
+        )
+        for idx, args in enumerate(calls)
+    ]
+    if len(txns) > 1:
+        transaction.assign_group_id(txns)
+    request = SimulateRequest(
+        txn_groups=[
+            SimulateRequestTransactionGroup(
+                txns=[transaction.SignedTransaction(txn, None) for txn in txns]
+            )
+        ],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+    )
+    response = cast(dict[str, object], algod.simulate_transactions(request))
+    (group,) = cast(list[dict[str, object]], response["txn-groups"])
+    if "failure-message" in group:
+        raise SimulateError(str(group["failure-message"]))
+
+    results: list[object] = []
+    for args, txn_result in zip(
+        calls,
+        cast(list[dict[str, dict[str, object]]], group["txn-results"]),
+        strict=True,
+    ):
+        logs = cast(list[str], txn_result["txn-result"].get("logs", []))
+        abi_return = base64.b64decode(logs[-1])
+        if not abi_return.startswith(RETURN_PREFIX):
+            raise SimulateError(f"No ABI return in {args}")
+        decode = return_decoder(args.abi_method_signature)
+        results.append(decode(abi_return[len(RETURN_PREFIX) :]))
+    return results
+
+
+def batch_read(
+    algod: AlgodClient,
+    app_id: int,
+    calls: Iterable[AbiArgs],
+    *,
+    sender: str,
+    group_size: int = MAX_GROUP_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[object]:
+    """
+    Decoded returns of the getter `calls` (typed client `*Args`), in input order.
+    Calls are simulated in groups of `group_size`, up to `concurrency` in parallel.
+    """
+    sp = algod.suggested_params()
+    groups = map_groups(
+        lambda chunk: simulate_group(algod, app_id, chunk, sender=sender, sp=sp),
+        calls,
+        group_size=group_size,
+        concurrency=concurrency,
+        name="read",
+    )
+    return [result for group in groups for result in group]
@@ -0,0 +1,153 @@
+"""
+Snapshot reader for the SmartAsa app global state.
+
+The typed client reads global state one key at a time (an algod request per
+`client.state.global_state.<key>` access) and looks up the App Spec state keys on
+each access. A snapshot fetches the whole global state with a single algod request,
+decodes it through a key map built from the App Spec on first use, and serves typed
+attributes from memory:
+
+    snapshot = GlobalStateSnapshot(algod, client.app_id, ttl=2.0)
+    state = snapshot.state  # one algod request, until the TTL expires
+    state.total, state.reserve_addr, state.smart_asa_id
+
+Refresh policy: with `ttl=None` (default) the snapshot is only refreshed explicitly
+(`refresh()`), otherwise it is refreshed on access once older than `ttl` seconds.
+"""
+
+import base64
+import dataclasses
+import time
+from collections.abc import Callable
+from typing import Final, TypeAlias, cast
+
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.smart_asa.app_spec import app_spec
+
+KeyDecoder: TypeAlias = Callable[[dict[str, object]], object]
+
+ZERO_ADDRESS: Final[str] = encoding.encode_address(bytes(32))
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SmartAsaGlobalState:
+    total: int = 0
+    decimals: int = 0
+    default_frozen: bool = False
+    unit_name: str = ""
+    name: str = ""
+    url: str = ""
+    metadata_hash: bytes = b""
+    manager_addr: str = ZERO_ADDRESS
+    reserve_addr: str = ZERO_ADDRESS
+    freeze_addr: str = ZERO_ADDRESS
+    clawback_addr: str = ZERO_ADDRESS
+    smart_asa_id: int = 0
+    global_frozen: bool = False
+    allowlist_root: bytes = b""
+
+
+_FIELDS: Final[tuple[dataclasses.Field[object], ...]] = dataclasses.fields(
+    SmartAsaGlobalState
+)
+_FIELD_TYPES: Final[dict[str, object]] = {
+    field.name: cast(object, field.type) for field in _FIELDS
+}
+
+_encode_address: Final[Callable[[bytes], object]] = encoding.encode_address
+_VALUE_DECODERS: Final[dict[str, Callable[[bytes], object]]] = {
+    "AVMBytes": bytes,
+    "AVMString": bytes.decode,
+    "address": _encode_address,
+}
+
+_GLOBAL_STATE_KEYS: Final[dict[str, tuple[str, KeyDecoder]]] = {}
+
+
+def _key_decoder(name: str, value_type: str) -> KeyDecoder:
+    if value_type == "AVMUint64":
+        as_bool = _FIELD_TYPES[name] is bool
+
+        def decode_uint(value: dict[str, object]) -> object:
+            uint = cast(int, value.get("uint", 0))
+            return bool(uint) if as_bool else uint
+
+        return decode_uint
+
+    decode_bytes = _VALUE_DECODERS[value_type]
+
+    def decode(value: dict[str, object]) -> object:
+        return decode_bytes(base64.b64decode(cast(str, value.get("bytes", ""))))
+
+    return decode
+
+
+def global_state_keys() -> dict[str, tuple[str, KeyDecoder]]:
+    """Raw key (base64, as returned by algod) to field name and value decoder"""
+    if not _GLOBAL_STATE_KEYS:
+        _GLOBAL_STATE_KEYS.update(_global_state_keys())
+    return _GLOBAL_STATE_KEYS
+
+
+def _global_state_keys() -> dict[str, tuple[str, KeyDecoder]]:
+    return {
+        storage_key.key: (name, _key_decoder(name, storage_key.value_type))
+        for name, storage_key in app_spec().state.keys.global_state.items()
+        if name in _FIELD_TYPES
+    }
+
+
+def decode_global_state(global_state: list[dict[str, object]]) -> SmartAsaGlobalState:
+    """Decodes the `global-state` of an algod application info response"""
+    keys = global_state_keys()
+    values: dict[str, object] = {}
+    for entry in global_state:
+        key_info = keys.get(cast(str, entry["key"]))
+        if key_info is not None:
+            name, decode = key_info
+            values[name] = decode(cast(dict[str, object], entry["value"]))
+    return SmartAsaGlobalState(**values)  # type: ignore[arg-type]
+
+
+class GlobalStateSnapshot:
+    """Global state of a SmartAsa app, fetched at once and refreshed by TTL"""
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        app_id: int,
+        *,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.ttl = ttl
+        self.clock = clock
+        self.fetched_at: float | None = None
+        self._state: SmartAsaGlobalState | None = None
+
+    @property
+    def is_stale(self) -> bool:
+        if self.fetched_at is None:
+            return True
+        return self.ttl is not None and self.clock() - self.fetched_at >= self.ttl
+
+    @property
+    def state(self) -> SmartAsaGlobalState:
+        """The snapshot, fetched on first access and refreshed once stale"""
+        if self._state is None or self.is_stale:
+            return self.refresh()
+        return self._state
+
+    def refresh(self) -> SmartAsaGlobalState:
+        """Fetches the whole global state with a single algod request"""
+        app_info = cast(dict[str, object], self.algod.application_info(self.app_id))
+        params = cast(dict[str, object], app_info["params"])
+        self._state = decode_global_state(
+            cast(list[dict[str, object]], params.get("global-state", []))
+        )
+        self.fetched_at = self.clock()
+        return self._state
@@ -0,0 +1,301 @@
+"""
+Bulk transfer engine for SmartAsa `asset_transfer` calls.
+
+Sending one `send.asset_transfer` per transfer waits for each confirmation before
+the next one is sent. The engine chunks an iterable of transfers into atomic groups
+of up to 16 app calls, pools the group fees (inner transfers included) on the first
+call, and keeps up to `concurrency` groups in flight: groups are signed, submitted
+and confirmed concurrently, each retried on its own. Throughput (transfers per
+second) is traded for per-transfer latency:
+
+    for result in send_transfers(
+        algod, app_id, smart_asa_id, transfers, sender=reserve.address,
+        signer=reserve.signer,
+    ):
+        ...
+
+All the transfers are sent by the same `sender`, authorized for each of them (e.g.
+the reserve minting, the clawback or the holder itself). Groups are independent:
+their confirmation order is not the transfers order, so transfers depending on each
+other (e.g. spending a just received amount) must not be sent in the same run.
+
+Each app call carries a unique note (a random run nonce and the transfer ordinal),
+so identical transfers (same accounts and amount) have distinct transaction IDs,
+within a group, across groups sharing suggested params and across runs.
+"""
+
+import copy
+import dataclasses
+import secrets
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Final, cast
+
+from algosdk import error, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
+from arc_common.suggested_params import SuggestedParamsCache
+
+from smart_contracts.smart_asa.encoders import encode_args
+from smart_contracts.smart_asa.fees import INNER_TXNS
+from smart_contracts.smart_asa.groups import MAX_GROUP_SIZE, map_groups
+
+INNER_TXNS_PER_TRANSFER: Final[int] = INNER_TXNS["asset_transfer"]
+DEFAULT_CONCURRENCY: Final[int] = 4
+DEFAULT_RETRIES: Final[int] = 3
+DEFAULT_BACKOFF: Final[float] = 0.5
+# Rounds waited for a group confirmation before resubmitting it.
+DEFAULT_WAIT_ROUNDS: Final[int] = 4
+NONCE_SIZE: Final[int] = 8
+ORDINAL_SIZE: Final[int] = 8
+ASSET_TRANSFER_SIGNATURE: Final[str] = (
+    "asset_transfer(uint64,uint64,address,address)void"
+)
+
+_AlgodHTTPError: Final[type[error.AlgodHTTPError]] = error.AlgodHTTPError
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Transfer:
+    asset_sender: str
+    asset_receiver: str
+    asset_amount: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GroupResult:
+    transfers: list[Transfer]
+    txids: list[str]
+    confirmed_round: int
+    attempts: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _AssetTransferArgs:
+    # Same fields (in ABI order) as the typed client `AssetTransferArgs`
+    xfer_asset: int
+    asset_amount: int
+    asset_sender: str
+    asset_receiver: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return ASSET_TRANSFER_SIGNATURE
+
+
+def pooled_fee(sp: transaction.SuggestedParams, group_size: int) -> int:
+    """Fee of a group of `group_size` transfers, app calls and inner transfers"""
+    return cast(int, sp.min_fee) * (1 + INNER_TXNS_PER_TRANSFER) * group_size
+
+
+def transfer_note(nonce: bytes, ordinal: int) -> bytes:
+    """Note of the `ordinal`-th transfer of the run identified by `nonce`"""
+    return nonce + ordinal.to_bytes(ORDINAL_SIZE, "big")
+
+
+def build_group(
+    sp: transaction.SuggestedParams,
+    app_id: int,
+    smart_asa_id: int,
+    transfers: list[Transfer],
+    *,
+    sender: str,
+    notes: Sequence[bytes],
+) -> list[transaction.Transaction]:
+    """
+    `asset_transfer` app calls of `transfers`, fees pooled on the first call, each
+    with its (unique) note
+    """
+    app_address = get_application_address(app_id)
+    foreign_assets: list[int] = [smart_asa_id]
+    txns: list[transaction.Transaction] = []
+    for idx, (transfer, note) in enumerate(zip(transfers, notes, strict=True)):
+        fee_sp = copy.copy(sp)
+        fee_sp.fee = pooled_fee(sp, len(transfers)) if idx == 0 else 0
+        fee_sp.flat_fee = True
+        accounts: list[str] = []
+        for account in (transfer.asset_sender, transfer.asset_receiver):
+            if account != app_address and account not in accounts:
+                accounts.append(account)
+        txns.append(
+            transaction.ApplicationNoOpTxn(
+                sender,
+                fee_sp,
+                app_id,
+                app_args=encode_args(
+                    _AssetTransferArgs(
+                        xfer_asset=smart_asa_id,
+                        asset_amount=transfer.asset_amount,
+                        asset_sender=transfer.asset_sender,
+                        asset_receiver=transfer.asset_receiver,
+                    )
+                ),
+                accounts=accounts,
+                foreign_assets=foreign_assets,
+                note=note,
+            )
+        )
+    return cast(list[transaction.Transaction], transaction.assign_group_id(txns))
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, _AlgodHTTPError):
+        code = cast(int | None, exc.code)
+        return code is None or code >= 500 or code == 429
+    return isinstance(exc, OSError)
+
+
+class _GroupSender:
+    def __init__(
+        self,
+        algod: AlgodClient,
+        params: SuggestedParamsCache,
+        app_id: int,
+        smart_asa_id: int,
+        *,
+        sender: str,
+        signer: TransactionSigner,
+        retries: int,
+        backoff: float,
+        wait_rounds: int,
+    ) -> None:
+        self.algod = algod
+        self.params = params
+        self.app_id = app_id
+        self.smart_asa_id = smart_asa_id
+        self.sender = sender
+        self.signer = signer
+        self.retries = retries
+        self.backoff = backoff
+        self.wait_rounds = wait_rounds
+
+    def sign(
+        self,
+        transfers: list[Transfer],
+        notes: list[bytes],
+        sp: transaction.SuggestedParams,
+    ) -> tuple[list[transaction.GenericSignedTransaction], list[str]]:
+        txns = build_group(
+            sp,
+            self.app_id,
+            self.smart_asa_id,
+            transfers,
+            sender=self.sender,
+            notes=notes,
+        )
+        signed = self.signer.sign_transactions(txns, list(range(len(txns))))
+        return signed, [cast(str, txn.get_txid()) for txn in txns]
+
+    def is_expired(self, sp: transaction.SuggestedParams) -> bool:
+        status = cast(dict[str, object], self.algod.status())
+        return cast(int, status["last-round"]) > cast(int, sp.last)
+
+    def send(self, transfers: list[Transfer], notes: list[bytes]) -> GroupResult:
+        """
+        Signs, submits and confirms a group. A group not confirmed within
+        `wait_rounds` is resubmitted (e.g. its submission was lost or dropped from
+        the pool), as after a retryable error. Retries resubmit the same signed
+        group (a group already in the ledger is not executed twice); a group is
+        rebuilt with fresh suggested params only once its validity expired
+        unconfirmed. Out of retries, a group still unconfirmed may confirm until its
+        last valid round: the error says which.
+
+        "Already in ledger" is only expected when resubmitting a signed group this
+        sender already submitted (e.g. the response of the first submission was
+        lost): delivery is then checked by the confirmation as for any submission.
+        On a first submission it means the group is not this run's, and it raises.
+        """
+        sp = self.params.get(self.algod)
+        signed, txids = self.sign(transfers, notes, sp)
+        submitted = False
+        attempt = 0
+        while True:
+            try:
+                try:
+                    self.algod.send_transactions(signed)
+                except _AlgodHTTPError as e:
+                    if not submitted or "already in ledger" not in str(e):
+                        raise
+                finally:
+                    submitted = True
+                confirmation = cast(
+                    dict[str, object],
+                    transaction.wait_for_confirmation(
+                        self.algod, txids[0], wait_rounds=self.wait_rounds
+                    ),
+                )
+                return GroupResult(
+                    transfers=transfers,
+                    txids=txids,
+                    confirmed_round=cast(int, confirmation["confirmed-round"]),
+                    attempts=attempt + 1,
+                )
+            except error.ConfirmationTimeoutError as e:
+                if attempt >= self.retries:
+                    e.add_note(
+                        f"Group of {txids[0]} may still confirm until round {cast(int, sp.last)}"
+                    )
+                    raise
+                if self.is_expired(sp):
+                    sp = self.params.get(self.algod)
+                    signed, txids = self.sign(transfers, notes, sp)
+                    submitted = False
+            except Exception as e:
+                if not _is_retryable(e) or attempt >= self.retries:
+                    raise
+                time.sleep(self.backoff * 2.0**attempt)
+            attempt += 1
+
+
+def send_transfers(
+    algod: AlgodClient,
+    app_id: int,
+    smart_asa_id: int,
+    transfers: Iterable[Transfer],
+    *,
+    sender: str,
+    signer: TransactionSigner,
+    group_size: int = MAX_GROUP_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    wait_rounds: int = DEFAULT_WAIT_ROUNDS,
+    params_cache: SuggestedParamsCache | None = None,
+) -> Iterator[GroupResult]:
+    """
+    Sends `transfers` of the `smart_asa_id` controlled by `app_id` in atomic groups
+    of `group_size`, up to `concurrency` groups in flight, and streams the group
+    results in submission order. Transfers are consumed lazily. Suggested params
+    come from `params_cache`, if shared with other callers.
+
+    If a group fails, the groups in flight are drained and their results streamed
+    before the error is raised (see `map_groups`): the transfers of the streamed
+    results are confirmed, the others were not sent or failed.
+    """
+    group_sender = _GroupSender(
+        algod,
+        params_cache or SuggestedParamsCache(),
+        app_id,
+        smart_asa_id,
+        sender=sender,
+        signer=signer,
+        retries=retries,
+        backoff=backoff,
+        wait_rounds=wait_rounds,
+    )
+    nonce = secrets.token_bytes(NONCE_SIZE)
+
+    def send(chunk: list[tuple[int, Transfer]]) -> GroupResult:
+        return group_sender.send(
+            [transfer for _, transfer in chunk],
+            [transfer_note(nonce, ordinal) for ordinal, _ in chunk],
+        )
+
+    return map_groups(
+        send,
+        enumerate(transfers),
+        group_size=group_size,
+        concurrency=concurrency,
+        name="transfers",
+    )
@@ -0,0 +1,40 @@
+from typing import Final
+
+from smart_contracts.smart_asa.config import (  # noqa: F401
+    APP_BINDING,
+    DECIMALS,
+    DEFAULT_FROZEN,
+    MAX_BATCH_LEGS,
+    MERKLE_LEAF_PREFIX,
+    MERKLE_NODE_PREFIX,
+    NAME,
+    TOTAL,
+    UNIT_NAME,
+)
+from smart_contracts.smart_asa_packed.config import (  # noqa: F401
+    ADDRESS_SIZE,
+    UINT64_SIZE,
+)
+
+# State Schema
+GLOBAL_BYTES: Final[int] = 0
+GLOBAL_UINTS: Final[int] = 0
+LOCAL_BYTES: Final[int] = 0
+LOCAL_UINTS: Final[int] = 0
+
+# Box Storage
+CTRL_ASSET_BOX_PREFIX: Final[bytes] = b"a"
+HOLDING_BOX_PREFIX: Final[bytes] = b"h"
+# Holding box MBR: 2_500 + 400 * (key: prefix + Holding, value: Bool)
+HOLDING_BOX_MBR: Final[int] = 2_500 + 400 * (1 + 40 + 1)
+
+# Controlled Asset (ARC-4 encoded ControlledAsset, the AssetConfig tail starts at 35)
+GLOBAL_FROZEN_OFFSET: Final[int] = 0
+ALLOWLIST_ROOT_OFFSET: Final[int] = 1
+HASH_SIZE: Final[int] = 32
+TOTAL_OFFSET: Final[int] = 35
+DEFAULT_FROZEN_OFFSET: Final[int] = 47
+MANAGER_ADDR_OFFSET: Final[int] = 56
+RESERVE_ADDR_OFFSET: Final[int] = 88
+FREEZE_ADDR_OFFSET: Final[int] = 120
+CLAWBACK_ADDR_OFFSET: Final[int] = 152
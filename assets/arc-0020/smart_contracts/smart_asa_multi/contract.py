@@ -0,0 +1,228 @@
+from algopy import (
+    Account,
+    Asset,
+    BoxMap,
+    Bytes,
+    Global,
+    StateTotals,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+)
+
+from smart_contracts import errors as err
+from smart_contracts.avm_types import AssetConfig, ControlledAsset, Hash, Holding
+from smart_contracts.smart_asa.contract import SmartAsaBase
+
+from . import config as cfg
+
+
+class SmartAsaMulti(
+    SmartAsaBase,
+    state_totals=StateTotals(
+        global_bytes=cfg.GLOBAL_BYTES,
+        global_uints=cfg.GLOBAL_UINTS,
+        local_bytes=cfg.LOCAL_BYTES,
+        local_uints=cfg.LOCAL_UINTS,
+    ),
+):
+    """
+    ARC-0020 (Smart ASA) - Reference Implementation, multi-tenant variant
+
+    A single application controls many Smart ASAs. Each Controlled ASA state is a box
+    keyed by the ASA ID, each (Controlled ASA, Account) opt in is a box holding the
+    account frozen status. The opt in pays the holding box MBR, refunded on close out.
+
+    There is no Local State: opt in and close out are NoOp app calls, so an account
+    can hold any number of the Smart ASAs, and a Clear State leaves its holdings (and
+    their MBR) in place, to be closed out as usual.
+    """
+
+    def __init__(self) -> None:
+        # Preconditions
+        assert Txn.global_num_byte_slice == cfg.GLOBAL_BYTES, err.WRONG_GLOBAL_BYTES
+        assert Txn.global_num_uint == cfg.GLOBAL_UINTS, err.WRONG_GLOBAL_UINTS
+        assert Txn.local_num_byte_slice == cfg.LOCAL_BYTES, err.WRONG_LOCAL_BYTES
+        assert Txn.local_num_uint == cfg.LOCAL_UINTS, err.WRONG_LOCAL_UINTS
+
+        # BOX STORAGE
+        # Smart ASA Fields, by Controlled ASA ID
+        self.ctrl_assets = BoxMap(
+            UInt64, ControlledAsset, key_prefix=cfg.CTRL_ASSET_BOX_PREFIX
+        )
+        # Account Frozen, by (Controlled ASA ID, Account)
+        self.holdings = BoxMap(Holding, arc4.Bool, key_prefix=cfg.HOLDING_BOX_PREFIX)
+
+    @subroutine
+    def ctrl_asset_key(self, asset_id: UInt64) -> Bytes:
+        return cfg.CTRL_ASSET_BOX_PREFIX + op.itob(asset_id)
+
+    @subroutine
+    def config_role(self, asset_id: UInt64, offset: UInt64) -> Account:
+        return Account(
+            op.Box.extract(self.ctrl_asset_key(asset_id), offset, cfg.ADDRESS_SIZE)
+        )
+
+    @subroutine
+    def holding(self, asset_id: UInt64, account: Account) -> Holding:
+        return Holding(asset_id=arc4.UInt64(asset_id), account=arc4.Address(account))
+
+    @subroutine
+    def assert_common_preconditions(self, asset_id: UInt64) -> None:
+        assert asset_id in self.ctrl_assets, err.MISSING_CTRL_ASA
+
+    @subroutine
+    def assert_create_preconditions(self) -> None:
+        pass  # Any number of Controlled ASAs
+
+    @subroutine
+    def create_ctrl_asset(self, asset_id: UInt64, asset_config: AssetConfig) -> None:
+        self.ctrl_assets[asset_id] = ControlledAsset(
+            global_frozen=arc4.Bool(),
+            allowlist_root=Hash.from_bytes(Global.zero_address.bytes),
+            asset_config=asset_config.copy(),
+        )
+
+    @subroutine
+    def delete_ctrl_asset(self, asset_id: UInt64) -> None:
+        del self.ctrl_assets[asset_id]
+
+    @subroutine
+    def config_total(self, asset_id: UInt64) -> UInt64:
+        return op.btoi(
+            op.Box.extract(
+                self.ctrl_asset_key(asset_id), cfg.TOTAL_OFFSET, cfg.UINT64_SIZE
+            )
+        )
+
+    @subroutine
+    def config_default_frozen(self, asset_id: UInt64) -> bool:
+        default_frozen = op.Box.extract(
+            self.ctrl_asset_key(asset_id), cfg.DEFAULT_FROZEN_OFFSET, 1
+        )
+        return bool(op.getbit(default_frozen, 0))
+
+    @subroutine
+    def config_manager_addr(self, asset_id: UInt64) -> Account:
+        return self.config_role(asset_id, UInt64(cfg.MANAGER_ADDR_OFFSET))
+
+    @subroutine
+    def config_reserve_addr(self, asset_id: UInt64) -> Account:
+        return self.config_role(asset_id, UInt64(cfg.RESERVE_ADDR_OFFSET))
+
+    @subroutine
+    def config_freeze_addr(self, asset_id: UInt64) -> Account:
+        return self.config_role(asset_id, UInt64(cfg.FREEZE_ADDR_OFFSET))
+
+    @subroutine
+    def config_clawback_addr(self, asset_id: UInt64) -> Account:
+        return self.config_role(asset_id, UInt64(cfg.CLAWBACK_ADDR_OFFSET))
+
+    @subroutine
+    def load_asset_config(self, asset_id: UInt64) -> AssetConfig:
+        return self.ctrl_assets[asset_id].asset_config.copy()
+
+    @subroutine
+    def store_asset_config(self, asset_id: UInt64, asset_config: AssetConfig) -> None:
+        ctrl_asset = self.ctrl_assets[asset_id].copy()
+        ctrl_asset.asset_config = asset_config.copy()
+        # Dynamic fields may change the encoded size, the box is re-created.
+        del self.ctrl_assets[asset_id]
+        self.ctrl_assets[asset_id] = ctrl_asset.copy()
+
+    @subroutine
+    def is_global_frozen(self, asset_id: UInt64) -> bool:
+        global_frozen = op.Box.extract(
+            self.ctrl_asset_key(asset_id), cfg.GLOBAL_FROZEN_OFFSET, 1
+        )
+        return bool(op.getbit(global_frozen, 0))
+
+    @subroutine
+    def store_global_frozen(self, asset_id: UInt64, *, asset_frozen: bool) -> None:
+        op.Box.replace(
+            self.ctrl_asset_key(asset_id),
+            cfg.GLOBAL_FROZEN_OFFSET,
+            arc4.Bool(asset_frozen).bytes,
+        )
+
+    @subroutine
+    def has_allowlist(self, asset_id: UInt64) -> bool:
+        return self.load_allowlist_root(asset_id) != Global.zero_address.bytes
+
+    @subroutine
+    def load_allowlist_root(self, asset_id: UInt64) -> Bytes:
+        return op.Box.extract(
+            self.ctrl_asset_key(asset_id), cfg.ALLOWLIST_ROOT_OFFSET, cfg.HASH_SIZE
+        )
+
+    @subroutine
+    def store_allowlist_root(self, asset_id: UInt64, allowlist_root: Bytes) -> None:
+        op.Box.replace(
+            self.ctrl_asset_key(asset_id), cfg.ALLOWLIST_ROOT_OFFSET, allowlist_root
+        )
+
+    @subroutine
+    def is_holder(self, asset_id: UInt64, account: Account) -> bool:
+        return self.holding(asset_id, account) in self.holdings
+
+    @subroutine
+    def is_account_frozen(self, asset_id: UInt64, account: Account) -> bool:
+        return self.holdings[self.holding(asset_id, account)].native
+
+    @subroutine
+    def store_account_frozen(
+        self, asset_id: UInt64, account: Account, *, asset_frozen: bool
+    ) -> None:
+        self.holdings[self.holding(asset_id, account)] = arc4.Bool(asset_frozen)
+
+    @subroutine
+    def create_holding(
+        self, asset_id: UInt64, account: Account, *, asset_frozen: bool
+    ) -> None:
+        # Group: [holding box MBR payment, Controlled ASA opt in, Smart ASA opt in]
+        assert not self.is_holder(asset_id, account), err.OPT_IN_EXISTING
+        assert Txn.group_index >= 2, err.OPT_IN_MISSING_MBR
+        mbr_payment = gtxn.PaymentTransaction(Txn.group_index - 2)
+        # The holder pays the MBR, so the close out refunds whoever paid it.
+        assert mbr_payment.sender == account, err.OPT_IN_WRONG_MBR_SENDER
+        assert (
+            mbr_payment.receiver == Global.current_application_address
+        ), err.OPT_IN_WRONG_MBR_RECEIVER
+        assert mbr_payment.amount >= cfg.HOLDING_BOX_MBR, err.OPT_IN_WRONG_MBR_AMOUNT
+        self.holdings[self.holding(asset_id, account)] = arc4.Bool(asset_frozen)
+
+    @subroutine
+    def delete_holding(self, asset_id: UInt64, account: Account) -> None:
+        # Refunds the holding box MBR to the holder, who paid it on opt in, also for
+        # destroyed Smart ASAs.
+        del self.holdings[self.holding(asset_id, account)]
+        itxn.Payment(fee=0, receiver=account, amount=cfg.HOLDING_BOX_MBR).submit()
+
+    @arc4.abimethod
+    def asset_opt_in(
+        self, asset: Asset, ctrl_asa_opt_in: gtxn.AssetTransferTransaction
+    ) -> None:
+        """
+        Smart ASA opt in (Controlled ASA and holding box), a NoOp app call preceded
+        by the holding box MBR payment
+
+        Args:
+            asset: Smart ASA ID
+            ctrl_asa_opt_in: Controlled ASA opt in transaction
+        """
+        self.opt_in(asset, ctrl_asa_opt_in)
+
+    @arc4.abimethod
+    def asset_close_out(self, close_asset: Asset, close_to: Account) -> None:
+        """
+        Smart ASA close out (Controlled ASA and holding box), a NoOp app call
+
+        Args:
+            close_asset: Smart ASA ID to close out
+            close_to: Account to send all the Smart ASA remainder to.
+        """
+        self.close_out(close_asset, close_to)
@@ -0,0 +1,30 @@
+from typing import Final
+
+from smart_contracts.smart_asa.config import (  # noqa: F401
+    APP_BINDING,
+    DECIMALS,
+    DEFAULT_FROZEN,
+    LOCAL_BYTES,
+    LOCAL_UINTS,
+    MAX_BATCH_LEGS,
+    MERKLE_LEAF_PREFIX,
+    MERKLE_NODE_PREFIX,
+    NAME,
+    TOTAL,
+    UNIT_NAME,
+)
+
+# State Schema
+GLOBAL_BYTES: Final[int] = 1
+GLOBAL_UINTS: Final[int] = 2
+
+# Packed Asset Config (ARC-4 encoded AssetConfig static head)
+ASSET_CONFIG_BOX_KEY: Final[bytes] = b"asset_config"
+UINT64_SIZE: Final[int] = 8
+ADDRESS_SIZE: Final[int] = 32
+TOTAL_OFFSET: Final[int] = 0
+DEFAULT_FROZEN_OFFSET: Final[int] = 12
+MANAGER_ADDR_OFFSET: Final[int] = 21
+RESERVE_ADDR_OFFSET: Final[int] = 53
+FREEZE_ADDR_OFFSET: Final[int] = 85
+CLAWBACK_ADDR_OFFSET: Final[int] = 117
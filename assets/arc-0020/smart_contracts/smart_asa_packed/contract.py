@@ -0,0 +1,94 @@
+from algopy import (
+    Account,
+    Box,
+    StateTotals,
+    Txn,
+    UInt64,
+    op,
+    subroutine,
+)
+
+from smart_contracts import errors as err
+from smart_contracts.avm_types import AssetConfig
+from smart_contracts.smart_asa.contract import SingleSmartAsaBase
+
+from . import config as cfg
+
+
+class SmartAsaPacked(
+    SingleSmartAsaBase,
+    state_totals=StateTotals(
+        global_bytes=cfg.GLOBAL_BYTES,
+        global_uints=cfg.GLOBAL_UINTS,
+        local_bytes=cfg.LOCAL_BYTES,
+        local_uints=cfg.LOCAL_UINTS,
+    ),
+):
+    """
+    ARC-0020 (Smart ASA) - Reference Implementation, packed configuration layout
+
+    The Smart ASA configuration is stored ARC-4 encoded (AssetConfig) in a single box,
+    role addresses and total are read at fixed offsets of its static head.
+    """
+
+    def __init__(self) -> None:
+        # Preconditions
+        assert Txn.global_num_byte_slice == cfg.GLOBAL_BYTES, err.WRONG_GLOBAL_BYTES
+        assert Txn.global_num_uint == cfg.GLOBAL_UINTS, err.WRONG_GLOBAL_UINTS
+        assert Txn.local_num_byte_slice == cfg.LOCAL_BYTES, err.WRONG_LOCAL_BYTES
+        assert Txn.local_num_uint == cfg.LOCAL_UINTS, err.WRONG_LOCAL_UINTS
+
+        # BOX STORAGE
+        # ASA Fields
+        self.asset_config_box = Box(AssetConfig, key=cfg.ASSET_CONFIG_BOX_KEY)
+        # Smart ASA Fields
+        super().__init__()
+
+    @subroutine
+    def config_role(self, offset: UInt64) -> Account:
+        return Account(
+            op.Box.extract(cfg.ASSET_CONFIG_BOX_KEY, offset, cfg.ADDRESS_SIZE)
+        )
+
+    @subroutine
+    def config_total(self, asset_id: UInt64) -> UInt64:
+        return op.btoi(
+            op.Box.extract(cfg.ASSET_CONFIG_BOX_KEY, cfg.TOTAL_OFFSET, cfg.UINT64_SIZE)
+        )
+
+    @subroutine
+    def config_default_frozen(self, asset_id: UInt64) -> bool:
+        default_frozen = op.Box.extract(
+            cfg.ASSET_CONFIG_BOX_KEY, cfg.DEFAULT_FROZEN_OFFSET, 1
+        )
+        return bool(op.getbit(default_frozen, 0))
+
+    @subroutine
+    def config_manager_addr(self, asset_id: UInt64) -> Account:
+        return self.config_role(UInt64(cfg.MANAGER_ADDR_OFFSET))
+
+    @subroutine
+    def config_reserve_addr(self, asset_id: UInt64) -> Account:
+        return self.config_role(UInt64(cfg.RESERVE_ADDR_OFFSET))
+
+    @subroutine
+    def config_freeze_addr(self, asset_id: UInt64) -> Account:
+        return self.config_role(UInt64(cfg.FREEZE_ADDR_OFFSET))
+
+    @subroutine
+    def config_clawback_addr(self, asset_id: UInt64) -> Account:
+        return self.config_role(UInt64(cfg.CLAWBACK_ADDR_OFFSET))
+
+    @subroutine
+    def load_asset_config(self, asset_id: UInt64) -> AssetConfig:
+        return self.asset_config_box.value.copy()
+
+    @subroutine
+    def store_asset_config(self, asset_id: UInt64, asset_config: AssetConfig) -> None:
+        # Dynamic fields may change the encoded size, the box is re-created.
+        del self.asset_config_box.value
+        self.asset_config_box.value = asset_config.copy()
+
+    @subroutine
+    def delete_asset_config(self) -> None:
+        del self.asset_config_box.value
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import asdict, dataclass
 from typing import Final
 
@@ -13,6 +13,7 @@ from algokit_utils import (
 )
 from algokit_utils.config import config
 from algosdk.atomic_transaction_composer import TransactionWithSigner
+from arc_common.funding import MAX_GROUP_SIZE, AccountFunder
 
 from smart_contracts.artifacts.smart_asa.smart_asa_client import (
     AssetConfigArgs,
@@ -22,8 +23,31 @@ from smart_contracts.artifacts.smart_asa.smart_asa_client import (
     SmartAsaClient,
     SmartAsaFactory,
 )
+from smart_contracts.smart_asa.fees import FeePolicy
+from smart_contracts.smart_asa.opt_ins import opt_in_holders
+
+from .app_pool import AppPool
+
+pytest_plugins = ("arc_common.http_accounting",)
 
 INITIAL_FUNDS: Final[AlgoAmount] = AlgoAmount.from_algo(100)
+ROLES: Final[tuple[str, ...]] = (
+    "creator",
+    "manager",
+    "reserve",
+    "freeze",
+    "clawback",
+    "eve",
+)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--app-pool-size",
+        type=int,
+        default=MAX_GROUP_SIZE,
+        help="SmartAsa apps deployed per pool refill (1 deploys an app per test)",
+    )
 
 
 @dataclass
@@ -52,63 +76,53 @@ def algorand() -> AlgorandClient:
 
 
 @pytest.fixture(scope="session")
-def creator(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def fees(algorand: AlgorandClient) -> FeePolicy:
+    return FeePolicy(algorand.client.algod)
 
 
+# Session fixtures are per pytest-xdist worker: each worker has its own funder
+# (and worker dispenser), role accounts and app pool.
 @pytest.fixture(scope="session")
-def manager(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def funder(algorand: AlgorandClient) -> Iterator[AccountFunder]:
+    funder = AccountFunder(algorand, INITIAL_FUNDS)
+    yield funder
+    funder.close()
 
 
 @pytest.fixture(scope="session")
-def reserve(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def role_accounts(funder: AccountFunder) -> dict[str, SigningAccount]:
+    # All the role accounts are funded at once, in a single dispenser group.
+    return dict(zip(ROLES, funder.accounts(len(ROLES)), strict=True))
 
 
 @pytest.fixture(scope="session")
-def freeze(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def creator(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["creator"]
 
 
 @pytest.fixture(scope="session")
-def clawback(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def manager(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["manager"]
 
 
 @pytest.fixture(scope="session")
-def eve(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def reserve(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["reserve"]
+
+
+@pytest.fixture(scope="session")
+def freeze(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["freeze"]
+
+
+@pytest.fixture(scope="session")
+def clawback(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["clawback"]
+
+
+@pytest.fixture(scope="session")
+def eve(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["eve"]
 
 
 @pytest.fixture(scope="session")
@@ -118,27 +132,34 @@ def dummy_asa(algorand: AlgorandClient, creator: SigningAccount) -> int:
     ).asset_id
 
 
-@pytest.fixture(scope="function")
-def smart_asa_client_no_asset(
-    algorand: AlgorandClient, creator: SigningAccount
-) -> SmartAsaClient:
-    config.configure(
-        debug=False,
-        populate_app_call_resources=True,
-        # trace_all=True,
-    )
-
+@pytest.fixture(scope="session")
+def app_pool(
+    algorand: AlgorandClient,
+    creator: SigningAccount,
+    funder: AccountFunder,
+    pytestconfig: pytest.Config,
+) -> AppPool:
     factory = algorand.client.get_typed_app_factory(
         SmartAsaFactory,
         default_sender=creator.address,
         default_signer=creator.signer,
     )
-    client, _ = factory.send.create.bare()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=client.app_address,
-        min_spending_balance=INITIAL_FUNDS,
+    return AppPool(
+        algorand,
+        factory,
+        funder,
+        batch_size=pytestconfig.getoption("--app-pool-size"),
     )
-    return client
+
+
+@pytest.fixture(scope="function")
+def smart_asa_client_no_asset(app_pool: AppPool) -> SmartAsaClient:
+    config.configure(
+        debug=False,
+        populate_app_call_resources=True,
+        # trace_all=True,
+    )
+    return app_pool.client()
 
 
 @pytest.fixture(
@@ -164,46 +185,40 @@ def asa_config(
 def smart_asa_client(
     smart_asa_client_no_asset: SmartAsaClient,
     asa_config: ASAConfig,
+    fees: FeePolicy,
 ) -> SmartAsaClient:
-    sp = smart_asa_client_no_asset.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
-
     smart_asa_client_no_asset.send.asset_create(
         AssetCreateArgs(**asa_config.dictify()),
-        params=CommonAppCallParams(static_fee=AlgoAmount.from_micro_algo(sp.fee)),
+        params=CommonAppCallParams(static_fee=fees.method_fee("asset_create")),
     )
     return smart_asa_client_no_asset
 
 
+@pytest.fixture(scope="function")
+def make_opted_in_accounts(
+    funder: AccountFunder, smart_asa_client: SmartAsaClient
+) -> Callable[[int], list[SigningAccount]]:
+    def _make(count: int) -> list[SigningAccount]:
+        # Funded in grouped payments, opted in 8 accounts per group, concurrently.
+        accounts = funder.pooled_accounts(count)
+        for _ in opt_in_holders(
+            smart_asa_client.algorand.client.algod,
+            smart_asa_client.app_id,
+            smart_asa_client.state.global_state.smart_asa_id,
+            accounts,
+        ):
+            pass
+        return accounts
+
+    return _make
+
+
 @pytest.fixture(scope="function")
 def opted_in_account_factory(
-    algorand: AlgorandClient, smart_asa_client: SmartAsaClient
+    make_opted_in_accounts: Callable[[int], list[SigningAccount]],
 ) -> Callable[..., SigningAccount]:
     def _factory() -> SigningAccount:
-        account = algorand.account.random()
-        algorand.account.ensure_funded_from_environment(
-            account_to_fund=account.address,
-            min_spending_balance=INITIAL_FUNDS,
-        )
-        smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
-
-        smart_asa_client.send.opt_in.asset_opt_in(
-            AssetOptInArgs(
-                asset=smart_asa_id,
-                ctrl_asa_opt_in=TransactionWithSigner(
-                    txn=algorand.create_transaction.asset_opt_in(
-                        AssetOptInParams(asset_id=smart_asa_id, sender=account.address)
-                    ),
-                    signer=account.signer,
-                ),
-            ),
-            params=CommonAppCallParams(
-                signer=account.signer,
-                sender=account.address,
-            ),
-        )
-        return account
+        return make_opted_in_accounts(1)[0]
 
     return _factory
 
@@ -241,6 +256,7 @@ def reserve_with_supply(
     algorand: AlgorandClient,
     reserve: SigningAccount,
     smart_asa_client: SmartAsaClient,
+    fees: FeePolicy,
 ) -> SigningAccount:
     smart_asa = smart_asa_client.state.global_state
     smart_asa_id = smart_asa.smart_asa_id
@@ -260,9 +276,6 @@ def reserve_with_supply(
             sender=reserve.address,
         ),
     )
-    sp = smart_asa_client.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
     smart_asa_client.send.asset_transfer(
         AssetTransferArgs(
             xfer_asset=smart_asa_id,
@@ -271,7 +284,7 @@ def reserve_with_supply(
             asset_receiver=reserve.address,
         ),
         params=CommonAppCallParams(
-            static_fee=AlgoAmount.from_micro_algo(sp.fee),
+            static_fee=fees.method_fee("asset_transfer"),
             signer=reserve.signer,
             sender=reserve.address,
         ),
@@ -284,12 +297,10 @@ def account_with_supply(
     reserve: SigningAccount,
     smart_asa_client: SmartAsaClient,
     opted_in_account_factory: Callable[..., SigningAccount],
+    fees: FeePolicy,
 ) -> SigningAccount:
     account = opted_in_account_factory()
     smart_asa = smart_asa_client.state.global_state
-    sp = smart_asa_client.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
     smart_asa_client.send.asset_transfer(
         AssetTransferArgs(
             xfer_asset=smart_asa.smart_asa_id,
@@ -298,7 +309,7 @@ def account_with_supply(
             asset_receiver=account.address,
         ),
         params=CommonAppCallParams(
-            static_fee=AlgoAmount.from_micro_algo(sp.fee),
+            static_fee=fees.method_fee("asset_transfer"),
             signer=reserve.signer,
             sender=reserve.address,
         ),
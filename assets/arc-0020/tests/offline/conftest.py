@@ -0,0 +1,168 @@
+"""
+Offline fixtures: `SmartAsa` runs in process against the ledger emulated by the
+Algorand Python testing framework, no LocalNet (or node) required. Select these
+tests with `pytest -m offline`.
+
+These are a separate set of contract logic tests, not the LocalNet suite run in a
+second mode: they cover `asset_create`, `asset_opt_in`, the `asset_transfer` mint and
+its preconditions, and the getters. The other methods are only covered on LocalNet,
+`asset_freeze` in particular fails in the emulator (its single field event struct
+can not be constructed) and its offline test is an expected failure.
+
+The emulator executes the contract Python code, inner transactions are recorded
+but not applied to the emulated ledger: Controlled ASA balances are set on the
+ledger by the fixtures and tests that need them.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, TypedDict
+
+import pytest
+from algopy import Account, Asset, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.smart_asa import config as cfg
+from smart_contracts.smart_asa.contract import SmartAsa
+
+from ..conftest import ASAConfig
+
+if TYPE_CHECKING:
+    from _algopy_testing.models.txn_fields import ApplicationCallFields
+
+
+class AssetConfigArgs(TypedDict):
+    total: arc4.UInt64
+    decimals: arc4.UInt32
+    default_frozen: arc4.Bool
+    unit_name: arc4.String
+    name: arc4.String
+    url: arc4.String
+    metadata_hash: arc4.DynamicBytes
+    manager_addr: arc4.Address
+    reserve_addr: arc4.Address
+    freeze_addr: arc4.Address
+    clawback_addr: arc4.Address
+
+
+def asset_config_args(asa_config: ASAConfig) -> AssetConfigArgs:
+    """`asset_create` / `asset_config` ABI arguments of an ASA configuration"""
+    return {
+        "total": arc4.UInt64(asa_config.total),
+        "decimals": arc4.UInt32(asa_config.decimals),
+        "default_frozen": arc4.Bool(asa_config.default_frozen),
+        "unit_name": arc4.String(asa_config.unit_name),
+        "name": arc4.String(asa_config.name),
+        "url": arc4.String(asa_config.url),
+        "metadata_hash": arc4.DynamicBytes(asa_config.metadata_hash),
+        "manager_addr": arc4.Address(asa_config.manager_addr),
+        "reserve_addr": arc4.Address(asa_config.reserve_addr),
+        "freeze_addr": arc4.Address(asa_config.freeze_addr),
+        "clawback_addr": arc4.Address(asa_config.clawback_addr),
+    }
+
+
+@pytest.fixture(scope="function")
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture(scope="function")
+def creator(context: AlgopyTestContext) -> Account:
+    return context.any.account()
+
+
+@pytest.fixture(scope="function")
+def manager(context: AlgopyTestContext) -> Account:
+    return context.any.account()
+
+
+@pytest.fixture(scope="function")
+def reserve(context: AlgopyTestContext) -> Account:
+    return context.any.account()
+
+
+@pytest.fixture(scope="function")
+def freeze(context: AlgopyTestContext) -> Account:
+    return context.any.account()
+
+
+@pytest.fixture(scope="function")
+def clawback(context: AlgopyTestContext) -> Account:
+    return context.any.account()
+
+
+@pytest.fixture(scope="function")
+def eve(context: AlgopyTestContext) -> Account:
+    return context.any.account()
+
+
+@pytest.fixture(scope="function")
+def asa_config(
+    manager: Account, reserve: Account, freeze: Account, clawback: Account
+) -> ASAConfig:
+    return ASAConfig(
+        manager_addr=str(manager),
+        reserve_addr=str(reserve),
+        freeze_addr=str(freeze),
+        clawback_addr=str(clawback),
+    )
+
+
+@pytest.fixture(scope="function")
+def smart_asa_no_asset(context: AlgopyTestContext, creator: Account) -> SmartAsa:
+    # App create call, with the state schema checked by `SmartAsa.__init__`.
+    app_create: ApplicationCallFields = {
+        "sender": creator,
+        "global_num_bytes": UInt64(cfg.GLOBAL_BYTES),
+        "global_num_uint": UInt64(cfg.GLOBAL_UINTS),
+        "local_num_bytes": UInt64(cfg.LOCAL_BYTES),
+        "local_num_uint": UInt64(cfg.LOCAL_UINTS),
+    }
+    with context.txn.create_group(active_txn_overrides=app_create):
+        return SmartAsa()
+
+
+@pytest.fixture(scope="function")
+def smart_asa(
+    context: AlgopyTestContext,
+    creator: Account,
+    smart_asa_no_asset: SmartAsa,
+    asa_config: ASAConfig,
+) -> SmartAsa:
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        smart_asa_id = smart_asa_no_asset.asset_create(**asset_config_args(asa_config))
+    # The Controlled ASA is created with the whole supply held by the app.
+    context.ledger.update_asset_holdings(
+        smart_asa_id.native,
+        context.ledger.get_app(smart_asa_no_asset).address,
+        balance=cfg.TOTAL,
+    )
+    return smart_asa_no_asset
+
+
+@pytest.fixture(scope="function")
+def smart_asa_asset(smart_asa: SmartAsa) -> Asset:
+    return Asset(smart_asa.smart_asa_id)
+
+
+@pytest.fixture(scope="function")
+def opted_in_account_factory(
+    context: AlgopyTestContext, smart_asa: SmartAsa, smart_asa_asset: Asset
+) -> Callable[[], Account]:
+    def _factory() -> Account:
+        account = context.any.account()
+        context.ledger.update_asset_holdings(smart_asa_asset, account)
+        ctrl_asa_opt_in = context.any.txn.asset_transfer(
+            sender=account, asset_receiver=account, xfer_asset=smart_asa_asset
+        )
+        with context.txn.create_group(active_txn_overrides={"sender": account}):
+            smart_asa.asset_opt_in(smart_asa_asset, ctrl_asa_opt_in)
+        return account
+
+    return _factory
+
+
+@pytest.fixture(scope="function")
+def receiver(opted_in_account_factory: Callable[[], Account]) -> Account:
+    return opted_in_account_factory()
@@ -0,0 +1,72 @@
+import pytest
+from algopy import Account, Asset
+from algopy_testing import AlgopyTestContext
+
+import smart_contracts.errors as err
+from smart_contracts.smart_asa import config as cfg
+from smart_contracts.smart_asa.contract import SmartAsa
+
+from ..conftest import ASAConfig
+from .conftest import asset_config_args
+
+pytestmark = pytest.mark.offline
+
+
+def test_pass_asset_create(
+    context: AlgopyTestContext,
+    creator: Account,
+    smart_asa_no_asset: SmartAsa,
+    asa_config: ASAConfig,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        smart_asa_id = smart_asa_no_asset.asset_create(**asset_config_args(asa_config))
+
+    app = context.ledger.get_app(smart_asa_no_asset)
+    ctrl_asa = context.txn.last_group.last_itxn.asset_config
+    assert smart_asa_id.native == ctrl_asa.created_asset.id
+    assert smart_asa_no_asset.smart_asa_id == smart_asa_id.native
+    assert ctrl_asa.total == cfg.TOTAL
+    assert ctrl_asa.default_frozen == cfg.DEFAULT_FROZEN
+    assert ctrl_asa.url == cfg.APP_BINDING + str(app.id).encode()
+    assert ctrl_asa.manager == app.address
+    assert ctrl_asa.clawback == app.address
+    assert smart_asa_no_asset.total == asa_config.total
+    assert smart_asa_no_asset.reserve_addr == Account(asa_config.reserve_addr)
+
+
+def test_fail_wrong_state_schema(context: AlgopyTestContext) -> None:
+    with pytest.raises(AssertionError, match=err.WRONG_GLOBAL_BYTES):
+        SmartAsa()
+
+
+def test_fail_unauthorized(
+    context: AlgopyTestContext,
+    eve: Account,
+    smart_asa_no_asset: SmartAsa,
+    asa_config: ASAConfig,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": eve}):
+        with pytest.raises(AssertionError, match=err.UNAUTHORIZED):
+            smart_asa_no_asset.asset_create(**asset_config_args(asa_config))
+
+
+def test_fail_existing_ctrl_asa(
+    context: AlgopyTestContext,
+    creator: Account,
+    smart_asa: SmartAsa,
+    asa_config: ASAConfig,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        with pytest.raises(AssertionError, match=err.EXISTING_CTRL_ASA):
+            smart_asa.asset_create(**asset_config_args(asa_config))
+
+
+def test_pass_get_asset_config(
+    smart_asa: SmartAsa, smart_asa_asset: Asset, asa_config: ASAConfig
+) -> None:
+    asset_config = smart_asa.get_asset_config(smart_asa_asset)
+    args = asset_config_args(asa_config)
+    assert asset_config.total == args["total"]
+    assert asset_config.name == args["name"]
+    assert asset_config.metadata_hash == args["metadata_hash"]
+    assert asset_config.clawback_addr == args["clawback_addr"]
@@ -0,0 +1,154 @@
+from collections.abc import Callable
+
+import pytest
+from algopy import Account, Asset, arc4
+from algopy_testing import AlgopyTestContext
+
+import smart_contracts.errors as err
+from smart_contracts.smart_asa import config as cfg
+from smart_contracts.smart_asa.contract import SmartAsa
+
+from ..conftest import ASAConfig
+
+pytestmark = pytest.mark.offline
+
+
+def test_pass_asset_opt_in(
+    smart_asa: SmartAsa, receiver: Account, smart_asa_asset: Asset
+) -> None:
+    assert smart_asa.account_smart_asa_id[receiver] == smart_asa_asset.id
+    assert not smart_asa.account_frozen[receiver]
+
+
+def test_fail_opt_in_wrong_asa(
+    context: AlgopyTestContext, smart_asa: SmartAsa, smart_asa_asset: Asset
+) -> None:
+    account = context.any.account()
+    context.ledger.update_asset_holdings(smart_asa_asset, account)
+    ctrl_asa_opt_in = context.any.txn.asset_transfer(
+        sender=account, asset_receiver=account, xfer_asset=context.any.asset()
+    )
+    with context.txn.create_group(active_txn_overrides={"sender": account}):
+        with pytest.raises(AssertionError, match=err.OPT_IN_WRONG_ASA):
+            smart_asa.asset_opt_in(smart_asa_asset, ctrl_asa_opt_in)
+
+
+def test_pass_mint(
+    context: AlgopyTestContext,
+    reserve: Account,
+    receiver: Account,
+    smart_asa: SmartAsa,
+    smart_asa_asset: Asset,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": reserve}):
+        smart_asa.asset_transfer(
+            smart_asa_asset,
+            arc4.UInt64(42),
+            context.ledger.get_app(smart_asa).address,
+            receiver,
+        )
+    mint = context.txn.last_group.last_itxn.asset_transfer
+    assert mint.xfer_asset == smart_asa_asset
+    assert mint.asset_amount == 42
+    assert mint.asset_receiver == receiver
+
+
+def test_fail_unauthorized_reserve(
+    context: AlgopyTestContext,
+    eve: Account,
+    receiver: Account,
+    smart_asa: SmartAsa,
+    smart_asa_asset: Asset,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": eve}):
+        with pytest.raises(AssertionError, match=err.UNAUTHORIZED_RESERVE):
+            smart_asa.asset_transfer(
+                smart_asa_asset,
+                arc4.UInt64(1),
+                context.ledger.get_app(smart_asa).address,
+                receiver,
+            )
+
+
+def test_fail_over_mint(
+    context: AlgopyTestContext,
+    reserve: Account,
+    receiver: Account,
+    smart_asa: SmartAsa,
+    smart_asa_asset: Asset,
+    asa_config: ASAConfig,
+) -> None:
+    app_address = context.ledger.get_app(smart_asa).address
+    # Inner transfers are not applied to the emulated ledger: mint the supply here.
+    context.ledger.update_asset_holdings(
+        smart_asa_asset, app_address, balance=cfg.TOTAL - asa_config.total
+    )
+    with context.txn.create_group(active_txn_overrides={"sender": reserve}):
+        with pytest.raises(AssertionError, match=err.OVER_MINT):
+            smart_asa.asset_transfer(
+                smart_asa_asset, arc4.UInt64(1), app_address, receiver
+            )
+
+
+def test_fail_receiver_frozen(
+    context: AlgopyTestContext,
+    freeze: Account,
+    reserve: Account,
+    receiver: Account,
+    smart_asa: SmartAsa,
+    smart_asa_asset: Asset,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": freeze}):
+        smart_asa.account_freeze(smart_asa_asset, receiver, arc4.Bool(True))
+    with context.txn.create_group(active_txn_overrides={"sender": reserve}):
+        with pytest.raises(AssertionError, match=err.RECEIVER_FROZEN):
+            smart_asa.asset_transfer(
+                smart_asa_asset,
+                arc4.UInt64(1),
+                context.ledger.get_app(smart_asa).address,
+                receiver,
+            )
+
+
+@pytest.mark.xfail(
+    raises=TypeError,
+    strict=True,
+    reason="algorand-python-testing can not construct the single field AssetFreeze "
+    "event struct: asset_freeze is only covered on LocalNet (tests/test_asset_freeze.py)",
+)
+def test_pass_asset_freeze(
+    context: AlgopyTestContext,
+    freeze: Account,
+    smart_asa: SmartAsa,
+    smart_asa_asset: Asset,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": freeze}):
+        smart_asa.asset_freeze(smart_asa_asset, arc4.Bool(True))
+    assert smart_asa.get_asset_is_frozen(smart_asa_asset).native
+
+
+def test_fail_global_frozen(
+    context: AlgopyTestContext,
+    smart_asa: SmartAsa,
+    smart_asa_asset: Asset,
+    opted_in_account_factory: Callable[[], Account],
+) -> None:
+    sender, receiver = opted_in_account_factory(), opted_in_account_factory()
+    # Set directly: asset_freeze fails in the emulator (see test_pass_asset_freeze).
+    smart_asa.global_frozen = True
+    assert smart_asa.get_asset_is_frozen(smart_asa_asset).native
+    with context.txn.create_group(active_txn_overrides={"sender": sender}):
+        with pytest.raises(AssertionError, match=err.GLOBAL_FROZEN):
+            smart_asa.asset_transfer(smart_asa_asset, arc4.UInt64(1), sender, receiver)
+
+
+def test_pass_get_circulating_supply(
+    context: AlgopyTestContext, smart_asa: SmartAsa, smart_asa_asset: Asset
+) -> None:
+    assert smart_asa.get_circulating_supply(smart_asa_asset).native == 0
+    context.ledger.update_asset_holdings(
+        smart_asa_asset,
+        context.ledger.get_app(smart_asa).address,
+        balance=cfg.TOTAL - 42,
+    )
+    assert smart_asa.get_circulating_supply(smart_asa_asset).native == 42
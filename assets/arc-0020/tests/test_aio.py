@@ -0,0 +1,137 @@
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from algokit_utils import CommonAppCallParams, SigningAccount
+from arc_common.aio import AsyncAlgodClient
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AccountFreezeArgs,
+    AssetConfig,
+    AssetTransferArgs,
+    GetAccountIsFrozenArgs,
+    GetAssetConfigArgs,
+    GetAssetIsFrozenArgs,
+    GetCirculatingSupplyArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.aio import AsyncSmartAsaClient
+from smart_contracts.smart_asa.encoders import encode_args
+from smart_contracts.smart_asa.reads import SimulateError
+from smart_contracts.smart_asa.state import GlobalStateSnapshot
+
+from .conftest import ASAConfig
+
+
+def async_client(
+    smart_asa_client: SmartAsaClient, sender: SigningAccount
+) -> AsyncSmartAsaClient:
+    return AsyncSmartAsaClient(
+        AsyncAlgodClient.from_algod(smart_asa_client.algorand.client.algod),
+        smart_asa_client.app_id,
+        default_sender=sender.address,
+        default_signer=sender.signer,
+    )
+
+
+def test_pass_params_references(
+    creator: SigningAccount,
+    eve: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    asa_config: ASAConfig,
+) -> None:
+    client = async_client(smart_asa_client, creator)
+    args = AssetTransferArgs(
+        xfer_asset=42,
+        asset_amount=1,
+        asset_sender=asa_config.reserve_addr,
+        asset_receiver=eve.address,
+    )
+    params = client.params.asset_transfer(args)
+    assert params.sender == creator.address
+    assert params.args == encode_args(args)
+    assert params.account_references == [asa_config.reserve_addr, eve.address]
+    assert params.asset_references == [42]
+    # Identical calls get distinct notes (and transaction IDs).
+    assert params.note != client.params.asset_transfer(args).note
+
+
+def test_pass_async_getters(
+    creator: SigningAccount, smart_asa_client: SmartAsaClient, asa_config: ASAConfig
+) -> None:
+    smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
+
+    async def read() -> list[object]:
+        client = async_client(smart_asa_client, creator)
+        async with client.algod:
+            results = await asyncio.gather(
+                client.send.get_asset_config(GetAssetConfigArgs(asset=smart_asa_id)),
+                client.send.get_asset_is_frozen(
+                    GetAssetIsFrozenArgs(freeze_asset=smart_asa_id)
+                ),
+                client.send.get_circulating_supply(
+                    GetCirculatingSupplyArgs(asset=smart_asa_id)
+                ),
+            )
+            return list(results)
+
+    assert asyncio.run(read()) == [AssetConfig(**asa_config.dictify()), False, 0]
+
+
+def test_pass_async_send_and_state(
+    freeze: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    opted_in_account_factory: Callable[[], SigningAccount],
+) -> None:
+    smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
+    account = opted_in_account_factory()
+
+    async def freeze_account() -> tuple[bool, bool | None]:
+        client = async_client(smart_asa_client, freeze)
+        async with client.algod:
+            result = await client.send.account_freeze(
+                AccountFreezeArgs(
+                    freeze_asset=smart_asa_id,
+                    freeze_account=account.address,
+                    asset_frozen=True,
+                )
+            )
+            assert result.abi_return is None
+            assert result.confirmation["confirmed-round"]
+            frozen = await client.send.get_account_is_frozen(
+                GetAccountIsFrozenArgs(
+                    freeze_asset=smart_asa_id, freeze_account=account.address
+                )
+            )
+            return frozen, (await client.state.local_state(account.address)).frozen
+
+    assert asyncio.run(freeze_account()) == (True, True)
+
+
+def test_pass_async_global_state(
+    creator: SigningAccount, smart_asa_client: SmartAsaClient
+) -> None:
+    async def global_state() -> object:
+        client = async_client(smart_asa_client, creator)
+        async with client.algod:
+            return await client.state.global_state()
+
+    snapshot = GlobalStateSnapshot(
+        smart_asa_client.algorand.client.algod, smart_asa_client.app_id
+    )
+    assert asyncio.run(global_state()) == snapshot.state
+
+
+def test_fail_async_getter_precondition(
+    creator: SigningAccount, smart_asa_client: SmartAsaClient, dummy_asa: int
+) -> None:
+    async def read() -> int:
+        client = async_client(smart_asa_client, creator)
+        async with client.algod:
+            return await client.send.get_circulating_supply(
+                GetCirculatingSupplyArgs(asset=dummy_asa),
+                params=CommonAppCallParams(sender=creator.address),
+            )
+
+    with pytest.raises(SimulateError, match="assert failed"):
+        asyncio.run(read())
@@ -0,0 +1,20 @@
+import dataclasses
+
+from algokit_utils import AlgorandClient
+
+from smart_contracts.artifacts.smart_asa import smart_asa_client
+from smart_contracts.smart_asa.app_spec import app_client, app_spec
+
+
+def test_pass_app_spec() -> None:
+    assert app_spec() is app_spec()
+    # The client generator drops the compiler info of the artifact.
+    assert (
+        dataclasses.replace(app_spec(), compiler_info=None) == smart_asa_client.APP_SPEC
+    )
+
+
+def test_pass_app_client() -> None:
+    client = app_client(AlgorandClient.default_localnet(), 1234)
+    assert client.app_id == 1234
+    assert client.app_spec is app_spec()
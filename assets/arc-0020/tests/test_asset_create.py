@@ -1,5 +1,5 @@
 import pytest
-from algokit_utils import AlgoAmount, CommonAppCallParams, LogicError, SigningAccount
+from algokit_utils import CommonAppCallParams, LogicError, SigningAccount
 
 import smart_contracts.errors as err
 import smart_contracts.smart_asa.config as cfg
@@ -7,6 +7,7 @@ from smart_contracts.artifacts.smart_asa.smart_asa_client import (
     AssetCreateArgs,
     SmartAsaClient,
 )
+from smart_contracts.smart_asa.fees import FeePolicy
 
 from .conftest import ASAConfig
 
@@ -14,14 +15,11 @@ from .conftest import ASAConfig
 def test_pass_asset_create(
     smart_asa_client_no_asset: SmartAsaClient,
     asa_config: ASAConfig,
+    fees: FeePolicy,
 ) -> None:
-    sp = smart_asa_client_no_asset.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
-
     smart_asa_id = smart_asa_client_no_asset.send.asset_create(
         AssetCreateArgs(**asa_config.dictify()),
-        params=CommonAppCallParams(static_fee=AlgoAmount.from_micro_algo(sp.fee)),
+        params=CommonAppCallParams(static_fee=fees.method_fee("asset_create")),
     ).abi_return
 
     # Verify Controlled ASA
@@ -57,16 +55,13 @@ def test_fail_unauthorized(
     smart_asa_client_no_asset: SmartAsaClient,
     eve: SigningAccount,
     asa_config: ASAConfig,
+    fees: FeePolicy,
 ) -> None:
-    sp = smart_asa_client_no_asset.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
-
     with pytest.raises(LogicError, match=err.UNAUTHORIZED):
         smart_asa_client_no_asset.send.asset_create(
             AssetCreateArgs(**asa_config.dictify()),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_create"),
                 signer=eve.signer,
                 sender=eve.address,
             ),
@@ -74,14 +69,12 @@ def test_fail_unauthorized(
 
 
 def test_fail_asa_already_created(
-    smart_asa_client: SmartAsaClient, asa_config: ASAConfig
+    smart_asa_client: SmartAsaClient,
+    asa_config: ASAConfig,
+    fees: FeePolicy,
 ) -> None:
-    sp = smart_asa_client.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
-
     with pytest.raises(LogicError, match=err.EXISTING_CTRL_ASA):
         smart_asa_client.send.asset_create(
             AssetCreateArgs(**asa_config.dictify()),
-            params=CommonAppCallParams(static_fee=AlgoAmount.from_micro_algo(sp.fee)),
+            params=CommonAppCallParams(static_fee=fees.method_fee("asset_create")),
         )
@@ -1,5 +1,5 @@
 import pytest
-from algokit_utils import AlgoAmount, CommonAppCallParams, LogicError, SigningAccount
+from algokit_utils import CommonAppCallParams, LogicError, SigningAccount
 from algosdk.constants import ZERO_ADDRESS
 from algosdk.error import AlgodHTTPError
 
@@ -8,19 +8,19 @@ from smart_contracts.artifacts.smart_asa.smart_asa_client import (
     AssetDestroyArgs,
     SmartAsaClient,
 )
+from smart_contracts.smart_asa.fees import FeePolicy
 
 
 def test_pass_destroy(
-    smart_asa_client: SmartAsaClient, manager: SigningAccount
+    smart_asa_client: SmartAsaClient,
+    manager: SigningAccount,
+    fees: FeePolicy,
 ) -> None:
     smart_asa = smart_asa_client.state.global_state
-    sp = smart_asa_client.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
     smart_asa_client.send.asset_destroy(
         AssetDestroyArgs(destroy_asset=smart_asa.smart_asa_id),
         params=CommonAppCallParams(
-            static_fee=AlgoAmount.from_micro_algo(sp.fee),
+            static_fee=fees.method_fee("asset_destroy"),
             signer=manager.signer,
             sender=manager.address,
         ),
@@ -52,17 +52,16 @@ def test_fail_invalid_ctrl_asa() -> None:
 
 
 def test_fail_unauthorized_manager(
-    smart_asa_client: SmartAsaClient, eve: SigningAccount
+    smart_asa_client: SmartAsaClient,
+    eve: SigningAccount,
+    fees: FeePolicy,
 ) -> None:
     smart_asa = smart_asa_client.state.global_state
-    sp = smart_asa_client.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
     with pytest.raises(LogicError, match=err.UNAUTHORIZED_MANAGER):
         smart_asa_client.send.asset_destroy(
             AssetDestroyArgs(destroy_asset=smart_asa.smart_asa_id),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_destroy"),
                 signer=eve.signer,
                 sender=eve.address,
             ),
@@ -74,16 +73,14 @@ def test_fail_still_in_circulation(
     smart_asa_client: SmartAsaClient,
     manager: SigningAccount,
     account_with_supply: SigningAccount,  # To have circulating supply
+    fees: FeePolicy,
 ) -> None:
     smart_asa = smart_asa_client.state.global_state
-    sp = smart_asa_client.algorand.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = sp.min_fee * 2
     with pytest.raises(LogicError, match="creator is holding only"):
         smart_asa_client.send.asset_destroy(
             AssetDestroyArgs(destroy_asset=smart_asa.smart_asa_id),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_destroy"),
                 signer=manager.signer,
                 sender=manager.address,
             ),
@@ -1,5 +1,5 @@
 import pytest
-from algokit_utils import AlgoAmount, CommonAppCallParams, LogicError, SigningAccount
+from algokit_utils import CommonAppCallParams, LogicError, SigningAccount
 
 import smart_contracts.errors as err
 from smart_contracts.artifacts.smart_asa.smart_asa_client import (
@@ -9,6 +9,7 @@ from smart_contracts.artifacts.smart_asa.smart_asa_client import (
     GetCirculatingSupplyArgs,
     SmartAsaClient,
 )
+from smart_contracts.smart_asa.fees import FeePolicy
 
 
 class TestMint:
@@ -18,6 +19,7 @@ class TestMint:
         reserve: SigningAccount,
         smart_asa_client: SmartAsaClient,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
         assert (
@@ -32,9 +34,6 @@ class TestMint:
             ).balance
             == 0
         )
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         smart_asa_client.send.asset_transfer(
             AssetTransferArgs(
                 xfer_asset=smart_asa.smart_asa_id,
@@ -43,7 +42,7 @@ class TestMint:
                 asset_receiver=receiver.address,
             ),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_transfer"),
                 signer=reserve.signer,
                 sender=reserve.address,
             ),
@@ -66,6 +65,7 @@ class TestMint:
         smart_asa_client: SmartAsaClient,
         reserve_and_clawback: SigningAccount,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
         assert (
@@ -80,9 +80,6 @@ class TestMint:
             ).balance
             == 0
         )
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         smart_asa_client.send.asset_transfer(
             AssetTransferArgs(
                 xfer_asset=smart_asa.smart_asa_id,
@@ -91,7 +88,7 @@ class TestMint:
                 asset_receiver=receiver.address,
             ),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_transfer"),
                 signer=reserve_and_clawback.signer,
                 sender=reserve_and_clawback.address,
             ),
@@ -114,11 +111,9 @@ class TestMint:
         eve: SigningAccount,
         smart_asa_client: SmartAsaClient,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.UNAUTHORIZED_RESERVE):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -128,7 +123,7 @@ class TestMint:
                     asset_receiver=receiver.address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=eve.signer,
                     sender=eve.address,
                 ),
@@ -139,11 +134,9 @@ class TestMint:
         clawback: SigningAccount,
         smart_asa_client: SmartAsaClient,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.UNAUTHORIZED_RESERVE):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -153,7 +146,7 @@ class TestMint:
                     asset_receiver=receiver.address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=clawback.signer,
                     sender=clawback.address,
                 ),
@@ -168,11 +161,9 @@ class TestMint:
         reserve: SigningAccount,
         smart_asa_client: SmartAsaClient,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.RECEIVER_FROZEN):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -182,7 +173,7 @@ class TestMint:
                     asset_receiver=receiver.address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=reserve.signer,
                     sender=reserve.address,
                 ),
@@ -193,11 +184,9 @@ class TestMint:
         self,
         reserve: SigningAccount,
         smart_asa_client: SmartAsaClient,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.SELF_MINT):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -207,7 +196,7 @@ class TestMint:
                     asset_receiver=smart_asa_client.app_address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=reserve.signer,
                     sender=reserve.address,
                 ),
@@ -218,11 +207,9 @@ class TestMint:
         reserve: SigningAccount,
         smart_asa_client: SmartAsaClient,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.OVER_MINT):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -232,7 +219,7 @@ class TestMint:
                     asset_receiver=receiver.address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=reserve.signer,
                     sender=reserve.address,
                 ),
@@ -242,7 +229,10 @@ class TestMint:
 class TestBurn:
     @pytest.mark.parametrize("asa_config", [False], indirect=True)
     def test_pass_as_reserve(
-        self, smart_asa_client: SmartAsaClient, reserve_with_supply: SigningAccount
+        self,
+        smart_asa_client: SmartAsaClient,
+        reserve_with_supply: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
         assert (
@@ -257,9 +247,6 @@ class TestBurn:
             ).balance
             == smart_asa.total
         )
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         smart_asa_client.send.asset_transfer(
             AssetTransferArgs(
                 xfer_asset=smart_asa.smart_asa_id,
@@ -268,7 +255,7 @@ class TestBurn:
                 asset_receiver=smart_asa_client.app_address,
             ),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_transfer"),
                 signer=reserve_with_supply.signer,
                 sender=reserve_with_supply.address,
             ),
@@ -291,6 +278,7 @@ class TestBurn:
         smart_asa_client: SmartAsaClient,
         reserve_and_clawback: SigningAccount,
         account_with_supply: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
         assert (
@@ -305,9 +293,6 @@ class TestBurn:
             ).balance
             == smart_asa.total
         )
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         smart_asa_client.send.asset_transfer(
             AssetTransferArgs(
                 xfer_asset=smart_asa.smart_asa_id,
@@ -316,7 +301,7 @@ class TestBurn:
                 asset_receiver=smart_asa_client.app_address,
             ),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_transfer"),
                 signer=reserve_and_clawback.signer,
                 sender=reserve_and_clawback.address,
             ),
@@ -336,12 +321,12 @@ class TestBurn:
 
     @pytest.mark.parametrize("asa_config", [False], indirect=True)
     def test_fail_unauthorized(
-        self, smart_asa_client: SmartAsaClient, account_with_supply: SigningAccount
+        self,
+        smart_asa_client: SmartAsaClient,
+        account_with_supply: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.UNAUTHORIZED_RESERVE):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -351,7 +336,7 @@ class TestBurn:
                     asset_receiver=smart_asa_client.app_address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=account_with_supply.signer,
                     sender=account_with_supply.address,
                 ),
@@ -363,11 +348,9 @@ class TestBurn:
         smart_asa_client: SmartAsaClient,
         clawback: SigningAccount,
         account_with_supply: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.UNAUTHORIZED_RESERVE):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -377,7 +360,7 @@ class TestBurn:
                     asset_receiver=smart_asa_client.app_address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=clawback.signer,
                     sender=clawback.address,
                 ),
@@ -395,11 +378,9 @@ class TestBurn:
         smart_asa_client: SmartAsaClient,
         reserve: SigningAccount,
         account_with_supply: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.CLAWBACK_BURN):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -409,7 +390,7 @@ class TestBurn:
                     asset_receiver=smart_asa_client.app_address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=reserve.signer,
                     sender=reserve.address,
                 ),
@@ -424,6 +405,7 @@ class TestClawback:
         clawback: SigningAccount,
         account_with_supply: SigningAccount,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
         assert (
@@ -438,9 +420,6 @@ class TestClawback:
             ).balance
             == 0
         )
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         smart_asa_client.send.asset_transfer(
             AssetTransferArgs(
                 xfer_asset=smart_asa.smart_asa_id,
@@ -449,7 +428,7 @@ class TestClawback:
                 asset_receiver=receiver.address,
             ),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_transfer"),
                 signer=clawback.signer,
                 sender=clawback.address,
             ),
@@ -480,11 +459,9 @@ class TestClawback:
         eve: SigningAccount,
         account_with_supply: SigningAccount,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.UNAUTHORIZED_CLAWBACK):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -494,7 +471,7 @@ class TestClawback:
                     asset_receiver=receiver.address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=eve.signer,
                     sender=eve.address,
                 ),
@@ -508,6 +485,7 @@ class TestRegularTransfer:
         smart_asa_client: SmartAsaClient,
         account_with_supply: SigningAccount,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa = smart_asa_client.state.global_state
         assert (
@@ -522,9 +500,6 @@ class TestRegularTransfer:
             ).balance
             == 0
         )
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         smart_asa_client.send.asset_transfer(
             AssetTransferArgs(
                 xfer_asset=smart_asa.smart_asa_id,
@@ -533,7 +508,7 @@ class TestRegularTransfer:
                 asset_receiver=receiver.address,
             ),
             params=CommonAppCallParams(
-                static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                static_fee=fees.method_fee("asset_transfer"),
                 signer=account_with_supply.signer,
                 sender=account_with_supply.address,
             ),
@@ -573,6 +548,7 @@ class TestRegularTransfer:
         freeze: SigningAccount,
         account_with_supply: SigningAccount,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa_client.send.asset_freeze(
             AssetFreezeArgs(
@@ -585,9 +561,6 @@ class TestRegularTransfer:
             ),
         )
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.GLOBAL_FROZEN):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -597,7 +570,7 @@ class TestRegularTransfer:
                     asset_receiver=receiver.address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=account_with_supply.signer,
                     sender=account_with_supply.address,
                 ),
@@ -610,6 +583,7 @@ class TestRegularTransfer:
         freeze: SigningAccount,
         account_with_supply: SigningAccount,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa_client.send.account_freeze(
             AccountFreezeArgs(
@@ -623,9 +597,6 @@ class TestRegularTransfer:
             ),
         )
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.SENDER_FROZEN):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -635,7 +606,7 @@ class TestRegularTransfer:
                     asset_receiver=receiver.address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=account_with_supply.signer,
                     sender=account_with_supply.address,
                 ),
@@ -648,6 +619,7 @@ class TestRegularTransfer:
         freeze: SigningAccount,
         account_with_supply: SigningAccount,
         receiver: SigningAccount,
+        fees: FeePolicy,
     ) -> None:
         smart_asa_client.send.account_freeze(
             AccountFreezeArgs(
@@ -661,9 +633,6 @@ class TestRegularTransfer:
             ),
         )
         smart_asa = smart_asa_client.state.global_state
-        sp = smart_asa_client.algorand.client.algod.suggested_params()
-        sp.flat_fee = True
-        sp.fee = sp.min_fee * 2
         with pytest.raises(LogicError, match=err.RECEIVER_FROZEN):
             smart_asa_client.send.asset_transfer(
                 AssetTransferArgs(
@@ -673,7 +642,7 @@ class TestRegularTransfer:
                     asset_receiver=receiver.address,
                 ),
                 params=CommonAppCallParams(
-                    static_fee=AlgoAmount.from_micro_algo(sp.fee),
+                    static_fee=fees.method_fee("asset_transfer"),
                     signer=account_with_supply.signer,
                     sender=account_with_supply.address,
                 ),
@@ -0,0 +1,198 @@
+from collections.abc import Callable
+
+import pytest
+from algokit_utils import AlgoAmount, CommonAppCallParams, LogicError, SigningAccount
+
+import smart_contracts.errors as err
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetTransferBatchArgs,
+    GetCirculatingSupplyArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.config import MAX_BATCH_LEGS
+
+
+def batch_fee(smart_asa_client: SmartAsaClient, legs: int) -> AlgoAmount:
+    sp = smart_asa_client.algorand.client.algod.suggested_params()
+    return AlgoAmount.from_micro_algo(sp.min_fee * (1 + legs))
+
+
+class TestBatchMint:
+    @pytest.mark.parametrize("asa_config", [False], indirect=True)
+    def test_pass_as_reserve(
+        self,
+        reserve: SigningAccount,
+        smart_asa_client: SmartAsaClient,
+        make_opted_in_accounts: Callable[[int], list[SigningAccount]],
+    ) -> None:
+        smart_asa = smart_asa_client.state.global_state
+        receivers = make_opted_in_accounts(3)
+        amount = smart_asa.total // len(receivers)
+        smart_asa_client.send.asset_transfer_batch(
+            AssetTransferBatchArgs(
+                xfer_asset=smart_asa.smart_asa_id,
+                legs=[
+                    (smart_asa_client.app_address, receiver.address, amount)
+                    for receiver in receivers
+                ],
+            ),
+            params=CommonAppCallParams(
+                static_fee=batch_fee(smart_asa_client, len(receivers)),
+                signer=reserve.signer,
+                sender=reserve.address,
+            ),
+        )
+        assert smart_asa_client.send.get_circulating_supply(
+            GetCirculatingSupplyArgs(asset=smart_asa.smart_asa_id)
+        ).abi_return == amount * len(receivers)
+        for receiver in receivers:
+            assert (
+                smart_asa_client.algorand.asset.get_account_information(
+                    receiver, smart_asa.smart_asa_id
+                ).balance
+                == amount
+            )
+
+    @pytest.mark.parametrize("asa_config", [False], indirect=True)
+    def test_fail_over_minting_across_legs(
+        self,
+        reserve: SigningAccount,
+        smart_asa_client: SmartAsaClient,
+        receiver: SigningAccount,
+    ) -> None:
+        smart_asa = smart_asa_client.state.global_state
+        leg = (smart_asa_client.app_address, receiver.address, smart_asa.total)
+        with pytest.raises(LogicError, match=err.OVER_MINT):
+            smart_asa_client.send.asset_transfer_batch(
+                AssetTransferBatchArgs(
+                    xfer_asset=smart_asa.smart_asa_id, legs=[leg, leg]
+                ),
+                params=CommonAppCallParams(
+                    static_fee=batch_fee(smart_asa_client, 2),
+                    signer=reserve.signer,
+                    sender=reserve.address,
+                ),
+            )
+
+    @pytest.mark.parametrize("asa_config", [True], indirect=True)
+    def test_fail_frozen_receiver(
+        self,
+        reserve: SigningAccount,
+        smart_asa_client: SmartAsaClient,
+        receiver: SigningAccount,
+    ) -> None:
+        smart_asa = smart_asa_client.state.global_state
+        with pytest.raises(LogicError, match=err.RECEIVER_FROZEN):
+            smart_asa_client.send.asset_transfer_batch(
+                AssetTransferBatchArgs(
+                    xfer_asset=smart_asa.smart_asa_id,
+                    legs=[
+                        (
+                            smart_asa_client.app_address,
+                            receiver.address,
+                            smart_asa.total,
+                        )
+                    ],
+                ),
+                params=CommonAppCallParams(
+                    static_fee=batch_fee(smart_asa_client, 1),
+                    signer=reserve.signer,
+                    sender=reserve.address,
+                ),
+            )
+
+
+class TestBatchRegularTransfer:
+    @pytest.mark.parametrize("asa_config", [False], indirect=True)
+    def test_pass_transfer(
+        self,
+        smart_asa_client: SmartAsaClient,
+        account_with_supply: SigningAccount,
+        make_opted_in_accounts: Callable[[int], list[SigningAccount]],
+    ) -> None:
+        smart_asa = smart_asa_client.state.global_state
+        receivers = make_opted_in_accounts(2)
+        smart_asa_client.send.asset_transfer_batch(
+            AssetTransferBatchArgs(
+                xfer_asset=smart_asa.smart_asa_id,
+                legs=[
+                    (account_with_supply.address, receiver.address, 1)
+                    for receiver in receivers
+                ],
+            ),
+            params=CommonAppCallParams(
+                static_fee=batch_fee(smart_asa_client, len(receivers)),
+                signer=account_with_supply.signer,
+                sender=account_with_supply.address,
+            ),
+        )
+        assert smart_asa_client.algorand.asset.get_account_information(
+            account_with_supply, smart_asa.smart_asa_id
+        ).balance == smart_asa.total - len(receivers)
+        for receiver in receivers:
+            assert (
+                smart_asa_client.algorand.asset.get_account_information(
+                    receiver, smart_asa.smart_asa_id
+                ).balance
+                == 1
+            )
+
+    @pytest.mark.parametrize("asa_config", [False], indirect=True)
+    def test_fail_unauthorized_leg(
+        self,
+        eve: SigningAccount,
+        smart_asa_client: SmartAsaClient,
+        account_with_supply: SigningAccount,
+        receiver: SigningAccount,
+    ) -> None:
+        smart_asa = smart_asa_client.state.global_state
+        with pytest.raises(LogicError, match=err.UNAUTHORIZED_CLAWBACK):
+            smart_asa_client.send.asset_transfer_batch(
+                AssetTransferBatchArgs(
+                    xfer_asset=smart_asa.smart_asa_id,
+                    legs=[(account_with_supply.address, receiver.address, 1)],
+                ),
+                params=CommonAppCallParams(
+                    static_fee=batch_fee(smart_asa_client, 1),
+                    signer=eve.signer,
+                    sender=eve.address,
+                ),
+            )
+
+
+class TestBatchSize:
+    @pytest.mark.parametrize("asa_config", [False], indirect=True)
+    def test_fail_empty_batch(
+        self, reserve: SigningAccount, smart_asa_client: SmartAsaClient
+    ) -> None:
+        smart_asa = smart_asa_client.state.global_state
+        with pytest.raises(LogicError, match=err.EMPTY_BATCH):
+            smart_asa_client.send.asset_transfer_batch(
+                AssetTransferBatchArgs(xfer_asset=smart_asa.smart_asa_id, legs=[]),
+                params=CommonAppCallParams(
+                    signer=reserve.signer,
+                    sender=reserve.address,
+                ),
+            )
+
+    @pytest.mark.parametrize("asa_config", [False], indirect=True)
+    def test_fail_oversized_batch(
+        self,
+        reserve: SigningAccount,
+        smart_asa_client: SmartAsaClient,
+        receiver: SigningAccount,
+    ) -> None:
+        smart_asa = smart_asa_client.state.global_state
+        leg = (smart_asa_client.app_address, receiver.address, 1)
+        with pytest.raises(LogicError, match=err.OVERSIZED_BATCH):
+            smart_asa_client.send.asset_transfer_batch(
+                AssetTransferBatchArgs(
+                    xfer_asset=smart_asa.smart_asa_id,
+                    legs=[leg] * (MAX_BATCH_LEGS + 1),
+                ),
+                params=CommonAppCallParams(
+                    static_fee=batch_fee(smart_asa_client, MAX_BATCH_LEGS + 1),
+                    signer=reserve.signer,
+                    sender=reserve.address,
+                ),
+            )
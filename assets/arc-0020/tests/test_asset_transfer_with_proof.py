@@ -0,0 +1,194 @@
+from collections.abc import Callable
+
+import pytest
+from algokit_utils import (
+    AssetTransferParams,
+    CommonAppCallParams,
+    LogicError,
+    SigningAccount,
+)
+
+import smart_contracts.errors as err
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetCloseOutArgs,
+    AssetTransferArgs,
+    AssetTransferWithProofArgs,
+    SetTransferAllowlistArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.fees import FeePolicy
+from smart_contracts.smart_asa.merkle import MerkleTree
+
+
+def set_allowlist(
+    smart_asa_client: SmartAsaClient, freeze: SigningAccount, allowlist: MerkleTree
+) -> None:
+    smart_asa_client.send.set_transfer_allowlist(
+        SetTransferAllowlistArgs(
+            freeze_asset=smart_asa_client.state.global_state.smart_asa_id,
+            allowlist_root=allowlist.root,
+        ),
+        params=CommonAppCallParams(
+            signer=freeze.signer,
+            sender=freeze.address,
+        ),
+    )
+
+
+@pytest.fixture(scope="function")
+def allowlist(
+    freeze: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    account_with_supply: SigningAccount,
+    receiver: SigningAccount,
+    make_opted_in_accounts: Callable[[int], list[SigningAccount]],
+) -> MerkleTree:
+    others = [account.address for account in make_opted_in_accounts(3)]
+    tree = MerkleTree([account_with_supply.address, receiver.address, *others])
+    set_allowlist(smart_asa_client, freeze, tree)
+    return tree
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_pass_allowlisted_transfer(
+    smart_asa_client: SmartAsaClient,
+    account_with_supply: SigningAccount,
+    receiver: SigningAccount,
+    allowlist: MerkleTree,
+    fees: FeePolicy,
+) -> None:
+    smart_asa = smart_asa_client.state.global_state
+    smart_asa_client.send.asset_transfer_with_proof(
+        AssetTransferWithProofArgs(
+            xfer_asset=smart_asa.smart_asa_id,
+            asset_amount=smart_asa.total,
+            asset_sender=account_with_supply.address,
+            asset_receiver=receiver.address,
+            sender_proof=[*allowlist.proof(account_with_supply.address)],
+            receiver_proof=[*allowlist.proof(receiver.address)],
+        ),
+        params=CommonAppCallParams(
+            static_fee=fees.method_fee("asset_transfer_with_proof"),
+            signer=account_with_supply.signer,
+            sender=account_with_supply.address,
+        ),
+    )
+    assert (
+        smart_asa_client.algorand.asset.get_account_information(
+            receiver, smart_asa.smart_asa_id
+        ).balance
+        == smart_asa.total
+    )
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_fail_receiver_not_allowlisted(
+    freeze: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    account_with_supply: SigningAccount,
+    receiver: SigningAccount,
+    fees: FeePolicy,
+) -> None:
+    allowlist = MerkleTree([account_with_supply.address, freeze.address])
+    set_allowlist(smart_asa_client, freeze, allowlist)
+    smart_asa = smart_asa_client.state.global_state
+    with pytest.raises(LogicError, match=err.RECEIVER_NOT_ALLOWLISTED):
+        smart_asa_client.send.asset_transfer_with_proof(
+            AssetTransferWithProofArgs(
+                xfer_asset=smart_asa.smart_asa_id,
+                asset_amount=smart_asa.total,
+                asset_sender=account_with_supply.address,
+                asset_receiver=receiver.address,
+                sender_proof=[*allowlist.proof(account_with_supply.address)],
+                receiver_proof=[*allowlist.proof(freeze.address)],
+            ),
+            params=CommonAppCallParams(
+                static_fee=fees.method_fee("asset_transfer_with_proof"),
+                signer=account_with_supply.signer,
+                sender=account_with_supply.address,
+            ),
+        )
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_fail_missing_allowlist(
+    smart_asa_client: SmartAsaClient,
+    account_with_supply: SigningAccount,
+    receiver: SigningAccount,
+    fees: FeePolicy,
+) -> None:
+    smart_asa = smart_asa_client.state.global_state
+    with pytest.raises(LogicError, match=err.MISSING_ALLOWLIST):
+        smart_asa_client.send.asset_transfer_with_proof(
+            AssetTransferWithProofArgs(
+                xfer_asset=smart_asa.smart_asa_id,
+                asset_amount=smart_asa.total,
+                asset_sender=account_with_supply.address,
+                asset_receiver=receiver.address,
+                sender_proof=[],
+                receiver_proof=[],
+            ),
+            params=CommonAppCallParams(
+                static_fee=fees.method_fee("asset_transfer_with_proof"),
+                signer=account_with_supply.signer,
+                sender=account_with_supply.address,
+            ),
+        )
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_fail_regular_transfer_without_proof(
+    smart_asa_client: SmartAsaClient,
+    account_with_supply: SigningAccount,
+    receiver: SigningAccount,
+    allowlist: MerkleTree,
+    fees: FeePolicy,
+) -> None:
+    smart_asa = smart_asa_client.state.global_state
+    with pytest.raises(LogicError, match=err.MISSING_ALLOWLIST_PROOF):
+        smart_asa_client.send.asset_transfer(
+            AssetTransferArgs(
+                xfer_asset=smart_asa.smart_asa_id,
+                asset_amount=smart_asa.total,
+                asset_sender=account_with_supply.address,
+                asset_receiver=receiver.address,
+            ),
+            params=CommonAppCallParams(
+                static_fee=fees.method_fee("asset_transfer"),
+                signer=account_with_supply.signer,
+                sender=account_with_supply.address,
+            ),
+        )
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_fail_close_out_not_to_creator(
+    smart_asa_client: SmartAsaClient,
+    account_with_supply: SigningAccount,
+    receiver: SigningAccount,
+    allowlist: MerkleTree,
+    fees: FeePolicy,
+) -> None:
+    smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
+    close_out = smart_asa_client.new_group().close_out.asset_close_out(
+        AssetCloseOutArgs(close_asset=smart_asa_id, close_to=receiver.address),
+        params=CommonAppCallParams(
+            static_fee=fees.method_fee("asset_close_out"),
+            signer=account_with_supply.signer,
+            sender=account_with_supply.address,
+        ),
+    )
+    close_out.add_transaction(
+        txn=smart_asa_client.algorand.create_transaction.asset_transfer(
+            AssetTransferParams(
+                sender=account_with_supply.address,
+                asset_id=smart_asa_id,
+                receiver=smart_asa_client.app_address,
+                close_asset_to=smart_asa_client.app_address,
+                amount=0,
+            )
+        ),
+        signer=account_with_supply.signer,
+    )
+    with pytest.raises(LogicError, match=err.ALLOWLIST_CLOSE_OUT):
+        close_out.send()
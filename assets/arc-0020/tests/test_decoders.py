@@ -0,0 +1,69 @@
+import dataclasses
+
+import pytest
+from algokit_utils import AppClientMethodCallParams
+from algosdk import abi
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetConfig,
+    GetAssetConfigArgs,
+    SmartAsaClient,
+    _init_dataclass,
+)
+from smart_contracts.smart_asa.decoders import (
+    REPRESENTATIONS,
+    Representation,
+    abi_struct_decoder,
+    decode_struct,
+    result_type,
+    struct_decoder,
+)
+
+from .conftest import ASAConfig
+
+ASSET_CONFIG_ABI: str = (
+    "(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)"
+)
+
+
+def test_pass_decode_matches_typed_client(asa_config: ASAConfig) -> None:
+    data = asa_config.dictify()
+    assert decode_struct(AssetConfig, data) == _init_dataclass(AssetConfig, data)
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_pass_representations(
+    asa_config: ASAConfig, representation: Representation
+) -> None:
+    data = asa_config.dictify()
+    decoded = decode_struct(AssetConfig, data, representation)
+    assert isinstance(decoded, result_type(AssetConfig, representation))
+    for field in dataclasses.fields(AssetConfig):
+        assert getattr(decoded, field.name) == data[field.name]
+
+
+def test_pass_decoder_is_cached() -> None:
+    assert struct_decoder(AssetConfig) is struct_decoder(AssetConfig)
+    assert struct_decoder(AssetConfig, "tuple") is not struct_decoder(AssetConfig)
+
+
+def test_pass_abi_decode(asa_config: ASAConfig) -> None:
+    data = asa_config.dictify()
+    values = [data[field.name] for field in dataclasses.fields(AssetConfig)]
+    encoded = abi.ABIType.from_string(ASSET_CONFIG_ABI).encode(values)
+    decoded = abi_struct_decoder(AssetConfig, ASSET_CONFIG_ABI)(encoded)
+    assert decoded == AssetConfig(**data)
+
+
+def test_pass_decode_get_asset_config(
+    smart_asa_client: SmartAsaClient, asa_config: ASAConfig
+) -> None:
+    args = GetAssetConfigArgs(asset=smart_asa_client.state.global_state.smart_asa_id)
+    # Undecoded (dict) ABI return, as AlgoKit Utils returns it to the typed client
+    result = smart_asa_client.app_client.send.call(
+        AppClientMethodCallParams(method=args.abi_method_signature, args=[args.asset])
+    )
+    assert isinstance(result.abi_return, dict)
+    assert decode_struct(AssetConfig, result.abi_return) == AssetConfig(
+        **asa_config.dictify()
+    )
@@ -19,6 +19,7 @@ def test_pass_create(smart_asa_client_no_asset: SmartAsaClient) -> None:
     assert state.clawback_addr == ZERO_ADDRESS
     assert state.smart_asa_id == 0
     assert not state.global_frozen
+    assert not state.allowlist_root
 
 
 def test_fail_update() -> None:
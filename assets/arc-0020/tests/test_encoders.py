@@ -0,0 +1,124 @@
+import dataclasses
+from typing import cast
+
+import pytest
+from algokit_utils import (
+    AssetOptInParams,
+    CommonAppCallParams,
+    SigningAccount,
+)
+from algosdk import abi
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetCreateArgs,
+    AssetOptInArgs,
+    AssetTransferArgs,
+    GetCirculatingSupplyArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.encoders import (
+    app_call_params,
+    args_encoder,
+    encode_args,
+)
+from smart_contracts.smart_asa.fees import FeePolicy
+
+from .conftest import ASAConfig
+
+
+def sdk_encode_args(
+    args: AssetTransferArgs | AssetCreateArgs, *values: object
+) -> list[bytes]:
+    method = abi.Method.from_signature(args.abi_method_signature)
+    return [
+        method.get_selector(),
+        *(
+            cast(abi.ABIType, arg.type).encode(value)
+            for arg, value in zip(method.args, values, strict=True)
+        ),
+    ]
+
+
+def test_pass_encode_args_matches_sdk(asa_config: ASAConfig) -> None:
+    transfer = AssetTransferArgs(
+        xfer_asset=42,
+        asset_amount=10**12,
+        asset_sender=asa_config.manager_addr,
+        asset_receiver=asa_config.reserve_addr,
+    )
+    assert encode_args(transfer) == sdk_encode_args(
+        transfer, 42, 10**12, asa_config.manager_addr, asa_config.reserve_addr
+    )
+
+    values = asa_config.dictify()
+    create = AssetCreateArgs(**values)
+    assert encode_args(create) == sdk_encode_args(
+        create, *(values[field.name] for field in dataclasses.fields(create))
+    )
+
+
+def test_pass_encoder_is_cached(asa_config: ASAConfig) -> None:
+    def args(amount: int) -> AssetTransferArgs:
+        return AssetTransferArgs(
+            xfer_asset=1,
+            asset_amount=amount,
+            asset_sender=asa_config.manager_addr,
+            asset_receiver=asa_config.manager_addr,
+        )
+
+    assert args_encoder(args(1)) is args_encoder(args(2))
+
+
+def test_fail_transaction_args(
+    smart_asa_client: SmartAsaClient, receiver: SigningAccount
+) -> None:
+    opt_in = smart_asa_client.algorand.create_transaction.asset_opt_in(
+        AssetOptInParams(
+            asset_id=smart_asa_client.state.global_state.smart_asa_id,
+            sender=receiver.address,
+        )
+    )
+    args = AssetOptInArgs(
+        asset=smart_asa_client.state.global_state.smart_asa_id,
+        ctrl_asa_opt_in=TransactionWithSigner(txn=opt_in, signer=receiver.signer),
+    )
+    with pytest.raises(ValueError, match="can not be precompiled"):
+        encode_args(args)
+
+
+def test_fail_missing_sender() -> None:
+    with pytest.raises(ValueError, match=r"params\.sender"):
+        app_call_params(1, GetCirculatingSupplyArgs(asset=1), CommonAppCallParams())
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_pass_precompiled_mint(
+    reserve: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    receiver: SigningAccount,
+    fees: FeePolicy,
+) -> None:
+    smart_asa = smart_asa_client.state.global_state
+    smart_asa_client.algorand.send.app_call(
+        app_call_params(
+            smart_asa_client.app_id,
+            AssetTransferArgs(
+                xfer_asset=smart_asa.smart_asa_id,
+                asset_amount=smart_asa.total,
+                asset_sender=smart_asa_client.app_address,
+                asset_receiver=receiver.address,
+            ),
+            CommonAppCallParams(
+                static_fee=fees.method_fee("asset_transfer"),
+                signer=reserve.signer,
+                sender=reserve.address,
+            ),
+        )
+    )
+    assert (
+        smart_asa_client.send.get_circulating_supply(
+            GetCirculatingSupplyArgs(asset=smart_asa.smart_asa_id)
+        ).abi_return
+        == smart_asa.total
+    )
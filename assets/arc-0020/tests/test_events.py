@@ -0,0 +1,173 @@
+import dataclasses
+from typing import cast
+
+import pytest
+from algokit_utils import CommonAppCallParams, SigningAccount
+from algosdk import abi
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AccountFreezeArgs,
+    AssetConfigArgs,
+    AssetFreezeArgs,
+    AssetTransferArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.events import (
+    EVENT_ARGS,
+    AccountFreeze,
+    AssetConfig,
+    AssetFreeze,
+    Burn,
+    Clawback,
+    Mint,
+    block_logs,
+    decode_event,
+    decode_logs,
+    event_selector,
+    supply_delta,
+)
+from smart_contracts.smart_asa.fees import FeePolicy
+
+from .conftest import ASAConfig
+
+
+def encode_event(event_type: type, **values: object) -> bytes:
+    # Keyword values in the event fields order.
+    args_type = abi.ABIType.from_string(EVENT_ARGS[event_type])
+    return event_selector(event_type) + args_type.encode(list(values.values()))
+
+
+def confirmation_logs(confirmation: object) -> list[str]:
+    # Base64 logs of the pending transaction response.
+    return cast(list[str], cast(dict[str, object], confirmation)["logs"])
+
+
+def test_pass_decode_events(asa_config: ASAConfig) -> None:
+    address = asa_config.manager_addr
+    assert decode_event(
+        encode_event(Mint, asset_receiver=address, asset_amount=42)
+    ) == Mint(asset_receiver=address, asset_amount=42)
+    assert decode_event(
+        encode_event(AccountFreeze, freeze_account=address, asset_frozen=True)
+    ) == AccountFreeze(freeze_account=address, asset_frozen=True)
+    values = asa_config.dictify()
+    asset_config = decode_event(
+        encode_event(
+            AssetConfig,
+            **{
+                field.name: values[field.name]
+                for field in dataclasses.fields(AssetConfig)
+            },
+        )
+    )
+    assert asset_config == AssetConfig(**asa_config.dictify())
+
+
+def test_pass_decode_logs_skips_other_logs() -> None:
+    abi_return = bytes.fromhex("151f7c75") + (1).to_bytes(8)
+    logs = [abi_return, encode_event(AssetFreeze, asset_frozen=True)]
+    assert list(decode_logs(logs)) == [AssetFreeze(asset_frozen=True)]
+
+
+def test_pass_supply_delta(asa_config: ASAConfig) -> None:
+    address = asa_config.manager_addr
+    assert supply_delta(Mint(asset_receiver=address, asset_amount=3)) == 3
+    assert supply_delta(Burn(asset_sender=address, asset_amount=3)) == -3
+    assert (
+        supply_delta(
+            Clawback(asset_sender=address, asset_receiver=address, asset_amount=3)
+        )
+        == 0
+    )
+
+
+def test_pass_block_logs_include_inner_calls() -> None:
+    log = encode_event(AssetFreeze, asset_frozen=False)
+    block = {
+        "block": {
+            "txns": [
+                {"txn": {"type": "pay"}},
+                {"txn": {"type": "appl", "apid": 1}, "dt": {"lg": [log]}},
+                {
+                    "txn": {"type": "appl", "apid": 2},
+                    "dt": {
+                        "lg": [b"other app"],
+                        "itx": [
+                            {"txn": {"type": "appl", "apid": 1}, "dt": {"lg": [log]}}
+                        ],
+                    },
+                },
+            ]
+        }
+    }
+    assert list(block_logs(block, app_id=1)) == [log, log]
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_pass_mint_event(
+    reserve: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    receiver: SigningAccount,
+    fees: FeePolicy,
+) -> None:
+    smart_asa = smart_asa_client.state.global_state
+    result = smart_asa_client.send.asset_transfer(
+        AssetTransferArgs(
+            xfer_asset=smart_asa.smart_asa_id,
+            asset_amount=smart_asa.total,
+            asset_sender=smart_asa_client.app_address,
+            asset_receiver=receiver.address,
+        ),
+        params=CommonAppCallParams(
+            static_fee=fees.method_fee("asset_transfer"),
+            signer=reserve.signer,
+            sender=reserve.address,
+        ),
+    )
+    assert list(decode_logs(confirmation_logs(result.confirmation))) == [
+        Mint(asset_receiver=receiver.address, asset_amount=smart_asa.total)
+    ]
+
+
+def test_pass_freeze_events(
+    freeze: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    receiver: SigningAccount,
+) -> None:
+    smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
+    result = smart_asa_client.send.asset_freeze(
+        AssetFreezeArgs(freeze_asset=smart_asa_id, asset_frozen=True),
+        params=CommonAppCallParams(sender=freeze.address, signer=freeze.signer),
+    )
+    assert list(decode_logs(confirmation_logs(result.confirmation))) == [
+        AssetFreeze(asset_frozen=True)
+    ]
+    result = smart_asa_client.send.account_freeze(
+        AccountFreezeArgs(
+            freeze_asset=smart_asa_id,
+            freeze_account=receiver.address,
+            asset_frozen=True,
+        ),
+        params=CommonAppCallParams(sender=freeze.address, signer=freeze.signer),
+    )
+    assert list(decode_logs(confirmation_logs(result.confirmation))) == [
+        AccountFreeze(freeze_account=receiver.address, asset_frozen=True)
+    ]
+
+
+def test_pass_asset_config_event(
+    manager: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    asa_config: ASAConfig,
+) -> None:
+    asa_config.name = "Reconfigured"
+    result = smart_asa_client.send.asset_config(
+        AssetConfigArgs(
+            config_asset=smart_asa_client.state.global_state.smart_asa_id,
+            **asa_config.dictify(),
+        ),
+        params=CommonAppCallParams(sender=manager.address, signer=manager.signer),
+    )
+    assert list(decode_logs(confirmation_logs(result.confirmation))) == [
+        AssetConfig(**asa_config.dictify())
+    ]
@@ -0,0 +1,101 @@
+import asyncio
+from typing import cast
+
+import pytest
+from algokit_utils import AlgoAmount, CommonAppCallParams
+from algosdk import transaction
+from algosdk.v2client.algod import AlgodClient
+from arc_common.suggested_params import SuggestedParamsCache
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AssetFreezeArgs,
+    AssetTransferArgs,
+    AssetTransferBatchArgs,
+)
+from smart_contracts.smart_asa.fees import (
+    BATCH_METHOD,
+    FeePolicy,
+    app_call_fee,
+    inner_txns,
+    method_fee,
+    with_fee,
+)
+
+from .conftest import ASAConfig
+
+SP = transaction.SuggestedParams(
+    fee=0, first=1, last=1001, gh="A" * 44, min_fee=1000, flat_fee=True
+)
+
+
+def transfer_args(asa_config: ASAConfig) -> AssetTransferArgs:
+    return AssetTransferArgs(
+        xfer_asset=1,
+        asset_amount=1,
+        asset_sender=asa_config.reserve_addr,
+        asset_receiver=asa_config.manager_addr,
+    )
+
+
+def test_pass_inner_txns(asa_config: ASAConfig) -> None:
+    legs = [(asa_config.reserve_addr, asa_config.manager_addr, 1) for _ in range(3)]
+    assert inner_txns(transfer_args(asa_config)) == 1
+    assert inner_txns(AssetFreezeArgs(freeze_asset=1, asset_frozen=True)) == 0
+    assert inner_txns(AssetTransferBatchArgs(xfer_asset=1, legs=legs)) == 3
+    assert app_call_fee(SP, AssetTransferBatchArgs(xfer_asset=1, legs=legs)) == 4000
+
+
+def test_pass_method_fee() -> None:
+    assert method_fee(SP, "asset_transfer") == 2000
+    assert method_fee(SP, "asset_freeze") == 1000
+
+
+def test_fail_batch_method_fee() -> None:
+    with pytest.raises(ValueError, match=BATCH_METHOD):
+        method_fee(SP, BATCH_METHOD)
+
+
+def test_pass_with_fee(asa_config: ASAConfig) -> None:
+    args = transfer_args(asa_config)
+    params = with_fee(CommonAppCallParams(note=b"note"), SP, args)
+    assert params.static_fee == AlgoAmount.from_micro_algo(2000)
+    assert params.note == b"note"
+    explicit = CommonAppCallParams(extra_fee=AlgoAmount.from_micro_algo(1000))
+    assert with_fee(explicit, SP, args) is explicit
+
+
+class _ParamsSource:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def suggested_params(self) -> transaction.SuggestedParams:
+        self.calls += 1
+        return SP
+
+
+class _AsyncParamsSource:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        self.calls += 1
+        return SP
+
+
+def test_pass_shared_params_cache() -> None:
+    algod = _ParamsSource()
+    aio_algod = _AsyncParamsSource()
+    params_cache = SuggestedParamsCache(ttl=60.0)
+    fees = FeePolicy(cast(AlgodClient, algod), params_cache=params_cache)
+    assert fees.method_fee("asset_transfer") == AlgoAmount.from_micro_algo(2000)
+    assert fees.method_fee("asset_create") == AlgoAmount.from_micro_algo(2000)
+    assert asyncio.run(params_cache.get_async(aio_algod)) is SP
+    assert (algod.calls, aio_algod.calls) == (1, 0)
+
+
+def test_pass_params_cache_expiry() -> None:
+    algod = _ParamsSource()
+    params_cache = SuggestedParamsCache(ttl=0.0)
+    params_cache.get(cast(AlgodClient, algod))
+    params_cache.get(cast(AlgodClient, algod))
+    assert algod.calls == 2
@@ -0,0 +1,51 @@
+import pytest
+
+from smart_contracts.smart_asa.groups import MAX_GROUP_SIZE, chunks, map_groups
+
+
+def test_pass_chunks() -> None:
+    assert list(chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunks([], 2)) == []
+
+
+def test_pass_map_groups_in_order() -> None:
+    results = map_groups(
+        sum,
+        range(2 * MAX_GROUP_SIZE + 1),
+        group_size=MAX_GROUP_SIZE,
+        concurrency=2,
+        name="test",
+    )
+    assert list(results) == [
+        sum(range(MAX_GROUP_SIZE)),
+        sum(range(MAX_GROUP_SIZE, 2 * MAX_GROUP_SIZE)),
+        2 * MAX_GROUP_SIZE,
+    ]
+
+
+def test_fail_map_groups_oversized_group() -> None:
+    with pytest.raises(ValueError, match="Group size"):
+        next(
+            map_groups(
+                sum, [1], group_size=MAX_GROUP_SIZE + 1, concurrency=1, name="test"
+            )
+        )
+
+
+def test_fail_map_groups_drains_in_flight() -> None:
+    def send(chunk: list[int]) -> int:
+        if chunk[0] % 2 == 0:
+            raise ValueError(f"group {chunk[0]}")
+        return chunk[0]
+
+    results: list[int] = []
+    with pytest.raises(ValueError, match="group 0") as exc_info:
+        for result in map_groups(
+            send, range(5), group_size=1, concurrency=4, name="test"
+        ):
+            results.append(result)
+    # Groups 1 to 3 were in flight when group 0 failed, group 4 was never sent.
+    assert results == [1, 3]
+    assert exc_info.value.__notes__ == [
+        "Another group in flight failed: ValueError('group 2')"
+    ]
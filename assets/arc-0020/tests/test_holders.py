@@ -0,0 +1,57 @@
+from algokit_utils import AlgorandClient, CommonAppCallParams, SigningAccount
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AccountFreezeArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.holders import (
+    HolderRecord,
+    decode_local_state,
+    local_state_keys,
+    scan_holders,
+)
+
+
+def test_pass_decode_local_state() -> None:
+    keys = local_state_keys()
+    local_state: dict[str, object] = {
+        "key-value": [
+            {"key": keys.smart_asa_id, "value": {"type": 2, "uint": 42}},
+            {"key": keys.frozen, "value": {"type": 2, "uint": 1}},
+        ]
+    }
+    assert decode_local_state("A", local_state) == HolderRecord("A", 42, frozen=True)
+    assert decode_local_state("A", {}) == HolderRecord("A", 0, frozen=False)
+    assert decode_local_state("A", None) == HolderRecord("A", None, None)
+
+
+def test_pass_scan_holders(
+    algorand: AlgorandClient,
+    smart_asa_client: SmartAsaClient,
+    freeze: SigningAccount,
+    receiver: SigningAccount,
+    eve: SigningAccount,
+) -> None:
+    smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
+    smart_asa_client.send.account_freeze(
+        AccountFreezeArgs(
+            freeze_asset=smart_asa_id,
+            freeze_account=receiver.address,
+            asset_frozen=True,
+        ),
+        params=CommonAppCallParams(sender=freeze.address, signer=freeze.signer),
+    )
+    addresses = [receiver.address, eve.address] * 20
+    records = list(
+        scan_holders(
+            algorand.client.algod, smart_asa_client.app_id, addresses, concurrency=4
+        )
+    )
+    assert (
+        records
+        == [
+            HolderRecord(receiver.address, smart_asa_id, frozen=True),
+            HolderRecord(eve.address, None, None),
+        ]
+        * 20
+    )
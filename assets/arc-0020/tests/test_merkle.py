@@ -0,0 +1,27 @@
+import pytest
+from algokit_utils import AlgorandClient
+
+from smart_contracts.smart_asa.merkle import MerkleTree, verify
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 16, 100])
+def test_pass_proofs(algorand: AlgorandClient, size: int) -> None:
+    addresses = [algorand.account.random().address for _ in range(size)]
+    tree = MerkleTree(addresses)
+    for address in addresses:
+        assert address in tree
+        assert verify(tree.root, address, tree.proof(address))
+
+
+def test_pass_root_is_order_independent(algorand: AlgorandClient) -> None:
+    addresses = [algorand.account.random().address for _ in range(5)]
+    assert MerkleTree(addresses).root == MerkleTree(reversed(addresses)).root
+
+
+def test_fail_proof_of_other_account(algorand: AlgorandClient) -> None:
+    member, other = (algorand.account.random().address for _ in range(2))
+    tree = MerkleTree([member, algorand.account.random().address])
+    assert other not in tree
+    assert not verify(tree.root, other, tree.proof(member))
+    with pytest.raises(ValueError):
+        tree.proof(other)
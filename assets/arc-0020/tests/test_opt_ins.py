@@ -0,0 +1,52 @@
+from collections.abc import Callable
+from typing import cast
+
+from algokit_utils import AlgorandClient, SigningAccount
+from algosdk import abi, transaction
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import SmartAsaClient
+from smart_contracts.smart_asa.opt_ins import (
+    ASSET_OPT_IN_SIGNATURE,
+    HOLDERS_PER_GROUP,
+    build_opt_in_group,
+)
+
+from .conftest import ASAConfig
+
+
+def test_pass_build_opt_in_group(asa_config: ASAConfig) -> None:
+    sp = transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh="A" * 44, min_fee=1000, flat_fee=True
+    )
+    holders = [asa_config.manager_addr, asa_config.reserve_addr]
+    txns = build_opt_in_group(sp, 1, 2, holders)
+    assert [txn.sender for txn in txns] == [
+        holder for holder in holders for _ in range(2)
+    ]
+    assert [type(txn) for txn in txns] == [
+        transaction.AssetOptInTxn,
+        transaction.ApplicationOptInTxn,
+    ] * len(holders)
+    app_call = cast(transaction.ApplicationOptInTxn, txns[1])
+    assert app_call.app_args[0] == (
+        abi.Method.from_signature(ASSET_OPT_IN_SIGNATURE).get_selector()
+    )
+    assert len({txn.group for txn in txns}) == 1
+
+
+def test_pass_make_opted_in_accounts(
+    algorand: AlgorandClient,
+    smart_asa_client: SmartAsaClient,
+    make_opted_in_accounts: Callable[[int], list[SigningAccount]],
+) -> None:
+    state = smart_asa_client.state.global_state
+    accounts = make_opted_in_accounts(HOLDERS_PER_GROUP + 1)
+    assert len({account.address for account in accounts}) == HOLDERS_PER_GROUP + 1
+    for account in accounts:
+        local_state = smart_asa_client.state.local_state(account.address)
+        assert local_state.account_smart_asa_id == state.smart_asa_id
+        assert local_state.account_frozen == state.default_frozen
+        assert (
+            algorand.asset.get_account_information(account, state.smart_asa_id).balance
+            == 0
+        )
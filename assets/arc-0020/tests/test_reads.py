@@ -0,0 +1,79 @@
+from collections.abc import Callable
+
+import pytest
+from algokit_utils import CommonAppCallParams, SigningAccount
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    AccountFreezeArgs,
+    AssetConfig,
+    GetAccountIsFrozenArgs,
+    GetAssetConfigArgs,
+    GetAssetIsFrozenArgs,
+    GetCirculatingSupplyArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.reads import MAX_GROUP_SIZE, SimulateError, batch_read
+
+from .conftest import ASAConfig
+
+
+def test_pass_batch_read_mixed_getters(
+    creator: SigningAccount, smart_asa_client: SmartAsaClient, asa_config: ASAConfig
+) -> None:
+    smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
+    results = batch_read(
+        smart_asa_client.algorand.client.algod,
+        smart_asa_client.app_id,
+        [
+            GetCirculatingSupplyArgs(asset=smart_asa_id),
+            GetAssetIsFrozenArgs(freeze_asset=smart_asa_id),
+            GetAssetConfigArgs(asset=smart_asa_id),
+        ],
+        sender=creator.address,
+    )
+    assert results == [0, False, AssetConfig(**asa_config.dictify())]
+
+
+def test_pass_batch_read_in_input_order(
+    creator: SigningAccount,
+    freeze: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    make_opted_in_accounts: Callable[[int], list[SigningAccount]],
+) -> None:
+    smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
+    frozen, unfrozen = make_opted_in_accounts(2)
+    smart_asa_client.send.account_freeze(
+        AccountFreezeArgs(
+            freeze_asset=smart_asa_id,
+            freeze_account=frozen.address,
+            asset_frozen=True,
+        ),
+        params=CommonAppCallParams(sender=freeze.address, signer=freeze.signer),
+    )
+    accounts = [frozen, unfrozen, unfrozen] * MAX_GROUP_SIZE
+    results = batch_read(
+        smart_asa_client.algorand.client.algod,
+        smart_asa_client.app_id,
+        [
+            GetAccountIsFrozenArgs(
+                freeze_asset=smart_asa_id, freeze_account=account.address
+            )
+            for account in accounts
+        ],
+        sender=creator.address,
+        concurrency=2,
+    )
+    assert results == [account is frozen for account in accounts]
+
+
+def test_fail_batch_read_precondition(
+    creator: SigningAccount, smart_asa_client: SmartAsaClient, dummy_asa: int
+) -> None:
+    # Simulate failure messages carry the failing PC, not the TEAL assert comment.
+    with pytest.raises(SimulateError, match="assert failed"):
+        batch_read(
+            smart_asa_client.algorand.client.algod,
+            smart_asa_client.app_id,
+            [GetCirculatingSupplyArgs(asset=dummy_asa)],
+            sender=creator.address,
+        )
@@ -0,0 +1,59 @@
+import pytest
+from algokit_utils import CommonAppCallParams, LogicError, SigningAccount
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.encoding import decode_address
+
+import smart_contracts.errors as err
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    SetTransferAllowlistArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.merkle import MerkleTree
+
+
+def test_pass_set_and_disable_allowlist(
+    smart_asa_client: SmartAsaClient,
+    freeze: SigningAccount,
+    receiver: SigningAccount,
+) -> None:
+    smart_asa = smart_asa_client.state.global_state
+    assert not smart_asa.allowlist_root
+    allowlist = MerkleTree([freeze.address, receiver.address])
+    smart_asa_client.send.set_transfer_allowlist(
+        SetTransferAllowlistArgs(
+            freeze_asset=smart_asa.smart_asa_id,
+            allowlist_root=allowlist.root,
+        ),
+        params=CommonAppCallParams(
+            signer=freeze.signer,
+            sender=freeze.address,
+        ),
+    )
+    assert smart_asa_client.state.global_state.allowlist_root == allowlist.root
+    smart_asa_client.send.set_transfer_allowlist(
+        SetTransferAllowlistArgs(
+            freeze_asset=smart_asa.smart_asa_id,
+            allowlist_root=decode_address(ZERO_ADDRESS),
+        ),
+        params=CommonAppCallParams(
+            signer=freeze.signer,
+            sender=freeze.address,
+        ),
+    )
+    assert not smart_asa_client.state.global_state.allowlist_root
+
+
+def test_fail_unauthorized(
+    smart_asa_client: SmartAsaClient, eve: SigningAccount
+) -> None:
+    with pytest.raises(LogicError, match=err.UNAUTHORIZED_FREEZE):
+        smart_asa_client.send.set_transfer_allowlist(
+            SetTransferAllowlistArgs(
+                freeze_asset=smart_asa_client.state.global_state.smart_asa_id,
+                allowlist_root=MerkleTree([eve.address]).root,
+            ),
+            params=CommonAppCallParams(
+                signer=eve.signer,
+                sender=eve.address,
+            ),
+        )
@@ -0,0 +1,379 @@
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetOptInParams,
+    AssetTransferParams,
+    CommonAppCallParams,
+    LogicError,
+    PaymentParams,
+    SigningAccount,
+)
+from algokit_utils.config import config
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from arc_common.funding import AccountFunder
+
+import smart_contracts.errors as err
+import smart_contracts.smart_asa_multi.config as cfg
+from smart_contracts.artifacts.smart_asa_multi.smart_asa_multi_client import (
+    AccountFreezeArgs,
+    AssetCloseOutArgs,
+    AssetConfigArgs,
+    AssetCreateArgs,
+    AssetFreezeArgs,
+    AssetOptInArgs,
+    AssetTransferArgs,
+    GetAccountIsFrozenArgs,
+    GetAssetConfigArgs,
+    GetAssetIsFrozenArgs,
+    GetCirculatingSupplyArgs,
+    SmartAsaMultiClient,
+    SmartAsaMultiFactory,
+)
+from smart_contracts.smart_asa.fees import MULTI_INNER_TXNS, FeePolicy
+
+from .conftest import ASAConfig
+
+
+def asset_create(
+    client: SmartAsaMultiClient, multi_fees: FeePolicy, asa_config: ASAConfig
+) -> int:
+    args = AssetCreateArgs(**asa_config.dictify())
+    smart_asa_id = client.send.asset_create(
+        args, params=multi_fees.params(args)
+    ).abi_return
+    assert smart_asa_id is not None
+    return smart_asa_id
+
+
+def asset_opt_in(
+    client: SmartAsaMultiClient,
+    smart_asa_id: int,
+    account: SigningAccount,
+    mbr: int = cfg.HOLDING_BOX_MBR,
+    mbr_payer: SigningAccount | None = None,
+) -> None:
+    group = client.new_group()
+    if mbr:
+        payer = mbr_payer or account
+        group.add_transaction(
+            txn=client.algorand.create_transaction.payment(
+                PaymentParams(
+                    sender=payer.address,
+                    receiver=client.app_address,
+                    amount=AlgoAmount.from_micro_algo(mbr),
+                )
+            ),
+            signer=payer.signer,
+        )
+    group.asset_opt_in(
+        AssetOptInArgs(
+            asset=smart_asa_id,
+            ctrl_asa_opt_in=TransactionWithSigner(
+                txn=client.algorand.create_transaction.asset_opt_in(
+                    AssetOptInParams(asset_id=smart_asa_id, sender=account.address)
+                ),
+                signer=account.signer,
+            ),
+        ),
+        params=CommonAppCallParams(signer=account.signer, sender=account.address),
+    ).send()
+
+
+def asset_close_out(
+    client: SmartAsaMultiClient,
+    multi_fees: FeePolicy,
+    smart_asa_id: int,
+    account: SigningAccount,
+) -> None:
+    args = AssetCloseOutArgs(close_asset=smart_asa_id, close_to=client.app_address)
+    client.new_group().asset_close_out(
+        args,
+        params=multi_fees.params(
+            args, CommonAppCallParams(signer=account.signer, sender=account.address)
+        ),
+    ).add_transaction(
+        txn=client.algorand.create_transaction.asset_transfer(
+            AssetTransferParams(
+                sender=account.address,
+                asset_id=smart_asa_id,
+                receiver=client.app_address,
+                close_asset_to=client.app_address,
+                amount=0,
+            )
+        ),
+        signer=account.signer,
+    ).send()
+
+
+@pytest.fixture(scope="function")
+def smart_asa_multi_client(
+    algorand: AlgorandClient, creator: SigningAccount, funder: AccountFunder
+) -> SmartAsaMultiClient:
+    config.configure(debug=False, populate_app_call_resources=True)
+    factory = algorand.client.get_typed_app_factory(
+        SmartAsaMultiFactory,
+        default_sender=creator.address,
+        default_signer=creator.signer,
+    )
+    client, _ = factory.send.create.bare()
+    funder.fund([client.app_address])
+    return client
+
+
+@pytest.fixture(scope="session")
+def multi_fees(algorand: AlgorandClient) -> FeePolicy:
+    return FeePolicy(algorand.client.algod, inner_txns=MULTI_INNER_TXNS)
+
+
+@pytest.fixture(scope="function")
+def smart_asa_ids(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    multi_fees: FeePolicy,
+    asa_config: ASAConfig,
+) -> tuple[int, int]:
+    first = asset_create(smart_asa_multi_client, multi_fees, asa_config)
+    second = asset_create(smart_asa_multi_client, multi_fees, asa_config)
+    return first, second
+
+
+@pytest.fixture(scope="function")
+def multi_receiver(
+    funder: AccountFunder,
+    smart_asa_multi_client: SmartAsaMultiClient,
+    smart_asa_ids: tuple[int, int],
+) -> SigningAccount:
+    # A single account holds both Smart ASAs of the application.
+    account = funder.account()
+    for smart_asa_id in smart_asa_ids:
+        asset_opt_in(smart_asa_multi_client, smart_asa_id, account)
+    return account
+
+
+def test_pass_many_controlled_assets(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    smart_asa_ids: tuple[int, int],
+    asa_config: ASAConfig,
+) -> None:
+    first, second = smart_asa_ids
+    assert first != second
+    for smart_asa_id in smart_asa_ids:
+        asset_config = smart_asa_multi_client.send.get_asset_config(
+            GetAssetConfigArgs(asset=smart_asa_id)
+        ).abi_return
+        assert asset_config is not None
+        assert asset_config.total == asa_config.total
+        assert asset_config.manager_addr == asa_config.manager_addr
+
+
+def test_pass_asset_config_is_per_asset(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    smart_asa_ids: tuple[int, int],
+    manager: SigningAccount,
+    asa_config: ASAConfig,
+) -> None:
+    first, second = smart_asa_ids
+    asa_config.name = "First"
+    smart_asa_multi_client.send.asset_config(
+        AssetConfigArgs(config_asset=first, **asa_config.dictify()),
+        params=CommonAppCallParams(sender=manager.address, signer=manager.signer),
+    )
+    configs = [
+        smart_asa_multi_client.send.get_asset_config(
+            GetAssetConfigArgs(asset=smart_asa_id)
+        ).abi_return
+        for smart_asa_id in (first, second)
+    ]
+    assert [config.name if config else None for config in configs] == [
+        "First",
+        "Test",
+    ]
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_pass_mint_is_per_asset(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    multi_fees: FeePolicy,
+    smart_asa_ids: tuple[int, int],
+    reserve: SigningAccount,
+    multi_receiver: SigningAccount,
+) -> None:
+    first, second = smart_asa_ids
+    args = AssetTransferArgs(
+        xfer_asset=first,
+        asset_amount=42,
+        asset_sender=smart_asa_multi_client.app_address,
+        asset_receiver=multi_receiver.address,
+    )
+    smart_asa_multi_client.send.asset_transfer(
+        args,
+        params=multi_fees.params(
+            args, CommonAppCallParams(signer=reserve.signer, sender=reserve.address)
+        ),
+    )
+    supplies = [
+        smart_asa_multi_client.send.get_circulating_supply(
+            GetCirculatingSupplyArgs(asset=smart_asa_id)
+        ).abi_return
+        for smart_asa_id in (first, second)
+    ]
+    assert supplies == [42, 0]
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_pass_freeze_is_per_asset(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    smart_asa_ids: tuple[int, int],
+    freeze: SigningAccount,
+    multi_receiver: SigningAccount,
+) -> None:
+    first, second = smart_asa_ids
+    as_freeze = CommonAppCallParams(sender=freeze.address, signer=freeze.signer)
+    smart_asa_multi_client.send.asset_freeze(
+        AssetFreezeArgs(freeze_asset=first, asset_frozen=True), params=as_freeze
+    )
+    smart_asa_multi_client.send.account_freeze(
+        AccountFreezeArgs(
+            freeze_asset=second,
+            freeze_account=multi_receiver.address,
+            asset_frozen=True,
+        ),
+        params=as_freeze,
+    )
+    assert [
+        smart_asa_multi_client.send.get_asset_is_frozen(
+            GetAssetIsFrozenArgs(freeze_asset=smart_asa_id)
+        ).abi_return
+        for smart_asa_id in (first, second)
+    ] == [True, False]
+    assert [
+        smart_asa_multi_client.send.get_account_is_frozen(
+            GetAccountIsFrozenArgs(
+                freeze_asset=smart_asa_id, freeze_account=multi_receiver.address
+            )
+        ).abi_return
+        for smart_asa_id in (first, second)
+    ] == [False, True]
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_pass_close_out_deletes_holding(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    multi_fees: FeePolicy,
+    smart_asa_ids: tuple[int, int],
+    multi_receiver: SigningAccount,
+) -> None:
+    first, second = smart_asa_ids
+    algorand = smart_asa_multi_client.algorand
+    app_address = smart_asa_multi_client.app_address
+    boxes = len(algorand.app.get_box_names(smart_asa_multi_client.app_id))
+    app_balance = algorand.account.get_information(app_address).amount.micro_algo
+    holder_balance = algorand.account.get_information(
+        multi_receiver.address
+    ).amount.micro_algo
+    asset_close_out(smart_asa_multi_client, multi_fees, first, multi_receiver)
+    assert len(algorand.app.get_box_names(smart_asa_multi_client.app_id)) == boxes - 1
+    assert (
+        algorand.account.get_information(app_address).amount.micro_algo
+        == app_balance - cfg.HOLDING_BOX_MBR
+    )
+    # The MBR is refunded to the holder (close out app call and ASA close out fees)
+    fees = (
+        multi_fees.method_fee("asset_close_out").micro_algo
+        + multi_fees.suggested_params().min_fee
+    )
+    assert (
+        algorand.account.get_information(multi_receiver.address).amount.micro_algo
+        == holder_balance + cfg.HOLDING_BOX_MBR - fees
+    )
+    # The other holding is left in place
+    assert not smart_asa_multi_client.send.get_account_is_frozen(
+        GetAccountIsFrozenArgs(
+            freeze_asset=second, freeze_account=multi_receiver.address
+        )
+    ).abi_return
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_pass_opt_in_after_close_out(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    multi_fees: FeePolicy,
+    smart_asa_ids: tuple[int, int],
+    multi_receiver: SigningAccount,
+) -> None:
+    first, _ = smart_asa_ids
+    asset_close_out(smart_asa_multi_client, multi_fees, first, multi_receiver)
+    asset_opt_in(smart_asa_multi_client, first, multi_receiver)
+    assert not smart_asa_multi_client.send.get_account_is_frozen(
+        GetAccountIsFrozenArgs(
+            freeze_asset=first, freeze_account=multi_receiver.address
+        )
+    ).abi_return
+
+
+def test_fail_opt_in_existing(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    smart_asa_ids: tuple[int, int],
+    multi_receiver: SigningAccount,
+) -> None:
+    first, _ = smart_asa_ids
+    with pytest.raises(LogicError, match=err.OPT_IN_EXISTING):
+        asset_opt_in(smart_asa_multi_client, first, multi_receiver)
+
+
+def test_fail_opt_in_wrong_mbr_sender(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    smart_asa_ids: tuple[int, int],
+    funder: AccountFunder,
+) -> None:
+    first, _ = smart_asa_ids
+    with pytest.raises(LogicError, match=err.OPT_IN_WRONG_MBR_SENDER):
+        asset_opt_in(
+            smart_asa_multi_client, first, funder.account(), mbr_payer=funder.account()
+        )
+
+
+def test_fail_opt_in_missing_mbr(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    smart_asa_ids: tuple[int, int],
+    funder: AccountFunder,
+) -> None:
+    first, _ = smart_asa_ids
+    with pytest.raises(LogicError, match=err.OPT_IN_MISSING_MBR):
+        asset_opt_in(smart_asa_multi_client, first, funder.account(), mbr=0)
+
+
+def test_fail_opt_in_wrong_mbr_amount(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    smart_asa_ids: tuple[int, int],
+    funder: AccountFunder,
+) -> None:
+    first, _ = smart_asa_ids
+    with pytest.raises(LogicError, match=err.OPT_IN_WRONG_MBR_AMOUNT):
+        asset_opt_in(
+            smart_asa_multi_client,
+            first,
+            funder.account(),
+            mbr=cfg.HOLDING_BOX_MBR - 1,
+        )
+
+
+def test_fail_unauthorized_creator(
+    smart_asa_multi_client: SmartAsaMultiClient,
+    eve: SigningAccount,
+    asa_config: ASAConfig,
+) -> None:
+    with pytest.raises(LogicError, match=err.UNAUTHORIZED):
+        smart_asa_multi_client.send.asset_create(
+            AssetCreateArgs(**asa_config.dictify()),
+            params=CommonAppCallParams(sender=eve.address, signer=eve.signer),
+        )
+
+
+def test_fail_missing_ctrl_asa(
+    smart_asa_multi_client: SmartAsaMultiClient, dummy_asa: int
+) -> None:
+    with pytest.raises(LogicError, match=err.MISSING_CTRL_ASA):
+        smart_asa_multi_client.send.get_asset_config(
+            GetAssetConfigArgs(asset=dummy_asa)
+        )
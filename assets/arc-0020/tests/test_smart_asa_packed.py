@@ -0,0 +1,172 @@
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    LogicError,
+    SigningAccount,
+)
+from algokit_utils.config import config
+from algosdk import abi, encoding
+from algosdk.constants import ZERO_ADDRESS
+from arc_common.funding import AccountFunder
+
+import smart_contracts.errors as err
+import smart_contracts.smart_asa_packed.config as cfg
+from smart_contracts.artifacts.smart_asa_packed.smart_asa_packed_client import (
+    AssetConfigArgs,
+    AssetCreateArgs,
+    AssetDestroyArgs,
+    AssetFreezeArgs,
+    GetAssetConfigArgs,
+    SmartAsaPackedClient,
+    SmartAsaPackedFactory,
+)
+
+from .conftest import ASAConfig
+
+ASSET_CONFIG_FIELDS = (
+    "total",
+    "decimals",
+    "default_frozen",
+    "unit_name",
+    "name",
+    "url",
+    "metadata_hash",
+    "manager_addr",
+    "reserve_addr",
+    "freeze_addr",
+    "clawback_addr",
+)
+ASSET_CONFIG_TYPE = abi.ABIType.from_string(
+    "(uint64,uint32,bool,string,string,string,byte[],address,address,address,address)"
+)
+
+
+@pytest.fixture(scope="function")
+def smart_asa_packed_client(
+    algorand: AlgorandClient,
+    creator: SigningAccount,
+    funder: AccountFunder,
+    asa_config: ASAConfig,
+) -> SmartAsaPackedClient:
+    config.configure(debug=False, populate_app_call_resources=True)
+    factory = algorand.client.get_typed_app_factory(
+        SmartAsaPackedFactory,
+        default_sender=creator.address,
+        default_signer=creator.signer,
+    )
+    client, _ = factory.send.create.bare()
+    funder.fund([client.app_address])
+    sp = algorand.client.algod.suggested_params()
+    client.send.asset_create(
+        AssetCreateArgs(**asa_config.dictify()),
+        params=CommonAppCallParams(
+            static_fee=AlgoAmount.from_micro_algo(sp.min_fee * 2)
+        ),
+    )
+    return client
+
+
+def test_pass_packed_offsets(asa_config: ASAConfig) -> None:
+    values = asa_config.dictify()
+    encoded = ASSET_CONFIG_TYPE.encode([values[field] for field in ASSET_CONFIG_FIELDS])
+
+    def field(offset: int, size: int) -> bytes:
+        return encoded[offset : offset + size]
+
+    total = field(cfg.TOTAL_OFFSET, cfg.UINT64_SIZE)
+    default_frozen = field(cfg.DEFAULT_FROZEN_OFFSET, 1)[0] & 0x80
+    assert int.from_bytes(total) == asa_config.total
+    assert bool(default_frozen) == asa_config.default_frozen
+    for offset, address in (
+        (cfg.MANAGER_ADDR_OFFSET, asa_config.manager_addr),
+        (cfg.RESERVE_ADDR_OFFSET, asa_config.reserve_addr),
+        (cfg.FREEZE_ADDR_OFFSET, asa_config.freeze_addr),
+        (cfg.CLAWBACK_ADDR_OFFSET, asa_config.clawback_addr),
+    ):
+        assert encoding.encode_address(field(offset, cfg.ADDRESS_SIZE)) == address
+
+
+def test_pass_get_asset_config(
+    smart_asa_packed_client: SmartAsaPackedClient, asa_config: ASAConfig
+) -> None:
+    smart_asa_id = smart_asa_packed_client.state.global_state.smart_asa_id
+    asset_config = smart_asa_packed_client.send.get_asset_config(
+        GetAssetConfigArgs(asset=smart_asa_id)
+    ).abi_return
+    assert asset_config is not None
+    assert asset_config.total == asa_config.total
+    assert asset_config.default_frozen == asa_config.default_frozen
+    assert asset_config.name == asa_config.name
+    assert asset_config.manager_addr == asa_config.manager_addr
+    assert asset_config.reserve_addr == asa_config.reserve_addr
+    assert asset_config.freeze_addr == asa_config.freeze_addr
+    assert asset_config.clawback_addr == asa_config.clawback_addr
+
+
+def test_pass_asset_config_resized(
+    smart_asa_packed_client: SmartAsaPackedClient,
+    manager: SigningAccount,
+    asa_config: ASAConfig,
+) -> None:
+    smart_asa_id = smart_asa_packed_client.state.global_state.smart_asa_id
+    asa_config.name = asa_config.name * 4
+    asa_config.manager_addr = ZERO_ADDRESS
+    smart_asa_packed_client.send.asset_config(
+        AssetConfigArgs(config_asset=smart_asa_id, **asa_config.dictify()),
+        params=CommonAppCallParams(sender=manager.address, signer=manager.signer),
+    )
+    asset_config = smart_asa_packed_client.send.get_asset_config(
+        GetAssetConfigArgs(asset=smart_asa_id)
+    ).abi_return
+    assert asset_config is not None
+    assert asset_config.name == asa_config.name
+    assert asset_config.manager_addr == ZERO_ADDRESS
+
+
+def test_fail_unauthorized_manager(
+    smart_asa_packed_client: SmartAsaPackedClient,
+    eve: SigningAccount,
+    asa_config: ASAConfig,
+) -> None:
+    with pytest.raises(LogicError, match=err.UNAUTHORIZED_MANAGER):
+        smart_asa_packed_client.send.asset_config(
+            AssetConfigArgs(
+                config_asset=smart_asa_packed_client.state.global_state.smart_asa_id,
+                **asa_config.dictify(),
+            ),
+            params=CommonAppCallParams(sender=eve.address, signer=eve.signer),
+        )
+
+
+def test_fail_unauthorized_freeze(
+    smart_asa_packed_client: SmartAsaPackedClient, eve: SigningAccount
+) -> None:
+    with pytest.raises(LogicError, match=err.UNAUTHORIZED_FREEZE):
+        smart_asa_packed_client.send.asset_freeze(
+            AssetFreezeArgs(
+                freeze_asset=smart_asa_packed_client.state.global_state.smart_asa_id,
+                asset_frozen=True,
+            ),
+            params=CommonAppCallParams(sender=eve.address, signer=eve.signer),
+        )
+
+
+def test_pass_destroy_deletes_config_box(
+    smart_asa_packed_client: SmartAsaPackedClient, manager: SigningAccount
+) -> None:
+    sp = smart_asa_packed_client.algorand.client.algod.suggested_params()
+    smart_asa_packed_client.send.asset_destroy(
+        AssetDestroyArgs(
+            destroy_asset=smart_asa_packed_client.state.global_state.smart_asa_id
+        ),
+        params=CommonAppCallParams(
+            static_fee=AlgoAmount.from_micro_algo(sp.min_fee * 2),
+            signer=manager.signer,
+            sender=manager.address,
+        ),
+    )
+    assert not smart_asa_packed_client.algorand.app.get_box_names(
+        smart_asa_packed_client.app_id
+    )
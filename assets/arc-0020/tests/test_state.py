@@ -0,0 +1,79 @@
+import base64
+
+from algokit_utils import AlgorandClient
+from algosdk import encoding
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import SmartAsaClient
+from smart_contracts.smart_asa.state import (
+    GlobalStateSnapshot,
+    SmartAsaGlobalState,
+    decode_global_state,
+)
+
+from .conftest import ASAConfig
+
+
+def b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def test_pass_decode_global_state(asa_config: ASAConfig) -> None:
+    global_state: list[dict[str, object]] = [
+        {"key": b64(b"total"), "value": {"type": 2, "uint": asa_config.total}},
+        {"key": b64(b"global_frozen"), "value": {"type": 2, "uint": 1}},
+        {"key": b64(b"name"), "value": {"type": 1, "bytes": b64(b"Test")}},
+        {
+            "key": b64(b"reserve_addr"),
+            "value": {
+                "type": 1,
+                "bytes": b64(encoding.decode_address(asa_config.reserve_addr)),
+            },
+        },
+        {"key": b64(b"unknown"), "value": {"type": 2, "uint": 1}},
+    ]
+    assert decode_global_state(global_state) == SmartAsaGlobalState(
+        total=asa_config.total,
+        global_frozen=True,
+        name="Test",
+        reserve_addr=asa_config.reserve_addr,
+    )
+
+
+def test_pass_snapshot_matches_typed_client(
+    algorand: AlgorandClient, smart_asa_client: SmartAsaClient
+) -> None:
+    state = GlobalStateSnapshot(algorand.client.algod, smart_asa_client.app_id).state
+    typed_client = smart_asa_client.state.global_state
+    assert state.total == typed_client.total
+    assert state.reserve_addr == typed_client.reserve_addr
+    assert state.smart_asa_id == typed_client.smart_asa_id
+    assert state.metadata_hash == typed_client.metadata_hash
+
+
+def test_pass_snapshot_ttl(
+    algorand: AlgorandClient, smart_asa_client: SmartAsaClient
+) -> None:
+    now = [0.0]
+    snapshot = GlobalStateSnapshot(
+        algorand.client.algod, smart_asa_client.app_id, ttl=2.0, clock=lambda: now[0]
+    )
+    state = snapshot.state
+    now[0] = 1.0
+    assert snapshot.state is state
+    now[0] = 2.0
+    assert snapshot.is_stale
+    assert snapshot.state is not state
+    assert snapshot.fetched_at == 2.0
+
+
+def test_pass_snapshot_explicit_refresh(
+    algorand: AlgorandClient, smart_asa_client: SmartAsaClient
+) -> None:
+    now = [0.0]
+    snapshot = GlobalStateSnapshot(
+        algorand.client.algod, smart_asa_client.app_id, clock=lambda: now[0]
+    )
+    state = snapshot.state
+    now[0] = 3600.0
+    assert snapshot.state is state
+    assert snapshot.refresh() is not state
@@ -0,0 +1,161 @@
+from collections.abc import Callable
+from typing import cast
+
+import pytest
+from algokit_utils import AlgorandClient, SigningAccount
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.smart_asa.smart_asa_client import (
+    GetCirculatingSupplyArgs,
+    SmartAsaClient,
+)
+from smart_contracts.smart_asa.transfers import (
+    MAX_GROUP_SIZE,
+    Transfer,
+    build_group,
+    pooled_fee,
+    send_transfers,
+    transfer_note,
+)
+
+from .conftest import ASAConfig
+
+
+def test_pass_build_group_pools_fees(asa_config: ASAConfig) -> None:
+    sp = transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh="A" * 44, min_fee=1000, flat_fee=True
+    )
+    transfers = [
+        Transfer(
+            asset_sender=asa_config.manager_addr,
+            asset_receiver=asa_config.reserve_addr,
+            asset_amount=amount,
+        )
+        for amount in range(1, 4)
+    ]
+    notes = [transfer_note(b"nonce---", idx) for idx in range(len(transfers))]
+    txns = build_group(sp, 1, 2, transfers, sender=asa_config.manager_addr, notes=notes)
+    assert [txn.fee for txn in txns] == [pooled_fee(sp, 3), 0, 0]
+    assert pooled_fee(sp, 3) == 6000
+    assert len({txn.group for txn in txns}) == 1
+    app_call = cast(transaction.ApplicationCallTxn, txns[0])
+    assert app_call.accounts == [asa_config.manager_addr, asa_config.reserve_addr]
+    assert [txn.note for txn in txns] == notes
+
+
+def test_pass_build_group_identical_transfers_unique_txids(
+    asa_config: ASAConfig,
+) -> None:
+    sp = transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh="A" * 44, min_fee=1000, flat_fee=True
+    )
+    transfer = Transfer(
+        asset_sender=asa_config.manager_addr,
+        asset_receiver=asa_config.reserve_addr,
+        asset_amount=1,
+    )
+    notes = [transfer_note(b"nonce---", idx) for idx in range(3)]
+    txns = build_group(
+        sp, 1, 2, [transfer] * 3, sender=asa_config.manager_addr, notes=notes
+    )
+    assert len({txn.get_txid() for txn in txns}) == 3
+
+
+def test_fail_oversized_group(
+    algorand: AlgorandClient, reserve: SigningAccount
+) -> None:
+    with pytest.raises(ValueError, match="Group size"):
+        next(
+            send_transfers(
+                algorand.client.algod,
+                1,
+                2,
+                [],
+                sender=reserve.address,
+                signer=reserve.signer,
+                group_size=MAX_GROUP_SIZE + 1,
+            )
+        )
+
+
+@pytest.mark.parametrize("asa_config", [False], indirect=True)
+def test_pass_send_transfers(
+    reserve: SigningAccount,
+    smart_asa_client: SmartAsaClient,
+    make_opted_in_accounts: Callable[[int], list[SigningAccount]],
+) -> None:
+    receivers = make_opted_in_accounts(3)
+    smart_asa_id = smart_asa_client.state.global_state.smart_asa_id
+    transfers = [
+        Transfer(
+            asset_sender=smart_asa_client.app_address,
+            asset_receiver=receivers[idx % len(receivers)].address,
+            asset_amount=1,
+        )
+        for idx in range(MAX_GROUP_SIZE + 4)
+    ]
+    results = list(
+        send_transfers(
+            smart_asa_client.algorand.client.algod,
+            smart_asa_client.app_id,
+            smart_asa_id,
+            transfers,
+            sender=reserve.address,
+            signer=reserve.signer,
+            concurrency=2,
+        )
+    )
+    assert [len(result.transfers) for result in results] == [MAX_GROUP_SIZE, 4]
+    assert [t for result in results for t in result.transfers] == transfers
+    assert smart_asa_client.send.get_circulating_supply(
+        GetCirculatingSupplyArgs(asset=smart_asa_id)
+    ).abi_return == len(transfers)
+
+
+class _LossyNode:
+    """Node losing the first `lost` submissions, confirming the next one"""
+
+    def __init__(self, lost: int) -> None:
+        self.lost = lost
+        self.submissions = 0
+        self.round = 1
+
+    def suggested_params(self) -> transaction.SuggestedParams:
+        return transaction.SuggestedParams(
+            fee=0, first=1, last=1001, gh="A" * 44, min_fee=1000, flat_fee=True
+        )
+
+    def send_transactions(self, signed: object) -> str:
+        self.submissions += 1
+        return ""
+
+    def status(self) -> dict[str, int]:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_num: int) -> dict[str, int]:
+        self.round = round_num + 1
+        return self.status()
+
+    def pending_transaction_info(self, txid: str) -> dict[str, object]:
+        if self.submissions > self.lost:
+            return {"confirmed-round": self.round, "pool-error": ""}
+        return {"pool-error": ""}
+
+
+def test_pass_send_transfers_resubmits_unconfirmed_group() -> None:
+    private_key, sender = account.generate_account()
+    node = _LossyNode(lost=2)
+    transfer = Transfer(asset_sender=sender, asset_receiver=sender, asset_amount=1)
+    (result,) = send_transfers(
+        cast(AlgodClient, node),
+        1,
+        2,
+        [transfer],
+        sender=sender,
+        signer=AccountTransactionSigner(private_key),
+        wait_rounds=2,
+    )
+    # Two waits of 2 rounds timed out, the third submission confirmed.
+    assert (result.attempts, node.submissions) == (3, 3)
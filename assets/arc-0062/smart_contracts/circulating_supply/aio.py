@@ -0,0 +1,431 @@
+"""
+Asyncio client for the ARC-62 Circulating Supply app.
+
+ARC-62 getters are read by wallets, explorers and indexing services, usually from
+asyncio code where the synchronous typed client blocks the event loop. The async
+client serves the typed client accessors on the pooled
+`arc_common.aio.AsyncAlgodClient`:
+
+    async with AsyncAlgodClient.from_algod(algod) as aio_algod:
+        client = AsyncCirculatingSupplyClient(
+            aio_algod, app_id, default_sender=caller.address
+        )
+        supply = await client.send.arc62_get_circulating_supply(
+            Arc62GetCirculatingSupplyArgs(asset_id=asset_id)
+        )
+        state = await client.state.global_state()
+
+`params` builds app call params, `create_transaction` unsigned app calls (suggested
+params from a `SuggestedParamsCache`, which can be shared), `send` simulates `arc62_get_circulating_supply`
+(read-only) and signs, submits and confirms the setters; `state` fetches the whole
+global state with a single request.
+
+The setters reference the asset and the holdings they check: as with the typed client
+`populate_app_call_resources`, their references are populated from a simulate of the
+call before signing. Explicit references in the params skip the simulate. Calls
+without an explicit note get a unique one, so identical concurrent calls have
+distinct transaction IDs.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Final, Protocol, TypeVar, cast
+
+from algokit_utils import AppCallParams, CommonAppCallParams
+from algosdk import abi, encoding, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+from arc_common.aio import (
+    DEFAULT_WAIT_ROUNDS,
+    AsyncAlgodClient,
+    CallNotes,
+    build_transaction,
+)
+from arc_common.suggested_params import SuggestedParamsCache
+
+from smart_contracts.circulating_supply.app_spec import app_spec
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.circulating_supply.circulating_supply_client import (
+        Arc62GetCirculatingSupplyArgs,
+        SetAssetArgs,
+        SetNotCirculatingAddressArgs,
+    )
+
+_T = TypeVar("_T", bound=Hashable)
+
+# algosdk is untyped: typed alias for the strict mypy config.
+_encode_address: Final[Callable[[bytes], str]] = encoding.encode_address
+
+# ARC-4 method return log prefix
+RETURN_PREFIX: Final[bytes] = bytes.fromhex("151f7c75")
+ZERO_ADDRESS: Final[str] = _encode_address(bytes(32))
+
+_GLOBAL_STATE_KEYS: Final[dict[str, tuple[str, str]]] = {}
+_READONLY_METHODS: Final[list[frozenset[str]]] = []
+_METHODS: Final[dict[str, abi.Method]] = {}
+
+
+class SimulateError(Exception):
+    """A simulated call (read-only call or resource population) failed"""
+
+
+class AbiArgs(Protocol):
+    """A typed client `*Args` dataclass"""
+
+    @property
+    def abi_method_signature(self) -> str: ...
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CirculatingSupplyGlobalState:
+    asset_id: int = 0
+    not_circulating_label_1: str = ZERO_ADDRESS
+    not_circulating_label_2: str = ZERO_ADDRESS
+    not_circulating_label_3: str = ZERO_ADDRESS
+
+
+def global_state_keys() -> dict[str, tuple[str, str]]:
+    """Raw key (base64, as returned by algod) to field name and value type"""
+    if not _GLOBAL_STATE_KEYS:
+        _GLOBAL_STATE_KEYS.update(
+            (storage_key.key, (name, storage_key.value_type))
+            for name, storage_key in app_spec().state.keys.global_state.items()
+        )
+    return _GLOBAL_STATE_KEYS
+
+
+def readonly_methods() -> frozenset[str]:
+    """Names of the read-only methods, from the App Spec"""
+    if not _READONLY_METHODS:
+        _READONLY_METHODS.append(
+            frozenset(method.name for method in app_spec().methods if method.readonly)
+        )
+    return _READONLY_METHODS[0]
+
+
+def decode_global_state(
+    global_state: list[dict[str, object]],
+) -> CirculatingSupplyGlobalState:
+    """Decodes the `global-state` of an algod application info response"""
+    keys = global_state_keys()
+    values: dict[str, object] = {}
+    for entry in global_state:
+        key_info = keys.get(cast(str, entry["key"]))
+        if key_info is None:
+            continue
+        name, value_type = key_info
+        value = cast(dict[str, object], entry["value"])
+        if value_type == "AVMUint64":
+            values[name] = cast(int, value.get("uint", 0))
+        else:
+            values[name] = _encode_address(
+                base64.b64decode(cast(str, value.get("bytes", "")))
+            )
+    return CirculatingSupplyGlobalState(**values)  # type: ignore[arg-type]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AsyncSendResult:
+    txid: str
+    # Pending transaction info, or the simulated transaction result (read-only calls)
+    confirmation: dict[str, object]
+    abi_return: object
+
+
+def _method(method_signature: str) -> abi.Method:
+    if method_signature not in _METHODS:
+        _METHODS[method_signature] = abi.Method.from_signature(method_signature)
+    return _METHODS[method_signature]
+
+
+def _txid(txn: transaction.Transaction) -> str:
+    get_txid: Callable[[], str] = txn.get_txid
+    return get_txid()
+
+
+def _unique(references: list[_T]) -> list[_T]:
+    unique: list[_T] = []
+    for reference in references:
+        if reference not in unique:
+            unique.append(reference)
+    return unique
+
+
+async def _simulate(
+    algod: AsyncAlgodClient, txn: transaction.Transaction
+) -> dict[str, object]:
+    """Simulated group of an unsigned `txn`, unnamed resources allowed"""
+    request = SimulateRequest(
+        txn_groups=[
+            SimulateRequestTransactionGroup(
+                txns=[transaction.SignedTransaction(txn, None)]
+            )
+        ],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+    )
+    response = await algod.simulate_transactions(request)
+    (group,) = cast(list[dict[str, object]], response["txn-groups"])
+    if "failure-message" in group:
+        raise SimulateError(str(group["failure-message"]))
+    return group
+
+
+def encode_args(args: AbiArgs) -> list[bytes]:
+    """Application arguments of an ABI call: method selector and encoded `args`"""
+    method = _method(args.abi_method_signature)
+    fields: tuple[dataclasses.Field[object], ...] = dataclasses.fields(
+        cast(type, type(args))
+    )
+    values = [cast(object, getattr(args, field.name)) for field in fields]
+    return [
+        bytes(method.get_selector()),
+        *(
+            bytes(cast(abi.ABIType, arg.type).encode(value))
+            for arg, value in zip(method.args, values, strict=True)
+        ),
+    ]
+
+
+def _abi_return(args: AbiArgs, result: dict[str, object]) -> object:
+    method = _method(args.abi_method_signature)
+    if method.returns.type == abi.Returns.VOID:
+        return None
+    logs = cast(list[str], result.get("logs", []))
+    abi_return = base64.b64decode(logs[-1]) if logs else b""
+    if not abi_return.startswith(RETURN_PREFIX):
+        raise ValueError(f"No ABI return in {args}")
+    return cast(
+        object,
+        cast(abi.ABIType, method.returns.type).decode(abi_return[len(RETURN_PREFIX) :]),
+    )
+
+
+def _populated(
+    txn: transaction.ApplicationCallTxn, group: dict[str, object]
+) -> transaction.ApplicationCallTxn:
+    """`txn` with the references of the unnamed resources accessed in its simulate"""
+    (txn_result,) = cast(list[dict[str, object]], group["txn-results"])
+    accounts = list(txn.accounts or [])
+    assets = list(txn.foreign_assets or [])
+    apps = list(txn.foreign_apps or [])
+    for accessed in (
+        group.get("unnamed-resources-accessed"),
+        txn_result.get("unnamed-resources-accessed"),
+    ):
+        resources = cast(dict[str, list[object]] | None, accessed) or {}
+        accounts += [cast(str, account) for account in resources.get("accounts", [])]
+        assets += [cast(int, asset) for asset in resources.get("assets", [])]
+        apps += [cast(int, app) for app in resources.get("apps", [])]
+        for holding in cast(
+            list[dict[str, object]], resources.get("asset-holdings", [])
+        ):
+            accounts.append(cast(str, holding["account"]))
+            assets.append(cast(int, holding["asset"]))
+    txn.accounts = _unique(accounts)
+    txn.foreign_assets = _unique(assets)
+    txn.foreign_apps = _unique(apps)
+    return txn
+
+
+def _has_references(params: CommonAppCallParams | None) -> bool:
+    return params is not None and bool(
+        params.account_references or params.asset_references or params.app_references
+    )
+
+
+class AsyncCirculatingSupplyParams:
+    def __init__(self, client: AsyncCirculatingSupplyClient) -> None:
+        self.client = client
+
+    def call(
+        self, args: AbiArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        """App call params of a method call (typed client `*Args`)"""
+        params = params or CommonAppCallParams()
+        sender = params.sender or self.client.default_sender
+        if sender is None:
+            raise ValueError("App calls require params.sender or a default sender")
+        return AppCallParams(
+            sender=sender,
+            signer=params.signer or self.client.default_signer,
+            rekey_to=params.rekey_to,
+            note=params.note or self.client.notes.next(),
+            lease=params.lease,
+            static_fee=params.static_fee,
+            extra_fee=params.extra_fee,
+            max_fee=params.max_fee,
+            validity_window=params.validity_window,
+            first_valid_round=params.first_valid_round,
+            last_valid_round=params.last_valid_round,
+            app_id=self.client.app_id,
+            on_complete=transaction.OnComplete.NoOpOC,
+            args=encode_args(args),
+            account_references=params.account_references,
+            app_references=params.app_references,
+            asset_references=params.asset_references,
+        )
+
+    def set_asset(
+        self, args: SetAssetArgs, params: CommonAppCallParams | None = None
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def set_not_circulating_address(
+        self,
+        args: SetNotCirculatingAddressArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+    def arc62_get_circulating_supply(
+        self,
+        args: Arc62GetCirculatingSupplyArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AppCallParams:
+        return self.call(args, params)
+
+
+class AsyncCirculatingSupplyCreateTransactionParams:
+    def __init__(self, client: AsyncCirculatingSupplyClient) -> None:
+        self.client = client
+
+    async def call(
+        self, args: AbiArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        """
+        Unsigned app call of a method call (typed client `*Args`), with the AlgoKit
+        Utils fee params. Without an explicit validity the suggested params one is kept
+        (cached params stay valid).
+        """
+        call = self.client.params.call(args, params)
+        return build_transaction(
+            call, await self.client.suggested_params.get_async(self.client.algod)
+        )
+
+    async def set_asset(
+        self, args: SetAssetArgs, params: CommonAppCallParams | None = None
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def set_not_circulating_address(
+        self,
+        args: SetNotCirculatingAddressArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+    async def arc62_get_circulating_supply(
+        self,
+        args: Arc62GetCirculatingSupplyArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> transaction.ApplicationCallTxn:
+        return await self.call(args, params)
+
+
+class AsyncCirculatingSupplySend:
+    def __init__(self, client: AsyncCirculatingSupplyClient) -> None:
+        self.client = client
+
+    async def call(
+        self,
+        args: AbiArgs,
+        params: CommonAppCallParams | None = None,
+        *,
+        wait_rounds: int = DEFAULT_WAIT_ROUNDS,
+    ) -> AsyncSendResult:
+        """
+        Sends a method call (typed client `*Args`): read-only methods are simulated,
+        the others have their references populated (unless explicit), are signed,
+        submitted and confirmed.
+        """
+        txn = await self.client.create_transaction.call(args, params)
+        algod = self.client.algod
+        if _method(args.abi_method_signature).name in readonly_methods():
+            group = await _simulate(algod, txn)
+            (txn_result,) = cast(
+                list[dict[str, dict[str, object]]], group["txn-results"]
+            )
+            result = txn_result["txn-result"]
+            return AsyncSendResult(
+                txid=_txid(txn),
+                confirmation=result,
+                abi_return=_abi_return(args, result),
+            )
+
+        signer = (
+            params.signer if params and params.signer else self.client.default_signer
+        )
+        if signer is None:
+            raise ValueError(
+                "Sending app calls requires params.signer or a default signer"
+            )
+        if not _has_references(params):
+            txn = _populated(txn, await _simulate(algod, txn))
+        txid = await algod.send_transactions(signer.sign_transactions([txn], [0]))
+        confirmation = await algod.wait_for_confirmation(txid, wait_rounds)
+        return AsyncSendResult(
+            txid=txid,
+            confirmation=confirmation,
+            abi_return=_abi_return(args, confirmation),
+        )
+
+    async def set_asset(
+        self, args: SetAssetArgs, params: CommonAppCallParams | None = None
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def set_not_circulating_address(
+        self,
+        args: SetNotCirculatingAddressArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncSendResult:
+        return await self.call(args, params)
+
+    async def arc62_get_circulating_supply(
+        self,
+        args: Arc62GetCirculatingSupplyArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> int:
+        return cast(int, (await self.call(args, params)).abi_return)
+
+
+class AsyncCirculatingSupplyState:
+    def __init__(self, client: AsyncCirculatingSupplyClient) -> None:
+        self.client = client
+
+    async def global_state(self) -> CirculatingSupplyGlobalState:
+        """The whole global state, fetched with a single algod request"""
+        app_info = await self.client.algod.application_info(self.client.app_id)
+        params = cast(dict[str, object], app_info["params"])
+        return decode_global_state(
+            cast(list[dict[str, object]], params.get("global-state", []))
+        )
+
+
+class AsyncCirculatingSupplyClient:
+    """Async counterpart of the typed `CirculatingSupplyClient` accessors"""
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        app_id: int,
+        *,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        params_cache: SuggestedParamsCache | None = None,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        self.suggested_params = params_cache or SuggestedParamsCache()
+        self.notes = CallNotes()
+        self.params = AsyncCirculatingSupplyParams(self)
+        self.create_transaction = AsyncCirculatingSupplyCreateTransactionParams(self)
+        self.send = AsyncCirculatingSupplySend(self)
+        self.state = AsyncCirculatingSupplyState(self)
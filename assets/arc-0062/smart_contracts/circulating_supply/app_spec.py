@@ -0,0 +1,26 @@
+"""
+Circulating Supply App Spec for the async client, parsed from the build artifact on
+first use.
+
+The async client only needs the App Spec state keys and method signatures: it loads
+it with `app_spec()` when first needed instead of importing the typed client, which
+parses its embedded App Spec at import.
+"""
+
+from pathlib import Path
+from typing import Final
+
+from algokit_utils import Arc56Contract
+from arc_common.app_spec import load_app_spec
+
+APP_SPEC_PATH: Final[Path] = (
+    Path(__file__).parents[1]
+    / "artifacts"
+    / "circulating_supply"
+    / "CirculatingSupply.arc56.json"
+)
+
+
+def app_spec() -> Arc56Contract:
+    """The Circulating Supply App Spec, parsed once"""
+    return load_app_spec(APP_SPEC_PATH)
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Final
 
 import pytest
@@ -11,6 +12,7 @@ from algokit_utils import (
     SigningAccount,
 )
 from algokit_utils.config import config
+from arc_common.funding import AccountFunder
 
 from smart_contracts.artifacts.circulating_supply.circulating_supply_client import (
     CirculatingSupplyClient,
@@ -19,7 +21,18 @@ from smart_contracts.artifacts.circulating_supply.circulating_supply_client impo
 )
 from smart_contracts.circulating_supply.config import ARC3_SUFFIX, ARC3_URI
 
+pytest_plugins = ("arc_common.http_accounting",)
+
 INITIAL_FUNDS: Final[AlgoAmount] = AlgoAmount.from_algo(100)
+ROLES: Final[tuple[str, ...]] = (
+    "deployer",
+    "asset_creator",
+    "asset_manager",
+    "asset_reserve",
+    "not_circulating_address_1",
+    "not_circulating_address_2",
+    "not_circulating_address_3",
+)
 ASA_TOTAL: Final[int] = 1000
 RESERVE_BALANCE: Final[int] = 420
 NOT_CIRCULATING_BALANCE_1: Final[int] = 69
@@ -34,19 +47,29 @@ def algorand() -> AlgorandClient:
     return client
 
 
+# Session fixtures are per pytest-xdist worker: each worker has its own funder
+# (and worker dispenser) and role accounts.
 @pytest.fixture(scope="session")
-def deployer(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def funder(algorand: AlgorandClient) -> Iterator[AccountFunder]:
+    funder = AccountFunder(algorand, INITIAL_FUNDS)
+    yield funder
+    funder.close()
+
+
+@pytest.fixture(scope="session")
+def role_accounts(funder: AccountFunder) -> dict[str, SigningAccount]:
+    # All the role accounts are funded at once, in a single dispenser group.
+    return dict(zip(ROLES, funder.accounts(len(ROLES)), strict=True))
+
+
+@pytest.fixture(scope="session")
+def deployer(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["deployer"]
 
 
 @pytest.fixture(scope="function")
 def circulating_supply_client(
-    algorand: AlgorandClient, deployer: SigningAccount
+    algorand: AlgorandClient, deployer: SigningAccount, funder: AccountFunder
 ) -> CirculatingSupplyClient:
     config.configure(
         debug=False,
@@ -60,71 +83,44 @@ def circulating_supply_client(
         default_signer=deployer.signer,
     )
     client, _ = factory.send.create.bare()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=client.app_address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    funder.fund([client.app_address])
     return client
 
 
 @pytest.fixture(scope="session")
-def asset_creator(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def asset_creator(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["asset_creator"]
 
 
 @pytest.fixture(scope="session")
-def asset_manager(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def asset_manager(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["asset_manager"]
 
 
 @pytest.fixture(scope="session")
-def asset_reserve(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def asset_reserve(role_accounts: dict[str, SigningAccount]) -> SigningAccount:
+    return role_accounts["asset_reserve"]
 
 
 @pytest.fixture(scope="session")
-def not_circulating_address_1(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def not_circulating_address_1(
+    role_accounts: dict[str, SigningAccount],
+) -> SigningAccount:
+    return role_accounts["not_circulating_address_1"]
 
 
 @pytest.fixture(scope="session")
-def not_circulating_address_2(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def not_circulating_address_2(
+    role_accounts: dict[str, SigningAccount],
+) -> SigningAccount:
+    return role_accounts["not_circulating_address_2"]
 
 
 @pytest.fixture(scope="session")
-def not_circulating_address_3(algorand: AlgorandClient) -> SigningAccount:
-    account = algorand.account.random()
-    algorand.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def not_circulating_address_3(
+    role_accounts: dict[str, SigningAccount],
+) -> SigningAccount:
+    return role_accounts["not_circulating_address_3"]
 
 
 @pytest.fixture(scope="function")
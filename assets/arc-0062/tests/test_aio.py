@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from algokit_utils import AlgorandClient, SigningAccount
+from arc_common.aio import AsyncAlgodClient
+
+from smart_contracts.artifacts.circulating_supply.circulating_supply_client import (
+    Arc62GetCirculatingSupplyArgs,
+    CirculatingSupplyClient,
+    SetNotCirculatingAddressArgs,
+)
+from smart_contracts.circulating_supply import config as cfg
+from smart_contracts.circulating_supply.aio import (
+    AsyncCirculatingSupplyClient,
+    CirculatingSupplyGlobalState,
+    SimulateError,
+)
+
+
+def async_client(
+    client: CirculatingSupplyClient, sender: SigningAccount
+) -> AsyncCirculatingSupplyClient:
+    return AsyncCirculatingSupplyClient(
+        AsyncAlgodClient.from_algod(client.algorand.client.algod),
+        client.app_id,
+        default_sender=sender.address,
+        default_signer=sender.signer,
+    )
+
+
+def test_pass_async_get_circulating_supply(
+    algorand: AlgorandClient,
+    asset_circulating_supply_client: CirculatingSupplyClient,
+    asset_manager: SigningAccount,
+    asset: int,
+    reserve_with_balance: SigningAccount,
+    not_circulating_balance_1: SigningAccount,
+) -> None:
+    total = algorand.asset.get_by_id(asset).total
+    reserve_balance = algorand.asset.get_account_information(
+        reserve_with_balance, asset
+    ).balance
+    nc_balance_1 = algorand.asset.get_account_information(
+        not_circulating_balance_1, asset
+    ).balance
+
+    async def set_and_read() -> tuple[int, int, CirculatingSupplyGlobalState]:
+        client = async_client(asset_circulating_supply_client, asset_manager)
+        async with client.algod:
+            args = Arc62GetCirculatingSupplyArgs(asset_id=asset)
+            before = await client.send.arc62_get_circulating_supply(args)
+            await client.send.set_not_circulating_address(
+                SetNotCirculatingAddressArgs(
+                    address=not_circulating_balance_1.address,
+                    label=cfg.NOT_CIRCULATING_LABEL_1,
+                )
+            )
+            after = await client.send.arc62_get_circulating_supply(args)
+            return before, after, await client.state.global_state()
+
+    before, after, state = asyncio.run(set_and_read())
+    assert before == total - reserve_balance
+    assert after == total - reserve_balance - nc_balance_1
+    assert state.asset_id == asset
+    assert state.not_circulating_label_1 == not_circulating_balance_1.address
+
+
+def test_pass_async_concurrent_reads(
+    asset_circulating_supply_client: CirculatingSupplyClient,
+    asset_manager: SigningAccount,
+    asset: int,
+) -> None:
+    expected = asset_circulating_supply_client.send.arc62_get_circulating_supply(
+        args=Arc62GetCirculatingSupplyArgs(asset_id=asset)
+    ).abi_return
+
+    async def read() -> list[int]:
+        client = async_client(asset_circulating_supply_client, asset_manager)
+        async with client.algod:
+            args = Arc62GetCirculatingSupplyArgs(asset_id=asset)
+            return list(
+                await asyncio.gather(
+                    *(client.send.arc62_get_circulating_supply(args) for _ in range(32))
+                )
+            )
+
+    assert asyncio.run(read()) == [expected] * 32
+
+
+def test_fail_async_invalid_asset(
+    asset_circulating_supply_client: CirculatingSupplyClient,
+    asset_manager: SigningAccount,
+    asset: int,
+) -> None:
+    async def read() -> int:
+        client = async_client(asset_circulating_supply_client, asset_manager)
+        async with client.algod:
+            return await client.send.arc62_get_circulating_supply(
+                Arc62GetCirculatingSupplyArgs(asset_id=asset + 1)
+            )
+
+    # Simulate failure messages carry the failing PC, not the TEAL assert comment.
+    with pytest.raises(SimulateError, match="assert failed"):
+        asyncio.run(read())
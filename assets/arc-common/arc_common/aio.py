@@ -0,0 +1,247 @@
+"""
+Asyncio algod client and app call building blocks, shared by the async app clients.
+
+The typed clients are synchronous: in an asyncio service each call blocks the event
+loop (or takes a worker thread). `AsyncAlgodClient` serves the algod endpoints the
+async app clients need over a pooled `httpx.AsyncClient`, so thousands of calls can
+be awaited concurrently on a handful of keep-alive connections:
+
+    async with AsyncAlgodClient.from_algod(algod) as aio_algod:
+        status = await aio_algod.status()
+
+The async app clients take their suggested params from a (shared)
+`arc_common.suggested_params.SuggestedParamsCache`.
+
+- `build_transaction` builds the unsigned app call of AlgoKit Utils `AppCallParams`;
+- `CallNotes` gives each app call a unique note, so identical concurrent calls
+  (same sender, arguments and suggested params) have distinct transaction IDs.
+"""
+
+import base64
+import copy
+import itertools
+import secrets
+from collections.abc import Mapping
+from types import TracebackType
+from typing import Final, Self, cast
+
+import httpx
+from algokit_utils import AppCallParams
+from algosdk import encoding, error, transaction
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest
+
+DEFAULT_MAX_CONNECTIONS: Final[int] = 64
+DEFAULT_TIMEOUT: Final[float] = 10.0
+DEFAULT_WAIT_ROUNDS: Final[int] = 10
+# Last valid round of the suggested params, as algosdk `suggested_params`.
+VALIDITY_ROUNDS: Final[int] = 1000
+NONCE_SIZE: Final[int] = 8
+ORDINAL_SIZE: Final[int] = 8
+
+
+class AsyncAlgodClient:
+    """The algod endpoints used by the async app clients, over pooled connections"""
+
+    def __init__(
+        self,
+        algod_address: str,
+        algod_token: str = "",
+        *,
+        headers: Mapping[str, str] | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.http = httpx.AsyncClient(
+            base_url=algod_address,
+            headers={"X-Algo-API-Token": algod_token, **(headers or {})},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout,
+        )
+
+    @classmethod
+    def from_algod(
+        cls,
+        algod: AlgodClient,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> Self:
+        """Async client to the node of a (synchronous) algosdk `AlgodClient`"""
+        return cls(
+            algod.algod_address,
+            algod.algod_token,
+            headers=algod.headers,
+            max_connections=max_connections,
+            timeout=timeout,
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+    ) -> dict[str, object]:
+        response = await self.http.request(
+            method, path, content=content, headers=headers, params=params
+        )
+        if response.is_error:
+            try:
+                message = str(cast(dict[str, object], response.json())["message"])
+            except (ValueError, KeyError):
+                message = response.text
+            raise error.AlgodHTTPError(message, response.status_code)
+        return cast(dict[str, object], response.json())
+
+    async def status(self) -> dict[str, object]:
+        return await self._request("GET", "/v2/status")
+
+    async def status_after_block(self, round_num: int) -> dict[str, object]:
+        return await self._request(
+            "GET", f"/v2/status/wait-for-block-after/{round_num}"
+        )
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        params = await self._request("GET", "/v2/transactions/params")
+        last_round = cast(int, params["last-round"])
+        return transaction.SuggestedParams(
+            fee=params["fee"],
+            first=last_round,
+            last=last_round + VALIDITY_ROUNDS,
+            gh=params["genesis-hash"],
+            gen=params["genesis-id"],
+            flat_fee=False,
+            consensus_version=params["consensus-version"],
+            min_fee=params["min-fee"],
+        )
+
+    async def send_transactions(
+        self, signed: list[transaction.GenericSignedTransaction]
+    ) -> str:
+        """Submits a signed group, returns the first transaction ID"""
+        content = b"".join(
+            base64.b64decode(cast(str, encoding.msgpack_encode(txn))) for txn in signed
+        )
+        response = await self._request(
+            "POST",
+            "/v2/transactions",
+            content=content,
+            headers={"Content-Type": "application/x-binary"},
+        )
+        return cast(str, response["txId"])
+
+    async def pending_transaction_info(self, txid: str) -> dict[str, object]:
+        return await self._request("GET", f"/v2/transactions/pending/{txid}")
+
+    async def wait_for_confirmation(
+        self, txid: str, wait_rounds: int = DEFAULT_WAIT_ROUNDS
+    ) -> dict[str, object]:
+        """Pending transaction info of `txid` once confirmed, within `wait_rounds`"""
+        current_round = cast(int, (await self.status())["last-round"])
+        last_round = current_round + wait_rounds
+        while True:
+            info = await self.pending_transaction_info(txid)
+            if cast(int, info.get("confirmed-round", 0)) > 0:
+                return info
+            if info.get("pool-error"):
+                raise error.ConfirmationTimeoutError(
+                    f"Transaction {txid} rejected: {info['pool-error']}"
+                )
+            if current_round >= last_round:
+                raise error.ConfirmationTimeoutError(
+                    f"Transaction {txid} not confirmed after {wait_rounds} rounds"
+                )
+            await self.status_after_block(current_round)
+            current_round += 1
+
+    async def simulate_transactions(
+        self, request: SimulateRequest
+    ) -> dict[str, object]:
+        return await self._request(
+            "POST",
+            "/v2/transactions/simulate",
+            content=base64.b64decode(cast(str, encoding.msgpack_encode(request))),
+            headers={"Content-Type": "application/msgpack"},
+            params={"format": "json"},
+        )
+
+    async def application_info(self, app_id: int) -> dict[str, object]:
+        return await self._request("GET", f"/v2/applications/{app_id}")
+
+    async def account_application_info(
+        self, address: str, app_id: int
+    ) -> dict[str, object]:
+        return await self._request(
+            "GET", f"/v2/accounts/{address}/applications/{app_id}"
+        )
+
+
+class CallNotes:
+    """Unique app call notes: a random nonce (per instance) and the call ordinal"""
+
+    def __init__(self) -> None:
+        self.nonce = secrets.token_bytes(NONCE_SIZE)
+        self._ordinals = itertools.count()
+
+    def next(self) -> bytes:
+        return self.nonce + next(self._ordinals).to_bytes(ORDINAL_SIZE, "big")
+
+
+def build_transaction(
+    call: AppCallParams, sp: transaction.SuggestedParams
+) -> transaction.ApplicationCallTxn:
+    """
+    The unsigned app call of `call`, with the AlgoKit Utils fee params. Without an
+    explicit validity the suggested params one is used (cached params stay valid).
+    """
+    fee = cast(int, sp.min_fee)
+    if call.static_fee is not None:
+        fee = call.static_fee.micro_algo
+    elif call.extra_fee is not None:
+        fee += call.extra_fee.micro_algo
+    if call.max_fee is not None and fee > call.max_fee.micro_algo:
+        raise ValueError(
+            f"Transaction fee {fee} is greater than max fee {call.max_fee.micro_algo}"
+        )
+    first = call.first_valid_round or cast(int, sp.first)
+    last = call.last_valid_round or (
+        first + call.validity_window if call.validity_window else cast(int, sp.last)
+    )
+    call_sp = copy.copy(sp)
+    call_sp.fee = fee
+    call_sp.first = first
+    call_sp.last = last
+    call_sp.flat_fee = True
+    return transaction.ApplicationCallTxn(
+        sender=call.sender,
+        sp=call_sp,
+        index=call.app_id,
+        on_complete=call.on_complete or transaction.OnComplete.NoOpOC,
+        app_args=call.args,
+        accounts=call.account_references,
+        foreign_apps=call.app_references,
+        foreign_assets=call.asset_references,
+        note=call.note,
+        lease=call.lease,
+        rekey_to=call.rekey_to,
+    )
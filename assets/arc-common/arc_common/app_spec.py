@@ -0,0 +1,25 @@
+"""
+App Spec of a contract, parsed from its ARC-56 artifact on first use.
+
+Importing a typed client parses its embedded App Spec, tens of milliseconds for the
+larger contracts. Helpers that only need the App Spec state keys or method
+signatures load it from the `*.arc56.json` build artifact instead, once per process
+and only when first needed, so importing them stays cheap:
+
+    spec = load_app_spec(ARTIFACTS / "SmartAsa.arc56.json")
+    spec.state.keys.global_state
+"""
+
+from pathlib import Path
+from typing import Final
+
+from algokit_utils import Arc56Contract
+
+_APP_SPECS: Final[dict[Path, Arc56Contract]] = {}
+
+
+def load_app_spec(path: Path) -> Arc56Contract:
+    """The ARC-56 App Spec at `path`, parsed once"""
+    if path not in _APP_SPECS:
+        _APP_SPECS[path] = Arc56Contract.from_json(path.read_text(encoding="utf-8"))
+    return _APP_SPECS[path]
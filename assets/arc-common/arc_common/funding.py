@@ -0,0 +1,147 @@
+"""
+Bulk account funding for the test sessions and the benchmarks.
+
+`ensure_funded_from_environment` sends one dispenser payment per account and waits
+for its confirmation. `AccountFunder` funds new accounts with atomic groups of up
+to 16 dispenser payments, submitting all the groups before waiting for their
+confirmations: the session role accounts are funded together, and single accounts
+(e.g. opted-in holders) are handed out from a pool refilled one group at a time:
+
+    funder = AccountFunder(algorand, AlgoAmount.from_algo(100))
+    roles = funder.accounts(4)
+    holder = funder.account()
+    ...
+    funder.close()
+
+Under pytest-xdist each worker funds its accounts from its own `WorkerDispenser`,
+so the workers never sign concurrently for the environment dispenser: it sends a
+top-up to a worker dispenser when its budget runs out, sized for the next
+`WORKER_REFILL_ACCOUNTS` accounts of the funder, and `close` returns the unspent
+budget to the environment dispenser.
+"""
+
+import os
+from collections.abc import Sequence
+from typing import Final
+
+from algokit_utils import AlgoAmount, AlgorandClient, PaymentParams, SigningAccount
+from algosdk import constants, transaction
+
+MAX_GROUP_SIZE: Final[int] = 16
+# New accounts are funded with the spending balance on top of the minimum balance.
+MIN_BALANCE: Final[AlgoAmount] = AlgoAmount.from_micro_algo(100_000)
+# Accounts funded by a worker dispenser top-up: four dispenser groups.
+WORKER_REFILL_ACCOUNTS: Final[int] = 4 * MAX_GROUP_SIZE
+
+
+def xdist_worker() -> str | None:
+    """The pytest-xdist worker ID (`gw0`, `gw1`, ...), None outside of workers"""
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+class WorkerDispenser:
+    """A random account funding a single worker, topped up by the `parent` one"""
+
+    def __init__(
+        self, algorand: AlgorandClient, parent: SigningAccount, refill: AlgoAmount
+    ) -> None:
+        self.algorand = algorand
+        self.parent = parent
+        self.refill = refill.micro_algo
+        self.account = algorand.account.random()
+        # The first top-up also covers the account minimum balance.
+        self._budget = -MIN_BALANCE.micro_algo
+        self._funded = False
+
+    def reserve(self, amount: int) -> None:
+        """Spends `amount` (fees included) of the budget, topping it up if short"""
+        if amount > self._budget:
+            top_up = max(self.refill, amount) - self._budget
+            self.algorand.send.payment(
+                PaymentParams(
+                    sender=self.parent.address,
+                    signer=self.parent.signer,
+                    receiver=self.account.address,
+                    amount=AlgoAmount.from_micro_algo(top_up),
+                )
+            )
+            self._budget += top_up
+            self._funded = True
+        self._budget -= amount
+
+    def close(self) -> None:
+        """Returns the unspent budget (and minimum balance) to the `parent`"""
+        if not self._funded:
+            return
+        self.algorand.send.payment(
+            PaymentParams(
+                sender=self.account.address,
+                signer=self.account.signer,
+                receiver=self.parent.address,
+                amount=AlgoAmount.from_micro_algo(0),
+                close_remainder_to=self.parent.address,
+            )
+        )
+        self._budget = -MIN_BALANCE.micro_algo
+        self._funded = False
+
+
+class AccountFunder:
+    def __init__(
+        self, algorand: AlgorandClient, min_spending_balance: AlgoAmount
+    ) -> None:
+        self.algorand = algorand
+        self.amount = min_spending_balance.micro_algo + MIN_BALANCE.micro_algo
+        self.dispenser = algorand.account.dispenser_from_environment()
+        self.worker_dispenser: WorkerDispenser | None = None
+        if xdist_worker() is not None:
+            refill = WORKER_REFILL_ACCOUNTS * (self.amount + constants.min_txn_fee)
+            self.worker_dispenser = WorkerDispenser(
+                algorand, self.dispenser, AlgoAmount.from_micro_algo(refill)
+            )
+            self.dispenser = self.worker_dispenser.account
+        self._pool: list[SigningAccount] = []
+
+    def fund(self, addresses: Sequence[str]) -> None:
+        """Funds `addresses` with one dispenser payment each, 16 per group"""
+        algod = self.algorand.client.algod
+        sp = algod.suggested_params()
+        min_fee: int = sp.min_fee
+        if self.worker_dispenser is not None:
+            self.worker_dispenser.reserve(len(addresses) * (self.amount + min_fee))
+        txids: list[str] = []
+        for start in range(0, len(addresses), MAX_GROUP_SIZE):
+            txns: list[transaction.Transaction] = [
+                transaction.PaymentTxn(self.dispenser.address, sp, address, self.amount)
+                for address in addresses[start : start + MAX_GROUP_SIZE]
+            ]
+            transaction.assign_group_id(txns)
+            signed = self.dispenser.signer.sign_transactions(
+                txns, list(range(len(txns)))
+            )
+            txids.append(algod.send_transactions(signed))
+        for txid in txids:
+            transaction.wait_for_confirmation(algod, txid)
+
+    def accounts(self, count: int) -> list[SigningAccount]:
+        """`count` new accounts, funded together"""
+        accounts = [self.algorand.account.random() for _ in range(count)]
+        self.fund([account.address for account in accounts])
+        return accounts
+
+    def pooled_accounts(self, count: int) -> list[SigningAccount]:
+        """`count` new funded accounts, from a pool refilled with whole groups"""
+        if len(self._pool) < count:
+            groups = -(-(count - len(self._pool)) // MAX_GROUP_SIZE)
+            self._pool.extend(self.accounts(groups * MAX_GROUP_SIZE))
+        accounts, self._pool = self._pool[:count], self._pool[count:]
+        return accounts
+
+    def account(self) -> SigningAccount:
+        """A new funded account, from a pool refilled with a whole group"""
+        return self.pooled_accounts(1)[0]
+
+    def close(self) -> None:
+        """Returns the unspent worker dispenser budget to the environment dispenser"""
+        if self.worker_dispenser is not None:
+            self.worker_dispenser.close()
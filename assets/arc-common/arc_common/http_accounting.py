@@ -0,0 +1,438 @@
+"""
+Network round-trip accounting for the test session, as a pytest plugin.
+
+Every LocalNet round trip goes through the AlgorandClient HTTP layer: the algosdk
+algod, indexer and kmd clients (`urllib`) and the `httpx` clients of the async
+clients and bulk readers (algod). With `--http-accounting` the plugin counts the
+calls per service, the request and response bytes and the seconds spent in each
+round trip, and attributes them to the running fixture setup (e.g. the app deployed
+for each test) and to the running test. Projects load it from their `conftest.py`:
+
+    pytest_plugins = ("arc_common.http_accounting",)
+
+    poetry run pytest --http-accounting [--http-accounting-top 0]
+        [--http-accounting-json http_accounting.json]
+
+The session summary lists the fixtures and the tests by HTTP seconds. HTTP seconds
+are summed over the round trips, so concurrent requests add up; `wall` is the
+fixture setup (or test) duration. A call is attributed to the innermost fixture
+being set up, so each fixture of a chain is accounted on its own; calls made by a
+test, also through a factory fixture, are attributed to the test. Under
+pytest-xdist each worker accounts for its own tests and the totals are merged in
+the summary.
+"""
+
+import dataclasses
+import json
+import threading
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Iterator
+from http.client import HTTPResponse
+from pathlib import Path
+from typing import Final, Protocol, TypeAlias, TypeVar, cast
+from urllib.request import Request
+
+import httpx
+import pytest
+from algosdk import kmd
+from algosdk.v2client import algod, indexer
+
+SERVICES: Final[tuple[str, ...]] = ("algod", "indexer", "kmd")
+# Calls outside of the tests (e.g. collection) are accounted to the session.
+PHASES: Final[tuple[str, ...]] = ("session", "setup", "call", "teardown")
+WORKER_OUTPUT_KEY: Final[str] = "http_accounting"
+NAME_WIDTH: Final[int] = 64
+
+# Adds the bytes received and the seconds spent to a round trip being accounted.
+Record: TypeAlias = Callable[[int, float], None]
+# Section ("phases", "fixtures", "tests") to name to `Traffic` fields.
+Report: TypeAlias = dict[str, dict[str, dict[str, object]]]
+HandleRequest: TypeAlias = Callable[
+    [httpx.HTTPTransport, httpx.Request], httpx.Response
+]
+HandleAsyncRequest: TypeAlias = Callable[
+    [httpx.AsyncHTTPTransport, httpx.Request], Awaitable[httpx.Response]
+]
+_Hook = TypeVar("_Hook")
+
+
+def _hookimpl(
+    *, wrapper: bool = False, tryfirst: bool = False, optionalhook: bool = False
+) -> Callable[[_Hook], _Hook]:
+    """`pytest.hookimpl`, typed without `Any`"""
+    return cast(
+        Callable[[_Hook], _Hook],
+        pytest.hookimpl(wrapper=wrapper, tryfirst=tryfirst, optionalhook=optionalhook),
+    )
+
+
+def _content_length(request: httpx.Request) -> int:
+    return int(cast(str, request.headers.get("content-length", "0")))
+
+
+class UrlOpen(Protocol):
+    """`urlopen`, as called by the algosdk clients"""
+
+    def __call__(self, url: Request, *, timeout: float | None) -> HTTPResponse: ...
+
+
+class WorkerNode(Protocol):
+    """pytest-xdist worker controller, with the output of a finished worker"""
+
+    workeroutput: dict[str, object]
+
+
+@dataclasses.dataclass
+class Traffic:
+    runs: int = 0
+    calls: dict[str, int] = dataclasses.field(default_factory=dict)
+    sent: int = 0
+    received: int = 0
+    seconds: float = 0.0
+    wall: float = 0.0
+
+    def merge(self, other: "Traffic") -> None:
+        self.runs += other.runs
+        for service, calls in other.calls.items():
+            self.calls[service] = self.calls.get(service, 0) + calls
+        self.sent += other.sent
+        self.received += other.received
+        self.seconds += other.seconds
+        self.wall += other.wall
+
+
+class _Response:
+    """`urlopen` response counting the bytes read and the seconds spent reading"""
+
+    def __init__(self, response: HTTPResponse, record: Record) -> None:
+        self._response = response
+        self._record = record
+
+    def read(self, amt: int | None = None) -> bytes:
+        start = time.perf_counter()
+        data = self._response.read(amt)
+        self._record(len(data), time.perf_counter() - start)
+        return data
+
+    def __getattr__(self, name: str) -> object:
+        return cast(object, getattr(self._response, name))
+
+
+class _SyncStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, record: Record) -> None:
+        self._stream = stream
+        self._record = record
+
+    def __iter__(self) -> Iterator[bytes]:
+        start = time.perf_counter()
+        received = 0
+        try:
+            for chunk in self._stream:
+                received += len(chunk)
+                yield chunk
+        finally:
+            self._record(received, time.perf_counter() - start)
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _AsyncStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, record: Record) -> None:
+        self._stream = stream
+        self._record = record
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        start = time.perf_counter()
+        received = 0
+        try:
+            async for chunk in self._stream:
+                received += len(chunk)
+                yield chunk
+        finally:
+            self._record(received, time.perf_counter() - start)
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class HttpAccounting:
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.fixtures: defaultdict[str, Traffic] = defaultdict(Traffic)
+        self.tests: defaultdict[str, Traffic] = defaultdict(Traffic)
+        self.phases: defaultdict[str, Traffic] = defaultdict(Traffic)
+        self._lock = threading.Lock()
+        self._fixture_stack: list[str] = []
+        self._test: str | None = None
+        self._phase = "session"
+        self._patches: list[tuple[object, str, object]] = []
+
+    # Round trips
+    def _call(self, service: str, sent: int) -> Record:
+        """Accounts a new round trip to the running fixture, test and phase"""
+        with self._lock:
+            targets = [self.phases[self._phase]]
+            if self._test is not None:
+                targets.append(self.tests[self._test])
+            if self._fixture_stack:
+                targets.append(self.fixtures[self._fixture_stack[-1]])
+            for traffic in targets:
+                traffic.calls[service] = traffic.calls.get(service, 0) + 1
+                traffic.sent += sent
+
+        def record(received: int, seconds: float) -> None:
+            with self._lock:
+                for traffic in targets:
+                    traffic.received += received
+                    traffic.seconds += seconds
+
+        return record
+
+    def _urlopen(self, service: str, urlopen: UrlOpen) -> UrlOpen:
+        def accounted_urlopen(url: Request, *, timeout: float | None) -> HTTPResponse:
+            data = url.data
+            record = self._call(service, len(data) if isinstance(data, bytes) else 0)
+            start = time.perf_counter()
+            try:
+                response = urlopen(url, timeout=timeout)
+            finally:
+                record(0, time.perf_counter() - start)
+            # Quacks as the response: the algosdk clients only read it.
+            return cast(HTTPResponse, _Response(response, record))
+
+        return accounted_urlopen
+
+    def _handle_request(self, handle: HandleRequest) -> HandleRequest:
+        # The `httpx` clients of the ARC projects (async clients, bulk readers) talk
+        # to algod.
+        def handle_request(
+            transport: httpx.HTTPTransport, request: httpx.Request
+        ) -> httpx.Response:
+            record = self._call("algod", _content_length(request))
+            start = time.perf_counter()
+            try:
+                response = handle(transport, request)
+            finally:
+                record(0, time.perf_counter() - start)
+            stream = cast(httpx.SyncByteStream, response.stream)
+            response.stream = _SyncStream(stream, record)
+            return response
+
+        return handle_request
+
+    def _handle_async_request(self, handle: HandleAsyncRequest) -> HandleAsyncRequest:
+        async def handle_async_request(
+            transport: httpx.AsyncHTTPTransport, request: httpx.Request
+        ) -> httpx.Response:
+            record = self._call("algod", _content_length(request))
+            start = time.perf_counter()
+            try:
+                response = await handle(transport, request)
+            finally:
+                record(0, time.perf_counter() - start)
+            stream = cast(httpx.AsyncByteStream, response.stream)
+            response.stream = _AsyncStream(stream, record)
+            return response
+
+        return handle_async_request
+
+    def _patch(self, owner: object, name: str, replacement: object) -> None:
+        self._patches.append((owner, name, cast(object, getattr(owner, name))))
+        setattr(owner, name, replacement)
+
+    def install(self) -> None:
+        for service, module in (("algod", algod), ("indexer", indexer), ("kmd", kmd)):
+            urlopen = cast(UrlOpen, module.urlopen)
+            self._patch(module, "urlopen", self._urlopen(service, urlopen))
+        self._patch(
+            httpx.HTTPTransport,
+            "handle_request",
+            self._handle_request(httpx.HTTPTransport.handle_request),
+        )
+        self._patch(
+            httpx.AsyncHTTPTransport,
+            "handle_async_request",
+            self._handle_async_request(httpx.AsyncHTTPTransport.handle_async_request),
+        )
+
+    def uninstall(self) -> None:
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            setattr(owner, name, original)
+
+    # Attribution
+    @_hookimpl(wrapper=True)
+    def pytest_runtest_protocol(
+        self, item: pytest.Item, nextitem: pytest.Item | None
+    ) -> Generator[None, object, object]:
+        self._test = item.nodeid
+        start = time.perf_counter()
+        try:
+            return (yield)
+        finally:
+            with self._lock:
+                self.tests[item.nodeid].runs += 1
+                self.tests[item.nodeid].wall += time.perf_counter() - start
+            self._test = None
+            self._phase = "session"
+
+    def _in_phase(self, phase: str) -> Generator[None, None, None]:
+        self._phase = phase
+        start = time.perf_counter()
+        try:
+            return (yield)
+        finally:
+            self._phase = "session"
+            with self._lock:
+                self.phases[phase].runs += 1
+                self.phases[phase].wall += time.perf_counter() - start
+
+    @_hookimpl(wrapper=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> Generator[None, None, None]:
+        return (yield from self._in_phase("setup"))
+
+    @_hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, None, None]:
+        return (yield from self._in_phase("call"))
+
+    @_hookimpl(wrapper=True)
+    def pytest_runtest_teardown(
+        self, item: pytest.Item, nextitem: pytest.Item | None
+    ) -> Generator[None, None, None]:
+        return (yield from self._in_phase("teardown"))
+
+    @_hookimpl(wrapper=True)
+    def pytest_fixture_setup(
+        self, fixturedef: pytest.FixtureDef[object], request: pytest.FixtureRequest
+    ) -> Generator[None, object, object]:
+        self._fixture_stack.append(fixturedef.argname)
+        start = time.perf_counter()
+        try:
+            return (yield)
+        finally:
+            self._fixture_stack.pop()
+            with self._lock:
+                self.fixtures[fixturedef.argname].runs += 1
+                self.fixtures[fixturedef.argname].wall += time.perf_counter() - start
+
+    # Reports
+    def to_json(self) -> Report:
+        return {
+            section: {
+                name: cast(dict[str, object], dataclasses.asdict(t))
+                for name, t in traffic.items()
+            }
+            for section, traffic in (
+                ("phases", self.phases),
+                ("fixtures", self.fixtures),
+                ("tests", self.tests),
+            )
+        }
+
+    def merge(self, report: Report) -> None:
+        for section, traffic in report.items():
+            accounted = cast(defaultdict[str, Traffic], getattr(self, section))
+            for name, fields in traffic.items():
+                accounted[name].merge(Traffic(**fields))  # type: ignore[arg-type]
+
+    @_hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: WorkerNode, error: object) -> None:
+        # pytest-xdist controller: merges the report of a finished worker (a crashed
+        # worker has no output).
+        output: dict[str, object] = getattr(node, "workeroutput", {})
+        report = output.get(WORKER_OUTPUT_KEY)
+        if report is not None:
+            self.merge(cast(Report, report))
+
+    @_hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        workeroutput = cast(
+            dict[str, object] | None, getattr(self.config, "workeroutput", None)
+        )
+        if workeroutput is not None:
+            workeroutput[WORKER_OUTPUT_KEY] = self.to_json()
+            return
+        path = cast(str | None, self.config.getoption("http_accounting_json"))
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text(json.dumps(self.to_json(), indent=2) + "\n")
+
+    def pytest_terminal_summary(
+        self, terminalreporter: pytest.TerminalReporter
+    ) -> None:
+        top = cast(int, self.config.getoption("http_accounting_top"))
+        terminalreporter.write_sep("=", "HTTP round trips (algod, indexer, kmd)")
+        phases = sorted(self.phases.items(), key=_phase_order)
+        for line in _table("phase", phases):
+            terminalreporter.write_line(line)
+        for title, traffic in (("fixture setup", self.fixtures), ("test", self.tests)):
+            rows = sorted(traffic.items(), key=_http_seconds, reverse=True)
+            terminalreporter.write_line("")
+            for line in _table(title, rows[:top] if top else rows):
+                terminalreporter.write_line(line)
+            if top and len(rows) > top:
+                terminalreporter.write_line(f"({len(rows) - top} more {title}s)")
+
+
+def _phase_order(row: tuple[str, Traffic]) -> int:
+    return PHASES.index(row[0])
+
+
+def _http_seconds(row: tuple[str, Traffic]) -> float:
+    return row[1].seconds
+
+
+def _table(title: str, rows: list[tuple[str, Traffic]]) -> list[str]:
+    header = (
+        f"{title:<{NAME_WIDTH}} {'runs':>5} "
+        + " ".join(f"{service:>7}" for service in SERVICES)
+        + f" {'sent KiB':>9} {'recv KiB':>9} {'http s':>8} {'wall s':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, t in rows:
+        if len(name) > NAME_WIDTH:
+            name = "..." + name[-(NAME_WIDTH - 3) :]
+        lines.append(
+            f"{name:<{NAME_WIDTH}} {t.runs:>5} "
+            + " ".join(f"{t.calls.get(service, 0):>7}" for service in SERVICES)
+            + f" {t.sent / 1024:>9.1f} {t.received / 1024:>9.1f}"
+            + f" {t.seconds:>8.2f} {t.wall:>8.2f}"
+        )
+    return lines
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--http-accounting",
+        action="store_true",
+        help="Account algod/indexer/kmd round trips per fixture and per test",
+    )
+    parser.addoption(
+        "--http-accounting-top",
+        type=int,
+        default=20,
+        help="Fixtures and tests listed in the HTTP round trips summary (0 for all)",
+    )
+    parser.addoption(
+        "--http-accounting-json",
+        default=None,
+        help="Write the HTTP round trips report to this JSON file",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if cast(bool, config.getoption("http_accounting")):
+        accounting = HttpAccounting(config)
+        accounting.install()
+        config.pluginmanager.register(accounting, "http-accounting")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    accounting = cast(
+        HttpAccounting | None, config.pluginmanager.get_plugin("http-accounting")
+    )
+    if accounting is not None:
+        accounting.uninstall()
+        config.pluginmanager.unregister(accounting)
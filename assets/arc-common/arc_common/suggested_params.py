@@ -0,0 +1,64 @@
+"""
+Suggested params cache, shared by the synchronous helpers and the async app clients.
+
+Each transaction is built from the node suggested params: fetching them per call adds
+a round trip to every call. `SuggestedParamsCache` serves the last fetched params to
+all the threads (`get`) and asyncio tasks (`get_async`) sharing it, and fetches them
+again once older than `ttl` seconds:
+
+    params = SuggestedParamsCache()
+    sp = params.get(algod)  # or: await params.get_async(aio_algod)
+
+The expiry is wall-clock time, it does not track the node rounds: cached params can
+be up to `ttl` seconds old, so their first valid round can lag the node by a round or
+more. The fees only depend on `min_fee` (a consensus parameter) and the validity
+window spans 1000 rounds, so params a few seconds old remain valid. Callers
+resubmitting a group check its last valid round against the node status.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Final, Protocol
+
+from algosdk import transaction
+from algosdk.v2client.algod import AlgodClient
+
+DEFAULT_PARAMS_TTL: Final[float] = 5.0
+
+
+class AsyncParamsSource(Protocol):
+    async def suggested_params(self) -> transaction.SuggestedParams: ...
+
+
+class SuggestedParamsCache:
+    """Suggested params, fetched at most once per `ttl` seconds (wall clock)"""
+
+    def __init__(self, ttl: float = DEFAULT_PARAMS_TTL) -> None:
+        self.ttl = ttl
+        self._params: transaction.SuggestedParams | None = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._async_lock: asyncio.Lock | None = None
+
+    def _cached(self) -> transaction.SuggestedParams | None:
+        if self._params is None or time.monotonic() - self._fetched_at >= self.ttl:
+            return None
+        return self._params
+
+    def _store(self, sp: transaction.SuggestedParams) -> transaction.SuggestedParams:
+        self._params = sp
+        self._fetched_at = time.monotonic()
+        return sp
+
+    def get(self, algod: AlgodClient) -> transaction.SuggestedParams:
+        """The cached params, fetched from `algod` once expired"""
+        with self._lock:
+            return self._cached() or self._store(algod.suggested_params())
+
+    async def get_async(self, algod: AsyncParamsSource) -> transaction.SuggestedParams:
+        """The cached params, fetched from the async `algod` once expired"""
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            return self._cached() or self._store(await algod.suggested_params())